@@ -1013,6 +1013,7 @@ pub async fn run(config: ConnectConfig) -> Result<()> {
     let mut outbox_post_tasks: JoinSet<(usize, usize, u64, u64)> = JoinSet::new();
     let mut runtime_outbox_post_tasks: JoinSet<(usize, usize, u64, u64)> = JoinSet::new();
     let mut heartbeat_post_tasks: JoinSet<HeartbeatPostResult> = JoinSet::new();
+    let heartbeat_delta_state = heartbeat::SharedHeartbeatDeltaState::default();
     let mut machine_presence_post_tasks: JoinSet<MachinePresencePostResult> = JoinSet::new();
     let mut unmanaged_binding_refresh_tasks: JoinSet<UnmanagedBindingRefreshResult> =
         JoinSet::new();
@@ -1959,6 +1960,7 @@ pub async fn run(config: ConnectConfig) -> Result<()> {
                                     spawn_heartbeat_post(
                                         &mut heartbeat_post_tasks,
                                         client.clone(),
+                                        heartbeat_delta_state.clone(),
                                         payload,
                                         signature,
                                         "runtime_truth_change",
@@ -2446,6 +2448,7 @@ pub async fn run(config: ConnectConfig) -> Result<()> {
                             spawn_heartbeat_post(
                                 &mut heartbeat_post_tasks,
                                 client.clone(),
+                                heartbeat_delta_state.clone(),
                                 payload,
                                 signature,
                                 "periodic_heartbeat",
@@ -3783,6 +3786,7 @@ fn spawn_transcript_wake_listener(
 fn spawn_heartbeat_post(
     tasks: &mut JoinSet<HeartbeatPostResult>,
     client: ShipperClient,
+    delta_state: heartbeat::SharedHeartbeatDeltaState,
     payload: heartbeat::HeartbeatPayload,
     signature: String,
     reason: &'static str,
@@ -3791,7 +3795,7 @@ fn spawn_heartbeat_post(
         let join_started = Instant::now();
         let heartbeat_task = tokio::spawn(async move {
             let task_started = Instant::now();
-            let result = heartbeat::send_heartbeat(&client, &payload)
+            let result = heartbeat::send_heartbeat(&client, &payload, &delta_state)
                 .await
                 .map_err(|err| err.to_string());
             (result, task_started.elapsed().as_millis() as u64)
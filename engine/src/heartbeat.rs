@@ -5,6 +5,7 @@
 //! - frequent local status-file writes for ambient UX / debugging
 //! - less frequent server heartbeats to `/api/agents/heartbeat`
 
+use std::collections::BTreeMap;
 use std::collections::HashMap;
 use std::collections::HashSet;
 #[cfg(target_os = "linux")]
@@ -12,6 +13,9 @@ use std::fs;
 use std::path::Path;
 #[cfg(target_os = "macos")]
 use std::process::Command;
+use std::sync::Arc;
+use std::sync::Mutex;
+use std::sync::MutexGuard;
 use std::sync::OnceLock;
 use std::time::Duration;
 
@@ -38,6 +42,7 @@ static MACHINE_BOOT_ID: OnceLock<Option<String>> = OnceLock::new();
 use crate::config;
 use crate::error_tracker::ConsecutiveErrorTracker;
 use crate::error_tracker::RecentIssueTracker;
+use crate::shipping::client::JsonPostResponse;
 use crate::shipping::client::ShipperClient;
 use crate::shipping_stats::RecentShipStatsTracker;
 use crate::shipping_stats::ShipLaneSummarySet;
@@ -3000,7 +3005,7 @@ impl EmptyStringFallback for String {
 #[tracing::instrument(
     level = "info",
     name = "engine.heartbeat.send",
-    skip(client, payload),
+    skip(client, payload, delta_state),
     fields(
         otel.kind = "client",
         http.request.method = "POST",
@@ -3010,13 +3015,213 @@ impl EmptyStringFallback for String {
         longhouse.ship_attempts_1h = payload.ship_attempts_1h as u64,
     )
 )]
-pub async fn send_heartbeat(client: &ShipperClient, payload: &HeartbeatPayload) -> Result<()> {
-    let json = serde_json::to_vec(payload)?;
+pub async fn send_heartbeat(
+    client: &ShipperClient,
+    payload: &HeartbeatPayload,
+    delta_state: &SharedHeartbeatDeltaState,
+) -> Result<()> {
+    let snapshot = HeartbeatWireSnapshot::from_payload(payload)?;
+    let delta_body = lock_delta_state(delta_state).delta_body(&snapshot)?;
+    if let Some(body) = delta_body {
+        let response = post_heartbeat(client, body).await?;
+        if !is_heartbeat_resync_required(&response) {
+            let response = response.error_for_status()?;
+            lock_delta_state(delta_state).record(snapshot, &response);
+            return Ok(());
+        }
+        // The server lost or disagrees with our base (restart, another
+        // worker, eviction, digest mismatch). One full snapshot re-bases it.
+        tracing::info!(body = %response.body, "Heartbeat delta rejected; resending full snapshot");
+        lock_delta_state(delta_state).reset();
+    }
+    let body = serde_json::to_vec(&snapshot.value)?;
+    let response = post_heartbeat(client, body).await?.error_for_status()?;
+    lock_delta_state(delta_state).record(snapshot, &response);
+    Ok(())
+}
+
+async fn post_heartbeat(client: &ShipperClient, body: Vec<u8>) -> Result<JsonPostResponse> {
     client
-        .post_json_with_timeout("/api/agents/heartbeat", json, Some(HEARTBEAT_POST_TIMEOUT))
+        .post_json_response_with_timeout(
+            "/api/agents/heartbeat",
+            body,
+            Some(HEARTBEAT_POST_TIMEOUT),
+        )
         .await
 }
 
+/// Header carrying the `sessions_digest` the server stored as this machine's
+/// delta base. Only an acknowledged digest may be used as `base_digest`.
+pub const HEARTBEAT_BASE_ACK_HEADER: &str = "x-longhouse-heartbeat-base";
+const HEARTBEAT_RESYNC_REQUIRED_CODE: &str = "heartbeat_resync_required";
+
+pub type SharedHeartbeatDeltaState = Arc<Mutex<HeartbeatDeltaState>>;
+
+fn lock_delta_state(state: &SharedHeartbeatDeltaState) -> MutexGuard<'_, HeartbeatDeltaState> {
+    // The state is a cache of what the server acknowledged; a poisoned lock
+    // only means a panicked POST, and the worst stale base costs one resync.
+    state
+        .lock()
+        .unwrap_or_else(|poisoned| poisoned.into_inner())
+}
+
+fn is_heartbeat_resync_required(response: &JsonPostResponse) -> bool {
+    response.status.as_u16() == 409
+        && serde_json::from_str::<serde_json::Value>(&response.body)
+            .ok()
+            .and_then(|body| {
+                body.pointer("/detail/code")
+                    .and_then(serde_json::Value::as_str)
+                    .map(|code| code == HEARTBEAT_RESYNC_REQUIRED_CODE)
+            })
+            .unwrap_or(false)
+}
+
+/// Identity of one resolved session on the wire; must match
+/// `wire_session_key` in server/zerg/services/heartbeat_snapshot_base.py.
+fn wire_session_key(session: &serde_json::Value) -> String {
+    ["provider", "session_id", "provider_session_id"]
+        .iter()
+        .map(|field| {
+            session
+                .get(*field)
+                .and_then(serde_json::Value::as_str)
+                .unwrap_or("")
+        })
+        .collect::<Vec<_>>()
+        .join("|")
+}
+
+/// One heartbeat in wire form, with its sessions keyed for delta encoding.
+struct HeartbeatWireSnapshot {
+    value: serde_json::Value,
+    digest: Option<String>,
+    sessions: Vec<(String, serde_json::Value)>,
+    machine_evidence: serde_json::Value,
+}
+
+impl HeartbeatWireSnapshot {
+    fn from_payload(payload: &HeartbeatPayload) -> Result<Self> {
+        let value = serde_json::to_value(payload)?;
+        let sessions = value
+            .get("sessions")
+            .and_then(serde_json::Value::as_array)
+            .map(|sessions| {
+                sessions
+                    .iter()
+                    .map(|session| (wire_session_key(session), session.clone()))
+                    .collect()
+            })
+            .unwrap_or_default();
+        let machine_evidence = value
+            .get("machine_evidence")
+            .cloned()
+            .unwrap_or(serde_json::Value::Null);
+        Ok(Self {
+            digest: payload.sessions_digest.clone(),
+            value,
+            sessions,
+            machine_evidence,
+        })
+    }
+
+    fn has_unique_session_keys(&self) -> bool {
+        let keys: HashSet<&str> = self.sessions.iter().map(|(key, _)| key.as_str()).collect();
+        keys.len() == self.sessions.len()
+    }
+}
+
+#[derive(Debug, Clone)]
+struct HeartbeatDeltaBase {
+    digest: String,
+    sessions: BTreeMap<String, serde_json::Value>,
+    machine_evidence: serde_json::Value,
+}
+
+/// The last session snapshot the server acknowledged for this machine.
+///
+/// The server keeps the matching base in memory and rebuilds full snapshots
+/// from `snapshot_delta` bodies; it recomputes `sessions_digest` over every
+/// reconstruction and answers `409 heartbeat_resync_required` when it cannot,
+/// so this state only ever decides how much to send, never what is true.
+#[derive(Debug, Default)]
+pub struct HeartbeatDeltaState {
+    base: Option<HeartbeatDeltaBase>,
+}
+
+impl HeartbeatDeltaState {
+    /// Delta body for `snapshot`, or `None` when it must go out in full.
+    fn delta_body(&self, snapshot: &HeartbeatWireSnapshot) -> Result<Option<Vec<u8>>> {
+        let Some(base) = self.base.as_ref() else {
+            return Ok(None);
+        };
+        if snapshot.digest.is_none() || !snapshot.has_unique_session_keys() {
+            return Ok(None);
+        }
+        let current_keys: HashSet<&str> = snapshot
+            .sessions
+            .iter()
+            .map(|(key, _)| key.as_str())
+            .collect();
+        let upserted_sessions: Vec<&serde_json::Value> = snapshot
+            .sessions
+            .iter()
+            .filter(|(key, session)| base.sessions.get(key) != Some(session))
+            .map(|(_, session)| session)
+            .collect();
+        let removed_session_keys: Vec<&str> = base
+            .sessions
+            .keys()
+            .map(String::as_str)
+            .filter(|key| !current_keys.contains(key))
+            .collect();
+        let machine_evidence_unchanged = !snapshot.machine_evidence.is_null()
+            && snapshot.machine_evidence == base.machine_evidence;
+
+        let mut body = snapshot.value.clone();
+        let Some(fields) = body.as_object_mut() else {
+            return Ok(None);
+        };
+        fields.remove("sessions");
+        if machine_evidence_unchanged {
+            fields.remove("machine_evidence");
+        }
+        fields.insert(
+            "snapshot_delta".to_string(),
+            serde_json::json!({
+                "base_digest": base.digest,
+                "upserted_sessions": upserted_sessions,
+                "removed_session_keys": removed_session_keys,
+                "session_count": snapshot.sessions.len(),
+                "machine_evidence_unchanged": machine_evidence_unchanged,
+            }),
+        );
+        Ok(Some(serde_json::to_vec(&body)?))
+    }
+
+    /// Adopt `snapshot` as the base only if the server acknowledged its digest.
+    fn record(&mut self, snapshot: HeartbeatWireSnapshot, response: &JsonPostResponse) {
+        let acknowledged = response
+            .headers
+            .get(HEARTBEAT_BASE_ACK_HEADER)
+            .and_then(|value| value.to_str().ok());
+        self.base = match (snapshot.digest, acknowledged) {
+            (Some(digest), Some(acknowledged)) if digest == acknowledged => {
+                Some(HeartbeatDeltaBase {
+                    digest,
+                    sessions: snapshot.sessions.into_iter().collect(),
+                    machine_evidence: snapshot.machine_evidence,
+                })
+            }
+            _ => None,
+        };
+    }
+
+    fn reset(&mut self) {
+        self.base = None;
+    }
+}
+
 /// Result of the caller's attempt to read fresh phase-ledger rows. Serializes
 /// to `"ok"` / `"read_failed: <err>"` so verify-runtime-truth can tell a
 /// genuinely empty ledger apart from a ledger read that threw on emit.
@@ -5957,6 +6162,186 @@ mod tests {
         );
     }
 
+    fn delta_test_session(provider_session_id: &str) -> ResolvedLocalSession {
+        ResolvedLocalSession {
+            session_id: None,
+            provider: "claude".to_string(),
+            provider_session_id: Some(provider_session_id.to_string()),
+            control_path: "unmanaged".to_string(),
+            state: "running".to_string(),
+            phase: Some("thinking".to_string()),
+            tool_name: None,
+            phase_observed_at: None,
+            last_activity_at: None,
+            timeline_title: None,
+            first_user_message: None,
+            title_state: None,
+            title_source: None,
+            workspace: ResolvedWorkspace {
+                cwd: Some("/Users/test/git/zerg".to_string()),
+                label: Some("zerg".to_string()),
+                branch: None,
+            },
+            process: ResolvedProcess {
+                pid: Some(5000),
+                ..Default::default()
+            },
+            bridge: ResolvedBridge::default(),
+            evidence: ResolvedEvidence {
+                process_observed: true,
+                transcript_observed: true,
+                ..Default::default()
+            },
+            reason_codes: Vec::new(),
+        }
+    }
+
+    #[test]
+    fn session_snapshot_digest_matches_the_server_test_vector() {
+        // Pinned in server/tests_lite/test_heartbeat_endpoint.py
+        // (`test_session_snapshot_digest_matches_the_engine_test_vector`). The
+        // server recomputes this digest over every delta reconstruction, so a
+        // drift here turns every delta heartbeat into a resync.
+        let mut session = delta_test_session("thread-0");
+        session.evidence.join_keys = vec!["transcript".to_string(), "pid".to_string()];
+        session.reason_codes = vec!["transcript_recent".to_string(), "process_alive".to_string()];
+        let mut evidence = machine_evidence_from_observations(
+            "cinder",
+            &[],
+            &[],
+            &[],
+            &[],
+            &[],
+            &[],
+            &[],
+            &RunWindowIndex::default(),
+            true,
+            true,
+            Utc::now(),
+            Some(&[]),
+        );
+        evidence.activity = vec![ActivityEvidence {
+            authority_class: "provider_runtime".to_string(),
+            provider: "claude".to_string(),
+            session_id: "session-1".to_string(),
+            run_id: None,
+            kind: "tool_started".to_string(),
+            raw_kind: "tool_started".to_string(),
+            tool_name: Some("Bash".to_string()),
+            detail: None,
+            source: "claude_hook".to_string(),
+            observed_at: "2026-01-01T00:00:00Z".to_string(),
+            valid_until: "2026-01-01T00:10:00Z".to_string(),
+            raw_locator: None,
+            reason_codes: Vec::new(),
+        }];
+        let mut payload = digest_test_payload();
+        payload.sessions = vec![session];
+        payload.machine_evidence = Some(evidence);
+
+        assert_eq!(
+            session_snapshot_digest(&payload),
+            "ec21fcb793e91c3de7db2468c508093a164603572f16deff7afad611221547a3"
+        );
+    }
+
+    fn acknowledged(digest: &str) -> JsonPostResponse {
+        let mut headers = reqwest::header::HeaderMap::new();
+        headers.insert(HEARTBEAT_BASE_ACK_HEADER, digest.parse().unwrap());
+        JsonPostResponse {
+            status: reqwest::StatusCode::NO_CONTENT,
+            headers,
+            body: String::new(),
+        }
+    }
+
+    fn snapshot_of(sessions: Vec<ResolvedLocalSession>) -> HeartbeatWireSnapshot {
+        let mut payload = digest_test_payload();
+        payload.sessions = sessions;
+        payload.sessions_digest = Some(session_snapshot_digest(&payload));
+        HeartbeatWireSnapshot::from_payload(&payload).unwrap()
+    }
+
+    #[test]
+    fn heartbeat_delta_carries_only_changed_sessions_after_an_ack() {
+        let mut state = HeartbeatDeltaState::default();
+        let base = snapshot_of(vec![
+            delta_test_session("thread-0"),
+            delta_test_session("thread-1"),
+            delta_test_session("thread-2"),
+        ]);
+        assert!(
+            state.delta_body(&base).unwrap().is_none(),
+            "no acknowledged base yet, so the first heartbeat goes out in full"
+        );
+        let base_digest = base.digest.clone().unwrap();
+        state.record(base, &acknowledged(&base_digest));
+
+        let mut changed = delta_test_session("thread-1");
+        changed.phase = Some("tool_use".to_string());
+        let current = snapshot_of(vec![
+            delta_test_session("thread-0"),
+            changed,
+            delta_test_session("thread-3"),
+        ]);
+        let body: serde_json::Value =
+            serde_json::from_slice(&state.delta_body(&current).unwrap().unwrap()).unwrap();
+
+        assert!(body.get("sessions").is_none());
+        assert_eq!(body["sessions_digest"], current.digest.clone().unwrap());
+        let delta = &body["snapshot_delta"];
+        assert_eq!(delta["base_digest"], base_digest);
+        assert_eq!(delta["session_count"], 3);
+        let upserted: Vec<&str> = delta["upserted_sessions"]
+            .as_array()
+            .unwrap()
+            .iter()
+            .map(|session| session["provider_session_id"].as_str().unwrap())
+            .collect();
+        assert_eq!(upserted, vec!["thread-1", "thread-3"]);
+        assert_eq!(
+            delta["removed_session_keys"],
+            serde_json::json!(["claude||thread-2"])
+        );
+    }
+
+    #[test]
+    fn heartbeat_delta_base_requires_a_matching_ack() {
+        let mut state = HeartbeatDeltaState::default();
+        let snapshot = snapshot_of(vec![delta_test_session("thread-0")]);
+        state.record(snapshot, &acknowledged("some-other-digest"));
+        let next = snapshot_of(vec![delta_test_session("thread-0")]);
+        assert!(state.delta_body(&next).unwrap().is_none());
+
+        let digest = next.digest.clone().unwrap();
+        state.record(next, &acknowledged(&digest));
+        let after_reset = snapshot_of(vec![delta_test_session("thread-0")]);
+        assert!(state.delta_body(&after_reset).unwrap().is_some());
+        state.reset();
+        assert!(state.delta_body(&after_reset).unwrap().is_none());
+    }
+
+    #[test]
+    fn heartbeat_resync_is_recognized_only_from_its_error_code() {
+        let response = |status: u16, body: &str| JsonPostResponse {
+            status: reqwest::StatusCode::from_u16(status).unwrap(),
+            headers: reqwest::header::HeaderMap::new(),
+            body: body.to_string(),
+        };
+        assert!(is_heartbeat_resync_required(&response(
+            409,
+            r#"{"detail":{"code":"heartbeat_resync_required","reason":"missing_base"}}"#
+        )));
+        assert!(!is_heartbeat_resync_required(&response(
+            409,
+            r#"{"detail":"conflict"}"#
+        )));
+        assert!(!is_heartbeat_resync_required(&response(
+            503,
+            r#"{"detail":{"code":"heartbeat_resync_required"}}"#
+        )));
+    }
+
     #[test]
     fn canonical_evidence_hash_matches_server_golden_vector() {
         let vector: serde_json::Value =
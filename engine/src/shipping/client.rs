@@ -364,6 +364,21 @@ impl ShipperClient {
         body: Vec<u8>,
         request_timeout: Option<Duration>,
     ) -> Result<()> {
+        self.post_json_response_with_timeout(path_suffix, body, request_timeout)
+            .await?
+            .error_for_status()
+            .map(|_| ())
+    }
+
+    /// POST a small JSON payload and hand back status, headers and body so the
+    /// caller can act on protocol responses (e.g. a heartbeat resync 409)
+    /// before treating them as errors.
+    pub async fn post_json_response_with_timeout(
+        &self,
+        path_suffix: &str,
+        body: Vec<u8>,
+        request_timeout: Option<Duration>,
+    ) -> Result<JsonPostResponse> {
         let url = self.ingest_url.replace("/api/agents/ingest", path_suffix);
         let mut request = self
             .client
@@ -377,23 +392,13 @@ impl ShipperClient {
         }
         let resp = request.send().await.context("POST failed")?;
         let status = resp.status();
-        if status.is_success() {
-            return Ok(());
-        }
         let headers = resp.headers().clone();
         let body = resp.text().await.unwrap_or_default();
-        if let Some(detail) =
-            parse_server_write_backpressure(status.as_u16(), &headers, body.clone())
-        {
-            anyhow::bail!(
-                "POST returned Runtime Host write backpressure: kind={} lane={} retry_after_seconds={:?}: {}",
-                detail.kind,
-                detail.lane.as_deref().unwrap_or("unknown"),
-                detail.retry_after_seconds,
-                detail.body
-            );
-        }
-        anyhow::bail!("POST returned {status}: {body}");
+        Ok(JsonPostResponse {
+            status,
+            headers,
+            body,
+        })
     }
 
     /// POST JSON and decode a JSON response with an optional request timeout.
@@ -797,6 +802,36 @@ fn parse_server_backpressure(
     })
 }
 
+/// A JSON POST response whose status the caller has not judged yet.
+#[derive(Debug)]
+pub struct JsonPostResponse {
+    pub status: reqwest::StatusCode,
+    pub headers: HeaderMap,
+    pub body: String,
+}
+
+impl JsonPostResponse {
+    /// Turn a non-2xx response into the same error `post_json_with_timeout`
+    /// has always returned, including the write-backpressure detail.
+    pub fn error_for_status(self) -> Result<Self> {
+        if self.status.is_success() {
+            return Ok(self);
+        }
+        if let Some(detail) =
+            parse_server_write_backpressure(self.status.as_u16(), &self.headers, self.body.clone())
+        {
+            anyhow::bail!(
+                "POST returned Runtime Host write backpressure: kind={} lane={} retry_after_seconds={:?}: {}",
+                detail.kind,
+                detail.lane.as_deref().unwrap_or("unknown"),
+                detail.retry_after_seconds,
+                detail.body
+            );
+        }
+        anyhow::bail!("POST returned {}: {}", self.status, self.body);
+    }
+}
+
 fn parse_server_write_backpressure(
     status_code: u16,
     headers: &reqwest::header::HeaderMap,
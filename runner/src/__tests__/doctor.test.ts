@@ -33,6 +33,7 @@ function deps(overrides: Partial<DoctorDeps> = {}): DoctorDeps {
       maxReconnectDelayMs: 60000,
       connectTimeoutMs: 15000,
       capabilities: ['exec.full'],
+      maxConcurrentJobs: 1,
     }),
     runCommand: () => ({ status: 0, stdout: '', stderr: '' }),
     fetchHealth: async () => true,
@@ -59,6 +59,7 @@ describe('RunnerWebSocketClient reconnect behavior', () => {
         maxReconnectDelayMs: 50,
         connectTimeoutMs: 50,
         capabilities: ['exec.full'],
+        maxConcurrentJobs: 1,
       },
       metadata,
     );
@@ -9,6 +9,8 @@
  * backends simultaneously. Falls back to LONGHOUSE_URL for single-backend mode.
  */
 
+import { availableParallelism } from 'node:os';
+
 export interface RunnerConfig {
   longhouseUrl: string;
   longhouseUrls: string[];
@@ -20,6 +22,7 @@ export interface RunnerConfig {
   maxReconnectDelayMs: number;
   connectTimeoutMs: number;
   capabilities: string[];
+  maxConcurrentJobs: number;
 }
 
 export function loadConfig(env: NodeJS.ProcessEnv = process.env): RunnerConfig {
@@ -61,6 +64,9 @@ export function loadConfig(env: NodeJS.ProcessEnv = process.env): RunnerConfig {
   const capabilitiesStr = env.RUNNER_CAPABILITIES || 'exec.readonly';
   const capabilities = capabilitiesStr.split(',').map((s) => s.trim()).filter((s) => s);
 
+  // Jobs the server may dispatch at once (default: one per CPU)
+  const maxConcurrentJobs = parseInt(env.RUNNER_MAX_CONCURRENT_JOBS || String(availableParallelism()), 10);
+
   return {
     longhouseUrl,
     longhouseUrls,
@@ -72,5 +78,6 @@ export function loadConfig(env: NodeJS.ProcessEnv = process.env): RunnerConfig {
     maxReconnectDelayMs: parseInt(env.MAX_RECONNECT_DELAY_MS || '60000', 10),
     connectTimeoutMs: parseInt(env.CONNECT_TIMEOUT_MS || '15000', 10),
     capabilities,
+    maxConcurrentJobs: Number.isFinite(maxConcurrentJobs) && maxConcurrentJobs > 0 ? maxConcurrentJobs : 1,
   };
 }
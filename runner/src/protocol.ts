@@ -75,6 +75,7 @@ export interface RunnerMetadata {
   heartbeat_interval_ms?: number;
   docker_available?: boolean;
   capabilities?: string[];
+  max_concurrent_jobs?: number;
   install_mode?: string;
   auto_update_policy?: string;
   install_layout_version?: number;
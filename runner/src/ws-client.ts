@@ -152,6 +152,7 @@ export class RunnerWebSocketClient {
         ...metadata,
         heartbeat_interval_ms: this.config.heartbeatIntervalMs,
         capabilities: this.config.capabilities,
+        max_concurrent_jobs: this.config.maxConcurrentJobs,
       },
     };
 
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Measure session-detail event serialization with and without cached fragments.
+
+Projects a synthetic page of render events the way the storage-v2 workspace
+does and times three paths: the dict path FastAPI renders through
+`jsonable_encoder` and `JSONResponse`, the fragment path on a cold cache, and
+the fragment path on a warm cache (a repeat poll or another tab). Every run
+asserts the fragment body is byte-identical to the dict body.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "server"))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("TESTING", "1")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+from zerg.services.event_fragments import get_event_fragment_cache  # noqa: E402
+from zerg.services.event_fragments import render_json  # noqa: E402
+from zerg.services.storage_v2_workspace import _event_projection  # noqa: E402
+
+
+def _events(count: int) -> list[dict[str, object]]:
+    events: list[dict[str, object]] = []
+    for index in range(count):
+        tool = index % 3 == 1
+        events.append(
+            {
+                "event_id": f"event-{index}",
+                "cursor": f"cursor-{index}",
+                "timestamp": "2026-07-12T12:00:00+00:00",
+                "role": "assistant" if tool else ("user" if index % 3 == 0 else "assistant"),
+                "content_text": None if tool else f"message {index} — " + "lorem ipsum " * 20,
+                "tool_name": "exec_command" if tool else None,
+                "tool_input_json": json.dumps({"cmd": ["bash", "-lc", f"make test TARGET={index}"]}) if tool else None,
+                "tool_output_text": ("ok\n" * 40) if tool else None,
+                "tool_call_id": f"call-{index}" if tool else None,
+                "branch_kind": None,
+            }
+        )
+    return events
+
+
+def _page(events: list[dict[str, object]], *, session_id, object_hash: str | None) -> dict[str, object]:
+    completed = {str(event["tool_call_id"]) for event in events if event.get("tool_call_id")}
+    items = [
+        _event_projection(
+            event,
+            session_id=session_id,
+            closed=False,
+            provider="codex",
+            completed_tool_call_ids=completed,
+            source=(object_hash, ordinal) if object_hash else None,
+        )
+        for ordinal, event in enumerate(events)
+    ]
+    return {"session_id": str(session_id), "projection": {"items": items, "next_cursor": None}}
+
+
+def _summary(samples_ms: list[float]) -> dict[str, float]:
+    ordered = sorted(samples_ms)
+    p95_index = max(0, min(len(ordered) - 1, int(len(ordered) * 0.95) - 1))
+    return {
+        "count": len(ordered),
+        "p50_ms": round(statistics.median(ordered), 4),
+        "p95_ms": round(ordered[p95_index], 4),
+        "max_ms": round(ordered[-1], 4),
+    }
+
+
+def run(*, events: int, iterations: int) -> dict[str, object]:
+    session_id = uuid4()
+    page_events = _events(events)
+    cache = get_event_fragment_cache()
+    dict_ms: list[float] = []
+    cold_ms: list[float] = []
+    warm_ms: list[float] = []
+    body_bytes = 0
+    for _ in range(iterations):
+        started = time.perf_counter_ns()
+        expected = JSONResponse(jsonable_encoder(_page(page_events, session_id=session_id, object_hash=None))).body
+        dict_ms.append((time.perf_counter_ns() - started) / 1_000_000)
+
+        object_hash = uuid4().hex * 2
+        started = time.perf_counter_ns()
+        cold = render_json(_page(page_events, session_id=session_id, object_hash=object_hash))
+        cold_ms.append((time.perf_counter_ns() - started) / 1_000_000)
+
+        started = time.perf_counter_ns()
+        warm = render_json(_page(page_events, session_id=session_id, object_hash=object_hash))
+        warm_ms.append((time.perf_counter_ns() - started) / 1_000_000)
+
+        if cold != expected or warm != expected:
+            raise SystemExit("fragment body differs from the JSONResponse body")
+        body_bytes = len(expected)
+    stats = cache.stats()
+    dict_p50 = statistics.median(dict_ms)
+    warm_p50 = statistics.median(warm_ms)
+    return {
+        "events": events,
+        "body_bytes": body_bytes,
+        "dict_path": _summary(dict_ms),
+        "fragment_cold": _summary(cold_ms),
+        "fragment_warm": _summary(warm_ms),
+        "warm_speedup": round(dict_p50 / warm_p50, 2) if warm_p50 else None,
+        "cache": {
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "evictions": stats.evictions,
+            "entries": stats.entries,
+            "resident_bytes": stats.resident_bytes,
+            "max_bytes": stats.max_bytes,
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--min-warm-speedup", type=float, default=None)
+    args = parser.parse_args()
+    if args.events < 1 or args.iterations < 1:
+        raise SystemExit("events and iterations must be positive")
+
+    result = run(events=args.events, iterations=args.iterations)
+    if args.min_warm_speedup is None:
+        print(json.dumps(result, indent=2, sort_keys=True))
+        return 0
+    result["gate_min_warm_speedup"] = args.min_warm_speedup
+    result["passed"] = (result["warm_speedup"] or 0) >= args.min_warm_speedup
+    print(json.dumps(result, indent=2, sort_keys=True))
+    return 0 if result["passed"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
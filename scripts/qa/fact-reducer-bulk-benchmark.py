@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""Compare bulk fact reduction with 256-fact setwise slices across session counts.
+
+Each round seeds one heartbeat's worth of heads, then reduces the next one (every
+session advances its sequence) inside a single catalog transaction. The
+`setwise_slices` mode is what a caller with more than 256 facts had to do
+before `reduce_fact_batch_bulk`; `bulk` reduces the batch in one pass. Reported
+statements are SQL statements executed by the reduce call alone.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "server"))
+
+from sqlalchemy import event  # noqa: E402
+
+from zerg.catalogd.fact_reducer import MAX_REDUCER_FACTS  # noqa: E402
+from zerg.catalogd.fact_reducer import ReducerFact  # noqa: E402
+from zerg.catalogd.fact_reducer import reduce_fact_batch_bulk  # noqa: E402
+from zerg.catalogd.fact_reducer import reduce_fact_batch_setwise  # noqa: E402
+from zerg.catalogd.schema import create_catalog_engine  # noqa: E402
+from zerg.catalogd.schema import initialize_catalog_schema  # noqa: E402
+from zerg.machine_evidence import canonical_evidence_hash  # noqa: E402
+
+BASE_TIME = datetime(2026, 8, 1, 12, 0, tzinfo=UTC)
+
+
+def _facts(sessions: int, facts_per_session: int, seq: int) -> list[ReducerFact]:
+    facts: list[ReducerFact] = []
+    observed_at = BASE_TIME + timedelta(seconds=seq)
+    for session in range(sessions):
+        for index in range(facts_per_session):
+            subject = f"run:run-{session}-{index}"
+            value = {
+                "kind": "thinking" if seq % 2 else "idle",
+                "observed_at": observed_at.isoformat(),
+                "run_id": f"run-{session}-{index}",
+                "session_id": f"session-{session}",
+            }
+            facts.append(
+                ReducerFact(
+                    family="activity",
+                    subject_key=subject,
+                    source="phase_ledger",
+                    source_epoch="epoch-1",
+                    source_seq=seq,
+                    dedupe_key=hashlib.sha256(f"activity:{subject}:phase_ledger:epoch-1:{seq}".encode()).hexdigest(),
+                    evidence_hash=canonical_evidence_hash(value),
+                    value=value,
+                    observed_at=observed_at,
+                    session_id=f"session-{session}",
+                    valid_until=observed_at + timedelta(seconds=90),
+                )
+            )
+    return facts
+
+
+def _reduce(mode: str, connection, facts: list[ReducerFact], received_at: datetime) -> None:
+    if mode == "bulk":
+        reduce_fact_batch_bulk(connection, facts, received_at=received_at)
+        return
+    for start in range(0, len(facts), MAX_REDUCER_FACTS):
+        reduce_fact_batch_setwise(connection, facts[start : start + MAX_REDUCER_FACTS], received_at=received_at)
+
+
+def run(mode: str, *, sessions: int, facts_per_session: int, rounds: int, workdir: Path) -> dict[str, object]:
+    engine = create_catalog_engine(workdir / f"{mode}-{sessions}.db")
+    initialize_catalog_schema(engine)
+    statements = 0
+
+    def count_statement(*_args) -> None:
+        nonlocal statements
+        statements += 1
+
+    samples_ms: list[float] = []
+    statement_counts: list[int] = []
+    with engine.begin() as connection:
+        _reduce(mode, connection, _facts(sessions, facts_per_session, 1), BASE_TIME)
+    event.listen(engine, "before_cursor_execute", count_statement)
+    try:
+        for round_index in range(rounds):
+            seq = round_index + 2
+            facts = _facts(sessions, facts_per_session, seq)
+            with engine.begin() as connection:
+                statements = 0
+                started = time.perf_counter_ns()
+                _reduce(mode, connection, facts, BASE_TIME + timedelta(seconds=seq))
+                samples_ms.append((time.perf_counter_ns() - started) / 1_000_000)
+                statement_counts.append(statements)
+    finally:
+        event.remove(engine, "before_cursor_execute", count_statement)
+        engine.dispose()
+    return {
+        "facts": sessions * facts_per_session,
+        "p50_ms": round(statistics.median(samples_ms), 3),
+        "max_ms": round(max(samples_ms), 3),
+        "statements": max(statement_counts),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, nargs="+", default=[10, 100, 1_000])
+    parser.add_argument("--facts-per-session", type=int, default=2)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    if args.rounds < 1 or args.facts_per_session < 1 or min(args.sessions) < 1:
+        raise SystemExit("sessions, facts-per-session and rounds must be positive")
+    result: dict[str, object] = {"facts_per_session": args.facts_per_session, "rounds": args.rounds}
+    with tempfile.TemporaryDirectory(prefix="fact-reducer-bench-") as workdir:
+        for sessions in args.sessions:
+            result[f"sessions_{sessions}"] = {
+                mode: run(
+                    mode,
+                    sessions=sessions,
+                    facts_per_session=args.facts_per_session,
+                    rounds=args.rounds,
+                    workdir=Path(workdir),
+                )
+                for mode in ("setwise_slices", "bulk")
+            }
+    print(json.dumps(result, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
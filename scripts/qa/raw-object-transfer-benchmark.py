@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Compare pickled and shared-memory raw-object transfer from the read workers.
+
+Seals one raw object per size, then streams it through
+`RawObjectWorkerPool.open_records` the way raw export does, once with the
+`pickle` transfer and once with `shared_memory`. Each sample covers the worker
+read and verification, the transfer back to this process, and copying every
+record out; the object file stays in the page cache after the first round.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from uuid import uuid4
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "server"))
+
+from zerg.services.raw_object_workers import RawObjectWorkerPool  # noqa: E402
+from zerg.storage_v2.raw_objects import RawObjectSpec  # noqa: E402
+from zerg.storage_v2.raw_objects import RawRecord  # noqa: E402
+
+RECORD_BYTES = 64_000
+
+
+def _spec(total_bytes: int) -> RawObjectSpec:
+    records: list[RawRecord] = []
+    position = 0
+    while position < total_bytes:
+        size = min(RECORD_BYTES, total_bytes - position)
+        # Varied, line-shaped records so zstd does not collapse the object.
+        body = (f'{{"seq":{len(records)},"text":"' + "x" * max(0, size - 40)).encode()[: size - 3] + b'"}\n'
+        records.append(RawRecord(source_position=position, data=body.ljust(size, b" ")))
+        position += size
+    return RawObjectSpec(
+        tenant_id="single",
+        machine_id="bench",
+        session_id=uuid4(),
+        provider="codex",
+        opaque_source_id="history.jsonl",
+        source_epoch=uuid4(),
+        range_kind="byte_offset",
+        range_start=0,
+        range_end=position,
+        records=tuple(records),
+    )
+
+
+async def run(mode: str, *, sizes_mb: list[int], rounds: int, root: Path) -> dict[str, object]:
+    pool = RawObjectWorkerPool(root, live_workers=1, repair_workers=1, queue_multiplier=1, read_transfer=mode)
+    result: dict[str, object] = {}
+    try:
+        await pool.start()
+        for size_mb in sizes_mb:
+            spec = _spec(size_mb * 1_000_000)
+            sealed = await pool.seal(spec, lane="live", operation_timeout_seconds=120.0)
+            samples_ms: list[float] = []
+            for _ in range(rounds):
+                started = time.perf_counter_ns()
+                streamed = 0
+                async with pool.open_records(
+                    sealed.object_path,
+                    sealed.object_hash,
+                    spec.tenant_id,
+                    operation_timeout_seconds=120.0,
+                ) as records:
+                    for data in records.record_data():
+                        streamed += len(data)
+                samples_ms.append((time.perf_counter_ns() - started) / 1_000_000)
+                if streamed != spec.range_end:
+                    raise SystemExit(f"{mode} streamed {streamed} bytes, expected {spec.range_end}")
+            result[f"{size_mb}mb"] = {
+                "p50_ms": round(statistics.median(samples_ms), 3),
+                "max_ms": round(max(samples_ms), 3),
+            }
+    finally:
+        await pool.close()
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes-mb", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    if args.rounds < 1 or min(args.sizes_mb) < 1 or max(args.sizes_mb) > 33:
+        raise SystemExit("rounds must be positive and sizes must be between 1 and 33 MB")
+    result: dict[str, object] = {"rounds": args.rounds}
+    with tempfile.TemporaryDirectory(prefix="raw-transfer-bench-") as workdir:
+        for mode in ("pickle", "shared_memory"):
+            result[mode] = asyncio.run(run(mode, sizes_mb=args.sizes_mb, rounds=args.rounds, root=Path(workdir) / mode))
+    print(json.dumps(result, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""Compare fused `search.recall.v2` against the per-lane recall round trips.
+
+Builds a synthetic searchd corpus from the vocabulary of
+`eval/recall/queries.jsonl`, starts a real `SearchDaemon` on it, and runs every
+eval query through both shapes of `/recall?mode=auto` discovery and hydration:
+
+- `per_lane`: `search.query.v2` and `search.embedding.query.v2` concurrently,
+  then one `search.context.v2` per fused winner (2 + k round trips);
+- `fused`: one `search.recall.v2`.
+
+Query vectors are deterministic hashes of the query text, so this measures the
+daemon and the wire, not the embedding model; see
+recall-query-embedding-benchmark.py for that stage. Result quality is not
+scored here: the corpus is synthetic and has no gold labels.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+from uuid import uuid4
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "server"))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("TESTING", "1")
+
+import numpy as np  # noqa: E402
+
+from zerg.catalogd.client import CatalogClient  # noqa: E402
+from zerg.embedding_space import ACTIVE_EMBEDDING_DIMS  # noqa: E402
+from zerg.embedding_space import ACTIVE_EMBEDDING_MODEL  # noqa: E402
+from zerg.searchd.recall import dense_candidates  # noqa: E402
+from zerg.searchd.recall import evidence_locator  # noqa: E402
+from zerg.searchd.recall import lexical_candidates  # noqa: E402
+from zerg.searchd.recall import rrf_fuse  # noqa: E402
+from zerg.searchd.server import SearchDaemon  # noqa: E402
+from zerg.searchd.server import _embedding_write_params  # noqa: E402
+from zerg.searchd.store import SCHEMA_GENERATION  # noqa: E402
+from zerg.searchd.store import SearchStore  # noqa: E402
+from zerg.searchd.store import object_set_hash  # noqa: E402
+from zerg.searchd.store import open_search_database  # noqa: E402
+
+QUERIES_PATH = ROOT / "eval" / "recall" / "queries.jsonl"
+OWNER_ID = "42"
+
+
+def _load_queries() -> list[str]:
+    queries: list[str] = []
+    for line in QUERIES_PATH.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("//"):
+            continue
+        row = json.loads(line)
+        if isinstance(row.get("query"), str):
+            queries.append(row["query"])
+    if not queries:
+        raise SystemExit(f"no queries in {QUERIES_PATH}")
+    return queries
+
+
+def _vector(text: str) -> np.ndarray:
+    seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "big")
+    vector = np.random.default_rng(seed).standard_normal(ACTIVE_EMBEDDING_DIMS).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _records(words: list[str], *, rng: random.Random, turns: int, started_us: int) -> list[dict]:
+    records = []
+    for ordinal in range(turns):
+        records.append(
+            {
+                "event_id": f"event-{ordinal}",
+                "record_ordinal": ordinal,
+                "order_time_us": started_us + ordinal,
+                "source_position": ordinal,
+                "event_subordinal": 0,
+                "role": "user" if ordinal % 2 == 0 else "assistant",
+                "interaction_kind": "durable_user_message" if ordinal % 2 == 0 else "assistant_message",
+                "content_text": " ".join(rng.choices(words, k=40)),
+                "tool_name": None,
+                "tool_output_text": None,
+                "tool_call_id": None,
+                "thread_id": None,
+                "branch_kind": None,
+            }
+        )
+    return records
+
+
+def build_corpus(path: Path, *, sessions: int, turns: int, vocabulary: list[str], seed: int) -> None:
+    rng = random.Random(seed)
+    connection = open_search_database(path)
+    store = SearchStore(connection)
+    now = datetime.now(UTC)
+    for index in range(sessions):
+        session_id = str(uuid4())
+        generation_id = str(uuid4())
+        object_id = hashlib.sha256(f"recall-fusion-{index}".encode()).hexdigest()
+        started = now - timedelta(days=rng.uniform(0, 60))
+        records = _records(vocabulary, rng=rng, turns=turns, started_us=int(started.timestamp() * 1_000_000))
+        store.index_object(
+            session_id=session_id,
+            generation_id=generation_id,
+            object_id=object_id,
+            desired_revision=1,
+            provider="codex",
+            machine_id="bench",
+            project="longhouse",
+            environment="local",
+            cwd=None,
+            git_repo=None,
+            opaque_source_id="codex/session.jsonl",
+            source_epoch=str(uuid4()),
+            records=records,
+        )
+        store.publish_generation(
+            session_id=session_id,
+            generation_id=generation_id,
+            owner_id=OWNER_ID,
+            desired_revision=1,
+            object_count=1,
+            object_set_hash=object_set_hash([object_id]),
+            event_count=len(records),
+            project="longhouse",
+            provider="codex",
+            environment="local",
+            cwd=None,
+            git_repo=None,
+            started_at=started.isoformat(),
+        )
+        episode_text = " ".join(record["content_text"] for record in records[:2])
+        store.write_episode_embeddings(
+            **_embedding_write_params(
+                {
+                    "session_id": session_id,
+                    "owner_id": OWNER_ID,
+                    "generation_id": generation_id,
+                    "revision": "1",
+                    "model": ACTIVE_EMBEDDING_MODEL,
+                    "dims": ACTIVE_EMBEDDING_DIMS,
+                    "complete": True,
+                    "desired_episode_ordinals": [0],
+                    "reused_episodes": [],
+                    "episodes": [
+                        {
+                            "episode_ordinal": 0,
+                            "event_index_start": 0,
+                            "event_index_end": 1,
+                            "start_order_time_us": records[0]["order_time_us"],
+                            "content_hash": hashlib.sha256(episode_text.encode()).hexdigest(),
+                            "embedding": base64.b64encode(_vector(episode_text).tobytes()).decode("ascii"),
+                        }
+                    ],
+                }
+            )
+        )
+    connection.close()
+
+
+def _summary(samples_ms: list[float]) -> dict[str, float]:
+    ordered = sorted(samples_ms)
+    p95_index = max(0, min(len(ordered) - 1, int(len(ordered) * 0.95) - 1))
+    return {
+        "count": len(ordered),
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[p95_index], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+async def _per_lane(client: CatalogClient, query: str, *, window_start_us: int, limit: int, depth: int, context_turns: int) -> int:
+    embedding = base64.b64encode(_vector(query).tobytes()).decode("ascii")
+    lexical, dense = await asyncio.gather(
+        client.call(
+            "search.query.v2",
+            {
+                "owner_id": OWNER_ID,
+                "query": query,
+                "project": None,
+                "provider": None,
+                "environment": None,
+                "window_start_us": window_start_us,
+                "window_end_us": None,
+                "limit": depth,
+                "include_snippets": False,
+                "include_origin_hidden": False,
+                "include_test": False,
+            },
+        ),
+        client.call(
+            "search.embedding.query.v2",
+            {
+                "model": ACTIVE_EMBEDDING_MODEL,
+                "owner_id": OWNER_ID,
+                "dims": ACTIVE_EMBEDDING_DIMS,
+                "query_embedding": embedding,
+                "limit": min(200, depth * 3),
+                "project": None,
+                "provider": None,
+                "environment": None,
+                "exclude_environments": ["test", "e2e", "automation"],
+                "since_iso": None,
+            },
+        ),
+    )
+    fused = rrf_fuse(
+        lexical_candidates(lexical["results"], include_test=False, include_automation=False, depth=depth),
+        dense_candidates(dense["results"], depth=depth),
+        limit=limit,
+    )
+    locators = [locator for locator in (evidence_locator(entry) for entry in fused) if locator is not None]
+    await asyncio.gather(
+        *(client.call("search.context.v2", {"owner_id": OWNER_ID, **locator, "context_turns": context_turns}) for locator in locators)
+    )
+    return 2 + len(locators)
+
+
+async def _fused(
+    client: CatalogClient,
+    query: str,
+    *,
+    window_start_us: int,
+    limit: int,
+    depth: int,
+    context_turns: int,
+    store_id: str,
+) -> dict[str, object]:
+    return await client.call(
+        "search.recall.v2",
+        {
+            "owner_id": OWNER_ID,
+            "query": query,
+            "project": None,
+            "provider": None,
+            "window_start_us": window_start_us,
+            "include_test": False,
+            "include_automation": False,
+            "candidate_depth": depth,
+            "limit": limit,
+            "context_turns": context_turns,
+            "discovery_timeout_ms": 4_000,
+            "dense": {
+                "model": ACTIVE_EMBEDDING_MODEL,
+                "dims": ACTIVE_EMBEDDING_DIMS,
+                "query_embedding": base64.b64encode(_vector(query).tobytes()).decode("ascii"),
+                "limit": min(200, depth * 3),
+                "exclude_environments": ["test", "e2e", "automation"],
+                "since_iso": None,
+                "expected_store_id": store_id,
+                "expected_schema_generation": SCHEMA_GENERATION,
+            },
+        },
+    )
+
+
+async def run(database_path: Path, queries: list[str], *, repeats: int, limit: int, context_turns: int, since_days: int) -> dict:
+    socket_parent = Path(tempfile.mkdtemp(prefix="lhs-", dir="/tmp"))
+    socket_path = socket_parent / "s"
+    daemon = SearchDaemon(database_path=database_path, socket_path=socket_path)
+    await daemon.start()
+    client = CatalogClient(socket_path, default_timeout_seconds=5.0)
+    depth = min(200, limit * 5)
+    window_start_us = int((datetime.now(UTC) - timedelta(days=since_days)).timestamp() * 1_000_000)
+    per_lane_ms: list[float] = []
+    fused_ms: list[float] = []
+    round_trips: list[int] = []
+    stages: dict[str, list[float]] = {"lexical_ms": [], "dense_ms": [], "fuse_ms": [], "hydrate_ms": []}
+    try:
+        store_id = str((await client.call("search.ping.v2"))["store_id"])
+        for _ in range(repeats):
+            for query in queries:
+                started = time.perf_counter_ns()
+                round_trips.append(
+                    await _per_lane(client, query, window_start_us=window_start_us, limit=limit, depth=depth, context_turns=context_turns)
+                )
+                per_lane_ms.append((time.perf_counter_ns() - started) / 1_000_000)
+                started = time.perf_counter_ns()
+                result = await _fused(
+                    client,
+                    query,
+                    window_start_us=window_start_us,
+                    limit=limit,
+                    depth=depth,
+                    context_turns=context_turns,
+                    store_id=store_id,
+                )
+                fused_ms.append((time.perf_counter_ns() - started) / 1_000_000)
+                for stage, value in result["stage_timing"].items():
+                    if value is not None:
+                        stages[stage].append(value)
+    finally:
+        await client.close()
+        await daemon.close()
+        socket_parent.rmdir()
+    return {
+        "per_lane": {**_summary(per_lane_ms), "mean_round_trips": round(statistics.mean(round_trips), 2)},
+        "fused": {**_summary(fused_ms), "round_trips": 1},
+        "fused_stages": {stage: _summary(values) for stage, values in stages.items() if values},
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=2_000)
+    parser.add_argument("--turns", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--max-results", type=int, default=5)
+    parser.add_argument("--context-turns", type=int, default=2)
+    parser.add_argument("--since-days", type=int, default=90)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    if args.sessions < 1 or args.turns < 2 or args.repeats < 1 or not 1 <= args.max_results <= 25:
+        raise SystemExit("sessions, turns, repeats and max-results must be positive and in range")
+
+    queries = _load_queries()
+    vocabulary = sorted({word.casefold() for query in queries for word in query.split() if word.isalpha()})
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = Path(directory) / "search.db"
+        build_started = time.perf_counter()
+        build_corpus(database_path, sessions=args.sessions, turns=args.turns, vocabulary=vocabulary, seed=args.seed)
+        build_seconds = time.perf_counter() - build_started
+        result = asyncio.run(
+            run(
+                database_path,
+                queries,
+                repeats=args.repeats,
+                limit=args.max_results,
+                context_turns=args.context_turns,
+                since_days=args.since_days,
+            )
+        )
+    result.update(
+        {
+            "queries": len(queries),
+            "sessions": args.sessions,
+            "turns": args.turns,
+            "corpus_build_seconds": round(build_seconds, 2),
+        }
+    )
+    print(json.dumps(result, indent=2, sort_keys=True))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""Load-test fused recall on a synthetic searchd corpus: latency and recall@k together.
+
+`eval/recall/run_eval.py` scores relevance against the hosted corpus one query
+at a time. This drives the same `eval/recall/queries.jsonl` queries through
+query embedding and `search.recall.v2` against a local `SearchDaemon`, at a
+configurable corpus size and concurrency, and reports:
+
+- per-stage p50/p95/p99 for embed, FTS, dense scan, RRF and hydration (the
+  searchd stages come from its own `stage_timing`), plus the RPC and the
+  end-to-end request;
+- throughput in completed recalls per second;
+- recall@k against gold sessions planted in the corpus.
+
+Gold is planted per category, so each lane has something it must find:
+`exact` queries get a session containing every query term with an unrelated
+vector, `paraphrase` a session sharing no terms whose episode vector lies near
+the query, and `causal`/`supersession` both. `absent` queries plant nothing and
+are timed but not scored. Scores are therefore a regression signal for index,
+fusion and cache changes, not a measure of real retrieval quality; that stays
+`run_eval.py`'s job.
+
+Without `--model-dir` query vectors are hashes of the text and the embed stage
+costs almost nothing. With it the pinned ONNX model embeds both the queries
+and the planted gold episodes, so the embed stage and its query cache are real.
+Corpora are cached under `--corpus-dir` by size, seed and embedding mode;
+building one million episodes takes a while.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+from uuid import uuid4
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "server"))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("TESTING", "1")
+
+import numpy as np  # noqa: E402
+
+from zerg.catalogd.client import CatalogClient  # noqa: E402
+from zerg.embedding_space import ACTIVE_EMBEDDING_DIMS  # noqa: E402
+from zerg.embedding_space import ACTIVE_EMBEDDING_MODEL  # noqa: E402
+from zerg.searchd.server import SearchDaemon  # noqa: E402
+from zerg.searchd.server import _embedding_write_params  # noqa: E402
+from zerg.searchd.store import SCHEMA_GENERATION  # noqa: E402
+from zerg.searchd.store import SearchStore  # noqa: E402
+from zerg.searchd.store import object_set_hash  # noqa: E402
+from zerg.searchd.store import open_search_database  # noqa: E402
+
+QUERIES_PATH = ROOT / "eval" / "recall" / "queries.jsonl"
+OWNER_ID = "42"
+# Which lanes a planted gold session is built to be found by.
+_PLANTED_LANES = {
+    "exact": ("lexical",),
+    "paraphrase": ("dense",),
+    "causal": ("lexical", "dense"),
+    "supersession": ("lexical", "dense"),
+}
+_STAGES = ("embed_ms", "lexical_ms", "dense_ms", "fuse_ms", "hydrate_ms", "rpc_ms", "end_to_end_ms")
+# Filler vocabulary beyond the query words, so FTS has realistic competition
+# rather than every event matching some query term.
+_FILLER_WORDS = 4_000
+
+
+def _load_queries() -> list[dict[str, str]]:
+    queries: list[dict[str, str]] = []
+    for line in QUERIES_PATH.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("//"):
+            continue
+        row = json.loads(line)
+        if isinstance(row.get("query"), str) and isinstance(row.get("id"), str):
+            queries.append({"id": row["id"], "category": str(row.get("category") or ""), "query": row["query"]})
+    if not queries:
+        raise SystemExit(f"no queries in {QUERIES_PATH}")
+    return queries
+
+
+def _terms(text: str) -> list[str]:
+    return re.findall(r"[a-z0-9]+", text.casefold())
+
+
+class _Embedder:
+    """Query and episode vectors: the real local model, or a stable text hash."""
+
+    def __init__(self, model_dir: Path | None) -> None:
+        self.mode = "hash"
+        if model_dir is not None:
+            from zerg.models_config import get_embedding_space_config
+            from zerg.services import local_embedder
+
+            local_embedder.initialize_local_embedder(get_embedding_space_config(), model_dir)
+            self.mode = "onnx"
+
+    async def embed(self, text: str) -> np.ndarray:
+        if self.mode == "onnx":
+            from zerg.services import local_embedder
+
+            return np.asarray(await local_embedder.embed_query(text), dtype=np.float32)
+        seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "big")
+        vector = np.random.default_rng(seed).standard_normal(ACTIVE_EMBEDDING_DIMS).astype(np.float32)
+        return vector / np.linalg.norm(vector)
+
+
+def _random_unit(rng: np.random.Generator) -> np.ndarray:
+    vector = rng.standard_normal(ACTIVE_EMBEDDING_DIMS).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _near(vector: np.ndarray, *, signal: float, rng: np.random.Generator) -> np.ndarray:
+    noise = _random_unit(rng)
+    near = signal * vector + math.sqrt(max(0.0, 1 - signal * signal)) * noise
+    return (near / np.linalg.norm(near)).astype(np.float32)
+
+
+def _session(
+    store: SearchStore,
+    *,
+    index: int,
+    texts: list[str],
+    vectors: list[np.ndarray],
+    started: datetime,
+) -> str:
+    session_id = str(uuid4())
+    generation_id = str(uuid4())
+    object_id = hashlib.sha256(f"recall-load-{index}".encode()).hexdigest()
+    started_us = int(started.timestamp() * 1_000_000)
+    records = []
+    for ordinal, text in enumerate(texts):
+        records.append(
+            {
+                "event_id": f"event-{ordinal}",
+                "record_ordinal": ordinal,
+                "order_time_us": started_us + ordinal,
+                "source_position": ordinal,
+                "event_subordinal": 0,
+                "role": "user" if ordinal % 2 == 0 else "assistant",
+                "interaction_kind": "durable_user_message" if ordinal % 2 == 0 else "assistant_message",
+                "content_text": text,
+                "tool_name": None,
+                "tool_output_text": None,
+                "tool_call_id": None,
+                "thread_id": None,
+                "branch_kind": None,
+            }
+        )
+    store.index_object(
+        session_id=session_id,
+        generation_id=generation_id,
+        object_id=object_id,
+        desired_revision=1,
+        provider="codex",
+        machine_id="bench",
+        project="longhouse",
+        environment="local",
+        cwd=None,
+        git_repo=None,
+        opaque_source_id="codex/session.jsonl",
+        source_epoch=str(uuid4()),
+        records=records,
+    )
+    store.publish_generation(
+        session_id=session_id,
+        generation_id=generation_id,
+        owner_id=OWNER_ID,
+        desired_revision=1,
+        object_count=1,
+        object_set_hash=object_set_hash([object_id]),
+        event_count=len(records),
+        project="longhouse",
+        provider="codex",
+        environment="local",
+        cwd=None,
+        git_repo=None,
+        started_at=started.isoformat(),
+    )
+    episodes = []
+    for ordinal, vector in enumerate(vectors):
+        start = ordinal * 2
+        episode_text = " ".join(texts[start : start + 2])
+        episodes.append(
+            {
+                "episode_ordinal": ordinal,
+                "event_index_start": start,
+                "event_index_end": start + 1,
+                "start_order_time_us": started_us + start,
+                "content_hash": hashlib.sha256(episode_text.encode()).hexdigest(),
+                "embedding": base64.b64encode(vector.tobytes()).decode("ascii"),
+            }
+        )
+    store.write_episode_embeddings(
+        **_embedding_write_params(
+            {
+                "session_id": session_id,
+                "owner_id": OWNER_ID,
+                "generation_id": generation_id,
+                "revision": "1",
+                "model": ACTIVE_EMBEDDING_MODEL,
+                "dims": ACTIVE_EMBEDDING_DIMS,
+                "complete": True,
+                "desired_episode_ordinals": list(range(len(episodes))),
+                "reused_episodes": [],
+                "episodes": episodes,
+            }
+        )
+    )
+    return session_id
+
+
+async def build_corpus(
+    path: Path,
+    *,
+    queries: list[dict[str, str]],
+    episodes: int,
+    episodes_per_session: int,
+    embedder: _Embedder,
+    dense_signal: float,
+    seed: int,
+) -> dict[str, str]:
+    """Write the corpus and return query id -> planted gold session id."""
+
+    rng = random.Random(seed)
+    vector_rng = np.random.default_rng(seed)
+    query_words = sorted({term for query in queries for term in _terms(query["query"])})
+    filler_words = [f"w{index:04d}" for index in range(_FILLER_WORDS)]
+    vocabulary = query_words + filler_words
+    now = datetime.now(UTC)
+
+    def started_at() -> datetime:
+        return now - timedelta(days=rng.uniform(0, 60))
+
+    def filler_text() -> str:
+        return " ".join(rng.choices(vocabulary, k=40))
+
+    connection = open_search_database(path)
+    store = SearchStore(connection)
+    gold: dict[str, str] = {}
+    index = 0
+    for query in queries:
+        lanes = _PLANTED_LANES.get(query["category"])
+        if lanes is None:
+            continue
+        query_vector = await embedder.embed(query["query"])
+        vectors = [_random_unit(vector_rng)]
+        if "lexical" in lanes:
+            texts = [filler_text() for _ in range(episodes_per_session * 2)]
+            texts[0] = f"{query['query']} {texts[0]}"
+        else:
+            # A paraphrase plant must not be findable by its words.
+            texts = [" ".join(rng.choices(filler_words, k=40)) for _ in range(episodes_per_session * 2)]
+        if "dense" in lanes:
+            vectors = [_near(query_vector, signal=dense_signal, rng=vector_rng)]
+        vectors += [_random_unit(vector_rng) for _ in range(episodes_per_session - 1)]
+        gold[query["id"]] = _session(store, index=index, texts=texts, vectors=vectors, started=started_at())
+        index += 1
+
+    total_sessions = max(index, math.ceil(episodes / episodes_per_session))
+    report_every = max(1, total_sessions // 10)
+    while index < total_sessions:
+        texts = [filler_text() for _ in range(episodes_per_session * 2)]
+        vectors = [_random_unit(vector_rng) for _ in range(episodes_per_session)]
+        _session(store, index=index, texts=texts, vectors=vectors, started=started_at())
+        index += 1
+        if index % report_every == 0:
+            print(f"corpus {index}/{total_sessions} sessions", file=sys.stderr)
+    connection.close()
+    return gold
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+
+    def at(fraction: float) -> float:
+        return ordered[max(0, min(len(ordered) - 1, int(len(ordered) * fraction) - 1))]
+
+    return {
+        "count": len(ordered),
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(at(0.95), 3),
+        "p99_ms": round(at(0.99), 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+async def _recall_once(
+    client: CatalogClient,
+    embedder: _Embedder,
+    query: str,
+    *,
+    window_start_us: int,
+    limit: int,
+    context_turns: int,
+    store_id: str,
+) -> tuple[dict[str, float], list[str]]:
+    started = time.perf_counter_ns()
+    vector = await embedder.embed(query)
+    embedded = time.perf_counter_ns()
+    result = await client.call(
+        "search.recall.v2",
+        {
+            "owner_id": OWNER_ID,
+            "query": query,
+            "project": None,
+            "provider": None,
+            "window_start_us": window_start_us,
+            "include_test": False,
+            "include_automation": False,
+            "candidate_depth": min(200, limit * 5),
+            "limit": limit,
+            "context_turns": context_turns,
+            "discovery_timeout_ms": 4_000,
+            "dense": {
+                "model": ACTIVE_EMBEDDING_MODEL,
+                "dims": ACTIVE_EMBEDDING_DIMS,
+                "query_embedding": base64.b64encode(vector.astype(np.float32).tobytes()).decode("ascii"),
+                "limit": min(200, limit * 15),
+                "exclude_environments": ["test", "e2e", "automation"],
+                "since_iso": None,
+                "expected_store_id": store_id,
+                "expected_schema_generation": SCHEMA_GENERATION,
+            },
+        },
+    )
+    finished = time.perf_counter_ns()
+    timing = {
+        "embed_ms": (embedded - started) / 1_000_000,
+        "rpc_ms": (finished - embedded) / 1_000_000,
+        "end_to_end_ms": (finished - started) / 1_000_000,
+    }
+    timing.update({stage: value for stage, value in result["stage_timing"].items() if value is not None})
+    return timing, [str(match["session_id"]) for match in result["matches"]]
+
+
+async def _run_level(
+    client: CatalogClient,
+    embedder: _Embedder,
+    queries: list[dict[str, str]],
+    gold: dict[str, str],
+    *,
+    concurrency: int,
+    repeats: int,
+    ks: list[int],
+    window_start_us: int,
+    context_turns: int,
+    store_id: str,
+) -> dict[str, object]:
+    work: asyncio.Queue[dict[str, str]] = asyncio.Queue()
+    for _ in range(repeats):
+        for query in queries:
+            work.put_nowait(query)
+    samples: dict[str, list[float]] = {stage: [] for stage in _STAGES}
+    ranked: dict[str, list[str]] = {}
+    errors: list[str] = []
+
+    async def worker() -> None:
+        while True:
+            try:
+                query = work.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                timing, session_ids = await _recall_once(
+                    client,
+                    embedder,
+                    query["query"],
+                    window_start_us=window_start_us,
+                    limit=max(ks),
+                    context_turns=context_turns,
+                    store_id=store_id,
+                )
+            except Exception as exc:
+                errors.append(f"{query['id']}: {exc}")
+                continue
+            for stage, value in timing.items():
+                samples[stage].append(value)
+            ranked.setdefault(query["id"], session_ids)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    completed = len(samples["end_to_end_ms"])
+
+    categories: dict[str, dict[str, int]] = {}
+    recall = {f"recall@{k}": 0 for k in ks}
+    for query in queries:
+        gold_session = gold.get(query["id"])
+        if gold_session is None:
+            continue
+        bucket = categories.setdefault(query["category"], {"planted": 0, **{f"hits@{k}": 0 for k in ks}})
+        bucket["planted"] += 1
+        returned = ranked.get(query["id"], [])
+        for k in ks:
+            if gold_session in returned[:k]:
+                recall[f"recall@{k}"] += 1
+                bucket[f"hits@{k}"] += 1
+    return {
+        "concurrency": concurrency,
+        "completed": completed,
+        "errors": errors[:10],
+        "error_count": len(errors),
+        "throughput_rps": round(completed / elapsed, 2) if elapsed > 0 else None,
+        "stages": {stage: _percentiles(values) for stage, values in samples.items() if values},
+        "quality": {
+            **{name: round(hits / len(gold), 4) if gold else None for name, hits in recall.items()},
+            "planted": len(gold),
+            "by_category": categories,
+        },
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, object]:
+    queries = _load_queries()
+    embedder = _Embedder(args.model_dir)
+    corpus_dir = args.corpus_dir or Path(tempfile.mkdtemp(prefix="recall-load-"))
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"recall-load-{args.episodes}-{args.episodes_per_session}-{args.seed}-{args.dense_signal}-{embedder.mode}"
+    database_path = corpus_dir / f"{stem}.db"
+    gold_path = corpus_dir / f"{stem}.gold.json"
+    build_seconds = None
+    if not (database_path.exists() and gold_path.exists()):
+        for stale in corpus_dir.glob(f"{stem}.db*"):
+            stale.unlink()
+        build_started = time.perf_counter()
+        gold = await build_corpus(
+            database_path,
+            queries=queries,
+            episodes=args.episodes,
+            episodes_per_session=args.episodes_per_session,
+            embedder=embedder,
+            dense_signal=args.dense_signal,
+            seed=args.seed,
+        )
+        build_seconds = round(time.perf_counter() - build_started, 2)
+        gold_path.write_text(json.dumps(gold, sort_keys=True), encoding="utf-8")
+    gold = json.loads(gold_path.read_text(encoding="utf-8"))
+
+    socket_parent = Path(tempfile.mkdtemp(prefix="lhs-", dir="/tmp"))
+    socket_path = socket_parent / "s"
+    daemon = SearchDaemon(database_path=database_path, socket_path=socket_path)
+    load_started = time.perf_counter()
+    await daemon.start()
+    load_seconds = round(time.perf_counter() - load_started, 2)
+    client = CatalogClient(socket_path, default_timeout_seconds=args.timeout_seconds)
+    window_start_us = int((datetime.now(UTC) - timedelta(days=args.since_days)).timestamp() * 1_000_000)
+    levels = []
+    try:
+        store_id = str((await client.call("search.ping.v2"))["store_id"])
+        for query in queries[: args.warmup]:
+            await _recall_once(
+                client,
+                embedder,
+                query["query"],
+                window_start_us=window_start_us,
+                limit=max(args.k),
+                context_turns=args.context_turns,
+                store_id=store_id,
+            )
+        for concurrency in args.concurrency:
+            levels.append(
+                await _run_level(
+                    client,
+                    embedder,
+                    queries,
+                    gold,
+                    concurrency=concurrency,
+                    repeats=args.repeats,
+                    ks=args.k,
+                    window_start_us=window_start_us,
+                    context_turns=args.context_turns,
+                    store_id=store_id,
+                )
+            )
+    finally:
+        await client.close()
+        await daemon.close()
+        socket_parent.rmdir()
+        if args.corpus_dir is None:
+            for path in corpus_dir.iterdir():
+                path.unlink()
+            corpus_dir.rmdir()
+    return {
+        "corpus": {
+            "episodes": max(args.episodes, len(gold) * args.episodes_per_session),
+            "episodes_per_session": args.episodes_per_session,
+            "dense_signal": args.dense_signal,
+            "build_seconds": build_seconds,
+            "daemon_load_seconds": load_seconds,
+            "embedding_mode": embedder.mode,
+        },
+        "queries": len(queries),
+        "repeats": args.repeats,
+        "context_turns": args.context_turns,
+        "levels": levels,
+    }
+
+
+def _int_list(value: str) -> list[int]:
+    try:
+        items = [int(item) for item in value.split(",") if item.strip()]
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError("expected comma-separated integers") from exc
+    if not items or any(item < 1 for item in items):
+        raise argparse.ArgumentTypeError("values must be positive")
+    return items
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--episodes", type=int, default=10_000, help="corpus size in embedded episodes (e.g. 10000, 100000, 1000000)")
+    parser.add_argument("--episodes-per-session", type=int, default=4)
+    parser.add_argument("--concurrency", type=_int_list, default=[1, 8], help="comma-separated concurrency levels")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=10)
+    parser.add_argument("--k", type=_int_list, default=[1, 5, 10], help="comma-separated recall@k cutoffs, at most 25")
+    parser.add_argument("--context-turns", type=int, default=2)
+    parser.add_argument("--since-days", type=int, default=90)
+    parser.add_argument("--dense-signal", type=float, default=0.5, help="cosine between a planted dense episode and its query")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--timeout-seconds", type=float, default=5.0)
+    parser.add_argument("--model-dir", type=Path, default=None)
+    parser.add_argument("--corpus-dir", type=Path, default=None, help="reuse corpora across runs instead of a temporary build")
+    parser.add_argument("--max-end-to-end-p95-ms", type=float, default=None)
+    parser.add_argument("--min-recall-at-5", type=float, default=None)
+    args = parser.parse_args()
+    if args.episodes < 1 or args.episodes_per_session < 1 or args.repeats < 1 or args.warmup < 0:
+        raise SystemExit("episodes, episodes-per-session and repeats must be positive and warmup non-negative")
+    if max(args.k) > 25 or not 0 <= args.context_turns <= 10 or not 0 < args.dense_signal <= 1:
+        raise SystemExit("k must be at most 25, context-turns 0-10 and dense-signal in (0, 1]")
+
+    result = asyncio.run(run(args))
+    failures = []
+    for level in result["levels"]:
+        if level["error_count"]:
+            failures.append(f"concurrency {level['concurrency']}: {level['error_count']} errors")
+        p95 = level["stages"].get("end_to_end_ms", {}).get("p95_ms")
+        if args.max_end_to_end_p95_ms is not None and (p95 is None or p95 > args.max_end_to_end_p95_ms):
+            failures.append(f"concurrency {level['concurrency']}: end-to-end p95 {p95}ms")
+        recall_at_5 = level["quality"].get("recall@5")
+        if args.min_recall_at_5 is not None and (recall_at_5 is None or recall_at_5 < args.min_recall_at_5):
+            failures.append(f"concurrency {level['concurrency']}: recall@5 {recall_at_5}")
+    result["gate_failures"] = failures
+    result["passed"] = not failures
+    print(json.dumps(result, indent=2, sort_keys=True))
+    return 0 if result["passed"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Measure recall query-embedding latency for first-seen versus repeated queries.
+
+Drives `zerg.services.local_embedder.embed_query` exactly as `/recall` does.
+With `--model-dir` it loads the pinned ONNX artifact and applies the
+repeated-query p50 gate. Without it a stub encoder sleeps `--stub-forward-ms`
+per call; that mode only reports numbers, because a stub cannot prove anything
+about the real forward pass the cache is meant to skip.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "server"))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("TESTING", "1")
+
+import numpy as np  # noqa: E402
+
+from zerg.embedding_space import EMBEDDING_OUTPUT_NAME  # noqa: E402
+from zerg.services import local_embedder  # noqa: E402
+
+QUERIES_PATH = ROOT / "eval" / "recall" / "queries.jsonl"
+
+
+class _StubSession:
+    """Stands in for the ONNX session; the tokenizer and normalization are real code."""
+
+    def __init__(self, *, dims: int, forward_ms: float) -> None:
+        self._dims = dims
+        self._forward_seconds = forward_ms / 1000
+
+    def get_outputs(self):
+        return [type("Output", (), {"name": EMBEDDING_OUTPUT_NAME})()]
+
+    def run(self, _outputs, feed):
+        time.sleep(self._forward_seconds)
+        return [np.ones((feed["input_ids"].shape[0], self._dims), dtype="float32")]
+
+
+class _StubTokenizer:
+    def encode_batch(self, texts):
+        return [type("Encoding", (), {"ids": [1], "attention_mask": [1]})() for _ in texts]
+
+
+class _StubLocalEmbedder(local_embedder.LocalEmbedder):
+    def __init__(self, model_dir, *, dims: int, forward_ms: float) -> None:
+        super().__init__(model_dir, dims=dims)
+        self._stub_session = _StubSession(dims=dims, forward_ms=forward_ms)
+
+    def load(self) -> None:
+        self._session = self._stub_session
+        self._tokenizer = _StubTokenizer()
+        self._embedding_output = 0
+
+
+def _load_queries(limit: int) -> list[str]:
+    queries: list[str] = []
+    for line in QUERIES_PATH.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("//"):
+            continue
+        row = json.loads(line)
+        if isinstance(row.get("query"), str):
+            queries.append(row["query"])
+    if not queries:
+        raise SystemExit(f"no queries in {QUERIES_PATH}")
+    return queries[:limit]
+
+
+def _summary(samples_ms: list[float]) -> dict[str, float]:
+    ordered = sorted(samples_ms)
+    p95_index = max(0, min(len(ordered) - 1, int(len(ordered) * 0.95) - 1))
+    return {
+        "count": len(ordered),
+        "p50_ms": round(statistics.median(ordered), 4),
+        "p95_ms": round(ordered[p95_index], 4),
+        "max_ms": round(ordered[-1], 4),
+    }
+
+
+async def run(queries: list[str], *, repeats: int) -> dict[str, object]:
+    cold: list[float] = []
+    warm: list[float] = []
+    for query in queries:
+        started = time.perf_counter_ns()
+        await local_embedder.embed_query(query)
+        cold.append((time.perf_counter_ns() - started) / 1_000_000)
+    for _ in range(repeats):
+        for query in queries:
+            started = time.perf_counter_ns()
+            await local_embedder.embed_query(query)
+            warm.append((time.perf_counter_ns() - started) / 1_000_000)
+    stats = local_embedder.get_query_embedding_cache().stats()
+    return {
+        "first_seen": _summary(cold),
+        "repeated": _summary(warm),
+        "cache": {
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "hit_rate": round(stats.hit_rate, 4),
+            "entries": stats.entries,
+            "max_entries": stats.max_entries,
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model-dir", type=Path, default=None)
+    parser.add_argument("--stub-forward-ms", type=float, default=21.4)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--max-repeated-p50-ms", type=float, default=1.0)
+    args = parser.parse_args()
+    if args.queries < 1 or args.repeats < 1:
+        raise SystemExit("queries and repeats must be positive")
+
+    from zerg.models_config import get_embedding_space_config
+
+    config = get_embedding_space_config()
+    if args.model_dir is not None:
+        local_embedder.initialize_local_embedder(config, args.model_dir)
+        mode = "onnx"
+    else:
+        forward_ms = args.stub_forward_ms
+
+        def stub_embedder(model_dir, *, dims):
+            return _StubLocalEmbedder(model_dir, dims=dims, forward_ms=forward_ms)
+
+        # Same initialization path as production, so the cache is bound to the
+        # real embedding space id; only the model class is substituted.
+        local_embedder.LocalEmbedder = stub_embedder
+        local_embedder.initialize_local_embedder(config, "stub")
+        mode = "stub"
+
+    result = asyncio.run(run(_load_queries(args.queries), repeats=args.repeats))
+    result["mode"] = mode
+    if mode == "stub":
+        print(json.dumps(result, indent=2, sort_keys=True))
+        return 0
+    result["gate_max_repeated_p50_ms"] = args.max_repeated_p50_ms
+    result["passed"] = result["repeated"]["p50_ms"] <= args.max_repeated_p50_ms
+    print(json.dumps(result, indent=2, sort_keys=True))
+    return 0 if result["passed"] else 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
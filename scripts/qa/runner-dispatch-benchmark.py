@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""Measure runner job dispatch throughput as a runner advertises more slots.
+
+Drives `RunnerJobDispatcher.dispatch_job` the way agent tools do: each caller
+runs on its own thread and event loop, while a stand-in runner websocket on a
+separate loop answers every `exec_request` with an `exec_done` after a fixed
+job duration. Callers belong to a handful of runs so the fair queue is
+exercised. Reports jobs/sec, dispatch latency (request to `exec_request`
+sent, including slot queueing) and end-to-end latency per slot count, plus
+the throughput ratio of each count against the first.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "server"))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("TESTING", "1")
+
+from zerg.services import runner_job_dispatcher  # noqa: E402
+from zerg.utils.time import utc_now_naive  # noqa: E402
+
+OWNER_ID = 1
+RUNNER_ID = 7
+
+
+def _summary(values_ms: list[float]) -> dict[str, float]:
+    ordered = sorted(values_ms)
+    if not ordered:
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    return {
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+class _StandInRunner:
+    """Connection manager whose runner executes each job for `job_seconds`."""
+
+    def __init__(self, dispatcher: runner_job_dispatcher.RunnerJobDispatcher, loop: asyncio.AbstractEventLoop, job_seconds: float):
+        self.dispatcher = dispatcher
+        self.loop = loop
+        self.job_seconds = job_seconds
+        self.sent_at: dict[str, float] = {}
+
+    def is_online(self, owner_id: int, runner_id: int) -> bool:
+        return True
+
+    async def send_to_runner(self, *, owner_id: int, runner_id: int, message: dict) -> bool:
+        self.sent_at[message["job_id"]] = time.perf_counter()
+        self.loop.call_soon_threadsafe(self.loop.call_later, self.job_seconds, self._exec_done, runner_id, message["job_id"])
+        return True
+
+    def _exec_done(self, runner_id: int, job_id: str) -> None:
+        result = {"ok": True, "data": {"job_id": job_id, "exit_code": 0, "stdout": "", "stderr": "", "duration_ms": 0}}
+        self.dispatcher.complete_job(job_id, result, runner_id=runner_id)
+
+
+def _install_fakes(runner: _StandInRunner) -> None:
+    counter = iter(range(1, 10**9))
+    crud = runner_job_dispatcher.runner_crud
+    runner_job_dispatcher.get_runner_connection_manager = lambda: runner
+    crud.create_runner_job = lambda **kwargs: SimpleNamespace(id=f"job-{next(counter)}")
+    crud.update_job_started = lambda *args, **kwargs: None
+    crud.update_job_timeout = lambda *args, **kwargs: None
+    crud.update_job_error = lambda *args, **kwargs: None
+    crud.get_job = lambda _db, job_id: SimpleNamespace(
+        id=job_id, status="running", started_at=utc_now_naive(), created_at=None, timeout_secs=600
+    )
+
+
+def _run_slots(*, slots: int, callers: int, runs: int, jobs: int, job_ms: float) -> dict:
+    dispatcher = runner_job_dispatcher.RunnerJobDispatcher()
+    runner_loop = asyncio.new_event_loop()
+    runner_thread = threading.Thread(target=runner_loop.run_forever, daemon=True)
+    runner_thread.start()
+    runner = _StandInRunner(dispatcher, runner_loop, job_ms / 1000.0)
+    _install_fakes(runner)
+    dispatcher.set_runner_slots(RUNNER_ID, slots)
+
+    dispatch_ms: list[float] = []
+    total_ms: list[float] = []
+    failures = 0
+    lock = threading.Lock()
+
+    def _caller(index: int) -> None:
+        nonlocal failures
+        for job in range(index, jobs, callers):
+            started = time.perf_counter()
+            result = asyncio.run(dispatcher.dispatch_job(None, OWNER_ID, RUNNER_ID, "true", timeout_secs=600, run_id=f"run-{job % runs}"))
+            finished = time.perf_counter()
+            with lock:
+                if not result.get("ok"):
+                    failures += 1
+                    continue
+                dispatch_ms.append((runner.sent_at.pop(result["data"]["job_id"]) - started) * 1000.0)
+                total_ms.append((finished - started) * 1000.0)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=callers) as pool:
+        list(pool.map(_caller, range(callers)))
+    elapsed = time.perf_counter() - started
+
+    runner_loop.call_soon_threadsafe(runner_loop.stop)
+    runner_thread.join()
+    runner_loop.close()
+    return {
+        "slots": slots,
+        "jobs": len(total_ms),
+        "failures": failures,
+        "elapsed_s": round(elapsed, 3),
+        "jobs_per_sec": round(len(total_ms) / elapsed, 2),
+        "dispatch": _summary(dispatch_ms),
+        "end_to_end": _summary(total_ms),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--slots", default="1,8", help="Comma-separated runner slot counts; the first is the baseline")
+    parser.add_argument("--callers", type=int, default=16, help="Concurrent dispatching threads")
+    parser.add_argument("--runs", type=int, default=4, help="Distinct runs the callers dispatch for")
+    parser.add_argument("--jobs", type=int, default=160)
+    parser.add_argument("--job-ms", type=float, default=50.0, help="How long the stand-in runner takes per job")
+    parser.add_argument("--min-scaling", type=float, default=None, help="Required throughput ratio of the last slot count over the first")
+    args = parser.parse_args()
+
+    slot_counts = [int(value) for value in args.slots.split(",") if value.strip()]
+    results = [_run_slots(slots=slots, callers=args.callers, runs=args.runs, jobs=args.jobs, job_ms=args.job_ms) for slots in slot_counts]
+    baseline = results[0]["jobs_per_sec"] or 1.0
+    for entry in results:
+        entry["throughput_ratio"] = round(entry["jobs_per_sec"] / baseline, 2)
+    result = {"callers": args.callers, "runs": args.runs, "job_ms": args.job_ms, "results": results}
+    print(json.dumps(result, indent=2, sort_keys=True))
+    if any(entry["failures"] for entry in results):
+        return 1
+    if args.min_scaling is not None and results[-1]["throughput_ratio"] < args.min_scaling:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""Measure read throughput of `longhouse serve --demo` as HTTP workers are added.
+
+Starts a demo Runtime Host once per worker count in one throwaway HOME (the
+demo catalog is built on the first run and reused), then drives the timeline
+list and session workspace endpoints with a fixed number of concurrent
+clients for a fixed duration. `--workers 1` is the classic single process;
+larger counts run N HTTP workers in front of one control process. Reports
+requests/sec and p50/p95/max latency per endpoint and worker count, plus the
+throughput ratio of each count against the first.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import signal
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[2]
+SERVER = ROOT / "server"
+
+
+def _summary(values_ms: list[float]) -> dict[str, float]:
+    ordered = sorted(values_ms)
+    if not ordered:
+        return {"p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+    return {
+        "p50_ms": round(statistics.median(ordered), 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+def _start_server(*, home: Path, port: int, workers: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "HOME": str(home),
+        "LLM_DISABLED": "1",
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(SERVER), os.environ.get("PYTHONPATH")])),
+    }
+    env.pop("DATABASE_URL", None)
+    env.pop("TESTING", None)
+    log = (home / f"serve-{workers}.log").open("wb")
+    return subprocess.Popen(
+        [sys.executable, "-m", "zerg.cli.main", "serve", "--demo", "--port", str(port), "--workers", str(workers)],
+        cwd=str(home),
+        env=env,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+        start_new_session=True,
+    )
+
+
+def _stop_server(process: subprocess.Popen) -> None:
+    if process.poll() is None:
+        os.killpg(process.pid, signal.SIGTERM)
+        try:
+            process.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            os.killpg(process.pid, signal.SIGKILL)
+            process.wait()
+
+
+def _wait_ready(base_url: str, process: subprocess.Popen, *, timeout_seconds: float) -> None:
+    deadline = time.monotonic() + timeout_seconds
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"server exited with code {process.returncode} before it was ready")
+        try:
+            if httpx.get(f"{base_url}/api/timeline/sessions?limit=1", timeout=2.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.5)
+    raise SystemExit(f"server was not ready within {timeout_seconds:.0f}s")
+
+
+async def _drive(base_url: str, *, concurrency: int, duration_seconds: float, seed: int) -> dict[str, object]:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30.0) as client:
+        listing = (await client.get("/api/timeline/sessions", params={"limit": 50})).json()
+        session_ids = [row["head"]["id"] for row in listing["sessions"]]
+        if not session_ids:
+            raise SystemExit("demo catalog has no sessions")
+        targets = {
+            "timeline": lambda rng: ("/api/timeline/sessions", {"limit": 20}),
+            "workspace": lambda rng: (f"/api/timeline/sessions/{rng.choice(session_ids)}/workspace", None),
+        }
+        latencies: dict[str, list[float]] = {name: [] for name in targets}
+        errors: dict[str, int] = {name: 0 for name in targets}
+        stop_at = time.perf_counter() + duration_seconds
+
+        async def client_loop(index: int) -> None:
+            rng = random.Random(seed + index)
+            names = list(targets)
+            turn = index
+            while time.perf_counter() < stop_at:
+                name = names[turn % len(names)]
+                turn += 1
+                path, params = targets[name](rng)
+                started = time.perf_counter_ns()
+                try:
+                    response = await client.get(path, params=params)
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    latencies[name].append((time.perf_counter_ns() - started) / 1_000_000)
+                else:
+                    errors[name] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(client_loop(index) for index in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    endpoints = {
+        name: {"requests": len(values), "errors": errors[name], "requests_per_sec": round(len(values) / elapsed, 1), **_summary(values)}
+        for name, values in latencies.items()
+    }
+    total = sum(len(values) for values in latencies.values())
+    return {"requests_per_sec": round(total / elapsed, 1), "errors": sum(errors.values()), "endpoints": endpoints}
+
+
+def run(*, worker_counts: list[int], concurrency: int, duration_seconds: float, port: int, warmup_seconds: float) -> dict[str, object]:
+    runs: dict[str, dict[str, object]] = {}
+    with tempfile.TemporaryDirectory(prefix="lhbench-") as directory:
+        home = Path(directory)
+        for workers in worker_counts:
+            process = _start_server(home=home, port=port, workers=workers)
+            base_url = f"http://127.0.0.1:{port}"
+            try:
+                _wait_ready(base_url, process, timeout_seconds=600)
+                # Warm every worker's storage lanes and caches before measuring.
+                asyncio.run(_drive(base_url, concurrency=concurrency, duration_seconds=warmup_seconds, seed=0))
+                runs[str(workers)] = asyncio.run(_drive(base_url, concurrency=concurrency, duration_seconds=duration_seconds, seed=1))
+            finally:
+                _stop_server(process)
+    baseline = runs[str(worker_counts[0])]["requests_per_sec"] or 0
+    for workers in worker_counts:
+        measured = runs[str(workers)]
+        measured["scaling"] = round(measured["requests_per_sec"] / baseline, 2) if baseline else None
+    return {
+        "cpu_count": os.cpu_count(),
+        "concurrency": concurrency,
+        "duration_seconds": duration_seconds,
+        "workers": runs,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", default="1,4", help="Comma-separated worker counts; the first is the baseline")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--warmup", type=float, default=3.0)
+    parser.add_argument("--port", type=int, default=18480)
+    parser.add_argument("--min-scaling", type=float, default=None, help="Required throughput ratio of the last worker count over the first")
+    args = parser.parse_args()
+    worker_counts = [int(item) for item in args.workers.split(",") if item.strip()]
+    if not worker_counts or any(count < 1 for count in worker_counts) or args.concurrency < 1 or args.duration <= 0:
+        raise SystemExit("workers, concurrency and duration must be positive")
+
+    result = run(
+        worker_counts=worker_counts,
+        concurrency=args.concurrency,
+        duration_seconds=args.duration,
+        port=args.port,
+        warmup_seconds=args.warmup,
+    )
+    if args.min_scaling is None:
+        print(json.dumps(result, indent=2, sort_keys=True))
+        return 0
+    scaling = result["workers"][str(worker_counts[-1])]["scaling"] or 0
+    result["gate_min_scaling"] = args.min_scaling
+    result["passed"] = scaling >= args.min_scaling
+    print(json.dumps(result, indent=2, sort_keys=True))
+    return 0 if result["passed"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
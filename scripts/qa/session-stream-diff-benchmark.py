@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""Measure session stream change detection cost and bytes per tick.
+
+Projects `--sessions` real timeline cards from a throwaway catalog, then
+replays `--ticks` wakes in which `--changed` sessions get new activity. For
+each wake it times, per connected client, what the streams do to decide what
+to send:
+
+- timeline stream: the previous JSON signature (dump every card, drop the
+  catalog watermark, encode) against the structural digest, plus encoding
+  the upserts for the cards that actually changed;
+- machine stream: for the sessions a wake touched, the previous double
+  projection plus JSON signature against one projection plus per-field
+  digests, and the bytes of full `session_delta` events against
+  `session_patch` events.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+from uuid import UUID
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "server"))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("TESTING", "1")
+
+from sqlalchemy import insert  # noqa: E402
+
+from zerg.catalogd.models import StorageSession  # noqa: E402
+from zerg.catalogd.schema import initialize_catalog_schema  # noqa: E402
+from zerg.catalogd.store import CatalogStore  # noqa: E402
+from zerg.database import make_live_engine  # noqa: E402
+from zerg.services import live_catalog_timeline  # noqa: E402
+from zerg.services.live_catalog_timeline import project_catalog_timeline_snapshot  # noqa: E402
+from zerg.services.live_catalog_timeline import project_machine_session_delta  # noqa: E402
+from zerg.services.projection_digest import changed_fields  # noqa: E402
+from zerg.services.projection_digest import field_digests  # noqa: E402
+
+OWNER_ID = 1
+_MACHINE_VOLATILE = frozenset({"commit_seq", "fanout_kind", "server_fanout_at_ms"})
+
+
+def _summary(values_ms: list[float]) -> dict[str, float]:
+    ordered = sorted(values_ms)
+    return {"p50_ms": round(statistics.median(ordered), 3), "max_ms": round(ordered[-1], 3)}
+
+
+def _json_card_signature(card) -> str:
+    """The signature the timeline stream computed before structural digests."""
+
+    payload = card.model_dump(mode="json")
+    for key in ("head", "detail", "root"):
+        projection = payload.get(key)
+        if not isinstance(projection, dict):
+            continue
+        projection.pop("runtime_version", None)
+        state = projection.get("session_state")
+        if isinstance(state, dict):
+            state.pop("commit_seq", None)
+    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+
+
+def _json_delta_signature(payload: dict) -> str:
+    rendered = {key: value for key, value in payload.items() if key not in _MACHINE_VOLATILE}
+    return json.dumps(rendered, sort_keys=True, separators=(",", ":"))
+
+
+def _cards(sessions: int):
+    now = datetime.now(UTC).replace(tzinfo=None)
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_live_engine(f"sqlite:///{Path(tmp) / 'catalog.db'}")
+        initialize_catalog_schema(engine)
+        rows = []
+        for index in range(sessions):
+            activity = now - timedelta(minutes=index)
+            rows.append(
+                {
+                    "session_id": str(UUID(int=index + 1)),
+                    "tenant_id": "bench",
+                    "owner_id": str(OWNER_ID),
+                    "provider": ("codex", "claude", "opencode")[index % 3],
+                    "environment": "production",
+                    "machine_id": "bench-host",
+                    "project": f"project-{index % 7}",
+                    "cwd": f"/workspace/project-{index % 7}",
+                    "started_at": activity - timedelta(minutes=30),
+                    "last_activity_at": activity,
+                    "user_messages": 3 + index % 5,
+                    "assistant_messages": 7 + index % 11,
+                    "tool_calls": index % 13,
+                    "summary_title": f"Benchmark session {index}",
+                    "first_user_message_preview": "Refactor the stream diff path and measure it",
+                    "last_visible_text_preview": "Done: streams now skip unchanged cards.",
+                    "transcript_revision": 1,
+                    "raw_state": "durable",
+                    "render_state": "ready",
+                    "commit_seq": 1,
+                    "created_at": activity,
+                    "updated_at": activity,
+                }
+            )
+        with engine.begin() as connection:
+            connection.execute(insert(StorageSession), rows)
+        store = CatalogStore(engine)
+        cards = []
+        cursor = None
+        while True:
+            # Canonical head reads are bounded at 200 sessions per page.
+            snapshot = store.list_session_timeline(
+                project=None,
+                provider=None,
+                environment=None,
+                include_test=False,
+                hide_autonomous=True,
+                include_automation=False,
+                device_id=None,
+                days_back=14,
+                limit=200,
+                offset=0,
+                owner_id=OWNER_ID,
+                include_state_heads=True,
+                cursor=cursor,
+            )
+            cards.extend(project_catalog_timeline_snapshot(snapshot).sessions)
+            cursor = snapshot["next_cursor"]
+            if cursor is None:
+                break
+        engine.dispose()
+    return cards
+
+
+def _tick(cards, *, tick: int, changed: int):
+    """Return the next wake's cards and the ids of the sessions that changed.
+
+    Every card's catalog watermark advances, as it does on any commit; only
+    `changed` sessions get new activity.
+    """
+
+    stride = max(1, len(cards) // max(1, changed))
+    moved = []
+    woken = set()
+    for index, card in enumerate(cards):
+        head = card.head
+        update = {"runtime_version": (head.runtime_version or 0) + 1}
+        if changed and index % stride == tick % stride:
+            update["last_activity_at"] = head.last_activity_at + timedelta(seconds=1)
+            update["display_phase"] = "Thinking" if head.display_phase != "Thinking" else "Idle"
+            woken.add(head.id)
+        head = head.model_copy(update=update)
+        moved.append(card.model_copy(update={"head": head, "detail": head, "root": head}))
+    return moved, woken
+
+
+def _timeline_client(previous_json, previous_digest, cards):
+    started = time.perf_counter()
+    current = {card.thread_id: _json_card_signature(card) for card in cards}
+    legacy_bytes = sum(len(card.model_dump_json()) for card in cards if previous_json.get(card.thread_id) != current[card.thread_id])
+    legacy_ms = (time.perf_counter() - started) * 1000.0
+
+    started = time.perf_counter()
+    digests = {card.thread_id: live_catalog_timeline._timeline_card_signature(card) for card in cards}
+    digest_bytes = sum(len(card.model_dump_json()) for card in cards if previous_digest.get(card.thread_id) != digests[card.thread_id])
+    digest_ms = (time.perf_counter() - started) * 1000.0
+    return current, digests, legacy_ms, digest_ms, legacy_bytes, digest_bytes
+
+
+def _machine_client(previous_json, previous_fields, cards, fanout):
+    started = time.perf_counter()
+    legacy_bytes = 0
+    for card in cards:
+        delta = project_machine_session_delta(card.head, commit_seq=card.head.runtime_version, canonical=True)
+        signature = _json_delta_signature(delta)
+        if previous_json.get(card.head.id) == signature:
+            continue
+        previous_json[card.head.id] = signature
+        event = project_machine_session_delta(card.head, commit_seq=card.head.runtime_version, fanout=fanout, canonical=True)
+        legacy_bytes += len(json.dumps(event, sort_keys=True, separators=(",", ":")))
+    legacy_ms = (time.perf_counter() - started) * 1000.0
+
+    started = time.perf_counter()
+    patch_bytes = 0
+    for card in cards:
+        delta = project_machine_session_delta(card.head, commit_seq=card.head.runtime_version, fanout=fanout, canonical=True)
+        digests = field_digests(delta, exclude=_MACHINE_VOLATILE)
+        prior = previous_fields.get(card.head.id)
+        changed = changed_fields(prior, digests)
+        if not changed:
+            continue
+        previous_fields[card.head.id] = digests
+        if prior is None:
+            patch_bytes += len(json.dumps(delta, sort_keys=True, separators=(",", ":")))
+            continue
+        patch = {key: delta[key] for key in ("session_id", "source", *_MACHINE_VOLATILE) if key in delta}
+        patch.update({key: delta.get(key) for key in changed})
+        patch_bytes += len(json.dumps(patch, sort_keys=True, separators=(",", ":")))
+    patch_ms = (time.perf_counter() - started) * 1000.0
+    return legacy_ms, patch_ms, legacy_bytes, patch_bytes
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--changed", type=int, default=5, help="Sessions with new activity per wake")
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument("--min-cpu-ratio", type=float, default=None, help="Fail if legacy/digest timeline CPU ratio is below this")
+    args = parser.parse_args()
+
+    cards = _cards(args.sessions)
+    fanout = {"kind": "commit", "server_fanout_at_ms": 0}
+
+    timeline_legacy_ms: list[float] = []
+    timeline_digest_ms: list[float] = []
+    machine_legacy_ms: list[float] = []
+    machine_patch_ms: list[float] = []
+    timeline_bytes = [0, 0]
+    machine_bytes = [0, 0]
+    previous_json, previous_digest, _legacy_ms, _digest_ms, _legacy_bytes, _digest_bytes = _timeline_client({}, {}, cards)
+    machine_json: dict[str, str] = {}
+    machine_fields: dict[str, dict[str, int]] = {}
+    _machine_client(machine_json, machine_fields, cards, fanout)
+    for tick in range(args.ticks):
+        cards, woken = _tick(cards, tick=tick, changed=args.changed)
+        previous_json, previous_digest, legacy_ms, digest_ms, legacy_bytes, digest_bytes = _timeline_client(
+            previous_json, previous_digest, cards
+        )
+        timeline_legacy_ms.append(legacy_ms)
+        timeline_digest_ms.append(digest_ms)
+        timeline_bytes[0] += legacy_bytes
+        timeline_bytes[1] += digest_bytes
+        # The machine stream re-reads only the sessions a commit woke.
+        woken_cards = [card for card in cards if card.head.id in woken]
+        legacy_ms, patch_ms, legacy_bytes, patch_bytes = _machine_client(machine_json, machine_fields, woken_cards, fanout)
+        machine_legacy_ms.append(legacy_ms)
+        machine_patch_ms.append(patch_ms)
+        machine_bytes[0] += legacy_bytes
+        machine_bytes[1] += patch_bytes
+
+    timeline_ratio = statistics.median(timeline_legacy_ms) / (statistics.median(timeline_digest_ms) or 1.0)
+    result = {
+        "sessions": args.sessions,
+        "changed_per_tick": args.changed,
+        "ticks": args.ticks,
+        "timeline": {
+            "json_signature": _summary(timeline_legacy_ms),
+            "structural_digest": _summary(timeline_digest_ms),
+            "cpu_ratio": round(timeline_ratio, 2),
+            "bytes_per_tick": {"json_signature": timeline_bytes[0] // args.ticks, "structural_digest": timeline_bytes[1] // args.ticks},
+        },
+        "machine": {
+            "json_signature": _summary(machine_legacy_ms),
+            "field_digests": _summary(machine_patch_ms),
+            "bytes_per_tick": {"session_delta": machine_bytes[0] // args.ticks, "session_patch": machine_bytes[1] // args.ticks},
+        },
+    }
+    print(json.dumps(result, indent=2, sort_keys=True))
+    if args.min_cpu_ratio is not None and timeline_ratio < args.min_cpu_ratio:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
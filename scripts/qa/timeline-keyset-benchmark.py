@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""Measure timeline page latency by depth for offset vs keyset cursors.
+
+Seeds a throwaway catalog with one owner holding `--sessions` durable
+storage sessions spread across the default recency window (plus a handful of
+unread Console results, and a live-store row for every `--live-every`th
+session as managed launches have), then reads pages through
+`CatalogStore.list_session_timeline` exactly as catalogd serves
+`session.timeline.list.v2`. Offset pages are read at each requested depth;
+keyset pages walk the cursor chain and are timed when they reach the same
+depths. Reports p50/max latency per depth and the SQLite plan of the keyset
+arm query so the index range scans are visible.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC
+from datetime import datetime
+from datetime import timedelta
+from pathlib import Path
+from uuid import UUID
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "server"))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("TESTING", "1")
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from zerg.catalogd.models import StorageSession  # noqa: E402
+from zerg.catalogd.schema import initialize_catalog_schema  # noqa: E402
+from zerg.catalogd.store import CatalogStore  # noqa: E402
+from zerg.database import make_live_engine  # noqa: E402
+from zerg.models.live_store import LiveSession  # noqa: E402
+
+OWNER_ID = 1
+
+
+def _summary(values_ms: list[float]) -> dict[str, float]:
+    ordered = sorted(values_ms)
+    return {"p50_ms": round(statistics.median(ordered), 3), "max_ms": round(ordered[-1], 3)}
+
+
+def _seed(engine, *, sessions: int, unread: int, live_every: int, days: int) -> None:
+    now = datetime.now(UTC).replace(tzinfo=None)
+    step = timedelta(days=days) / sessions
+    rows = []
+    live_rows = []
+    with engine.begin() as connection:
+        for index in range(sessions):
+            activity = now - step * index
+            if live_every and index % live_every == 0:
+                live_rows.append(
+                    {
+                        "session_id": str(UUID(int=index + 1)),
+                        "owner_id": str(OWNER_ID),
+                        "provider": "codex",
+                        "last_seen_at": activity,
+                        "updated_at": activity,
+                    }
+                )
+            rows.append(
+                {
+                    "session_id": str(UUID(int=index + 1)),
+                    "tenant_id": "bench",
+                    "owner_id": str(OWNER_ID),
+                    "provider": "codex",
+                    "environment": "production",
+                    "machine_id": "bench-host",
+                    "project": f"project-{index % 7}",
+                    "started_at": activity,
+                    "last_activity_at": activity,
+                    "user_messages": 1,
+                    "transcript_revision": 1,
+                    "raw_state": "durable",
+                    "render_state": "ready",
+                    "last_console_result_at": activity if index % max(1, sessions // max(1, unread)) == 0 and unread else None,
+                    "commit_seq": 1,
+                    "created_at": activity,
+                    "updated_at": activity,
+                }
+            )
+            if len(rows) == 5_000:
+                connection.execute(insert(StorageSession), rows)
+                rows.clear()
+            if len(live_rows) == 5_000:
+                connection.execute(insert(LiveSession), live_rows)
+                live_rows.clear()
+        if rows:
+            connection.execute(insert(StorageSession), rows)
+        if live_rows:
+            connection.execute(insert(LiveSession), live_rows)
+        connection.exec_driver_sql("ANALYZE")
+
+
+def _page(store: CatalogStore, *, limit: int, offset: int = 0, cursor: dict | None = None) -> dict:
+    return store.list_session_timeline(
+        project=None,
+        provider=None,
+        environment=None,
+        include_test=False,
+        hide_autonomous=True,
+        include_automation=False,
+        device_id=None,
+        days_back=14,
+        limit=limit,
+        offset=offset,
+        owner_id=OWNER_ID,
+        include_state_heads=True,
+        cursor=cursor,
+    )
+
+
+def _timed(fn) -> tuple[float, dict]:
+    started = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - started) * 1000.0, result
+
+
+def _keyset_plan(engine, store: CatalogStore, *, limit: int, cursor: dict) -> list[str]:
+    statements: list[str] = []
+
+    def _capture(conn, cursor_, statement, parameters, context, executemany):
+        if "UNION ALL" in statement and "order_at" in statement and not statements:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        _page(store, limit=limit, cursor=cursor)
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    statement, parameters = statements[0]
+    with engine.connect() as connection:
+        plan = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+    return [row[-1] for row in plan]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=200_000)
+    parser.add_argument("--unread", type=int, default=20, help="Sessions with an unacknowledged Console result")
+    parser.add_argument("--live-every", type=int, default=2, help="Give every Nth session a live-store owner row (0 for none)")
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--depths", default="0,1000,10000,100000", help="Comma-separated row depths to time")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-depth-ratio", type=float, default=None, help="Fail if deepest keyset p50 exceeds this multiple of depth 0")
+    args = parser.parse_args()
+
+    depths = sorted(int(value) for value in args.depths.split(",") if value.strip())
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = make_live_engine(f"sqlite:///{Path(tmp) / 'catalog.db'}")
+        initialize_catalog_schema(engine)
+        started = time.perf_counter()
+        _seed(engine, sessions=args.sessions, unread=args.unread, live_every=args.live_every, days=13)
+        seed_s = time.perf_counter() - started
+        store = CatalogStore(engine)
+
+        offset_ms: dict[int, list[float]] = {depth: [] for depth in depths}
+        keyset_ms: dict[int, list[float]] = {depth: [] for depth in depths}
+        cursors: dict[int, dict | None] = {}
+        total = None
+        for _ in range(args.repeat):
+            for depth in depths:
+                elapsed, _result = _timed(lambda depth=depth: _page(store, limit=args.limit, offset=depth))
+                offset_ms[depth].append(elapsed)
+            cursor = None
+            read = 0
+            for depth in depths:
+                while read < depth:
+                    _elapsed, result = _timed(lambda cursor=cursor: _page(store, limit=args.limit, cursor=cursor))
+                    cursor = result["next_cursor"]
+                    read += args.limit
+                cursors[depth] = cursor
+                elapsed, result = _timed(lambda cursor=cursor: _page(store, limit=args.limit, cursor=cursor))
+                keyset_ms[depth].append(elapsed)
+                if depth == 0:
+                    total = result["total"]
+                assert len(result["rows"]) == args.limit
+        deepest = cursors[depths[-1]]
+        plan = _keyset_plan(engine, store, limit=args.limit, cursor=deepest) if deepest is not None else []
+        engine.dispose()
+
+    results = [
+        {
+            "depth": depth,
+            "offset": _summary(offset_ms[depth]),
+            "keyset": _summary(keyset_ms[depth]),
+        }
+        for depth in depths
+    ]
+    ratio = results[-1]["keyset"]["p50_ms"] / (results[0]["keyset"]["p50_ms"] or 1.0)
+    print(
+        json.dumps(
+            {
+                "sessions": args.sessions,
+                "unread": args.unread,
+                "live_every": args.live_every,
+                "limit": args.limit,
+                "seed_s": round(seed_s, 2),
+                "first_page_total": total,
+                "results": results,
+                "keyset_depth_ratio": round(ratio, 2),
+                "keyset_plan": plan,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+    )
+    if args.max_depth_ratio is not None and ratio > args.max_depth_ratio:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
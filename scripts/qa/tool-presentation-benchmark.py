@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Measure tool presentation for a tool-heavy session on first and repeat views.
+
+Builds a synthetic 5,000-event session of `Bash`, `Edit`, `Read` and Codex
+`exec` wrapper calls and projects every event's presentation the way a
+transcript read does. The first view fills the memo; each repeat view is what
+another tab, poll or reload pays. Every repeat projection is checked against an
+unmemoized projection of the same input.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "server"))
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("TESTING", "1")
+
+from zerg.services import tool_presentation  # noqa: E402
+
+
+def _events(count: int) -> list[tuple[str, object, str]]:
+    events: list[tuple[str, object, str]] = []
+    for index in range(count):
+        kind = index % 4
+        if kind == 0:
+            command = f"cd /repo && git diff --stat HEAD~{index % 7} && uv run pytest tests/test_{index}.py -q | tail -20"
+            events.append(("Bash", {"command": command, "description": f"run tests {index}"}, "claude"))
+        elif kind == 1:
+            events.append(
+                (
+                    "Edit",
+                    {"file_path": f"/repo/src/module_{index}.py", "old_string": "return None\n" * 8, "new_string": f"return {index}\n" * 8},
+                    "claude",
+                )
+            )
+        elif kind == 2:
+            events.append(("Read", {"file_path": f"/repo/src/module_{index}.py", "offset": index, "limit": 200}, "claude"))
+        else:
+            source = (
+                f'const r = await tools.exec_command({{"cmd": "rg -n needle_{index} server | head -50", "workdir": "/repo"}}); '
+                "text(JSON.stringify(r));"
+            )
+            events.append(("exec", source, "codex"))
+    return events
+
+
+def _view(events: list[tuple[str, object, str]]) -> tuple[float, list[dict[str, object] | None]]:
+    started = time.perf_counter_ns()
+    projections = [
+        tool_presentation.project_tool_presentation(name, tool_input, provider=provider) for name, tool_input, provider in events
+    ]
+    return (time.perf_counter_ns() - started) / 1_000_000, projections
+
+
+def run(*, events: int, repeats: int) -> dict[str, object]:
+    session = _events(events)
+    memo = tool_presentation.get_tool_presentation_memo()
+    memo.clear()
+    first_ms, _projections = _view(session)
+    repeat_ms: list[float] = []
+    projections: list[dict[str, object] | None] = []
+    for _ in range(repeats):
+        elapsed_ms, projections = _view(session)
+        repeat_ms.append(elapsed_ms)
+    for (name, tool_input, provider), projection in zip(session, projections, strict=True):
+        expected = tool_presentation._project_tool_presentation(
+            name,
+            tool_input,
+            is_codex=provider == "codex",
+            rules_path=tool_presentation.DEFAULT_RULES_PATH,
+        )
+        if projection != expected:
+            raise SystemExit(f"memoized projection differs for {name}")
+    stats = memo.stats()
+    repeat_p50 = statistics.median(repeat_ms)
+    return {
+        "events": events,
+        "first_view_ms": round(first_ms, 3),
+        "repeat_view_p50_ms": round(repeat_p50, 3),
+        "repeat_view_max_ms": round(max(repeat_ms), 3),
+        "repeat_speedup": round(first_ms / repeat_p50, 2) if repeat_p50 else None,
+        "memo": {
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "evictions": stats.evictions,
+            "entries": stats.entries,
+            "resident_bytes": stats.resident_bytes,
+            "max_bytes": stats.max_bytes,
+        },
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=5000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--min-repeat-speedup", type=float, default=None)
+    args = parser.parse_args()
+    if args.events < 1 or args.repeats < 1:
+        raise SystemExit("events and repeats must be positive")
+
+    result = run(events=args.events, repeats=args.repeats)
+    if args.min_repeat_speedup is None:
+        print(json.dumps(result, indent=2, sort_keys=True))
+        return 0
+    result["gate_min_repeat_speedup"] = args.min_repeat_speedup
+    result["passed"] = (result["repeat_speedup"] or 0) >= args.min_repeat_speedup
+    print(json.dumps(result, indent=2, sort_keys=True))
+    return 0 if result["passed"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -31,6 +31,7 @@ from sqlalchemy import select
 from zerg.catalogd.fact_reducer import ReducerFact
 from zerg.catalogd.fact_reducer import ReducerResult
 from zerg.catalogd.fact_reducer import reduce_fact_batch
+from zerg.catalogd.fact_reducer import reduce_fact_batch_bulk
 from zerg.catalogd.fact_reducer import reduce_fact_batch_setwise
 from zerg.catalogd.models import FactConflict
 from zerg.catalogd.models import FactHead
@@ -266,3 +267,9 @@ def setwise_reduce(connection, facts, **kwargs) -> ReducerResult:
     """The set-based candidate, validated against the reference."""
 
     return reduce_fact_batch_setwise(connection, facts, **kwargs)
+
+
+def bulk_reduce(connection, facts, **kwargs) -> ReducerResult:
+    """The many-session candidate, validated against the reference."""
+
+    return reduce_fact_batch_bulk(connection, facts, **kwargs)
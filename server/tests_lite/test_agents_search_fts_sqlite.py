@@ -10,6 +10,18 @@ from zerg.database import make_engine
 from zerg.services.agents import AgentsStore
 from zerg.services.agents import EventIngest
 from zerg.services.agents import SessionIngest
+from zerg.services.agents import store as agents_store_module
+from zerg.services.agents.fts_journal import drain_fts_journal
+from zerg.services.agents.fts_journal import fts_journal_status
+
+
+def _match_count(db, query: str) -> int:
+    return db.execute(text("SELECT count(*) FROM events_fts WHERE events_fts MATCH :query"), {"query": query}).scalar()
+
+
+def _assert_fts_integrity(db) -> None:
+    # Raises if the external-content index disagrees with the events table.
+    db.execute(text("INSERT INTO events_fts(events_fts, rank) VALUES('integrity-check', 1)"))
 
 
 def test_agents_search_fts_sqlite(tmp_path):
@@ -145,7 +157,7 @@ def test_agents_fts_triggers_update_delete(tmp_path):
         assert count_deleted == 0
 
 
-def test_agents_fts_small_append_keeps_triggers_enabled(tmp_path):
+def test_agents_fts_small_append_indexes_inline(tmp_path):
     db_path = tmp_path / "fts_small_append.db"
     engine = make_engine(f"sqlite:///{db_path}")
     initialize_database(engine)
@@ -182,10 +194,10 @@ def test_agents_fts_small_append_keeps_triggers_enabled(tmp_path):
             )
         )
 
-        def fail_disable_triggers():
-            raise AssertionError("small transcript appends should not disable FTS triggers")
+        def fail_defer(_session_id):
+            raise AssertionError("small transcript appends should index inline, not through the journal")
 
-        store._disable_fts_triggers = fail_disable_triggers
+        store._defer_fts_for_session = fail_defer
         append_events = [
             EventIngest(
                 role="assistant" if index % 2 else "user",
@@ -211,11 +223,10 @@ def test_agents_fts_small_append_keeps_triggers_enabled(tmp_path):
             )
         )
 
-        count = db.execute(text("SELECT count(*) FROM events_fts")).scalar()
-        assert count == 14
+        assert _match_count(db, '"small append event"') == 12
 
 
-def test_agents_fts_large_append_backfills_inserted_rows_only(tmp_path):
+def test_agents_fts_large_append_journals_inserts_for_the_indexer(tmp_path, monkeypatch):
     db_path = tmp_path / "fts_large_append.db"
     engine = make_engine(f"sqlite:///{db_path}")
     initialize_database(engine)
@@ -252,18 +263,8 @@ def test_agents_fts_large_append_backfills_inserted_rows_only(tmp_path):
             )
         )
 
-        captured_ids: list[int] = []
-        original_backfill = store._backfill_fts_for_event_ids
-
-        def capture_event_backfill(event_ids):
-            captured_ids.extend(event_ids)
-            return original_backfill(event_ids)
-
-        def fail_session_backfill(_session_id):
-            raise AssertionError("large transcript appends should backfill only the inserted rows")
-
-        store._backfill_fts_for_event_ids = capture_event_backfill
-        store._backfill_fts_for_session = fail_session_backfill
+        # A running background indexer owns the drain; the ingest only wakes it.
+        monkeypatch.setattr(agents_store_module, "wake_fts_indexer", lambda: True)
 
         append_events = [
             EventIngest(
@@ -291,14 +292,25 @@ def test_agents_fts_large_append_backfills_inserted_rows_only(tmp_path):
         )
 
         assert result.events_inserted == 120
-        assert len(captured_ids) == 120
-        assert len(set(captured_ids)) == 120
+        assert fts_journal_status(db).pending_events == 120
+        assert fts_journal_status(db).deferred_sessions == 0
+        assert _match_count(db, '"large append event"') == 0
+        assert _match_count(db, '"seed event"') == 2
 
-        count = db.execute(text("SELECT count(*) FROM events_fts")).scalar()
-        assert count == 122
+        # Writers outside the deferred ingest keep indexing inline.
+        db.execute(text("UPDATE events SET content_text = 'seed event edited' WHERE content_text = 'seed event one'"))
+
+        assert drain_fts_journal(db, limit=50) == 50
+        assert drain_fts_journal(db, limit=500) == 70
+        assert drain_fts_journal(db) == 0
+        db.commit()
 
+        assert _match_count(db, '"large append event"') == 120
+        assert _match_count(db, '"seed event edited"') == 1
+        _assert_fts_integrity(db)
 
-def test_agents_fts_large_append_restores_triggers_after_error(tmp_path):
+
+def test_agents_fts_large_append_failure_leaves_index_consistent(tmp_path):
     db_path = tmp_path / "fts_restore_after_error.db"
     engine = make_engine(f"sqlite:///{db_path}")
     initialize_database(engine)
@@ -375,15 +387,87 @@ def test_agents_fts_large_append_restores_triggers_after_error(tmp_path):
 
         db.rollback()
 
-        trigger_names = {
-            row[0]
-            for row in db.execute(
-                text("SELECT name FROM sqlite_master WHERE type='trigger' AND name IN ('events_ai', 'events_ad', 'events_au')")
-            ).fetchall()
-        }
-        assert trigger_names == {"events_ai", "events_ad", "events_au"}
-
+        # The committed chunk stays searchable and the deferral is released,
+        # with no trigger repair or rebuild involved.
         events_count = db.execute(text("SELECT count(*) FROM events")).scalar()
-        fts_count = db.execute(text("SELECT count(*) FROM events_fts")).scalar()
         assert events_count == 202
-        assert fts_count == 202
+        assert _match_count(db, '"large append event"') == 200
+        status = fts_journal_status(db)
+        assert status.pending_events == 0
+        assert status.deferred_sessions == 0
+        _assert_fts_integrity(db)
+
+
+def test_agents_fts_journal_survives_updates_and_deletes_of_pending_rows(tmp_path):
+    db_path = tmp_path / "fts_pending_rows.db"
+    engine = make_engine(f"sqlite:///{db_path}")
+    initialize_database(engine)
+
+    SessionLocal = sessionmaker(bind=engine)
+    with SessionLocal() as db:
+        store = AgentsStore(db)
+        result = store.ingest_session(
+            SessionIngest(
+                provider="claude",
+                environment="test",
+                project="fts",
+                device_id="dev-machine",
+                cwd="/tmp",
+                git_repo=None,
+                git_branch=None,
+                started_at=datetime(2026, 2, 5, tzinfo=timezone.utc),
+                events=[
+                    EventIngest(
+                        role="user",
+                        content_text="seed event one",
+                        timestamp=datetime(2026, 2, 5, tzinfo=timezone.utc),
+                        source_path="/tmp/session.jsonl",
+                        source_offset=0,
+                    ),
+                ],
+            )
+        )
+        seed_id = db.execute(text("SELECT id FROM events")).scalar()
+        assert store._defer_fts_for_session(result.session_id) is True
+        for offset, body in ((1, "pendingkept original"), (2, "pendingdropped body")):
+            db.execute(
+                text(
+                    "INSERT INTO events (session_id, role, content_text, timestamp, source_path, source_offset, schema_version) "
+                    "SELECT session_id, 'assistant', :body, timestamp, source_path, :offset, 1 FROM events WHERE id = :seed"
+                ),
+                {"body": body, "offset": offset, "seed": seed_id},
+            )
+        db.execute(text("UPDATE events SET content_text = 'pendingkept edited' WHERE content_text = 'pendingkept original'"))
+        db.execute(text("DELETE FROM events WHERE content_text = 'pendingdropped body'"))
+        assert fts_journal_status(db).pending_events == 1
+
+        store._end_fts_deferral(result.session_id)
+        db.commit()
+
+        assert _match_count(db, "pendingkept") == 1
+        assert _match_count(db, "original") == 0
+        assert _match_count(db, "pendingdropped") == 0
+        _assert_fts_integrity(db)
+
+
+def test_ensure_agents_fts_replaces_inline_only_triggers(tmp_path):
+    db_path = tmp_path / "fts_legacy_triggers.db"
+    engine = make_engine(f"sqlite:///{db_path}")
+    initialize_database(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP TRIGGER events_ai_journal")
+        conn.exec_driver_sql("DROP TRIGGER events_ad")
+        conn.exec_driver_sql(
+            "CREATE TRIGGER events_ad AFTER DELETE ON events BEGIN "
+            "INSERT INTO events_fts(events_fts, rowid, content_text, tool_output_text, tool_name, role, session_id) "
+            "VALUES('delete', old.id, old.content_text, old.tool_output_text, old.tool_name, old.role, old.session_id); END"
+        )
+
+    initialize_database(engine)
+
+    with engine.connect() as conn:
+        triggers = dict(
+            conn.exec_driver_sql("SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'events_a%'").fetchall()
+        )
+    assert set(triggers) == {"events_ai", "events_ai_journal", "events_ad", "events_au"}
+    assert "events_fts_pending" in triggers["events_ad"]
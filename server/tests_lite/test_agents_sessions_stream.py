@@ -26,11 +26,12 @@ class _Request:
 def test_machine_session_stream_uses_commit_driven_catalog_projection(monkeypatch):
     captured = {}
 
-    async def fake_stream(request, *, params, skip_initial_replay, owner_id):
+    async def fake_stream(request, *, params, skip_initial_replay, owner_id, emit_patches):
         captured["request"] = request
         captured["params"] = params
         captured["skip_initial_replay"] = skip_initial_replay
         captured["owner_id"] = owner_id
+        captured["emit_patches"] = emit_patches
         yield {"event": "connected", "data": "{}"}
 
     monkeypatch.setattr(agents_sessions.database_module, "live_catalog_enabled", lambda: True)
@@ -44,6 +45,7 @@ def test_machine_session_stream_uses_commit_driven_catalog_projection(monkeypatc
             days_back=7,
             limit=8,
             skip_initial_replay=False,
+            patch=True,
             _auth=SimpleNamespace(owner_id=1),
             _single=None,
         )
@@ -57,6 +59,7 @@ def test_machine_session_stream_uses_commit_driven_catalog_projection(monkeypatc
     assert captured["params"].limit == 8
     assert captured["skip_initial_replay"] is False
     assert captured["owner_id"] == 1
+    assert captured["emit_patches"] is True
 
 
 def test_machine_session_delta_is_small_and_contains_no_browser_card_copies():
@@ -193,3 +196,95 @@ def test_canonical_machine_stream_initial_replay_preserves_commit_coordinate(mon
     assert connected["event"] == "connected"
     assert delta["event"] == "session_delta"
     assert json.loads(delta["data"])["commit_seq"] == "91"
+
+
+def test_machine_stream_patches_only_changed_fields(monkeypatch):
+    def session(**overrides):
+        values = {
+            "id": "633a0114-de2d-4b3d-b1b9-dfa7f314e300",
+            "device_id": "cinder",
+            "timeline_title": "Investigate state",
+            "title_state": "ready",
+            "title_source": "ai",
+            "runtime_phase": "thinking",
+            "display_phase": "Thinking",
+            "last_activity_at": datetime(2026, 7, 14, 5, 0, tzinfo=timezone.utc),
+            "runtime_version": 91,
+        }
+        values.update(overrides)
+        return SimpleNamespace(**values)
+
+    reads = iter(
+        [
+            (session(), None, 91),
+            (session(runtime_version=92), None, 92),
+            (session(runtime_version=92), None, 93),
+            (session(runtime_version=94, runtime_phase=None, display_phase="Idle"), None, 94),
+        ]
+    )
+
+    class Request:
+        def __init__(self):
+            self.checks = 0
+
+        async def is_disconnected(self):
+            self.checks += 1
+            return self.checks > 4
+
+    class Subscription:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_args):
+            return None
+
+        async def next_message(self, *, timeout):
+            return SimpleNamespace(payload={"session_id": "633a0114-de2d-4b3d-b1b9-dfa7f314e300", "kind": "commit"})
+
+    class Bus:
+        def peek_latest_seq(self, _topic):
+            return 0
+
+        def subscribe(self, _topic, *, since_seq):
+            return Subscription()
+
+    monkeypatch.setattr(live_catalog_timeline, "get_pubsub", lambda: Bus())
+    monkeypatch.setattr(live_catalog_timeline, "read_live_catalog_session", lambda *_args, **_kwargs: next(reads))
+    monkeypatch.setattr(
+        live_catalog_timeline,
+        "project_machine_session_delta",
+        lambda value, *, commit_seq, fanout=None, canonical=False: project_machine_session_delta(
+            value, commit_seq=commit_seq, fanout=fanout
+        ),
+    )
+
+    async def collect():
+        stream = live_catalog_timeline.stream_live_catalog_machine_sessions(
+            Request(),
+            params=SimpleNamespace(device_id=None),
+            skip_initial_replay=True,
+            owner_id=1,
+            emit_patches=True,
+        )
+        return [event async for event in stream]
+
+    events = asyncio.run(collect())
+
+    assert [event["event"] for event in events] == ["connected", "session_delta", "session_patch", "session_patch"]
+    assert json.loads(events[1]["data"])["runtime_phase"] == "thinking"
+    assert json.loads(events[2]["data"]) == {
+        "commit_seq": "92",
+        "fanout_kind": "commit",
+        "runtime_version": 92,
+        "session_id": "633a0114-de2d-4b3d-b1b9-dfa7f314e300",
+        "source": "runtime_host",
+    }
+    assert json.loads(events[3]["data"]) == {
+        "commit_seq": "94",
+        "display_phase": "Idle",
+        "fanout_kind": "commit",
+        "runtime_phase": None,
+        "runtime_version": 94,
+        "session_id": "633a0114-de2d-4b3d-b1b9-dfa7f314e300",
+        "source": "runtime_host",
+    }
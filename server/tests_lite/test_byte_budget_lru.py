@@ -0,0 +1,51 @@
+"""Byte-budgeted LRU shared by the render-object, event-fragment and tool-presentation caches."""
+
+from __future__ import annotations
+
+from zerg.services.byte_budget_lru import ByteBudgetLRU
+
+
+def test_evicts_least_recently_used_by_bytes_and_counts_lookups():
+    lookups: list[str] = []
+    sizes: list[tuple[int, int]] = []
+    cache: ByteBudgetLRU[str, str] = ByteBudgetLRU(max_bytes=250, on_lookup=lookups.append, on_resize=lambda *size: sizes.append(size))
+
+    assert cache.put("a", "A", size_bytes=100)
+    assert cache.put("b", "B", size_bytes=100)
+    assert cache.get("a") == "A"
+    assert cache.put("c", "C", size_bytes=100)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == ("A", "C")
+    stats = cache.stats()
+    assert (stats.entries, stats.resident_bytes, stats.evictions) == (2, 200, 1)
+    assert (stats.hits, stats.misses, stats.hit_ratio) == (3, 1, 0.75)
+    assert lookups == ["hit", "miss", "hit", "hit"]
+    assert sizes == [(100, 1), (200, 2), (200, 2)]
+
+
+def test_oversized_and_duplicate_puts_keep_the_resident_value():
+    cache: ByteBudgetLRU[str, str] = ByteBudgetLRU(max_bytes=100)
+
+    assert not cache.put("big", "X", size_bytes=101)
+    assert cache.put("a", "first", size_bytes=10)
+    assert not cache.put("a", "second", size_bytes=10)
+
+    assert cache.get("a") == "first"
+    assert cache.get("big") is None
+    assert cache.stats().resident_bytes == 10
+
+
+def test_clear_empties_the_cache_and_zero_budget_disables_it():
+    sizes: list[tuple[int, int]] = []
+    cache: ByteBudgetLRU[str, str] = ByteBudgetLRU(max_bytes=100, on_resize=lambda *size: sizes.append(size))
+    cache.put("a", "A", size_bytes=10)
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert cache.stats().resident_bytes == 0
+    assert sizes[-1] == (0, 0)
+    disabled: ByteBudgetLRU[str, str] = ByteBudgetLRU(max_bytes=0)
+    assert not disabled.enabled
+    assert not disabled.put("a", "A", size_bytes=1)
@@ -19,6 +19,8 @@ from zerg.catalogd.fact_reducer import canonical_value_json
 from zerg.catalogd.fact_reducer import read_bounded_sessions_fact_heads
 from zerg.catalogd.fact_reducer import read_fact_heads
 from zerg.catalogd.fact_reducer import reduce_fact_batch
+from zerg.catalogd.fact_reducer import reduce_fact_batch_bulk
+from zerg.catalogd.fact_reducer import reduce_fact_batch_setwise
 from zerg.catalogd.fact_reducer import reducer_facts_from_machine_evidence
 from zerg.catalogd.models import FactConflict
 from zerg.catalogd.models import FactReceipt
@@ -367,3 +369,20 @@ def test_hash_mismatch_is_rejected_before_any_write(tmp_path):
     bad = replace(bad, evidence_hash="0" * 64)
     with engine.begin() as connection, pytest.raises(ValueError, match="canonical value"):
         reduce_fact_batch(connection, [bad], received_at=NOW)
+
+
+def test_bulk_reducer_folds_a_many_session_batch_under_one_commit(tmp_path):
+    engine = _engine(tmp_path)
+    facts = [_fact(subject=f"run:run-{index}", run_id=f"run-{index}") for index in range(1_000)]
+    with engine.begin() as connection:
+        with pytest.raises(ValueError, match="exceeds 256"):
+            reduce_fact_batch_setwise(connection, facts, received_at=NOW)
+        result = reduce_fact_batch_bulk(connection, facts, received_at=NOW)
+        replay = reduce_fact_batch_bulk(connection, facts, received_at=NOW + timedelta(seconds=1))
+        head_count = connection.execute(select(func.count()).select_from(fact_reducer.FactHead)).scalar_one()
+        commit_seq = connection.execute(select(catalog_meta.c.commit_seq)).scalar_one()
+
+    assert (result.commit_seq, result.changed_heads) == (1, 1_000)
+    assert (replay.changed_heads, replay.duplicates) == (0, 1_000)
+    assert head_count == 1_000
+    assert commit_seq == 1
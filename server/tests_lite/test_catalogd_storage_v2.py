@@ -3561,3 +3561,116 @@ async def test_restore_generation_requires_retired_current_and_durable_target(da
     finally:
         await client.close()
         await daemon.close()
+
+
+@pytest.mark.asyncio
+async def test_usage_ledger_folds_each_response_once_into_daily_rollups(daemon_paths):
+    database_path, socket_path = daemon_paths
+    now = datetime(2026, 3, 4, 12, 0, tzinfo=UTC)
+    daemon = CatalogDaemon(database_path=database_path, socket_path=socket_path)
+    await daemon.start()
+    client = CatalogClient(socket_path)
+    try:
+        epoch = uuid4()
+        session_id = uuid4()
+        first_response = {
+            "source_key": "codex:1500",
+            "day": "2026-03-04",
+            "model": "gpt-5",
+            "input_tokens": 1000,
+            "output_tokens": 500,
+            "cache_read_tokens": 0,
+            "cache_write_tokens": 0,
+        }
+        # A turn whose turn_context sat in an earlier envelope arrives unpriced.
+        second_response = {**first_response, "source_key": "codex:2100", "model": "unknown", "input_tokens": 400, "output_tokens": 200}
+        raw = _raw_params(epoch=epoch, session_id=session_id, start=0, end=6, records=(b"hello\n",), sealed_at=now)
+        raw["usage_deltas"] = [first_response]
+        await client.call("storage.raw_object.commit.v2", raw)
+        await client.call("storage.raw_object.commit.v2", raw)
+
+        following = _raw_params(epoch=epoch, session_id=session_id, start=6, end=12, records=(b"again\n",), sealed_at=now)
+        following["usage_deltas"] = [first_response, second_response]
+        await client.call("storage.raw_object.commit.v2", following)
+
+        folded = await client.call("usage.ledger.fold.v2", {"session_id": str(session_id), "usage_deltas": [second_response]})
+        assert folded["folded"] == 0
+
+        rollups = await client.call("usage.rollups.read.v2", {"owner_ids": ["42"], "start_day": "2026-03-01", "end_day": "2026-03-31"})
+        assert rollups["rows"] == [
+            {
+                "owner_id": "42",
+                "day": "2026-03-04",
+                "input_tokens": 1400,
+                "output_tokens": 700,
+                "cache_read_tokens": 0,
+                "cache_write_tokens": 0,
+                # gpt-5 at $0.00125/$0.01 per 1K tokens.
+                "cost_microusd": 8750,
+                "responses": 2,
+            }
+        ]
+        other_owner = await client.call("usage.rollups.read.v2", {"owner_ids": ["7"], "start_day": "2026-03-01", "end_day": "2026-03-31"})
+        assert other_owner["rows"] == []
+
+        page = await client.call("usage.ledger.backfill.objects.v2", {"after_envelope_id": None, "limit": 1})
+        assert len(page["objects"]) == 1
+        assert page["objects"][0]["session_id"] == str(session_id)
+        last = await client.call("usage.ledger.backfill.objects.v2", {"after_envelope_id": page["next_after_envelope_id"], "limit": 1})
+        assert last["next_after_envelope_id"] is None
+
+        with pytest.raises(CatalogRemoteError) as invalid:
+            await client.call("usage.rollups.read.v2", {"owner_ids": None, "start_day": "2026-03-31", "end_day": "2026-03-01"})
+        assert invalid.value.code == "invalid_request"
+    finally:
+        await client.close()
+        await daemon.close()
+
+
+@pytest.mark.asyncio
+async def test_usage_ledger_keeps_the_fullest_report_of_a_message_split_across_envelopes(daemon_paths):
+    database_path, socket_path = daemon_paths
+    now = datetime(2026, 3, 4, 12, 0, tzinfo=UTC)
+    daemon = CatalogDaemon(database_path=database_path, socket_path=socket_path)
+    await daemon.start()
+    client = CatalogClient(socket_path)
+    try:
+        epoch = uuid4()
+        session_id = uuid4()
+        # A live-shipped Claude message: the first envelope ends mid-stream.
+        partial = {
+            "source_key": "claude:msg_1",
+            "day": "2026-03-04",
+            "model": "claude-sonnet-4-5-20250929",
+            "input_tokens": 1000,
+            "output_tokens": 5,
+            "cache_read_tokens": 0,
+            "cache_write_tokens": 0,
+        }
+        raw = _raw_params(epoch=epoch, session_id=session_id, start=0, end=6, records=(b"hello\n",), sealed_at=now)
+        raw["usage_deltas"] = [partial]
+        await client.call("storage.raw_object.commit.v2", raw)
+        following = _raw_params(epoch=epoch, session_id=session_id, start=6, end=12, records=(b"again\n",), sealed_at=now)
+        following["usage_deltas"] = [{**partial, "output_tokens": 120}]
+        await client.call("storage.raw_object.commit.v2", following)
+
+        replayed = await client.call("usage.ledger.fold.v2", {"session_id": str(session_id), "usage_deltas": [partial]})
+        assert replayed["folded"] == 0
+
+        rollups = await client.call("usage.rollups.read.v2", {"owner_ids": ["42"], "start_day": "2026-03-01", "end_day": "2026-03-31"})
+        assert rollups["rows"] == [
+            {
+                "owner_id": "42",
+                "day": "2026-03-04",
+                "input_tokens": 1000,
+                "output_tokens": 120,
+                "cache_read_tokens": 0,
+                "cache_write_tokens": 0,
+                # claude-sonnet-4-5 at $0.003/$0.015 per 1K tokens.
+                "cost_microusd": 4800,
+                "responses": 1,
+            }
+        ]
+    finally:
+        await client.close()
+        await daemon.close()
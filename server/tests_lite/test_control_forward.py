@@ -0,0 +1,240 @@
+"""Tests for the multi-worker HTTP worker -> control process forwarding."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("TESTING", "1")
+
+import uvicorn
+from fastapi import FastAPI
+from fastapi import Request
+from fastapi import WebSocket
+from fastapi.testclient import TestClient
+
+from zerg.middleware.control_forward import ControlForwardMiddleware
+from zerg.middleware.control_forward import ForwardedClientMiddleware
+from zerg.pubsubd.server import PubsubBroker
+from zerg.services import runner_connection_manager as runner_connections
+from zerg.services.machine_control_channel import MACHINE_CONTROL_TOPIC
+from zerg.services.machine_control_channel import MachineControlChannelRegistry
+from zerg.services.pubsub_fanout import PubsubBrokerLink
+from zerg.services.session_pubsub import get_pubsub
+from zerg.services.session_pubsub import reset_pubsub_for_test
+
+
+def _control_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/api/echo")
+    async def echo(request: Request):
+        body = await request.body()
+        return {"process": "control", "body": body.decode(), "client": request.client.host, "query": request.url.query}
+
+    @app.get("/api/whoami")
+    async def whoami():
+        return {"process": "control"}
+
+    @app.get("/api/health")
+    @app.get("/api/admin/profiler/folded")
+    async def health():
+        return {"process": "control"}
+
+    @app.websocket("/api/ws")
+    async def ws(websocket: WebSocket):
+        await websocket.accept(subprotocol="longhouse")
+        await websocket.send_json({"client": websocket.client.host})
+        while True:
+            text = await websocket.receive_text()
+            if text == "bye":
+                await websocket.close(code=4001)
+                return
+            await websocket.send_text(text.upper())
+
+    return ForwardedClientMiddleware(app)
+
+
+def _worker_app(socket_path: Path) -> ControlForwardMiddleware:
+    app = FastAPI()
+
+    @app.get("/api/whoami")
+    async def whoami():
+        return {"process": "worker"}
+
+    @app.get("/api/health")
+    @app.get("/api/admin/profiler/folded")
+    async def health():
+        return {"process": "worker"}
+
+    return ControlForwardMiddleware(app, socket_path=socket_path)
+
+
+@pytest.fixture(scope="module")
+def control_socket():
+    # pytest's tmp_path can exceed the 104-byte Unix socket limit.
+    with tempfile.TemporaryDirectory(prefix="lhcf-") as directory:
+        socket_path = Path(directory) / "control.sock"
+        server = uvicorn.Server(uvicorn.Config(_control_app(), uds=str(socket_path), log_level="warning", ws_ping_interval=None))
+        thread = threading.Thread(target=server.run, daemon=True)
+        thread.start()
+        deadline = time.monotonic() + 10
+        while not server.started and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert server.started
+        yield socket_path
+        server.should_exit = True
+        thread.join(timeout=10)
+
+
+def test_reads_stay_local_and_writes_reach_control_with_the_client_address(control_socket):
+    with TestClient(_worker_app(control_socket)) as client:
+        assert client.get("/api/whoami").json() == {"process": "worker"}
+        # Health and the profiler report on control's writers, so control answers.
+        assert client.get("/api/health").json() == {"process": "control"}
+        assert client.get("/api/admin/profiler/folded").json() == {"process": "control"}
+
+        response = client.post("/api/echo?x=1", content=b"payload")
+
+    assert response.status_code == 200
+    assert response.json() == {"process": "control", "body": "payload", "client": "testclient", "query": "x=1"}
+
+
+def test_writes_answer_503_when_control_is_unreachable():
+    with tempfile.TemporaryDirectory(prefix="lhcf-") as directory:
+        with TestClient(_worker_app(Path(directory) / "missing.sock")) as client:
+            response = client.post("/api/echo", content=b"payload")
+
+    assert response.status_code == 503
+    assert response.json() == {"detail": "Runtime Host control process is unavailable"}
+
+
+def test_websockets_are_relayed_to_control_including_close_codes(control_socket):
+    with TestClient(_worker_app(control_socket)) as client:
+        with client.websocket_connect("/api/ws", subprotocols=["longhouse"]) as websocket:
+            assert websocket.accepted_subprotocol == "longhouse"
+            assert websocket.receive_json() == {"client": "testclient"}
+            websocket.send_text("ping")
+            assert websocket.receive_text() == "PING"
+            websocket.send_text("bye")
+            closed = websocket.receive()
+
+    assert closed == {"type": "websocket.close", "code": 4001, "reason": ""}
+
+
+class _FakeWebSocket:
+    pass
+
+
+@pytest.mark.asyncio
+async def test_http_workers_mirror_control_registry_snapshots():
+    reset_pubsub_for_test()
+    control = MachineControlChannelRegistry()
+    mirror = MachineControlChannelRegistry()
+    websocket = _FakeWebSocket()
+    try:
+        control.enable_snapshot_publishing()
+        with get_pubsub().subscribe(MACHINE_CONTROL_TOPIC) as snapshots:
+            await control.register(
+                owner_id=7,
+                device_id="laptop",
+                machine_name="Laptop",
+                engine_build="1.2.3",
+                supports=["resume", "stop"],
+                websocket=websocket,
+            )
+            mirror.apply_snapshot((await snapshots.next_message(timeout=1.0)).payload)
+            assert mirror.is_online(owner_id=7, device_id="laptop")
+            assert mirror.info(owner_id=7, device_id="laptop") == control.info(owner_id=7, device_id="laptop")
+            assert mirror.supports(owner_id=7, device_id="laptop", capability="resume")
+            assert [info.device_id for info in mirror.list_for_owner(owner_id=7)] == ["laptop"]
+
+            await control.unregister(owner_id=7, device_id="laptop", websocket=websocket)
+            mirror.apply_snapshot((await asyncio.wait_for(snapshots.next_message(), timeout=1.0)).payload)
+
+        assert not mirror.is_online(owner_id=7, device_id="laptop")
+        assert mirror.list_for_owner(owner_id=7) == []
+    finally:
+        reset_pubsub_for_test()
+
+
+# Runs as the control process: holds a runner socket, drops it on the first stdin line.
+_RUNNER_CONTROL_SCRIPT = """
+import asyncio, sys
+from pathlib import Path
+from zerg.services.pubsub_fanout import PubsubBrokerLink
+from zerg.services.runner_connection_manager import get_runner_connection_manager
+from zerg.services.session_pubsub import get_pubsub
+
+async def main():
+    link = PubsubBrokerLink(socket_path=Path(sys.argv[1]), bus=get_pubsub())
+    assert await link.start()
+    manager = get_runner_connection_manager()
+    manager.enable_snapshot_publishing()
+    websocket = object()
+    manager.register(7, 3, websocket)
+    print("registered", flush=True)
+    await asyncio.to_thread(sys.stdin.readline)
+    manager.unregister(7, 3, websocket)
+    print("unregistered", flush=True)
+    await asyncio.to_thread(sys.stdin.readline)
+    await link.stop()
+
+asyncio.run(main())
+"""
+
+
+@pytest.mark.asyncio
+async def test_http_worker_sees_runners_connected_to_the_control_process(monkeypatch):
+    monkeypatch.setattr(runner_connections, "_manager_instance", None)
+    reset_pubsub_for_test()
+    with tempfile.TemporaryDirectory(prefix="lhcf-") as directory:
+        broker_socket = Path(directory) / "pubsub.sock"
+        broker = PubsubBroker(socket_path=broker_socket)
+        await broker.start()
+        serve_task = asyncio.create_task(broker.serve_forever())
+        control = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-c",
+            _RUNNER_CONTROL_SCRIPT,
+            str(broker_socket),
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+        )
+        follow_task = asyncio.create_task(runner_connections.follow_runner_connection_snapshots())
+        link = PubsubBrokerLink(socket_path=broker_socket, bus=get_pubsub())
+        try:
+            assert await asyncio.wait_for(control.stdout.readline(), timeout=30) == b"registered\n"
+            # The worker joins after the runner connected; the broker replays the snapshot.
+            assert await link.start()
+            worker = runner_connections.get_runner_connection_manager()
+            deadline = time.monotonic() + 5
+            while not worker.is_online(7, 3) and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+            assert worker.is_online(7, 3)
+            assert worker.get_online_count(owner_id=7) == 1
+
+            control.stdin.write(b"\n")
+            assert await asyncio.wait_for(control.stdout.readline(), timeout=10) == b"unregistered\n"
+            deadline = time.monotonic() + 5
+            while worker.is_online(7, 3) and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+            assert not worker.is_online(7, 3)
+        finally:
+            control.stdin.write(b"\n")
+            await asyncio.wait_for(control.wait(), timeout=10)
+            follow_task.cancel()
+            await asyncio.gather(follow_task, return_exceptions=True)
+            await link.stop()
+            serve_task.cancel()
+            await asyncio.gather(serve_task, return_exceptions=True)
+            await broker.close()
+            reset_pubsub_for_test()
@@ -0,0 +1,167 @@
+"""Tests for pre-serialized event fragments on the storage-v2 session-detail surfaces."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+import zerg.services.storage_v2_workspace as workspace_module
+from zerg.services.event_fragments import EventFragmentCache
+from zerg.services.event_fragments import SerializedJSON
+from zerg.services.event_fragments import encode_json
+from zerg.services.event_fragments import fragment_json_response
+from zerg.services.event_fragments import get_event_fragment_cache
+from zerg.services.event_fragments import render_json
+
+
+def _reference(content: object) -> bytes:
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"text": "héllo — 東京  ", "n": 12, "ok": True, "none": None},
+        {"ratio": 0.5, "tiny": 1e-7, "big": 1.5e300, "neg": -0.0},
+        {"wide": 2**70, "nested": [{"a": [1, 2.25, "x"]}]},
+        {"edge": 9999999999999998.0, "exp": 1e16},
+        {"exp": 2.5e20},
+        {"exp": -1.5e300},
+    ],
+)
+def test_render_json_matches_json_response_bytes(value):
+    envelope = {"projection": {"items": [{"event": SerializedJSON(encode_json(value))}, value]}, "meta": value}
+
+    assert render_json(envelope) == _reference({"projection": {"items": [{"event": value}, value]}, "meta": value})
+
+
+def test_render_json_refuses_nan_like_json_response():
+    with pytest.raises(ValueError):
+        render_json({"bad": float("nan")})
+    with pytest.raises(ValueError):
+        encode_json({"bad": float("inf")})
+
+
+def test_fragment_cache_builds_once_per_key():
+    cache = EventFragmentCache(max_bytes=1_000)
+    builds: list[int] = []
+
+    def build(ordinal: int):
+        def run():
+            builds.append(ordinal)
+            return {"ordinal": ordinal}
+
+        return run
+
+    first = cache.fragment(("a" * 64, 0, "codex", None), build(0))
+    again = cache.fragment(("a" * 64, 0, "codex", None), build(0))
+    cache.fragment(("a" * 64, 0, "codex", "running"), build(0))
+
+    assert again is first
+    assert first.data == b'{"ordinal":0}'
+    assert builds == [0, 0]
+    assert cache.stats().resident_bytes == 2 * len(first.data)
+
+
+def test_disabled_cache_still_serializes():
+    cache = EventFragmentCache(max_bytes=0)
+
+    fragment = cache.fragment(("a" * 64, 0, None, None), lambda: {"id": "e"})
+
+    assert fragment.data == b'{"id":"e"}'
+    assert len(cache) == 0
+
+
+def test_fragment_json_response_keeps_route_headers():
+    injected = Response()
+    injected.headers["Server-Timing"] = "catalog_session;dur=1.0"
+    injected.headers["Cache-Control"] = "no-store"
+
+    rendered = fragment_json_response({"event": SerializedJSON(b'{"id":"e"}')}, response=injected)
+
+    assert rendered.body == b'{"event":{"id":"e"}}'
+    assert rendered.headers["server-timing"] == "catalog_session;dur=1.0"
+    assert rendered.headers["cache-control"] == "no-store"
+    assert rendered.headers["content-type"] == "application/json"
+    assert rendered.headers["content-length"] == str(len(rendered.body))
+
+
+class _Catalog:
+    async def call(self, method, params):
+        return {
+            "found": True,
+            "commit_seq": "8",
+            "session": {"owner_id": "42", "updated_at": "2026-07-12T12:00:00Z"},
+        }
+
+
+@pytest.mark.asyncio
+async def test_serialized_workspace_renders_byte_identical_to_dict_workspace(monkeypatch):
+    session_id = uuid4()
+    session = SimpleNamespace(
+        provider="codex",
+        runtime_display=SimpleNamespace(lifecycle="open"),
+        capabilities=SimpleNamespace(live_control_available=True),
+        model_dump=lambda **_kwargs: {"id": str(session_id), "lifecycle": "open", "capabilities": {}},
+    )
+    events = [
+        {
+            "event_id": "event-1",
+            "cursor": "cursor-1",
+            "timestamp": "2026-07-12T12:00:00+00:00",
+            "role": "user",
+            "content_text": "ship it — 東京",
+            "tool_name": None,
+            "tool_input_json": None,
+            "tool_output_text": None,
+            "tool_call_id": None,
+            "branch_kind": None,
+        },
+        {
+            "event_id": "event-2",
+            "cursor": "cursor-2",
+            "timestamp": "2026-07-12T12:00:01+00:00",
+            "role": "assistant",
+            "content_text": None,
+            "tool_name": "exec_command",
+            "tool_input_json": json.dumps({"cmd": ["bash", "-lc", "make test"]}),
+            "tool_output_text": None,
+            "tool_call_id": "call-2",
+            "branch_kind": None,
+        },
+    ]
+
+    async def read_page(**kwargs):
+        page = {"generation_id": "gen", "events": events, "next_cursor": None, "has_more": False, "total": 2}
+        if kwargs["include_sources"]:
+            page["event_sources"] = [("c" * 64, 0), ("c" * 64, 1)]
+        return page
+
+    monkeypatch.setattr(workspace_module, "get_catalogd_client", lambda: _Catalog())
+    monkeypatch.setattr(workspace_module, "read_live_catalog_session", lambda _session_id, **_kwargs: (session, None, "7"))
+    monkeypatch.setattr(workspace_module, "read_storage_v2_session_events_page", read_page)
+    get_event_fragment_cache().clear()
+
+    async def build(serialized: bool):
+        return await workspace_module.build_storage_v2_workspace(
+            session_id=session_id,
+            owner_id=42,
+            branch_mode="head",
+            limit=50,
+            serialized_events=serialized,
+        )
+
+    plain = await build(False)
+    serialized = await build(True)
+    cached = await build(True)
+
+    assert isinstance(serialized["projection"]["items"][1]["event"], SerializedJSON)
+    assert cached["projection"]["items"][1]["event"] is serialized["projection"]["items"][1]["event"]
+    assert render_json(serialized) == _reference(plain)
+    assert render_json(cached) == _reference(plain)
@@ -19,7 +19,9 @@ import random
 
 import pytest
 
+import zerg.catalogd.fact_reducer as fact_reducer
 from tests_lite._fact_reducer_oracle import BASE_TIME
+from tests_lite._fact_reducer_oracle import bulk_reduce
 from tests_lite._fact_reducer_oracle import coverage_of
 from tests_lite._fact_reducer_oracle import make_fact
 from tests_lite._fact_reducer_oracle import random_batch
@@ -27,7 +29,7 @@ from tests_lite._fact_reducer_oracle import reference_reduce
 from tests_lite._fact_reducer_oracle import run_scenario
 from tests_lite._fact_reducer_oracle import setwise_reduce
 
-CANDIDATE_REDUCERS = [setwise_reduce]
+CANDIDATE_REDUCERS = [setwise_reduce, bulk_reduce]
 
 
 def assert_equivalent(tmp_path, *, name, seed_batches, batch):
@@ -234,6 +236,21 @@ def test_randomized_batches_are_equivalent(tmp_path, seed):
     )
 
 
+@pytest.mark.parametrize("seed", [5, 37])
+def test_chunked_keyed_reads_are_equivalent(tmp_path, monkeypatch, seed):
+    """Chunk boundaries must be invisible: a candidate's rows all land in one chunk."""
+
+    monkeypatch.setattr(fact_reducer, "_CANDIDATE_CHUNK", 2)
+    rng = random.Random(seed)
+    seed_batches = [random_batch(rng, rng.randint(4, 8)) for _ in range(2)]
+    assert_equivalent(
+        tmp_path,
+        name=f"chunked-{seed}",
+        seed_batches=seed_batches,
+        batch=random_batch(rng, 16),
+    )
+
+
 @pytest.mark.parametrize("seed", [23, 29, 31])
 def test_randomized_batches_are_order_independent(tmp_path, seed):
     rng = random.Random(seed)
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from types import SimpleNamespace
 
+import pytest
 from cryptography.fernet import Fernet
 from sqlalchemy import text
 
@@ -646,3 +648,88 @@ def test_readyz_fails_stale_live_writer_with_queued_work(tmp_path, monkeypatch):
 
     assert response.status_code == 503
     assert b"live_write_serializer_stalled" in response.body
+
+
+@pytest.mark.asyncio
+async def test_readyz_serves_snapshot_until_refresh_or_fresh_request(tmp_path, monkeypatch):
+    from zerg.services import health_snapshot
+
+    engine = make_engine(f"sqlite:///{tmp_path}/readyz_snapshot.db")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE VIRTUAL TABLE events_fts USING fts5(content_text)"))
+
+    writer_metrics = {"queue_depth": 0, "writer_active": False, "active_label": None, "active_age_ms": 0.0}
+    reads = {"writer": 0}
+
+    class Writer:
+        is_configured = True
+
+        def get_metrics(self):
+            reads["writer"] += 1
+            return dict(writer_metrics)
+
+    import zerg.database as database_module
+
+    monkeypatch.setattr(database_module, "default_engine", engine)
+    monkeypatch.setattr(database_module, "get_wal_bytes", lambda: 0)
+    monkeypatch.setattr("zerg.services.write_serializer.get_write_serializer", lambda: Writer())
+    health_snapshot.reset_health_aggregator_for_tests()
+    refresh = asyncio.create_task(health_snapshot.get_health_aggregator().run())
+    try:
+        await asyncio.sleep(0)
+        assert health_router.readyz_check() == {"status": "ok"}
+        inline_reads = reads["writer"]
+
+        writer_metrics.update(queue_depth=38, writer_active=True, active_label="ingest-scan")
+        writer_metrics["active_age_ms"] = health_router._write_serializer_stale_active_ms() + 1
+        # Within the probe interval the snapshot answers without re-reading.
+        assert health_router.readyz_check() == {"status": "ok"}
+        assert reads["writer"] == inline_reads
+
+        response = health_router.readyz_check(fresh=True)
+        assert response["status"] == "ready_with_archive_degraded"
+        assert health_router.readyz_check()["status"] == "ready_with_archive_degraded"
+
+        snapshot = health_snapshot.get_health_aggregator().snapshot()
+        assert {"readiness_database", "write_serializer", "archive_wal_bytes"} <= set(snapshot.results)
+    finally:
+        refresh.cancel()
+        await asyncio.gather(refresh, return_exceptions=True)
+        health_snapshot.reset_health_aggregator_for_tests()
+
+
+@pytest.mark.asyncio
+async def test_health_aggregator_refreshes_registered_probes_and_replays_failures():
+    from zerg.services.health_snapshot import HealthAggregator
+
+    aggregator = HealthAggregator()
+    calls = {"count": 0}
+
+    def flaky():
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise ConnectionError("down")
+        return calls["count"]
+
+    # Without a running loop every read is inline.
+    assert aggregator.read("probe", lambda: 1, interval_seconds=60.0).value == 1
+    assert aggregator.snapshot().results == {}
+
+    refresh = asyncio.create_task(aggregator.run())
+    try:
+        await asyncio.sleep(0)
+        first = aggregator.read("probe", flaky, interval_seconds=0.05)
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                first.unwrap()
+        for _ in range(100):
+            if calls["count"] > 1:
+                break
+            await asyncio.sleep(0.02)
+        refreshed = aggregator.read("probe", flaky, interval_seconds=0.05)
+        assert refreshed.unwrap() >= 2
+        assert refreshed.freshness()["age_seconds"] >= 0
+    finally:
+        refresh.cancel()
+        await asyncio.gather(refresh, return_exceptions=True)
+    assert aggregator.running is False
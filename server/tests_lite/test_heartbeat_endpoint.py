@@ -1983,3 +1983,260 @@ def test_heartbeat_empty_resolved_sessions_requires_complete_process_scope(tmp_p
                 assert state.terminal_state is None
     finally:
         api_app_ref.dependency_overrides = {}
+
+
+def _unmanaged_resolved_session(provider_session_id: str, *, phase: str) -> dict[str, object]:
+    return {
+        "provider": "claude",
+        "provider_session_id": provider_session_id,
+        "control_path": "unmanaged",
+        "state": "running",
+        "phase": phase,
+        "workspace": {"cwd": "/Users/test/git/zerg", "label": "zerg"},
+        "process": {"pid": 5000},
+        "bridge": {},
+        "evidence": {"process_observed": True, "transcript_observed": True, "join_keys": []},
+        "reason_codes": [],
+    }
+
+
+def _snapshot_delta(
+    base_sessions: list[dict[str, object]],
+    current_sessions: list[dict[str, object]],
+    *,
+    base_digest: str,
+) -> dict[str, object]:
+    """Encode a delta the way engine/src/heartbeat.rs does."""
+
+    from zerg.services.heartbeat_snapshot_base import wire_session_key
+
+    base_by_key = {wire_session_key(session): session for session in base_sessions}
+    current_keys = {wire_session_key(session) for session in current_sessions}
+    return {
+        "base_digest": base_digest,
+        "upserted_sessions": [session for session in current_sessions if base_by_key.get(wire_session_key(session)) != session],
+        "removed_session_keys": sorted(key for key in base_by_key if key not in current_keys),
+        "session_count": len(current_sessions),
+        "machine_evidence_unchanged": True,
+    }
+
+
+def _snapshot_digest(sessions: list[dict[str, object]]) -> str:
+    from zerg.services.heartbeat_snapshot_base import session_snapshot_digest
+
+    return session_snapshot_digest(sessions, [])
+
+
+def test_session_snapshot_digest_matches_the_engine_test_vector():
+    from zerg.services.heartbeat_snapshot_base import session_snapshot_digest
+
+    session = _unmanaged_resolved_session("thread-0", phase="thinking")
+    session["evidence"]["join_keys"] = ["transcript", "pid"]
+    session["reason_codes"] = ["transcript_recent", "process_alive"]
+    activity = [
+        {
+            "provider": "claude",
+            "session_id": "session-1",
+            "kind": "tool_started",
+            "tool_name": "Bash",
+            "observed_at": "2026-01-01T00:00:00Z",
+        }
+    ]
+
+    # Pinned in engine/src/heartbeat.rs
+    # (`session_snapshot_digest_matches_the_server_test_vector`); a change on
+    # either side must change both, or every delta heartbeat resyncs.
+    assert session_snapshot_digest([session], activity) == "ec21fcb793e91c3de7db2468c508093a164603572f16deff7afad611221547a3"
+
+
+def test_heartbeat_delta_is_reconstructed_against_the_acknowledged_base(tmp_path):
+    from zerg.services.heartbeat_snapshot_base import HEARTBEAT_BASE_ACK_HEADER
+    from zerg.services.heartbeat_snapshot_base import get_heartbeat_snapshot_base_cache
+
+    get_heartbeat_snapshot_base_cache().clear()
+    SessionLocal = _make_db(tmp_path)
+    client, api_app_ref = _make_client(SessionLocal)
+    base_sessions = [_unmanaged_resolved_session(f"thread-{index}", phase="thinking") for index in range(3)]
+    current_sessions = [
+        base_sessions[0],
+        _unmanaged_resolved_session("thread-1", phase="tool_use"),
+        _unmanaged_resolved_session("thread-3", phase="thinking"),
+    ]
+    base_digest = _snapshot_digest(base_sessions)
+    current_digest = _snapshot_digest(current_sessions)
+
+    try:
+        full = client.post(
+            "/api/agents/heartbeat",
+            json={"version": "0.7.0", "sessions_digest": base_digest, "sessions_sequence": 1, "sessions": base_sessions},
+        )
+        assert full.status_code == 204, full.text
+        assert full.headers[HEARTBEAT_BASE_ACK_HEADER] == base_digest
+
+        delta = _snapshot_delta(base_sessions, current_sessions, base_digest=base_digest)
+        assert [session["provider_session_id"] for session in delta["upserted_sessions"]] == ["thread-1", "thread-3"]
+        assert delta["removed_session_keys"] == ["claude||thread-2"]
+
+        response = client.post(
+            "/api/agents/heartbeat",
+            json={"version": "0.7.0", "sessions_digest": current_digest, "sessions_sequence": 2, "snapshot_delta": delta},
+        )
+
+        assert response.status_code == 204, response.text
+        assert response.headers[HEARTBEAT_BASE_ACK_HEADER] == current_digest
+        with SessionLocal() as db:
+            latest = db.query(AgentHeartbeat).order_by(AgentHeartbeat.id.desc()).first()
+            raw = json.loads(latest.raw_json)
+        # The retained row is the full snapshot, indistinguishable from a
+        # heartbeat that had sent every session.
+        assert [(s["provider_session_id"], s["phase"]) for s in raw["sessions"]] == [
+            ("thread-0", "thinking"),
+            ("thread-1", "tool_use"),
+            ("thread-3", "thinking"),
+        ]
+        assert "snapshot_delta" not in raw
+        assert latest.sessions_digest == current_digest
+    finally:
+        api_app_ref.dependency_overrides = {}
+        get_heartbeat_snapshot_base_cache().clear()
+
+
+def test_heartbeat_delta_whose_reconstruction_disagrees_with_its_digest_requires_resync(tmp_path):
+    from zerg.services.heartbeat_snapshot_base import get_heartbeat_snapshot_base_cache
+
+    get_heartbeat_snapshot_base_cache().clear()
+    SessionLocal = _make_db(tmp_path)
+    client, api_app_ref = _make_client(SessionLocal)
+    base_sessions = [_unmanaged_resolved_session("thread-0", phase="thinking")]
+    base_digest = _snapshot_digest(base_sessions)
+    current_sessions = [_unmanaged_resolved_session("thread-0", phase="tool_use")]
+
+    try:
+        full = client.post("/api/agents/heartbeat", json={"sessions_digest": base_digest, "sessions": base_sessions})
+        assert full.status_code == 204, full.text
+
+        # The engine thinks the phase changed but the delta omits the session,
+        # so the server's reconstruction is still the base snapshot. Trusting
+        # the claimed digest here would also make the next repeated-digest
+        # heartbeat skip managed-lease work against the wrong snapshot.
+        delta = _snapshot_delta(base_sessions, base_sessions, base_digest=base_digest)
+        response = client.post(
+            "/api/agents/heartbeat",
+            json={"sessions_digest": _snapshot_digest(current_sessions), "snapshot_delta": delta},
+        )
+
+        assert response.status_code == 409, response.text
+        detail = response.json()["detail"]
+        assert detail["code"] == "heartbeat_resync_required"
+        assert detail["reason"] == "sessions_digest_mismatch"
+        assert detail["acknowledged_digest"] == base_digest
+        with SessionLocal() as db:
+            assert db.query(AgentHeartbeat).count() == 1
+    finally:
+        api_app_ref.dependency_overrides = {}
+        get_heartbeat_snapshot_base_cache().clear()
+
+
+def test_heartbeat_full_snapshot_with_a_foreign_digest_is_not_acknowledged(tmp_path):
+    from zerg.services.heartbeat_snapshot_base import HEARTBEAT_BASE_ACK_HEADER
+    from zerg.services.heartbeat_snapshot_base import get_heartbeat_snapshot_base_cache
+
+    get_heartbeat_snapshot_base_cache().clear()
+    SessionLocal = _make_db(tmp_path)
+    client, api_app_ref = _make_client(SessionLocal)
+
+    try:
+        response = client.post(
+            "/api/agents/heartbeat",
+            json={"sessions_digest": "digest-1", "sessions": [_unmanaged_resolved_session("thread-0", phase="thinking")]},
+        )
+
+        # Older engines keep working; they just never get to send deltas.
+        assert response.status_code == 204, response.text
+        assert HEARTBEAT_BASE_ACK_HEADER not in response.headers
+        assert len(get_heartbeat_snapshot_base_cache()) == 0
+    finally:
+        api_app_ref.dependency_overrides = {}
+        get_heartbeat_snapshot_base_cache().clear()
+
+
+@pytest.mark.parametrize(
+    ("use_acknowledged_base", "session_count", "reason"),
+    [
+        (False, 1, "digest_mismatch"),
+        (True, 5, "session_count_mismatch"),
+    ],
+)
+def test_heartbeat_delta_against_a_divergent_base_requires_resync(tmp_path, use_acknowledged_base, session_count, reason):
+    from zerg.services.heartbeat_snapshot_base import get_heartbeat_snapshot_base_cache
+
+    get_heartbeat_snapshot_base_cache().clear()
+    SessionLocal = _make_db(tmp_path)
+    client, api_app_ref = _make_client(SessionLocal)
+    base_sessions = [_unmanaged_resolved_session("thread-0", phase="thinking")]
+    base_digest = _snapshot_digest(base_sessions)
+
+    try:
+        full = client.post("/api/agents/heartbeat", json={"sessions_digest": base_digest, "sessions": base_sessions})
+        assert full.status_code == 204, full.text
+
+        response = client.post(
+            "/api/agents/heartbeat",
+            json={
+                "sessions_digest": base_digest,
+                "snapshot_delta": {
+                    "base_digest": base_digest if use_acknowledged_base else "digest-unknown",
+                    "session_count": session_count,
+                },
+            },
+        )
+
+        assert response.status_code == 409, response.text
+        detail = response.json()["detail"]
+        assert detail["code"] == "heartbeat_resync_required"
+        assert detail["reason"] == reason
+        assert detail["acknowledged_digest"] == base_digest
+        with SessionLocal() as db:
+            assert db.query(AgentHeartbeat).count() == 1
+    finally:
+        api_app_ref.dependency_overrides = {}
+        get_heartbeat_snapshot_base_cache().clear()
+
+
+def test_heartbeat_delta_without_a_base_requires_resync(tmp_path):
+    from zerg.services.heartbeat_snapshot_base import get_heartbeat_snapshot_base_cache
+
+    get_heartbeat_snapshot_base_cache().clear()
+    SessionLocal = _make_db(tmp_path)
+    client, api_app_ref = _make_client(SessionLocal)
+
+    try:
+        response = client.post(
+            "/api/agents/heartbeat",
+            json={"sessions_digest": "digest-2", "snapshot_delta": {"base_digest": "digest-1", "session_count": 0}},
+        )
+
+        assert response.status_code == 409, response.text
+        assert response.json()["detail"]["reason"] == "missing_base"
+        assert response.json()["detail"]["acknowledged_digest"] is None
+    finally:
+        api_app_ref.dependency_overrides = {}
+
+
+def test_heartbeat_delta_cannot_also_carry_sessions(tmp_path):
+    SessionLocal = _make_db(tmp_path)
+    client, api_app_ref = _make_client(SessionLocal)
+
+    try:
+        response = client.post(
+            "/api/agents/heartbeat",
+            json={
+                "sessions_digest": "digest-2",
+                "sessions": [],
+                "snapshot_delta": {"base_digest": "digest-1", "session_count": 0},
+            },
+        )
+
+        assert response.status_code == 422, response.text
+    finally:
+        api_app_ref.dependency_overrides = {}
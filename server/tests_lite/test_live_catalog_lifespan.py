@@ -255,3 +255,77 @@ async def test_lifespan_stops_searchd_and_catalogd_when_later_startup_fails(monk
 
     assert calls[:2] == ["catalogd_start", "searchd_start"]
     assert calls[-4:] == ["raw_stop", "render_stop", "searchd_stop", "catalogd_stop"]
+
+
+@pytest.mark.asyncio
+async def test_http_worker_lifespan_attaches_to_control_daemons_and_starts_no_background_loops(monkeypatch):
+    calls: list[str] = []
+    monkeypatch.setenv("TESTING", "0")
+    monkeypatch.setenv("LONGHOUSE_PROCESS_ROLE", "http")
+
+    def forbidden(name):
+        def fail(*_args, **_kwargs):
+            raise AssertionError(f"HTTP worker started {name}")
+
+        return fail
+
+    async def start_catalogd(*, spawn=True):
+        calls.append(f"catalogd_attach spawn={spawn}")
+        return {"ready": True}
+
+    async def start_searchd(*, spawn=True):
+        calls.append(f"searchd_attach spawn={spawn}")
+        return {"ready": True}
+
+    def follow_mirror(name):
+        async def follow():
+            calls.append(f"{name}_follow")
+            await asyncio.Event().wait()
+
+        return follow
+
+    class StorageWorkers:
+        async def start(self):
+            calls.append("workers_start")
+
+    async def noop_async(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setattr(lifespan_module, "live_catalog_enabled", lambda: True)
+    monkeypatch.setattr(lifespan_module, "configure_observability", lambda: None)
+    monkeypatch.setattr(lifespan_module, "shutdown_observability", lambda: None)
+    monkeypatch.setattr(lifespan_module, "_validate_models_config_startup", lambda: None)
+    monkeypatch.setattr(lifespan_module, "_enforce_single_tenant_startup", forbidden("single-tenant bootstrap"))
+    monkeypatch.setattr(lifespan_module._settings, "testing", False)
+    monkeypatch.setattr(lifespan_module, "get_settings", lambda: lifespan_module._settings)
+    monkeypatch.setattr(database_module, "start_wal_checkpoint_loop", forbidden("the WAL checkpoint loop"))
+    monkeypatch.setattr(database_module, "stop_wal_checkpoint_loop", noop_async)
+    monkeypatch.setattr("zerg.services.catalogd_supervisor.start_catalogd_supervisor", start_catalogd)
+    monkeypatch.setattr("zerg.services.catalogd_supervisor.stop_catalogd_supervisor", noop_async)
+    monkeypatch.setattr("zerg.services.searchd_supervisor.start_searchd_supervisor", start_searchd)
+    monkeypatch.setattr("zerg.services.searchd_supervisor.stop_searchd_supervisor", noop_async)
+    monkeypatch.setattr("zerg.services.raw_object_workers.get_raw_object_worker_pool", lambda: StorageWorkers())
+    monkeypatch.setattr("zerg.services.raw_object_workers.close_raw_object_worker_pool", noop_async)
+    monkeypatch.setattr("zerg.services.render_object_workers.get_render_object_worker_pool", lambda: StorageWorkers())
+    monkeypatch.setattr("zerg.services.render_object_workers.close_render_object_worker_pool", noop_async)
+    monkeypatch.setattr("zerg.services.search_v2_projector.start_search_v2_projector", forbidden("a projector"))
+    monkeypatch.setattr("zerg.services.semantic_v2_projector.start_semantic_v2_projector", forbidden("a projector"))
+    monkeypatch.setattr("zerg.services.live_control_catalog.run_live_catalog_input_recovery_loop", forbidden("input recovery"))
+    monkeypatch.setattr("zerg.services.storage_session_titles.run_storage_title_reconciler", forbidden("the title reconciler"))
+    monkeypatch.setattr("zerg.services.maintenance.start_maintenance_loop", forbidden("maintenance"))
+    monkeypatch.setattr("zerg.services.maintenance.stop_maintenance_loop", noop_async)
+    monkeypatch.setattr("zerg.services.machine_control_channel.follow_machine_control_snapshots", follow_mirror("machine_control"))
+    monkeypatch.setattr("zerg.services.runner_connection_manager.follow_runner_connection_snapshots", follow_mirror("runner"))
+    monkeypatch.setattr("zerg.websocket.manager.topic_manager.shutdown", noop_async)
+    monkeypatch.setattr("zerg.tools.mcp_adapter.MCPManager.shutdown_stdio_processes", noop_async)
+
+    app = FastAPI()
+    async with lifespan_module.lifespan(app):
+        # The mirrors subscribe before the broker link asks for replay.
+        assert calls[:2] == ["machine_control_follow", "runner_follow"]
+        assert calls[2:4] == ["catalogd_attach spawn=False", "searchd_attach spawn=False"]
+        assert sorted(calls[4:]) == ["workers_start", "workers_start"]
+        assert getattr(app.state, "embedding_initializer_task", None) is None
+
+    assert app.state.machine_control_mirror_task is None
+    assert app.state.runner_connection_mirror_task is None
@@ -23,6 +23,7 @@ from zerg.machine_evidence import canonical_evidence_hash
 from zerg.models.live_store import LiveInteractionRequest
 from zerg.models.live_store import LiveLaunchReadiness
 from zerg.models.live_store import LiveRuntimeState
+from zerg.models.live_store import LiveSession as LiveStoreSession
 from zerg.models.live_store import LiveSessionCatalog
 from zerg.models.live_store import LiveSessionConnection
 from zerg.models.live_store import LiveSessionRun
@@ -35,6 +36,7 @@ from zerg.services.live_catalog_timeline import project_catalog_session_facts
 from zerg.services.live_catalog_timeline import project_catalog_sessions_snapshot
 from zerg.services.live_catalog_timeline import project_catalog_timeline_snapshot
 from zerg.services.live_catalog_timeline import read_live_catalog_session
+from zerg.services.session_listing_types import SessionListingError
 from zerg.services.session_views import SessionResponse
 from zerg.services.timeline_session_listing import TimelineSessionListParams
 
@@ -86,7 +88,7 @@ def test_timeline_card_signature_ignores_global_commit_coordinates():
     }
 
     def card(value):
-        return SimpleNamespace(model_dump=lambda mode: deepcopy(value))
+        return SimpleNamespace(**deepcopy(value))
 
     baseline = _timeline_card_signature(card(payload))
     advanced = deepcopy(payload)
@@ -526,6 +528,131 @@ def test_canonical_timeline_projects_all_rows_at_snapshot_commit(monkeypatch):
     assert captured["params"]["limit"] == 20
 
 
+def _seed_keyset_sessions(db, now: datetime) -> dict[str, str]:
+    """Owner 1 sessions with tied anchors, one unread and one live-owned row."""
+
+    ids = sorted(str(uuid4()) for _ in range(13))
+    kinds: dict[str, str] = {}
+    for index, session_id in enumerate(ids[:10]):
+        kinds[session_id] = "owned"
+        activity = now - timedelta(minutes=index // 2)
+        db.add(_keyset_storage_row(session_id, owner_id="1", activity=activity, now=now))
+    unread, live_owned, foreign = ids[10:]
+    kinds[unread] = "unread"
+    row = _keyset_storage_row(unread, owner_id="1", activity=now - timedelta(days=40), now=now)
+    row.last_console_result_at = now - timedelta(days=40)
+    db.add(row)
+    kinds[live_owned] = "live_owned"
+    db.add(_keyset_storage_row(live_owned, owner_id=None, activity=now - timedelta(minutes=2), now=now))
+    db.add(live_store_session(live_owned, owner_id="1", now=now))
+    db.add(_keyset_storage_row(foreign, owner_id="2", activity=now, now=now))
+    db.commit()
+    return kinds
+
+
+def _keyset_storage_row(session_id: str, *, owner_id: str | None, activity: datetime, now: datetime) -> StorageSession:
+    return StorageSession(
+        session_id=session_id,
+        tenant_id="tenant-a",
+        owner_id=owner_id,
+        provider="codex",
+        environment="production",
+        machine_id="cinder",
+        project="longhouse",
+        started_at=activity,
+        last_activity_at=activity,
+        user_messages=1,
+        transcript_revision=1,
+        raw_state="durable",
+        render_state="ready",
+        commit_seq=1,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def live_store_session(session_id: str, *, owner_id: str, now: datetime) -> LiveStoreSession:
+    return LiveStoreSession(session_id=session_id, owner_id=owner_id, provider="codex", last_seen_at=now, updated_at=now)
+
+
+def _owner_page(db, **kwargs):
+    return CatalogStore(db.get_bind()).list_session_timeline(
+        project=None,
+        provider=None,
+        environment=None,
+        include_test=False,
+        hide_autonomous=True,
+        include_automation=False,
+        device_id=None,
+        days_back=14,
+        owner_id=1,
+        include_state_heads=True,
+        **kwargs,
+    )
+
+
+def _page_ids(snapshot) -> list[str]:
+    return [row["facts"]["catalog"]["session_id"] for row in snapshot["rows"]]
+
+
+def test_timeline_keyset_pages_match_offset_order(tmp_path):
+    engine = make_live_engine(f"sqlite:///{tmp_path / 'keyset.db'}")
+    initialize_catalog_schema(engine)
+    LiveSession = make_sessionmaker(engine)
+    now = datetime.now(timezone.utc)
+    with LiveSession() as db:
+        kinds = _seed_keyset_sessions(db, now)
+        ranked = _page_ids(_owner_page(db, limit=50, offset=0))
+
+        walked: list[str] = []
+        cursor = None
+        totals = []
+        while True:
+            page = _owner_page(db, limit=4, offset=0, cursor=cursor)
+            totals.append(page["total"])
+            walked.extend(_page_ids(page))
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        offset_pages = [_page_ids(_owner_page(db, limit=4, offset=offset)) for offset in range(4, 12, 4)]
+
+    assert len(ranked) == 12
+    assert ranked[0] == next(session_id for session_id, kind in kinds.items() if kind == "unread")
+    assert "foreign" not in {kinds.get(session_id, "foreign") for session_id in ranked}
+    assert walked == ranked
+    assert totals == [12, None, None]
+    assert offset_pages == [ranked[4:8], ranked[8:12]]
+
+
+def test_timeline_cursor_token_carries_total_and_rejects_other_filters(monkeypatch):
+    keyset = {"unread": 0, "order_at": "2026-10-01T12:00:00", "session_id": str(uuid4())}
+    captured: list[dict] = []
+
+    def canonical(params, *, owner_id):
+        captured.append(dict(params))
+        return {
+            "commit_seq": "1",
+            "observed_at": datetime.now(timezone.utc).isoformat(),
+            "rows": [],
+            "total": 40 if "cursor" not in params else None,
+            "has_real_sessions": True,
+            "next_cursor": keyset,
+        }
+
+    monkeypatch.setattr(live_catalog_timeline, "canonical_timeline_snapshot", canonical)
+
+    first = list_live_catalog_timeline(params=_params(limit=4), owner_id=7)
+    second = list_live_catalog_timeline(params=_params(limit=4, cursor=first.next_cursor), owner_id=7)
+
+    assert captured[1]["cursor"] == keyset
+    assert (first.total, second.total) == (40, 40)
+    with pytest.raises(SessionListingError) as raised:
+        list_live_catalog_timeline(params=_params(limit=4, project="other", cursor=first.next_cursor), owner_id=7)
+    assert raised.value.status_code == 400
+    with pytest.raises(SessionListingError):
+        list_live_catalog_timeline(params=_params(cursor="not-a-cursor"), owner_id=7)
+
+
 def test_canonical_timeline_fails_closed_on_truncated_heads():
     snapshot = {
         "commit_seq": "31",
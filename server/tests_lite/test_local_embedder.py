@@ -199,3 +199,136 @@ def test_pinned_production_graph_matches_the_golden_vector():
     assert actual.shape == expected.shape == (ACTIVE_EMBEDDING_DIMS,)
     np.testing.assert_allclose(actual, expected, rtol=2e-4, atol=2e-4)
     assert np.isclose(np.linalg.norm(actual), 1.0, atol=1e-5)
+
+
+class _CountingEmbedder:
+    ready = True
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def embed_queries(self, texts):
+        self.calls.append(list(texts))
+        return np.tile(np.array([[1, 0, 0, 0]], dtype="float32"), (len(texts), 1))
+
+
+def _install_cached_embedder(monkeypatch, *, space_id="space-a", cache=None):
+    import zerg.services.local_embedder as local_embedder_module
+
+    embedder = _CountingEmbedder()
+    monkeypatch.setattr(local_embedder_module, "_embedder", embedder)
+    monkeypatch.setattr(local_embedder_module, "_embedder_space_id", space_id)
+    monkeypatch.setattr(local_embedder_module, "_query_cache", cache or local_embedder_module.QueryEmbeddingCache(max_entries=8))
+    local_embedder_module._query_cache.bind_space(space_id)
+    return embedder
+
+
+def test_repeated_query_is_served_from_the_cache_without_a_forward_pass(monkeypatch):
+    import asyncio
+
+    from zerg.services import local_embedder as local_embedder_module
+
+    embedder = _install_cached_embedder(monkeypatch)
+
+    first = asyncio.run(local_embedder_module.embed_query("find  the\tthing "))
+    second = asyncio.run(local_embedder_module.embed_query("find the thing"))
+
+    assert embedder.calls == [["find the thing"]]
+    assert np.array_equal(first, second)
+    # Every caller shares the cached array, so none of them may mutate it.
+    assert second.flags.writeable is False
+    stats = local_embedder_module.get_query_embedding_cache().stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_query_cache_keeps_case_because_the_tokenizer_does():
+    from zerg.services.local_embedder import normalize_query_text
+
+    assert normalize_query_text("  Kopia backup\n") == "Kopia backup"
+    assert normalize_query_text("Kopia") != normalize_query_text("kopia")
+
+
+def test_query_cache_evicts_least_recently_used_and_expires_by_ttl():
+    from zerg.services.local_embedder import QueryEmbeddingCache
+
+    now = [0.0]
+    cache = QueryEmbeddingCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+    cache.bind_space("s")
+    vector = np.ones(DIMS, dtype="float32")
+    cache.put("s", "a", vector)
+    cache.put("s", "b", vector)
+    assert cache.get("s", "a") is not None
+    cache.put("s", "c", vector)
+    assert cache.get("s", "b") is None
+    assert cache.get("s", "a") is not None
+
+    now[0] = 11.0
+    assert cache.get("s", "c") is None
+    stats = cache.stats()
+    assert (stats.evictions, stats.expired, stats.entries) == (1, 1, 1)
+
+
+def test_query_cache_drops_vectors_from_a_retired_embedding_space():
+    from zerg.services.local_embedder import QueryEmbeddingCache
+
+    cache = QueryEmbeddingCache(max_entries=4)
+    cache.bind_space("old")
+    cache.put("old", "q", np.ones(DIMS, dtype="float32"))
+    cache.bind_space("new")
+
+    assert cache.get("new", "q") is None
+    # A forward pass that started under the old space must not repopulate it.
+    cache.put("old", "q", np.ones(DIMS, dtype="float32"))
+    assert cache.stats().entries == 0
+    assert cache.stats().invalidations == 1
+
+
+def test_disabled_query_cache_always_runs_the_model_on_the_raw_text(monkeypatch):
+    import asyncio
+
+    from zerg.services import local_embedder as local_embedder_module
+
+    embedder = _install_cached_embedder(monkeypatch, cache=local_embedder_module.QueryEmbeddingCache(max_entries=0))
+
+    asyncio.run(local_embedder_module.embed_query("find\tthe  thing"))
+    asyncio.run(local_embedder_module.embed_query("find\tthe  thing"))
+
+    # Without the cache there is no key to agree with, so the model input is
+    # exactly what the caller sent.
+    assert embedder.calls == [["find\tthe  thing"], ["find\tthe  thing"]]
+
+
+def test_initializing_a_different_embedding_space_invalidates_cached_queries(monkeypatch):
+    import asyncio
+
+    from zerg.models_config import EmbeddingSpaceConfig
+    from zerg.services import local_embedder as local_embedder_module
+
+    def stub_load(self):
+        self._session = _StubSession([[1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]])
+        self._tokenizer = _StubTokenizer()
+        self._embedding_output = 0
+
+    monkeypatch.setattr(local_embedder_module.LocalEmbedder, "load", stub_load)
+    monkeypatch.setattr(local_embedder_module, "_embedder", None)
+    monkeypatch.setattr(local_embedder_module, "_embedder_space_id", None)
+    monkeypatch.setattr(local_embedder_module, "_query_cache", local_embedder_module.QueryEmbeddingCache(max_entries=8))
+    old_space = EmbeddingSpaceConfig(provider="local-onnx", model="model-a", dims=DIMS)
+    same_space = EmbeddingSpaceConfig(provider="local-onnx", model="model-a", dims=DIMS)
+    new_space = EmbeddingSpaceConfig(provider="local-onnx", model="model-a", dims=8)
+    assert local_embedder_module.embedding_space_id(old_space) != local_embedder_module.embedding_space_id(new_space)
+
+    local_embedder_module.initialize_local_embedder(old_space, "/nonexistent")
+    asyncio.run(local_embedder_module.embed_query("q"))
+    cache = local_embedder_module.get_query_embedding_cache()
+    assert cache.stats().entries == 1
+
+    # Reloading the same space keeps vectors that are still exact.
+    local_embedder_module.initialize_local_embedder(same_space, "/nonexistent")
+    assert cache.stats().entries == 1
+
+    local_embedder_module.initialize_local_embedder(new_space, "/nonexistent")
+    assert cache.stats().entries == 0
+    assert cache.stats().space_id == local_embedder_module.embedding_space_id(new_space)
+    assert asyncio.run(local_embedder_module.embed_query("q")).shape == (8,)
@@ -0,0 +1,152 @@
+"""Tests for the pubsub-driven managed-local turn event waiter."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("TESTING", "1")
+
+import zerg.services.managed_local_event_polling as polling
+from zerg.services.session_pubsub import get_pubsub
+from zerg.services.session_pubsub import reset_pubsub_for_test
+from zerg.services.session_pubsub import topic_session
+
+
+@pytest.fixture(autouse=True)
+def _fresh_pubsub():
+    reset_pubsub_for_test()
+    yield
+    reset_pubsub_for_test()
+
+
+def _event(role: str, text: str):
+    return SimpleNamespace(role=role, content_text=text, tool_name=None)
+
+
+def _install_store(monkeypatch, stored: list) -> list[float]:
+    reads: list[float] = []
+
+    def fetch(*, db_bind, session_id, after_event_id):
+        reads.append(asyncio.get_running_loop().time())
+        return list(stored)
+
+    monkeypatch.setattr(polling, "fetch_managed_local_events_since", fetch)
+    return reads
+
+
+@pytest.mark.asyncio
+async def test_waiter_reads_once_after_an_ingest_burst_settles(monkeypatch):
+    stored: list = []
+    reads = _install_store(monkeypatch, stored)
+    session_id = uuid4()
+    topic = topic_session(str(session_id))
+
+    waiter = asyncio.create_task(
+        polling.await_managed_local_turn_events(
+            db_bind=None,
+            session_id=session_id,
+            after_event_id=0,
+            expected_user_message="ship it",
+            timeout_secs=5.0,
+            poll_interval_secs=0.05,
+        )
+    )
+    await asyncio.sleep(0.02)
+    bus = get_pubsub()
+    bus.publish(topic, {"kind": "runtime", "session_id": str(session_id)})
+    await asyncio.sleep(0.1)
+    assert len(reads) == 1
+
+    stored.append(_event("user", "ship it"))
+    bus.publish(topic, {"kind": "ingest", "session_id": str(session_id)})
+    await asyncio.sleep(0.02)
+    stored.append(_event("assistant", "shipped"))
+    bus.publish(topic, {"kind": "ingest", "session_id": str(session_id)})
+
+    events = await asyncio.wait_for(waiter, timeout=1.0)
+
+    assert [event.content_text for event in events] == ["ship it", "shipped"]
+    assert len(reads) == 2
+
+
+@pytest.mark.asyncio
+async def test_waiter_keeps_waiting_for_the_expected_turn_and_times_out_quietly(monkeypatch):
+    stored = [_event("user", "older prompt"), _event("assistant", "older reply")]
+    reads = _install_store(monkeypatch, stored)
+    monkeypatch.setattr(polling, "MANAGED_LOCAL_RECHECK_INTERVAL_SECS", 60.0)
+    session_id = uuid4()
+
+    async def publish_unrelated_ingest() -> None:
+        await asyncio.sleep(0.02)
+        get_pubsub().publish(topic_session(str(session_id)), {"kind": "ingest"})
+
+    publisher = asyncio.create_task(publish_unrelated_ingest())
+    events = await polling.await_managed_local_turn_events(
+        db_bind=None,
+        session_id=session_id,
+        after_event_id=0,
+        expected_user_message="ship it",
+        timeout_secs=0.2,
+        poll_interval_secs=0.02,
+    )
+    await publisher
+
+    assert events == []
+    assert len(reads) == 2
+
+
+@pytest.mark.asyncio
+async def test_waiter_rechecks_the_db_when_no_publication_arrives(monkeypatch):
+    stored: list = []
+    reads = _install_store(monkeypatch, stored)
+    monkeypatch.setattr(polling, "MANAGED_LOCAL_RECHECK_INTERVAL_SECS", 0.05)
+
+    async def write_without_publishing() -> None:
+        await asyncio.sleep(0.02)
+        stored.append(_event("assistant", "from another worker"))
+
+    writer = asyncio.create_task(write_without_publishing())
+    events = await polling.await_managed_local_turn_events(
+        db_bind=None,
+        session_id=uuid4(),
+        after_event_id=0,
+        timeout_secs=1.0,
+    )
+    await writer
+
+    assert [event.content_text for event in events] == ["from another worker"]
+    # The backstop read found the turn; a re-read one quiet period later
+    # confirmed nothing else was still landing.
+    assert len(reads) == 3
+
+
+@pytest.mark.asyncio
+async def test_entry_read_waits_for_a_landing_turn_to_settle(monkeypatch):
+    stored = [_event("user", "ship it"), _event("assistant", "working")]
+    reads = _install_store(monkeypatch, stored)
+    session_id = uuid4()
+
+    async def finish_the_turn() -> None:
+        await asyncio.sleep(0.02)
+        stored.append(_event("assistant", "shipped"))
+        get_pubsub().publish(topic_session(str(session_id)), {"kind": "ingest"})
+
+    finisher = asyncio.create_task(finish_the_turn())
+    events = await polling.await_managed_local_turn_events(
+        db_bind=None,
+        session_id=session_id,
+        after_event_id=0,
+        expected_user_message="ship it",
+        timeout_secs=1.0,
+        poll_interval_secs=0.05,
+    )
+    await finisher
+
+    assert [event.content_text for event in events] == ["ship it", "working", "shipped"]
+    assert len(reads) == 3
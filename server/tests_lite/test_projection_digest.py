@@ -0,0 +1,69 @@
+"""Structural digests used by the session streams' change detection."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from datetime import timezone
+
+from pydantic import BaseModel
+
+from zerg.services.projection_digest import changed_fields
+from zerg.services.projection_digest import field_digests
+from zerg.services.projection_digest import structural_digest
+
+
+class _State(BaseModel):
+    commit_seq: int
+    activity: dict[str, str]
+
+
+class _Projection(BaseModel):
+    id: str
+    runtime_version: int
+    observed_at: datetime
+    session_state: _State
+
+
+def _projection(**overrides) -> _Projection:
+    values = {
+        "id": "s-1",
+        "runtime_version": 41,
+        "observed_at": datetime(2026, 7, 14, 5, 0, tzinfo=timezone.utc),
+        "session_state": _State(commit_seq=41, activity={"state": "idle"}),
+    }
+    values.update(overrides)
+    return _Projection(**values)
+
+
+def test_digest_follows_json_equality_and_honours_exclusions():
+    exclude = {"runtime_version": None, "session_state": {"commit_seq": None}}
+    baseline = structural_digest(_projection(), exclude=exclude)
+
+    advanced = _projection(runtime_version=42, session_state=_State(commit_seq=42, activity={"state": "idle"}))
+    assert structural_digest(advanced, exclude=exclude) == baseline
+    assert structural_digest(advanced) != structural_digest(_projection())
+
+    changed = _projection(session_state=_State(commit_seq=41, activity={"state": "thinking"}))
+    assert structural_digest(changed, exclude=exclude) != baseline
+    assert structural_digest({"flag": True}) != structural_digest({"flag": 1})
+    assert structural_digest({"a": [1, 2]}) != structural_digest({"a": [2, 1]})
+
+
+def test_shared_subtrees_are_digested_once_per_walk():
+    shared = _projection()
+    card = {"head": shared, "detail": shared, "root": shared}
+    memo: dict = {}
+
+    digest = structural_digest(card, memo=memo)
+
+    assert digest == structural_digest({"head": _projection(), "detail": _projection(), "root": _projection()})
+    assert sum(1 for key in memo if key[0] == id(shared)) == 1
+
+
+def test_changed_fields_reports_added_changed_and_dropped_keys():
+    before = field_digests({"session_id": "s-1", "phase": "thinking", "title": "A", "commit_seq": "1"}, exclude={"commit_seq"})
+    after = field_digests({"session_id": "s-1", "title": "B", "mode": "helm", "commit_seq": "2"}, exclude={"commit_seq"})
+
+    assert changed_fields(before, before) == set()
+    assert changed_fields(before, after) == {"phase", "title", "mode"}
+    assert changed_fields(None, after) == {"session_id", "title", "mode"}
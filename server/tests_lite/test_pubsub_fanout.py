@@ -0,0 +1,166 @@
+"""Tests for cross-process session pubsub fan-out through the pubsub broker."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("TESTING", "1")
+
+from zerg.pubsubd.server import PubsubBroker
+from zerg.services.pubsub_fanout import PubsubBrokerLink
+from zerg.services.session_pubsub import SessionPubsub
+
+
+@pytest.fixture
+def socket_path():
+    # pytest's tmp_path can exceed the 104-byte Unix socket limit.
+    with tempfile.TemporaryDirectory(prefix="lhps-") as directory:
+        yield Path(directory) / "pubsub.sock"
+
+
+async def _started_broker(socket_path: Path, **options) -> tuple[PubsubBroker, asyncio.Task]:
+    broker = PubsubBroker(socket_path=socket_path, **options)
+    await broker.start()
+    return broker, asyncio.create_task(broker.serve_forever())
+
+
+async def _stop_broker(broker: PubsubBroker, task: asyncio.Task) -> None:
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    await broker.close()
+
+
+async def _worker(socket_path: Path, bus: SessionPubsub | None = None) -> tuple[SessionPubsub, PubsubBrokerLink]:
+    bus = bus or SessionPubsub()
+    link = PubsubBrokerLink(socket_path=socket_path, bus=bus)
+    assert await link.start(ready_timeout_seconds=2.0)
+    return bus, link
+
+
+@pytest.mark.asyncio
+async def test_publish_on_one_worker_reaches_every_worker_with_one_seq(socket_path):
+    broker, task = await _started_broker(socket_path)
+    first, first_link = await _worker(socket_path)
+    second, second_link = await _worker(socket_path)
+    try:
+        with first.subscribe("session:abc") as on_first, second.subscribe("session:abc") as on_second:
+            assert first.publish("session:abc", {"kind": "ingest", "n": 1}) is None
+            second.publish("session:abc", {"kind": "ingest", "n": 2})
+
+            received = [await on_first.next_message(timeout=1.0), await on_first.next_message(timeout=1.0)]
+            mirrored = [await on_second.next_message(timeout=1.0), await on_second.next_message(timeout=1.0)]
+
+        assert [(m.seq, m.payload["n"]) for m in received] == [(1, 1), (2, 2)]
+        assert [(m.seq, m.payload["n"]) for m in mirrored] == [(1, 1), (2, 2)]
+        assert first.peek_latest_seq("session:abc") == second.peek_latest_seq("session:abc") == 2
+        assert broker.snapshot()["workers"] == 2
+    finally:
+        await first_link.stop()
+        await second_link.stop()
+        await _stop_broker(broker, task)
+
+
+@pytest.mark.asyncio
+async def test_late_worker_replays_subscribed_rings_and_answers_replay_gap_identically(socket_path):
+    broker, task = await _started_broker(socket_path, buffer_size=3)
+    early, early_link = await _worker(socket_path)
+    try:
+        for n in range(5):
+            early.publish("timeline", {"kind": "ingest", "n": n})
+            early.publish("session:abc", {"kind": "ingest", "n": n})
+        while early.peek_latest_seq("session:abc") < 5:
+            await asyncio.sleep(0.01)
+
+        late = SessionPubsub()
+        with late.subscribe("timeline"):
+            late, late_link = await _worker(socket_path, late)
+            try:
+                assert late.peek_latest_seq("timeline") == 5
+                assert late.peek_latest_seq("session:abc") == 0
+                for since_seq in (1, 2, 5, 9):
+                    assert late.replay_gap("timeline", since_seq=since_seq) == early.replay_gap("timeline", since_seq=since_seq)
+                with late.subscribe("timeline", since_seq=3) as replay:
+                    assert [(await replay.next_message(timeout=1.0)).payload["n"] for _ in range(2)] == [3, 4]
+
+                with late.subscribe("session:abc") as live:
+                    early.publish("session:abc", {"kind": "ingest", "n": 5})
+                    assert (await live.next_message(timeout=1.0)).seq == 6
+                gap = late.replay_gap("session:abc", since_seq=2)
+                assert gap is not None and gap.reason == "cursor_too_old"
+            finally:
+                await late_link.stop()
+    finally:
+        await early_link.stop()
+        await _stop_broker(broker, task)
+
+
+@pytest.mark.asyncio
+async def test_broker_restart_resets_sequences_and_flushes_queued_publishes(socket_path):
+    broker, task = await _started_broker(socket_path)
+    bus, link = await _worker(socket_path)
+    try:
+        bus.publish("session:abc", {"kind": "ingest", "n": 1})
+        while bus.peek_latest_seq("session:abc") < 1:
+            await asyncio.sleep(0.01)
+        first_epoch = link.epoch
+
+        await _stop_broker(broker, task)
+        while link.connected:
+            await asyncio.sleep(0.01)
+        bus.publish("session:abc", {"kind": "ingest", "n": 2})
+
+        broker, task = await _started_broker(socket_path)
+        with bus.subscribe("session:abc") as subscription:
+            message = await subscription.next_message(timeout=3.0)
+
+        assert link.epoch != first_epoch
+        assert (message.seq, message.payload["n"]) == (1, 2)
+        gap = bus.replay_gap("session:abc", since_seq=7)
+        assert gap is not None and gap.reason == "cursor_ahead"
+    finally:
+        await link.stop()
+        await _stop_broker(broker, task)
+
+
+@pytest.mark.asyncio
+async def test_broker_evicts_idle_and_excess_topics_without_reusing_seqs(socket_path):
+    now = [0.0]
+    broker, task = await _started_broker(socket_path, idle_topic_seconds=60.0, max_topics=2, clock=lambda: now[0])
+    bus, link = await _worker(socket_path)
+    try:
+        with bus.subscribe("session:a") as on_a:
+            bus.publish("session:a", {"n": 1})
+            bus.publish("session:a", {"n": 2})
+            seqs = [(await on_a.next_message(timeout=1.0)).seq for _ in range(2)]
+            now[0] = 120.0
+            bus.publish("session:b", {"n": 3})
+            bus.publish("session:a", {"n": 4})
+            seqs.append((await on_a.next_message(timeout=1.0)).seq)
+        assert seqs[:2] == [1, 2] and seqs[2] > 2
+        assert broker.snapshot()["evicted_topics"] == 1
+
+        bus.publish("session:c", {"n": 5})
+        while bus.peek_latest_seq("session:c") == 0:
+            await asyncio.sleep(0.01)
+        assert broker.snapshot()["topics"] == 2
+        assert broker.snapshot()["evicted_topics"] == 2
+    finally:
+        await link.stop()
+        await _stop_broker(broker, task)
+
+
+def test_without_a_transport_publish_stays_local_and_returns_the_seq():
+    bus = SessionPubsub()
+
+    assert bus.publish("timeline", {"kind": "ingest"}) == 1
+    assert bus.deliver("timeline", 1, {"kind": "ingest"}) is False
+    assert bus.deliver("timeline", 4, {"kind": "ingest"}) is True
+    assert bus.publish("timeline", {"kind": "ingest"}) == 5
+    gap = bus.replay_gap("timeline", since_seq=1)
+    assert gap is not None and gap.reason == "cursor_too_old"
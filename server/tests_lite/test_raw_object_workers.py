@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import asyncio
+from multiprocessing import shared_memory
 from uuid import uuid4
 
 import pytest
 
-from zerg.services.raw_object_workers import RawObjectWorkerPool
 from zerg.services.raw_object_workers import RawObjectWorkerBusy
 from zerg.services.raw_object_workers import RawObjectWorkerError
+from zerg.services.raw_object_workers import RawObjectWorkerPool
 from zerg.storage_v2.raw_objects import RawObjectSpec
 from zerg.storage_v2.raw_objects import RawRecord
 
@@ -83,3 +84,66 @@ async def test_admission_is_bounded_and_repair_has_reserved_capacity(tmp_path):
                 pass
     finally:
         await pool.close()
+
+
+def _large_spec(record_count: int, record_bytes: int) -> RawObjectSpec:
+    records = tuple(
+        RawRecord(source_position=index * record_bytes, data=bytes([65 + index % 26]) * (record_bytes - 1) + b"\n")
+        for index in range(record_count)
+    )
+    return RawObjectSpec(
+        tenant_id="single",
+        machine_id="cinder",
+        session_id=uuid4(),
+        provider="codex",
+        opaque_source_id="history.jsonl",
+        source_epoch=uuid4(),
+        range_kind="byte_offset",
+        range_start=0,
+        range_end=record_count * record_bytes,
+        records=records,
+    )
+
+
+@pytest.mark.asyncio
+async def test_shared_memory_transfer_streams_records_and_releases_the_segment(tmp_path):
+    pool = RawObjectWorkerPool(
+        tmp_path,
+        live_workers=1,
+        repair_workers=1,
+        queue_multiplier=1,
+        read_transfer="shared_memory",
+        shared_memory_min_bytes=1024,
+    )
+    try:
+        spec = _large_spec(8, 4096)
+        sealed = await pool.seal(spec, lane="live")
+        async with pool.open_records(sealed.object_path, sealed.object_hash, spec.tenant_id) as records:
+            assert records.shared is True
+            assert records.spec.records == ()
+            assert records.envelope_id == sealed.envelope_id
+            assert list(records.record_data()) == [record.data for record in spec.records]
+            segment_name = records._segment.name
+        with pytest.raises(FileNotFoundError):
+            shared_memory.SharedMemory(name=segment_name)
+
+        small = _spec()
+        small_sealed = await pool.seal(small, lane="live")
+        async with pool.open_records(small_sealed.object_path, small_sealed.object_hash, small.tenant_id) as records:
+            assert records.shared is False
+            assert list(records.record_data()) == [b"hello\n"]
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pickle_transfer_streams_the_same_records(tmp_path):
+    pool = RawObjectWorkerPool(tmp_path, live_workers=1, repair_workers=1, queue_multiplier=1)
+    try:
+        spec = _large_spec(4, 4096)
+        sealed = await pool.seal(spec, lane="live")
+        async with pool.open_records(sealed.object_path, sealed.object_hash, spec.tenant_id) as records:
+            assert records.shared is False
+            assert list(records.record_data()) == [record.data for record in spec.records]
+    finally:
+        await pool.close()
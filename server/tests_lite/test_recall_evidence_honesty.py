@@ -30,6 +30,10 @@ def _timing() -> dict[str, float | int]:
     return {"admit_ms": 0.0, "sql_ms": 0.1, "active_readers": 1, "queued_readers": 0}
 
 
+def _contexts(*evidence: dict[str, object]) -> dict[str, object]:
+    return {"evidence": list(evidence), "timing": _timing()}
+
+
 def _coverage() -> dict[str, object]:
     return {
         "complete": True,
@@ -214,17 +218,18 @@ async def test_semantic_match_with_a_locator_hydrates(monkeypatch):
     generation_id = str(uuid4())
     seen: dict = {}
 
-    async def fake_context(**kwargs):
-        seen.update(kwargs)
-        return {
-            "evidence_status": "complete",
-            "evidence_reason": None,
-            "context": [_context_row("the migration applied cleanly")],
-            "total_events": 590,
-            "timing": _timing(),
-        }
+    async def fake_contexts(**kwargs):
+        seen.update(kwargs["locators"][0])
+        return _contexts(
+            {
+                "evidence_status": "complete",
+                "evidence_reason": None,
+                "context": [_context_row("the migration applied cleanly")],
+                "total_events": 590,
+            }
+        )
 
-    monkeypatch.setattr(agents_search, "search_storage_v2_context", fake_context)
+    monkeypatch.setattr(agents_search, "search_storage_v2_contexts", fake_contexts)
 
     match = RecallMatch(
         session_id=session_id,
@@ -233,8 +238,8 @@ async def test_semantic_match_with_a_locator_hydrates(monkeypatch):
         generation_id=generation_id,
         start_order_time_us=1785605093280000,
     )
-    await agents_search._hydrate_recall_match(
-        match,
+    await agents_search._hydrate_recall_matches(
+        [match],
         owner_id=42,
         context_turns=2,
         timeout_seconds=5.0,
@@ -252,17 +257,18 @@ async def test_lexical_match_still_locates_by_event_id(monkeypatch):
     """A match holding both locators must use the event id, not the position."""
     seen: dict = {}
 
-    async def fake_context(**kwargs):
-        seen.update(kwargs)
-        return {
-            "evidence_status": "complete",
-            "evidence_reason": None,
-            "context": [],
-            "total_events": 12,
-            "timing": _timing(),
-        }
+    async def fake_contexts(**kwargs):
+        seen.update(kwargs["locators"][0])
+        return _contexts(
+            {
+                "evidence_status": "complete",
+                "evidence_reason": None,
+                "context": [],
+                "total_events": 12,
+            }
+        )
 
-    monkeypatch.setattr(agents_search, "search_storage_v2_context", fake_context)
+    monkeypatch.setattr(agents_search, "search_storage_v2_contexts", fake_contexts)
 
     match = RecallMatch(
         session_id=str(uuid4()),
@@ -272,7 +278,7 @@ async def test_lexical_match_still_locates_by_event_id(monkeypatch):
         match_event_id=4459411,
         start_order_time_us=1785605093280000,
     )
-    await agents_search._hydrate_recall_match(match, owner_id=42, context_turns=2, timeout_seconds=5.0)
+    await agents_search._hydrate_recall_matches([match], owner_id=42, context_turns=2, timeout_seconds=5.0)
 
     assert seen["search_event_id"] == 4459411
     assert seen["start_order_time_us"] is None
@@ -282,13 +288,13 @@ async def test_lexical_match_still_locates_by_event_id(monkeypatch):
 async def test_match_without_any_locator_reports_why(monkeypatch):
     """An episode embedded before locators existed cannot borrow another event's position."""
 
-    async def fake_context(**kwargs):  # pragma: no cover - must not be called
+    async def fake_contexts(**kwargs):  # pragma: no cover - must not be called
         raise AssertionError("hydration must not be attempted without a locator")
 
-    monkeypatch.setattr(agents_search, "search_storage_v2_context", fake_context)
+    monkeypatch.setattr(agents_search, "search_storage_v2_contexts", fake_contexts)
 
     match = RecallMatch(session_id=str(uuid4()), chunk_index=0, score=0.58, generation_id=str(uuid4()))
-    await agents_search._hydrate_recall_match(match, owner_id=42, context_turns=2, timeout_seconds=5.0)
+    await agents_search._hydrate_recall_matches([match], owner_id=42, context_turns=2, timeout_seconds=5.0)
 
     assert match.evidence_status == "unavailable"
     assert match.evidence_reason == "search_hit_missing_locator"
@@ -298,10 +304,10 @@ async def test_match_without_any_locator_reports_why(monkeypatch):
 async def test_absent_store_status_fails_the_strict_contract(monkeypatch):
     """A malformed response is an error, not evidence that hydration partially worked."""
 
-    async def fake_context(**kwargs):
-        return {"context": [], "total_events": 0}
+    async def fake_contexts(**kwargs):
+        return _contexts({"context": [], "total_events": 0})
 
-    monkeypatch.setattr(agents_search, "search_storage_v2_context", fake_context)
+    monkeypatch.setattr(agents_search, "search_storage_v2_contexts", fake_contexts)
 
     match = RecallMatch(
         session_id=str(uuid4()),
@@ -311,21 +317,22 @@ async def test_absent_store_status_fails_the_strict_contract(monkeypatch):
         match_event_id=99,
     )
     with pytest.raises(ValueError):
-        await agents_search._hydrate_recall_match(match, owner_id=42, context_turns=2, timeout_seconds=5.0)
+        await agents_search._hydrate_recall_matches([match], owner_id=42, context_turns=2, timeout_seconds=5.0)
 
 
 @pytest.mark.asyncio
 async def test_malformed_context_turn_fails_the_strict_contract(monkeypatch):
-    async def fake_context(**_kwargs):
-        return {
-            "evidence_status": "complete",
-            "evidence_reason": None,
-            "context": [{**_context_row("the answer"), "unexpected": True}],
-            "total_events": 1,
-            "timing": _timing(),
-        }
-
-    monkeypatch.setattr(agents_search, "search_storage_v2_context", fake_context)
+    async def fake_contexts(**_kwargs):
+        return _contexts(
+            {
+                "evidence_status": "complete",
+                "evidence_reason": None,
+                "context": [{**_context_row("the answer"), "unexpected": True}],
+                "total_events": 1,
+            }
+        )
+
+    monkeypatch.setattr(agents_search, "search_storage_v2_contexts", fake_contexts)
     match = RecallMatch(
         session_id=str(uuid4()),
         chunk_index=0,
@@ -334,7 +341,7 @@ async def test_malformed_context_turn_fails_the_strict_contract(monkeypatch):
         match_event_id=99,
     )
     with pytest.raises(ValueError):
-        await agents_search._hydrate_recall_match(match, owner_id=42, context_turns=2, timeout_seconds=5.0)
+        await agents_search._hydrate_recall_matches([match], owner_id=42, context_turns=2, timeout_seconds=5.0)
 
 
 @pytest.mark.asyncio
@@ -347,20 +354,21 @@ async def test_semantic_match_carries_evidence_beside_its_context(monkeypatch):
     skip a match whose evidence was sitting in the very next field.
     """
 
-    async def fake_context(**_kwargs):
-        return {
-            "evidence_status": "complete",
-            "evidence_reason": None,
-            "context": [
-                _context_row("earlier turn, before the anchor", order_time_us=100, role="user"),
-                _context_row("the anchored episode text", order_time_us=200),
-                _context_row("later turn", order_time_us=300, role="user"),
-            ],
-            "total_events": 42,
-            "timing": _timing(),
-        }
-
-    monkeypatch.setattr(agents_search, "search_storage_v2_context", fake_context)
+    async def fake_contexts(**_kwargs):
+        return _contexts(
+            {
+                "evidence_status": "complete",
+                "evidence_reason": None,
+                "context": [
+                    _context_row("earlier turn, before the anchor", order_time_us=100, role="user"),
+                    _context_row("the anchored episode text", order_time_us=200),
+                    _context_row("later turn", order_time_us=300, role="user"),
+                ],
+                "total_events": 42,
+            }
+        )
+
+    monkeypatch.setattr(agents_search, "search_storage_v2_contexts", fake_contexts)
 
     match = RecallMatch(
         session_id=str(uuid4()),
@@ -369,7 +377,7 @@ async def test_semantic_match_carries_evidence_beside_its_context(monkeypatch):
         generation_id=str(uuid4()),
         start_order_time_us=200,
     )
-    await agents_search._hydrate_recall_match(match, owner_id=42, context_turns=2, timeout_seconds=5.0)
+    await agents_search._hydrate_recall_matches([match], owner_id=42, context_turns=2, timeout_seconds=5.0)
 
     assert match.evidence == "the anchored episode text"
     assert match.context_text == "the anchored episode text"
@@ -377,16 +385,17 @@ async def test_semantic_match_carries_evidence_beside_its_context(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_lexical_snippet_is_not_overwritten_by_the_anchor(monkeypatch):
-    async def fake_context(**_kwargs):
-        return {
-            "evidence_status": "complete",
-            "evidence_reason": None,
-            "context": [_context_row("neighbour text", order_time_us=200)],
-            "total_events": 42,
-            "timing": _timing(),
-        }
+    async def fake_contexts(**_kwargs):
+        return _contexts(
+            {
+                "evidence_status": "complete",
+                "evidence_reason": None,
+                "context": [_context_row("neighbour text", order_time_us=200)],
+                "total_events": 42,
+            }
+        )
 
-    monkeypatch.setattr(agents_search, "search_storage_v2_context", fake_context)
+    monkeypatch.setattr(agents_search, "search_storage_v2_contexts", fake_contexts)
 
     match = RecallMatch(
         session_id=str(uuid4()),
@@ -396,27 +405,28 @@ async def test_lexical_snippet_is_not_overwritten_by_the_anchor(monkeypatch):
         match_event_id=17,
         evidence="the matched fts snippet",
     )
-    await agents_search._hydrate_recall_match(match, owner_id=42, context_turns=2, timeout_seconds=5.0)
+    await agents_search._hydrate_recall_matches([match], owner_id=42, context_turns=2, timeout_seconds=5.0)
 
     assert match.evidence == "the matched fts snippet"
 
 
 @pytest.mark.asyncio
 async def test_lexical_match_without_a_snippet_uses_its_exact_context_event(monkeypatch):
-    async def fake_context(**_kwargs):
-        return {
-            "evidence_status": "complete",
-            "evidence_reason": None,
-            "context": [
-                _context_row("earlier neighbour", order_time_us=16),
-                _context_row("the exact lexical match", order_time_us=17),
-                _context_row("later neighbour", order_time_us=18),
-            ],
-            "total_events": 42,
-            "timing": _timing(),
-        }
-
-    monkeypatch.setattr(agents_search, "search_storage_v2_context", fake_context)
+    async def fake_contexts(**_kwargs):
+        return _contexts(
+            {
+                "evidence_status": "complete",
+                "evidence_reason": None,
+                "context": [
+                    _context_row("earlier neighbour", order_time_us=16),
+                    _context_row("the exact lexical match", order_time_us=17),
+                    _context_row("later neighbour", order_time_us=18),
+                ],
+                "total_events": 42,
+            }
+        )
+
+    monkeypatch.setattr(agents_search, "search_storage_v2_contexts", fake_contexts)
     match = RecallMatch(
         session_id=str(uuid4()),
         chunk_index=0,
@@ -425,7 +435,54 @@ async def test_lexical_match_without_a_snippet_uses_its_exact_context_event(monk
         match_event_id=17,
     )
 
-    await agents_search._hydrate_recall_match(match, owner_id=42, context_turns=2, timeout_seconds=5.0)
+    await agents_search._hydrate_recall_matches([match], owner_id=42, context_turns=2, timeout_seconds=5.0)
 
     assert match.evidence == "the exact lexical match"
     assert match.context_text == "the exact lexical match"
+
+
+@pytest.mark.asyncio
+async def test_ranked_matches_hydrate_in_one_read_and_keep_their_own_evidence(monkeypatch):
+    """Every locatable match shares one searchd call; each still gets its own status."""
+    calls: list[list[dict]] = []
+
+    async def fake_contexts(**kwargs):
+        calls.append(kwargs["locators"])
+        return _contexts(
+            {
+                "evidence_status": "complete",
+                "evidence_reason": None,
+                "context": [_context_row("first neighbour", order_time_us=7)],
+                "total_events": 3,
+            },
+            {"evidence_status": "unavailable", "evidence_reason": "hit_not_published", "context": [], "total_events": 0},
+        )
+
+    monkeypatch.setattr(agents_search, "search_storage_v2_contexts", fake_contexts)
+    published = RecallMatch(session_id=str(uuid4()), chunk_index=0, score=0.5, generation_id=str(uuid4()), match_event_id=7)
+    unlocated = RecallMatch(session_id=str(uuid4()), chunk_index=0, score=0.4, generation_id=str(uuid4()))
+    vanished = RecallMatch(session_id=str(uuid4()), chunk_index=2, score=0.3, generation_id=str(uuid4()), start_order_time_us=40)
+
+    await agents_search._hydrate_recall_matches(
+        [published, unlocated, vanished],
+        owner_id=42,
+        context_turns=2,
+        timeout_seconds=5.0,
+    )
+
+    assert len(calls) == 1
+    assert [locator["session_id"] for locator in calls[0]] == [published.session_id, vanished.session_id]
+    assert (published.evidence_status, published.total_events) == ("complete", 3)
+    assert (unlocated.evidence_status, unlocated.evidence_reason) == ("unavailable", "search_hit_missing_locator")
+    assert (vanished.evidence_status, vanished.evidence_reason) == ("unavailable", "hit_not_published")
+
+
+@pytest.mark.asyncio
+async def test_misaligned_batch_evidence_fails_the_strict_contract(monkeypatch):
+    async def fake_contexts(**_kwargs):
+        return _contexts()
+
+    monkeypatch.setattr(agents_search, "search_storage_v2_contexts", fake_contexts)
+    match = RecallMatch(session_id=str(uuid4()), chunk_index=0, score=0.4, generation_id=str(uuid4()), match_event_id=99)
+    with pytest.raises(ValueError):
+        await agents_search._hydrate_recall_matches([match], owner_id=42, context_turns=2, timeout_seconds=5.0)
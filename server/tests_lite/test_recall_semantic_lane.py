@@ -47,9 +47,9 @@ def _complete_catalog_projection(monkeypatch):
     monkeypatch.setattr(agents_search, "_require_projection_coverage", complete)
 
 
-async def _noop_hydrate(match, **_kwargs):
-    match.evidence_status = "not_requested"
-    return match
+async def _noop_hydrate(matches, **_kwargs):
+    for match in matches:
+        match.evidence_status = "not_requested"
 
 
 async def _recall(*, mode: str):
@@ -415,10 +415,8 @@ async def test_auto_mode_serves_lexical_when_the_dense_lane_is_down(monkeypatch)
     string search, which is exactly what they did.
     """
 
-    lexical_hit = _match(str(uuid4()), 0.8)
-
-    async def lexical(**_kwargs):
-        return [lexical_hit]
+    session_id = str(uuid4())
+    seen: dict[str, object] = {}
 
     async def dense(**_kwargs):
         raise agents_search.HTTPException(
@@ -426,13 +424,37 @@ async def test_auto_mode_serves_lexical_when_the_dense_lane_is_down(monkeypatch)
             detail={"code": "embedder_unavailable", "message": "The local embedding model is not loaded."},
         )
 
-    monkeypatch.setattr(agents_search, "_lexical_recall_matches", lexical)
-    monkeypatch.setattr(agents_search, "_semantic_recall", dense)
-    monkeypatch.setattr(agents_search, "_hydrate_recall_match", _noop_hydrate)
+    async def fused(**kwargs):
+        seen.update(kwargs)
+        return agents_search._FusedRecallPayload.model_validate(
+            {
+                "matches": [
+                    {
+                        "session_id": session_id,
+                        "lane": "lexical",
+                        "hit": {"session_id": session_id, "rank": -4.0, "record_ordinal": 0},
+                        "score": 1 / 61,
+                        "lanes": ["lexical"],
+                        "lane_ranks": {"lexical": 1},
+                        "evidence": None,
+                    }
+                ],
+                "served_lanes": ["lexical"],
+                "lane_errors": [],
+                "dense": None,
+                "evidence_error": None,
+                "stage_timing": {"lexical_ms": 1.0, "dense_ms": None, "fuse_ms": 0.1, "hydrate_ms": None},
+            }
+        )
+
+    monkeypatch.setattr(agents_search, "_prepare_dense_query", dense)
+    monkeypatch.setattr(agents_search, "search_storage_v2_recall", fused)
 
     response = await _recall(mode="auto")
 
-    assert [match.session_id for match in response.matches] == [lexical_hit.session_id]
+    # Lexical still ran, in the one searchd call, without a dense query.
+    assert seen["dense_query"] is None
+    assert [match.session_id for match in response.matches] == [session_id]
     assert response.lanes == ["lexical"]
     # The caller must be able to tell a narrower answer from a complete one.
     assert [failure.lane for failure in response.degraded] == ["dense"]
@@ -440,6 +462,49 @@ async def test_auto_mode_serves_lexical_when_the_dense_lane_is_down(monkeypatch)
     assert response.coverage is None
 
 
+@pytest.mark.asyncio
+async def test_auto_mode_reports_a_dense_fault_raised_inside_searchd(monkeypatch):
+    """searchd's lane errors read exactly like the per-lane RPC faults did."""
+
+    session_id = str(uuid4())
+
+    async def prepared(**_kwargs):
+        return agents_search._DenseQuery(embedding=b"\0" * 16, catalog_coverage=_catalog_coverage())
+
+    async def fused(**_kwargs):
+        return agents_search._FusedRecallPayload.model_validate(
+            {
+                "matches": [
+                    {
+                        "session_id": session_id,
+                        "lane": "lexical",
+                        "hit": {"session_id": session_id, "rank": -4.0, "record_ordinal": 0},
+                        "score": 1 / 61,
+                        "lanes": ["lexical"],
+                        "lane_ranks": {"lexical": 1},
+                        "evidence": None,
+                    }
+                ],
+                "served_lanes": ["lexical"],
+                "lane_errors": [{"lane": "dense", "code": "embedding_coverage_incomplete", "reason": "store_binding_mismatch"}],
+                "dense": None,
+                "evidence_error": None,
+                "stage_timing": {"lexical_ms": 1.0, "dense_ms": 0.5, "fuse_ms": 0.1, "hydrate_ms": None},
+            }
+        )
+
+    monkeypatch.setattr(agents_search, "_prepare_dense_query", prepared)
+    monkeypatch.setattr(agents_search, "search_storage_v2_recall", fused)
+
+    response = await _recall(mode="auto")
+
+    assert response.lanes == ["lexical"]
+    assert response.matches[0].evidence_status == "not_requested"
+    assert [(failure.lane, failure.code, failure.reason) for failure in response.degraded] == [
+        ("dense", "embedding_coverage_incomplete", "store_binding_mismatch")
+    ]
+
+
 @pytest.mark.asyncio
 async def test_semantic_mode_still_fails_when_its_only_lane_is_down(monkeypatch):
     """A caller who named one lane gets that lane's fault, not an empty success."""
@@ -451,7 +516,7 @@ async def test_semantic_mode_still_fails_when_its_only_lane_is_down(monkeypatch)
         )
 
     monkeypatch.setattr(agents_search, "_semantic_recall", dense)
-    monkeypatch.setattr(agents_search, "_hydrate_recall_match", _noop_hydrate)
+    monkeypatch.setattr(agents_search, "_hydrate_recall_matches", _noop_hydrate)
 
     with pytest.raises(agents_search.HTTPException) as failure:
         await _recall(mode="semantic")
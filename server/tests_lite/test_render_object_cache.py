@@ -0,0 +1,143 @@
+"""Tests for the decoded render-object cache in front of the render worker pool."""
+
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID
+
+import pytest
+
+from zerg.services.render_object_cache import DecodedRenderObjectCache
+from zerg.services.render_object_workers import RenderObjectWorkerPool
+from zerg.storage_v2.render_objects import DecodedRenderObject
+from zerg.storage_v2.render_objects import RenderObjectSpec
+from zerg.storage_v2.render_objects import RenderRecord
+from zerg.storage_v2.render_objects import seal_render_object
+
+
+def _spec(text: str = "hello") -> RenderObjectSpec:
+    return RenderObjectSpec(
+        session_id=UUID("018f0c3a-7b2d-7f10-8a11-123456789abc"),
+        render_generation=UUID("018f0c3a-7b2d-7f10-8a11-223456789abc"),
+        parser_revision="engine-parser-v2",
+        ordering_revision="semantic-order-v2",
+        machine_id="cinder",
+        provider="codex",
+        opaque_source_id="history.jsonl",
+        source_epoch=UUID("018f0c3a-7b2d-7f10-8a11-323456789abc"),
+        source_envelope_id="a" * 64,
+        records=(
+            RenderRecord(
+                event_id="user-1",
+                order_time_us=1_700_000_000_000_000,
+                source_position=0,
+                event_subordinal=0,
+                role="user",
+                content_text=text,
+            ),
+        ),
+    )
+
+
+def _decoded(object_hash: str, *, size: int = 100) -> DecodedRenderObject:
+    return DecodedRenderObject(spec=_spec(), object_hash=object_hash, payload_hash="b" * 64, payload_size=size)
+
+
+class _CountingReader:
+    def __init__(self, *, size: int = 100, delay: float = 0.0) -> None:
+        self.calls: list[str] = []
+        self._size = size
+        self._delay = delay
+
+    def loader(self, object_hash: str):
+        async def read() -> tuple[DecodedRenderObject, float]:
+            self.calls.append(object_hash)
+            if self._delay:
+                await asyncio.sleep(self._delay)
+            return _decoded(object_hash, size=self._size), 0.02
+
+        return read
+
+
+@pytest.mark.asyncio
+async def test_repeated_reads_are_served_from_cache_and_count_saved_decode_time():
+    cache = DecodedRenderObjectCache(max_bytes=1_000)
+    reader = _CountingReader()
+
+    first = await cache.load("a" * 64, reader.loader("a" * 64))
+    second = await cache.load("a" * 64, reader.loader("a" * 64))
+
+    assert second is first
+    assert reader.calls == ["a" * 64]
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.resident_bytes) == (1, 1, 100)
+    assert stats.decode_seconds_saved == pytest.approx(0.02)
+    assert stats.hit_ratio == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_worker_read():
+    cache = DecodedRenderObjectCache(max_bytes=1_000)
+    reader = _CountingReader(delay=0.01)
+
+    results = await asyncio.gather(*(cache.load("a" * 64, reader.loader("a" * 64)) for _ in range(5)))
+
+    assert reader.calls == ["a" * 64]
+    assert all(result is results[0] for result in results)
+    assert cache.stats().joined == 4
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_fail_joined_readers():
+    cache = DecodedRenderObjectCache(max_bytes=1_000)
+    reader = _CountingReader(delay=0.02)
+
+    leader = asyncio.create_task(cache.load("a" * 64, reader.loader("a" * 64)))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.load("a" * 64, reader.loader("a" * 64)))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    decoded = await follower
+    assert decoded.object_hash == "a" * 64
+    assert reader.calls == ["a" * 64]
+
+
+@pytest.mark.asyncio
+async def test_failed_and_non_filling_reads_are_not_stored():
+    cache = DecodedRenderObjectCache(max_bytes=1_000)
+
+    async def failing() -> tuple[DecodedRenderObject, float]:
+        raise RuntimeError("corrupt")
+
+    with pytest.raises(RuntimeError):
+        await cache.load("a" * 64, failing)
+    await cache.load("b" * 64, _CountingReader().loader("b" * 64), fill=False)
+
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_reads_each_object_once_through_the_cache(tmp_path):
+    sealed = seal_render_object(tmp_path, _spec())
+    cache = DecodedRenderObjectCache(max_bytes=1_000_000)
+    pool = RenderObjectWorkerPool(
+        tmp_path,
+        live_workers=1,
+        repair_workers=1,
+        user_read_workers=1,
+        queue_multiplier=1,
+        decoded_cache=cache,
+    )
+    try:
+        background = await pool.read(sealed.object_path, sealed.object_hash, lane="background")
+        first = await pool.read(sealed.object_path, sealed.object_hash, lane="user")
+        second = await pool.read(sealed.object_path, sealed.object_hash, lane="user")
+    finally:
+        await pool.close()
+
+    assert background.spec == first.spec == _spec()
+    assert second is first
+    stats = cache.stats()
+    assert (stats.hits, stats.misses) == (1, 2)
+    assert stats.resident_bytes == first.payload_size > 0
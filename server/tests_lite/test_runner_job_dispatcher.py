@@ -204,3 +204,131 @@ async def test_dispatch_job_reclaims_stale_active_job(monkeypatch):
     assert dispatcher.can_accept_job(runner_id) is True
     with dispatcher._pending_lock:
         assert stale_job.id not in dispatcher._pending_jobs
+
+
+class _StandInRunner:
+    """Connection manager stand-in that records exec requests without answering."""
+
+    def __init__(self, dispatcher: RunnerJobDispatcher, monkeypatch, *, complete_from_thread: bool = False):
+        self.dispatcher = dispatcher
+        self.sent: list[dict] = []
+        self.complete_from_thread = complete_from_thread
+        next_id = iter(range(1, 1000))
+        monkeypatch.setattr("zerg.services.runner_job_dispatcher.get_runner_connection_manager", lambda: self)
+        monkeypatch.setattr(
+            "zerg.services.runner_job_dispatcher.runner_crud.create_runner_job",
+            lambda **kwargs: SimpleNamespace(id=f"job-{next(next_id)}"),
+        )
+        monkeypatch.setattr("zerg.services.runner_job_dispatcher.runner_crud.update_job_started", lambda *args, **kwargs: None)
+        monkeypatch.setattr("zerg.services.runner_job_dispatcher.runner_crud.update_job_timeout", lambda *args, **kwargs: None)
+        monkeypatch.setattr(
+            "zerg.services.runner_job_dispatcher.runner_crud.get_job",
+            lambda _db, job_id: SimpleNamespace(id=job_id, status="running", started_at=utc_now_naive(), created_at=None, timeout_secs=60),
+        )
+
+    def is_online(self, owner_id: int, runner_id: int) -> bool:
+        return True
+
+    async def send_to_runner(self, *, owner_id: int, runner_id: int, message: dict) -> bool:
+        self.sent.append(message)
+        if self.complete_from_thread:
+            threading.Thread(target=self.finish, args=(runner_id, message["job_id"])).start()
+        return True
+
+    def finish(self, runner_id: int, job_id: str) -> None:
+        self.dispatcher.complete_job(job_id, {"ok": True, "data": {"job_id": job_id}}, runner_id=runner_id)
+
+    def dispatch(self, command: str, *, run_id: str | None = None, timeout_secs: float = 5) -> asyncio.Task:
+        return asyncio.create_task(
+            self.dispatcher.dispatch_job(db=None, owner_id=1, runner_id=7, command=command, timeout_secs=timeout_secs, run_id=run_id)
+        )
+
+
+@pytest.mark.asyncio
+async def test_dispatch_runs_jobs_concurrently_up_to_advertised_slots(monkeypatch):
+    dispatcher = RunnerJobDispatcher()
+    runner = _StandInRunner(dispatcher, monkeypatch)
+    dispatcher.set_runner_slots(7, 2)
+
+    tasks = [runner.dispatch(f"cmd-{index}") for index in range(3)]
+    await asyncio.sleep(0.05)
+
+    assert [message["command"] for message in runner.sent] == ["cmd-0", "cmd-1"]
+    assert len(dispatcher.get_active_job_ids(7)) == 2
+
+    runner.finish(7, runner.sent[0]["job_id"])
+    await asyncio.sleep(0.05)
+    assert [message["command"] for message in runner.sent] == ["cmd-0", "cmd-1", "cmd-2"]
+
+    for message in runner.sent[1:]:
+        runner.finish(7, message["job_id"])
+    results = await asyncio.gather(*tasks)
+    assert all(result["ok"] for result in results)
+    assert dispatcher.can_accept_job(7) is True
+
+
+@pytest.mark.asyncio
+async def test_queued_dispatches_alternate_between_runs(monkeypatch):
+    dispatcher = RunnerJobDispatcher()
+    runner = _StandInRunner(dispatcher, monkeypatch)
+    dispatcher.set_runner_slots(7, 1)
+    dispatcher.mark_job_active(7, "job-busy")
+
+    tasks = []
+    for command, run_id in (("a1", "run-a"), ("a2", "run-a"), ("a3", "run-a"), ("b1", "run-b")):
+        tasks.append(runner.dispatch(command, run_id=run_id))
+        await asyncio.sleep(0)
+    await asyncio.sleep(0.05)
+    assert runner.sent == []
+    assert dispatcher.can_accept_job(7) is False
+
+    dispatcher.complete_job("job-busy", {"ok": True}, runner_id=7)
+    for _ in tasks:
+        await asyncio.sleep(0.05)
+        runner.finish(7, runner.sent[-1]["job_id"])
+    await asyncio.gather(*tasks)
+
+    assert [message["command"] for message in runner.sent] == ["a1", "b1", "a2", "a3"]
+
+
+@pytest.mark.asyncio
+async def test_queued_dispatch_times_out_and_leaves_the_queue(monkeypatch):
+    dispatcher = RunnerJobDispatcher()
+    runner = _StandInRunner(dispatcher, monkeypatch)
+    dispatcher.mark_job_active(7, "job-busy")
+
+    result = await runner.dispatch("late", timeout_secs=0.05)
+
+    assert result["ok"] is False
+    assert "no job slot freed" in result["error"]["message"]
+    assert runner.sent == []
+    dispatcher.clear_active_job(7, expected_job_id="job-busy")
+    assert dispatcher.can_accept_job(7) is True
+
+
+@pytest.mark.asyncio
+async def test_runner_disconnect_fails_queued_dispatches(monkeypatch):
+    dispatcher = RunnerJobDispatcher()
+    runner = _StandInRunner(dispatcher, monkeypatch)
+    dispatcher.set_runner_slots(7, 1)
+    dispatcher.mark_job_active(7, "job-busy")
+
+    task = runner.dispatch("queued")
+    await asyncio.sleep(0.05)
+    dispatcher.runner_disconnected(7)
+
+    result = await task
+    assert result["error"]["message"] == "Runner is offline"
+    assert runner.sent == []
+
+
+@pytest.mark.asyncio
+async def test_completion_from_another_thread_wakes_dispatch(monkeypatch):
+    dispatcher = RunnerJobDispatcher()
+    runner = _StandInRunner(dispatcher, monkeypatch, complete_from_thread=True)
+    dispatcher.set_runner_slots(7, 4)
+
+    results = await asyncio.wait_for(asyncio.gather(*(runner.dispatch(f"cmd-{index}") for index in range(8))), timeout=5)
+
+    assert [result["data"]["job_id"] for result in results] == [f"job-{index}" for index in range(1, 9)]
+    assert dispatcher.get_active_job_ids(7) == []
@@ -0,0 +1,98 @@
+"""Sampling profiler aggregation, tagging and admin surface."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from zerg.routers import admin
+from zerg.services import sampling_profiler
+from zerg.services.sampling_profiler import SamplingProfiler
+
+
+def _busy_endpoint(started: threading.Event, stop: threading.Event) -> None:
+    started.set()
+    while not stop.is_set():
+        sum(range(200))
+
+
+@pytest.fixture
+def busy_thread():
+    started, stop = threading.Event(), threading.Event()
+    thread = threading.Thread(target=_busy_endpoint, args=(started, stop), name="busy-worker_3")
+    thread.start()
+    started.wait(timeout=5)
+    yield thread
+    stop.set()
+    thread.join(timeout=5)
+
+
+def _sample_until(profiler: SamplingProfiler, predicate) -> None:
+    for _ in range(200):
+        profiler.sample_once()
+        if predicate():
+            return
+    raise AssertionError("sampler never observed the expected stack")
+
+
+def test_samples_are_tagged_with_route_writer_and_thread(busy_thread, monkeypatch):
+    writer = SimpleNamespace(name="archive", active_label="ingest", active_worker_thread_id=busy_thread.ident, writer_active=True)
+    monkeypatch.setattr("zerg.services.write_serializer.get_write_serializer", lambda: writer)
+    profiler = SamplingProfiler()
+    profiler.register_routes([SimpleNamespace(path="/busy", methods={"GET"}, endpoint=_busy_endpoint)])
+
+    _sample_until(profiler, lambda: profiler.window(tag="route:GET /busy").stacks)
+
+    profile = profiler.window(tag="writer:archive/ingest")
+    (key,) = {key for key in profile.stacks if key.route == "GET /busy"}
+    assert key.thread == "busy-worker"
+    assert any(frame.startswith("_busy_endpoint (") for frame in key.frames)
+    assert "thread:busy-worker;route:GET /busy;writer:archive/ingest;" in profile.folded()
+    summary = profile.summary(limit=50)
+    assert {"tag": "route:GET /busy", "samples": sum(profile.stacks.values())} in summary["tags"]
+
+
+def test_parked_threads_count_as_idle_without_stacks():
+    parked = threading.Event()
+    thread = threading.Thread(target=parked.wait, name="parked")
+    thread.start()
+    try:
+        profiler = SamplingProfiler()
+        profiler.sample_once()
+    finally:
+        parked.set()
+        thread.join(timeout=5)
+
+    profile = profiler.window()
+    assert profile.idle_samples >= 1
+    assert not [key for key in profile.stacks if key.thread == "parked"]
+
+
+def test_window_rolls_old_buckets_out(busy_thread):
+    now = [1_000.0]
+    profiler = SamplingProfiler(window_seconds=60, clock=lambda: now[0])
+    _sample_until(profiler, lambda: profiler.window().stacks)
+
+    now[0] += 30
+    assert profiler.window().stacks
+    assert not profiler.window(seconds=10).stacks
+
+    now[0] += 60
+    assert profiler.window().samples == 0
+
+
+def test_admin_profiler_reports_the_answering_process(busy_thread, monkeypatch):
+    profiler = SamplingProfiler()
+    monkeypatch.setattr(sampling_profiler, "_profiler", profiler)
+    _sample_until(profiler, lambda: profiler.window().stacks)
+
+    body = admin.get_profiler_summary(seconds=None, tag="thread:busy-worker", limit=50)
+
+    assert body["status"]["running"] is False
+    assert body["status"]["process_role"] == "all"
+    assert body["profile"]["busy_samples"] >= 1
+    assert any(row["frame"].startswith("_busy_endpoint (") for row in body["profile"]["top_total"])
+    folded = admin.get_profiler_folded(seconds=None, tag="thread:busy-worker").body.decode()
+    assert folded.startswith("thread:busy-worker;")
@@ -20,8 +20,12 @@ from zerg.catalogd.client import CatalogRemoteError
 from zerg.catalogd.client import CatalogUnavailable
 from zerg.embedding_space import ACTIVE_EMBEDDING_DIMS
 from zerg.embedding_space import ACTIVE_EMBEDDING_MODEL
+from zerg.searchd.recall import dense_candidates
+from zerg.searchd.recall import lexical_candidates
+from zerg.searchd.recall import rrf_fuse
 from zerg.searchd.server import SearchDaemon
 from zerg.searchd.server import _embedding_write_params
+from zerg.searchd.store import _CONTEXT_BATCH_SQL
 from zerg.searchd.store import _PUBLISH_AGGREGATES_SQL
 from zerg.searchd.store import _SEARCH_SQL
 from zerg.searchd.store import _SEARCHABLE_SEARCH_SQL
@@ -916,8 +920,8 @@ async def test_timed_out_search_is_interrupted_before_later_reads(tmp_path):
         assert ping["ready"] is True
         assert all(worker.connection.in_transaction is False for worker in daemon._all_read_workers)
         for _ in range(20):
-            assert daemon._read_workers is not None
-            queued_workers = list(daemon._read_workers._queue)
+            assert daemon._read_pool is not None
+            queued_workers = list(daemon._read_pool._idle)
             if len(queued_workers) == len(daemon._all_read_workers):
                 break
             await asyncio.sleep(0.01)
@@ -1380,6 +1384,8 @@ async def test_searchd_publishes_only_complete_generations_and_serves_search_wor
         ping = await client.call("search.ping.v2")
         assert ping["ready"] is True
         assert str(UUID(ping["store_id"])) == ping["store_id"]
+        assert set(ping["read_pool"]["lanes"]) == {"interactive", "timeline", "background"}
+        assert ping["read_pool"]["lanes"]["interactive"]["n"] >= 1
         index_params = {
             "session_id": session_id,
             "generation_id": generation_id,
@@ -1452,6 +1458,23 @@ async def test_searchd_publishes_only_complete_generations_and_serves_search_wor
         assert context["evidence_status"] == "complete"
         assert context["total_events"] == 2
         assert [item["role"] for item in context["context"]] == ["user", "assistant"]
+        locator = {
+            "session_id": session_id,
+            "generation_id": generation_id,
+            "search_event_id": search["results"][0]["search_event_id"],
+            "start_order_time_us": None,
+        }
+        contexts = await client.call(
+            "search.contexts.v2",
+            {"owner_id": "42", "locators": [locator, None], "context_turns": 1},
+        )
+        assert contexts["evidence"] == [{key: context[key] for key in contexts["evidence"][0]}, None]
+        with pytest.raises(CatalogRemoteError) as ambiguous:
+            await client.call(
+                "search.contexts.v2",
+                {"owner_id": "42", "locators": [{**locator, "start_order_time_us": 1}], "context_turns": 1},
+            )
+        assert ambiguous.value.code == "invalid_request"
         filtered = await client.call("search.query.v2", {**_search_params("speed"), "provider": "claude"})
         assert filtered["results"] == []
 
@@ -2364,3 +2387,326 @@ def test_delayed_publish_preserves_newer_reconciled_visibility(tmp_path):
         assert store.search(**_search_params("scope needle"), include_test=True)["results"] == []
     finally:
         connection.close()
+
+
+def _publish_needle_sessions(store: SearchStore, *, count: int) -> None:
+    for index in range(count):
+        session_id = str(uuid4())
+        generation_id = str(uuid4())
+        object_id = hashlib.sha256(f"archive-shard-{index}".encode()).hexdigest()
+        # Distinct needle density per session keeps every bm25 score distinct.
+        text = " ".join(["needle"] * (index % 5 + 1) + ["filler"] * (index * 3 + 1))
+        records = _records(text)
+        store.index_object(
+            session_id=session_id,
+            generation_id=generation_id,
+            object_id=object_id,
+            desired_revision=1,
+            provider="codex",
+            machine_id="cinder",
+            project="longhouse",
+            environment="local",
+            cwd="/workspace/longhouse",
+            git_repo="cipher982/longhouse",
+            opaque_source_id="codex/session.jsonl",
+            source_epoch=str(uuid4()),
+            records=records,
+        )
+        store.publish_generation(
+            session_id=session_id,
+            generation_id=generation_id,
+            owner_id="42",
+            desired_revision=1,
+            object_count=1,
+            object_set_hash=object_set_hash([object_id]),
+            event_count=len(records),
+            project="longhouse",
+            provider="codex",
+            environment="local",
+            cwd="/workspace/longhouse",
+            git_repo="cipher982/longhouse",
+            started_at="2024-07-12T12:00:00+00:00",
+        )
+
+
+def test_archive_search_merges_rowid_shards_into_the_exact_ranking(tmp_path, monkeypatch):
+    """Sharded archive ranking must equal the unbounded bm25 sort.
+
+    Every shard ranks against the one events_fts table, so scores compare
+    across shards and the merged top-k is the global top-k.
+    """
+
+    connection = open_search_database(tmp_path / "search.db")
+    store = SearchStore(connection)
+    monkeypatch.setattr("zerg.searchd.store._ARCHIVE_SHARD_ROWS", 3)
+    try:
+        _publish_needle_sessions(store, count=12)
+        shards = store.archive_shards()
+        assert len(shards) > 1
+        assert shards == sorted(shards, reverse=True)
+        assert sum(high - low + 1 for low, high in shards) == 24
+
+        oracle = connection.execute(
+            _SEARCH_SQL,
+            ("needle", "42", 0, 0, None, None, None, None, None, None, None, None, None, None, 5),
+        ).fetchall()
+        result = store.search(**{**_search_params("needle"), "limit": 5})
+
+        assert result["search_scope"] == "published_archive"
+        assert result["ranking_scope"] == "exact"
+        assert result["archive_shards"] == len(shards)
+        assert [row["search_event_id"] for row in result["results"]] == [row["search_event_id"] for row in oracle]
+        assert all("needle" in row["content_snippet"] for row in result["results"])
+
+        monkeypatch.setattr("zerg.searchd.store._CANDIDATE_CEILING", 1)
+        assert store.search(**{**_search_params("needle"), "limit": 1})["ranking_scope"] == "shard_bounded"
+    finally:
+        connection.close()
+
+
+@pytest.mark.asyncio
+async def test_searchd_ranks_archive_shards_across_read_workers(tmp_path, monkeypatch):
+    monkeypatch.setattr("zerg.searchd.store._ARCHIVE_SHARD_ROWS", 4)
+    connection = open_search_database(tmp_path / "search.db")
+    _publish_needle_sessions(SearchStore(connection), count=10)
+    expected = SearchStore(connection).search(**_search_params("needle"))
+    connection.close()
+
+    socket_parent = Path("/tmp") / f"lhs-{uuid4().hex[:8]}"
+    socket_parent.mkdir(mode=0o700)
+    socket_path = socket_parent / "s"
+    daemon = SearchDaemon(database_path=tmp_path / "search.db", socket_path=socket_path)
+    await daemon.start()
+    client = CatalogClient(socket_path)
+    shard_reads: list[tuple[int, int]] = []
+    for worker in daemon._all_read_workers:
+        original = worker.store.search
+
+        def recording_search(original=original, **params):
+            if params.get("rowid_range") is not None:
+                shard_reads.append(params["rowid_range"])
+            return original(**params)
+
+        worker.store.search = recording_search
+    try:
+        result = await client.call("search.query.v2", _search_params("needle"))
+        assert sorted(shard_reads, reverse=True) == daemon._all_read_workers[0].store.archive_shards()
+        assert result["ranking_scope"] == "exact"
+        assert [row["search_event_id"] for row in result["results"]] == [row["search_event_id"] for row in expected["results"]]
+        assert [row["content_snippet"] for row in result["results"]] == [row["content_snippet"] for row in expected["results"]]
+    finally:
+        await client.close()
+        await daemon.close()
+        socket_parent.rmdir()
+
+
+def test_recall_fusion_credits_agreement_and_keeps_the_better_ranked_row():
+    lexical = lexical_candidates(
+        [
+            {"session_id": "a", "environment": "local", "search_event_id": 1},
+            {"session_id": "a", "environment": "local", "search_event_id": 2},
+            {"session_id": "t", "environment": "test", "search_event_id": 3},
+            {"session_id": "b", "environment": "local", "search_event_id": 4},
+        ],
+        include_test=False,
+        include_automation=False,
+        depth=10,
+    )
+    dense = dense_candidates(
+        [{"session_id": "b", "start_order_time_us": 5}, {"session_id": "c", "start_order_time_us": 6}],
+        depth=10,
+    )
+
+    fused = rrf_fuse(lexical, dense, limit=2)
+
+    assert [entry["session_id"] for entry in fused] == ["b", "a"]
+    assert fused[0]["lane"] == "dense"
+    assert fused[0]["lanes"] == ["lexical", "dense"]
+    assert fused[0]["lane_ranks"] == {"lexical": 2, "dense": 1}
+    assert fused[0]["score"] == pytest.approx(1 / 62 + 1 / 61)
+    assert fused[1]["hit"]["search_event_id"] == 1
+
+
+@pytest.mark.asyncio
+async def test_searchd_recall_fuses_both_lanes_and_hydrates_winners_in_one_call(tmp_path):
+    connection = open_search_database(tmp_path / "search.db")
+    _publish_needle_sessions(SearchStore(connection), count=3)
+    sessions = connection.execute("SELECT session_id, generation_id FROM session_index ORDER BY session_id").fetchall()
+    connection.close()
+
+    socket_parent = Path("/tmp") / f"lhs-{uuid4().hex[:8]}"
+    socket_parent.mkdir(mode=0o700)
+    socket_path = socket_parent / "s"
+    daemon = SearchDaemon(database_path=tmp_path / "search.db", socket_path=socket_path)
+    await daemon.start()
+    client = CatalogClient(socket_path)
+    vector = np.zeros(ACTIVE_EMBEDDING_DIMS, dtype=np.float32)
+    vector[0] = 1.0
+    embedded_session, embedded_generation = sessions[0]
+    try:
+        await client.call(
+            "search.embedding.write.v2",
+            {
+                "session_id": embedded_session,
+                "owner_id": "42",
+                "generation_id": embedded_generation,
+                "revision": "1",
+                "model": ACTIVE_EMBEDDING_MODEL,
+                "dims": ACTIVE_EMBEDDING_DIMS,
+                "complete": True,
+                "desired_episode_ordinals": [0],
+                "reused_episodes": [],
+                "episodes": [
+                    {
+                        "episode_ordinal": 0,
+                        "event_index_start": 0,
+                        "event_index_end": 1,
+                        "start_order_time_us": 1_720_780_400_000_000,
+                        "content_hash": "a" * 64,
+                        "embedding": base64.b64encode(vector.tobytes()).decode("ascii"),
+                    }
+                ],
+            },
+        )
+        ping = await client.call("search.ping.v2")
+        params = {
+            "owner_id": "42",
+            "query": "needle",
+            "project": None,
+            "provider": None,
+            "window_start_us": None,
+            "include_test": False,
+            "include_automation": False,
+            "candidate_depth": 10,
+            "limit": 5,
+            "context_turns": 1,
+            "discovery_timeout_ms": 2_000,
+            "dense": {
+                "model": ACTIVE_EMBEDDING_MODEL,
+                "dims": ACTIVE_EMBEDDING_DIMS,
+                "query_embedding": base64.b64encode(vector.tobytes()).decode("ascii"),
+                "limit": 30,
+                "exclude_environments": None,
+                "since_iso": None,
+                "expected_store_id": ping["store_id"],
+                "expected_schema_generation": SCHEMA_GENERATION,
+            },
+        }
+
+        result = await client.call("search.recall.v2", params)
+
+        assert result["served_lanes"] == ["lexical", "dense"]
+        assert result["lane_errors"] == []
+        assert result["dense"]["store_id"] == ping["store_id"]
+        assert len(result["matches"]) == 3
+        winner = result["matches"][0]
+        assert (winner["session_id"], winner["lanes"]) == (embedded_session, ["lexical", "dense"])
+        assert all(match["evidence"]["evidence_status"] == "complete" for match in result["matches"])
+        assert all(match["evidence"]["context"] for match in result["matches"])
+
+        # A store the catalog never bound costs the dense lane, not the request.
+        mismatched = await client.call(
+            "search.recall.v2",
+            {**params, "dense": {**params["dense"], "expected_store_id": str(uuid4())}},
+        )
+        assert mismatched["served_lanes"] == ["lexical"]
+        assert mismatched["lane_errors"] == [
+            {"lane": "dense", "code": "embedding_coverage_incomplete", "reason": "store_binding_mismatch"}
+        ]
+        assert mismatched["dense"] is None
+        assert all(match["lanes"] == ["lexical"] for match in mismatched["matches"])
+    finally:
+        await client.close()
+        await daemon.close()
+        socket_parent.rmdir()
+
+
+def test_recall_contexts_hydrates_every_hit_in_one_statement(tmp_path):
+    connection = open_search_database(tmp_path / "search.db")
+    store = SearchStore(connection)
+    session_id = str(uuid4())
+    generation_id = str(uuid4())
+    object_id = hashlib.sha256(b"recall-context-batch").hexdigest()
+    records = [
+        {
+            **_records("")[ordinal % 2],
+            "event_id": f"event-{ordinal}",
+            "record_ordinal": ordinal,
+            "order_time_us": 1_720_780_400_000_000 + ordinal,
+            "source_position": 10 + ordinal,
+            "content_text": f"turn {ordinal}",
+        }
+        for ordinal in range(8)
+    ]
+    store.index_object(
+        session_id=session_id,
+        generation_id=generation_id,
+        object_id=object_id,
+        desired_revision=1,
+        provider="codex",
+        machine_id="cinder",
+        project="longhouse",
+        environment="local",
+        cwd=None,
+        git_repo=None,
+        opaque_source_id="codex/session.jsonl",
+        source_epoch=str(uuid4()),
+        records=records,
+    )
+    store.publish_generation(
+        session_id=session_id,
+        generation_id=generation_id,
+        owner_id="42",
+        desired_revision=1,
+        object_count=1,
+        object_set_hash=object_set_hash([object_id]),
+        event_count=len(records),
+        project="longhouse",
+        provider="codex",
+        environment="local",
+        cwd=None,
+        git_repo=None,
+        started_at="2024-07-12T12:00:00+00:00",
+    )
+    event_ids = [row[0] for row in connection.execute("SELECT id FROM events ORDER BY order_time_us").fetchall()]
+    hit = {"session_id": session_id, "generation_id": generation_id, "search_event_id": None, "start_order_time_us": None}
+    locators = [
+        {**hit, "search_event_id": event_ids[4]},
+        {**hit, "start_order_time_us": 1_720_780_400_000_006},
+        None,
+        hit,
+        {**hit, "generation_id": str(uuid4()), "search_event_id": event_ids[4]},
+    ]
+    statements: list[str] = []
+    connection.set_trace_callback(statements.append)
+    try:
+        evidence = store.recall_contexts(owner_id="42", locators=locators, context_turns=1)["evidence"]
+        assert len(statements) == 1
+
+        lexical, positional, missing, unlocated, unpublished = evidence
+        assert [row["content_text"] for row in lexical["context"]] == ["turn 3", "turn 4", "turn 5"]
+        assert [row["content_text"] for row in positional["context"]] == ["turn 5", "turn 6", "turn 7"]
+        assert (lexical["evidence_status"], lexical["total_events"]) == ("complete", 8)
+        assert missing is None
+        assert (unlocated["evidence_status"], unlocated["evidence_reason"]) == ("unavailable", "hit_missing_locator")
+        assert (unpublished["evidence_status"], unpublished["evidence_reason"]) == ("unavailable", "hit_not_published")
+        # The batch and the single-hit read are one implementation.
+        assert store.recall_context(owner_id="42", context_turns=1, **locators[0]) == lexical
+        assert store.recall_context(owner_id="7", context_turns=1, **locators[0])["evidence_reason"] == "hit_not_published"
+        assert store.recall_contexts(owner_id="42", locators=locators[:1], context_turns=0)["evidence"][0] == {
+            "evidence_status": "complete",
+            "evidence_reason": None,
+            "context": [],
+            "total_events": 8,
+        }
+
+        plan = connection.execute(
+            f"EXPLAIN QUERY PLAN {_CONTEXT_BATCH_SQL.format(hits='(:i0, :s0, :g0, :e0, :p0)')}",
+            {"owner_id": "42", "before": 2, "after": 1, "i0": 0, "s0": session_id, "g0": generation_id, "e0": None, "p0": 0},
+        ).fetchall()
+        details = [str(row[3]) for row in plan]
+        assert not any(detail in {"SCAN e", "SCAN n", "SCAN p"} for detail in details)
+        assert any("ix_search_events_session_generation_order" in detail for detail in details)
+    finally:
+        connection.set_trace_callback(None)
+        connection.close()
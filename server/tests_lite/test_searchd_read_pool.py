@@ -0,0 +1,123 @@
+"""Tests for searchd's priority-laned, adaptively sized read pool."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from zerg.searchd.read_pool import ReadLaneLimit
+from zerg.searchd.read_pool import ReadLaneRejected
+from zerg.searchd.read_pool import SearchReadPool
+
+
+def _pool(*, min_workers: int = 1, max_workers: int = 1, **kwargs) -> tuple[SearchReadPool[str], list[str]]:
+    closed: list[str] = []
+    pool = SearchReadPool(
+        open_worker=lambda name: name,
+        close_worker=closed.append,
+        min_workers=min_workers,
+        max_workers=max_workers,
+        **kwargs,
+    )
+    pool.start()
+    return pool, closed
+
+
+def _deadline(seconds: float = 5.0) -> int:
+    return time.monotonic_ns() + int(seconds * 1_000_000_000)
+
+
+@pytest.mark.asyncio
+async def test_freed_worker_goes_to_interactive_before_earlier_timeline_waiter():
+    pool, _closed = _pool(grow_after_ms=10_000)
+    held = await pool.acquire("interactive", deadline_mono_ns=_deadline())
+    order: list[str] = []
+
+    async def read(lane: str) -> None:
+        lease = await pool.acquire(lane, deadline_mono_ns=_deadline())
+        order.append(lane)
+        pool.release(lease)
+
+    timeline = asyncio.create_task(read("timeline"))
+    await asyncio.sleep(0)
+    interactive = asyncio.create_task(read("interactive"))
+    await asyncio.sleep(0)
+    pool.release(held)
+    await asyncio.gather(timeline, interactive)
+
+    assert order == ["interactive", "timeline"]
+    lanes = pool.snapshot()["lanes"]
+    assert lanes["timeline"]["n"] == 1
+    assert lanes["timeline"]["queue_wait_ms"]["max"] >= lanes["interactive"]["queue_wait_ms"]["p50"]
+
+
+@pytest.mark.asyncio
+async def test_lower_lanes_leave_a_reserved_worker_for_interactive():
+    pool, _closed = _pool(min_workers=2, max_workers=2, grow_after_ms=10_000)
+
+    timeline = await pool.acquire("timeline", deadline_mono_ns=_deadline())
+    with pytest.raises(TimeoutError):
+        await pool.acquire("background", deadline_mono_ns=_deadline(0.02))
+    interactive = await pool.acquire("interactive", deadline_mono_ns=_deadline(0.02))
+
+    assert pool.active == 2
+    assert pool.snapshot()["lanes"]["background"]["expired"] == 1
+    pool.release(timeline)
+    pool.release(interactive)
+
+
+@pytest.mark.asyncio
+async def test_expired_waiter_is_failed_instead_of_handed_a_worker():
+    pool, _closed = _pool(grow_after_ms=10_000)
+    held = await pool.acquire("interactive", deadline_mono_ns=_deadline())
+
+    stale = asyncio.create_task(pool.acquire("timeline", deadline_mono_ns=_deadline(0.01)))
+    await asyncio.sleep(0)
+    time.sleep(0.02)
+    pool.release(held)
+
+    with pytest.raises(TimeoutError):
+        await stale
+    assert pool.snapshot()["idle"] == 1
+    assert pool.snapshot()["lanes"]["timeline"]["expired"] == 1
+    assert pool.queued == 0
+
+
+@pytest.mark.asyncio
+async def test_full_lane_queue_rejects_instead_of_waiting():
+    limits = {
+        "interactive": ReadLaneLimit(max_queued=4),
+        "timeline": ReadLaneLimit(max_queued=1, reserve=1),
+        "background": ReadLaneLimit(max_queued=1, reserve=1, max_active=1),
+    }
+    pool, _closed = _pool(grow_after_ms=10_000, lane_limits=limits)
+    held = await pool.acquire("interactive", deadline_mono_ns=_deadline())
+    queued = asyncio.create_task(pool.acquire("timeline", deadline_mono_ns=_deadline()))
+    await asyncio.sleep(0)
+
+    with pytest.raises(ReadLaneRejected):
+        await pool.acquire("timeline", deadline_mono_ns=_deadline())
+
+    pool.release(held)
+    pool.release(await queued)
+    assert pool.snapshot()["lanes"]["timeline"]["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_grows_on_queue_wait_and_shrinks_when_idle():
+    pool, closed = _pool(min_workers=1, max_workers=3, grow_after_ms=5, shrink_after_seconds=0.05)
+    held = await pool.acquire("interactive", deadline_mono_ns=_deadline())
+
+    grown = await pool.acquire("interactive", deadline_mono_ns=_deadline())
+
+    assert len(pool.workers) == 2
+    assert pool.snapshot()["grown"] == 1
+    pool.release(grown)
+    await asyncio.sleep(0.06)
+    pool.release(held)
+
+    assert len(pool.workers) == 1
+    assert len(closed) == 1
+    assert pool.snapshot()["shrunk"] == 1
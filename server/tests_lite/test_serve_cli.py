@@ -4,6 +4,8 @@ import os
 import sys
 from types import ModuleType
 
+import pytest
+import typer
 from cryptography.fernet import Fernet
 
 os.environ.setdefault("DATABASE_URL", "sqlite://")
@@ -154,3 +156,41 @@ def test_serve_domain_overrides_runtime_env_and_persists_config(monkeypatch, tmp
         "fallback_scan_secs": 300,
     }
     assert uvicorn_calls[0][1]["host"] == "0.0.0.0"
+
+
+def _serve_with_workers(workers: int) -> None:
+    serve_cli.serve(
+        host="127.0.0.1",
+        port=8080,
+        reload=False,
+        db=None,
+        workers=workers,
+        daemon=False,
+        stop=False,
+        demo=False,
+        demo_fresh=False,
+        domain=None,
+        allow_public_no_auth=False,
+    )
+
+
+def test_serve_multiple_workers_runs_behind_a_control_process(monkeypatch, tmp_path):
+    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'longhouse.db'}")
+    uvicorn_calls, _saved_configs = _patch_serve(monkeypatch, tmp_path, config=_base_config(public_url=None))
+    control_calls: list[dict] = []
+    monkeypatch.setattr(serve_cli, "_serve_with_control_process", lambda _uvicorn, **kwargs: control_calls.append(kwargs))
+
+    _serve_with_workers(4)
+
+    assert control_calls == [{"host": "127.0.0.1", "port": 8080, "workers": 4}]
+    assert uvicorn_calls == []
+
+
+def test_serve_multiple_workers_requires_a_file_backed_database(monkeypatch, tmp_path):
+    monkeypatch.setenv("DATABASE_URL", "sqlite://")
+    uvicorn_calls, _saved_configs = _patch_serve(monkeypatch, tmp_path, config=_base_config(public_url=None))
+
+    with pytest.raises(typer.Exit):
+        _serve_with_workers(2)
+
+    assert uvicorn_calls == []
@@ -5,6 +5,7 @@ import hashlib
 import json
 import os
 import threading
+from dataclasses import replace
 from datetime import UTC
 from datetime import datetime
 from pathlib import Path
@@ -32,6 +33,7 @@ from zerg.dependencies.browser_auth import get_current_browser_user
 from zerg.main import api_app
 from zerg.services.session_workspace import get_legacy_workspace_session_factory
 from zerg.storage_v2.render_objects import DecodedRenderObject
+from zerg.storage_v2.render_objects import RenderObjectFilterIndex
 from zerg.storage_v2.render_objects import RenderObjectSpec
 from zerg.storage_v2.render_objects import RenderRecord
 
@@ -264,3 +266,108 @@ async def test_large_session_workspace_tail_is_bounded_and_independent_of_catalo
         await catalog.close()
         await daemon.close()
         tempdir.cleanup()
+
+
+_TOOL_EVERY = 250
+
+
+class _ToolRenderPool(_RenderPool):
+    """Every ``_TOOL_EVERY``-th object holds a Bash call; the filter index says so."""
+
+    def __init__(self, *, session_id: UUID, generation_id: UUID, indexed: bool) -> None:
+        super().__init__(session_id=session_id, generation_id=generation_id)
+        self.indexed = indexed
+
+    async def read(self, object_path: str, object_hash: str, *, lane: str) -> DecodedRenderObject:
+        decoded = await super().read(object_path, object_hash, lane=lane)
+        index = int(object_path.rsplit("/", 1)[-1])
+        if index % _TOOL_EVERY:
+            return decoded
+        records = tuple(replace(record, role="assistant", tool_name="Bash") for record in decoded.spec.records)
+        return replace(decoded, spec=replace(decoded.spec, records=records))
+
+    async def read_filter_indexes(self, items):
+        if not self.indexed:
+            return [None for _item in items]
+        indexes = []
+        for object_path, object_hash in items:
+            index = int(object_path.rsplit("/", 1)[-1])
+            tool = index % _TOOL_EVERY == 0
+            indexes.append(
+                RenderObjectFilterIndex(
+                    object_hash=object_hash,
+                    record_count=1,
+                    roles={"assistant" if tool else "user": (0,)},
+                    tool_names={"Bash": (0,)} if tool else {},
+                    text_filter=None,
+                )
+            )
+        return indexes
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("indexed", [True, False])
+async def test_filtered_events_page_is_dense_and_cursor_crosses_empty_manifest_windows(monkeypatch, indexed):
+    tempdir = TemporaryDirectory(prefix="lhsd-", dir="/tmp")
+    root = Path(tempdir.name)
+    database_path = root / "catalog.db"
+    socket_path = root / "catalogd.sock"
+    session_id = uuid4()
+    generation_id = uuid4()
+    _seed_large_storage_session(database_path, session_id=session_id, generation_id=generation_id)
+
+    daemon = CatalogDaemon(database_path=database_path, socket_path=socket_path)
+    await daemon.start()
+    catalog = CatalogClient(socket_path)
+    render_pool = _ToolRenderPool(session_id=session_id, generation_id=generation_id, indexed=indexed)
+    fake_session = SimpleNamespace(
+        provider=_PROVIDER,
+        origin_kind="imported",
+        runtime_display=SimpleNamespace(lifecycle="closed"),
+        capabilities=SimpleNamespace(live_control_available=False, can_start_turn=False),
+        model_dump=lambda **_kwargs: {"id": str(session_id), "provider": _PROVIDER},
+    )
+    monkeypatch.setattr(workspace_service, "get_catalogd_client", lambda: catalog)
+    monkeypatch.setattr(storage_router, "get_catalogd_client", lambda: catalog)
+    monkeypatch.setattr(storage_router, "get_render_object_worker_pool", lambda: render_pool)
+    monkeypatch.setattr(storage_router, "get_raw_object_worker_pool", lambda: None)
+    monkeypatch.setattr(
+        workspace_service,
+        "read_live_catalog_session",
+        lambda requested_session_id, *, owner_id: (fake_session, None, "1"),
+    )
+    api_app.dependency_overrides[get_current_browser_user] = lambda: SimpleNamespace(id=1)
+    api_app.dependency_overrides[get_legacy_workspace_session_factory] = lambda: None
+
+    try:
+        seen: list[str] = []
+        cursor = None
+        pages = 0
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=api_app), base_url="http://test") as client:
+            while True:
+                params = {"tool_name": "Bash", "anchor": "start", "limit": 5}
+                if cursor is not None:
+                    params["cursor"] = cursor
+                response = await client.get(f"/timeline/sessions/{session_id}/events", params=params)
+                assert response.status_code == 200, response.text
+                payload = response.json()
+                assert all(event["tool_name"] == "Bash" for event in payload["events"])
+                seen.extend(event["id"] for event in payload["events"])
+                pages += 1
+                if not payload["has_more"]:
+                    break
+                cursor = payload["next_cursor"]
+                assert cursor is not None
+                assert pages < 10
+
+        assert seen == [f"event-{index}" for index in range(0, _EVENT_COUNT, _TOOL_EVERY)]
+        if indexed:
+            assert render_pool.read_count == _EVENT_COUNT // _TOOL_EVERY
+        else:
+            assert render_pool.read_count == _EVENT_COUNT
+    finally:
+        api_app.dependency_overrides.pop(get_current_browser_user, None)
+        api_app.dependency_overrides.pop(get_legacy_workspace_session_factory, None)
+        await catalog.close()
+        await daemon.close()
+        tempdir.cleanup()
@@ -453,6 +453,33 @@ def test_intent_auto_not_locked_returns_sent(monkeypatch, tmp_path):
         api_app_ref.dependency_overrides = {}
 
 
+def test_input_over_the_daily_cost_limit_is_rejected_before_dispatch(monkeypatch, tmp_path):
+    session_local = _make_db(tmp_path)
+    session_id, user_id = _seed_live_session(session_local)
+    calls = _stub_dispatch(monkeypatch)
+
+    async def spent_today(_user_id):
+        return 1.5
+
+    monkeypatch.setattr("zerg.services.quota.get_settings", lambda: SimpleNamespace(daily_cost_per_user_cents=100))
+    monkeypatch.setattr("zerg.services.usage_service.get_user_today_cost_usd", spent_today)
+    client, api_app_ref = _make_client(
+        session_local,
+        SimpleNamespace(id=user_id, email="x@y", role=UserRole.USER.value),
+    )
+    try:
+        resp = client.post(
+            f"/api/sessions/{session_id}/input",
+            json={"text": "hello", "intent": "auto"},
+        )
+        assert resp.status_code == 429, resp.text
+        assert calls == []
+        with session_local() as db:
+            assert db.query(SessionInput).filter(SessionInput.session_id == session_id).count() == 0
+    finally:
+        api_app_ref.dependency_overrides = {}
+
+
 def test_auto_input_response_includes_live_input_id(monkeypatch, tmp_path):
     session_local = _make_db(tmp_path)
     session_id, user_id = _seed_live_session(session_local)
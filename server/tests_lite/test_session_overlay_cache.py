@@ -0,0 +1,210 @@
+"""Tests for the process-local session workspace overlay cache."""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from uuid import uuid4
+
+from cryptography.fernet import Fernet
+
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("TESTING", "1")
+os.environ.setdefault("FERNET_SECRET", Fernet.generate_key().decode())
+os.environ.setdefault("JWT_SECRET", "test-jwt-secret-1234")
+os.environ.setdefault("INTERNAL_API_SECRET", Fernet.generate_key().decode())
+
+from zerg.database import Base
+from zerg.database import make_engine
+from zerg.database import make_sessionmaker
+from zerg.models.agents import AgentSession
+from zerg.models.agents import SessionRuntimeState
+from zerg.services import session_workspace
+from zerg.services.session_overlay_cache import SessionOverlay
+from zerg.services.session_overlay_cache import SessionOverlayCache
+from zerg.services.session_overlay_cache import detach_orm_row
+from zerg.services.session_overlay_cache import get_session_overlay_cache
+from zerg.services.session_pubsub import SessionPubsub
+from zerg.services.session_pubsub import publish_session_runtime_update
+from zerg.services.session_pubsub import topic_session
+from zerg.services.session_workspace import build_session_workspace
+
+
+def _overlay(**overrides) -> SessionOverlay:
+    values = {
+        "runtime_state": None,
+        "pause_request": None,
+        "archive_state": "current",
+        "control_state": None,
+        "transcript_preview": None,
+        "has_pending_response_turn": False,
+    }
+    values.update(overrides)
+    return SessionOverlay(**values)
+
+
+class _CountingLoader:
+    def __init__(self, make=_overlay) -> None:
+        self.calls: list[list] = []
+        self._make = make
+
+    def __call__(self, session_ids):
+        self.calls.append(list(session_ids))
+        return {session_id: self._make() for session_id in session_ids}
+
+
+def _load(cache: SessionOverlayCache, session_ids, loader, *, revision="rev-1", scope="db", now=None):
+    return cache.load(
+        scope=scope,
+        revision=revision,
+        session_ids=session_ids,
+        loader=loader,
+        now=now or datetime.now(timezone.utc),
+    )
+
+
+def test_overlay_cache_reuses_entries_until_revision_or_scope_changes():
+    cache = SessionOverlayCache(ttl_seconds=60, max_sessions=16)
+    first, second = uuid4(), uuid4()
+    loader = _CountingLoader()
+
+    loaded = _load(cache, [first], loader)
+    again = _load(cache, [first, second], loader)
+
+    assert again[first] is loaded[first]
+    assert loader.calls == [[first], [second]]
+
+    _load(cache, [first], loader, revision="rev-2")
+    _load(cache, [first], loader, revision="rev-2", scope="other-db")
+    assert loader.calls[2:] == [[first], [first]]
+
+
+def test_overlay_cache_drops_entries_past_their_valid_until():
+    cache = SessionOverlayCache(ttl_seconds=60, max_sessions=16)
+    session_id = uuid4()
+    now = datetime.now(timezone.utc)
+    loader = _CountingLoader(lambda: _overlay(pause_request={"id": "p1"}, valid_until=now + timedelta(seconds=5)))
+
+    _load(cache, [session_id], loader, now=now)
+    _load(cache, [session_id], loader, now=now + timedelta(seconds=4))
+    _load(cache, [session_id], loader, now=now + timedelta(seconds=5))
+
+    assert len(loader.calls) == 2
+
+
+def test_overlay_cache_is_bounded_and_disabled_by_zero_ttl():
+    cache = SessionOverlayCache(ttl_seconds=60, max_sessions=2)
+    loader = _CountingLoader()
+    ids = [uuid4() for _ in range(3)]
+    _load(cache, ids, loader)
+    assert len(cache) == 2
+
+    disabled = SessionOverlayCache(ttl_seconds=0, max_sessions=2)
+    _load(disabled, ids[:1], loader)
+    _load(disabled, ids[:1], loader)
+    assert len(disabled) == 0
+    assert loader.calls[-2:] == [ids[:1], ids[:1]]
+
+
+def test_session_topic_publication_invalidates_cached_overlay():
+    cache = get_session_overlay_cache()
+    cache.clear()
+    session_id = uuid4()
+    loader = _CountingLoader()
+    _load(cache, [session_id], loader)
+
+    bus = SessionPubsub()
+    bus.publish("timeline", {"kind": "runtime", "session_id": str(session_id)})
+    _load(cache, [session_id], loader)
+    assert len(loader.calls) == 1
+
+    bus.publish(topic_session(str(session_id)), {"kind": "runtime", "session_id": str(session_id)})
+    _load(cache, [session_id], loader)
+    assert len(loader.calls) == 2
+    cache.clear()
+
+
+def test_load_racing_an_invalidation_is_returned_but_not_stored():
+    cache = SessionOverlayCache(ttl_seconds=60, max_sessions=16)
+    session_id = uuid4()
+
+    def racing_loader(session_ids):
+        cache.invalidate(session_id)
+        return {item: _overlay(has_pending_response_turn=True) for item in session_ids}
+
+    result = _load(cache, [session_id], racing_loader)
+
+    assert result[session_id].has_pending_response_turn is True
+    assert len(cache) == 0
+
+
+def test_detached_runtime_state_survives_its_session(tmp_path):
+    engine = make_engine(f"sqlite:///{tmp_path / 'overlay_detach.db'}")
+    Base.metadata.create_all(bind=engine)
+    sf = make_sessionmaker(engine)
+    now = datetime.now(timezone.utc)
+
+    with sf() as db:
+        session = AgentSession(provider="claude", environment="production", project="test", started_at=now)
+        db.add(session)
+        db.flush()
+        row = SessionRuntimeState(
+            session_id=session.id,
+            runtime_key="claude:overlay",
+            provider="claude",
+            phase="thinking",
+            phase_source="hook",
+            runtime_version=3,
+            timeline_anchor_at=now,
+            updated_at=now,
+        )
+        db.add(row)
+        db.commit()
+        detached = detach_orm_row(db.query(SessionRuntimeState).one())
+        db.commit()
+
+    assert isinstance(detached, SessionRuntimeState)
+    assert detached.phase == "thinking"
+    assert detached.runtime_version == 3
+
+
+def test_workspace_refresh_reads_overlays_from_cache_until_published(tmp_path, monkeypatch):
+    engine = make_engine(f"sqlite:///{tmp_path / 'overlay_workspace.db'}")
+    Base.metadata.create_all(bind=engine)
+    sf = make_sessionmaker(engine)
+    cache = get_session_overlay_cache()
+    cache.clear()
+
+    calls: list[list] = []
+    real_loader = session_workspace.load_runtime_state_map
+
+    def counting_runtime_loader(db, session_ids):
+        calls.append(list(session_ids))
+        return real_loader(db, session_ids)
+
+    monkeypatch.setattr(session_workspace, "load_runtime_state_map", counting_runtime_loader)
+
+    with sf() as db:
+        session = AgentSession(
+            provider="claude",
+            environment="production",
+            project="test",
+            started_at=datetime.now(timezone.utc),
+            user_messages=1,
+            assistant_messages=0,
+        )
+        db.add(session)
+        db.commit()
+        session_id = session.id
+
+        first = build_session_workspace(db=db, session_id=session_id)
+        second = build_session_workspace(db=db, session_id=session_id)
+        assert len(calls) == 1
+        assert second.session.model_dump() == first.session.model_dump()
+
+        publish_session_runtime_update(session_id=str(session_id), provider="claude", source="test")
+        build_session_workspace(db=db, session_id=session_id)
+        assert len(calls) == 2
+    cache.clear()
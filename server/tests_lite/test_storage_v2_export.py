@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from types import SimpleNamespace
 from uuid import UUID
 
@@ -8,6 +9,7 @@ from fastapi import HTTPException
 from starlette.responses import Response
 
 from zerg.routers.timeline import get_timeline_session_workspace
+from zerg.services.raw_object_workers import RawObjectRecords
 from zerg.services.storage_v2_export import build_storage_v2_raw_export
 from zerg.storage_v2.raw_objects import RawRecord
 
@@ -42,19 +44,24 @@ async def test_raw_export_streams_verified_objects_in_source_order(monkeypatch):
             return {"objects": [manifest_item], "objects_truncated": False}
 
     class Workers:
-        async def read(self, object_path, object_hash, tenant_id):
+        @asynccontextmanager
+        async def open_records(self, object_path, object_hash, tenant_id):
             assert object_path == manifest_item["object_path"]
             assert object_hash == manifest_item["object_hash"]
             assert tenant_id == manifest_item["tenant_id"]
-            return SimpleNamespace(
-                envelope_id="envelope",
-                spec=SimpleNamespace(
-                    session_id=session_id,
-                    records=(
-                        RawRecord(source_position=0, data=b'{"one":1}'),
-                        RawRecord(source_position=1, data=b'{"two":2}\n'),
+            yield RawObjectRecords(
+                SimpleNamespace(
+                    envelope_id="envelope",
+                    payload_hash="b" * 64,
+                    object_hash=object_hash,
+                    spec=SimpleNamespace(
+                        session_id=session_id,
+                        records=(
+                            RawRecord(source_position=0, data=b'{"one":1}'),
+                            RawRecord(source_position=1, data=b'{"two":2}\n'),
+                        ),
                     ),
-                ),
+                )
             )
 
     monkeypatch.setattr("zerg.services.storage_v2_export.get_catalogd_client", lambda: Catalog())
@@ -201,28 +201,32 @@ def test_recall_machine_search_uses_searchd_without_legacy_db(monkeypatch):
 
     monkeypatch.setattr(agents_search, "search_storage_v2_rows", search_v2)
 
-    async def context_v2(**kwargs):
-        assert kwargs["search_event_id"] == 9
+    async def contexts_v2(**kwargs):
+        assert [locator["search_event_id"] for locator in kwargs["locators"]] == [9]
         return {
-            "evidence_status": "complete",
-            "evidence_reason": None,
-            "total_events": 12,
-            "context": [
+            "evidence": [
                 {
-                    "search_event_id": 9,
-                    "event_id": "event-9",
-                    "source_object_id": "a" * 64,
-                    "record_ordinal": 4,
-                    "order_time_us": 100,
-                    "role": "user",
-                    "content_text": "please migrate",
-                    "tool_name": None,
+                    "evidence_status": "complete",
+                    "evidence_reason": None,
+                    "total_events": 12,
+                    "context": [
+                        {
+                            "search_event_id": 9,
+                            "event_id": "event-9",
+                            "source_object_id": "a" * 64,
+                            "record_ordinal": 4,
+                            "order_time_us": 100,
+                            "role": "user",
+                            "content_text": "please migrate",
+                            "tool_name": None,
+                        }
+                    ],
                 }
             ],
             "timing": {"admit_ms": 0.0, "sql_ms": 0.1, "active_readers": 1, "queued_readers": 0},
         }
 
-    monkeypatch.setattr(agents_search, "search_storage_v2_context", context_v2)
+    monkeypatch.setattr(agents_search, "search_storage_v2_contexts", contexts_v2)
     monkeypatch.setattr(agents_search, "_server_build_commit", lambda: "c" * 40)
 
     response = asyncio.run(
@@ -21,8 +21,11 @@ from zerg.storage_v2.raw_objects import seal_raw_object
 from zerg.storage_v2.render_objects import RenderObjectSpec
 from zerg.storage_v2.render_objects import RenderObjectValidationError
 from zerg.storage_v2.render_objects import RenderRecord
+from zerg.storage_v2.render_objects import RenderRecordFilter
 from zerg.storage_v2.render_objects import decode_render_object
 from zerg.storage_v2.render_objects import encode_render_object
+from zerg.storage_v2.render_objects import filter_index_path
+from zerg.storage_v2.render_objects import read_render_filter_index
 from zerg.storage_v2.render_objects import read_render_object
 from zerg.storage_v2.render_objects import seal_render_object
 
@@ -76,6 +79,31 @@ def test_render_object_is_deterministic_verified_and_summarized(tmp_path):
     assert decoded.spec == spec
 
 
+def test_sealed_render_object_has_a_verified_filter_index(tmp_path):
+    sealed = seal_render_object(tmp_path, _spec())
+    index = read_render_filter_index(tmp_path, sealed.object_path, expected_object_hash=sealed.object_hash)
+    assert index is not None
+    assert index.record_count == 2
+
+    def candidates(**filters):
+        return RenderRecordFilter(**filters).candidate_ordinals(index)
+
+    assert candidates(roles=frozenset({"assistant"})) == frozenset({1})
+    assert candidates(tool_name="apply_patch") == frozenset({1})
+    assert candidates(roles=frozenset({"user"}), tool_name="apply_patch") == frozenset()
+    assert candidates(query="BUILD") is None
+    assert candidates(query="nowhere in this object") == frozenset()
+    assert RenderRecordFilter(query="build").matches(_spec().records[0])
+    assert not RenderRecordFilter(query="build").matches(_spec().records[1])
+
+    sidecar = tmp_path / filter_index_path(sealed.object_path)
+    sidecar.write_text(sidecar.read_text().replace('"record_count":2', '"record_count":3'))
+    assert read_render_filter_index(tmp_path, sealed.object_path, expected_object_hash=sealed.object_hash) is None
+    sidecar.unlink()
+    assert read_render_filter_index(tmp_path, sealed.object_path, expected_object_hash=sealed.object_hash) is None
+    assert RenderRecordFilter(tool_name="apply_patch").candidate_ordinals(None) is None
+
+
 def test_render_aggregate_keeps_claude_control_raw_but_excludes_it_from_semantics(tmp_path):
     spec = _spec()
     claude = replace(
@@ -59,6 +59,8 @@ async def test_storage_v2_workspace_composes_catalog_shell_and_tail(monkeypatch)
             "cursor": None,
             "anchor": "tail",
             "limit": 50,
+            "record_filter": None,
+            "include_sources": False,
         }
         return {
             "generation_id": str(uuid4()),
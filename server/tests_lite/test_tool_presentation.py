@@ -279,3 +279,55 @@ def test_default_rules_path_prefers_packaged_copy(tmp_path, monkeypatch):
     monkeypatch.setattr(tool_presentation_module, "__file__", str(fake_module))
 
     assert tool_presentation_module._get_default_rules_path() == packaged_rules
+
+
+def test_repeated_tool_input_reuses_memoized_projection(monkeypatch):
+    memo = tool_presentation_module.ToolPresentationMemo(max_bytes=1_000_000)
+    monkeypatch.setattr(tool_presentation_module, "_memo", memo)
+    calls = []
+    original = tool_presentation_module._project_tool_presentation
+
+    def counting(*args, **kwargs):
+        calls.append(args[0])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(tool_presentation_module, "_project_tool_presentation", counting)
+
+    first = project_tool_presentation("Bash", {"command": "git status && make test"}, provider="claude")
+    again = project_tool_presentation("Bash", {"command": "git status && make test"}, provider="gemini")
+    other = project_tool_presentation("Bash", {"command": "git status"}, provider="claude")
+
+    assert again is first
+    assert other is not first
+    assert first["shell_summary"]["operations"]
+    assert calls == ["Bash", "Bash"]
+    stats = memo.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+
+    tool_presentation_module.clear_tool_presentation_cache()
+    assert len(memo) == 0
+
+
+def test_memo_keys_separate_codex_and_json_spellings(monkeypatch):
+    monkeypatch.setattr(tool_presentation_module, "_memo", tool_presentation_module.ToolPresentationMemo(max_bytes=1_000_000))
+
+    codex = project_tool_presentation("write_stdin", {"session_id": 1, "chars": ""}, provider="codex")
+    claude = project_tool_presentation("write_stdin", {"session_id": 1, "chars": ""}, provider="claude")
+    as_text = project_tool_presentation("Read", '{"file_path":"/a"}')
+    as_json = project_tool_presentation("Read", {"file_path": "/a"})
+
+    assert codex["label"] == "Wait"
+    assert claude["label"] != "Wait"
+    assert as_text["tool_input_json"] == '{"file_path":"/a"}'
+    assert as_json["tool_input_json"] == {"file_path": "/a"}
+
+
+def test_memo_skips_input_json_cannot_encode(monkeypatch):
+    memo = tool_presentation_module.ToolPresentationMemo(max_bytes=1_000_000)
+    monkeypatch.setattr(tool_presentation_module, "_memo", memo)
+
+    project_tool_presentation("Read", {"file_path": {1, 2}})
+    project_tool_presentation("Read", {"file_path": {1, 2}})
+
+    stats = memo.stats()
+    assert (stats.entries, stats.hits, stats.misses) == (0, 0, 0)
@@ -0,0 +1,91 @@
+"""Tests for serialize-once websocket broadcast and slow-client coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import zerg.websocket.manager as manager_module
+from zerg.generated.ws_messages import Envelope
+from zerg.websocket.manager import TopicConnectionManager
+from zerg.websocket.manager import _ClientQueue
+
+
+class _FakeWebSocket:
+    def __init__(self) -> None:
+        self.sent: list[str] = []
+
+    async def send_text(self, text: str) -> None:
+        self.sent.append(text)
+
+    async def close(self, code: int = 1000, reason: str | None = None) -> None:
+        return None
+
+
+def _message(topic: str, data: dict) -> dict:
+    return Envelope.create(message_type="user_update", topic=topic, data=data).model_dump()
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_once_and_sends_the_same_frame_to_every_subscriber(monkeypatch):
+    manager = TopicConnectionManager()
+    encoded: list[dict] = []
+    original = manager_module.encode_frame
+
+    def counting(message):
+        encoded.append(message)
+        return original(message)
+
+    monkeypatch.setattr(manager_module, "encode_frame", counting)
+    sockets = [_FakeWebSocket() for _ in range(3)]
+    try:
+        for index, websocket in enumerate(sockets):
+            await manager.connect(f"client-{index}", websocket, user_id=7)
+        message = _message("user:7", {"id": 7, "display_name": "Zoë"})
+
+        await manager.broadcast_to_topic("user:7", message)
+
+        assert len(encoded) == 1
+        sent = [websocket.sent for websocket in sockets]
+        assert len(sent[0]) == 1
+        assert sent == [sent[0]] * 3
+        assert json.loads(sockets[0].sent[0]) == message
+    finally:
+        await manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_full_queue_coalesces_superseded_state_and_drops_clients_otherwise(monkeypatch):
+    monkeypatch.setattr(manager_module, "get_settings", lambda: SimpleNamespace(testing=False))
+    manager = TopicConnectionManager()
+    disconnected: list[str] = []
+
+    async def record_disconnect(client_id: str) -> None:
+        disconnected.append(client_id)
+
+    monkeypatch.setattr(manager, "disconnect", record_disconnect)
+    queue = _ClientQueue(maxsize=1)
+    manager.active_connections["slow"] = _FakeWebSocket()
+    manager.client_queues["slow"] = queue
+    manager.topic_subscriptions["user:7"] = {"slow"}
+
+    await manager.broadcast_to_topic("user:7", _message("user:7", {"id": 7, "rev": 1}), coalesce=True)
+    await manager.broadcast_to_topic("user:7", _message("user:7", {"id": 7, "rev": 2}), coalesce=True)
+
+    assert queue.qsize() == 1
+    assert json.loads(queue.get_nowait().text)["data"]["rev"] == 2
+    assert disconnected == []
+
+    queue.put_nowait(manager_module._build_frame("user:7", _message("user:7", {"id": 7, "rev": 3})))
+    await manager.broadcast_to_topic("user:7", _message("user:7", {"id": 7, "rev": 4}))
+    await asyncio.sleep(0)
+
+    assert disconnected == ["slow"]
+
+
+def test_encode_frame_falls_back_for_messages_orjson_rejects():
+    assert manager_module.encode_frame({"v": 1, "data": {1: "x"}}) == '{"v":1,"data":{"1":"x"}}'
+    assert manager_module.encode_frame({"text": "é"}) == '{"text":"é"}'
@@ -0,0 +1,165 @@
+"""Usage ledger extraction and the rollup-backed usage service."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC
+from datetime import date
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from zerg.services import quota
+from zerg.services import usage_service
+from zerg.services.usage_ledger import extract_usage_deltas
+from zerg.services.usage_ledger import usage_cost_microusd
+
+FALLBACK = datetime(2026, 3, 4, 9, 0, tzinfo=UTC)
+
+
+def _line(value: dict) -> bytes:
+    return json.dumps(value).encode() + b"\n"
+
+
+def test_claude_usage_keeps_one_report_per_message():
+    usage = {"input_tokens": 10, "output_tokens": 3, "cache_read_input_tokens": 900, "cache_creation_input_tokens": 50}
+    records = (
+        _line({"type": "user", "message": {"role": "user", "content": "hi"}}),
+        _line(
+            {
+                "type": "assistant",
+                "timestamp": "2026-03-03T23:59:59Z",
+                "message": {"id": "msg_1", "model": "claude-sonnet-4-5-20250929", "usage": usage},
+            }
+        ),
+        _line(
+            {
+                "type": "assistant",
+                "timestamp": "2026-03-03T23:59:59Z",
+                "message": {"id": "msg_1", "model": "claude-sonnet-4-5-20250929", "usage": {**usage, "output_tokens": 120}},
+            }
+        ),
+        _line({"type": "assistant", "message": {"id": "msg_2", "model": "<synthetic>", "usage": usage}}),
+    )
+
+    deltas = extract_usage_deltas("claude", records, fallback_time=FALLBACK)
+
+    assert [delta.to_wire() for delta in deltas] == [
+        {
+            "source_key": "claude:msg_1",
+            "day": "2026-03-03",
+            "model": "claude-sonnet-4-5-20250929",
+            "input_tokens": 10,
+            "output_tokens": 120,
+            "cache_read_tokens": 900,
+            "cache_write_tokens": 50,
+        }
+    ]
+
+
+def test_codex_usage_uses_turn_model_and_splits_cached_input():
+    token_count = {
+        "type": "event_msg",
+        "payload": {
+            "type": "token_count",
+            "info": {
+                "last_token_usage": {"input_tokens": 1000, "cached_input_tokens": 600, "output_tokens": 80},
+                "total_token_usage": {"total_tokens": 1080},
+            },
+        },
+    }
+    records = (
+        _line({"type": "turn_context", "payload": {"model": "gpt-5-codex"}}),
+        _line(token_count),
+        # Codex repeats the last token_count after some turns.
+        _line(token_count),
+        _line({"type": "event_msg", "payload": {"type": "token_count", "info": None}}),
+    )
+
+    deltas = extract_usage_deltas("codex", records, fallback_time=FALLBACK)
+
+    assert len(deltas) == 1
+    assert deltas[0].source_key == "codex:1080"
+    assert deltas[0].model == "gpt-5-codex"
+    assert deltas[0].day == "2026-03-04"
+    assert (deltas[0].input_tokens, deltas[0].cache_read_tokens, deltas[0].output_tokens) == (400, 600, 80)
+    assert extract_usage_deltas("gemini", records, fallback_time=FALLBACK) == []
+
+
+def test_usage_cost_strips_date_suffix_and_ignores_unpriced_models():
+    dated = usage_cost_microusd("claude-sonnet-4-5-20250929", input_tokens=1000, output_tokens=1000, cache_read_tokens=1000)
+    assert dated == usage_cost_microusd("claude-sonnet-4-5", input_tokens=1000, output_tokens=1000, cache_read_tokens=1000)
+    # $0.003 input + $0.015 output + 0.1 x $0.003 cache read.
+    assert dated == 18_300
+    assert usage_cost_microusd("unknown", input_tokens=1000, output_tokens=1000) == 0
+
+
+class _Catalog:
+    def __init__(self, rows: list[dict]):
+        self.rows = rows
+        self.calls: list[tuple[str, dict]] = []
+
+    async def call(self, method: str, params: dict) -> dict:
+        self.calls.append((method, params))
+        owners = params["owner_ids"]
+        return {"rows": [row for row in self.rows if owners is None or row["owner_id"] in owners]}
+
+
+def _row(owner_id: str, day: str, *, cost_microusd: int, output_tokens: int = 10) -> dict:
+    return {
+        "owner_id": owner_id,
+        "day": day,
+        "input_tokens": 100,
+        "output_tokens": output_tokens,
+        "cache_read_tokens": 50,
+        "cache_write_tokens": 0,
+        "cost_microusd": cost_microusd,
+        "responses": 2,
+    }
+
+
+@pytest.fixture
+def ledger(monkeypatch):
+    catalog = _Catalog([_row("1", "2026-03-04", cost_microusd=1_500_000), _row("1", "2026-03-01", cost_microusd=250_000)])
+    monkeypatch.setattr("zerg.services.catalogd_supervisor.get_catalogd_client", lambda: catalog)
+    monkeypatch.setattr(usage_service, "_today_utc_date", lambda: date(2026, 3, 4))
+    return catalog
+
+
+@pytest.mark.asyncio
+async def test_user_usage_reads_one_rollup_range(ledger, monkeypatch):
+    monkeypatch.setattr(usage_service, "get_settings", lambda: SimpleNamespace(daily_cost_per_user_cents=200))
+
+    usage = await usage_service.get_user_usage(1, "7d")
+
+    assert ledger.calls == [("usage.rollups.read.v2", {"owner_ids": ["1"], "start_day": "2026-02-26", "end_day": "2026-03-04"})]
+    assert usage.tokens.prompt == 300
+    assert usage.tokens.completion == 20
+    assert usage.cost_usd == 1.75
+    assert usage.runs == 4
+    assert usage.limit.used_percent == 75.0
+    assert usage.limit.status == "ok"
+
+
+@pytest.mark.asyncio
+async def test_usage_is_empty_without_a_catalog(monkeypatch):
+    monkeypatch.setattr("zerg.services.catalogd_supervisor.get_catalogd_client", lambda: None)
+
+    usage = await usage_service.get_user_usage(1, "today")
+
+    assert usage.tokens.total == 0
+    assert usage.cost_usd == 0.0
+
+
+@pytest.mark.asyncio
+async def test_quota_blocks_non_admins_over_the_daily_limit(ledger, monkeypatch):
+    monkeypatch.setattr(quota, "get_settings", lambda: SimpleNamespace(daily_cost_per_user_cents=100))
+
+    with pytest.raises(HTTPException) as exceeded:
+        await quota.assert_can_start_run(user=SimpleNamespace(id=1, role="USER"))
+    assert exceeded.value.status_code == 429
+
+    await quota.assert_can_start_run(user=SimpleNamespace(id=1, role="ADMIN"))
+    await quota.assert_can_start_run(user=SimpleNamespace(id=2, role="USER"))
@@ -110,6 +110,11 @@ _SAFE_RETRY_METHODS = {
     "storage.media.commit.v2",
     "storage.media.read.v2",
     "storage.media.exists.batch.v2",
+    # Usage reads are snapshots; a fold is keyed per (session, response) in
+    # the ledger, so replaying it after a lost response counts nothing twice.
+    "usage.rollups.read.v2",
+    "usage.ledger.fold.v2",
+    "usage.ledger.backfill.objects.v2",
     "projector.state.advance.v2",
     "projector.state.claim.v2",
     "projector.state.complete.v2",
@@ -135,6 +140,7 @@ _SAFE_RETRY_METHODS = {
     "search.index.publish.v2",
     "search.embedding.source.v2",
     "search.query.v2",
+    "search.recall.v2",
     "worklog.day.v2",
     "worklog.snapshot.release.v2",
     "search.session.delete.v2",
@@ -14,6 +14,7 @@ could not have corrected that: the timeline consumes these rows as the string ke
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import re
@@ -40,6 +41,9 @@ from zerg.machine_evidence import canonical_value_json
 from zerg.machine_evidence import validate_machine_evidence_identities
 
 MAX_REDUCER_FACTS = 256
+# Bulk reduction is for batches that span many sessions (runtime phase batches,
+# coalesced machine evidence); the per-heartbeat wire bound stays 256.
+MAX_BULK_REDUCER_FACTS = int(os.getenv("CATALOGD_BULK_REDUCER_MAX_FACTS", "16384"))
 _REDUCER_SLOW_MS = float(os.getenv("CATALOGD_REDUCER_SLOW_MS", "100"))
 MAX_VALUE_JSON_BYTES = 4 * 1024
 MAX_RAW_LOCATOR_BYTES = 1024
@@ -47,6 +51,10 @@ MAX_RECEIPTS_PER_CANDIDATE = 16
 MAX_CONFLICTS_PER_CANDIDATE = 8
 MAX_HEADS_PER_FAMILY = 2_048
 _SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+# SQLite bounds bind parameters per statement (999 before 3.32). A candidate key
+# is four parameters, so keyed reads and prunes are issued in chunks that stay
+# under the old limit at any batch size.
+_CANDIDATE_CHUNK = 200
 
 
 @dataclass(frozen=True, slots=True)
@@ -451,9 +459,10 @@ def _validate_fact(fact: ReducerFact) -> ReducerFact:
         raise ValueError("fact dedupe_key must be lowercase sha256")
     if not _SHA256_RE.fullmatch(fact.evidence_hash):
         raise ValueError("fact evidence_hash must be lowercase sha256")
-    if canonical_evidence_hash(fact.value) != fact.evidence_hash:
+    value_json = canonical_value_json(fact.value).encode()
+    if hashlib.sha256(value_json).hexdigest() != fact.evidence_hash:
         raise ValueError("fact evidence_hash does not match canonical value")
-    if len(canonical_value_json(fact.value).encode()) > MAX_VALUE_JSON_BYTES:
+    if len(value_json) > MAX_VALUE_JSON_BYTES:
         raise ValueError("fact value exceeds reducer bound")
     if fact.raw_locator is not None and len(fact.raw_locator.encode()) > MAX_RAW_LOCATOR_BYTES:
         raise ValueError("fact raw_locator exceeds reducer bound")
@@ -545,24 +554,27 @@ def _prune_candidate_rows_setwise(connection: Connection, table, candidates: lis
     and a helper changed underneath both would make them agree while both moved.
     """
 
-    if not candidates:
-        return
     scope = tuple_(table.c.family, table.c.subject_key, table.c.source, table.c.source_epoch)
-    ranked = (
-        select(
-            table.c.id,
-            func.row_number()
-            .over(
-                partition_by=(table.c.family, table.c.subject_key, table.c.source, table.c.source_epoch),
-                order_by=table.c.id.desc(),
+    for chunk in _chunks(candidates, _CANDIDATE_CHUNK):
+        ranked = (
+            select(
+                table.c.id,
+                func.row_number()
+                .over(
+                    partition_by=(table.c.family, table.c.subject_key, table.c.source, table.c.source_epoch),
+                    order_by=table.c.id.desc(),
+                )
+                .label("rank"),
             )
-            .label("rank"),
+            .where(scope.in_(chunk))
+            .subquery()
         )
-        .where(scope.in_(candidates))
-        .subquery()
-    )
-    doomed = select(ranked.c.id).where(ranked.c.rank > keep)
-    connection.execute(delete(table).where(table.c.id.in_(doomed)))
+        doomed = select(ranked.c.id).where(ranked.c.rank > keep)
+        connection.execute(delete(table).where(table.c.id.in_(doomed)))
+
+
+def _chunks(items: list[Any], size: int) -> list[list[Any]]:
+    return [items[start : start + size] for start in range(0, len(items), size)]
 
 
 def _prune_fact_family(connection: Connection, family: str) -> None:
@@ -628,6 +640,7 @@ def _parse_wire_datetime(value: object, field: str, *, nullable: bool = False) -
 
 
 __all__ = [
+    "MAX_BULK_REDUCER_FACTS",
     "MAX_HEADS_PER_FAMILY",
     "MAX_REDUCER_FACTS",
     "ReducerFact",
@@ -639,6 +652,8 @@ __all__ = [
     "read_session_fact_heads",
     "reducer_facts_from_machine_evidence",
     "reduce_fact_batch",
+    "reduce_fact_batch_bulk",
+    "reduce_fact_batch_setwise",
 ]
 
 
@@ -669,9 +684,56 @@ def reduce_fact_batch_setwise(
     construction, and the differential oracle proves it.
     """
 
-    started_at = time.perf_counter()
     if len(facts) > MAX_REDUCER_FACTS:
         raise ValueError(f"reducer batch exceeds {MAX_REDUCER_FACTS} facts")
+    return _reduce_in_memory(
+        connection,
+        facts,
+        received_at=received_at,
+        commit_seq_override=commit_seq_override,
+        label="reduce_fact_batch_setwise",
+    )
+
+
+def reduce_fact_batch_bulk(
+    connection: Connection,
+    facts: list[ReducerFact],
+    *,
+    received_at: datetime,
+    commit_seq_override: int | None = None,
+) -> ReducerResult:
+    """Reduce a batch spanning many sessions in one pass.
+
+    Same fold as `reduce_fact_batch_setwise`, without its 256-fact ceiling.
+    That ceiling is the heartbeat wire bound, not a property of the fold, and a
+    caller holding more facts than that -- a runtime batch covering hundreds of
+    sessions -- would otherwise either fail or split the batch, paying the
+    keyed reads, the bulk writes and both prune passes once per slice.
+
+    The statement count grows with the number of distinct candidates only in
+    bind-parameter-sized chunks, never per fact.
+    """
+
+    if len(facts) > MAX_BULK_REDUCER_FACTS:
+        raise ValueError(f"bulk reducer batch exceeds {MAX_BULK_REDUCER_FACTS} facts")
+    return _reduce_in_memory(
+        connection,
+        facts,
+        received_at=received_at,
+        commit_seq_override=commit_seq_override,
+        label="reduce_fact_batch_bulk",
+    )
+
+
+def _reduce_in_memory(
+    connection: Connection,
+    facts: list[ReducerFact],
+    *,
+    received_at: datetime,
+    commit_seq_override: int | None,
+    label: str,
+) -> ReducerResult:
+    started_at = time.perf_counter()
     received_at = _aware(received_at, "received_at")
     prepared, batch_duplicates, batch_conflicts = _prepare_batch(facts)
     current_commit = _current_commit_seq(connection)
@@ -714,46 +776,47 @@ def reduce_fact_batch_setwise(
         conflict_table.c.source_epoch,
     )
 
-    # Three reads for the whole batch, replacing three reads per fact.
+    # Three keyed reads for the whole batch, replacing three reads per fact.
     dedupe_index: dict[tuple[str, str, str, str], dict[str, str]] = {}
     position_index: dict[tuple[str, str, str, str], dict[str, str]] = {}
-    for row in connection.execute(
-        select(
-            receipts.c.family,
-            receipts.c.subject_key,
-            receipts.c.source,
-            receipts.c.source_epoch,
-            receipts.c.dedupe_key,
-            receipts.c.position_key,
-            receipts.c.evidence_hash,
-        ).where(receipt_scope.in_(candidate_list))
-    ).mappings():
-        key = (row["family"], row["subject_key"], row["source"], row["source_epoch"])
-        dedupe_index.setdefault(key, {})[str(row["dedupe_key"])] = str(row["evidence_hash"])
-        position_index.setdefault(key, {})[str(row["position_key"])] = str(row["evidence_hash"])
-
     head_index: dict[tuple[str, str, str, str], dict[str, Any]] = {}
-    for row in connection.execute(select(heads).where(head_scope.in_(candidate_list))).mappings():
-        key = (row["family"], row["subject_key"], row["source"], row["source_epoch"])
-        head_index[key] = {
-            "ordering_mode": str(row["ordering_mode"]),
-            "source_seq": row["source_seq"],
-            "evidence_hash": str(row["evidence_hash"]),
-            "observed_at": _sqlite_datetime(row["observed_at"]),
-        }
-
     known_conflicts: set[tuple[tuple[str, str, str, str], str, str]] = set()
-    for row in connection.execute(
-        select(
-            conflict_table.c.family,
-            conflict_table.c.subject_key,
-            conflict_table.c.source,
-            conflict_table.c.source_epoch,
-            conflict_table.c.position_key,
-            conflict_table.c.incoming_hash,
-        ).where(conflict_scope.in_(candidate_list))
-    ):
-        known_conflicts.add(((row[0], row[1], row[2], row[3]), str(row[4]), str(row[5])))
+    for chunk in _chunks(candidate_list, _CANDIDATE_CHUNK):
+        for row in connection.execute(
+            select(
+                receipts.c.family,
+                receipts.c.subject_key,
+                receipts.c.source,
+                receipts.c.source_epoch,
+                receipts.c.dedupe_key,
+                receipts.c.position_key,
+                receipts.c.evidence_hash,
+            ).where(receipt_scope.in_(chunk))
+        ).mappings():
+            key = (row["family"], row["subject_key"], row["source"], row["source_epoch"])
+            dedupe_index.setdefault(key, {})[str(row["dedupe_key"])] = str(row["evidence_hash"])
+            position_index.setdefault(key, {})[str(row["position_key"])] = str(row["evidence_hash"])
+
+        for row in connection.execute(select(heads).where(head_scope.in_(chunk))).mappings():
+            key = (row["family"], row["subject_key"], row["source"], row["source_epoch"])
+            head_index[key] = {
+                "ordering_mode": str(row["ordering_mode"]),
+                "source_seq": row["source_seq"],
+                "evidence_hash": str(row["evidence_hash"]),
+                "observed_at": _sqlite_datetime(row["observed_at"]),
+            }
+
+        for row in connection.execute(
+            select(
+                conflict_table.c.family,
+                conflict_table.c.subject_key,
+                conflict_table.c.source,
+                conflict_table.c.source_epoch,
+                conflict_table.c.position_key,
+                conflict_table.c.incoming_hash,
+            ).where(conflict_scope.in_(chunk))
+        ):
+            known_conflicts.add(((row[0], row[1], row[2], row[3]), str(row[4]), str(row[5])))
 
     pending_heads: dict[tuple[str, str, str, str], dict[str, Any]] = {}
     pending_receipts: list[dict[str, Any]] = []
@@ -917,8 +980,10 @@ def reduce_fact_batch_setwise(
     # because retention keeps the highest ids, so a reordered insert would
     # silently change which receipts survive pruning.
     if pending_heads:
-        head_rows = list(pending_heads.values())
-        statement = sqlite_insert(heads).values(head_rows)
+        # One compiled upsert run as executemany. A multi-row VALUES statement
+        # is a new statement per batch shape, and compiling its 14 binds per
+        # row cost more than the fold it was writing out.
+        statement = sqlite_insert(heads)
         statement = statement.on_conflict_do_update(
             index_elements=[heads.c.family, heads.c.subject_key, heads.c.source, heads.c.source_epoch],
             set_={
@@ -937,7 +1002,7 @@ def reduce_fact_batch_setwise(
                 )
             },
         )
-        connection.execute(statement)
+        connection.execute(statement, list(pending_heads.values()))
     if pending_receipts:
         connection.execute(receipts.insert(), pending_receipts)
     if pending_conflicts:
@@ -948,22 +1013,30 @@ def reduce_fact_batch_setwise(
     _prune_candidate_rows_setwise(connection, FactReceipt.__table__, pruned_candidates, MAX_RECEIPTS_PER_CANDIDATE)
     _prune_candidate_rows_setwise(connection, FactConflict.__table__, pruned_candidates, MAX_CONFLICTS_PER_CANDIDATE)
     candidate_pruned_at = time.perf_counter()
-    for family in sorted({fact.family for fact in touched_candidates.values()}):
-        # The family sweep is O(family size), not O(batch): it ranks every head
-        # in the family to find the 2048 it keeps, and it ran on every heartbeat
-        # regardless of whether the family was anywhere near that bound. One
-        # indexed COUNT decides whether the sweep can delete anything at all.
-        #
-        # Equivalent because the sweep's own predicate is `candidate NOT IN (top
-        # 2048)`: when the family holds no more than 2048 heads that set is
-        # empty, so every DELETE in the sweep matches nothing. Child rows cannot
-        # outlive that -- receipts and conflicts are only written for a candidate
-        # that has a head, and eviction removes a candidate's children in the
-        # same statement -- so skipping cannot strand them either.
-        head_count = connection.execute(
-            select(func.count()).select_from(FactHead.__table__).where(FactHead.__table__.c.family == family)
-        ).scalar_one()
-        if head_count > MAX_HEADS_PER_FAMILY:
+    touched_families = sorted({fact.family for fact in touched_candidates.values()})
+    # The family sweep is O(family size), not O(batch): it ranks every head in
+    # the family to find the 2048 it keeps, and it ran on every heartbeat
+    # regardless of whether the family was anywhere near that bound. One
+    # indexed, grouped COUNT decides whether the sweep can delete anything at
+    # all, for every touched family at once.
+    #
+    # Equivalent because the sweep's own predicate is `candidate NOT IN (top
+    # 2048)`: when the family holds no more than 2048 heads that set is empty,
+    # so every DELETE in the sweep matches nothing. Child rows cannot outlive
+    # that -- receipts and conflicts are only written for a candidate that has
+    # a head, and eviction removes a candidate's children in the same
+    # statement -- so skipping cannot strand them either.
+    family_counts = (
+        dict(
+            connection.execute(
+                select(heads.c.family, func.count()).where(heads.c.family.in_(touched_families)).group_by(heads.c.family)
+            ).all()
+        )
+        if touched_families
+        else {}
+    )
+    for family in touched_families:
+        if family_counts.get(family, 0) > MAX_HEADS_PER_FAMILY:
             _prune_fact_family(connection, family)
 
     # The fold is three reads and three writes; everything after it is bounds
@@ -973,15 +1046,15 @@ def reduce_fact_batch_setwise(
     total_ms = (time.perf_counter() - started_at) * 1000.0
     if total_ms >= _REDUCER_SLOW_MS:
         logging.getLogger(__name__).warning(
-            "reduce_fact_batch_setwise took %.0fms: fold=%.0fms prune_candidates=%.0fms "
-            "prune_families=%.0fms (facts=%d candidates=%d families=%d)",
+            "%s took %.0fms: fold=%.0fms prune_candidates=%.0fms prune_families=%.0fms (facts=%d candidates=%d families=%d)",
+            label,
             total_ms,
             (fold_finished_at - started_at) * 1000.0,
             (candidate_pruned_at - fold_finished_at) * 1000.0,
             (time.perf_counter() - candidate_pruned_at) * 1000.0,
             len(prepared),
             len(touched_candidates),
-            len({fact.family for fact in touched_candidates.values()}),
+            len(touched_families),
         )
 
     return ReducerResult(
@@ -223,6 +223,23 @@ class StorageSession(CatalogBase):
             "session_id",
         ),
         Index("ix_sessions_project_provider", "project", "provider", "last_activity_at"),
+        # Timeline keyset pages range-scan (owner, activity, session id); the
+        # trailing visibility columns let SQLite drop hidden rows in-index.
+        Index(
+            "ix_sessions_owner_activity",
+            "owner_id",
+            "last_activity_at",
+            "session_id",
+            "user_state",
+            "user_hidden_from_timeline",
+        ),
+        Index(
+            "ix_sessions_owner_console_results",
+            "owner_id",
+            "last_activity_at",
+            "session_id",
+            sqlite_where=text("last_console_result_at IS NOT NULL"),
+        ),
     )
 
 
@@ -467,6 +484,58 @@ class SessionMediaRef(CatalogBase):
     )
 
 
+class UsageLedgerEntry(CatalogBase):
+    """One metered provider response folded into ``usage_daily_rollups``.
+
+    The row is the idempotency key for the fold: a provider response can
+    repeat across envelope boundaries and the backfill re-reads envelopes that
+    live ingest already counted. It keeps the largest counters reported so
+    far, so a later envelope that reports more of the same response (a
+    streamed Claude message) adds only the difference. Reads never scan this
+    table.
+    """
+
+    __tablename__ = "usage_ledger_entries"
+
+    session_id = Column(String(36), primary_key=True)
+    source_key = Column(String(255), primary_key=True)
+    owner_id = Column(String(64), nullable=False, server_default=text("''"))
+    day = Column(String(10), nullable=False)
+    model = Column(String(255), nullable=False)
+    input_tokens = Column(BigInteger, nullable=False, server_default=text("0"))
+    output_tokens = Column(BigInteger, nullable=False, server_default=text("0"))
+    cache_read_tokens = Column(BigInteger, nullable=False, server_default=text("0"))
+    cache_write_tokens = Column(BigInteger, nullable=False, server_default=text("0"))
+    commit_seq = Column(BigInteger, nullable=False)
+
+
+class UsageDailyRollup(CatalogBase):
+    """Additive token and cost totals per owner, UTC day, provider, model and project.
+
+    Cost is integer micro-USD so repeated upserts never accumulate float drift.
+    The primary key leads with (owner_id, day), so a usage window is one
+    bounded range read of O(days x models) rows however large the corpus is.
+    """
+
+    __tablename__ = "usage_daily_rollups"
+
+    owner_id = Column(String(64), primary_key=True, server_default=text("''"))
+    day = Column(String(10), primary_key=True)
+    provider = Column(String(32), primary_key=True)
+    model = Column(String(255), primary_key=True)
+    project = Column(String(255), primary_key=True, server_default=text("''"))
+    input_tokens = Column(BigInteger, nullable=False, server_default=text("0"))
+    output_tokens = Column(BigInteger, nullable=False, server_default=text("0"))
+    cache_read_tokens = Column(BigInteger, nullable=False, server_default=text("0"))
+    cache_write_tokens = Column(BigInteger, nullable=False, server_default=text("0"))
+    cost_microusd = Column(BigInteger, nullable=False, server_default=text("0"))
+    responses = Column(BigInteger, nullable=False, server_default=text("0"))
+    commit_seq = Column(BigInteger, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (Index("ix_usage_daily_rollups_day", "day", "owner_id"),)
+
+
 class ProjectorState(CatalogBase):
     """One coalescing desired/completed revision row per projector/session."""
 
@@ -606,4 +675,6 @@ __all__ = [
     "SessionTombstone",
     "SourceEpoch",
     "StorageSession",
+    "UsageDailyRollup",
+    "UsageLedgerEntry",
 ]
@@ -36,6 +36,7 @@ from sqlalchemy import text
 from sqlalchemy.engine import make_url
 from sqlalchemy.pool import StaticPool
 from sqlalchemy.schema import CreateColumn
+from sqlalchemy.schema import CreateIndex
 
 from zerg.catalogd.models import CatalogBase
 from zerg.models.live_store import LiveBase
@@ -541,9 +542,12 @@ def _create_declared_indexes(engine: Engine, metadata: MetaData) -> None:
     indexes now rather than leaving production silently unindexed.
     """
 
-    for table in metadata.sorted_tables:
-        for index in table.indexes:
-            index.create(bind=engine, checkfirst=True)
+    # IF NOT EXISTS rather than checkfirst: reflection skips expression
+    # indexes, so checkfirst would try to recreate them on every start.
+    with engine.begin() as connection:
+        for table in metadata.sorted_tables:
+            for index in table.indexes:
+                connection.execute(CreateIndex(index, if_not_exists=True))
 
 
 def _user_version(connection) -> int:
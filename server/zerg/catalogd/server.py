@@ -33,6 +33,7 @@ from zerg.catalogd.schema import create_catalog_engine
 from zerg.catalogd.schema import initialize_catalog_schema
 from zerg.catalogd.schema import read_catalog_meta
 from zerg.catalogd.store import CatalogStore
+from zerg.services.usage_ledger import MAX_USAGE_DELTAS
 
 logger = logging.getLogger(__name__)
 
@@ -540,6 +541,12 @@ class CatalogDaemon:
             return await self._read_storage_health(request)
         if request.method == "storage.telemetry.summary.v2":
             return await self._read_storage_telemetry_summary(request)
+        if request.method == "usage.rollups.read.v2":
+            return await self._read_usage_rollups(request)
+        if request.method == "usage.ledger.fold.v2":
+            return await self._fold_usage_ledger(request)
+        if request.method == "usage.ledger.backfill.objects.v2":
+            return await self._list_usage_backfill_objects(request)
         if request.method == "storage.session.raw_manifest.v2":
             return await self._read_storage_session_raw_manifest(request)
         if request.method == "storage.session.render_manifest.v2":
@@ -1960,7 +1967,7 @@ class CatalogDaemon:
             "offset",
         }
         canonical_expected = expected | {"owner_id", "include_state_heads"}
-        if set(request.params) not in (expected, canonical_expected):
+        if set(request.params) - {"cursor"} not in (expected, canonical_expected):
             return self._error(request, "invalid_request", "session.timeline.list.v2 has invalid parameters")
         params = dict(request.params)
         for field, maximum in (("project", 255), ("provider", 64), ("environment", 32), ("device_id", 255)):
@@ -1976,11 +1983,21 @@ class CatalogDaemon:
             return self._error(request, "invalid_request", "limit must be an integer from 1 through 200")
         if type(params["offset"]) is not int or not 0 <= params["offset"] <= 1_000_000:
             return self._error(request, "invalid_request", "offset must be an integer from 0 through 1000000")
-        if set(params) == canonical_expected:
+        if set(params) - {"cursor"} == canonical_expected:
             if type(params["owner_id"]) is not int or params["owner_id"] <= 0:
                 return self._error(request, "invalid_request", "owner_id must be a positive integer")
             if params["include_state_heads"] is not True:
                 return self._error(request, "invalid_request", "include_state_heads must be true")
+        cursor = params.get("cursor")
+        if cursor is not None:
+            if not _is_timeline_cursor(cursor):
+                return self._error(
+                    request,
+                    "invalid_request",
+                    "cursor must be null or an object with unread (0 or 1), ISO order_at and canonical UUID session_id",
+                )
+            if params["offset"] != 0:
+                return self._error(request, "invalid_request", "cursor and offset cannot be combined")
         assert self._store is not None
         # Timeline is a read-only snapshot. Keep it on the read executor so a
         # projector claim/commit cannot queue the launch visibility path behind
@@ -2288,13 +2305,15 @@ class CatalogDaemon:
             "sealed_at",
         }
         # Optional so pre-rotation callers (legacy replay, direct commits) stay
-        # valid; absent means the envelope carried no conversation_reset records.
-        optional = {"conversation_resets"}
+        # valid; absent means the envelope carried no conversation_reset records
+        # or no metered provider responses.
+        optional = {"conversation_resets", "usage_deltas"}
         provided = set(request.params)
         if provided - expected - optional or expected - provided:
             return self._error(request, "invalid_request", "storage.raw_object.commit.v2 has invalid parameters")
         params = dict(request.params)
         params.setdefault("conversation_resets", [])
+        params.setdefault("usage_deltas", [])
         try:
             _validate_raw_object_commit(params)
         except ValueError as exc:
@@ -2699,6 +2718,56 @@ class CatalogDaemon:
         result = await self._run_read_store(self._store.read_storage_telemetry_summary)
         return CatalogRpcResponse(id=request.id, result=result)
 
+    async def _read_usage_rollups(self, request: CatalogRpcRequest) -> CatalogRpcResponse:
+        if set(request.params) != {"owner_ids", "start_day", "end_day"}:
+            return self._error(request, "invalid_request", "usage.rollups.read.v2 requires owner_ids, start_day and end_day")
+        owner_ids = request.params["owner_ids"]
+        try:
+            start_day = _usage_day(request.params["start_day"], "start_day")
+            end_day = _usage_day(request.params["end_day"], "end_day")
+            if owner_ids is not None:
+                if not isinstance(owner_ids, list) or not 1 <= len(owner_ids) <= MAX_USAGE_ROLLUP_OWNERS:
+                    raise ValueError(f"owner_ids must be null or contain 1 through {MAX_USAGE_ROLLUP_OWNERS} owners")
+                owner_ids = tuple(_canonical_storage_text(owner_id, field="owner_id", maximum_bytes=64) for owner_id in owner_ids)
+        except ValueError as exc:
+            return self._error(request, "invalid_request", str(exc))
+        span_days = (datetime.strptime(end_day, "%Y-%m-%d") - datetime.strptime(start_day, "%Y-%m-%d")).days
+        if not 0 <= span_days < MAX_USAGE_ROLLUP_DAYS:
+            return self._error(request, "invalid_request", f"usage windows must span 1 through {MAX_USAGE_ROLLUP_DAYS} days")
+        assert self._store is not None
+        result = await self._run_read_store(self._store.read_usage_rollups, owner_ids=owner_ids, start_day=start_day, end_day=end_day)
+        return CatalogRpcResponse(id=request.id, result=result)
+
+    async def _fold_usage_ledger(self, request: CatalogRpcRequest) -> CatalogRpcResponse:
+        if set(request.params) != {"session_id", "usage_deltas"}:
+            return self._error(request, "invalid_request", "usage.ledger.fold.v2 requires session_id and usage_deltas")
+        try:
+            session_id = _canonical_uuid(request.params["session_id"], "session_id")
+            usage_deltas = _validate_usage_deltas(request.params["usage_deltas"])
+        except ValueError as exc:
+            return self._error(request, "invalid_request", str(exc))
+        assert self._store is not None
+        result = await self._run_store(
+            self._store.fold_usage_deltas,
+            session_id=session_id,
+            usage_deltas=usage_deltas,
+            folded_at=datetime.now(UTC),
+        )
+        return CatalogRpcResponse(id=request.id, result=result)
+
+    async def _list_usage_backfill_objects(self, request: CatalogRpcRequest) -> CatalogRpcResponse:
+        if set(request.params) != {"after_envelope_id", "limit"}:
+            return self._error(request, "invalid_request", "usage.ledger.backfill.objects.v2 requires after_envelope_id and limit")
+        after_envelope_id = request.params["after_envelope_id"]
+        limit = request.params["limit"]
+        if after_envelope_id is not None and not _is_hash(after_envelope_id):
+            return self._error(request, "invalid_request", "after_envelope_id must be null or lowercase SHA-256 hex")
+        if type(limit) is not int or not 1 <= limit <= 500:
+            return self._error(request, "invalid_request", "limit must be an integer from 1 through 500")
+        assert self._store is not None
+        result = await self._run_read_store(self._store.list_usage_backfill_objects, after_envelope_id=after_envelope_id, limit=limit)
+        return CatalogRpcResponse(id=request.id, result=result)
+
     async def _read_storage_session_raw_manifest(self, request: CatalogRpcRequest) -> CatalogRpcResponse:
         if set(request.params) != {"session_id", "owner_id", "after_source_key", "limit"}:
             return self._error(request, "invalid_request", "storage.session.raw_manifest.v2 has invalid parameters")
@@ -3590,6 +3659,12 @@ class CatalogDaemon:
 
 
 _STORAGE_PROVIDER_RE = re.compile(r"[a-z0-9][a-z0-9_-]{0,31}\Z")
+_USAGE_DAY_RE = re.compile(r"\d{4}-\d{2}-\d{2}\Z")
+_USAGE_TOKEN_FIELDS = ("input_tokens", "output_tokens", "cache_read_tokens", "cache_write_tokens")
+_USAGE_DELTA_FIELDS = frozenset({"source_key", "model", "day", *_USAGE_TOKEN_FIELDS})
+# An admin window covers at most a year of days for at most this many owners.
+MAX_USAGE_ROLLUP_OWNERS = 1_000
+MAX_USAGE_ROLLUP_DAYS = 366
 
 
 def _canonical_uuid(value: object, field: str) -> uuid.UUID:
@@ -3715,9 +3790,43 @@ def _validate_raw_object_commit(params: dict) -> None:
         params["owner_id"] = _canonical_storage_text(owner_id, field="owner_id", maximum_bytes=64)
     params["session_facts"] = _validate_storage_session_facts(params["session_facts"])
     params["conversation_resets"] = _validate_conversation_resets(params["conversation_resets"])
+    params["usage_deltas"] = _validate_usage_deltas(params["usage_deltas"])
     params["sealed_at"] = _parse_datetime(params["sealed_at"], "sealed_at")
 
 
+def _validate_usage_deltas(value: object) -> tuple[dict, ...]:
+    """Validate per-response token usage extracted from one envelope."""
+
+    if not isinstance(value, list) or len(value) > MAX_USAGE_DELTAS:
+        raise ValueError(f"usage_deltas must contain at most {MAX_USAGE_DELTAS} responses")
+    deltas: list[dict] = []
+    for item in value:
+        if not isinstance(item, dict) or set(item) != _USAGE_DELTA_FIELDS:
+            raise ValueError("usage_deltas contains an invalid response")
+        delta = {
+            "source_key": _canonical_storage_text(item["source_key"], field="source_key", maximum_bytes=255),
+            "model": _canonical_storage_text(item["model"], field="model", maximum_bytes=255),
+            "day": _usage_day(item["day"], "day"),
+        }
+        for field in _USAGE_TOKEN_FIELDS:
+            count = item[field]
+            if type(count) is not int or not 0 <= count < 1 << 48:
+                raise ValueError(f"usage_deltas {field} must be a non-negative integer")
+            delta[field] = count
+        deltas.append(delta)
+    return tuple(deltas)
+
+
+def _usage_day(value: object, field: str) -> str:
+    if not isinstance(value, str) or _USAGE_DAY_RE.fullmatch(value) is None:
+        raise ValueError(f"{field} must be an ISO calendar day")
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError as exc:
+        raise ValueError(f"{field} must be an ISO calendar day") from exc
+    return value
+
+
 def _validate_conversation_resets(value: object) -> tuple[dict, ...]:
     """Validate native-id rotations extracted from conversation_reset records."""
 
@@ -4511,6 +4620,20 @@ def _is_canonical_uuid(value: object) -> bool:
     return parsed is not None and str(parsed) == value
 
 
+def _is_timeline_cursor(value: object) -> bool:
+    if not isinstance(value, dict) or set(value) != {"unread", "order_at", "session_id"}:
+        return False
+    if value["unread"] not in (0, 1) or type(value["unread"]) is not int:
+        return False
+    if not isinstance(value["order_at"], str):
+        return False
+    try:
+        datetime.fromisoformat(value["order_at"])
+    except ValueError:
+        return False
+    return _is_canonical_uuid(value["session_id"])
+
+
 def _parse_datetime(value: object, field: str) -> datetime:
     if not isinstance(value, str):
         raise ValueError(f"{field} must be an ISO-8601 UTC datetime string")
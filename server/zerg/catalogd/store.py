@@ -43,6 +43,7 @@ from zerg.catalogd.fact_reducer import ReducerFact
 from zerg.catalogd.fact_reducer import read_bounded_session_fact_heads
 from zerg.catalogd.fact_reducer import read_bounded_sessions_fact_heads
 from zerg.catalogd.fact_reducer import read_session_fact_heads
+from zerg.catalogd.fact_reducer import reduce_fact_batch_bulk
 from zerg.catalogd.fact_reducer import reduce_fact_batch_setwise
 from zerg.catalogd.fact_reducer import reducer_facts_from_machine_evidence
 from zerg.catalogd.models import FactConflict
@@ -62,6 +63,8 @@ from zerg.catalogd.models import SessionMediaRef
 from zerg.catalogd.models import SessionTombstone as LiveSessionTombstone
 from zerg.catalogd.models import SourceEpoch as LiveSourceEpoch
 from zerg.catalogd.models import StorageSession
+from zerg.catalogd.models import UsageDailyRollup
+from zerg.catalogd.models import UsageLedgerEntry
 from zerg.catalogd.schema import catalog_meta
 from zerg.catalogd.schema import storage_telemetry_counters
 from zerg.embedding_space import EMBEDDING_PROJECTOR_ID
@@ -113,6 +116,8 @@ from zerg.services.session_visibility_policy import evaluate_origin_visibility
 from zerg.services.session_visibility_policy import primary_worker_only_clause
 from zerg.services.session_visibility_policy import title_origin_eligible_clause
 from zerg.services.session_visibility_policy import visible_in_test_scope
+from zerg.services.usage_ledger import UNKNOWN_MODEL
+from zerg.services.usage_ledger import usage_cost_microusd
 from zerg.services.workspace_suggestion_projection import WORKSPACE_CANDIDATE_MAX_PAGES
 from zerg.services.workspace_suggestion_projection import WORKSPACE_CANDIDATE_PAGE_SIZE
 from zerg.services.workspace_suggestion_projection import WorkspaceSessionFacts
@@ -154,6 +159,70 @@ def _has_durable_timeline_content(row) -> Any:
     )
 
 
+def _timeline_cursor_instant(value: datetime | str) -> datetime:
+    """Normalize a keyset anchor to the naive UTC form SQLite compares."""
+
+    instant = datetime.fromisoformat(value) if isinstance(value, str) else value
+    if instant.tzinfo is not None:
+        instant = instant.astimezone(UTC).replace(tzinfo=None)
+    return instant
+
+
+def _timeline_keyset_page(
+    connection,
+    arms: list[tuple[Any, Any, Any, Any, list[Any]]],
+    *,
+    since: datetime,
+    cursor: dict[str, Any] | None,
+    limit: int,
+) -> list[dict[str, Any]]:
+    """Return up to ``limit + 1`` timeline rows strictly after ``cursor``.
+
+    Rows come in page order (unread desc, anchor desc, session id desc). The
+    unread phase is read first, then the recency-windowed phase. Each arm is
+    an ordered range scan on its anchor index bounded by ``LIMIT``, so a page
+    reads at most ``limit + 1`` rows per arm however deep the cursor is.
+    """
+
+    rows: list[dict[str, Any]] = []
+    after_unread = int(cursor["unread"]) if cursor is not None else 1
+    after_at = _timeline_cursor_instant(cursor["order_at"]) if cursor is not None else None
+    after_id = str(cursor["session_id"]) if cursor is not None else None
+    for phase in (1, 0):
+        remaining = limit + 1 - len(rows)
+        if phase > after_unread or remaining <= 0:
+            continue
+        arm_pages = []
+        for source, session_col, anchor, unread, where in arms:
+            # Outside the unread phase the recency window reduces to a plain
+            # lower bound on the anchor, which the index can range over.
+            clauses = [*where, unread] if phase else [*where, ~unread, anchor >= since]
+            if cursor is not None and phase == after_unread:
+                # A row-value bound keeps the scan a single ordered range;
+                # the equivalent OR splits into two scans plus a sort.
+                clauses.append(tuple_(anchor, session_col) < tuple_(after_at, after_id))
+            arm_pages.append(
+                select(session_col.label("session_id"), anchor.label("order_at"))
+                .select_from(source)
+                .where(*clauses)
+                .order_by(anchor.desc(), session_col.desc())
+                .limit(remaining)
+                .subquery()
+            )
+        merged = union_all(*(select(page.c.session_id, page.c.order_at) for page in arm_pages)).subquery()
+        for session_id, order_at in connection.execute(
+            select(merged.c.session_id, merged.c.order_at).order_by(merged.c.order_at.desc(), merged.c.session_id.desc()).limit(remaining)
+        ):
+            rows.append(
+                {
+                    "session_id": str(session_id),
+                    "order_at": _timeline_cursor_instant(order_at).isoformat(),
+                    "unread": phase,
+                }
+            )
+    return rows
+
+
 def _empty_human_helm_is_open(*, session_id, thread_id, observed_at: datetime) -> Any:
     """Admit an empty human Helm only on canonical current-work evidence.
 
@@ -2275,7 +2344,9 @@ class CatalogStore:
                 events=events,
                 updated_runtime_keys=set(result.updated_runtime_keys),
             )
-            reduced = reduce_fact_batch_setwise(
+            # A runtime batch is not bounded by the heartbeat wire limit; one
+            # phase signal per session across hundreds of sessions is normal.
+            reduced = reduce_fact_batch_bulk(
                 connection,
                 activity_facts,
                 received_at=observed_at,
@@ -4837,8 +4908,13 @@ class CatalogStore:
         offset: int,
         owner_id: int | None = None,
         include_state_heads: bool = False,
+        cursor: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Return one bounded timeline page and all raw facts in one snapshot."""
+        """Return one bounded timeline page and all raw facts in one snapshot.
+
+        ``cursor`` is the ``next_cursor`` of the previous page. Cursor pages
+        skip the candidate count and report ``total`` as ``None``.
+        """
 
         observed_at = datetime.now(UTC)
         since = observed_at - timedelta(days=days_back)
@@ -4974,6 +5050,13 @@ class CatalogStore:
                         ),
                     )
                 )
+            legacy_anchor = func.coalesce(card.c.last_activity_at, card.c.started_at)
+            joined = card.join(catalog, catalog.c.session_id == card.c.session_id)
+            storage_joined = storage.outerjoin(catalog, catalog.c.session_id == storage.c.session_id).outerjoin(
+                LiveSession.__table__, LiveSession.__table__.c.session_id == storage.c.session_id
+            )
+            # Each arm is (source, session id, activity anchor, unread, where).
+            arms: list[tuple[Any, Any, Any, Any, list[Any]]] = []
             if include_state_heads:
                 if owner_id is None:
                     raise ValueError("canonical timeline projection requires owner_id")
@@ -4986,46 +5069,96 @@ class CatalogStore:
                     )
                     .exists()
                 )
+                arms.append((joined, card.c.session_id, legacy_anchor, legacy_unread, legacy_where))
                 # Storage-v2 ingest may not carry the machine token's owner
                 # binding, while the managed lease has already bound the
                 # session in the live store. Match the detail/read ownership
                 # rule: live ownership wins, with storage ownership as the
-                # fallback for sessions that have no live row yet.
-                storage_owner = func.coalesce(LiveSession.__table__.c.owner_id, storage.c.owner_id)
-                storage_where.append(storage_owner == owner_text)
-
-            joined = card.join(catalog, catalog.c.session_id == card.c.session_id)
-            storage_joined = storage.outerjoin(catalog, catalog.c.session_id == storage.c.session_id).outerjoin(
-                LiveSession.__table__, LiveSession.__table__.c.session_id == storage.c.session_id
-            )
-            candidates = union_all(
-                select(
-                    card.c.session_id.label("session_id"),
-                    func.coalesce(card.c.last_activity_at, card.c.started_at).label("order_at"),
-                    case((legacy_unread, 1), else_=0).label("unread"),
-                )
-                .select_from(joined)
-                .where(*legacy_where),
-                select(
-                    storage.c.session_id.label("session_id"),
-                    storage.c.last_activity_at.label("order_at"),
-                    case((storage_unread, 1), else_=0).label("unread"),
-                )
-                .select_from(storage_joined)
-                .where(*storage_where),
-            ).subquery()
-            total = int(connection.execute(select(func.count()).select_from(candidates)).scalar_one())
-            # Unread first so acknowledgement-pending sessions can never be
-            # paged out of the first window; clients do their own visual sort.
-            session_ids = [
-                str(value)
-                for value in connection.execute(
-                    select(candidates.c.session_id)
-                    .order_by(candidates.c.unread.desc(), candidates.c.order_at.desc(), candidates.c.session_id.desc())
-                    .limit(limit)
-                    .offset(offset)
-                ).scalars()
-            ]
+                # fallback for sessions that have no live row yet. The rule is
+                # split into disjoint arms by storage owner so the common cases
+                # (storage owner agrees, or is not yet bound) walk
+                # ix_sessions_owner_activity in order. A storage row bound to
+                # another owner is only reachable through the live owner; its
+                # anchor is wrapped (last_activity_at is NOT NULL) so SQLite
+                # drives that arm from ix_live_sessions_owner_id rather than
+                # scanning every owner's sessions by activity.
+                live_owner = LiveSession.__table__.c.owner_id
+                for storage_owner, live_rule, anchor in (
+                    (
+                        storage.c.owner_id == owner_text,
+                        or_(live_owner.is_(None), live_owner == owner_text),
+                        storage.c.last_activity_at,
+                    ),
+                    (storage.c.owner_id.is_(None), live_owner == owner_text, storage.c.last_activity_at),
+                    (
+                        storage.c.owner_id != owner_text,
+                        live_owner == owner_text,
+                        func.coalesce(storage.c.last_activity_at, storage.c.started_at),
+                    ),
+                ):
+                    arms.append(
+                        (
+                            storage_joined,
+                            storage.c.session_id,
+                            anchor,
+                            storage_unread,
+                            [*storage_where, storage_owner, live_rule],
+                        )
+                    )
+            else:
+                arms.append((joined, card.c.session_id, legacy_anchor, legacy_unread, legacy_where))
+                arms.append((storage_joined, storage.c.session_id, storage.c.last_activity_at, storage_unread, storage_where))
+
+            total: int | None = None
+            if cursor is None:
+                # Deeper pages carry the first page's total in their cursor.
+                counted = union_all(
+                    *(
+                        select(session_col.label("session_id")).select_from(source).where(*where)
+                        for source, session_col, _anchor, _unread, where in arms
+                    )
+                ).subquery()
+                total = int(connection.execute(select(func.count()).select_from(counted)).scalar_one())
+
+            next_cursor: dict[str, Any] | None = None
+            if offset:
+                # Offset paging (older clients) still ranks every candidate.
+                candidates = union_all(
+                    *(
+                        select(
+                            session_col.label("session_id"),
+                            anchor.label("order_at"),
+                            case((unread, 1), else_=0).label("unread"),
+                        )
+                        .select_from(source)
+                        .where(*where)
+                        for source, session_col, anchor, unread, where in arms
+                    )
+                ).subquery()
+                # Unread first so acknowledgement-pending sessions can never be
+                # paged out of the first window; clients do their own visual sort.
+                session_ids = [
+                    str(value)
+                    for value in connection.execute(
+                        select(candidates.c.session_id)
+                        .order_by(candidates.c.unread.desc(), candidates.c.order_at.desc(), candidates.c.session_id.desc())
+                        .limit(limit)
+                        .offset(offset)
+                    ).scalars()
+                ]
+            else:
+                # Keyset paging in the same (unread, anchor, session id) order:
+                # unread sessions first, then everything else, each phase an
+                # ordered merge of per-arm index range scans bounded by limit.
+                page = _timeline_keyset_page(connection, arms, since=since, cursor=cursor, limit=limit)
+                session_ids = [row["session_id"] for row in page[:limit]]
+                if len(page) > limit:
+                    last = page[limit - 1]
+                    next_cursor = {
+                        "unread": last["unread"],
+                        "order_at": last["order_at"],
+                        "session_id": last["session_id"],
+                    }
             facts = _assemble_session_facts(
                 connection,
                 session_ids=session_ids,
@@ -5075,6 +5208,7 @@ class CatalogStore:
                 ],
                 "total": total,
                 "has_real_sessions": has_real_sessions,
+                "next_cursor": next_cursor,
             }
 
     def read_session(self, *, session_id: str, owner_id: int | None = None) -> dict[str, Any]:
@@ -6420,6 +6554,7 @@ class CatalogStore:
         session_facts: dict[str, Any],
         sealed_at: datetime,
         conversation_resets: tuple[dict[str, Any], ...] = (),
+        usage_deltas: tuple[dict[str, Any], ...] = (),
     ) -> dict[str, Any]:
         del protocol_version  # validated as v2 by the RPC boundary
         identity = EnvelopeIdentity(
@@ -6922,6 +7057,18 @@ class CatalogStore:
                     created_at=commit_time,
                 )
             )
+            # Folded only on first insert: an exact replay returned above, so
+            # live ingest never double counts its own envelopes.
+            _fold_usage_deltas(
+                connection,
+                session_key=session_key,
+                owner_id=owner_id if owner_id is not None else (existing_session or {}).get("owner_id"),
+                provider=provider,
+                project=session_facts["project"] or (existing_session or {}).get("project"),
+                usage_deltas=usage_deltas,
+                commit_seq=commit_seq,
+                now=commit_time,
+            )
             missing_object_hashes = sorted(media_hash for media_hash in missing_media_hashes if media_hash not in media_by_hash)
             if missing_object_hashes:
                 connection.execute(
@@ -9059,6 +9206,109 @@ class CatalogStore:
                 "observed_at": observed_at.isoformat(),
             }
 
+    def fold_usage_deltas(self, *, session_id: UUID, usage_deltas: tuple[dict[str, Any], ...], folded_at: datetime) -> dict[str, Any]:
+        """Fold backfilled usage for one storage session; already-counted responses are ignored."""
+
+        table = StorageSession.__table__
+        session_key = str(session_id)
+        with _write_transaction(self.engine) as connection:
+            session = (
+                connection.execute(select(table.c.owner_id, table.c.provider, table.c.project).where(table.c.session_id == session_key))
+                .mappings()
+                .first()
+            )
+            if session is None:
+                return {"missing": True, "folded": 0, "commit_seq": str(_current_commit_seq(connection))}
+            commit_seq = _advance_commit_seq(connection, folded_at)
+            folded = _fold_usage_deltas(
+                connection,
+                session_key=session_key,
+                owner_id=session["owner_id"],
+                provider=str(session["provider"]),
+                project=session["project"],
+                usage_deltas=usage_deltas,
+                commit_seq=commit_seq,
+                now=folded_at,
+            )
+        return {"folded": folded, "commit_seq": str(commit_seq)}
+
+    def list_usage_backfill_objects(self, *, after_envelope_id: str | None, limit: int) -> dict[str, Any]:
+        """Page live raw objects in envelope-id order for the usage backfill."""
+
+        raw = LiveRawObject.__table__
+        query = (
+            select(
+                raw.c.envelope_id, raw.c.session_id, raw.c.provider, raw.c.tenant_id, raw.c.object_path, raw.c.object_hash, raw.c.sealed_at
+            )
+            .where(raw.c.retired_at.is_(None))
+            .order_by(raw.c.envelope_id)
+            .limit(limit + 1)
+        )
+        if after_envelope_id is not None:
+            query = query.where(raw.c.envelope_id > after_envelope_id)
+        with _read_snapshot(self.engine) as connection:
+            rows = connection.execute(query).mappings().all()
+        page = rows[:limit]
+        return {
+            "objects": [
+                {
+                    "envelope_id": str(row["envelope_id"]),
+                    "session_id": str(row["session_id"]),
+                    "provider": str(row["provider"]),
+                    "tenant_id": str(row["tenant_id"]),
+                    "object_path": str(row["object_path"]),
+                    "object_hash": str(row["object_hash"]),
+                    "sealed_at": _as_aware_utc(row["sealed_at"]).isoformat(),
+                }
+                for row in page
+            ],
+            "next_after_envelope_id": str(page[-1]["envelope_id"]) if len(rows) > limit else None,
+        }
+
+    def read_usage_rollups(self, *, owner_ids: tuple[str, ...] | None, start_day: str, end_day: str) -> dict[str, Any]:
+        """Sum daily rollups per owner and day over an inclusive UTC day range."""
+
+        table = UsageDailyRollup.__table__
+        query = (
+            select(
+                table.c.owner_id,
+                table.c.day,
+                func.sum(table.c.input_tokens).label("input_tokens"),
+                func.sum(table.c.output_tokens).label("output_tokens"),
+                func.sum(table.c.cache_read_tokens).label("cache_read_tokens"),
+                func.sum(table.c.cache_write_tokens).label("cache_write_tokens"),
+                func.sum(table.c.cost_microusd).label("cost_microusd"),
+                func.sum(table.c.responses).label("responses"),
+            )
+            .where(table.c.day >= start_day, table.c.day <= end_day)
+            .group_by(table.c.owner_id, table.c.day)
+            .order_by(table.c.owner_id, table.c.day)
+        )
+        if owner_ids is not None:
+            query = query.where(table.c.owner_id.in_(owner_ids))
+        with _read_snapshot(self.engine) as connection:
+            rows = connection.execute(query).mappings().all()
+        return {
+            "rows": [
+                {
+                    "owner_id": str(row["owner_id"]),
+                    "day": str(row["day"]),
+                    **{
+                        field: int(row[field] or 0)
+                        for field in (
+                            "input_tokens",
+                            "output_tokens",
+                            "cache_read_tokens",
+                            "cache_write_tokens",
+                            "cost_microusd",
+                            "responses",
+                        )
+                    },
+                }
+                for row in rows
+            ]
+        }
+
     def read_storage_telemetry_summary(self) -> dict[str, Any]:
         """Return O(1) transactional storage and projector counters."""
 
@@ -12883,6 +13133,108 @@ def _current_commit_seq(connection) -> int:
     return value
 
 
+_USAGE_TOKEN_FIELDS = ("input_tokens", "output_tokens", "cache_read_tokens", "cache_write_tokens")
+_USAGE_TOTAL_FIELDS = (*_USAGE_TOKEN_FIELDS, "cost_microusd", "responses")
+
+
+def _fold_usage_deltas(
+    connection,
+    *,
+    session_key: str,
+    owner_id: object,
+    provider: str,
+    project: str | None,
+    usage_deltas: tuple[dict[str, Any], ...],
+    commit_seq: int,
+    now: datetime,
+) -> int:
+    """Record ledger entries and add what they grew by to their daily rollup rows.
+
+    A response already in the ledger keeps the larger of each counter, and only
+    the increase reaches the rollup, so it counts once at its fullest report
+    whichever envelopes carried it. Returns how many entries were added or grew.
+    """
+
+    if not usage_deltas:
+        return 0
+    entries = UsageLedgerEntry.__table__
+    rollups = UsageDailyRollup.__table__
+    owner_key = str(owner_id) if owner_id is not None else ""
+    session_model: str | None = None
+    totals: dict[tuple[str, str], dict[str, int]] = {}
+    folded = 0
+    for delta in usage_deltas:
+        reported = {field: int(delta[field]) for field in _USAGE_TOKEN_FIELDS}
+        entry_key = (entries.c.session_id == session_key, entries.c.source_key == delta["source_key"])
+        previous = connection.execute(
+            select(entries.c.day, entries.c.model, *(entries.c[field] for field in _USAGE_TOKEN_FIELDS)).where(*entry_key)
+        ).first()
+        if previous is None:
+            day, model = delta["day"], str(delta["model"])
+            if model == UNKNOWN_MODEL:
+                # Codex names its model once per turn_context, which may have
+                # shipped in an earlier envelope of the same session.
+                if session_model is None:
+                    session_model = (
+                        connection.execute(
+                            select(entries.c.model)
+                            .where(entries.c.session_id == session_key, entries.c.model != UNKNOWN_MODEL)
+                            .order_by(entries.c.commit_seq.desc())
+                            .limit(1)
+                        ).scalar_one_or_none()
+                        or UNKNOWN_MODEL
+                    )
+                model = session_model
+            before = dict.fromkeys(_USAGE_TOKEN_FIELDS, 0)
+            after = reported
+            connection.execute(
+                sqlite_insert(entries).values(
+                    session_id=session_key,
+                    source_key=delta["source_key"],
+                    owner_id=owner_key,
+                    day=day,
+                    model=model,
+                    **after,
+                    commit_seq=commit_seq,
+                )
+            )
+        else:
+            day, model = previous.day, previous.model
+            before = {field: int(previous._mapping[field]) for field in _USAGE_TOKEN_FIELDS}
+            after = {field: max(before[field], reported[field]) for field in _USAGE_TOKEN_FIELDS}
+            if after == before:
+                continue
+            connection.execute(update(entries).where(*entry_key).values(**after, commit_seq=commit_seq))
+        folded += 1
+        row = totals.setdefault((day, model), dict.fromkeys(_USAGE_TOTAL_FIELDS, 0))
+        for field in _USAGE_TOKEN_FIELDS:
+            row[field] += after[field] - before[field]
+        row["cost_microusd"] += usage_cost_microusd(model, **after) - usage_cost_microusd(model, **before)
+        row["responses"] += 1 if previous is None else 0
+    for (day, model), values in totals.items():
+        statement = sqlite_insert(rollups).values(
+            owner_id=owner_key,
+            day=day,
+            provider=provider,
+            model=model,
+            project=project or "",
+            **values,
+            commit_seq=commit_seq,
+            updated_at=now,
+        )
+        connection.execute(
+            statement.on_conflict_do_update(
+                index_elements=["owner_id", "day", "provider", "model", "project"],
+                set_={
+                    **{field: rollups.c[field] + statement.excluded[field] for field in _USAGE_TOTAL_FIELDS},
+                    "commit_seq": commit_seq,
+                    "updated_at": now,
+                },
+            )
+        )
+    return folded
+
+
 def _advance_commit_seq(connection, now: datetime) -> int:
     return connection.execute(
         update(catalog_meta)
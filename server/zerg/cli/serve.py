@@ -13,9 +13,12 @@ import base64
 import ipaddress
 import os
 import secrets
+import shutil
 import signal
 import socket
+import subprocess
 import sys
+import tempfile
 import time
 from pathlib import Path
 from typing import Optional
@@ -27,6 +30,24 @@ from zerg.services.longhouse_paths import resolve_longhouse_home
 
 app = typer.Typer(help="Longhouse server commands")
 
+# Shared by the single-process server and every process of a multi-worker one.
+UVICORN_RUN_OPTIONS: dict[str, object] = {
+    "log_level": "info",
+    # Per-request access logs (presence/heartbeat polls) drown the
+    # structured application records in the journal; uvicorn.error still
+    # logs real server failures. Uvicorn's own log config is applied at
+    # startup, so suppressing uvicorn.access in configure_logging is not
+    # enough.
+    "access_log": False,
+    # Machine Agent control uses an app-level heartbeat. Uvicorn protocol
+    # pings have been flaky behind hosted proxies for non-browser clients,
+    # and the control route has its own receive timeout for stale sockets.
+    "ws_ping_interval": None,
+}
+# The control process binds its socket only after lifespan startup, which
+# includes a catalogd cold start (up to 90 seconds on large catalogs).
+CONTROL_READINESS_TIMEOUT_SECONDS = 180.0
+
 
 def _get_lan_ip() -> str | None:
     """Return the LAN IP the OS would use for outbound traffic.
@@ -297,6 +318,81 @@ def _daemonize() -> None:
     pid_file.chmod(0o600)
 
 
+def _wait_for_unix_socket(path: Path, process: subprocess.Popen, *, timeout_seconds: float, name: str) -> None:
+    deadline = time.monotonic() + timeout_seconds
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{name} exited with code {process.returncode} before it was ready")
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(str(path))
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"{name} was not ready within {timeout_seconds:.0f}s")
+
+
+def _stop_child(process: subprocess.Popen) -> None:
+    if process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def _serve_with_control_process(uvicorn_module, *, host: str, port: int, workers: int) -> None:
+    """Run N stateless HTTP workers in front of one control process.
+
+    - ``zerg.pubsubd`` fans session pubsub out so every process sees every
+      publish with the same seqs.
+    - The control process (``zerg.cli.serve_control``) runs the full
+      lifespan (catalogd/searchd supervisors, projectors, maintenance) and
+      serves on a private Unix socket.
+    - The HTTP workers serve reads on ``host:port``, attach to control's
+      daemons, and forward writes and WebSockets to control.
+    """
+    from zerg.process_role import CONTROL_SOCKET_ENV
+    from zerg.process_role import PROCESS_ROLE_ENV
+    from zerg.process_role import ROLE_CONTROL
+    from zerg.process_role import ROLE_HTTP
+    from zerg.services.pubsub_fanout import PUBSUB_SOCKET_ENV
+
+    # mkdtemp gives a 0700 directory; the sockets inside are reachable only
+    # by this user. Keep it under /tmp so socket paths stay short.
+    run_dir = Path(tempfile.mkdtemp(prefix=f"lhmw-{os.getuid()}-", dir="/tmp"))
+    pubsub_socket = run_dir / "pubsub.sock"
+    control_socket = run_dir / "control.sock"
+    shared_env = {PUBSUB_SOCKET_ENV: str(pubsub_socket), CONTROL_SOCKET_ENV: str(control_socket)}
+    children: list[subprocess.Popen] = []
+    try:
+        broker = subprocess.Popen(
+            [sys.executable, "-m", "zerg.pubsubd", "--socket", str(pubsub_socket)],
+            env={**os.environ, **shared_env},
+        )
+        children.append(broker)
+        _wait_for_unix_socket(pubsub_socket, broker, timeout_seconds=15.0, name="pubsub broker")
+        control = subprocess.Popen(
+            [sys.executable, "-m", "zerg.cli.serve_control"],
+            env={**os.environ, **shared_env, PROCESS_ROLE_ENV: ROLE_CONTROL},
+        )
+        children.append(control)
+        _wait_for_unix_socket(control_socket, control, timeout_seconds=CONTROL_READINESS_TIMEOUT_SECONDS, name="control process")
+
+        os.environ.update(shared_env)
+        os.environ[PROCESS_ROLE_ENV] = ROLE_HTTP
+        uvicorn_module.run("zerg.main:app", host=host, port=port, workers=workers, **UVICORN_RUN_OPTIONS)
+    except RuntimeError as exc:
+        typer.secho(f"ERROR: {exc}", fg=typer.colors.RED)
+        raise typer.Exit(code=1) from exc
+    finally:
+        for child in reversed(children):
+            _stop_child(child)
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+
 def _build_demo_db(db_path: Path) -> None:
     """Build the same storage-v2 corpus used by the marketing harness."""
     from zerg.services.demo_database import build_demo_database
@@ -456,7 +552,6 @@ def serve(
         os.environ["DATABASE_URL"] = db
 
     db_url = os.environ["DATABASE_URL"]
-    is_sqlite = db_url.startswith("sqlite")
 
     # Safety gate: never expose an unauthenticated server on a public interface.
     # Evaluate the full set of auth-disabling inputs (AUTH_DISABLED/DEMO_MODE/
@@ -516,10 +611,14 @@ def serve(
             typer.echo("  re-run with --allow-public-no-auth to accept the risk.")
             raise typer.Exit(code=1)
 
-    # Prevent SQLite with multiple workers (Longhouse is SQLite-only).
-    if is_sqlite and workers > 1:
+    # Multiple workers need the file-backed live catalog: HTTP workers never
+    # write SQLite themselves, every write funnels through control + catalogd.
+    from zerg.config import resolve_live_database_url
+
+    multi_worker = workers > 1 and not reload
+    if multi_worker and not resolve_live_database_url(db_url):
         typer.secho(
-            "ERROR: SQLite does not support multiple workers.",
+            "ERROR: Multiple workers need a file-backed SQLite database.",
             fg=typer.colors.RED,
         )
         typer.echo("  Use --workers 1.")
@@ -586,6 +685,8 @@ def serve(
     typer.echo(f"  Frontend: {frontend_source}")
     if daemon:
         typer.echo("  Daemon: yes")
+    if multi_worker:
+        typer.echo(f"  Workers: {workers} HTTP + 1 control")
     if reload:
         typer.echo("  Reload: enabled")
     typer.echo("")
@@ -633,23 +734,17 @@ def serve(
         typer.echo(f"Starting daemon... (log: {_get_log_file()})")
         _daemonize()
 
+    if multi_worker:
+        _serve_with_control_process(uvicorn, host=host, port=port, workers=workers)
+        return
+
     uvicorn.run(
         "zerg.main:app",
         host=host,
         port=port,
         reload=reload,
-        workers=workers if not reload else 1,
-        log_level="info",
-        # Per-request access logs (presence/heartbeat polls) drown the
-        # structured application records in the journal; uvicorn.error still
-        # logs real server failures. Uvicorn's own log config is applied at
-        # startup, so suppressing uvicorn.access in configure_logging is not
-        # enough.
-        access_log=False,
-        # Machine Agent control uses an app-level heartbeat. Uvicorn protocol
-        # pings have been flaky behind hosted proxies for non-browser clients,
-        # and the control route has its own receive timeout for stale sockets.
-        ws_ping_interval=None,
+        workers=1,
+        **UVICORN_RUN_OPTIONS,
     )
 
 
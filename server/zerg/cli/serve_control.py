@@ -0,0 +1,29 @@
+"""Control process of a multi-worker ``longhouse serve --workers N``.
+
+Started by ``longhouse serve``; runs the full application lifespan with
+``LONGHOUSE_PROCESS_ROLE=control`` and serves only on the private Unix socket
+named by ``LONGHOUSE_CONTROL_SOCKET``, where the HTTP workers forward writes
+and WebSockets.
+"""
+
+from __future__ import annotations
+
+from zerg.process_role import CONTROL_SOCKET_ENV
+from zerg.process_role import ROLE_CONTROL
+from zerg.process_role import control_socket_path
+from zerg.process_role import process_role
+
+
+def main() -> None:
+    import uvicorn
+
+    from zerg.cli.serve import UVICORN_RUN_OPTIONS
+
+    socket_path = control_socket_path()
+    if socket_path is None or process_role() != ROLE_CONTROL:
+        raise SystemExit(f"serve_control requires LONGHOUSE_PROCESS_ROLE=control and {CONTROL_SOCKET_ENV}")
+    uvicorn.run("zerg.main:app", uds=str(socket_path), workers=1, **UVICORN_RUN_OPTIONS)
+
+
+if __name__ == "__main__":
+    main()
@@ -2321,31 +2321,106 @@ def _auto_add_missing_columns(
     return [(t, c) for t, c, _ in pending]
 
 
+# Bulk ingest indexes events through a durable journal instead of dropping the
+# FTS triggers. A session listed in ``events_fts_deferred_sessions`` has its
+# event inserts appended to ``events_fts_pending`` (inside the inserting
+# transaction) rather than indexed inline; the FTS indexer drains the journal
+# in bounded batches. Invariant: every ``events`` row is either in
+# ``events_fts`` or in ``events_fts_pending``, never both, so the update and
+# delete triggers only touch the index for rows that are actually in it. A
+# rolled-back ingest rolls back its journal rows with its events, so nothing
+# ever needs a full rebuild.
+_EVENTS_FTS_JOURNAL_DDL = (
+    """
+    CREATE TABLE IF NOT EXISTS events_fts_pending (
+        event_id INTEGER PRIMARY KEY,
+        enqueued_at INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS events_fts_deferred_sessions (
+        session_id TEXT PRIMARY KEY,
+        deferred_at INTEGER NOT NULL
+    )
+    """,
+)
+_EVENTS_FTS_TRIGGER_DDL = {
+    "events_ai": """
+        CREATE TRIGGER events_ai AFTER INSERT ON events
+        WHEN NOT EXISTS (SELECT 1 FROM events_fts_deferred_sessions d WHERE d.session_id = new.session_id)
+        BEGIN
+          INSERT INTO events_fts(rowid, content_text, tool_output_text, tool_name, role, session_id)
+          VALUES (new.id, new.content_text, new.tool_output_text, new.tool_name, new.role, new.session_id);
+        END
+        """,
+    "events_ai_journal": """
+        CREATE TRIGGER events_ai_journal AFTER INSERT ON events
+        WHEN EXISTS (SELECT 1 FROM events_fts_deferred_sessions d WHERE d.session_id = new.session_id)
+        BEGIN
+          INSERT OR IGNORE INTO events_fts_pending(event_id, enqueued_at)
+          VALUES (new.id, CAST(strftime('%s', 'now') AS INTEGER));
+        END
+        """,
+    "events_ad": """
+        CREATE TRIGGER events_ad AFTER DELETE ON events BEGIN
+          INSERT INTO events_fts(
+            events_fts, rowid, content_text, tool_output_text,
+            tool_name, role, session_id
+          )
+          SELECT
+            'delete', old.id, old.content_text, old.tool_output_text,
+            old.tool_name, old.role, old.session_id
+          WHERE NOT EXISTS (SELECT 1 FROM events_fts_pending p WHERE p.event_id = old.id);
+          DELETE FROM events_fts_pending WHERE event_id = old.id;
+        END
+        """,
+    "events_au": """
+        CREATE TRIGGER events_au AFTER UPDATE ON events BEGIN
+          INSERT INTO events_fts(
+            events_fts, rowid, content_text, tool_output_text,
+            tool_name, role, session_id
+          )
+          SELECT
+            'delete', old.id, old.content_text, old.tool_output_text,
+            old.tool_name, old.role, old.session_id
+          WHERE NOT EXISTS (SELECT 1 FROM events_fts_pending p WHERE p.event_id = old.id);
+          INSERT INTO events_fts(rowid, content_text, tool_output_text, tool_name, role, session_id)
+          SELECT new.id, new.content_text, new.tool_output_text, new.tool_name, new.role, new.session_id
+          WHERE NOT EXISTS (SELECT 1 FROM events_fts_pending p WHERE p.event_id = new.id);
+        END
+        """,
+}
+
+
 def _ensure_agents_fts(engine: Engine) -> None:
-    """Ensure FTS5 index and triggers exist for agent events (SQLite only)."""
+    """Ensure FTS5 index, pending-index journal, and triggers exist (SQLite only)."""
     try:
         with engine.connect() as conn:
             object_rows = conn.exec_driver_sql(
                 """
-                SELECT type, name
+                SELECT type, name, sql
                 FROM sqlite_master
-                WHERE (type = 'table' AND name = 'events_fts')
-                   OR (type = 'trigger' AND name IN ('events_ai', 'events_ad', 'events_au'))
+                WHERE (type = 'table' AND name IN ('events_fts', 'events_fts_pending', 'events_fts_deferred_sessions'))
+                   OR (type = 'trigger' AND name IN ('events_ai', 'events_ai_journal', 'events_ad', 'events_au'))
                 """
             ).fetchall()
-            existing_objects = {(str(row[0]), str(row[1])) for row in object_rows}
+            existing_objects = {(str(row[0]), str(row[1])): str(row[2] or "") for row in object_rows}
             fts_exists = ("table", "events_fts") in existing_objects
-            missing_triggers = {
-                "events_ai",
-                "events_ad",
-                "events_au",
-            } - {name for obj_type, name in existing_objects if obj_type == "trigger"}
+            journal_exists = all(("table", name) in existing_objects for name in ("events_fts_pending", "events_fts_deferred_sessions"))
+            # Re-create any trigger whose definition changed, e.g. the inline
+            # triggers from before the journal, which would delete journaled
+            # rows that were never indexed.
+            stale_triggers = [
+                name
+                for name, ddl in _EVENTS_FTS_TRIGGER_DDL.items()
+                if " ".join(existing_objects.get(("trigger", name), "").split()) != " ".join(ddl.split())
+            ]
 
             fts_has_rows = fts_exists and conn.exec_driver_sql("SELECT 1 FROM events_fts LIMIT 1").fetchone() is not None
             events_has_rows = conn.exec_driver_sql("SELECT 1 FROM events LIMIT 1").fetchone() is not None
             needs_rebuild = fts_exists and not fts_has_rows and events_has_rows
 
-        if fts_exists and not missing_triggers and not needs_rebuild:
+        if fts_exists and journal_exists and not stale_triggers and not needs_rebuild:
             return
 
         with engine.begin() as conn:
@@ -2363,49 +2438,15 @@ def _ensure_agents_fts(engine: Engine) -> None:
                     )
                     """
                 )
-
-            if "events_ai" in missing_triggers:
-                conn.exec_driver_sql(
-                    """
-                    CREATE TRIGGER IF NOT EXISTS events_ai AFTER INSERT ON events BEGIN
-                      INSERT INTO events_fts(rowid, content_text, tool_output_text, tool_name, role, session_id)
-                      VALUES (new.id, new.content_text, new.tool_output_text, new.tool_name, new.role, new.session_id);
-                    END
-                    """
-                )
-            if "events_ad" in missing_triggers:
-                conn.exec_driver_sql(
-                    """
-                    CREATE TRIGGER IF NOT EXISTS events_ad AFTER DELETE ON events BEGIN
-                      INSERT INTO events_fts(
-                        events_fts, rowid, content_text, tool_output_text,
-                        tool_name, role, session_id
-                      ) VALUES(
-                        'delete', old.id, old.content_text, old.tool_output_text,
-                        old.tool_name, old.role, old.session_id
-                      );
-                    END
-                    """
-                )
-            if "events_au" in missing_triggers:
-                conn.exec_driver_sql(
-                    """
-                    CREATE TRIGGER IF NOT EXISTS events_au AFTER UPDATE ON events BEGIN
-                      INSERT INTO events_fts(
-                        events_fts, rowid, content_text, tool_output_text,
-                        tool_name, role, session_id
-                      ) VALUES(
-                        'delete', old.id, old.content_text, old.tool_output_text,
-                        old.tool_name, old.role, old.session_id
-                      );
-                      INSERT INTO events_fts(rowid, content_text, tool_output_text, tool_name, role, session_id)
-                      VALUES (new.id, new.content_text, new.tool_output_text, new.tool_name, new.role, new.session_id);
-                    END
-                    """
-                )
+            for ddl in _EVENTS_FTS_JOURNAL_DDL:
+                conn.exec_driver_sql(ddl)
+            for name in stale_triggers:
+                conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+                conn.exec_driver_sql(_EVENTS_FTS_TRIGGER_DDL[name])
 
             if needs_rebuild:
                 conn.exec_driver_sql("INSERT INTO events_fts(events_fts) VALUES('rebuild')")
+                conn.exec_driver_sql("DELETE FROM events_fts_pending")
     except Exception as exc:  # pragma: no cover - surface missing FTS5 support
         raise RuntimeError(f"Failed to initialize FTS5 index (events_fts): {exc}") from exc
 
@@ -19,6 +19,10 @@ from zerg.database import live_store_configured
 from zerg.database import refresh_database_settings_from_env
 from zerg.observability import configure_observability
 from zerg.observability import shutdown_observability
+from zerg.process_role import ROLE_CONTROL
+from zerg.process_role import ROLE_HTTP
+from zerg.process_role import owns_background_services
+from zerg.process_role import process_role
 
 _settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -194,12 +198,46 @@ async def lifespan(app: FastAPI):
     refresh_database_settings_from_env()
     startup_started = time.monotonic()
     catalog_mode = live_catalog_enabled()
+    # HTTP workers of a multi-worker host attach to the daemons and loops the
+    # control process owns instead of starting their own (see process_role).
+    role = process_role()
+    owns_background = owns_background_services()
     from zerg.services.factory_assurance_title_binding import factory_assurance_title_enabled
 
     factory_title_assurance = factory_assurance_title_enabled()
     try:
         with _timed_startup_step("configure_observability"):
             configure_observability()
+        if role == ROLE_HTTP:
+            from zerg.services.machine_control_channel import follow_machine_control_snapshots
+            from zerg.services.runner_connection_manager import follow_runner_connection_snapshots
+
+            app.state.machine_control_mirror_task = asyncio.create_task(
+                follow_machine_control_snapshots(),
+                name="machine-control-mirror",
+            )
+            app.state.runner_connection_mirror_task = asyncio.create_task(
+                follow_runner_connection_snapshots(),
+                name="runner-connection-mirror",
+            )
+            # Let the mirrors subscribe so the broker replays their topics on connect.
+            await asyncio.sleep(0)
+        with _timed_startup_step("pubsub_fanout"):
+            from zerg.services.pubsub_fanout import start_pubsub_fanout
+
+            app.state.pubsub_fanout_ready = await start_pubsub_fanout()
+        if role == ROLE_CONTROL:
+            from zerg.services.control_snapshots import republish_snapshots
+            from zerg.services.machine_control_channel import get_machine_control_channel_registry
+            from zerg.services.runner_connection_manager import get_runner_connection_manager
+
+            registries = (get_machine_control_channel_registry(), get_runner_connection_manager())
+            for registry in registries:
+                registry.enable_snapshot_publishing()
+            app.state.connection_snapshot_refresh_task = asyncio.create_task(
+                republish_snapshots([registry.publish_snapshot for registry in registries]),
+                name="connection-snapshot-refresh",
+            )
         if not catalog_mode:
             with _timed_startup_step("initialize_database"):
                 initialize_database()
@@ -209,13 +247,19 @@ async def lifespan(app: FastAPI):
             with _timed_startup_step("catalogd_supervisor"):
                 from zerg.services.catalogd_supervisor import start_catalogd_supervisor
 
-                app.state.catalogd_ping = await start_catalogd_supervisor()
+                if owns_background:
+                    app.state.catalogd_ping = await start_catalogd_supervisor()
+                else:
+                    app.state.catalogd_ping = await start_catalogd_supervisor(spawn=False)
             logger.info("Live catalog schema is owned by catalogd")
             with _timed_startup_step("searchd_supervisor"):
                 try:
                     from zerg.services.searchd_supervisor import start_searchd_supervisor
 
-                    app.state.searchd_ping = await start_searchd_supervisor()
+                    if owns_background:
+                        app.state.searchd_ping = await start_searchd_supervisor()
+                    else:
+                        app.state.searchd_ping = await start_searchd_supervisor(spawn=False)
                     if app.state.searchd_ping is None:
                         logger.warning("searchd is degraded; hot Runtime Host readiness is unaffected")
                 except Exception:  # search is derived and never gates the launch loop
@@ -230,35 +274,36 @@ async def lifespan(app: FastAPI):
                     get_render_object_worker_pool().start(),
                 )
             logger.info("Storage-v2 live and repair worker lanes are ready")
-            try:
-                from zerg.services.semantic_v2_projector import start_semantic_v2_projector
+            if owns_background:
+                try:
+                    from zerg.services.semantic_v2_projector import start_semantic_v2_projector
 
-                app.state.semantic_v2_projector_started = start_semantic_v2_projector()
-                if not app.state.semantic_v2_projector_started:
-                    logger.warning("Semantic-v2 projector is degraded; hot Runtime Host readiness is unaffected")
-            except Exception:
-                app.state.semantic_v2_projector_started = False
-                logger.exception("Failed to start semantic-v2 projector (non-fatal)")
-            try:
-                from zerg.services.search_v2_projector import start_search_v2_projector
+                    app.state.semantic_v2_projector_started = start_semantic_v2_projector()
+                    if not app.state.semantic_v2_projector_started:
+                        logger.warning("Semantic-v2 projector is degraded; hot Runtime Host readiness is unaffected")
+                except Exception:
+                    app.state.semantic_v2_projector_started = False
+                    logger.exception("Failed to start semantic-v2 projector (non-fatal)")
+                try:
+                    from zerg.services.search_v2_projector import start_search_v2_projector
 
-                app.state.search_v2_projector_started = start_search_v2_projector()
-                if not app.state.search_v2_projector_started:
-                    logger.warning("Search-v2 projector is degraded; hot Runtime Host readiness is unaffected")
-            except Exception:
-                app.state.search_v2_projector_started = False
-                logger.exception("Failed to start search-v2 projector (non-fatal)")
-            app.state.embedding_initializer_task = asyncio.create_task(
-                _initialize_local_embedding_projector(app),
-                name="local-embedding-initializer",
-            )
-            try:
-                from zerg.services.storage_telemetry_snapshot import run_storage_telemetry_refresh_loop
+                    app.state.search_v2_projector_started = start_search_v2_projector()
+                    if not app.state.search_v2_projector_started:
+                        logger.warning("Search-v2 projector is degraded; hot Runtime Host readiness is unaffected")
+                except Exception:
+                    app.state.search_v2_projector_started = False
+                    logger.exception("Failed to start search-v2 projector (non-fatal)")
+                app.state.embedding_initializer_task = asyncio.create_task(
+                    _initialize_local_embedding_projector(app),
+                    name="local-embedding-initializer",
+                )
+                try:
+                    from zerg.services.storage_telemetry_snapshot import run_storage_telemetry_refresh_loop
 
-                app.state.storage_telemetry_task = asyncio.create_task(run_storage_telemetry_refresh_loop())
-                logger.info("Storage telemetry refresh loop started")
-            except Exception:
-                logger.exception("Failed to start storage telemetry refresh loop (non-fatal)")
+                    app.state.storage_telemetry_task = asyncio.create_task(run_storage_telemetry_refresh_loop())
+                    logger.info("Storage telemetry refresh loop started")
+                except Exception:
+                    logger.exception("Failed to start storage telemetry refresh loop (non-fatal)")
         elif catalog_mode and factory_title_assurance:
             # The hermetic title oracle needs the real catalog owner and real
             # storage lanes, but none of the unrelated production projectors.
@@ -330,8 +375,9 @@ async def lifespan(app: FastAPI):
                     logger.error(f"FTS5 readiness check failed: {fts_error}")
                     raise
 
-        with _timed_startup_step("single_tenant_startup"):
-            _enforce_single_tenant_startup(app)
+        if owns_background:
+            with _timed_startup_step("single_tenant_startup"):
+                _enforce_single_tenant_startup(app)
 
         # Auto-seed
         if not catalog_mode and not _settings.testing:
@@ -374,7 +420,7 @@ async def lifespan(app: FastAPI):
 
         get_shared_runner().start()
 
-        if catalog_mode and not _settings.testing:
+        if catalog_mode and not _settings.testing and owns_background:
             try:
                 from zerg.services.live_control_catalog import run_live_catalog_input_recovery_loop
 
@@ -390,7 +436,7 @@ async def lifespan(app: FastAPI):
         # Factory title assurance is deliberately a test Runtime Host, but it
         # must exercise the real background worker. This is the only normal
         # production loop re-enabled by the startup-bound assurance gate.
-        if catalog_mode:
+        if catalog_mode and owns_background:
             if not _settings.testing or factory_title_assurance:
                 try:
                     from zerg.services.storage_session_titles import run_storage_title_reconciler
@@ -403,7 +449,7 @@ async def lifespan(app: FastAPI):
         # Periodic runtime maintenance (runner-health reconcile, etc.). The
         # loop's own body branches on live_catalog_enabled() internally, so it
         # must start in every non-test process, not only the legacy cold-db lane.
-        if not _settings.testing:
+        if not _settings.testing and owns_background:
             try:
                 from zerg.services.maintenance import start_maintenance_loop
 
@@ -413,7 +459,7 @@ async def lifespan(app: FastAPI):
                 logger.exception("Failed to start maintenance loop")
 
         # Mark runners offline
-        if not catalog_mode:
+        if not catalog_mode and owns_background:
             try:
                 from sqlalchemy import update
 
@@ -428,7 +474,7 @@ async def lifespan(app: FastAPI):
                 logger.warning("Startup: failed to reset runner statuses (non-fatal): %s", e)
 
         # WAL checkpoints
-        if not _settings.testing:
+        if not _settings.testing and owns_background:
             try:
                 from zerg.database import start_wal_checkpoint_loop
 
@@ -437,6 +483,31 @@ async def lifespan(app: FastAPI):
             except Exception as e:
                 logger.warning("Startup: WAL checkpoint loop failed (non-fatal): %s", e)
 
+        # Bulk archive ingest journals FTS work; drain it in the background.
+        if not _settings.testing and not catalog_mode and owns_background:
+            try:
+                from zerg.services.agents.fts_journal import start_fts_indexer_loop
+
+                await start_fts_indexer_loop()
+                logger.info("FTS journal indexer started")
+            except Exception as e:
+                logger.warning("Startup: FTS journal indexer failed (non-fatal): %s", e)
+
+        # The process that answers /health and /readyz keeps its snapshot warm
+        # instead of recomputing checks per probe; HTTP workers forward both
+        # to control.
+        if not _settings.testing and role != ROLE_HTTP:
+            from zerg.services.health_snapshot import run_health_refresh_loop
+
+            app.state.health_refresh_task = asyncio.create_task(run_health_refresh_loop(), name="health-refresh")
+
+        # Control keeps the rolling CPU profile for /admin/profiler; HTTP
+        # workers forward those requests to it.
+        if not _settings.testing and role != ROLE_HTTP:
+            from zerg.services.sampling_profiler import start_sampling_profiler
+
+            start_sampling_profiler(app.routes)
+
         elapsed_ms = (time.monotonic() - startup_started) * 1000
         logger.info("Application startup complete elapsed_ms=%.1f", elapsed_ms)
     except Exception as e:
@@ -502,6 +573,13 @@ async def lifespan(app: FastAPI):
             except Exception:  # noqa: BLE001
                 logger.exception("Failed to stop WAL checkpoint loop")
 
+            try:
+                from zerg.services.agents.fts_journal import stop_fts_indexer_loop
+
+                await stop_fts_indexer_loop()
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to stop FTS journal indexer")
+
             try:
                 from zerg.services.maintenance import stop_maintenance_loop
 
@@ -524,6 +602,30 @@ async def lifespan(app: FastAPI):
 
         await topic_manager.shutdown()
 
+        for task_name in ("machine_control_mirror_task", "runner_connection_mirror_task", "connection_snapshot_refresh_task"):
+            snapshot_task = getattr(app.state, task_name, None)
+            if snapshot_task is not None:
+                snapshot_task.cancel()
+                await asyncio.gather(snapshot_task, return_exceptions=True)
+                setattr(app.state, task_name, None)
+
+        health_task = getattr(app.state, "health_refresh_task", None)
+        if health_task is not None:
+            health_task.cancel()
+            await asyncio.gather(health_task, return_exceptions=True)
+            app.state.health_refresh_task = None
+
+        from zerg.services.sampling_profiler import stop_sampling_profiler
+
+        stop_sampling_profiler()
+
+        try:
+            from zerg.services.pubsub_fanout import stop_pubsub_fanout
+
+            await stop_pubsub_fanout()
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to stop pubsub fan-out")
+
         if catalog_mode and (not _settings.testing or factory_title_assurance):
             await _stop_storage_title_services(app)
             await _stop_local_embedding_initializer(app)
@@ -237,6 +237,22 @@ from zerg.middleware.safe_error_response import SafeErrorResponseMiddleware
 
 app.add_middleware(SafeErrorResponseMiddleware, cors_origins=cors_origins)
 
+# Multi-worker hosts (`longhouse serve --workers N`): outermost, so HTTP workers
+# hand writes and WebSockets to the control process before any local handling.
+from zerg.process_role import ROLE_CONTROL
+from zerg.process_role import ROLE_HTTP
+from zerg.process_role import control_socket_path
+from zerg.process_role import process_role
+
+if process_role() == ROLE_HTTP and control_socket_path() is not None:
+    from zerg.middleware.control_forward import ControlForwardMiddleware
+
+    app.add_middleware(ControlForwardMiddleware, socket_path=control_socket_path())
+elif process_role() == ROLE_CONTROL:
+    from zerg.middleware.control_forward import ForwardedClientMiddleware
+
+    app.add_middleware(ForwardedClientMiddleware)
+
 # ---------------------------------------------------------------------------
 # API routers
 # ---------------------------------------------------------------------------
@@ -199,6 +199,12 @@ try:
         labelnames=("reason",),
     )
 
+    agents_heartbeat_snapshot_delta_total = Counter(
+        "agents_heartbeat_snapshot_delta_total",
+        "Delta-encoded agent heartbeats by outcome (applied, or the reason a full resync was required)",
+        labelnames=("outcome",),
+    )
+
     managed_codex_runtime_observations_total = Counter(
         "managed_codex_runtime_observations_total",
         "Managed Codex runtime observations by source, kind, and reducer outcome",
@@ -251,6 +257,132 @@ try:
         buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2, 5),
     )
 
+    query_embedding_cache_lookups_total = Counter(
+        "longhouse_query_embedding_cache_lookups_total",
+        "Recall query-embedding cache lookups by outcome (hit, miss, expired)",
+        labelnames=("outcome",),
+    )
+
+    query_embedding_cache_entries = Gauge(
+        "longhouse_query_embedding_cache_entries",
+        "Query vectors currently resident in the recall query-embedding cache",
+    )
+
+    render_object_cache_lookups_total = Counter(
+        "longhouse_render_object_cache_lookups_total",
+        "Decoded render-object cache lookups by outcome (hit, miss, joined)",
+        labelnames=("outcome",),
+    )
+
+    render_object_cache_decode_seconds_saved_total = Counter(
+        "longhouse_render_object_cache_decode_seconds_saved_total",
+        "Worker read and decode seconds avoided by decoded render-object cache hits",
+    )
+
+    render_object_cache_resident_bytes = Gauge(
+        "longhouse_render_object_cache_resident_bytes",
+        "Decoded payload bytes resident in the decoded render-object cache",
+    )
+
+    render_object_cache_entries = Gauge(
+        "longhouse_render_object_cache_entries",
+        "Decoded render objects resident in the decoded render-object cache",
+    )
+
+    render_object_cache_hit_ratio = Gauge(
+        "longhouse_render_object_cache_hit_ratio",
+        "Share of decoded render-object cache lookups served without a new worker read since process start",
+    )
+
+    event_fragment_cache_lookups_total = Counter(
+        "longhouse_event_fragment_cache_lookups_total",
+        "Serialized event fragment cache lookups by outcome (hit, miss)",
+        labelnames=("outcome",),
+    )
+
+    event_fragment_cache_resident_bytes = Gauge(
+        "longhouse_event_fragment_cache_resident_bytes",
+        "Serialized JSON bytes resident in the event fragment cache",
+    )
+
+    event_fragment_cache_entries = Gauge(
+        "longhouse_event_fragment_cache_entries",
+        "Serialized events resident in the event fragment cache",
+    )
+
+    event_fragment_cache_hit_ratio = Gauge(
+        "longhouse_event_fragment_cache_hit_ratio",
+        "Share of event fragment cache lookups served without re-serializing since process start",
+    )
+
+    tool_presentation_memo_lookups_total = Counter(
+        "longhouse_tool_presentation_memo_lookups_total",
+        "Tool presentation memo lookups by outcome (hit, miss)",
+        labelnames=("outcome",),
+    )
+
+    tool_presentation_memo_resident_bytes = Gauge(
+        "longhouse_tool_presentation_memo_resident_bytes",
+        "Approximate bytes held by memoized tool presentations",
+    )
+
+    tool_presentation_memo_entries = Gauge(
+        "longhouse_tool_presentation_memo_entries",
+        "Tool presentations resident in the memo",
+    )
+
+    tool_presentation_memo_hit_ratio = Gauge(
+        "longhouse_tool_presentation_memo_hit_ratio",
+        "Share of tool presentation lookups served without re-parsing since process start",
+    )
+
+    ws_broadcast_fanout_seconds = Histogram(
+        "longhouse_ws_broadcast_fanout_seconds",
+        "Time from encoding a websocket broadcast to sending it to one subscriber, by topic family (seconds)",
+        labelnames=("topic",),
+        buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2),
+    )
+
+    ws_broadcast_frames_total = Counter(
+        "longhouse_ws_broadcast_frames_total",
+        "Websocket broadcast frames per subscriber by outcome (queued, coalesced, disconnected)",
+        labelnames=("outcome",),
+    )
+
+    pubsub_fanout_frames_total = Counter(
+        "longhouse_pubsub_fanout_frames_total",
+        "Cross-process pubsub frames by outcome (sent, delivered, duplicate, queued_offline, dropped_offline)",
+        labelnames=("outcome",),
+    )
+
+    pubsub_fanout_connected = Gauge(
+        "longhouse_pubsub_fanout_connected",
+        "1 while this worker's session pubsub is attached to the pubsub broker",
+    )
+
+    runner_job_queue_depth = Gauge(
+        "longhouse_runner_job_queue_depth",
+        "Runner jobs waiting for a free runner slot, across runners",
+    )
+
+    runner_job_slots = Gauge(
+        "longhouse_runner_job_slots",
+        "Runner job slots across connected runners, by state (total, in_use)",
+        labelnames=("state",),
+    )
+
+    runner_job_dispatch_wait_seconds = Histogram(
+        "longhouse_runner_job_dispatch_wait_seconds",
+        "Time from a runner job dispatch request until its exec_request is sent, including slot queueing (seconds)",
+        buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 15, 60, 300),
+    )
+
+    runner_job_dispatch_total = Counter(
+        "longhouse_runner_job_dispatch_total",
+        "Runner job dispatch attempts by outcome (immediate, queued, queue_full, queue_timeout, offline)",
+        labelnames=("outcome",),
+    )
+
     product_read_bytes = Histogram(
         "longhouse_product_read_bytes",
         "Compressed immutable object bytes read per product request",
@@ -457,6 +589,16 @@ try:
         "Age of the oldest pending Live Store archive outbox row in seconds",
     )
 
+    events_fts_pending = Gauge(
+        "longhouse_events_fts_pending",
+        "Archive events journaled for FTS indexing and not yet indexed",
+    )
+
+    events_fts_oldest_pending_age_seconds = Gauge(
+        "longhouse_events_fts_oldest_pending_age_seconds",
+        "Age of the oldest event waiting in the FTS pending-index journal in seconds",
+    )
+
     live_archive_outbox_last_drained_age_seconds = Gauge(
         "longhouse_live_archive_outbox_last_drained_age_seconds",
         "Age of the most recently drained Live Store archive outbox row in seconds",
@@ -558,12 +700,21 @@ except ModuleNotFoundError:  # pragma: no cover – metrics disabled when lib ab
     agents_heartbeat_requests_total = _NoopCounter()  # type: ignore[assignment]
     managed_session_heartbeat_lease_rows_total = _NoopCounter()  # type: ignore[assignment]
     agents_heartbeat_snapshot_skipped_total = _NoopCounter()  # type: ignore[assignment]
+    agents_heartbeat_snapshot_delta_total = _NoopCounter()  # type: ignore[assignment]
     managed_codex_runtime_observations_total = _NoopCounter()  # type: ignore[assignment]
     managed_codex_bridge_freshness_total = _NoopCounter()  # type: ignore[assignment]
     session_input_attachments_total = _NoopCounter()  # type: ignore[assignment]
     session_input_attachment_blob_fetches_total = _NoopCounter()  # type: ignore[assignment]
     product_read_requests_total = _NoopCounter()  # type: ignore[assignment]
+    query_embedding_cache_lookups_total = _NoopCounter()  # type: ignore[assignment]
+    render_object_cache_decode_seconds_saved_total = _NoopCounter()  # type: ignore[assignment]
+    render_object_cache_lookups_total = _NoopCounter()  # type: ignore[assignment]
+    event_fragment_cache_lookups_total = _NoopCounter()  # type: ignore[assignment]
+    tool_presentation_memo_lookups_total = _NoopCounter()  # type: ignore[assignment]
+    ws_broadcast_frames_total = _NoopCounter()  # type: ignore[assignment]
+    pubsub_fanout_frames_total = _NoopCounter()  # type: ignore[assignment]
     historical_admission_rejections_total = _NoopCounter()  # type: ignore[assignment]
+    runner_job_dispatch_total = _NoopCounter()  # type: ignore[assignment]
 
     # Provide *noop* Gauge so code can call ``set`` without importing
     # the optional dependency in minimal CI images.
@@ -592,6 +743,8 @@ except ModuleNotFoundError:  # pragma: no cover – metrics disabled when lib ab
             return self
 
     dashboard_snapshot_latency_seconds = _NoopHistogram()  # type: ignore[assignment]
+    ws_broadcast_fanout_seconds = _NoopHistogram()  # type: ignore[assignment]
+    runner_job_dispatch_wait_seconds = _NoopHistogram()  # type: ignore[assignment]
     dashboard_snapshot_runs_returned = _NoopHistogram()  # type: ignore[assignment]
     managed_turn_dispatch_seconds = _NoopHistogram()  # type: ignore[assignment]
     managed_turn_phase_seconds = _NoopHistogram()  # type: ignore[assignment]
@@ -628,6 +781,8 @@ except ModuleNotFoundError:  # pragma: no cover – metrics disabled when lib ab
     live_archive_outbox_pending = _NoopGauge()  # type: ignore[assignment]
     live_archive_outbox_failed = _NoopGauge()  # type: ignore[assignment]
     live_archive_outbox_oldest_pending_age_seconds = _NoopGauge()  # type: ignore[assignment]
+    events_fts_pending = _NoopGauge()  # type: ignore[assignment]
+    events_fts_oldest_pending_age_seconds = _NoopGauge()  # type: ignore[assignment]
     live_archive_outbox_last_drained_age_seconds = _NoopGauge()  # type: ignore[assignment]
     live_archive_outbox_max_attempts = _NoopGauge()  # type: ignore[assignment]
     live_store_table_bytes = _NoopGauge()  # type: ignore[assignment]
@@ -647,6 +802,16 @@ except ModuleNotFoundError:  # pragma: no cover – metrics disabled when lib ab
     product_read_bytes = _NoopHistogram()  # type: ignore[assignment]
     product_read_objects = _NoopHistogram()  # type: ignore[assignment]
     storage_object_stored_bytes = _NoopGauge()  # type: ignore[assignment]
+    query_embedding_cache_entries = _NoopGauge()  # type: ignore[assignment]
+    render_object_cache_resident_bytes = _NoopGauge()  # type: ignore[assignment]
+    render_object_cache_entries = _NoopGauge()  # type: ignore[assignment]
+    render_object_cache_hit_ratio = _NoopGauge()  # type: ignore[assignment]
+    event_fragment_cache_resident_bytes = _NoopGauge()  # type: ignore[assignment]
+    event_fragment_cache_entries = _NoopGauge()  # type: ignore[assignment]
+    event_fragment_cache_hit_ratio = _NoopGauge()  # type: ignore[assignment]
+    tool_presentation_memo_resident_bytes = _NoopGauge()  # type: ignore[assignment]
+    tool_presentation_memo_entries = _NoopGauge()  # type: ignore[assignment]
+    tool_presentation_memo_hit_ratio = _NoopGauge()  # type: ignore[assignment]
     storage_object_count = _NoopGauge()  # type: ignore[assignment]
     storage_total_stored_bytes = _NoopGauge()  # type: ignore[assignment]
     projector_lag_sessions = _NoopGauge()  # type: ignore[assignment]
@@ -660,3 +825,6 @@ except ModuleNotFoundError:  # pragma: no cover – metrics disabled when lib ab
     historical_disk_free_bytes = _NoopGauge()  # type: ignore[assignment]
     historical_disk_free_ratio = _NoopGauge()  # type: ignore[assignment]
     historical_budget_available_bytes = _NoopGauge()  # type: ignore[assignment]
+    pubsub_fanout_connected = _NoopGauge()  # type: ignore[assignment]
+    runner_job_queue_depth = _NoopGauge()  # type: ignore[assignment]
+    runner_job_slots = _NoopGauge()  # type: ignore[assignment]
@@ -0,0 +1,285 @@
+"""ASGI middleware that hands writes and WebSockets to the control process.
+
+In a multi-worker Runtime Host the HTTP workers serve reads themselves and
+forward everything else to the single control process over its private Unix
+socket: every non-GET/HEAD/OPTIONS request (so writes keep going through the
+one set of supervisors, serializers and in-memory registries), every
+WebSocket (the runner, Machine Agent control and topic sockets are stateful
+and must all land in the process that owns those registries), and the few
+reads that report on state only control has (health, the sampling profiler).
+
+Bodies stream in both directions; nothing is buffered whole. The original
+client address and scheme travel in ``x-longhouse-forwarded-*`` headers that
+``ForwardedClientMiddleware`` restores on the control side, so routes that
+read ``request.client`` behave as on a single-process host.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from pathlib import Path
+from typing import Any
+from typing import Callable
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+_SAFE_METHODS: frozenset[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+# Health and readiness grade the write serializers, which only ever run in
+# control; a worker's own are always idle and would hide a stalled writer.
+_CONTROL_READ_PATHS: frozenset[str] = frozenset({"/api/health", "/api/readyz"})
+# The sampling profiler runs only in control, where the writers it tags live.
+_CONTROL_READ_PREFIXES: tuple[str, ...] = ("/api/admin/profiler/",)
+
+FORWARDED_CLIENT_HEADER = b"x-longhouse-forwarded-client"
+FORWARDED_SCHEME_HEADER = b"x-longhouse-forwarded-scheme"
+_FORWARDED_HEADERS = frozenset({FORWARDED_CLIENT_HEADER, FORWARDED_SCHEME_HEADER})
+
+# Hop-by-hop headers describe one connection and are never relayed. ``date``
+# and ``server`` are re-added by the worker's own uvicorn.
+_HOP_BY_HOP_REQUEST = frozenset({b"connection", b"keep-alive", b"proxy-connection", b"te", b"trailer", b"transfer-encoding", b"upgrade"})
+_HOP_BY_HOP_RESPONSE = _HOP_BY_HOP_REQUEST | {b"date", b"server"}
+# The WebSocket client library writes its own handshake headers.
+_WEBSOCKET_HANDSHAKE_HEADERS = _HOP_BY_HOP_REQUEST | {b"host", b"user-agent"}
+# Close codes that may not be sent on the wire (RFC 6455 section 7.4.1).
+_RESERVED_CLOSE_CODES = frozenset({1005, 1006, 1015})
+
+_UNAVAILABLE_BODY = json.dumps({"detail": "Runtime Host control process is unavailable"}).encode("utf-8")
+
+
+def _forwarded_headers(scope: dict[str, Any], *, drop: frozenset[bytes]) -> list[tuple[bytes, bytes]]:
+    headers = [
+        (name, value) for name, value in scope.get("headers", []) if name.lower() not in drop and name.lower() not in _FORWARDED_HEADERS
+    ]
+    client = scope.get("client")
+    if client:
+        headers.append((FORWARDED_CLIENT_HEADER, f"{client[0]}:{client[1]}".encode("latin-1")))
+    headers.append((FORWARDED_SCHEME_HEADER, str(scope.get("scheme", "http")).encode("latin-1")))
+    return headers
+
+
+def _target(scope: dict[str, Any]) -> str:
+    path = scope.get("raw_path") or scope.get("path", "/").encode("utf-8")
+    query = scope.get("query_string") or b""
+    return (path + (b"?" + query if query else b"")).decode("latin-1")
+
+
+def _is_control_read(scope: dict[str, Any]) -> bool:
+    path = scope.get("path", "").rstrip("/")
+    return path in _CONTROL_READ_PATHS or (path + "/").startswith(_CONTROL_READ_PREFIXES)
+
+
+def _wire_close_code(code: int | None, *, default: int) -> int:
+    if code is None or code in _RESERVED_CLOSE_CODES:
+        return default
+    return code
+
+
+async def _wait_for_disconnect(receive: Callable) -> None:
+    while True:
+        message = await receive()
+        if message["type"] == "http.disconnect":
+            return
+
+
+class ControlForwardMiddleware:
+    """Pure ASGI middleware: forward writes and WebSockets to the control socket."""
+
+    def __init__(self, app: Any, *, socket_path: Path) -> None:
+        self.app = app
+        self.socket_path = socket_path
+        self._client: httpx.AsyncClient | None = None
+
+    async def __call__(self, scope: dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] == "websocket":
+            await self._forward_websocket(scope, receive, send)
+            return
+        if scope["type"] != "http" or (scope.get("method", "GET") in _SAFE_METHODS and not _is_control_read(scope)):
+            await self.app(scope, receive, send)
+            return
+        await self._forward_http(scope, receive, send)
+
+    def _http_client(self) -> httpx.AsyncClient:
+        # Created on first use so it binds to the worker's serving loop.
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(uds=str(self.socket_path)),
+                base_url="http://longhouse-control",
+                # Request deadlines are enforced by the control process's
+                # own RequestTimeoutMiddleware; only connecting is bounded.
+                timeout=httpx.Timeout(None, connect=5.0),
+                limits=httpx.Limits(max_connections=None, max_keepalive_connections=64),
+            )
+        return self._client
+
+    async def _forward_http(self, scope: dict[str, Any], receive: Callable, send: Callable) -> None:
+        async def request_body():
+            while True:
+                message = await receive()
+                if message["type"] == "http.disconnect":
+                    return
+                body = message.get("body", b"")
+                if body:
+                    yield body
+                if not message.get("more_body", False):
+                    return
+
+        client = self._http_client()
+        request = client.build_request(
+            scope["method"],
+            _target(scope),
+            headers=_forwarded_headers(scope, drop=_HOP_BY_HOP_REQUEST),
+            content=request_body(),
+        )
+        try:
+            response = await client.send(request, stream=True)
+        except httpx.TransportError as exc:
+            logger.warning("Control process unreachable for %s %s: %s", scope["method"], scope.get("path"), exc)
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 503,
+                    "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(_UNAVAILABLE_BODY)).encode())],
+                }
+            )
+            await send({"type": "http.response.body", "body": _UNAVAILABLE_BODY})
+            return
+
+        try:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": response.status_code,
+                    "headers": [(name, value) for name, value in response.headers.raw if name.lower() not in _HOP_BY_HOP_RESPONSE],
+                }
+            )
+            # Streaming responses can outlive their client; stop relaying as
+            # soon as the client goes away instead of draining control.
+            relay = asyncio.ensure_future(self._relay_body(response, send))
+            watcher = asyncio.ensure_future(_wait_for_disconnect(receive))
+            done, pending = await asyncio.wait({relay, watcher}, return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if relay in done:
+                relay.result()
+        finally:
+            await response.aclose()
+
+    @staticmethod
+    async def _relay_body(response: httpx.Response, send: Callable) -> None:
+        async for chunk in response.aiter_raw():
+            if chunk:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+    async def _forward_websocket(self, scope: dict[str, Any], receive: Callable, send: Callable) -> None:
+        from websockets.asyncio.client import unix_connect
+        from websockets.exceptions import ConnectionClosed
+        from websockets.exceptions import InvalidStatus
+
+        message = await receive()
+        if message["type"] != "websocket.connect":
+            return
+        headers = [
+            (name.decode("latin-1"), value.decode("latin-1"))
+            for name, value in _forwarded_headers(scope, drop=_WEBSOCKET_HANDSHAKE_HEADERS)
+            if not name.lower().startswith(b"sec-websocket-")
+        ]
+        try:
+            upstream = await unix_connect(
+                str(self.socket_path),
+                f"ws://longhouse-control{_target(scope)}",
+                additional_headers=headers,
+                subprotocols=scope.get("subprotocols") or None,
+                user_agent_header=None,
+                compression=None,
+                max_size=None,
+                # The routes run their own app-level heartbeats.
+                ping_interval=None,
+                open_timeout=10,
+            )
+        except InvalidStatus as exc:
+            # Closing before accept makes the worker's uvicorn answer 403.
+            logger.info("Control process rejected WebSocket %s: HTTP %s", scope.get("path"), exc.response.status_code)
+            await send({"type": "websocket.close", "code": 1008})
+            return
+        except (OSError, asyncio.TimeoutError) as exc:
+            logger.warning("Control process unreachable for WebSocket %s: %s", scope.get("path"), exc)
+            await send({"type": "websocket.close", "code": 1011})
+            return
+
+        await send({"type": "websocket.accept", "subprotocol": upstream.subprotocol})
+
+        async def client_to_control() -> None:
+            while True:
+                message = await receive()
+                if message["type"] == "websocket.disconnect":
+                    await upstream.close(code=_wire_close_code(message.get("code"), default=1000))
+                    return
+                if message["type"] != "websocket.receive":
+                    continue
+                if message.get("text") is not None:
+                    await upstream.send(message["text"])
+                else:
+                    await upstream.send(message.get("bytes") or b"")
+
+        async def control_to_client() -> None:
+            try:
+                async for data in upstream:
+                    if isinstance(data, str):
+                        await send({"type": "websocket.send", "text": data})
+                    else:
+                        await send({"type": "websocket.send", "bytes": data})
+            except ConnectionClosed:
+                pass
+            await send(
+                {
+                    "type": "websocket.close",
+                    "code": _wire_close_code(upstream.close_code, default=1011),
+                    "reason": upstream.close_reason or "",
+                }
+            )
+
+        inbound = asyncio.ensure_future(client_to_control())
+        outbound = asyncio.ensure_future(control_to_client())
+        try:
+            done, pending = await asyncio.wait({inbound, outbound}, return_when=asyncio.FIRST_COMPLETED)
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            for task in done:
+                if not task.cancelled() and task.exception() is not None and not isinstance(task.exception(), ConnectionClosed):
+                    logger.warning("WebSocket relay for %s failed: %r", scope.get("path"), task.exception())
+        finally:
+            await upstream.close()
+
+
+class ForwardedClientMiddleware:
+    """Restore the client address and scheme an HTTP worker forwarded.
+
+    Installed only in the control process, which listens solely on a Unix
+    socket inside a private 0700 directory, so every caller is one of its own
+    workers and the headers can be trusted.
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] in {"http", "websocket"}:
+            forwarded = {name: value for name, value in scope.get("headers", []) if name in _FORWARDED_HEADERS}
+            if forwarded:
+                scope = dict(scope)
+                scope["headers"] = [(name, value) for name, value in scope["headers"] if name not in _FORWARDED_HEADERS]
+                client = forwarded.get(FORWARDED_CLIENT_HEADER)
+                if client:
+                    host, _, port = client.decode("latin-1").rpartition(":")
+                    scope["client"] = (host, int(port) if port.isdigit() else 0)
+                scheme = forwarded.get(FORWARDED_SCHEME_HEADER)
+                if scheme:
+                    scope["scheme"] = scheme.decode("latin-1")
+        await self.app(scope, receive, send)
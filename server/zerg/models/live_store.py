@@ -397,6 +397,7 @@ class LiveTimelineCard(LiveBase):
 
     __table_args__ = (
         Index("ix_live_timeline_cards_activity", "last_activity_at", "started_at"),
+        Index("ix_live_timeline_cards_anchor", func.coalesce(last_activity_at, started_at), "session_id"),
         Index("ix_live_timeline_cards_project_provider", "project", "provider"),
     )
 
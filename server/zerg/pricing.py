@@ -32,6 +32,17 @@ MODEL_PRICES_USD_PER_1K: dict[str, Tuple[float, float]] = {
     # OpenAI (direct) — approximate rates
     "gpt-4o": (0.0025, 0.01),
     "gpt-4o-mini": (0.00015, 0.0006),
+    "gpt-5": (0.00125, 0.01),
+    "gpt-5-codex": (0.00125, 0.01),
+    "gpt-5-mini": (0.00025, 0.002),
+    # Anthropic (direct) — transcript model ids may carry a -YYYYMMDD suffix;
+    # the usage ledger retries without it.
+    "claude-opus-4-1": (0.015, 0.075),
+    "claude-opus-4": (0.015, 0.075),
+    "claude-sonnet-4-5": (0.003, 0.015),
+    "claude-sonnet-4": (0.003, 0.015),
+    "claude-haiku-4-5": (0.001, 0.005),
+    "claude-3-5-haiku": (0.0008, 0.004),
 }
 
 _CATALOG_CACHE: Optional[dict[str, Tuple[float, float]]] = None
@@ -0,0 +1,42 @@
+"""Which part of a multi-worker Runtime Host this process plays.
+
+``longhouse serve --workers N`` runs one ``control`` process and N ``http``
+workers. The control process owns everything that must exist exactly once:
+the catalogd/searchd supervisors, projectors, maintenance and WAL loops, and
+every in-memory channel registry. HTTP workers serve reads, attach to the
+control process's daemons, and hand writes and WebSockets to control over its
+private Unix socket. A plain single-process server is ``all``.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+PROCESS_ROLE_ENV = "LONGHOUSE_PROCESS_ROLE"
+CONTROL_SOCKET_ENV = "LONGHOUSE_CONTROL_SOCKET"
+
+ROLE_ALL = "all"
+ROLE_CONTROL = "control"
+ROLE_HTTP = "http"
+_ROLES = frozenset({ROLE_ALL, ROLE_CONTROL, ROLE_HTTP})
+
+
+def process_role() -> str:
+    raw = os.getenv(PROCESS_ROLE_ENV, "").strip().lower()
+    if not raw:
+        return ROLE_ALL
+    if raw not in _ROLES:
+        raise RuntimeError(f"{PROCESS_ROLE_ENV} must be one of {sorted(_ROLES)}, got {raw!r}")
+    return raw
+
+
+def owns_background_services() -> bool:
+    """Return whether this process starts supervisors and background loops."""
+
+    return process_role() != ROLE_HTTP
+
+
+def control_socket_path() -> Path | None:
+    raw = os.getenv(CONTROL_SOCKET_ENV, "").strip()
+    return Path(raw).expanduser() if raw else None
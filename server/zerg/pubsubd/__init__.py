@@ -0,0 +1,5 @@
+"""Local broker that fans session pubsub out across API worker processes."""
+
+from zerg.pubsubd.server import PubsubBroker
+
+__all__ = ["PubsubBroker"]
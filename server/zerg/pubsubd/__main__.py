@@ -0,0 +1,60 @@
+"""Run the Longhouse pubsub broker for a multi-worker deployment."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import signal
+from contextlib import suppress
+from pathlib import Path
+
+
+async def _run(socket_path: Path, buffer_size: int, idle_topic_seconds: float, max_topics: int) -> None:
+    from zerg.pubsubd.server import PubsubBroker
+
+    broker = PubsubBroker(
+        socket_path=socket_path,
+        buffer_size=buffer_size,
+        idle_topic_seconds=idle_topic_seconds,
+        max_topics=max_topics,
+    )
+    stop_requested = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop_requested.set)
+    await broker.start()
+    serve_task = asyncio.create_task(broker.serve_forever(), name="pubsubd-serve")
+    stop_task = asyncio.create_task(stop_requested.wait(), name="pubsubd-stop")
+    try:
+        done, _pending = await asyncio.wait({serve_task, stop_task}, return_when=asyncio.FIRST_COMPLETED)
+        if serve_task in done:
+            await serve_task
+    finally:
+        for task in (serve_task, stop_task):
+            task.cancel()
+        for task in (serve_task, stop_task):
+            with suppress(asyncio.CancelledError):
+                await task
+        await broker.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--socket", type=Path, required=True)
+    parser.add_argument("--buffer-size", type=int, default=1000)
+    parser.add_argument("--idle-topic-seconds", type=float, default=600.0)
+    parser.add_argument("--max-topics", type=int, default=4096)
+    args = parser.parse_args()
+    from zerg.logging_config import configure_logging
+
+    configure_logging(os.getenv("LOG_LEVEL", "INFO"))
+    try:
+        asyncio.run(_run(args.socket, max(1, args.buffer_size), args.idle_topic_seconds, max(1, args.max_topics)))
+    except KeyboardInterrupt:
+        return 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,76 @@
+"""Length-prefixed JSON framing for the pubsub broker's local Unix socket.
+
+Frames are ``LHP1 + u32be length + JSON object``. Five message types cross the
+socket:
+
+- ``hello`` (broker -> worker, first frame): ``{"type", "epoch", "buffer_size"}``;
+- ``subscribe`` (worker -> broker, answers ``hello``): ``{"type", "topics"}``,
+  the topics whose retained rings the worker wants replayed;
+- ``publish`` (worker -> broker): ``{"type", "topic", "payload"}``;
+- ``message`` (broker -> worker): ``{"type", "topic", "seq", "payload"}``;
+- ``ready`` (broker -> worker): the retained replay is complete.
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+from asyncio import IncompleteReadError
+from asyncio import StreamReader
+from typing import Any
+
+from zerg.catalogd.protocol import ProtocolError
+from zerg.catalogd.protocol import decode_payload
+
+MAGIC = b"LHP1"
+MAX_PAYLOAD_BYTES = 1024 * 1024
+HEADER_BYTES = len(MAGIC) + 4
+
+_FIELDS = {
+    "publish": {"type", "topic", "payload"},
+    "hello": {"type", "epoch", "buffer_size"},
+    "subscribe": {"type", "topics"},
+    "message": {"type", "topic", "seq", "payload"},
+    "ready": {"type"},
+}
+
+
+def validate_message(wire: dict[str, Any]) -> dict[str, Any]:
+    kind = wire.get("type")
+    expected = _FIELDS.get(kind) if isinstance(kind, str) else None
+    if expected is None:
+        raise ProtocolError("invalid_request", f"unknown pubsub frame type: {kind!r}")
+    if set(wire) != expected:
+        raise ProtocolError("invalid_request", f"invalid pubsub {kind} fields: {sorted(wire)}")
+    if "topic" in wire and (not isinstance(wire["topic"], str) or not wire["topic"]):
+        raise ProtocolError("invalid_request", "topic must be a non-empty string")
+    if "topics" in wire and (not isinstance(wire["topics"], list) or not all(isinstance(topic, str) and topic for topic in wire["topics"])):
+        raise ProtocolError("invalid_request", "topics must be a list of non-empty strings")
+    if "payload" in wire and not isinstance(wire["payload"], dict):
+        raise ProtocolError("invalid_request", "payload must be a JSON object")
+    if "seq" in wire and (type(wire["seq"]) is not int or wire["seq"] < 1):
+        raise ProtocolError("invalid_request", "seq must be a positive integer")
+    return wire
+
+
+def encode_message(wire: dict[str, Any]) -> bytes:
+    payload = json.dumps(validate_message(wire), ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+    if len(payload) > MAX_PAYLOAD_BYTES:
+        raise ProtocolError("invalid_request", "pubsub payload exceeds the 1 MiB frame limit")
+    return MAGIC + struct.pack(">I", len(payload)) + payload
+
+
+async def read_message(reader: StreamReader) -> dict[str, Any]:
+    """Read one bounded frame; EOF before a header raises ``IncompleteReadError``."""
+
+    header = await reader.readexactly(HEADER_BYTES)
+    if header[: len(MAGIC)] != MAGIC:
+        raise ProtocolError("invalid_request", "invalid pubsub frame magic")
+    payload_length = struct.unpack(">I", header[len(MAGIC) :])[0]
+    if payload_length > MAX_PAYLOAD_BYTES:
+        raise ProtocolError("invalid_request", "pubsub payload exceeds the 1 MiB frame limit")
+    try:
+        payload = await reader.readexactly(payload_length)
+    except IncompleteReadError as exc:
+        raise ProtocolError("invalid_request", "truncated pubsub frame payload") from exc
+    return validate_message(decode_payload(payload))
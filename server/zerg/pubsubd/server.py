@@ -0,0 +1,253 @@
+"""Unix-socket broker that fans session pubsub messages out to every API worker.
+
+Workers publish to the broker instead of delivering locally. The broker is the
+single authority for per-topic ``seq``: it numbers each message once, keeps the
+same bounded per-topic ring a worker keeps, and writes the numbered message to
+every connected worker, the publisher included. Connected workers therefore
+hold identical topic buffers, so ``Last-Event-ID`` replay and ``replay_gap``
+give the same answer whichever worker an SSE reconnect lands on.
+
+A connecting worker receives a ``hello`` carrying the broker's epoch and answers
+with the topics it has subscribers on; only those retained rings are replayed.
+A worker that sees a new epoch knows the seq space restarted and drops its old
+buffers, exactly as a fresh single process would.
+
+Rings of topics nobody has published to for ``idle_topic_seconds`` are evicted,
+as are the least recently published topics beyond ``max_topics``. A topic that
+comes back is numbered above every seq the broker has assigned, so a worker
+still holding its old buffer sees a gap, never a reused seq.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import logging
+import os
+import stat
+import time
+import uuid
+from collections import OrderedDict
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import Any
+
+from zerg.catalogd.protocol import ProtocolError
+from zerg.pubsubd.protocol import encode_message
+from zerg.pubsubd.protocol import read_message
+
+logger = logging.getLogger(__name__)
+
+# A worker that stops reading is disconnected once this much is queued for it;
+# it reconnects and catches up from the retained rings.
+_MAX_WORKER_BACKLOG_BYTES = 16 * 1024 * 1024
+
+
+@dataclass
+class _Topic:
+    buffer: deque[bytes]
+    next_seq: int = 1
+    last_published_at: float = 0.0
+
+
+@dataclass(eq=False)
+class _Worker:
+    writer: asyncio.StreamWriter
+    ready: bool = False
+    pending: list[bytes] = field(default_factory=list)
+
+
+class PubsubBroker:
+    """Number and fan out topic messages for the API workers of one deployment."""
+
+    def __init__(
+        self,
+        *,
+        socket_path: Path,
+        buffer_size: int = 1000,
+        idle_topic_seconds: float = 600.0,
+        max_topics: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.socket_path = socket_path.expanduser().resolve()
+        self.lock_path = self.socket_path.with_name(f"{self.socket_path.name}.lock")
+        self.buffer_size = buffer_size
+        self.idle_topic_seconds = idle_topic_seconds
+        self.max_topics = max(1, max_topics)
+        self.epoch = uuid.uuid4().hex
+        self._clock = clock
+        # Least recently published first.
+        self._topics: OrderedDict[str, _Topic] = OrderedDict()
+        # First seq for a topic created now; stays above every seq an evicted topic had.
+        self._seq_floor = 1
+        self._workers: set[_Worker] = set()
+        self._lock_handle = None
+        self._server: asyncio.AbstractServer | None = None
+        self._published_inode: tuple[int, int] | None = None
+        self._closed = asyncio.Event()
+        self.published = 0
+        self.disconnected_slow = 0
+        self.evicted_topics = 0
+
+    async def start(self) -> None:
+        self.socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        parent = self.socket_path.parent.lstat()
+        if stat.S_ISLNK(parent.st_mode) or not stat.S_ISDIR(parent.st_mode) or parent.st_uid != os.getuid():
+            raise RuntimeError("pubsub broker socket parent is unsafe")
+        self._closed.clear()
+        self._acquire_lock()
+        try:
+            self._prepare_socket()
+            temporary = self.socket_path.with_name(f".{self.socket_path.name}.tmp.{os.getpid()}")
+            if len(os.fsencode(temporary)) >= 104:
+                raise RuntimeError("pubsub broker socket path exceeds the portable Unix limit")
+            temporary.unlink(missing_ok=True)
+            self._server = await asyncio.start_unix_server(self._handle_connection, path=temporary)
+            os.chmod(temporary, 0o600)
+            os.replace(temporary, self.socket_path)
+            published = self.socket_path.stat()
+            self._published_inode = (published.st_dev, published.st_ino)
+        except BaseException:
+            await self.close()
+            raise
+
+    async def serve_forever(self) -> None:
+        # The server accepts from ``start()`` on. Worker connections never end
+        # on their own, so ``Server.serve_forever`` would hang in its
+        # ``wait_closed`` on cancellation; park here and let ``close()`` drop
+        # the workers before it waits.
+        if self._server is None:
+            raise RuntimeError("pubsub broker is not started")
+        await self._closed.wait()
+
+    async def close(self) -> None:
+        self._closed.set()
+        if self._server is not None:
+            self._server.close()
+            for worker in list(self._workers):
+                worker.writer.transport.abort()
+            await self._server.wait_closed()
+            self._server = None
+        self._workers.clear()
+        self._unlink_socket()
+        if self._lock_handle is not None:
+            fcntl.flock(self._lock_handle.fileno(), fcntl.LOCK_UN)
+            self._lock_handle.close()
+            self._lock_handle = None
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "epoch": self.epoch,
+            "workers": len(self._workers),
+            "topics": len(self._topics),
+            "published": self.published,
+            "disconnected_slow": self.disconnected_slow,
+            "evicted_topics": self.evicted_topics,
+        }
+
+    def _acquire_lock(self) -> None:
+        handle = self.lock_path.open("a+", encoding="utf-8")
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError as exc:
+            handle.close()
+            raise RuntimeError("pubsub broker socket is already owned") from exc
+        self._lock_handle = handle
+
+    def _prepare_socket(self) -> None:
+        try:
+            entry = self.socket_path.lstat()
+        except FileNotFoundError:
+            return
+        if stat.S_ISLNK(entry.st_mode) or not stat.S_ISSOCK(entry.st_mode) or entry.st_uid != os.getuid():
+            raise RuntimeError("pubsub broker socket path is unsafe")
+        self.socket_path.unlink()
+
+    def _unlink_socket(self) -> None:
+        if self._published_inode is None:
+            return
+        try:
+            current = self.socket_path.stat()
+        except FileNotFoundError:
+            self._published_inode = None
+            return
+        if (current.st_dev, current.st_ino) == self._published_inode and stat.S_ISSOCK(current.st_mode):
+            self.socket_path.unlink()
+        self._published_inode = None
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        worker = _Worker(writer=writer)
+        self._workers.add(worker)
+        try:
+            writer.write(encode_message({"type": "hello", "epoch": self.epoch, "buffer_size": self.buffer_size}))
+            await writer.drain()
+            request = await read_message(reader)
+            if request["type"] != "subscribe":
+                raise ProtocolError("invalid_request", "pubsub worker must answer hello with subscribe")
+            self._evict_idle(self._clock())
+            replay = [self._topics[name] for name in dict.fromkeys(request["topics"]) if name in self._topics]
+            for topic in replay:
+                for frame in list(topic.buffer):
+                    writer.write(frame)
+                    # Yield to the loop while replaying large rings; messages
+                    # published meanwhile wait in ``pending`` so order holds.
+                    await writer.drain()
+            for frame in worker.pending:
+                writer.write(frame)
+            worker.pending.clear()
+            worker.ready = True
+            writer.write(encode_message({"type": "ready"}))
+            await writer.drain()
+            while True:
+                wire = await read_message(reader)
+                if wire["type"] != "publish":
+                    raise ProtocolError("invalid_request", "pubsub broker accepts publish frames only")
+                self._publish(wire["topic"], wire["payload"])
+        except (EOFError, asyncio.IncompleteReadError, ConnectionError, ProtocolError):
+            pass
+        finally:
+            self._workers.discard(worker)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except OSError:
+                pass
+
+    def _publish(self, topic_name: str, payload: dict[str, Any]) -> None:
+        now = self._clock()
+        topic = self._topics.get(topic_name)
+        if topic is None:
+            topic = self._topics[topic_name] = _Topic(buffer=deque(maxlen=self.buffer_size), next_seq=self._seq_floor)
+        else:
+            self._topics.move_to_end(topic_name)
+        frame = encode_message({"type": "message", "topic": topic_name, "seq": topic.next_seq, "payload": payload})
+        topic.next_seq += 1
+        topic.last_published_at = now
+        topic.buffer.append(frame)
+        self.published += 1
+        self._evict_idle(now)
+        for worker in list(self._workers):
+            if not worker.ready:
+                worker.pending.append(frame)
+                continue
+            transport = worker.writer.transport
+            if transport.is_closing():
+                continue
+            if transport.get_write_buffer_size() > _MAX_WORKER_BACKLOG_BYTES:
+                self.disconnected_slow += 1
+                logger.warning("pubsub broker disconnected a worker that stopped reading")
+                transport.abort()
+                continue
+            worker.writer.write(frame)
+
+    def _evict_idle(self, now: float) -> None:
+        while self._topics:
+            name, topic = next(iter(self._topics.items()))
+            if len(self._topics) <= self.max_topics and now - topic.last_published_at < self.idle_topic_seconds:
+                return
+            del self._topics[name]
+            self._seq_floor = max(self._seq_floor, topic.next_seq)
+            self.evicted_topics += 1
@@ -14,6 +14,7 @@ from fastapi import Depends
 from fastapi import HTTPException
 from fastapi import Query
 from fastapi.responses import JSONResponse
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
@@ -33,10 +34,12 @@ from zerg.dependencies.auth import require_super_admin
 from zerg.models.agents import AgentSession
 from zerg.models.models import Runner
 from zerg.models.user import User
+from zerg.process_role import process_role
 from zerg.schemas.usage import AdminUserDetailResponse
 from zerg.schemas.usage import AdminUsersResponse
 from zerg.services.agents.kernel_capabilities import project_session_capabilities
 from zerg.services.runner_connection_manager import get_runner_connection_manager
+from zerg.services.sampling_profiler import get_sampling_profiler
 from zerg.services.session_kernel_projection import project_session_control_fields
 
 # Usage service
@@ -66,6 +69,13 @@ class DatabaseResetRequest(BaseModel):
     reset_type: ResetType = ResetType.CLEAR_DATA
 
 
+class ProfilerControlRequest(BaseModel):
+    """Start or stop the sampling profiler."""
+
+    enabled: bool
+    reset: bool = False
+
+
 class SuperAdminStatusResponse(BaseModel):
     """Response model for super admin status check."""
 
@@ -676,7 +686,7 @@ async def list_users_with_usage(
     Returns users sorted by the specified field with usage stats for today, 7d, and 30d.
     Admin-only endpoint.
     """
-    return get_all_users_usage(db, sort=sort, order=order, limit=limit, offset=offset, active=active)
+    return await get_all_users_usage(db, sort=sort, order=order, limit=limit, offset=offset, active=active)
 
 
 @router.get("/users/{user_id}/usage", response_model=AdminUserDetailResponse)
@@ -695,7 +705,51 @@ async def get_user_usage_details(
 
     Admin-only endpoint.
     """
-    result = get_user_usage_detail(db, user_id, period)
+    result = await get_user_usage_detail(db, user_id, period)
     if result is None:
         raise HTTPException(status_code=404, detail="User not found")
     return result
+
+
+# ---------------------------------------------------------------------------
+# Sampling profiler
+# ---------------------------------------------------------------------------
+
+_PROFILE_TAG_DESCRIPTION = "Keep only samples carrying this tag, e.g. 'route:GET /api/timeline' or 'writer:live/ingest'"
+
+
+@router.get("/profiler")
+def get_profiler_summary(
+    seconds: Optional[int] = Query(None, ge=1, le=3600, description="Aggregate only the last N seconds of the window"),
+    tag: Optional[str] = Query(None, description=_PROFILE_TAG_DESCRIPTION),
+    limit: int = Query(25, ge=1, le=200, description="Rows per top-N table"),
+) -> dict[str, object]:
+    """Top frames and tag breakdown from the rolling CPU profile."""
+    profiler = get_sampling_profiler()
+    return {
+        "status": {**profiler.status(), "process_role": process_role()},
+        "profile": profiler.window(seconds=seconds, tag=tag).summary(limit=limit),
+    }
+
+
+@router.get("/profiler/folded", response_class=PlainTextResponse)
+def get_profiler_folded(
+    seconds: Optional[int] = Query(None, ge=1, le=3600, description="Aggregate only the last N seconds of the window"),
+    tag: Optional[str] = Query(None, description=_PROFILE_TAG_DESCRIPTION),
+) -> PlainTextResponse:
+    """Folded stacks (``frame;frame count`` lines) for flamegraph.pl or speedscope."""
+    profile = get_sampling_profiler().window(seconds=seconds, tag=tag)
+    return PlainTextResponse(profile.folded(), headers={"X-Profile-Pid": str(os.getpid())})
+
+
+@router.post("/profiler")
+def control_profiler(request: ProfilerControlRequest) -> dict[str, object]:
+    """Start or stop the profiler, optionally clearing its window."""
+    profiler = get_sampling_profiler()
+    if request.reset:
+        profiler.reset()
+    if request.enabled:
+        profiler.start()
+    else:
+        profiler.stop()
+    return {**profiler.status(), "process_role": process_role()}
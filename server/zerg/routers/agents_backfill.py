@@ -36,6 +36,7 @@ from zerg.services.session_views import BackfillSummariesResponse
 from zerg.services.session_views import CursorRoleBackfillResponse
 from zerg.services.session_views import IngestHealthResponse
 from zerg.services.session_views import MediaBackfillInlineDataUrlsResponse
+from zerg.services.session_views import UsageLedgerBackfillResponse
 from zerg.services.session_views import UsageStatsByProvider
 from zerg.services.session_views import UsageStatsResponse
 
@@ -297,6 +298,53 @@ async def backfill_cursor_roles(
     )
 
 
+@router.post("/backfill-usage-ledger", response_model=UsageLedgerBackfillResponse)
+async def backfill_usage_ledger(
+    dry_run: bool = Query(True, description="When true, extract and report without folding"),
+    after_envelope_id: Optional[str] = Query(None, description="Only scan raw objects after this envelope id"),
+    batch_size: int = Query(100, ge=1, le=500, description="Max raw objects to scan in this batch"),
+    _auth: None = Depends(verify_agents_token),
+    _single: None = Depends(require_single_tenant),
+) -> UsageLedgerBackfillResponse:
+    """Fold one batch of the existing storage-v2 corpus into the usage ledger.
+
+    Envelopes committed before the ledger existed carry no folded usage.
+    Idempotent; paginated via ``after_envelope_id`` (loop until
+    ``next_after_envelope_id`` is null).
+    """
+    from zerg.services.usage_ledger import backfill_usage_ledger_batch
+
+    catalogd = get_catalogd_client()
+    if catalogd is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"code": "catalog_unavailable", "message": "Usage backfill requires the live catalog."},
+        )
+    try:
+        result = await backfill_usage_ledger_batch(catalogd, after_envelope_id=after_envelope_id, limit=batch_size, dry_run=dry_run)
+    except CatalogRemoteError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail={"code": exc.code, "message": str(exc)}) from exc
+    except CatalogUnavailable as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"code": "catalog_unavailable", "message": "Usage backfill is temporarily unavailable."},
+        ) from exc
+    mode = "dry run" if dry_run else "write"
+    message = (
+        f"Usage ledger backfill {mode}: scanned={result.scanned} folded={result.folded} "
+        f"skipped={result.skipped} unreadable={result.unreadable} next={result.next_after_envelope_id}"
+    )
+    return UsageLedgerBackfillResponse(
+        dry_run=dry_run,
+        scanned=result.scanned,
+        folded=result.folded,
+        skipped=result.skipped,
+        unreadable=result.unreadable,
+        next_after_envelope_id=result.next_after_envelope_id,
+        message=message,
+    )
+
+
 @router.get("/ingest-health", response_model=IngestHealthResponse)
 async def get_ingest_health(
     db: Session | None = Depends(_ingest_health_db_dependency),
@@ -1332,10 +1332,12 @@ async def ingest_session(
                 }
                 session_pubsub_seq = bus.publish(topic_session(session_id_str), payload)
                 timeline_pubsub_seq = bus.publish(TOPIC_TIMELINE, payload)
+                # With the pubsub broker attached, the broker numbers messages
+                # after this returns, so there is no seq to record here.
                 fanout_payload = {
                     **payload,
-                    "session_pubsub_seq": session_pubsub_seq,
-                    "timeline_pubsub_seq": timeline_pubsub_seq,
+                    **({"session_pubsub_seq": session_pubsub_seq} if session_pubsub_seq is not None else {}),
+                    **({"timeline_pubsub_seq": timeline_pubsub_seq} if timeline_pubsub_seq is not None else {}),
                 }
                 _background_server_fanout_observation(
                     session_id=result.session_id,
@@ -4,10 +4,13 @@ import asyncio
 import base64
 import logging
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+from typing import Callable
+from typing import Iterator
 from typing import Literal
 from typing import Optional
 from uuid import UUID
@@ -161,16 +164,99 @@ class _RecallContextTurn(BaseModel):
     tool_name: str | None
 
 
-class _RecallContextPayload(BaseModel):
+class _RecallEvidencePayload(BaseModel):
     model_config = ConfigDict(extra="forbid", strict=True)
 
     evidence_status: Literal["complete", "partial", "unavailable"]
     evidence_reason: str | None
     context: list[_RecallContextTurn]
     total_events: int = Field(ge=0)
+
+
+class _RecallContextsPayload(BaseModel):
+    model_config = ConfigDict(extra="forbid", strict=True)
+
+    evidence: list[_RecallEvidencePayload | None]
     timing: _SearchReadTiming
 
 
+class _FusedRecallLaneError(BaseModel):
+    model_config = ConfigDict(extra="forbid", strict=True)
+
+    lane: Literal["lexical", "dense"]
+    code: str = Field(min_length=1)
+    reason: str | None
+
+
+class _FusedRecallEntry(BaseModel):
+    model_config = ConfigDict(extra="forbid", strict=True, allow_inf_nan=False)
+
+    session_id: str = Field(min_length=1)
+    lane: Literal["lexical", "dense"]
+    hit: dict[str, object]
+    score: float
+    lanes: list[Literal["lexical", "dense"]] = Field(min_length=1)
+    lane_ranks: dict[Literal["lexical", "dense"], int]
+    evidence: _RecallEvidencePayload | None
+
+    @model_validator(mode="after")
+    def validate_lanes(self) -> "_FusedRecallEntry":
+        if self.lane not in self.lanes or set(self.lanes) != set(self.lane_ranks):
+            raise ValueError("fused recall lanes contradict their ranks")
+        if str(self.hit.get("session_id") or "") != self.session_id:
+            raise ValueError("fused recall hit belongs to another session")
+        return self
+
+
+class _FusedRecallDense(BaseModel):
+    model_config = ConfigDict(extra="forbid", strict=True)
+
+    coverage: _EmbeddingCoveragePayload
+    store_id: str
+    schema_generation: str = Field(min_length=1)
+
+    @model_validator(mode="after")
+    def validate_store_identity(self) -> "_FusedRecallDense":
+        try:
+            parsed = UUID(self.store_id)
+        except ValueError as exc:
+            raise ValueError("store_id must be a canonical UUID") from exc
+        if str(parsed) != self.store_id:
+            raise ValueError("store_id must be a canonical UUID")
+        return self
+
+
+class _FusedRecallStageTiming(BaseModel):
+    model_config = ConfigDict(extra="forbid", strict=True, allow_inf_nan=False)
+
+    lexical_ms: float | None
+    dense_ms: float | None
+    fuse_ms: float | None
+    hydrate_ms: float | None
+
+
+class _FusedRecallPayload(BaseModel):
+    """searchd's fused answer: both lanes, the RRF page and its evidence."""
+
+    model_config = ConfigDict(extra="forbid", strict=True)
+
+    matches: list[_FusedRecallEntry]
+    served_lanes: list[Literal["lexical", "dense"]] = Field(min_length=1)
+    lane_errors: list[_FusedRecallLaneError]
+    dense: _FusedRecallDense | None
+    evidence_error: str | None
+    stage_timing: _FusedRecallStageTiming
+
+    @model_validator(mode="after")
+    def validate_lane_accounting(self) -> "_FusedRecallPayload":
+        failed = {error.lane for error in self.lane_errors}
+        if failed & set(self.served_lanes):
+            raise ValueError("a recall lane cannot both serve and fail")
+        if ("dense" in self.served_lanes) != (self.dense is not None):
+            raise ValueError("dense coverage must accompany exactly a served dense lane")
+        return self
+
+
 class _ProjectorStoreBindingPayload(BaseModel):
     model_config = ConfigDict(extra="forbid", strict=True)
 
@@ -384,20 +470,18 @@ async def search_storage_v2_rows(
     return [row for row in (result.get("results") or []) if isinstance(row, dict)]
 
 
-async def search_storage_v2_context(
+async def search_storage_v2_contexts(
     *,
     owner_id: int,
-    session_id: str,
-    generation_id: str,
-    search_event_id: int | None = None,
-    start_order_time_us: int | None = None,
+    locators: list[dict[str, object]],
     context_turns: int,
     timeout_seconds: float,
-) -> _RecallContextPayload:
-    """Read bounded neighbor evidence from the same generation as a search hit.
+) -> _RecallContextsPayload:
+    """Read bounded neighbor evidence for many search hits in one round trip.
 
-    Lexical hits locate by searchd event id; semantic episode hits locate by
-    their start position in the published ordering. Exactly one applies.
+    Each locator names a hit's session and generation plus exactly one of its
+    searchd event id (lexical) or its start position in the published ordering
+    (semantic episodes). ``evidence`` comes back in locator order.
     """
 
     search = get_searchd_client()
@@ -408,15 +492,8 @@ async def search_storage_v2_context(
         )
     try:
         result = await search.call(
-            "search.context.v2",
-            {
-                "owner_id": str(owner_id),
-                "session_id": session_id,
-                "generation_id": generation_id,
-                "search_event_id": search_event_id,
-                "start_order_time_us": start_order_time_us,
-                "context_turns": context_turns,
-            },
+            "search.contexts.v2",
+            {"owner_id": str(owner_id), "locators": locators, "context_turns": context_turns},
             timeout_seconds=timeout_seconds,
         )
     except (CatalogRemoteError, CatalogUnavailable) as exc:
@@ -429,7 +506,7 @@ async def search_storage_v2_context(
                 "reason": reason,
             },
         ) from exc
-    return _RecallContextPayload.model_validate(result)
+    return _RecallContextsPayload.model_validate(result)
 
 
 async def read_search_coverage(*, owner_id: int) -> dict[str, object] | None:
@@ -512,6 +589,108 @@ async def search_storage_v2_episode_embeddings(
     return _DenseQueryPayload.model_validate(result)
 
 
+async def search_storage_v2_recall(
+    *,
+    owner_id: int,
+    query: str,
+    project: str | None,
+    provider: str | None,
+    since_days: int,
+    include_test: bool,
+    include_automation: bool,
+    candidate_depth: int,
+    limit: int,
+    context_turns: int,
+    discovery_timeout_seconds: float,
+    timeout_seconds: float,
+    dense_query: "_DenseQuery | None",
+) -> _FusedRecallPayload:
+    """Run fused hybrid recall inside searchd in one round trip.
+
+    searchd runs FTS and the resident dense index concurrently, fuses them with
+    RRF and reads evidence for the winners in one read-worker turn. With
+    ``dense_query`` None only the lexical lane runs.
+    """
+
+    search = get_searchd_client()
+    if search is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"code": "search_unavailable", "message": "The derived search index is unavailable."},
+        )
+    dense: dict[str, object] | None = None
+    if dense_query is not None:
+        from zerg.models_config import get_embedding_space_config
+
+        config = get_embedding_space_config()
+        binding = dense_query.catalog_coverage.store_binding
+        assert binding is not None
+        exclude_environments, since_iso = _dense_scope(
+            since_days=since_days,
+            include_test=include_test,
+            include_automation=include_automation,
+        )
+        dense = {
+            "model": config.model,
+            "dims": config.dims,
+            "query_embedding": base64.b64encode(dense_query.embedding).decode("ascii"),
+            "limit": min(200, max(1, candidate_depth * 3)),
+            "exclude_environments": exclude_environments,
+            "since_iso": since_iso,
+            # searchd checks the catalog's binding against its own identity
+            # before fusing, so a mismatched store never contributes ranks.
+            "expected_store_id": binding.store_id,
+            "expected_schema_generation": binding.schema_generation,
+        }
+    now = datetime.now(timezone.utc)
+    try:
+        result = await search.call(
+            "search.recall.v2",
+            {
+                "owner_id": str(owner_id),
+                "query": query,
+                "project": project,
+                "provider": provider,
+                "window_start_us": int((now - timedelta(days=since_days)).timestamp() * 1_000_000),
+                "include_test": include_test,
+                "include_automation": include_automation,
+                "candidate_depth": min(200, max(1, candidate_depth)),
+                "limit": limit,
+                "context_turns": context_turns,
+                "discovery_timeout_ms": max(1, int(discovery_timeout_seconds * 1000)),
+                "dense": dense,
+            },
+            timeout_seconds=timeout_seconds,
+        )
+    except (CatalogRemoteError, CatalogUnavailable) as exc:
+        reason = exc.code if isinstance(exc, CatalogRemoteError) else str(exc)
+        logger.warning(
+            "Storage-v2 fused recall unavailable owner_id=%s query_length=%d reason=%s",
+            owner_id,
+            len(query),
+            reason,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "code": "search_unavailable",
+                "message": "The derived search index is unavailable.",
+                "reason": reason,
+            },
+        ) from exc
+    try:
+        return _FusedRecallPayload.model_validate(result)
+    except ValidationError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "code": "search_unavailable",
+                "message": "The derived search index returned a malformed recall.",
+                "reason": "invalid_search_response",
+            },
+        ) from exc
+
+
 async def search_storage_v2_sessions(
     *,
     owner_id: int,
@@ -629,6 +808,157 @@ def _machine_session_from_search_row(row: dict[str, object]) -> MachineSessionRe
     )
 
 
+@dataclass(frozen=True)
+class _DenseQuery:
+    """The API-side half of the dense lane: the query vector and its coverage."""
+
+    embedding: bytes
+    catalog_coverage: _ProjectorCoveragePayload
+
+
+@contextmanager
+def _dense_lane_faults(timeout_seconds: float) -> Iterator[None]:
+    """Map dense-lane faults to the 503s every recall surface reports."""
+
+    from zerg.services.local_embedder import LocalEmbedderUnavailable
+
+    try:
+        yield
+    except LocalEmbedderUnavailable:
+        # A missing model is a deployment fault, not "no results". Swallowing it
+        # is how the previous remote lane stayed dead for days: an empty list is
+        # indistinguishable from an honest miss.
+        logger.error("Dense recall unavailable: local embedder is not loaded")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"code": "embedder_unavailable", "message": "The local embedding model is not loaded."},
+        ) from None
+    except (CatalogRemoteError, CatalogUnavailable) as exc:
+        reason = exc.code if isinstance(exc, CatalogRemoteError) else "searchd_unavailable"
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"code": reason, "message": "The resident dense index is unavailable."},
+        ) from exc
+    except TimeoutError:
+        logger.warning("Dense recall exceeded its %.2fs budget", timeout_seconds)
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"code": "dense_timed_out", "message": "Dense recall exceeded its execution budget."},
+        ) from None
+
+
+def _require_dense_request(*, query: str, owner_id: int | None, timeout_seconds: float) -> None:
+    if timeout_seconds <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={"code": "dense_timed_out", "message": "Dense recall had no execution budget."},
+        )
+    if owner_id is None or not query:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"code": "invalid_dense_request", "message": "Dense recall requires an owner and query."},
+        )
+
+
+async def _prepare_dense_query(*, query: str, owner_id: int | None, timeout_seconds: float) -> _DenseQuery:
+    """Embed the query and read the catalog's coverage of the derived store, concurrently.
+
+    The query is embedded in-process. It used to be a live third-party call
+    whose 27s tail could not fit the 5s route budget, so the lane silently
+    returned nothing on every slow call while spending the whole budget; see
+    zerg/services/local_embedder.py.
+    """
+
+    from zerg.services.local_embedder import embed_query
+
+    _require_dense_request(query=query, owner_id=owner_id, timeout_seconds=timeout_seconds)
+    with _dense_lane_faults(timeout_seconds):
+        query_vec, catalog_coverage = await asyncio.wait_for(
+            asyncio.gather(
+                embed_query(query),
+                _require_projection_coverage(timeout_seconds=timeout_seconds),
+            ),
+            timeout=timeout_seconds,
+        )
+    return _DenseQuery(embedding=query_vec.astype("float32").tobytes(), catalog_coverage=catalog_coverage)
+
+
+def _dense_scope(*, since_days: int, include_test: bool, include_automation: bool) -> tuple[list[str] | None, str]:
+    """Environments to exclude and the recency floor for a dense query.
+
+    Scoping is a SQL predicate against searchd's own session_index
+    (owner/project/provider/environment/recency), not an enumerated session id
+    list -- an earlier version of this paginated the owner's full visible
+    listing client-side and passed ids as a filter, which caps out well before
+    covering a real tenant's full history (tens of thousands of sessions),
+    silently excluding exactly the older sessions a paraphrase query most needs
+    to reach. See search.embedding.query.v2 and ResidentEpisodeIndex.
+    """
+
+    exclude_environments: list[str] = []
+    if not include_test:
+        exclude_environments.extend(["test", "e2e"])
+    if not include_automation:
+        exclude_environments.append("automation")
+    since_iso = (datetime.now(timezone.utc) - timedelta(days=since_days)).isoformat()
+    return exclude_environments or None, since_iso
+
+
+def _dense_recall_match(row: _DenseEpisodeHit) -> RecallMatch:
+    return RecallMatch(
+        session_id=row.session_id,
+        chunk_index=row.episode_ordinal,
+        score=row.score,
+        event_index_start=row.event_index_start,
+        event_index_end=row.event_index_end,
+        # Carrying the generation the episode was embedded from is what lets
+        # hydration refuse a superseded transcript instead of showing
+        # neighbours that have since moved.
+        generation_id=row.generation_id,
+        start_order_time_us=row.start_order_time_us,
+    )
+
+
+def _recall_coverage(
+    *,
+    catalog_coverage: _ProjectorCoveragePayload,
+    resident: _EmbeddingCoveragePayload,
+    store_id: str,
+    schema_generation: str,
+) -> RecallCoverage:
+    from zerg.embedding_space import EMBEDDING_PROJECTOR_ID
+
+    # `indexed_through` is one below the oldest lagging revision, so it is
+    # exactly the point the corpus is provably current through. It was already
+    # computed and returned by catalogd and simply never used; the gate looked
+    # at lag age instead, which is why a single unfinished session could refuse
+    # the whole corpus.
+    return RecallCoverage(
+        complete_through_commit_seq=catalog_coverage.indexed_through,
+        complete=catalog_coverage.lag_count == 0,
+        unpublished_sessions=resident.unpublished_sessions,
+        projector=EMBEDDING_PROJECTOR_ID,
+        search_store_id=store_id,
+        search_schema_generation=schema_generation,
+        catalog_lag_count=catalog_coverage.lag_count,
+        catalog_indexed_through=catalog_coverage.indexed_through,
+        catalog_oldest_lag_at=catalog_coverage.oldest_lag_at,
+        catalog_oldest_lag_seconds=catalog_coverage.oldest_lag_seconds,
+        catalog_commit_seq=catalog_coverage.commit_seq,
+        catalog_observed_at=catalog_coverage.observed_at,
+        resident_stale=resident.stale,
+        expected_sessions=resident.expected_sessions,
+        published_sessions=resident.published_sessions,
+        expected_episodes=resident.expected_episodes,
+        current_episodes=resident.current_episodes,
+        invalid_vectors=resident.invalid_vectors,
+        unnormalized_vectors=resident.unnormalized_vectors,
+        unlocatable_episodes=resident.unlocatable_episodes,
+        episode_count_mismatches=resident.episode_count_mismatches,
+        missing_session_ids=resident.missing_session_ids[:RECALL_COVERAGE_MAX_NAMED_SESSIONS],
+    )
+
+
 async def _semantic_recall(
     *,
     query: str,
@@ -644,64 +974,34 @@ async def _semantic_recall(
 ) -> _DenseRecallResult:
     """Dense recall over episode-level embeddings via searchd's episode_embeddings.
 
-    The query is embedded in-process. It used to be a live third-party call
-    whose 27s tail could not fit the 5s route budget, so the lane silently
-    returned nothing on every slow call while spending the whole budget; see
-    zerg/services/local_embedder.py.
-
     Returns the full ranked list (not deduped against lexical results) so
     the caller can run real reciprocal rank fusion: a session found by both
     lanes should get credit from both, not just whichever ran first.
     """
-    from zerg.embedding_space import EMBEDDING_PROJECTOR_ID
     from zerg.models_config import get_embedding_space_config
-    from zerg.services.local_embedder import LocalEmbedderUnavailable
-    from zerg.services.local_embedder import embed_query
-
-    if timeout_seconds <= 0:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail={"code": "dense_timed_out", "message": "Dense recall had no execution budget."},
-        )
-    if owner_id is None or not query:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={"code": "invalid_dense_request", "message": "Dense recall requires an owner and query."},
-        )
 
+    _require_dense_request(query=query, owner_id=owner_id, timeout_seconds=timeout_seconds)
     config = get_embedding_space_config()
 
     async def _run() -> _DenseRecallResult:
-        query_vec, catalog_coverage = await asyncio.gather(
-            embed_query(query),
-            _require_projection_coverage(timeout_seconds=timeout_seconds),
+        dense_query = await _prepare_dense_query(query=query, owner_id=owner_id, timeout_seconds=timeout_seconds)
+        catalog_coverage = dense_query.catalog_coverage
+        exclude_environments, since_iso = _dense_scope(
+            since_days=since_days,
+            include_test=include_test,
+            include_automation=include_automation,
         )
-
-        # Scoping is a SQL predicate against searchd's own session_index
-        # (owner/project/provider/environment/recency), not an enumerated
-        # session id list -- an earlier version of this paginated the
-        # owner's full visible listing client-side and passed ids as a
-        # filter, which caps out well before covering a real tenant's full
-        # history (tens of thousands of sessions), silently excluding
-        # exactly the older sessions a paraphrase query most needs to
-        # reach. See search.embedding.query.v2 and ResidentEpisodeIndex.
-        exclude_environments: list[str] = []
-        if not include_test:
-            exclude_environments.extend(["test", "e2e"])
-        if not include_automation:
-            exclude_environments.append("automation")
-        since_iso = (datetime.now(timezone.utc) - timedelta(days=since_days)).isoformat()
         dense_payload = await search_storage_v2_episode_embeddings(
             model=config.model,
             owner_id=owner_id,
             dims=config.dims,
-            query_embedding=query_vec.astype("float32").tobytes(),
+            query_embedding=dense_query.embedding,
             limit=max_results * 3,
             timeout_seconds=timeout_seconds,
             project=project,
             provider=provider,
             environment=environment,
-            exclude_environments=exclude_environments or None,
+            exclude_environments=exclude_environments,
             since_iso=since_iso,
             include_origin_hidden=include_automation,
             include_test=include_test,
@@ -731,81 +1031,22 @@ async def _semantic_recall(
         seen: set[str] = set()
         for raw_row in dense_payload.results:
             row = _DenseEpisodeHit.model_validate(raw_row)
-            session_id = row.session_id
-            if not session_id or session_id in seen:
+            if not row.session_id or row.session_id in seen:
                 continue
-            seen.add(session_id)
-            matches.append(
-                RecallMatch(
-                    session_id=session_id,
-                    chunk_index=row.episode_ordinal,
-                    score=row.score,
-                    event_index_start=row.event_index_start,
-                    event_index_end=row.event_index_end,
-                    # Carrying the generation the episode was embedded from is
-                    # what lets hydration refuse a superseded transcript instead
-                    # of showing neighbours that have since moved.
-                    generation_id=row.generation_id,
-                    start_order_time_us=row.start_order_time_us,
-                )
-            )
+            seen.add(row.session_id)
+            matches.append(_dense_recall_match(row))
             if len(matches) >= max_results:
                 break
-        resident = dense_payload.coverage
-        # `indexed_through` is one below the oldest lagging revision, so it is
-        # exactly the point the corpus is provably current through. It was
-        # already computed and returned by catalogd and simply never used; the
-        # gate looked at lag age instead, which is why a single unfinished
-        # session could refuse the whole corpus.
-        coverage = RecallCoverage(
-            complete_through_commit_seq=catalog_coverage.indexed_through,
-            complete=catalog_coverage.lag_count == 0,
-            unpublished_sessions=resident.unpublished_sessions,
-            projector=EMBEDDING_PROJECTOR_ID,
-            search_store_id=dense_payload.store_id,
-            search_schema_generation=dense_payload.schema_generation,
-            catalog_lag_count=catalog_coverage.lag_count,
-            catalog_indexed_through=catalog_coverage.indexed_through,
-            catalog_oldest_lag_at=catalog_coverage.oldest_lag_at,
-            catalog_oldest_lag_seconds=catalog_coverage.oldest_lag_seconds,
-            catalog_commit_seq=catalog_coverage.commit_seq,
-            catalog_observed_at=catalog_coverage.observed_at,
-            resident_stale=resident.stale,
-            expected_sessions=resident.expected_sessions,
-            published_sessions=resident.published_sessions,
-            expected_episodes=resident.expected_episodes,
-            current_episodes=resident.current_episodes,
-            invalid_vectors=resident.invalid_vectors,
-            unnormalized_vectors=resident.unnormalized_vectors,
-            unlocatable_episodes=resident.unlocatable_episodes,
-            episode_count_mismatches=resident.episode_count_mismatches,
-            missing_session_ids=resident.missing_session_ids[:RECALL_COVERAGE_MAX_NAMED_SESSIONS],
+        coverage = _recall_coverage(
+            catalog_coverage=catalog_coverage,
+            resident=dense_payload.coverage,
+            store_id=dense_payload.store_id,
+            schema_generation=dense_payload.schema_generation,
         )
         return _DenseRecallResult(matches=matches, coverage=coverage)
 
-    try:
+    with _dense_lane_faults(timeout_seconds):
         return await asyncio.wait_for(_run(), timeout=timeout_seconds)
-    except LocalEmbedderUnavailable:
-        # A missing model is a deployment fault, not "no results". Swallowing it
-        # is how the previous remote lane stayed dead for days: an empty list is
-        # indistinguishable from an honest miss.
-        logger.error("Dense recall unavailable: local embedder is not loaded")
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail={"code": "embedder_unavailable", "message": "The local embedding model is not loaded."},
-        ) from None
-    except (CatalogRemoteError, CatalogUnavailable) as exc:
-        reason = exc.code if isinstance(exc, CatalogRemoteError) else "searchd_unavailable"
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail={"code": reason, "message": "The resident dense index is unavailable."},
-        ) from exc
-    except TimeoutError:
-        logger.warning("Dense recall exceeded its %.2fs budget", timeout_seconds)
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail={"code": "dense_timed_out", "message": "Dense recall exceeded its execution budget."},
-        ) from None
 
 
 async def _semantic_recall_matches(
@@ -1017,79 +1258,104 @@ async def _lexical_recall_matches(
         if not include_automation and environment == "automation":
             continue
         seen.add(session_id)
-        snippet = str(row.get("content_snippet") or row.get("tool_output_snippet") or "")
-        matches.append(
-            RecallMatch(
-                session_id=session_id,
-                chunk_index=int(row.get("record_ordinal") or 0),
-                score=1.0 / (1.0 + abs(float(row.get("rank") or 0.0))),
-                context_text=snippet or None,
-                evidence=snippet or None,
-                total_events=int(row.get("event_count") or 0),
-                context=[],
-                match_event_id=int(row["search_event_id"]) if row.get("search_event_id") is not None else None,
-                generation_id=str(row.get("generation_id") or "") or None,
-                source_object_id=str(row.get("source_object_id") or "") or None,
-                record_ordinal=int(row.get("record_ordinal") or 0),
-            )
-        )
+        matches.append(_lexical_recall_match(row))
         if len(matches) >= candidate_depth:
             break
     return matches
 
 
-async def _hydrate_recall_match(
-    match: RecallMatch,
+def _lexical_recall_match(row: dict[str, object]) -> RecallMatch:
+    snippet = str(row.get("content_snippet") or row.get("tool_output_snippet") or "")
+    return RecallMatch(
+        session_id=str(row.get("session_id") or ""),
+        chunk_index=int(row.get("record_ordinal") or 0),
+        score=1.0 / (1.0 + abs(float(row.get("rank") or 0.0))),
+        context_text=snippet or None,
+        evidence=snippet or None,
+        total_events=int(row.get("event_count") or 0),
+        context=[],
+        match_event_id=int(row["search_event_id"]) if row.get("search_event_id") is not None else None,
+        generation_id=str(row.get("generation_id") or "") or None,
+        source_object_id=str(row.get("source_object_id") or "") or None,
+        record_ordinal=int(row.get("record_ordinal") or 0),
+    )
+
+
+async def _hydrate_recall_matches(
+    matches: list[RecallMatch],
     *,
     owner_id: int,
     context_turns: int,
     timeout_seconds: float,
 ) -> None:
-    """Attach neighbour evidence to a match and record how well that went.
+    """Attach neighbour evidence to ranked matches and record how well that went.
 
-    Every exit sets ``evidence_status`` explicitly. Nothing here may leave it at
-    the model default, because a default is a claim nobody checked.
+    Every match that can be located is read in one searchd call. Every exit sets
+    ``evidence_status`` explicitly. Nothing here may leave it at the model
+    default, because a default is a claim nobody checked.
     """
 
-    if context_turns == 0:
-        match.evidence_status = "not_requested"
-        match.evidence_reason = None
-        return
-    if match.generation_id is None or (match.match_event_id is None and match.start_order_time_us is None):
-        match.evidence_status = "unavailable"
-        match.evidence_reason = "search_hit_missing_locator"
+    pending = [match for match in matches if _needs_recall_evidence(match, context_turns=context_turns)]
+    if not pending:
         return
+    locators = [
+        {
+            "session_id": match.session_id,
+            "generation_id": match.generation_id,
+            "search_event_id": match.match_event_id,
+            # An event id is exact; a position is an anchor. Prefer the exact
+            # one when a match somehow carries both.
+            "start_order_time_us": None if match.match_event_id is not None else match.start_order_time_us,
+        }
+        for match in pending
+    ]
     try:
-        evidence = await search_storage_v2_context(
+        result = await search_storage_v2_contexts(
             owner_id=owner_id,
-            session_id=match.session_id,
-            generation_id=match.generation_id,
-            search_event_id=match.match_event_id,
-            # An event id is exact; a position is an anchor. Prefer the exact one
-            # when a match somehow carries both.
-            start_order_time_us=None if match.match_event_id is not None else match.start_order_time_us,
+            locators=locators,
             context_turns=context_turns,
             timeout_seconds=timeout_seconds,
         )
     except HTTPException as exc:
         detail = exc.detail if isinstance(exc.detail, dict) else {}
-        match.evidence_status = "partial"
-        match.evidence_reason = str(detail.get("code") or "search_evidence_unavailable")
+        for match in pending:
+            match.evidence_status = "partial"
+            match.evidence_reason = str(detail.get("code") or "search_evidence_unavailable")
         return
-    evidence = _RecallContextPayload.model_validate(evidence)
+    payload = _RecallContextsPayload.model_validate(result)
+    if len(payload.evidence) != len(pending):
+        raise ValueError("search evidence does not line up with the requested hits")
+    for match, evidence in zip(pending, payload.evidence):
+        if evidence is None:
+            match.evidence_status = "unavailable"
+            match.evidence_reason = "search_hit_missing_locator"
+            continue
+        _apply_recall_evidence(match, evidence)
+
+
+def _needs_recall_evidence(match: RecallMatch, *, context_turns: int) -> bool:
+    """Settle the status of a match that cannot be hydrated; True when it can."""
+
+    if context_turns == 0:
+        match.evidence_status = "not_requested"
+        match.evidence_reason = None
+        return False
+    if match.generation_id is None or (match.match_event_id is None and match.start_order_time_us is None):
+        match.evidence_status = "unavailable"
+        match.evidence_reason = "search_hit_missing_locator"
+        return False
+    return True
+
+
+def _apply_recall_evidence(match: RecallMatch, evidence: _RecallEvidencePayload) -> None:
     match.context = [turn.model_dump() for turn in evidence.context]
     match.total_events = evidence.total_events
     # Only the store may declare completeness. An absent status means the
     # response did not carry one, which is not evidence that everything arrived
     # — reading it as "complete" is how a silent contract change would look
     # like a healthy result.
-    reported = evidence.evidence_status
-    match.evidence_status = reported
-    reason = evidence.evidence_reason
-    if reason is not None:
-        match.evidence_reason = str(reason)
-    else:
-        match.evidence_reason = None
+    match.evidence_status = evidence.evidence_status
+    match.evidence_reason = str(evidence.evidence_reason) if evidence.evidence_reason is not None else None
     if match.evidence is None:
         match.evidence = _anchor_excerpt(match)
         match.context_text = match.evidence
@@ -1154,50 +1420,139 @@ def _anchor_excerpt(match: RecallMatch) -> str | None:
 _ANCHOR_EXCERPT_MAX_CHARS = 400
 
 
-def _rrf_merge_recall_matches(
-    lexical: list[RecallMatch],
-    semantic: list[RecallMatch],
-    *,
-    limit: int,
-) -> list[RecallMatch]:
-    """Reciprocal rank fusion over two ranked RecallMatch lists, keyed by session_id.
+@dataclass(frozen=True)
+class _FusedRecallResult:
+    matches: list[RecallMatch]
+    lanes: tuple[Literal["lexical", "dense"], ...]
+    coverage: RecallCoverage | None
+
+
+# What a lane fault reported by searchd reads as to the caller: the same code
+# and message the per-lane RPCs raise for that fault.
+_FUSED_LANE_FAULTS = {
+    "lexical": ("search_unavailable", "The derived search index is unavailable."),
+    "dense": (None, "The resident dense index is unavailable."),
+}
 
-    A session found by both lanes accumulates a score contribution from each
-    (standard RRF agreement credit). When a session appears in both, the
-    match object with the *better* individual rank wins for evidence display
-    -- picking the lexical copy unconditionally would show weaker evidence
-    for a session that the dense lane actually ranked far higher.
+
+async def _fused_recall(
+    *,
+    owner_id: int,
+    query: str,
+    project: Optional[str],
+    provider: Optional[str],
+    since_days: int,
+    include_test: bool,
+    include_automation: bool,
+    max_results: int,
+    candidate_depth: int,
+    context_turns: int,
+    discovery_ends_at: float,
+    remaining_budget: Callable[[], float],
+    timing: ServerTimingRecorder,
+    degraded: list[RecallLaneFailure],
+) -> _FusedRecallResult:
+    """Hybrid recall in one searchd round trip instead of 2 + k.
+
+    The query is embedded here, where the model lives; everything after that
+    -- both lanes, RRF and evidence for the winners -- runs inside searchd. A
+    dense lane that cannot even be prepared still leaves lexical to run.
     """
-    k = 60
-    scores: dict[str, float] = {}
-    best_rank: dict[str, tuple[int, RecallMatch]] = {}
-
-    for rank, match in enumerate(lexical):
-        sid = match.session_id
-        scores[sid] = scores.get(sid, 0.0) + 1.0 / (k + rank + 1)
-        if sid not in best_rank or rank < best_rank[sid][0]:
-            best_rank[sid] = (rank, match)
-    for rank, match in enumerate(semantic):
-        sid = match.session_id
-        scores[sid] = scores.get(sid, 0.0) + 1.0 / (k + rank + 1)
-        if sid not in best_rank or rank < best_rank[sid][0]:
-            best_rank[sid] = (rank, match)
-
-    ordered_ids = sorted(scores, key=lambda sid: scores[sid], reverse=True)
-    merged = []
-    lexical_ranks = {match.session_id: rank for rank, match in enumerate(lexical, start=1)}
-    semantic_ranks = {match.session_id: rank for rank, match in enumerate(semantic, start=1)}
-    for sid in ordered_ids[:limit]:
-        match = best_rank[sid][1]
-        # Report the value the ordering was actually made from. The lanes score
-        # on incomparable scales — lexical is 1/(1+|bm25|), semantic is cosine —
-        # so passing the winner's raw lane score through made a fused list look
-        # arbitrarily ordered to anyone reading the numbers.
-        match.score = scores[sid]
-        match.retrieval_lanes = [lane for lane, ranks in (("lexical", lexical_ranks), ("dense", semantic_ranks)) if sid in ranks]
-        match.lane_ranks = {lane: ranks[sid] for lane, ranks in (("lexical", lexical_ranks), ("dense", semantic_ranks)) if sid in ranks}
-        merged.append(match)
-    return merged
+
+    dense_query: _DenseQuery | None = None
+    try:
+        with timing.span("embed"):
+            dense_query = await _prepare_dense_query(
+                query=query,
+                owner_id=owner_id,
+                timeout_seconds=max(0.05, discovery_ends_at - time.perf_counter()),
+            )
+    except HTTPException as exc:
+        _lane_result(exc, lane="dense", degraded=degraded)
+
+    with timing.span("recall"):
+        payload = await search_storage_v2_recall(
+            owner_id=owner_id,
+            query=query,
+            project=project,
+            provider=provider,
+            since_days=since_days,
+            include_test=include_test,
+            include_automation=include_automation,
+            candidate_depth=candidate_depth,
+            limit=max_results,
+            context_turns=context_turns,
+            discovery_timeout_seconds=max(0.05, discovery_ends_at - time.perf_counter()),
+            timeout_seconds=max(0.05, remaining_budget()),
+            dense_query=dense_query,
+        )
+    for stage, duration_ms in (
+        ("lexical", payload.stage_timing.lexical_ms),
+        ("dense", payload.stage_timing.dense_ms),
+        ("fuse", payload.stage_timing.fuse_ms),
+        ("hydrate", payload.stage_timing.hydrate_ms),
+    ):
+        if duration_ms is not None:
+            timing.record(stage, duration_ms)
+    for error in payload.lane_errors:
+        code, message = _FUSED_LANE_FAULTS[error.lane]
+        if error.code == "embedding_coverage_incomplete":
+            message = "The active embedding corpus is incomplete."
+        elif error.code == "dense_timed_out":
+            message = "Dense recall exceeded its execution budget."
+        fault = HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "code": code or error.code,
+                "message": message,
+                "reason": error.code if code is not None else error.reason,
+            },
+        )
+        _lane_result(fault, lane=error.lane, degraded=degraded)
+
+    if payload.evidence_error is not None:
+        logger.warning("Fused recall evidence unavailable reason=%s", payload.evidence_error)
+    matches: list[RecallMatch] = []
+    for entry in payload.matches:
+        if entry.lane == "lexical":
+            match = _lexical_recall_match(entry.hit)
+        else:
+            match = _dense_recall_match(_DenseEpisodeHit.model_validate(entry.hit))
+        # The fused value is what the ordering was made from; the lanes score
+        # on incomparable scales, so passing a raw lane score through made a
+        # fused list look arbitrarily ordered to anyone reading the numbers.
+        match.score = entry.score
+        match.retrieval_lanes = list(entry.lanes)
+        match.lane_ranks = dict(entry.lane_ranks)
+        if _needs_recall_evidence(match, context_turns=context_turns):
+            if entry.evidence is None:
+                match.evidence_status = "partial"
+                match.evidence_reason = "search_evidence_unavailable"
+            else:
+                _apply_recall_evidence(match, entry.evidence)
+        matches.append(match)
+
+    coverage: RecallCoverage | None = None
+    if payload.dense is not None:
+        assert dense_query is not None
+        catalog_coverage = dense_query.catalog_coverage
+        if payload.dense.coverage.stale:
+            # Catalog advancement precedes the searchd mutation, so a second
+            # read after observing a stale resident snapshot captures the head
+            # responsible for that staleness. The ranks are already fused, so
+            # failing this read keeps the earlier observation rather than the
+            # lane.
+            try:
+                catalog_coverage = await _require_projection_coverage(timeout_seconds=max(0.05, remaining_budget()))
+            except HTTPException:
+                logger.warning("Recall kept its first catalog coverage read after a stale resident snapshot")
+        coverage = _recall_coverage(
+            catalog_coverage=catalog_coverage,
+            resident=payload.dense.coverage,
+            store_id=payload.dense.store_id,
+            schema_generation=payload.dense.schema_generation,
+        )
+    return _FusedRecallResult(matches=matches, lanes=tuple(payload.served_lanes), coverage=coverage)
 
 
 @router.get("/sessions/semantic", response_model=MachineSessionsListResponse)
@@ -1354,57 +1709,51 @@ async def recall_sessions(
     # first and fuse, which made the lane-specific evaluation meaningless: every
     # mode measured some amount of lexical.
     degraded: list[RecallLaneFailure] = []
+    coverage: RecallCoverage | None = None
     if mode == "lexical":
         matches = _rank_single_lane(await lexical(), limit=max_results, lane="lexical")
         lanes = ("lexical",)
-        dense_result = None
     elif mode == "semantic":
         # The caller named exactly one lane. Failing it is the whole answer, so
         # this still raises rather than returning an empty success.
         dense_result = await dense()
         matches = _rank_single_lane(dense_result.matches, limit=max_results, lane="dense")
         lanes = ("dense",)
+        coverage = dense_result.coverage
     else:
-        # `auto` used to gather without `return_exceptions`, so a dense fault
-        # propagated and threw away lexical results that had already been
-        # computed. An agent asking a reasonable question got a 503 and a hint
-        # to go use plain string search instead. A lane that cannot run costs
-        # its own results and says so; it does not cost the request.
-        lexical_outcome, dense_outcome = await asyncio.gather(lexical(), dense(), return_exceptions=True)
-        lexical_matches = _lane_result(lexical_outcome, lane="lexical", degraded=degraded)
-        dense_result = _lane_result(dense_outcome, lane="dense", degraded=degraded)
-        if lexical_matches is None and dense_result is None:
-            # Both lanes are down: there is no partial answer to report, so
-            # surface the lexical fault rather than inventing a summary.
-            raise lexical_outcome if isinstance(lexical_outcome, BaseException) else RuntimeError("recall produced no lanes")
-        served: list[Literal["lexical", "dense"]] = []
-        if lexical_matches is not None:
-            served.append("lexical")
-        if dense_result is not None:
-            served.append("dense")
-        matches = _rrf_merge_recall_matches(
-            lexical_matches or [],
-            dense_result.matches if dense_result is not None else [],
-            limit=max_results,
+        # `auto` used to gather the two lane RPCs and then hydrate each fused
+        # winner with its own context RPC: 2 + k round trips. searchd now runs
+        # both lanes, fuses and hydrates in one. A lane that cannot run still
+        # costs only its own results and says so in `degraded`.
+        fused = await _fused_recall(
+            owner_id=owner_id,
+            query=query,
+            project=project,
+            provider=provider,
+            since_days=since_days,
+            include_test=include_test,
+            include_automation=include_automation,
+            max_results=max_results,
+            candidate_depth=candidate_depth,
+            context_turns=context_turns,
+            discovery_ends_at=time.perf_counter() + discovery_deadline,
+            remaining_budget=remaining_budget,
+            timing=timing,
+            degraded=degraded,
         )
-        lanes = tuple(served)
-
-    # Hydrate after fusion, not before. Hydrating the lexical list first meant
-    # semantic matches never reached the hydrator at all — they were appended
-    # afterwards and went out with empty evidence — while lexical matches that
-    # fusion then dropped were hydrated for nothing.
-    with timing.span("hydrate"):
-        await asyncio.gather(
-            *(
-                _hydrate_recall_match(
-                    match,
-                    owner_id=owner_id,
-                    context_turns=context_turns,
-                    timeout_seconds=max(0.05, remaining_budget()),
-                )
-                for match in matches
+        matches, lanes, coverage = fused.matches, fused.lanes, fused.coverage
+
+    if mode != "auto":
+        # Hydrate after ranking, not before. Hydrating the lexical list first
+        # meant semantic matches never reached the hydrator at all, while
+        # lexical matches that ranking then dropped were hydrated for nothing.
+        with timing.span("hydrate"):
+            await _hydrate_recall_matches(
+                matches,
+                owner_id=owner_id,
+                context_turns=context_turns,
+                timeout_seconds=max(0.05, remaining_budget()),
             )
-        )
 
     _finalize_recall_evidence(matches)
     timing.apply(response)
@@ -1421,7 +1770,7 @@ async def recall_sessions(
             embedding_model=ACTIVE_EMBEDDING_MODEL,
             embedding_dims=ACTIVE_EMBEDDING_DIMS,
             embedding_revision=EMBEDDING_ARTIFACT_REVISION,
-            coverage=dense_result.coverage,
+            coverage=coverage,
             server_commit=_server_build_commit(),
         )
     return RecallResponse(
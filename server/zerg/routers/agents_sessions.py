@@ -272,6 +272,10 @@ async def stream_agent_sessions(
     days_back: int = Query(14, ge=1, le=90),
     limit: int = Query(40, ge=1, le=100),
     skip_initial_replay: bool = Query(False),
+    patch: bool = Query(
+        False,
+        description="Send session_patch events with only the changed fields once a session has been sent in full",
+    ),
     _auth: object = Depends(verify_agents_token),
     _single: None = Depends(require_single_tenant),
 ) -> EventSourceResponse:
@@ -279,6 +283,8 @@ async def stream_agent_sessions(
 
     The initial replay is the cold-start snapshot. After that, commit-driven
     upsert/remove events are the hot path; reconnecting performs a new replay.
+    Clients that opt into ``patch`` merge ``session_patch`` fields into the
+    session they hold; ``session_delta`` always replaces it.
     """
 
     params = TimelineSessionListParams(
@@ -304,6 +310,7 @@ async def stream_agent_sessions(
             params=params,
             skip_initial_replay=skip_initial_replay,
             owner_id=owner_id if isinstance(owner_id, int) else None,
+            emit_patches=patch,
         )
     else:
         owner_id = getattr(_auth, "owner_id", None)
@@ -48,6 +48,7 @@ from zerg.services.storage_v2_semantics import StorageV2SemanticRecoveryError
 from zerg.services.storage_v2_semantics import StorageV2SemanticRecoveryPermanentError
 from zerg.services.storage_v2_semantics import enrich_render_interaction_kinds
 from zerg.services.storage_v2_semantics import recover_render_interaction_kinds
+from zerg.services.usage_ledger import extract_usage_deltas
 from zerg.storage_v2.contracts import DurableReceipt
 from zerg.storage_v2.contracts import EnvelopeIdentity
 from zerg.storage_v2.contracts import RawExportCursor
@@ -75,6 +76,7 @@ from zerg.storage_v2.render_objects import RenderObjectCorruptError
 from zerg.storage_v2.render_objects import RenderObjectSpec
 from zerg.storage_v2.render_objects import RenderObjectValidationError
 from zerg.storage_v2.render_objects import RenderRecord
+from zerg.storage_v2.render_objects import RenderRecordFilter
 from zerg.storage_v2.render_objects import validate_render_object_spec
 from zerg.utils.server_timing import ServerTimingRecorder
 
@@ -581,6 +583,7 @@ def _parse_envelope(
     if envelope_id(identity) != expected_envelope:
         raise ValueError("expected_envelope_id does not match the exact source bytes")
     render_spec = _parse_render_spec(payload["render"], raw_spec=spec, source_envelope_id=expected_envelope)
+    usage_deltas = extract_usage_deltas(provider, (record.data for record in records), fallback_time=datetime.now(UTC))
     return spec, {
         "lane": lane,
         "predecessor_source_epoch": predecessor,
@@ -589,6 +592,7 @@ def _parse_envelope(
         "session_facts": session_facts,
         "render_spec": render_spec,
         "media_refs": media_refs,
+        "usage_deltas": [delta.to_wire() for delta in usage_deltas],
     }
 
 
@@ -1125,6 +1129,7 @@ async def _commit_admitted_envelope(
                 "render_manifest": render_manifest,
                 "session_facts": parsed["session_facts"],
                 "conversation_resets": _conversation_resets(render_spec),
+                "usage_deltas": parsed["usage_deltas"],
                 "sealed_at": datetime.now(UTC).isoformat(),
             },
             timeout_seconds=2.0,
@@ -1260,6 +1265,22 @@ def _manifest_last_key(manifest: dict[str, object]) -> tuple[int, str, str, str,
     return tuple(decoded)  # type: ignore[return-value]
 
 
+def _frontier_cursor_token(session_id: UUID, generation_id: UUID, key: tuple[int, str, str, str, str, int, int]) -> str:
+    return render_detail_cursor_token(
+        RenderDetailCursor(
+            session_id=session_id,
+            render_generation=generation_id,
+            order_time_us=int(key[0]),
+            machine_id=str(key[1]),
+            provider=str(key[2]),
+            opaque_source_id=str(key[3]),
+            source_epoch=UUID(str(key[4])),
+            source_position=int(key[5]),
+            event_subordinal=int(key[6]),
+        )
+    )
+
+
 def _render_event_wire(session_id: UUID, generation_id: UUID, decoded, record: RenderRecord) -> dict[str, object]:
     spec = decoded.spec
     try:
@@ -1539,11 +1560,22 @@ async def read_storage_v2_session_events_page(
     anchor: str,
     limit: int,
     timing: ServerTimingRecorder | None = None,
+    record_filter: RenderRecordFilter | None = None,
+    include_sources: bool = False,
 ) -> dict[str, object]:
     """Read one verified render page for a known owner.
 
     Browser and machine routes share this physical read so the canonical
     product surfaces cannot drift back toward the cold monolith.
+
+    With an active ``record_filter`` the page holds up to ``limit`` matching
+    events. Objects whose filter index rules out every record are skipped
+    without a worker read, and the cursor advances past scanned objects even
+    when they produced no match.
+
+    With ``include_sources`` the page also carries ``event_sources``: the
+    render object hash and record ordinal behind each event, in page order.
+    Both are immutable, so callers may key serialized output on them.
     """
 
     if anchor not in {"start", "tail"}:
@@ -1628,23 +1660,36 @@ async def read_storage_v2_session_events_page(
     raw_workers = get_raw_object_worker_pool()
     raw_manifest_cache: dict[str, dict[str, dict[str, object]]] = {}
     sequence_context_cache: dict[tuple[str, str, str, str, str], dict[str, object]] = {}
-    ordered_events: list[tuple[tuple[int, str, str, str, str, int, int], dict[str, object]]] = []
+    ordered_events: list[tuple[tuple[int, str, str, str, str, int, int], dict[str, object], tuple[str, int]]] = []
     next_object_index = 0
     cursor_key = _cursor_order_key(decoded_cursor) if decoded_cursor is not None else None
+    filtering = record_filter is not None and record_filter.active
+    object_candidates: list[frozenset[int] | None] = [None] * len(objects)
     object_read_duration_ms = 0.0
     try:
+        if filtering:
+            if any(not isinstance(item, dict) for item in objects):
+                raise ValueError("render object manifest is invalid")
+            with timing.span("render_filter_index"):
+                indexes = await workers.read_filter_indexes([(str(item["object_path"]), str(item["object_hash"])) for item in objects])
+            object_candidates = [record_filter.candidate_ordinals(index) for index in indexes]
         while next_object_index < len(objects):
             batch_manifests = objects[next_object_index : next_object_index + _RENDER_READ_BATCH]
             if any(not isinstance(item, dict) for item in batch_manifests):
                 raise ValueError("render object manifest is invalid")
+            batch_reads = [
+                (item, object_candidates[next_object_index + position])
+                for position, item in enumerate(batch_manifests)
+                if object_candidates[next_object_index + position] != frozenset()
+            ]
             object_read_started = monotonic()
             try:
                 decoded_batch = await asyncio.gather(
-                    *(workers.read(str(item["object_path"]), str(item["object_hash"]), lane="user") for item in batch_manifests)
+                    *(workers.read(str(item["object_path"]), str(item["object_hash"]), lane="user") for item, _candidates in batch_reads)
                 )
             finally:
                 object_read_duration_ms += (monotonic() - object_read_started) * 1000.0
-            for item, decoded in zip(batch_manifests, decoded_batch, strict=True):
+            for (item, candidates), decoded in zip(batch_reads, decoded_batch, strict=True):
                 spec = decoded.spec
                 if (
                     spec.session_id != session_id
@@ -1666,6 +1711,8 @@ async def read_storage_v2_session_events_page(
                     reclassify_sequence_controls=spec.provider.strip().lower() == "claude",
                 )
                 for ordinal, record in enumerate(spec.records):
+                    if candidates is not None and ordinal not in candidates:
+                        continue
                     recovered_kind = recovered_kinds.get(ordinal)
                     # A legacy render object may have persisted the ambiguous
                     # command as durable before a later Claude caveat arrived.
@@ -1680,11 +1727,15 @@ async def read_storage_v2_session_events_page(
                         interaction_kind=interaction_kind,
                     ):
                         continue
+                    if filtering and not record_filter.matches(record):
+                        continue
                     key = _render_record_order_key(decoded, record)
                     if (anchor == "start" and (cursor_key is None or key > cursor_key)) or (
                         anchor == "tail" and (cursor_key is None or key < cursor_key)
                     ):
-                        ordered_events.append((key, _render_event_wire(session_id, generation_id, decoded, record)))
+                        ordered_events.append(
+                            (key, _render_event_wire(session_id, generation_id, decoded, record), (decoded.object_hash, ordinal))
+                        )
             next_object_index += len(batch_manifests)
             ordered_events.sort(key=lambda item: item[0])
             if len(ordered_events) > limit:
@@ -1730,8 +1781,24 @@ async def read_storage_v2_session_events_page(
     finally:
         timing.record("render_object_read", object_read_duration_ms)
 
+    scan_frontier = None
+    if filtering and objects and next_object_index >= len(objects) and manifest.get("objects_truncated") is True:
+        # Objects beyond this manifest window start after the last scanned
+        # object's first key (tail: end before its last key), so only matches
+        # up to that bound are final. The next page rescans from it.
+        frontier_object = objects[-1]
+        scan_frontier = _manifest_first_key(frontier_object) if anchor == "start" else _manifest_last_key(frontier_object)
+        ordered_events = [
+            entry for entry in ordered_events if (entry[0] <= scan_frontier if anchor == "start" else entry[0] >= scan_frontier)
+        ]
     page = ordered_events[:limit] if anchor == "start" else ordered_events[-limit:]
     has_more = len(ordered_events) > limit or next_object_index < len(objects) or manifest.get("objects_truncated") is True
+    if page and has_more:
+        next_cursor = page[-1][1]["cursor"] if anchor == "start" else page[0][1]["cursor"]
+    else:
+        next_cursor = None
+    if scan_frontier is not None and len(page) < limit:
+        next_cursor = _frontier_cursor_token(session_id, generation_id, scan_frontier)
     if retain_product_metrics:
         from zerg.metrics import product_read_bytes
         from zerg.metrics import product_read_objects
@@ -1740,15 +1807,18 @@ async def read_storage_v2_session_events_page(
         compressed_bytes = sum(int(item.get("compressed_size") or 0) for item in read_objects if isinstance(item, dict))
         product_read_objects.labels("session_detail", "render").observe(next_object_index)
         product_read_bytes.labels("session_detail", "render").observe(compressed_bytes)
-    return {
+    result: dict[str, object] = {
         "v": 2,
         "session_id": str(session_id),
         "generation_id": str(generation_id),
-        "events": [event for _, event in page],
-        "next_cursor": (page[-1][1]["cursor"] if anchor == "start" else page[0][1]["cursor"]) if page and has_more else None,
+        "events": [event for _, event, _source in page],
+        "next_cursor": next_cursor,
         "has_more": has_more,
         "total": total,
     }
+    if include_sources:
+        result["event_sources"] = [source for _, _event, source in page]
+    return result
 
 
 @router.get("/sessions/{session_id}/events")
@@ -12,6 +12,7 @@ from fastapi import APIRouter
 from fastapi import Request
 from fastapi.responses import JSONResponse
 from sqlalchemy import text
+from sqlalchemy.orm import Session
 
 from zerg.config import get_settings
 
@@ -87,6 +88,153 @@ def _archive_wal_pressure_payload(wal_bytes: int | None) -> dict[str, object]:
     return payload
 
 
+# Refresh cadence (seconds) per cached health probe. In-process counters
+# refresh fastest; table scans and store statistics refresh slowest.
+_PROBE_INTERVAL_SECONDS = {
+    "catalogd_ping": 5.0,
+    "write_serializer": 2.0,
+    "live_write_serializer": 2.0,
+    "readiness_database": 5.0,
+    "database": 5.0,
+    "session_titles": 15.0,
+    "live_store": 30.0,
+    "fts5": 30.0,
+    "archive_wal_bytes": 10.0,
+    "sqlite_wal": 10.0,
+    "session_projection_lag": 30.0,
+    "session_enrichment_lag": 30.0,
+}
+
+
+def _probe(name: str, compute, *, fresh: bool = False, consulted: dict | None = None):
+    """Read one health probe through the snapshot aggregator.
+
+    Raises whatever the probe raised so callers grade cached failures exactly
+    like inline ones.
+    """
+    from zerg.services.health_snapshot import get_health_aggregator
+
+    result = get_health_aggregator().read(name, compute, interval_seconds=_PROBE_INTERVAL_SECONDS[name], fresh=fresh)
+    if consulted is not None:
+        consulted[name] = result
+    return result.unwrap()
+
+
+def _catalogd_ping() -> dict:
+    from zerg.catalogd.client import call_catalogd_sync
+    from zerg.services.catalogd_supervisor import catalogd_paths
+
+    _database_path, catalog_socket = catalogd_paths()
+    return call_catalogd_sync(catalog_socket, "ping.v2", timeout_seconds=CATALOG_HEALTH_TIMEOUT_SECONDS)
+
+
+def _readiness_database_check() -> str:
+    """Probe the readiness database without queueing behind a long write.
+
+    Returns ``ok``, ``memory``, ``events_fts_missing`` or ``unavailable``.
+    """
+    from zerg.database import default_engine
+    from zerg.database import get_live_engine
+    from zerg.database import live_catalog_enabled
+    from zerg.database import live_store_configured
+
+    readiness_engine = None if live_catalog_enabled() else ((get_live_engine() if live_store_configured() else None) or default_engine)
+    db_url = str(readiness_engine.url) if readiness_engine is not None else ""
+    if db_url.startswith("sqlite"):
+        db_path = db_url.replace("sqlite:///", "").replace("sqlite://", "")
+        if not db_path or db_path == ":memory:":
+            return "memory"
+        try:
+            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=2)
+            try:
+                conn.execute("SELECT 1")
+                if readiness_engine is default_engine and not conn.execute(EVENTS_FTS_EXISTS_SQL).fetchone():
+                    return "events_fts_missing"
+            finally:
+                conn.close()
+        except Exception:
+            return "unavailable"
+        return "ok"
+    try:
+        with readiness_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except Exception:
+        return "unavailable"
+    return "ok"
+
+
+def _database_check() -> dict:
+    from zerg.database import default_engine
+    from zerg.database import get_live_engine
+    from zerg.database import live_store_configured
+
+    health_engine = (get_live_engine() if live_store_configured() else None) or default_engine
+    with health_engine.connect() as conn:
+        row = conn.execute(text("SELECT 1")).fetchone()
+    url = health_engine.url
+    return {
+        "status": "pass" if row and row[0] == 1 else "fail",
+        "connection": "ok",
+        "url": str(url).replace(url.password or "", "***") if url.password else str(url),
+    }
+
+
+def _live_store_stats() -> dict:
+    from zerg.database import get_live_session_factory
+    from zerg.services.db_diagnostics import collect_sqlite_store_stats
+
+    _settings = get_settings()
+    diagnostics_db = None
+    if _settings.testing:
+        factory = get_live_session_factory()
+        diagnostics_db = factory() if factory is not None else None
+    try:
+        return collect_sqlite_store_stats(
+            _settings.live_database_url,
+            archive_database_url=_settings.database_url,
+            db=diagnostics_db,
+        )
+    finally:
+        if diagnostics_db is not None:
+            diagnostics_db.close()
+
+
+def _fts5_check() -> dict:
+    from zerg.database import default_engine
+
+    if default_engine is None or default_engine.dialect.name != "sqlite":
+        return {"status": "skip", "reason": "non-sqlite"}
+
+    from zerg.services.agents.fts_journal import fts_journal_available
+    from zerg.services.agents.fts_journal import fts_journal_status
+
+    with Session(default_engine) as db:
+        fts_row = db.execute(text(EVENTS_FTS_EXISTS_SQL)).fetchone()
+        if not fts_row:
+            raise RuntimeError("events_fts table is missing (FTS5 required).")
+        # Index lag: events journaled by bulk ingest but not yet searchable.
+        journal = fts_journal_status(db) if fts_journal_available(db) else None
+    check = {"status": "pass"}
+    if journal is not None:
+        check["pending_events"] = journal.pending_events
+        check["oldest_pending_age_seconds"] = journal.oldest_pending_age_seconds
+    return check
+
+
+def _archive_wal_bytes() -> int | None:
+    from zerg.database import get_wal_bytes
+
+    return get_wal_bytes()
+
+
+def _sqlite_wal_stats() -> tuple:
+    from zerg.database import get_live_wal_bytes
+    from zerg.database import get_wal_bytes
+    from zerg.database import get_wal_checkpoint_metrics
+
+    return get_wal_bytes(), get_live_wal_bytes(), get_wal_checkpoint_metrics()
+
+
 def _session_projection_lag_check(session_factory=None) -> dict:
     """Return lag for sessions whose archive ingest skipped derived projections."""
     if session_factory is None:
@@ -265,11 +413,13 @@ def livez_check():
 
 @router.get("/readyz", operation_id="readyz_check_get")
 @router.head("/readyz", operation_id="readyz_check_head", include_in_schema=False)
-def readyz_check():
+def readyz_check(fresh: bool = False):
     """Readiness probe: returns 503 when core dependencies are unavailable.
 
-    Uses a raw SQLite connection with a short timeout so it never blocks behind
-    a long write transaction.
+    Dependency checks are served from the background health snapshot;
+    ``?fresh=1`` recomputes them. The database probe uses a raw SQLite
+    connection with a short timeout so it never blocks behind a long write
+    transaction.
     """
     # Access the parent app via the request scope (health is mounted on api_app,
     # which is mounted on app). We need app.state from the root app.
@@ -303,13 +453,9 @@ def readyz_check():
     catalogd_ready = False
     if catalog_mode and not _settings.testing:
         try:
-            from zerg.catalogd.client import call_catalogd_sync
             from zerg.catalogd.schema import catalogd_ping_is_compatible
-            from zerg.services.catalogd_supervisor import catalogd_paths
 
-            _database_path, catalog_socket = catalogd_paths()
-            ping = call_catalogd_sync(catalog_socket, "ping.v2", timeout_seconds=CATALOG_HEALTH_TIMEOUT_SECONDS)
-            catalogd_ready = catalogd_ping_is_compatible(ping)
+            catalogd_ready = catalogd_ping_is_compatible(_probe("catalogd_ping", _catalogd_ping, fresh=fresh))
         except Exception:
             catalogd_ready = False
         if not catalogd_ready:
@@ -318,44 +464,29 @@ def readyz_check():
                 content={"status": "unhealthy", "reason": "catalog_unavailable"},
             )
 
-    db_url = str(readiness_engine.url) if readiness_engine is not None else ""
-    if not catalogd_ready and db_url.startswith("sqlite"):
-        db_path = db_url.replace("sqlite:///", "").replace("sqlite://", "")
-        if not db_path or db_path == ":memory:":
+    if not catalogd_ready:
+        database_state = _probe("readiness_database", _readiness_database_check, fresh=fresh)
+        if database_state == "memory":
             return {"status": "ok"}
-        try:
-            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=2)
-            try:
-                conn.execute("SELECT 1")
-                if readiness_engine is default_engine:
-                    row = conn.execute(EVENTS_FTS_EXISTS_SQL).fetchone()
-                    if not row:
-                        return JSONResponse(
-                            status_code=503,
-                            content={"status": "unhealthy", "reason": "events_fts table missing (FTS5 required)"},
-                        )
-            finally:
-                conn.close()
-        except Exception:
+        if database_state == "events_fts_missing":
             return JSONResponse(
                 status_code=503,
-                content={"status": "unhealthy", "reason": "database unavailable"},
+                content={"status": "unhealthy", "reason": "events_fts table missing (FTS5 required)"},
             )
-    elif not catalogd_ready:
-        try:
-            with readiness_engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
-        except Exception:
+        if database_state != "ok":
             return JSONResponse(
                 status_code=503,
                 content={"status": "unhealthy", "reason": "database unavailable"},
             )
 
-    catalog_mode = live_catalog_enabled()
-    writer_stale, writer_metrics = (False, {"status": "retired"}) if catalog_mode else _write_serializer_stall_check()
+    writer_stale, writer_metrics = (
+        (False, {"status": "retired"}) if catalog_mode else _probe("write_serializer", _write_serializer_stall_check, fresh=fresh)
+    )
     archive_degraded = writer_stale and _writer_stall_is_archive_degraded(writer_metrics)
     live_writer_stale, live_writer_metrics = (
-        (False, {"status": "retired", "owner": "catalogd"}) if catalog_mode else _live_write_serializer_check()
+        (False, {"status": "retired", "owner": "catalogd"})
+        if catalog_mode
+        else _probe("live_write_serializer", _live_write_serializer_check, fresh=fresh)
     )
     if live_writer_stale:
         return JSONResponse(
@@ -383,9 +514,8 @@ def readyz_check():
         )
 
     try:
-        from zerg.database import get_wal_bytes
-
-        archive_wal = _archive_wal_pressure_payload(None if catalog_mode else get_wal_bytes())
+        wal_bytes = None if catalog_mode else _probe("archive_wal_bytes", _archive_wal_bytes, fresh=fresh)
+        archive_wal = _archive_wal_pressure_payload(wal_bytes)
         if archive_wal.get("shed"):
             return {
                 "status": "ready_with_archive_degraded",
@@ -400,12 +530,15 @@ def readyz_check():
 
 @router.get("/health", operation_id="health_check_get")
 @router.head("/health", operation_id="health_check_head", include_in_schema=False)
-def health_check(request: Request):
+def health_check(request: Request, fresh: bool = False):
     """Health probe: core dependencies are available.
 
     Returns HTTP 503 when any critical check fails so monitors and the README
     smoke test (`curl -sf`) correctly treat an unhealthy body as a failure.
 
+    Expensive checks are served from the background health snapshot with
+    per-check freshness; trusted callers may pass ``?fresh=1`` to recompute.
+
     Verbose, infra-revealing detail (DB path, email addresses, migration log,
     env specifics) is included only for trusted callers (loopback, admin
     session, or internal token); public callers get a minimal status body.
@@ -417,6 +550,8 @@ def health_check(request: Request):
     _settings = get_settings()
     catalog_mode = live_catalog_enabled()
     trusted = _request_is_trusted(request)
+    fresh = fresh and trusted
+    consulted: dict = {}
     health_status = {"status": "healthy", "message": "Longhouse API is running"}
 
     # `critical_failure` drives the HTTP 503: only hard infra failures (db, fts5,
@@ -503,7 +638,7 @@ def health_check(request: Request):
         try:
             from zerg.services.catalog_read_gateway import title_dependency_health
 
-            title_health = title_dependency_health()
+            title_health = _probe("session_titles", title_dependency_health, fresh=fresh, consulted=consulted)
             degraded = title_health.get("status") == "degraded"
             checks["session_titles"] = {
                 "status": "warn" if degraded else "pass",
@@ -518,16 +653,9 @@ def health_check(request: Request):
     # 2. Database connectivity
     if catalog_mode and not _settings.testing:
         try:
-            from zerg.catalogd.client import call_catalogd_sync
             from zerg.catalogd.schema import catalogd_ping_is_compatible
-            from zerg.services.catalogd_supervisor import catalogd_paths
 
-            _database_path, catalog_socket = catalogd_paths()
-            catalog_ping = call_catalogd_sync(
-                catalog_socket,
-                "ping.v2",
-                timeout_seconds=CATALOG_HEALTH_TIMEOUT_SECONDS,
-            )
+            catalog_ping = _probe("catalogd_ping", _catalogd_ping, fresh=fresh, consulted=consulted)
             # Schema version and generation were reported here but never
             # graded, so an incompatible catalogd passed and only readyz
             # noticed. Deploy gates and QA scripts read this endpoint.
@@ -549,28 +677,14 @@ def health_check(request: Request):
             critical_failure = True
 
     try:
-        from zerg.database import default_engine
-        from zerg.database import get_live_engine
-        from zerg.database import live_store_configured
-
         if catalog_mode:
             checks["database"] = {"status": "pass", "connection": "catalogd"}
         else:
-            health_engine = (get_live_engine() if live_store_configured() else None) or default_engine
-            with health_engine.connect() as conn:
-                result = conn.execute(text("SELECT 1"))
-                row = result.fetchone()
-                db_check = {
-                    "status": "pass" if row and row[0] == 1 else "fail",
-                    "connection": "ok",
-                }
-                if trusted:
-                    db_check["url"] = (
-                        str(health_engine.url).replace(health_engine.url.password or "", "***")
-                        if health_engine.url.password
-                        else str(health_engine.url)
-                    )
-                checks["database"] = db_check
+            db_check = dict(_probe("database", _database_check, fresh=fresh, consulted=consulted))
+            database_url = db_check.pop("url")
+            if trusted:
+                db_check["url"] = database_url
+            checks["database"] = db_check
     except Exception as e:
         checks["database"] = {"status": "fail", "error": str(e)}
         health_status["status"] = "unhealthy"
@@ -578,24 +692,7 @@ def health_check(request: Request):
 
     # 2a. Canonical Live Store topology.
     try:
-        from zerg.database import get_live_session_factory
-        from zerg.database import live_store_configured
-        from zerg.services.db_diagnostics import collect_sqlite_store_stats
-
-        diagnostics_db = None
-        if _settings.testing:
-            factory = get_live_session_factory()
-            diagnostics_db = factory() if factory is not None else None
-        try:
-            live_store = collect_sqlite_store_stats(
-                _settings.live_database_url,
-                archive_database_url=_settings.database_url,
-                db=diagnostics_db,
-            )
-        finally:
-            if diagnostics_db is not None:
-                diagnostics_db.close()
-
+        live_store = _probe("live_store", _live_store_stats, fresh=fresh, consulted=consulted)
         live_status = live_store.get("status")
         live_warnings = live_store.get("warnings") or []
         outbox = live_store.get("live_archive_outbox") or {}
@@ -667,18 +764,10 @@ def health_check(request: Request):
 
     # 3. SQLite FTS5 readiness
     try:
-        from zerg.database import default_engine
-
         if catalog_mode:
             checks["fts5"] = {"status": "skip", "reason": "searchd_owned"}
-        elif default_engine is not None and default_engine.dialect.name == "sqlite":
-            with default_engine.connect() as conn:
-                fts_row = conn.execute(text(EVENTS_FTS_EXISTS_SQL)).fetchone()
-                if not fts_row:
-                    raise RuntimeError("events_fts table is missing (FTS5 required).")
-            checks["fts5"] = {"status": "pass"}
         else:
-            checks["fts5"] = {"status": "skip", "reason": "non-sqlite"}
+            checks["fts5"] = dict(_probe("fts5", _fts5_check, fresh=fresh, consulted=consulted))
     except Exception as e:
         checks["fts5"] = {"status": "fail", "error": str(e)}
         health_status["status"] = "unhealthy"
@@ -722,7 +811,11 @@ def health_check(request: Request):
     checks["migration"] = migration_status
 
     # 7. Write serializer metrics
-    writer_stale, writer_metrics = (False, {"status": "retired"}) if catalog_mode else _write_serializer_stall_check()
+    writer_stale, writer_metrics = (
+        (False, {"status": "retired"})
+        if catalog_mode
+        else _probe("write_serializer", _write_serializer_stall_check, fresh=fresh, consulted=consulted)
+    )
     archive_degraded = writer_stale and _writer_stall_is_archive_degraded(writer_metrics)
     checks["write_serializer"] = _archive_degraded_metrics(writer_metrics) if archive_degraded else writer_metrics
     if archive_degraded:
@@ -734,7 +827,9 @@ def health_check(request: Request):
         health_status["message"] = "Write serializer is stalled"
         critical_failure = True
     _live_writer_stale, live_writer_metrics = (
-        (False, {"status": "retired", "owner": "catalogd"}) if catalog_mode else _live_write_serializer_check()
+        (False, {"status": "retired", "owner": "catalogd"})
+        if catalog_mode
+        else _probe("live_write_serializer", _live_write_serializer_check, fresh=fresh, consulted=consulted)
     )
     checks["live_write_serializer"] = live_writer_metrics
     if _live_writer_stale:
@@ -749,7 +844,9 @@ def health_check(request: Request):
         checks["session_projection_lag"] = {"status": "skip", "reason": "storage_v2_projectors"}
     else:
         try:
-            checks["session_projection_lag"] = _session_projection_lag_check()
+            checks["session_projection_lag"] = dict(
+                _probe("session_projection_lag", _session_projection_lag_check, fresh=fresh, consulted=consulted)
+            )
         except Exception as e:
             checks["session_projection_lag"] = {"status": "warn", "error": str(e)}
 
@@ -759,7 +856,9 @@ def health_check(request: Request):
         checks["session_enrichment_lag"] = {"status": "skip", "reason": "storage_v2_projectors"}
     else:
         try:
-            checks["session_enrichment_lag"] = _session_enrichment_lag_check()
+            checks["session_enrichment_lag"] = dict(
+                _probe("session_enrichment_lag", _session_enrichment_lag_check, fresh=fresh, consulted=consulted)
+            )
         except Exception as e:
             checks["session_enrichment_lag"] = {"status": "warn", "error": str(e)}
 
@@ -767,13 +866,7 @@ def health_check(request: Request):
     # leading indicator of write-side backpressure; the engine's adaptive
     # controller (phase 2) reads this to back off when pressure climbs.
     try:
-        from zerg.database import get_live_wal_bytes
-        from zerg.database import get_wal_bytes
-        from zerg.database import get_wal_checkpoint_metrics
-
-        wal_bytes = get_wal_bytes()
-        live_wal_bytes = get_live_wal_bytes()
-        checkpoint_metrics = get_wal_checkpoint_metrics()
+        wal_bytes, live_wal_bytes, checkpoint_metrics = _probe("sqlite_wal", _sqlite_wal_stats, fresh=fresh, consulted=consulted)
         wal_check = _archive_wal_pressure_payload(wal_bytes)
         if live_wal_bytes is not None:
             wal_check["live_wal_bytes"] = live_wal_bytes
@@ -788,6 +881,13 @@ def health_check(request: Request):
 
     health_status["checks"] = checks
 
+    from zerg.services.health_snapshot import get_health_aggregator
+
+    health_status["freshness"] = {
+        "source": "snapshot" if get_health_aggregator().running and not fresh else "inline",
+        "checks": {name: result.freshness() for name, result in consulted.items()},
+    }
+
     # Untrusted callers get a minimal body: overall status, message, and the
     # build identity ONLY. The commit/version is already public (git history +
     # the image tag) and the deploy verifier reads it from here to confirm a
@@ -14,10 +14,13 @@ import logging
 import os
 import re
 import time
+from dataclasses import dataclass
 from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
+from typing import Any
 from typing import Literal
+from typing import Mapping
 from typing import Optional
 from uuid import UUID
 
@@ -43,6 +46,7 @@ from zerg.dependencies.agents_auth import verify_agents_token
 from zerg.machine_evidence import validate_machine_evidence_identities
 from zerg.metrics import agents_heartbeat_payload_bytes
 from zerg.metrics import agents_heartbeat_requests_total
+from zerg.metrics import agents_heartbeat_snapshot_delta_total
 from zerg.metrics import agents_heartbeat_snapshot_skipped_total
 from zerg.metrics import agents_heartbeat_write_seconds
 from zerg.metrics import managed_session_heartbeat_lease_rows_total
@@ -56,6 +60,11 @@ from zerg.observability import set_span_attributes
 from zerg.schemas.history_import import HistoryImportSnapshot
 from zerg.services.agents.kernel_capabilities import project_session_capabilities
 from zerg.services.catalogd_supervisor import get_catalogd_client
+from zerg.services.heartbeat_snapshot_base import HEARTBEAT_BASE_ACK_HEADER
+from zerg.services.heartbeat_snapshot_base import HeartbeatSnapshotBase
+from zerg.services.heartbeat_snapshot_base import get_heartbeat_snapshot_base_cache
+from zerg.services.heartbeat_snapshot_base import session_snapshot_digest
+from zerg.services.heartbeat_snapshot_base import wire_session_key
 from zerg.services.live_session_state import mark_missing_live_sessions
 from zerg.services.live_session_state import upsert_live_sessions_from_managed_leases
 from zerg.services.managed_control_state import mark_missing_live_control_leases
@@ -391,6 +400,19 @@ class ResolvedLocalSessionIn(UTCBaseModel):
     reason_codes: list[str] = Field(default_factory=list)
 
 
+class HeartbeatSnapshotDeltaIn(UTCBaseModel):
+    """Changed sessions relative to a snapshot the server acknowledged.
+
+    See zerg/services/heartbeat_snapshot_base.py for the protocol.
+    """
+
+    base_digest: str = Field(..., min_length=1, max_length=128)
+    upserted_sessions: list[ResolvedLocalSessionIn] = Field(default_factory=list)
+    removed_session_keys: list[str] = Field(default_factory=list)
+    session_count: int = Field(..., ge=0)
+    machine_evidence_unchanged: bool = False
+
+
 class HeartbeatIn(BaseModel):
     """Payload from the engine daemon."""
 
@@ -451,6 +473,22 @@ class HeartbeatIn(BaseModel):
     # Older engines omit these, which forces the full compatibility path.
     sessions_digest: str | None = Field(None, max_length=128)
     sessions_sequence: int | None = None
+    # Delta-encoded replacement for ``sessions``. Engines send it only after
+    # the server acknowledged a base digest; see heartbeat_snapshot_base.py.
+    snapshot_delta: HeartbeatSnapshotDeltaIn | None = None
+
+    @model_validator(mode="after")
+    def validate_snapshot_delta(self) -> HeartbeatIn:
+        delta = self.snapshot_delta
+        if delta is None:
+            return self
+        if "sessions" in self.model_fields_set:
+            raise ValueError("snapshot_delta replaces sessions; send one or the other")
+        if not str(self.sessions_digest or "").strip():
+            raise ValueError("snapshot_delta requires the resulting sessions_digest")
+        if delta.machine_evidence_unchanged and self.machine_evidence is not None:
+            raise ValueError("machine_evidence_unchanged cannot carry machine_evidence")
+        return self
 
     @field_validator("history_import", mode="before")
     @classmethod
@@ -463,6 +501,150 @@ class HeartbeatIn(BaseModel):
             return HistoryImportSnapshot.unavailable()
 
 
+class HeartbeatResyncRequired(Exception):
+    """A delta heartbeat cannot be applied; the machine must send a full snapshot."""
+
+    def __init__(self, reason: str, *, acknowledged_digest: str | None) -> None:
+        super().__init__(reason)
+        self.reason = reason
+        self.acknowledged_digest = acknowledged_digest
+
+
+@dataclass(frozen=True, slots=True)
+class _HeartbeatSessionSnapshot:
+    """A full session snapshot with its wire form, aligned index by index."""
+
+    payload: HeartbeatIn
+    keys: list[str]
+    sessions_wire: list[Mapping[str, Any]]
+    activity_wire: list[Mapping[str, Any]]
+    reusable_sessions_json: dict[str, dict[str, Any]]
+    machine_evidence_json: dict[str, Any] | None
+
+    def digest(self) -> str:
+        return session_snapshot_digest(self.sessions_wire, self.activity_wire)
+
+
+def _wire_activity(wire: Mapping[str, Any]) -> list[Mapping[str, Any]]:
+    evidence = wire.get("machine_evidence")
+    activity = evidence.get("activity") if isinstance(evidence, Mapping) else None
+    return [fact for fact in activity or () if isinstance(fact, Mapping)]
+
+
+def _full_heartbeat_session_snapshot(payload: HeartbeatIn, wire: Mapping[str, Any]) -> _HeartbeatSessionSnapshot | None:
+    sessions_wire = wire.get("sessions")
+    if not isinstance(sessions_wire, list) or len(sessions_wire) != len(payload.sessions):
+        return None
+    return _HeartbeatSessionSnapshot(
+        payload=payload,
+        keys=[wire_session_key(session) for session in sessions_wire],
+        sessions_wire=sessions_wire,
+        activity_wire=_wire_activity(wire),
+        reusable_sessions_json={},
+        machine_evidence_json=None,
+    )
+
+
+def _apply_heartbeat_snapshot_delta(
+    payload: HeartbeatIn,
+    wire: Mapping[str, Any],
+    base: HeartbeatSnapshotBase | None,
+) -> _HeartbeatSessionSnapshot:
+    """Rebuild the full heartbeat a delta describes, or demand a resync.
+
+    The rebuilt snapshot is accepted only when its recomputed digest equals the
+    ``sessions_digest`` the machine claims for it, so the server never applies
+    or acknowledges a reconstruction the two sides disagree about.
+    """
+
+    delta = payload.snapshot_delta
+    assert delta is not None
+    if base is None:
+        raise HeartbeatResyncRequired("missing_base", acknowledged_digest=None)
+    if base.digest != delta.base_digest:
+        raise HeartbeatResyncRequired("digest_mismatch", acknowledged_digest=base.digest)
+
+    removed = set(delta.removed_session_keys)
+    if not removed.issubset(base.sessions):
+        raise HeartbeatResyncRequired("unknown_removed_session", acknowledged_digest=base.digest)
+    wire_delta = wire.get("snapshot_delta")
+    upserts_wire = wire_delta.get("upserted_sessions") if isinstance(wire_delta, Mapping) else None
+    if not isinstance(upserts_wire, list) or len(upserts_wire) != len(delta.upserted_sessions):
+        upserts_wire = [] if not delta.upserted_sessions else None
+    if upserts_wire is None:
+        raise HeartbeatResyncRequired("malformed_delta", acknowledged_digest=base.digest)
+    upserts: dict[str, tuple[ResolvedLocalSessionIn, Mapping[str, Any]]] = {}
+    for session, session_wire in zip(delta.upserted_sessions, upserts_wire):
+        key = wire_session_key(session_wire)
+        if key in upserts or key in removed:
+            raise HeartbeatResyncRequired("ambiguous_session_key", acknowledged_digest=base.digest)
+        upserts[key] = (session, session_wire)
+
+    keys: list[str] = []
+    sessions: list[ResolvedLocalSessionIn] = []
+    sessions_wire: list[Mapping[str, Any]] = []
+    reusable_json: dict[str, dict[str, Any]] = {}
+    for key, session in base.sessions.items():
+        if key in removed:
+            continue
+        replacement = upserts.pop(key, None)
+        if replacement is None:
+            sessions.append(session)
+            sessions_wire.append(base.sessions_wire[key])
+            reusable_json[key] = base.sessions_json[key]
+        else:
+            sessions.append(replacement[0])
+            sessions_wire.append(replacement[1])
+        keys.append(key)
+    for key, (session, session_wire) in upserts.items():
+        keys.append(key)
+        sessions.append(session)
+        sessions_wire.append(session_wire)
+    if len(sessions) != delta.session_count:
+        raise HeartbeatResyncRequired("session_count_mismatch", acknowledged_digest=base.digest)
+
+    update: dict[str, object] = {"sessions": sessions, "snapshot_delta": None}
+    evidence_json = None
+    activity_wire = _wire_activity(wire)
+    if delta.machine_evidence_unchanged:
+        update["machine_evidence"] = base.machine_evidence
+        evidence_json = base.machine_evidence_json
+        activity_wire = list(base.activity_wire)
+    snapshot = _HeartbeatSessionSnapshot(
+        payload=payload.model_copy(update=update),
+        keys=keys,
+        sessions_wire=sessions_wire,
+        activity_wire=activity_wire,
+        reusable_sessions_json=reusable_json,
+        machine_evidence_json=evidence_json,
+    )
+    if snapshot.digest() != str(payload.sessions_digest or "").strip():
+        raise HeartbeatResyncRequired("sessions_digest_mismatch", acknowledged_digest=base.digest)
+    return snapshot
+
+
+def _heartbeat_snapshot_base(
+    digest: str,
+    snapshot: _HeartbeatSessionSnapshot,
+    sessions_json: list[dict[str, Any]],
+    *,
+    machine_evidence_json: dict[str, Any] | None,
+) -> HeartbeatSnapshotBase | None:
+    if len(set(snapshot.keys)) != len(snapshot.keys):
+        # A snapshot that repeats a key cannot be addressed by a delta;
+        # leaving no base makes the next delta resync instead of guessing.
+        return None
+    return HeartbeatSnapshotBase(
+        digest=digest,
+        sessions=dict(zip(snapshot.keys, snapshot.payload.sessions)),
+        sessions_json=dict(zip(snapshot.keys, sessions_json)),
+        sessions_wire=dict(zip(snapshot.keys, snapshot.sessions_wire)),
+        activity_wire=tuple(snapshot.activity_wire),
+        machine_evidence=snapshot.payload.machine_evidence,
+        machine_evidence_json=machine_evidence_json,
+    )
+
+
 def _machine_process_snapshot_complete(payload: HeartbeatIn, scope_name: str) -> bool:
     evidence = payload.machine_evidence
     if evidence is None:
@@ -833,12 +1015,53 @@ async def ingest_heartbeat(
                     except ValueError:
                         pass
 
-                wire_bytes = len(await request.body())
-                payload_for_retention = payload.model_dump(mode="json")
+                snapshot_bases = get_heartbeat_snapshot_base_cache()
+                raw_body = await request.body()
+                wire_bytes = len(raw_body)
+                session_snapshot: _HeartbeatSessionSnapshot | None = None
+                delta_applied = payload.snapshot_delta is not None
+                if delta_applied or ("sessions" in payload.model_fields_set and payload.sessions_digest):
+                    # Re-read as plain JSON: the digest is defined over the
+                    # strings the engine sent, which the models normalize.
+                    wire = json.loads(raw_body)
+                    if delta_applied:
+                        try:
+                            session_snapshot = _apply_heartbeat_snapshot_delta(payload, wire, snapshot_bases.get(device_id))
+                        except HeartbeatResyncRequired as exc:
+                            agents_heartbeat_snapshot_delta_total.labels(outcome=exc.reason).inc()
+                            request_status_label = "resync_required"
+                            raise HTTPException(
+                                status_code=status.HTTP_409_CONFLICT,
+                                detail={
+                                    "code": "heartbeat_resync_required",
+                                    "message": "Send a full session snapshot; the delta base is not available.",
+                                    "reason": exc.reason,
+                                    "acknowledged_digest": exc.acknowledged_digest,
+                                },
+                            ) from exc
+                        agents_heartbeat_snapshot_delta_total.labels(outcome="applied").inc()
+                        payload = session_snapshot.payload
+                    else:
+                        session_snapshot = _full_heartbeat_session_snapshot(payload, wire)
+
+                payload_for_retention = payload.model_dump(mode="json", exclude={"sessions", "machine_evidence", "snapshot_delta"})
                 if "history_import" not in payload.model_fields_set:
                     payload_for_retention.pop("history_import", None)
-                if payload.machine_evidence is not None:
-                    payload_for_retention["machine_evidence"] = payload.machine_evidence.model_dump(mode="json", exclude_none=True)
+                machine_evidence_json = session_snapshot.machine_evidence_json if session_snapshot is not None else None
+                if machine_evidence_json is None and payload.machine_evidence is not None:
+                    machine_evidence_json = payload.machine_evidence.model_dump(mode="json", exclude_none=True)
+                payload_for_retention["machine_evidence"] = machine_evidence_json
+                # Sessions the delta left untouched keep their retention form
+                # from the base, so an unchanged session costs neither a
+                # validation nor a serialization pass.
+                if session_snapshot is not None:
+                    retained_sessions_json = [
+                        session_snapshot.reusable_sessions_json.get(key) or session.model_dump(mode="json")
+                        for key, session in zip(session_snapshot.keys, payload.sessions)
+                    ]
+                else:
+                    retained_sessions_json = [session.model_dump(mode="json") for session in payload.sessions]
+                payload_for_retention["sessions"] = retained_sessions_json
                 payload_json = json.dumps(payload_for_retention)
                 agents_heartbeat_payload_bytes.observe(wire_bytes)
                 set_span_attributes(
@@ -854,6 +1077,7 @@ async def ingest_heartbeat(
                         "longhouse.heartbeat.spool_dead_count": payload.spool_dead_count,
                         "longhouse.heartbeat.payload_bytes_wire": wire_bytes,
                         "longhouse.heartbeat.is_offline": payload.is_offline,
+                        "longhouse.heartbeat.snapshot_delta": delta_applied,
                     },
                 )
                 set_span_attributes(
@@ -1255,8 +1479,32 @@ async def ingest_heartbeat(
                 task = asyncio.create_task(_run_heartbeat_bookkeeping())
                 task.add_done_callback(lambda done: done.exception() if not done.cancelled() else None)
 
+            response_headers: dict[str, str] = {}
+            snapshot_base = None
+            # A full snapshot becomes a base only when its recomputed digest
+            # agrees with the engine's; otherwise deltas against it could never
+            # verify, and acknowledging it would only provoke resyncs.
+            if (
+                session_snapshot is not None
+                and incoming_sessions_digest is not None
+                and (delta_applied or session_snapshot.digest() == incoming_sessions_digest)
+            ):
+                snapshot_base = _heartbeat_snapshot_base(
+                    incoming_sessions_digest,
+                    session_snapshot,
+                    retained_sessions_json,
+                    machine_evidence_json=machine_evidence_json,
+                )
+            if snapshot_base is not None:
+                snapshot_bases.put(_device_id, snapshot_base)
+                # Acknowledging the digest is what permits the machine to
+                # send its next heartbeat as a delta against it.
+                response_headers[HEARTBEAT_BASE_ACK_HEADER] = incoming_sessions_digest
+            elif _resolved_sessions_present:
+                snapshot_bases.discard(_device_id)
+
             request_status_label = "ok"
-            return Response(status_code=status.HTTP_204_NO_CONTENT)
+            return Response(status_code=status.HTTP_204_NO_CONTENT, headers=response_headers)
         except HTTPException:
             # Preserve typed route errors such as hot-write backpressure instead
             # of logging them as heartbeat ingest internals.
@@ -59,6 +59,7 @@ from zerg.services.runner_health import build_runner_response
 from zerg.services.runner_health import normalize_runner_binary_tag
 from zerg.services.runner_heartbeat_cache import mark_runner_heartbeat
 from zerg.services.runner_job_dispatcher import get_runner_job_dispatcher
+from zerg.services.runner_job_dispatcher import runner_slots_from_metadata
 from zerg.services.write_serializer import get_live_write_serializer
 from zerg.services.write_serializer import get_write_serializer
 from zerg.utils.server_timing import ServerTimingRecorder
@@ -1133,8 +1134,9 @@ async def _runner_websocket_with_db(
 
         owner_id = runner.owner_id
 
-        # Register connection
+        # Register connection and the job slots the runner advertised
         connection_manager.register(owner_id, runner_id, websocket)
+        job_dispatcher.set_runner_slots(runner_id, runner_slots_from_metadata(metadata))
 
         # Update runner status to online via serializer
         _rid = runner_id
@@ -1205,6 +1207,7 @@ async def _runner_websocket_with_db(
 
             # Only mark runner offline if we actually unregistered it (wasn't replaced)
             if was_unregistered:
+                job_dispatcher.runner_disconnected(runner_id)
                 _rid = runner_id
 
                 def _mark_offline(wdb: Session) -> None:
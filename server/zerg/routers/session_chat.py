@@ -68,6 +68,7 @@ from zerg.services.managed_local_launcher import build_managed_local_launch_plan
 from zerg.services.managed_local_launcher import managed_local_run_id_for_session
 from zerg.services.managed_local_launcher import managed_provider_has_lease_observer
 from zerg.services.managed_local_launcher import resolve_managed_local_launch_runner
+from zerg.services.quota import assert_can_start_run
 from zerg.services.session_chat_impl import ManagedLocalSessionLaunchResponse
 from zerg.services.session_chat_impl import SessionDraftReplyResponse
 from zerg.services.session_chat_impl import SessionLockInfo
@@ -1272,6 +1273,7 @@ async def send_to_live_session(
     source_session = _load_session_for_continuation(db, session_id, owner_id=current_user.id)
     logger.info(f"[{request_id}] Live session send request for session {source_session.id}")
     _assert_live_session_send_available(db, source_session, owner_id=current_user.id)
+    await assert_can_start_run(user=current_user)
     lock_scope_id = await _acquire_session_lock_or_raise(source_session=source_session, request_id=request_id)
     try:
         return await _build_managed_local_chat_response(
@@ -2983,6 +2985,7 @@ async def create_session_input_endpoint(
     current_user: User = Depends(get_current_browser_route_user),
 ) -> SessionInputResponse:
     source_session = _load_session_for_continuation(db, session_id, owner_id=current_user.id)
+    await assert_can_start_run(user=current_user)
     return await _create_session_input_response(
         source_session=source_session,
         owner_id=current_user.id,
@@ -43,6 +43,7 @@ from zerg.routers.session_chat import QueuedInputSummary
 from zerg.routers.session_chat import SessionInputResponse
 from zerg.services.live_session_inputs import record_live_input_receipt_best_effort
 from zerg.services.managed_provider_contracts import managed_transport_for_control_plane
+from zerg.services.quota import assert_can_start_run
 from zerg.services.session_chat_impl import _assert_live_session_send_available
 from zerg.services.session_chat_impl import _build_managed_local_chat_response
 from zerg.services.session_chat_impl import _load_session_for_continuation
@@ -235,6 +236,11 @@ async def create_session_input_with_attachments(
     except HTTPException:
         _record_outcome("rejected_live_control")
         raise
+    try:
+        await assert_can_start_run(user=current_user)
+    except HTTPException:
+        _record_outcome("rejected_quota")
+        raise
 
     if database_module.live_catalog_enabled():
         codex_transport = _catalog_codex_transport_available(source_session)
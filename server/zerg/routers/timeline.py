@@ -60,6 +60,7 @@ from zerg.services.agents import AgentsStore
 from zerg.services.catalog_read_gateway import CatalogReadError
 from zerg.services.catalog_read_gateway import enrolled_machines
 from zerg.services.catalog_read_gateway import machine_workspaces
+from zerg.services.event_fragments import fragment_json_response
 from zerg.services.live_catalog_timeline import list_live_catalog_sessions
 from zerg.services.live_catalog_timeline import list_live_catalog_timeline
 from zerg.services.live_catalog_timeline import read_live_catalog_session
@@ -109,6 +110,7 @@ from zerg.services.timeline_session_listing import list_timeline_sessions_for_br
 from zerg.services.timeline_session_stream import stream_timeline_sessions_for_browser
 from zerg.services.timeline_session_stream import validate_timeline_stream_contract
 from zerg.services.workspace_suggestions import build_workspace_suggestions
+from zerg.storage_v2.render_objects import RenderRecordFilter
 from zerg.utils.server_timing import ServerTimingRecorder
 
 logger = logging.getLogger(__name__)
@@ -421,6 +423,11 @@ async def list_timeline_sessions(
     query: Optional[str] = Query(None, description="Search query for content"),
     limit: int = Query(20, ge=1, description="Max results (server clamps to 100)"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(
+        None,
+        max_length=1024,
+        description="Opaque next_cursor from the previous page; replaces offset for deep pages",
+    ),
     sort: Optional[str] = Query(
         None,
         description="Sort order: relevance|recency|balanced. Default: recency if no query, relevance if query present.",
@@ -448,7 +455,10 @@ async def list_timeline_sessions(
         sort=sort,
         mode=mode,
         context_mode=context_mode,
+        cursor=cursor,
     )
+    if cursor is not None and (query or not database_module.live_catalog_enabled()):
+        raise HTTPException(status_code=400, detail="cursor pagination is only available for live catalog timeline listings")
     if database_module.live_catalog_enabled():
         try:
             with timing.span("catalog_search" if query else "catalog_list"):
@@ -470,6 +480,8 @@ async def list_timeline_sessions(
                 status_code=503,
                 detail={"code": exc.code, "message": exc.message},
             ) from exc
+        except SessionListingError as exc:
+            raise HTTPException(status_code=exc.status_code, detail=exc.detail) from exc
         except ValueError:
             raise
     try:
@@ -1052,6 +1064,7 @@ async def get_timeline_session_events(
     current_user=Depends(get_current_browser_user),
 ):
     timing = ServerTimingRecorder(surface="session_detail")
+    role_filter = frozenset(value.strip() for value in roles.split(",") if value.strip()) if roles else None
     storage_workspace = await build_storage_v2_workspace(
         session_id=session_id,
         owner_id=int(current_user.id),
@@ -1060,6 +1073,8 @@ async def get_timeline_session_events(
         cursor=cursor,
         anchor=anchor,
         timing=timing,
+        record_filter=RenderRecordFilter(roles=role_filter, tool_name=tool_name, query=query),
+        serialized_events=True,
     )
     if storage_workspace is None and not get_settings().testing:
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
@@ -1090,15 +1105,8 @@ async def get_timeline_session_events(
         timing.apply(response)
         return result
     projection = storage_workspace["projection"]
-    role_filter = {value.strip() for value in roles.split(",") if value.strip()} if roles else None
+    # Filters were pushed down into the render read, so the page is already dense.
     events = [item["event"] for item in projection["items"] if item.get("kind") == "event" and item.get("event")]
-    if role_filter is not None:
-        events = [event for event in events if event.get("role") in role_filter]
-    if tool_name is not None:
-        events = [event for event in events if event.get("tool_name") == tool_name]
-    if query is not None:
-        needle = query.casefold()
-        events = [event for event in events if needle in str(event.get("content_text") or "").casefold()]
     result = {
         "events": events,
         "total": projection["total"],
@@ -1109,7 +1117,7 @@ async def get_timeline_session_events(
         "has_more": projection.get("has_more", False),
     }
     timing.apply(response)
-    return result
+    return fragment_json_response(result, response=response)
 
 
 @router.get("/sessions/{session_id}/projection")
@@ -1135,6 +1143,7 @@ async def get_timeline_session_projection(
         limit=limit,
         cursor=cursor,
         anchor=anchor,
+        serialized_events=True,
     )
     if storage_workspace is None and not get_settings().testing:
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
@@ -1159,7 +1168,7 @@ async def get_timeline_session_projection(
                 )
 
         return await asyncio.to_thread(build_legacy_projection)
-    return storage_workspace["projection"]
+    return fragment_json_response(storage_workspace["projection"], response=response)
 
 
 @router.get("/sessions/{session_id}/workspace")
@@ -1194,6 +1203,7 @@ async def get_timeline_session_workspace(
         limit=limit,
         cursor=cursor,
         timing=timing,
+        serialized_events=True,
     )
     if storage_workspace is None and not get_settings().testing:
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
@@ -1233,7 +1243,7 @@ async def get_timeline_session_workspace(
         timing.apply(response)
         return result
     timing.apply(response)
-    return storage_workspace
+    return fragment_json_response(storage_workspace, response=response)
 
 
 # Documented, not validated: the storage-v2 branch returns an already-serialized
@@ -1264,6 +1274,7 @@ async def get_timeline_session_mobile_tail(
         limit=limit,
         cursor=cursor,
         timing=timing,
+        serialized_events=True,
     )
     if storage_workspace is None and not get_settings().testing:
         raise HTTPException(status_code=404, detail=f"Session {session_id} not found")
@@ -1293,12 +1304,15 @@ async def get_timeline_session_mobile_tail(
         timing.apply(response)
         return result
     timing.apply(response)
-    return {
-        "session": storage_workspace["session"],
-        "projection": storage_workspace["projection"],
-        "snapshot_event_id": storage_workspace["workspace_revision"]["latest_event_id"],
-        "workspace_revision": storage_workspace["workspace_revision"],
-    }
+    return fragment_json_response(
+        {
+            "session": storage_workspace["session"],
+            "projection": storage_workspace["projection"],
+            "snapshot_event_id": storage_workspace["workspace_revision"]["latest_event_id"],
+            "workspace_revision": storage_workspace["workspace_revision"],
+        },
+        response=response,
+    )
 
 
 @router.get("/sessions/{session_id}/export")
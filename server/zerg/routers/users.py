@@ -23,6 +23,7 @@ from sqlalchemy.orm import Session
 
 import zerg.database as database_module
 from zerg.auth.catalog_gateway import update_user
+from zerg.catalogd.client import CatalogUnavailable
 from zerg.database import get_db
 
 # Auth guard ---------------------------------------------------------------
@@ -105,9 +106,8 @@ def read_current_user(current_user=Depends(get_current_user)):
 
 
 @router.get("/users/me/usage", response_model=UserUsageResponse)
-def read_current_user_usage(
+async def read_current_user_usage(
     period: Literal["today", "7d", "30d"] = Query("today", description="Time period for usage stats"),
-    db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
     """Return the authenticated user's LLM usage stats.
@@ -116,7 +116,10 @@ def read_current_user_usage(
     The `limit` field always reflects today's daily limit usage,
     regardless of the selected period.
     """
-    return get_user_usage(db, current_user.id, period)
+    try:
+        return await get_user_usage(current_user.id, period)
+    except CatalogUnavailable as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Usage ledger is unavailable") from exc
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,349 @@
+"""Priority-laned, adaptively sized pool of searchd read workers.
+
+searchd used to hand read workers out FIFO from a fixed queue, so one slow
+archive FTS scan from the timeline could hold a worker while interactive recall
+waited behind it, and projector reads competed with both. Reads now enter one
+of three lanes:
+
+- ``interactive``: recall, evidence hydration, ping and coverage;
+- ``timeline``: user-facing archive search;
+- ``background``: projector reads that feed embedding passes.
+
+A freed worker always goes to the highest-priority lane with an admissible
+waiter. Lower lanes leave ``reserve`` workers free for the lanes above them and
+may be capped outright, and each lane bounds its own queue so a burst is
+rejected as retryable instead of waiting out its deadline. A waiter whose
+deadline has already passed is failed rather than handed a worker.
+
+The pool grows by one worker whenever a request has queued longer than
+``grow_after_ms`` and shrinks back toward ``min_workers`` once nothing has had
+to queue for ``shrink_after_seconds``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Generic
+from typing import TypeVar
+
+READ_LANES = ("interactive", "timeline", "background")
+
+# Rolling window per lane, matching the catalogd writer stats.
+_LANE_HISTOGRAM_WINDOW = 256
+
+W = TypeVar("W")
+
+
+@dataclass(frozen=True)
+class ReadLaneLimit:
+    """Admission for one lane; lanes earlier in ``READ_LANES`` win freed workers."""
+
+    max_queued: int
+    reserve: int = 0
+    max_active: int | None = None
+
+
+DEFAULT_READ_LANE_LIMITS: Mapping[str, ReadLaneLimit] = {
+    "interactive": ReadLaneLimit(max_queued=256),
+    "timeline": ReadLaneLimit(max_queued=128, reserve=1),
+    "background": ReadLaneLimit(max_queued=32, reserve=1, max_active=1),
+}
+
+
+class ReadLaneRejected(RuntimeError):
+    """The lane's queue is full; the caller should retry rather than wait."""
+
+    def __init__(self, lane: str) -> None:
+        super().__init__(f"searchd {lane} read queue is full")
+        self.lane = lane
+
+
+class ReadLaneStats:
+    """Queue wait and hold time per read lane, shaped like ``CatalogWriterStats``."""
+
+    def __init__(self) -> None:
+        self._queue_wait: dict[str, deque[float]] = {lane: deque(maxlen=_LANE_HISTOGRAM_WINDOW) for lane in READ_LANES}
+        self._exec: dict[str, deque[float]] = {lane: deque(maxlen=_LANE_HISTOGRAM_WINDOW) for lane in READ_LANES}
+        self._counts = dict.fromkeys(READ_LANES, 0)
+        self._expired = dict.fromkeys(READ_LANES, 0)
+        self._rejected = dict.fromkeys(READ_LANES, 0)
+        self._depth = dict.fromkeys(READ_LANES, 0)
+        self._peak_depth = dict.fromkeys(READ_LANES, 0)
+        self._lock = threading.Lock()
+
+    def depth(self, lane: str) -> int:
+        return self._depth[lane]
+
+    def record_enqueue(self, lane: str) -> None:
+        with self._lock:
+            self._depth[lane] += 1
+            self._peak_depth[lane] = max(self._peak_depth[lane], self._depth[lane])
+
+    def record_dequeue(self, lane: str) -> None:
+        with self._lock:
+            self._depth[lane] = max(0, self._depth[lane] - 1)
+
+    def record_admit(self, lane: str, queue_wait_ms: float) -> None:
+        with self._lock:
+            self._queue_wait[lane].append(queue_wait_ms)
+            self._counts[lane] += 1
+
+    def record_release(self, lane: str, exec_ms: float) -> None:
+        with self._lock:
+            self._exec[lane].append(exec_ms)
+
+    def record_expired(self, lane: str) -> None:
+        with self._lock:
+            self._expired[lane] += 1
+
+    def record_rejected(self, lane: str) -> None:
+        with self._lock:
+            self._rejected[lane] += 1
+
+    @staticmethod
+    def _percentiles(samples) -> dict[str, float]:
+        if not samples:
+            return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        ordered = sorted(samples)
+
+        def at(q: int) -> float:
+            return round(ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))], 2)
+
+        return {"p50": at(50), "p95": at(95), "p99": at(99), "max": round(ordered[-1], 2)}
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                lane: {
+                    "n": self._counts[lane],
+                    "depth": self._depth[lane],
+                    "peak_depth": self._peak_depth[lane],
+                    "expired": self._expired[lane],
+                    "rejected": self._rejected[lane],
+                    "queue_wait_ms": self._percentiles(self._queue_wait[lane]),
+                    "exec_ms": self._percentiles(self._exec[lane]),
+                }
+                for lane in READ_LANES
+            }
+
+
+@dataclass(slots=True)
+class _Waiter:
+    lane: str
+    deadline_mono_ns: int
+    queued_at: float
+    future: asyncio.Future
+
+
+@dataclass(slots=True)
+class ReadLease(Generic[W]):
+    worker: W
+    lane: str
+    queue_wait_ms: float
+    admitted_at: float
+
+
+class SearchReadPool(Generic[W]):
+    """Hand read workers to lanes by priority; grow and shrink within bounds.
+
+    Every method runs on the daemon's event loop. Opening a worker is one
+    read-only SQLite connection and a thread, cheap enough to do inline.
+    """
+
+    def __init__(
+        self,
+        *,
+        open_worker: Callable[[str], W],
+        close_worker: Callable[[W], None],
+        min_workers: int,
+        max_workers: int,
+        grow_after_ms: float = 25.0,
+        shrink_after_seconds: float = 30.0,
+        lane_limits: Mapping[str, ReadLaneLimit] = DEFAULT_READ_LANE_LIMITS,
+    ) -> None:
+        if min_workers < 1 or max_workers < min_workers:
+            raise ValueError("read pool bounds must satisfy 1 <= min_workers <= max_workers")
+        if set(lane_limits) != set(READ_LANES):
+            raise ValueError("read pool needs a limit for every lane")
+        self._open_worker = open_worker
+        self._close_worker = close_worker
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self._grow_after_seconds = grow_after_ms / 1000
+        self._shrink_after_seconds = shrink_after_seconds
+        self._limits = dict(lane_limits)
+        self.workers: list[W] = []
+        self._idle: list[W] = []
+        self._active = dict.fromkeys(READ_LANES, 0)
+        self._waiters: dict[str, deque[_Waiter]] = {lane: deque() for lane in READ_LANES}
+        self._last_queued_at = 0.0
+        self._opened = 0
+        self._grown = 0
+        self._shrunk = 0
+        self.stats = ReadLaneStats()
+
+    def start(self) -> None:
+        while len(self.workers) < self.min_workers:
+            self._add_worker()
+
+    def close(self) -> list[W]:
+        """Fail every waiter and return all workers for the caller to close."""
+
+        for queue in self._waiters.values():
+            while queue:
+                waiter = queue.popleft()
+                if not waiter.future.done():
+                    waiter.future.cancel()
+        workers, self.workers, self._idle = self.workers, [], []
+        return workers
+
+    @property
+    def active(self) -> int:
+        return sum(self._active.values())
+
+    @property
+    def queued(self) -> int:
+        return sum(len(queue) for queue in self._waiters.values())
+
+    async def acquire(self, lane: str, *, deadline_mono_ns: int) -> ReadLease[W]:
+        """Admit one read on ``lane``; raise ``TimeoutError`` once its deadline passes."""
+
+        queued_at = time.monotonic()
+        if time.monotonic_ns() >= deadline_mono_ns:
+            self.stats.record_expired(lane)
+            raise TimeoutError
+        if not any(self._waiters[ahead] for ahead in READ_LANES[: READ_LANES.index(lane) + 1]) and self._admissible(lane):
+            return self._admit(lane, self._idle.pop(), queued_at)
+        if len(self._waiters[lane]) >= self._limits[lane].max_queued:
+            self.stats.record_rejected(lane)
+            raise ReadLaneRejected(lane)
+        waiter = _Waiter(lane, deadline_mono_ns, queued_at, asyncio.get_running_loop().create_future())
+        self._waiters[lane].append(waiter)
+        self.stats.record_enqueue(lane)
+        self._last_queued_at = queued_at
+        deadline = deadline_mono_ns / 1_000_000_000
+        try:
+            while True:
+                grow_at = queued_at + self._grow_after_seconds
+                wake_at = min(deadline, grow_at) if len(self.workers) < self.max_workers else deadline
+                try:
+                    async with asyncio.timeout_at(wake_at):
+                        worker = await asyncio.shield(waiter.future)
+                except TimeoutError:
+                    if waiter.future.done():
+                        worker = waiter.future.result()
+                    elif time.monotonic() >= deadline:
+                        self.stats.record_expired(lane)
+                        raise
+                    else:
+                        # Queued past the growth threshold: add a worker and
+                        # let the dispatcher give it to the most urgent lane.
+                        self._last_queued_at = time.monotonic()
+                        queued_at = self._last_queued_at
+                        if len(self.workers) < self.max_workers:
+                            self._add_worker()
+                            self._grown += 1
+                            self._dispatch()
+                        continue
+                return self._admit(lane, worker, waiter.queued_at, dispatched=True)
+        except BaseException:
+            if waiter in self._waiters[lane]:
+                self._waiters[lane].remove(waiter)
+                self.stats.record_dequeue(lane)
+            if waiter.future.done() and not waiter.future.cancelled() and waiter.future.exception() is None:
+                # The dispatcher handed this waiter a worker just as it gave up.
+                self._active[lane] -= 1
+                self._return(waiter.future.result())
+            raise
+
+    def release(self, lease: ReadLease[W]) -> None:
+        self._active[lease.lane] -= 1
+        self.stats.record_release(lease.lane, (time.monotonic() - lease.admitted_at) * 1000)
+        self._return(lease.worker)
+
+    def snapshot(self) -> dict:
+        return {
+            "workers": len(self.workers),
+            "min_workers": self.min_workers,
+            "max_workers": self.max_workers,
+            "idle": len(self._idle),
+            "grown": self._grown,
+            "shrunk": self._shrunk,
+            "lanes": self.stats.snapshot(),
+        }
+
+    def _add_worker(self) -> None:
+        worker = self._open_worker(f"searchd-read-{self._opened}")
+        self._opened += 1
+        self.workers.append(worker)
+        self._idle.append(worker)
+
+    def _admissible(self, lane: str) -> bool:
+        if not self._idle:
+            return False
+        limit = self._limits[lane]
+        if limit.max_active is not None and self._active[lane] >= limit.max_active:
+            return False
+        # Leave ``reserve`` idle workers for the lanes above, except that a
+        # one-worker pool must still serve every lane.
+        return len(self._idle) > min(limit.reserve, len(self.workers) - 1)
+
+    def _admit(self, lane: str, worker: W, queued_at: float, *, dispatched: bool = False) -> ReadLease[W]:
+        if not dispatched:
+            self._active[lane] += 1
+        admitted_at = time.monotonic()
+        queue_wait_ms = (admitted_at - queued_at) * 1000
+        self.stats.record_admit(lane, queue_wait_ms)
+        return ReadLease(worker=worker, lane=lane, queue_wait_ms=queue_wait_ms, admitted_at=admitted_at)
+
+    def _return(self, worker: W) -> None:
+        if worker not in self.workers:
+            return
+        if (
+            not self.queued
+            and len(self.workers) > self.min_workers
+            and time.monotonic() - self._last_queued_at >= self._shrink_after_seconds
+        ):
+            self.workers.remove(worker)
+            self._shrunk += 1
+            self._close_worker(worker)
+            return
+        self._idle.append(worker)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        now_ns = time.monotonic_ns()
+        while self._idle:
+            for lane in READ_LANES:
+                queue = self._waiters[lane]
+                while queue and (queue[0].future.done() or queue[0].deadline_mono_ns <= now_ns):
+                    expired = queue.popleft()
+                    self.stats.record_dequeue(lane)
+                    if not expired.future.done():
+                        self.stats.record_expired(lane)
+                        expired.future.set_exception(TimeoutError())
+                if queue and self._admissible(lane):
+                    waiter = queue.popleft()
+                    self.stats.record_dequeue(lane)
+                    self._active[lane] += 1
+                    waiter.future.set_result(self._idle.pop())
+                    break
+            else:
+                return
+
+
+__all__ = [
+    "DEFAULT_READ_LANE_LIMITS",
+    "READ_LANES",
+    "ReadLaneLimit",
+    "ReadLaneRejected",
+    "ReadLaneStats",
+    "ReadLease",
+    "SearchReadPool",
+]
@@ -0,0 +1,137 @@
+"""Hybrid recall fusion, run inside searchd beside the indexes it fuses.
+
+``search.recall.v2`` runs the FTS lane and the resident dense lane in one
+request, fuses them here, and hydrates only the fused winners. The API used to
+do the fusion itself: one RPC per lane, then one ``search.context.v2`` round
+trip per winner, each paying socket framing, admission and JSON for a handful
+of rows.
+
+These functions are pure so the route and the daemon cannot drift apart on
+what a candidate is or how two lanes agree:
+
+- a lane contributes at most one candidate per session, its best-ranked row;
+- fusion is reciprocal rank fusion with ``k = 60``;
+- a session found by both lanes keeps the row of whichever lane ranked it
+  better, and its score is the fused value the ordering was made from.
+"""
+
+from __future__ import annotations
+
+RRF_K = 60
+
+_TEST_ENVIRONMENTS = frozenset({"test", "e2e"})
+
+
+def lexical_candidates(
+    rows: list[dict[str, object]],
+    *,
+    include_test: bool,
+    include_automation: bool,
+    depth: int,
+) -> list[dict[str, object]]:
+    """One FTS row per session, best row wins, in the lane's own order."""
+
+    candidates: list[dict[str, object]] = []
+    seen: set[str] = set()
+    for row in rows:
+        session_id = str(row.get("session_id") or "")
+        environment = str(row.get("environment") or "")
+        if not session_id or session_id in seen:
+            continue
+        if not include_test and environment in _TEST_ENVIRONMENTS:
+            continue
+        if not include_automation and environment == "automation":
+            continue
+        seen.add(session_id)
+        candidates.append(row)
+        if len(candidates) >= depth:
+            break
+    return candidates
+
+
+def dense_candidates(rows: list[dict[str, object]], *, depth: int) -> list[dict[str, object]]:
+    """One episode per session, best episode wins, in the lane's own order."""
+
+    candidates: list[dict[str, object]] = []
+    seen: set[str] = set()
+    for row in rows:
+        session_id = str(row.get("session_id") or "")
+        if not session_id or session_id in seen:
+            continue
+        seen.add(session_id)
+        candidates.append(row)
+        if len(candidates) >= depth:
+            break
+    return candidates
+
+
+def rrf_fuse(
+    lexical: list[dict[str, object]],
+    dense: list[dict[str, object]],
+    *,
+    limit: int,
+) -> list[dict[str, object]]:
+    """Fuse two per-session candidate lists into the final ranked page.
+
+    Each entry names the lane whose row it carries (``lane`` and ``hit``), the
+    lanes that found the session and its 1-based rank in each. Ties keep
+    lexical-first insertion order, so a repeated query cannot reorder itself.
+    """
+
+    scores: dict[str, float] = {}
+    best: dict[str, tuple[int, str, dict[str, object]]] = {}
+    lane_ranks: dict[str, dict[str, int]] = {}
+    for lane, candidates in (("lexical", lexical), ("dense", dense)):
+        for rank, row in enumerate(candidates):
+            session_id = str(row["session_id"])
+            scores[session_id] = scores.get(session_id, 0.0) + 1.0 / (RRF_K + rank + 1)
+            lane_ranks.setdefault(session_id, {})[lane] = rank + 1
+            if session_id not in best or rank < best[session_id][0]:
+                best[session_id] = (rank, lane, row)
+
+    fused: list[dict[str, object]] = []
+    for session_id in sorted(scores, key=scores.__getitem__, reverse=True)[:limit]:
+        _rank, lane, row = best[session_id]
+        ranks = lane_ranks[session_id]
+        fused.append(
+            {
+                "session_id": session_id,
+                "lane": lane,
+                "hit": row,
+                "score": scores[session_id],
+                "lanes": [name for name in ("lexical", "dense") if name in ranks],
+                "lane_ranks": ranks,
+            }
+        )
+    return fused
+
+
+def evidence_locator(entry: dict[str, object]) -> dict[str, object] | None:
+    """Where to read a fused winner's neighbours, or None when it has no locator.
+
+    An event id is exact; an episode start position is an anchor. Lexical rows
+    carry the first and dense episodes the second.
+    """
+
+    hit = entry["hit"]
+    assert isinstance(hit, dict)
+    generation_id = hit.get("generation_id")
+    search_event_id = hit.get("search_event_id") if entry["lane"] == "lexical" else None
+    start_order_time_us = hit.get("start_order_time_us") if entry["lane"] == "dense" else None
+    if not generation_id or (search_event_id is None and start_order_time_us is None):
+        return None
+    return {
+        "session_id": str(entry["session_id"]),
+        "generation_id": str(generation_id),
+        "search_event_id": search_event_id,
+        "start_order_time_us": None if search_event_id is not None else start_order_time_us,
+    }
+
+
+__all__ = [
+    "RRF_K",
+    "dense_candidates",
+    "evidence_locator",
+    "lexical_candidates",
+    "rrf_fuse",
+]
@@ -27,11 +27,19 @@ from zerg.catalogd.protocol import write_frame
 from zerg.embedding_space import ACTIVE_EMBEDDING_DIMS
 from zerg.embedding_space import ACTIVE_EMBEDDING_MODEL
 from zerg.searchd.dense_index import ResidentEpisodeIndex
+from zerg.searchd.read_pool import ReadLaneRejected
+from zerg.searchd.read_pool import ReadLease
+from zerg.searchd.read_pool import SearchReadPool
+from zerg.searchd.recall import dense_candidates
+from zerg.searchd.recall import evidence_locator
+from zerg.searchd.recall import lexical_candidates
+from zerg.searchd.recall import rrf_fuse
 from zerg.searchd.store import SearchStore
 from zerg.searchd.store import WorklogPageTooLarge
 from zerg.searchd.store import WorklogSnapshotError
 from zerg.searchd.store import open_search_database
 from zerg.searchd.store import open_search_read_database
+from zerg.searchd.store import uses_searchable_corpus
 
 _HASH = re.compile(r"[0-9a-f]{64}\Z")
 _PROVIDER = re.compile(r"[a-z0-9][a-z0-9_-]{0,31}\Z")
@@ -41,6 +49,15 @@ logger = logging.getLogger(__name__)
 _DENSE_REFRESH_COALESCE_SECONDS = 0.01
 
 
+def _env_positive_int(name: str, default: int) -> int:
+    raw = os.getenv(name, "").strip()
+    try:
+        value = int(raw) if raw else default
+    except ValueError:
+        value = default
+    return max(1, value)
+
+
 class _ReadDeadlineExceeded(RuntimeError):
     pass
 
@@ -62,6 +79,10 @@ class _EmbeddingCoverageIncomplete(RuntimeError):
     """The active corpus has not been completely published into one space."""
 
 
+class _RecallStoreBindingMismatch(RuntimeError):
+    """The caller's catalog binding names a different derived store."""
+
+
 @dataclass(slots=True)
 class _ReadWorker:
     connection: sqlite3.Connection
@@ -86,15 +107,16 @@ class SearchDaemon:
         self._dense_known_unservable = False
         self._closing = False
         self._executor: ThreadPoolExecutor | None = None
-        self._read_workers: asyncio.Queue[_ReadWorker] | None = None
-        self._all_read_workers: list[_ReadWorker] = []
+        self._read_pool: SearchReadPool[_ReadWorker] | None = None
         self._worklog_worker: _ReadWorker | None = None
         self._worklog_lock = asyncio.Lock()
-        self._embedding_source_worker: _ReadWorker | None = None
-        self._embedding_source_lock = asyncio.Lock()
         self._server: asyncio.AbstractServer | None = None
         self._published_inode: tuple[int, int] | None = None
 
+    @property
+    def _all_read_workers(self) -> list[_ReadWorker]:
+        return list(self._read_pool.workers) if self._read_pool is not None else []
+
     @property
     def _read_connection(self) -> sqlite3.Connection | None:
         """Compatibility access for focused tests; production uses the worker queue."""
@@ -141,14 +163,19 @@ class SearchDaemon:
             # FIFO executor. Raising this count can publish a snapshot that
             # predates a concurrent committed mutation.
             self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="searchd-sqlite")
-            worker_count = min(2, max(1, (os.cpu_count() or 1) // 2))
-            self._read_workers = asyncio.Queue(maxsize=worker_count)
-            for index in range(worker_count):
-                worker = self._new_read_worker(f"searchd-read-{index}")
-                self._all_read_workers.append(worker)
-                self._read_workers.put_nowait(worker)
+            cpu_count = os.cpu_count() or 1
+            min_workers = _env_positive_int("LONGHOUSE_SEARCHD_READ_WORKERS_MIN", min(2, max(1, cpu_count // 2)))
+            max_workers = max(min_workers, _env_positive_int("LONGHOUSE_SEARCHD_READ_WORKERS_MAX", min(8, cpu_count)))
+            self._read_pool = SearchReadPool(
+                open_worker=self._new_read_worker,
+                close_worker=self._close_read_worker,
+                min_workers=min_workers,
+                max_workers=max_workers,
+            )
+            self._read_pool.start()
+            # Worklog snapshots are bound to one connection, so they keep a
+            # dedicated worker outside the pool.
             self._worklog_worker = self._new_read_worker("searchd-worklog")
-            self._embedding_source_worker = self._new_read_worker("searchd-embedding-source")
             self._prepare_socket()
             temporary = self.socket_path.with_name(f".{self.socket_path.name}.tmp.{os.getpid()}")
             if len(os.fsencode(temporary)) >= 104:
@@ -192,19 +219,15 @@ class SearchDaemon:
         if self._executor is not None:
             self._executor.shutdown(wait=True, cancel_futures=True)
             self._executor = None
-        for worker in self._all_read_workers:
-            worker.executor.shutdown(wait=True, cancel_futures=True)
-            worker.connection.close()
-        self._all_read_workers.clear()
-        self._read_workers = None
+        if self._read_pool is not None:
+            for worker in self._read_pool.close():
+                worker.executor.shutdown(wait=True, cancel_futures=True)
+                worker.connection.close()
+            self._read_pool = None
         if self._worklog_worker is not None:
             self._worklog_worker.executor.shutdown(wait=True, cancel_futures=True)
             self._worklog_worker.connection.close()
             self._worklog_worker = None
-        if self._embedding_source_worker is not None:
-            self._embedding_source_worker.executor.shutdown(wait=True, cancel_futures=True)
-            self._embedding_source_worker.connection.close()
-            self._embedding_source_worker = None
         if self._connection is not None:
             self._connection.close()
             self._connection = None
@@ -263,24 +286,22 @@ class SearchDaemon:
     async def _dispatch(self, request: CatalogRpcRequest) -> CatalogRpcResponse:
         if time.monotonic_ns() > int(request.deadline_mono_ns):
             return self._error(request, "deadline_exceeded", "request deadline exceeded", retryable=True)
-        if (
-            self._store is None
-            or self._executor is None
-            or self._read_workers is None
-            or self._worklog_worker is None
-            or self._embedding_source_worker is None
-        ):
+        if self._store is None or self._executor is None or self._read_pool is None or self._worklog_worker is None:
             return self._error(request, "catalog_unavailable", "search index is not ready", retryable=True)
         try:
             if request.method == "search.ping.v2":
-                ping = await self._run_interactive_read(
+                ping = await self._run_read(
                     lambda store: store.ping(),
+                    lane="interactive",
                     deadline_mono_ns=int(request.deadline_mono_ns),
                 )
                 coverage = (
                     self._dense_index.coverage.as_dict() if self._dense_index is not None else {"integrity_ready": False, "complete": False}
                 )
-                return self._result(request, {**ping, "pid": os.getpid(), "embedding_coverage": coverage})
+                return self._result(
+                    request,
+                    {**ping, "pid": os.getpid(), "embedding_coverage": coverage, "read_pool": self._read_pool.snapshot()},
+                )
             if request.method == "search.index.object.v2":
                 params = _index_object_params(request.params)
                 return self._result(request, await self._run(self._store.index_object, **params))
@@ -310,8 +331,9 @@ class SearchDaemon:
                 params = _embedding_hashes_params(request.params)
                 return self._result(
                     request,
-                    await self._run_interactive_read(
+                    await self._run_read(
                         lambda store: store.read_episode_embedding_hashes(**params),
+                        lane="background",
                         deadline_mono_ns=int(request.deadline_mono_ns),
                     ),
                 )
@@ -319,35 +341,18 @@ class SearchDaemon:
                 params = _embedding_source_params(request.params)
                 return self._result(
                     request,
-                    await self._run_embedding_source_read(
+                    await self._run_read(
                         lambda store: store.read_embedding_source(**params),
+                        lane="background",
                         deadline_mono_ns=int(request.deadline_mono_ns),
                     ),
                 )
             if request.method == "search.embedding.query.v2":
                 params = _embedding_query_params(request.params)
-                # Served from the resident matrix, not by rebuilding 85MB of
-                # vectors out of SQLite blobs on every request. An unloaded
-                # index is an error, never an empty result: the two are
-                # indistinguishable to a caller and that is how a dead lane
-                # stayed dead.
-                if self._dense_index is None or not self._dense_index.ready:
-                    raise _ResidentEpisodeIndexUnavailable
-                if params["model"] != self._dense_index.model or params["dims"] != self._dense_index.dims:
-                    raise _EmbeddingSpaceMismatch
-                # Integrity gates serving; completeness does not. A session that
-                # has not finished projecting yet makes the corpus less fresh,
-                # which the coverage payload reports to the caller. A corrupt or
-                # unlocatable vector makes it wrong, and still fails closed.
-                if not self._dense_index.coverage.integrity_ready:
-                    raise _EmbeddingCoverageIncomplete
-                query = np.frombuffer(params.pop("query_embedding"), dtype="float32")
-                params.pop("model", None)
-                params.pop("dims", None)
                 return self._result(
                     request,
                     {
-                        "results": self._dense_index.search(query, **params),
+                        "results": self._dense_search(params),
                         "coverage": self._dense_index.coverage.as_dict(),
                         **(self._store_identity or {}),
                     },
@@ -358,17 +363,15 @@ class SearchDaemon:
                     return self._error(request, "invalid_request", "search.coverage.v2 requires owner_id")
                 return self._result(
                     request,
-                    await self._run_interactive_read(
+                    await self._run_read(
                         lambda store: store.search_coverage(owner_id=owner_id),
+                        lane="interactive",
                         deadline_mono_ns=int(request.deadline_mono_ns),
                     ),
                 )
             if request.method == "search.query.v2":
                 params = _search_params(request.params)
-                result = await self._run_interactive_read(
-                    lambda store: store.search(**params),
-                    deadline_mono_ns=int(request.deadline_mono_ns),
-                )
+                result = await self._run_search(params, lane="timeline", deadline_mono_ns=int(request.deadline_mono_ns))
                 timing = result.get("timing") if isinstance(result.get("timing"), dict) else {}
                 logger.debug(
                     "searchd query scope=%s ranking=%s query_tokens=%s compiled_tokens=%s results=%s admit_ms=%s sql_ms=%s",
@@ -381,12 +384,26 @@ class SearchDaemon:
                     timing.get("sql_ms"),
                 )
                 return self._result(request, result)
+            if request.method == "search.recall.v2":
+                params = _recall_params(request.params)
+                return self._result(request, await self._run_recall(params, deadline_mono_ns=int(request.deadline_mono_ns)))
             if request.method == "search.context.v2":
                 params = _context_params(request.params)
                 return self._result(
                     request,
-                    await self._run_interactive_read(
+                    await self._run_read(
                         lambda store: store.recall_context(**params),
+                        lane="interactive",
+                        deadline_mono_ns=int(request.deadline_mono_ns),
+                    ),
+                )
+            if request.method == "search.contexts.v2":
+                params = _contexts_params(request.params)
+                return self._result(
+                    request,
+                    await self._run_read(
+                        lambda store: store.recall_contexts(**params),
+                        lane="interactive",
                         deadline_mono_ns=int(request.deadline_mono_ns),
                     ),
                 )
@@ -481,6 +498,8 @@ class SearchDaemon:
             return self._error(request, exc.code, str(exc), retryable=exc.code in {"snapshot_capacity", "stale_snapshot"})
         except _ReadDeadlineExceeded:
             return self._error(request, "deadline_exceeded", "search read deadline exceeded", retryable=True)
+        except ReadLaneRejected as exc:
+            return self._error(request, "resource_exhausted", str(exc), retryable=True)
         except _ResidentEpisodeIndexUnavailable:
             return self._error(request, "dense_index_unavailable", "the resident vector index is not loaded")
         except _EmbeddingSpaceMismatch:
@@ -624,16 +643,22 @@ class SearchDaemon:
             executor=ThreadPoolExecutor(max_workers=1, thread_name_prefix=name),
         )
 
-    async def _run_interactive_read(self, function, *, deadline_mono_ns: int) -> dict[str, object]:
-        assert self._read_workers is not None
+    @staticmethod
+    def _close_read_worker(worker: _ReadWorker) -> None:
+        """Retire an idle pool worker once its lane traffic has drained."""
+
+        worker.executor.shutdown(wait=False)
+        worker.connection.close()
+
+    async def _run_read(self, function, *, lane: str, deadline_mono_ns: int) -> dict[str, object]:
+        assert self._read_pool is not None
+        pool = self._read_pool
         deadline = deadline_mono_ns / 1_000_000_000
-        queued_at = time.monotonic()
         try:
-            async with asyncio.timeout_at(deadline):
-                worker = await self._read_workers.get()
+            lease = await pool.acquire(lane, deadline_mono_ns=deadline_mono_ns)
         except TimeoutError as exc:
             raise _ReadDeadlineExceeded from exc
-        admitted_at = time.monotonic()
+        worker = lease.worker
         execution = asyncio.get_running_loop().run_in_executor(
             worker.executor,
             lambda: self._execute_read(worker.connection, lambda: function(worker.store), deadline_mono_ns),
@@ -644,33 +669,216 @@ class SearchDaemon:
             completed_at = time.monotonic()
             payload = dict(result)
             payload["timing"] = {
-                "admit_ms": round((admitted_at - queued_at) * 1000, 1),
-                "sql_ms": round((completed_at - admitted_at) * 1000, 1),
-                "active_readers": len(self._all_read_workers) - self._read_workers.qsize(),
-                "queued_readers": self._read_workers.qsize(),
+                "admit_ms": round(lease.queue_wait_ms, 1),
+                "sql_ms": round((completed_at - lease.admitted_at) * 1000, 1),
+                "active_readers": pool.active,
+                "queued_readers": pool.queued,
             }
             return payload
         except TimeoutError as exc:
-            # Capture this worker now. The local variable is cleared below so
-            # the finally block does not return it before its SQLite call has
+            # Capture this lease now. The local variable is cleared below so
+            # the finally block does not release it before its SQLite call has
             # unwound; a closure over the variable itself would later see None
             # and permanently reduce the read pool after a deadline.
-            execution.add_done_callback(lambda completed, finished_worker=worker: self._return_finished_worker(finished_worker, completed))
-            worker = None
+            execution.add_done_callback(lambda completed, finished=lease: self._return_finished_worker(finished, completed))
+            lease = None
             raise _ReadDeadlineExceeded from exc
         finally:
-            if worker is not None:
-                self._read_workers.put_nowait(worker)
+            if lease is not None:
+                pool.release(lease)
+
+    async def _run_search(self, params: dict, *, lane: str, deadline_mono_ns: int) -> dict[str, object]:
+        """Serve one search, ranking archive shards on the read workers at once.
+
+        Each shard is its own read on ``lane``, so shards queue behind other
+        requests on the same pool rather than monopolizing it, and the
+        merge reads snippets only for the final page. Shards may observe
+        different WAL snapshots, so a publication landing mid-search can
+        surface a hit from the generation it superseded; recall already
+        re-checks publication when it loads a hit's evidence.
+        """
 
-    def _return_finished_worker(self, worker: _ReadWorker, completed: asyncio.Future) -> None:
+        if not uses_searchable_corpus(params["window_start_us"]):
+            plan = await self._run_read(
+                lambda store: {"shards": store.archive_shards()},
+                lane=lane,
+                deadline_mono_ns=deadline_mono_ns,
+            )
+            shards = plan["shards"]
+            if len(shards) > 1:
+                shard_params = {**params, "include_snippets": False}
+                shard_results = await asyncio.gather(
+                    *(
+                        self._run_read(
+                            lambda store, shard=shard: store.search(**shard_params, rowid_range=shard),
+                            lane=lane,
+                            deadline_mono_ns=deadline_mono_ns,
+                        )
+                        for shard in shards
+                    )
+                )
+                return await self._run_read(
+                    lambda store: store.merge_archive_shards(
+                        query=params["query"],
+                        shard_results=shard_results,
+                        limit=params["limit"],
+                        include_snippets=params["include_snippets"],
+                    ),
+                    lane=lane,
+                    deadline_mono_ns=deadline_mono_ns,
+                )
+        return await self._run_read(
+            lambda store: store.search(**params),
+            lane=lane,
+            deadline_mono_ns=deadline_mono_ns,
+        )
+
+    def _dense_search(self, params: dict) -> list[dict[str, object]]:
+        """Search the resident matrix with validated embedding query params.
+
+        Served from the resident matrix, not by rebuilding 85MB of vectors out
+        of SQLite blobs on every request. An unloaded index is an error, never
+        an empty result: the two are indistinguishable to a caller and that is
+        how a dead lane stayed dead.
+        """
+
+        if self._dense_index is None or not self._dense_index.ready:
+            raise _ResidentEpisodeIndexUnavailable
+        if params["model"] != self._dense_index.model or params["dims"] != self._dense_index.dims:
+            raise _EmbeddingSpaceMismatch
+        # Integrity gates serving; completeness does not. A session that has
+        # not finished projecting yet makes the corpus less fresh, which the
+        # coverage payload reports to the caller. A corrupt or unlocatable
+        # vector makes it wrong, and still fails closed.
+        if not self._dense_index.coverage.integrity_ready:
+            raise _EmbeddingCoverageIncomplete
+        query = np.frombuffer(params["query_embedding"], dtype="float32")
+        search_params = {key: value for key, value in params.items() if key not in {"query_embedding", "model", "dims"}}
+        return self._dense_index.search(query, **search_params)
+
+    async def _run_recall(self, params: dict, *, deadline_mono_ns: int) -> dict[str, object]:
+        """Run both recall lanes, fuse them and hydrate the winners in one request.
+
+        Lexical discovery runs on the read pool while the dense lane scans the
+        resident matrix on another thread; both stop at the discovery deadline
+        so hydration keeps its reserve. A lane that cannot run is reported in
+        ``lane_errors`` and costs only its own candidates. Evidence for every
+        winner is read in one read-worker turn instead of one RPC per match.
+        """
+
+        discovery_deadline_mono_ns = min(
+            deadline_mono_ns,
+            time.monotonic_ns() + params["discovery_timeout_ms"] * 1_000_000,
+        )
+        stage_timing: dict[str, float | None] = {"lexical_ms": None, "dense_ms": None, "fuse_ms": None, "hydrate_ms": None}
+
+        async def lexical() -> dict[str, object]:
+            started = time.monotonic()
+            try:
+                return await self._run_search(params["lexical"], lane="interactive", deadline_mono_ns=discovery_deadline_mono_ns)
+            finally:
+                stage_timing["lexical_ms"] = round((time.monotonic() - started) * 1000, 1)
+
+        def dense() -> tuple[list[dict[str, object]], dict[str, object]]:
+            started = time.monotonic()
+            try:
+                dense_params = params["dense"]
+                identity = self._store_identity or {}
+                if (identity.get("store_id"), identity.get("schema_generation")) != (
+                    dense_params["expected_store_id"],
+                    dense_params["expected_schema_generation"],
+                ):
+                    raise _RecallStoreBindingMismatch
+                search_params = {key: value for key, value in dense_params.items() if not key.startswith("expected_")}
+                rows = self._dense_search(search_params)
+                return rows, self._dense_index.coverage.as_dict()
+            finally:
+                stage_timing["dense_ms"] = round((time.monotonic() - started) * 1000, 1)
+
+        lanes = [lexical()]
+        if params["dense"] is not None:
+            discovery_seconds = max(0.0, (discovery_deadline_mono_ns - time.monotonic_ns()) / 1_000_000_000)
+            lanes.append(asyncio.wait_for(asyncio.to_thread(dense), timeout=discovery_seconds))
+        lexical_outcome, *dense_outcomes = await asyncio.gather(*lanes, return_exceptions=True)
+        dense_outcome = dense_outcomes[0] if dense_outcomes else None
+
+        lane_errors: list[dict[str, object]] = []
+        lexical_rows: list[dict[str, object]] | None = None
+        if isinstance(lexical_outcome, _ReadDeadlineExceeded):
+            lane_errors.append({"lane": "lexical", "code": "deadline_exceeded", "reason": None})
+        elif isinstance(lexical_outcome, BaseException):
+            raise lexical_outcome
+        else:
+            lexical_rows = [row for row in lexical_outcome.get("results") or [] if isinstance(row, dict)]
+        dense_rows: list[dict[str, object]] | None = None
+        dense_served: dict[str, object] | None = None
+        if dense_outcome is not None:
+            if isinstance(dense_outcome, BaseException):
+                error = _recall_dense_lane_error(dense_outcome)
+                if error is None:
+                    raise dense_outcome
+                lane_errors.append(error)
+            else:
+                dense_rows, coverage = dense_outcome
+                dense_served = {"coverage": coverage, **(self._store_identity or {})}
+        if lexical_rows is None and dense_rows is None:
+            # Nothing to fuse: surface the lexical fault as the whole answer.
+            raise lexical_outcome
+
+        fuse_started = time.monotonic()
+        depth = params["candidate_depth"]
+        matches = rrf_fuse(
+            lexical_candidates(
+                lexical_rows or [],
+                include_test=params["include_test"],
+                include_automation=params["include_automation"],
+                depth=depth,
+            ),
+            dense_candidates(dense_rows or [], depth=depth),
+            limit=params["limit"],
+        )
+        stage_timing["fuse_ms"] = round((time.monotonic() - fuse_started) * 1000, 1)
+
+        evidence_error: str | None = None
+        evidence: list[dict[str, object] | None] = [None] * len(matches)
+        locators = [evidence_locator(match) for match in matches]
+        if params["context_turns"] > 0 and any(locator is not None for locator in locators):
+            hydrate_started = time.monotonic()
+            try:
+                hydrated = await self._run_read(
+                    lambda store: store.recall_contexts(
+                        owner_id=params["lexical"]["owner_id"],
+                        locators=locators,
+                        context_turns=params["context_turns"],
+                    ),
+                    lane="interactive",
+                    deadline_mono_ns=deadline_mono_ns,
+                )
+                evidence = list(hydrated["evidence"])
+            except _ReadDeadlineExceeded:
+                evidence_error = "deadline_exceeded"
+            stage_timing["hydrate_ms"] = round((time.monotonic() - hydrate_started) * 1000, 1)
+        for match, item in zip(matches, evidence, strict=True):
+            match["evidence"] = item
+
+        return {
+            "matches": matches,
+            "served_lanes": [lane for lane, rows in (("lexical", lexical_rows), ("dense", dense_rows)) if rows is not None],
+            "lane_errors": lane_errors,
+            "dense": dense_served,
+            "evidence_error": evidence_error,
+            "stage_timing": stage_timing,
+        }
+
+    def _return_finished_worker(self, lease: ReadLease[_ReadWorker], completed: asyncio.Future) -> None:
         """Return a timed-out worker only after its SQLite call has unwound."""
 
         try:
             completed.result()
         except (Exception, asyncio.CancelledError):
             pass
-        if self._read_workers is not None:
-            self._read_workers.put_nowait(worker)
+        if self._read_pool is not None:
+            self._read_pool.release(lease)
 
     async def _run_worklog_read(self, function, *, deadline_mono_ns: int) -> dict[str, object]:
         assert self._worklog_worker is not None
@@ -689,25 +897,6 @@ class SearchDaemon:
         finally:
             self._worklog_lock.release()
 
-    async def _run_embedding_source_read(self, function, *, deadline_mono_ns: int) -> dict[str, object]:
-        """Run projector bulk reads outside the latency-sensitive user pool."""
-
-        assert self._embedding_source_worker is not None
-        deadline = deadline_mono_ns / 1_000_000_000
-        try:
-            async with asyncio.timeout_at(deadline):
-                await self._embedding_source_lock.acquire()
-        except TimeoutError as exc:
-            raise _ReadDeadlineExceeded from exc
-        worker = self._embedding_source_worker
-        try:
-            return await asyncio.get_running_loop().run_in_executor(
-                worker.executor,
-                lambda: self._execute_read(worker.connection, lambda: function(worker.store), deadline_mono_ns),
-            )
-        finally:
-            self._embedding_source_lock.release()
-
     @staticmethod
     def _execute_read(connection: sqlite3.Connection, function, deadline_mono_ns: int):
         if time.monotonic_ns() >= deadline_mono_ns:
@@ -754,6 +943,26 @@ class SearchDaemon:
         )
 
 
+def _recall_dense_lane_error(exc: BaseException) -> dict[str, object] | None:
+    """Map a dense-lane fault inside ``search.recall.v2`` to its lane error.
+
+    Codes match the ones ``search.embedding.query.v2`` returns for the same
+    fault, so a degraded lane reads the same whichever path served it.
+    """
+
+    if isinstance(exc, _ResidentEpisodeIndexUnavailable):
+        return {"lane": "dense", "code": "dense_index_unavailable", "reason": None}
+    if isinstance(exc, _EmbeddingSpaceMismatch):
+        return {"lane": "dense", "code": "embedding_space_mismatch", "reason": None}
+    if isinstance(exc, _EmbeddingCoverageIncomplete):
+        return {"lane": "dense", "code": "embedding_coverage_incomplete", "reason": None}
+    if isinstance(exc, _RecallStoreBindingMismatch):
+        return {"lane": "dense", "code": "embedding_coverage_incomplete", "reason": "store_binding_mismatch"}
+    if isinstance(exc, TimeoutError):
+        return {"lane": "dense", "code": "dense_timed_out", "reason": None}
+    return None
+
+
 def _exact_keys(value: dict, expected: set[str]) -> None:
     if set(value) != expected:
         raise ValueError("request fields do not match the searchd contract")
@@ -1216,6 +1425,100 @@ def _search_params(value: dict) -> dict:
     }
 
 
+def _recall_params(value: dict) -> dict:
+    _exact_keys(
+        value,
+        {
+            "owner_id",
+            "query",
+            "project",
+            "provider",
+            "window_start_us",
+            "include_test",
+            "include_automation",
+            "candidate_depth",
+            "limit",
+            "context_turns",
+            "discovery_timeout_ms",
+            "dense",
+        },
+    )
+    if type(value["include_automation"]) is not bool:
+        raise ValueError("include_automation is invalid")
+    if type(value["limit"]) is not int or not 1 <= value["limit"] <= 200:
+        raise ValueError("limit is invalid")
+    if type(value["context_turns"]) is not int or not 0 <= value["context_turns"] <= 10:
+        raise ValueError("context_turns is invalid")
+    if type(value["discovery_timeout_ms"]) is not int or not 1 <= value["discovery_timeout_ms"] <= 60_000:
+        raise ValueError("discovery_timeout_ms is invalid")
+    # Hidden-origin sessions are Hatch automation, so one flag scopes both
+    # lanes the way the per-lane RPCs were always called.
+    lexical = _search_params(
+        {
+            "owner_id": value["owner_id"],
+            "query": value["query"],
+            "project": value["project"],
+            "provider": value["provider"],
+            "environment": None,
+            "window_start_us": value["window_start_us"],
+            "window_end_us": None,
+            "limit": value["candidate_depth"],
+            "include_snippets": False,
+            "include_origin_hidden": value["include_automation"],
+            "include_test": value["include_test"],
+        }
+    )
+    dense = value["dense"]
+    if dense is not None:
+        if not isinstance(dense, dict):
+            raise ValueError("dense is invalid")
+        _exact_keys(
+            dense,
+            {
+                "model",
+                "dims",
+                "query_embedding",
+                "limit",
+                "exclude_environments",
+                "since_iso",
+                "expected_store_id",
+                "expected_schema_generation",
+            },
+        )
+        expected_store_id = _uuid(dense["expected_store_id"], "expected_store_id")
+        expected_schema_generation = _text(dense["expected_schema_generation"], "expected_schema_generation", 255)
+        dense = {
+            **_embedding_query_params(
+                {
+                    "model": dense["model"],
+                    "owner_id": value["owner_id"],
+                    "dims": dense["dims"],
+                    "query_embedding": dense["query_embedding"],
+                    "limit": dense["limit"],
+                    "project": value["project"],
+                    "provider": value["provider"],
+                    "environment": None,
+                    "exclude_environments": dense["exclude_environments"],
+                    "since_iso": dense["since_iso"],
+                    "include_origin_hidden": value["include_automation"],
+                    "include_test": value["include_test"],
+                }
+            ),
+            "expected_store_id": expected_store_id,
+            "expected_schema_generation": expected_schema_generation,
+        }
+    return {
+        "lexical": lexical,
+        "dense": dense,
+        "candidate_depth": lexical["limit"],
+        "limit": value["limit"],
+        "context_turns": value["context_turns"],
+        "include_test": lexical["include_test"],
+        "include_automation": value["include_automation"],
+        "discovery_timeout_ms": value["discovery_timeout_ms"],
+    }
+
+
 def _context_params(value: dict) -> dict:
     _exact_keys(
         value,
@@ -1244,6 +1547,32 @@ def _context_params(value: dict) -> dict:
     }
 
 
+def _contexts_params(value: dict) -> dict:
+    _exact_keys(value, {"owner_id", "locators", "context_turns"})
+    locators = value["locators"]
+    if not isinstance(locators, list) or not 1 <= len(locators) <= 200:
+        raise ValueError("locators is invalid")
+    if type(value["context_turns"]) is not int or not 0 <= value["context_turns"] <= 10:
+        raise ValueError("context_turns is invalid")
+    # Each locator is checked exactly as a single-hit read would check it; a
+    # null entry stands for a hit the caller could not locate at all.
+    checked: list[dict | None] = []
+    for locator in locators:
+        if locator is None:
+            checked.append(None)
+            continue
+        if not isinstance(locator, dict):
+            raise ValueError("locators is invalid")
+        _exact_keys(locator, {"session_id", "generation_id", "search_event_id", "start_order_time_us"})
+        params = _context_params({**locator, "owner_id": value["owner_id"], "context_turns": value["context_turns"]})
+        checked.append({key: params[key] for key in locator})
+    return {
+        "owner_id": _text(value["owner_id"], "owner_id", 64),
+        "locators": checked,
+        "context_turns": value["context_turns"],
+    }
+
+
 def _worklog_params(value: dict) -> dict:
     _exact_keys(
         value,
@@ -279,66 +279,140 @@ _SEARCHABLE_SEARCH_WITHOUT_SNIPPETS_SQL = _SEARCHABLE_SEARCH_SQL.replace(
 # queries that are otherwise sub-millisecond.
 _CANDIDATE_CEILING = 50_000
 
+# The archive candidate walk runs once per rowid shard of events_fts rather than
+# once over the whole table. `events.id` is assigned at index time, so a shard
+# is a contiguous slice of every doclist that FTS5 seeks to directly through
+# its rowid constraint, and each shard's walk is bounded by
+# _CANDIDATE_CEILING on its own. Shards are ranked independently — in
+# parallel across searchd's read workers — and merged by bm25 into one top-k.
+#
+# Shards are ranges of one FTS table rather than separate per-month tables on
+# purpose: bm25 weights terms by corpus-wide document frequency, and only a
+# shared index keeps scores from different shards comparable. Separate tables
+# would make the merged order depend on how a term happened to be distributed
+# across months, which is exactly the inexact ranking sharding is meant to fix.
+# The merged ranking is exact unless some shard saturated its walk.
+_ARCHIVE_SHARD_ROWS = 1_000_000
+
+_ARCHIVE_SHARD_SEARCH_SQL = _ARCHIVE_BOUNDED_SEARCH_WITHOUT_SNIPPETS_SQL.replace(
+    "WHERE events_fts MATCH ? AND s.owner_id = ?",
+    "WHERE events_fts MATCH ? AND events_fts.rowid BETWEEN ? AND ? AND s.owner_id = ?",
+)
+
+_ARCHIVE_SNIPPETS_SQL = """
+    SELECT rowid AS search_event_id,
+           snippet(events_fts, 0, '', '', ' … ', 24) AS content_snippet,
+           snippet(events_fts, 1, '', '', ' … ', 24) AS tool_output_snippet
+    FROM events_fts
+    WHERE events_fts MATCH ? AND rowid IN ({placeholders})
+"""
+
 # Focused plan tests and diagnostic tooling use this name for the all-history
 # correctness lane. Interactive recent recall uses _SEARCHABLE_SEARCH_SQL.
 _SEARCH_SQL = _ARCHIVE_SEARCH_SQL
 
-_CONTEXT_TARGET_SQL = """
-    SELECT e.order_time_us, e.event_key, s.event_count
-    FROM events e
-    JOIN session_index s ON s.session_id = e.session_id AND s.generation_id = e.generation_id
-    JOIN projection_membership m
-      ON m.session_id = e.session_id
-     AND m.generation_id = e.generation_id
-     AND m.desired_revision = s.indexed_through
-     AND m.object_id = e.source_object_id
-    WHERE e.id = ? AND e.session_id = ? AND e.generation_id = ? AND s.owner_id = ?
+# Published rows only: the generation the index serves and the objects its
+# current revision is made of.
+_CONTEXT_PUBLISHED_JOIN = """
+    JOIN session_index {s} ON {s}.session_id = {e}.session_id AND {s}.generation_id = {e}.generation_id
+    JOIN projection_membership {m}
+      ON {m}.session_id = {e}.session_id
+     AND {m}.generation_id = {e}.generation_id
+     AND {m}.desired_revision = {s}.indexed_through
+     AND {m}.object_id = {e}.source_object_id
 """
 
-# Same target row, located by transcript position instead of event id. The
-# semantic lane knows where an episode starts in the published ordering but not
-# which searchd row that is, so it anchors on the first event at or after that
-# position. Ordering matches _CONTEXT_ROWS_SQL so the neighbour walk stays
-# consistent with a lexical hit's.
-_CONTEXT_TARGET_BY_POSITION_SQL = """
-    SELECT e.order_time_us, e.event_key, s.event_count
-    FROM events e
-    JOIN session_index s ON s.session_id = e.session_id AND s.generation_id = e.generation_id
-    JOIN projection_membership m
-      ON m.session_id = e.session_id
-     AND m.generation_id = e.generation_id
-     AND m.desired_revision = s.indexed_through
-     AND m.object_id = e.source_object_id
-    WHERE e.session_id = ? AND e.generation_id = ? AND s.owner_id = ?
-      AND e.order_time_us >= ?
-    ORDER BY e.order_time_us ASC, e.event_key ASC
-    LIMIT 1
+# One clean neighbour walk from a target, index-ordered and bounded by LIMIT so
+# a long session costs only the rows returned. The clean projection is every
+# field the embeddings projector read, in the order it assembled its records:
+# it sorted catalog records by (order_time, machine, provider, source, epoch,
+# position, subordinal) and then numbered them, so reproducing this order here
+# reproduces its clean indices. `source_position` is stored zero-padded, which
+# sorts identically to the projector's integer compare.
+_CONTEXT_NEIGHBOURS_SQL = (
+    """
+    SELECT n.id FROM events n
 """
-
-# Every field the clean projection reads, in the order the embeddings projector
-# assembled its records. That projector sorted catalog records by
-# (order_time, machine, provider, source, epoch, position, subordinal) and then
-# numbered them, so reproducing this order here reproduces its clean indices.
-# `source_position` is stored zero-padded, which sorts identically to the
-# projector's integer compare.
-_CONTEXT_ROWS_SQL = """
-    SELECT e.id AS search_event_id, e.event_id, e.source_object_id, e.record_ordinal,
-           e.order_time_us, e.role, e.content_text, e.tool_name
-    FROM events e
-    JOIN session_index s ON s.session_id = e.session_id AND s.generation_id = e.generation_id
-    JOIN projection_membership m
-      ON m.session_id = e.session_id
-     AND m.generation_id = e.generation_id
-     AND m.desired_revision = s.indexed_through
-     AND m.object_id = e.source_object_id
-    WHERE e.session_id = ? AND e.generation_id = ? AND s.owner_id = ?
-      AND e.role IN ('user', 'assistant') AND e.content_text IS NOT NULL
-      AND (e.role != 'user' OR (e.title_eligible = 1
-           AND (e.interaction_kind IS NULL OR e.interaction_kind NOT IN ('local_control', 'local_control_output', 'conversation_boundary'))))
+    + _CONTEXT_PUBLISHED_JOIN.format(e="n", s="ns", m="nm")
+    + """
+    WHERE n.session_id = t.session_id AND n.generation_id = t.generation_id AND ns.owner_id = :owner_id
+      AND n.role IN ('user', 'assistant') AND n.content_text IS NOT NULL
+      AND (n.role != 'user' OR (n.title_eligible = 1
+           AND (n.interaction_kind IS NULL OR n.interaction_kind NOT IN ('local_control', 'local_control_output', 'conversation_boundary'))))
       AND {position_predicate}
-    ORDER BY e.order_time_us {direction}, e.event_key {direction}
-    LIMIT ?
+    ORDER BY n.order_time_us {direction}, n.event_key {direction}
+    LIMIT {limit}
+"""
+)
+
+# Batch hydration for many recall hits in one statement. `hits` carries each
+# hit's locator: a searchd event id (lexical) is exact; a transcript position
+# (semantic episodes, which know where they start but not which row that is)
+# anchors on the first published event at or after it, ordered as the
+# neighbour walk is so both lanes see consistent windows. A hit whose target
+# is not published yields no rows at all. Otherwise it yields one `target` row
+# carrying the session's event count, then up to `context_turns + 1` clean
+# rows at or before the target and `context_turns` after it.
+_CONTEXT_BATCH_SQL = (
+    """
+    WITH hits(hit_index, session_id, generation_id, search_event_id, start_order_time_us) AS (VALUES {hits}),
+    targets AS MATERIALIZED (
+        SELECT h.hit_index, e.session_id, e.generation_id, e.order_time_us, e.event_key, s.event_count
+        FROM hits h
+        JOIN events e ON e.id = COALESCE(h.search_event_id, (
+            SELECT p.id FROM events p
+"""
+    + _CONTEXT_PUBLISHED_JOIN.format(e="p", s="ps", m="pm")
+    + """
+            WHERE p.session_id = h.session_id AND p.generation_id = h.generation_id AND ps.owner_id = :owner_id
+              AND p.order_time_us >= h.start_order_time_us
+            ORDER BY p.order_time_us ASC, p.event_key ASC
+            LIMIT 1
+        ))
+"""
+    + _CONTEXT_PUBLISHED_JOIN.format(e="e", s="s", m="m")
+    + """
+        WHERE e.session_id = h.session_id AND e.generation_id = h.generation_id AND s.owner_id = :owner_id
+    )
+    SELECT 0 AS is_context, t.hit_index, t.event_count, NULL AS search_event_id, NULL AS event_id,
+           NULL AS source_object_id, NULL AS record_ordinal, t.order_time_us, NULL AS role,
+           NULL AS content_text, NULL AS tool_name, t.event_key
+    FROM targets t
+    UNION ALL
+    SELECT 1, t.hit_index, t.event_count, e.id, e.event_id, e.source_object_id, e.record_ordinal,
+           e.order_time_us, e.role, e.content_text, e.tool_name, e.event_key
+    FROM targets t
+    JOIN events e ON e.id IN ("""
+    + _CONTEXT_NEIGHBOURS_SQL.format(
+        position_predicate="n.order_time_us <= t.order_time_us AND (n.order_time_us < t.order_time_us OR n.event_key <= t.event_key)",
+        direction="DESC",
+        limit=":before",
+    )
+    + """)
+    UNION ALL
+    SELECT 1, t.hit_index, t.event_count, e.id, e.event_id, e.source_object_id, e.record_ordinal,
+           e.order_time_us, e.role, e.content_text, e.tool_name, e.event_key
+    FROM targets t
+    JOIN events e ON e.id IN ("""
+    + _CONTEXT_NEIGHBOURS_SQL.format(
+        position_predicate="n.order_time_us >= t.order_time_us AND (n.order_time_us > t.order_time_us OR n.event_key > t.event_key)",
+        direction="ASC",
+        limit=":after",
+    )
+    + """)
+    ORDER BY hit_index, is_context, order_time_us, event_key
 """
+)
+_CONTEXT_ROW_FIELDS = (
+    "search_event_id",
+    "event_id",
+    "source_object_id",
+    "record_ordinal",
+    "order_time_us",
+    "role",
+    "content_text",
+    "tool_name",
+)
 
 
 class WorklogPageTooLarge(RuntimeError):
@@ -1696,11 +1770,21 @@ class SearchStore:
         include_snippets: bool = True,
         include_origin_hidden: bool = False,
         include_test: bool = False,
+        rowid_range: tuple[int, int] | None = None,
     ) -> dict[str, object]:
+        """Rank published events matching ``query``.
+
+        Recent windows search the published recent corpus. Archive windows run
+        the candidate walk per rowid shard and merge the shards' rankings; with
+        ``rowid_range`` only that shard is searched, without snippets, so
+        searchd can rank shards on several read workers and merge them with
+        ``merge_archive_shards``.
+        """
+
         fts_query, query_token_count, compiled_token_count = self._compile_fts_query(query)
         if not fts_query:
             return {"results": [], "query_token_count": query_token_count, "compiled_token_count": compiled_token_count}
-        use_searchable_corpus = window_start_us is not None and window_start_us >= _fast_scope_cutoff_us()
+        use_searchable_corpus = uses_searchable_corpus(window_start_us)
         include_hidden_flag = 1 if include_origin_hidden else 0
         include_test_flag = 1 if include_test else 0
         filter_params = (
@@ -1723,7 +1807,34 @@ class SearchStore:
         if use_searchable_corpus:
             sql = _SEARCHABLE_SEARCH_SQL if include_snippets else _SEARCHABLE_SEARCH_WITHOUT_SNIPPETS_SQL
             params = filter_params + (candidate_ceiling, limit, fts_query)
+        elif rowid_range is not None:
+            sql = _ARCHIVE_SHARD_SEARCH_SQL
+            params = (fts_query, *rowid_range) + filter_params[1:] + (candidate_ceiling, limit)
+            include_snippets = False
         else:
+            shards = self.archive_shards()
+            if len(shards) > 1:
+                return self.merge_archive_shards(
+                    query=query,
+                    shard_results=[
+                        self.search(
+                            owner_id=owner_id,
+                            query=query,
+                            project=project,
+                            provider=provider,
+                            environment=environment,
+                            window_start_us=window_start_us,
+                            window_end_us=window_end_us,
+                            limit=limit,
+                            include_origin_hidden=include_origin_hidden,
+                            include_test=include_test,
+                            rowid_range=shard,
+                        )
+                        for shard in shards
+                    ],
+                    limit=limit,
+                    include_snippets=include_snippets,
+                )
             sql = _ARCHIVE_BOUNDED_SEARCH_SQL if include_snippets else _ARCHIVE_BOUNDED_SEARCH_WITHOUT_SNIPPETS_SQL
             params = filter_params + (candidate_ceiling, limit) + ((fts_query,) if include_snippets else ())
         rows = self.connection.execute(sql, params).fetchall()
@@ -1744,6 +1855,59 @@ class SearchStore:
             "ranking_scope": ranking_scope,
         }
 
+    def archive_shards(self) -> list[tuple[int, int]]:
+        """Inclusive rowid ranges of the archive FTS shards, newest first."""
+
+        row = self.connection.execute("SELECT MIN(id) AS low, MAX(id) AS high FROM events").fetchone()
+        if row is None or row["low"] is None:
+            return []
+        low, high = int(row["low"]), int(row["high"])
+        shards = []
+        for start in range(low // _ARCHIVE_SHARD_ROWS * _ARCHIVE_SHARD_ROWS, high + 1, _ARCHIVE_SHARD_ROWS):
+            shards.append((max(low, start), min(high, start + _ARCHIVE_SHARD_ROWS - 1)))
+        shards.reverse()
+        return shards
+
+    def merge_archive_shards(
+        self,
+        *,
+        query: str,
+        shard_results: list[dict[str, object]],
+        limit: int,
+        include_snippets: bool = True,
+    ) -> dict[str, object]:
+        """Merge per-shard archive rankings into one top-``limit`` page.
+
+        Every shard ranks against the same FTS table, so bm25 scores compare
+        directly. Snippets are built here, for the merged page only.
+        """
+
+        fts_query, query_token_count, compiled_token_count = self._compile_fts_query(query)
+        rows = [row for shard in shard_results for row in shard.get("results") or []]
+        rows.sort(key=lambda row: (float(row["rank"]), -int(row["search_event_id"])))
+        results = [dict(row) for row in rows[:limit]]
+        if include_snippets and results:
+            snippets = {
+                int(row["search_event_id"]): row
+                for row in self.connection.execute(
+                    _ARCHIVE_SNIPPETS_SQL.format(placeholders=",".join("?" for _ in results)),
+                    (fts_query, *(int(row["search_event_id"]) for row in results)),
+                ).fetchall()
+            }
+            for result in results:
+                snippet = snippets.get(int(result["search_event_id"]))
+                result["content_snippet"] = snippet["content_snippet"] if snippet is not None else None
+                result["tool_output_snippet"] = snippet["tool_output_snippet"] if snippet is not None else None
+        saturated = any(shard.get("ranking_scope") == "recent_bounded" for shard in shard_results)
+        return {
+            "results": results,
+            "query_token_count": query_token_count,
+            "compiled_token_count": compiled_token_count,
+            "search_scope": "published_archive",
+            "ranking_scope": "shard_bounded" if saturated else "exact",
+            "archive_shards": len(shard_results),
+        }
+
     def recall_context(
         self,
         *,
@@ -1761,51 +1925,76 @@ class SearchStore:
         they start but not which row that is).
         """
 
-        if search_event_id is not None:
-            target = self.connection.execute(
-                _CONTEXT_TARGET_SQL,
-                (search_event_id, session_id, generation_id, owner_id),
-            ).fetchone()
-        elif start_order_time_us is not None:
-            target = self.connection.execute(
-                _CONTEXT_TARGET_BY_POSITION_SQL,
-                (session_id, generation_id, owner_id, start_order_time_us),
-            ).fetchone()
-        else:
-            return {
-                "evidence_status": "unavailable",
-                "evidence_reason": "hit_missing_locator",
-                "context": [],
-                "total_events": 0,
-            }
-        if target is None:
-            return {
+        locator = {
+            "session_id": session_id,
+            "generation_id": generation_id,
+            "search_event_id": search_event_id,
+            "start_order_time_us": start_order_time_us,
+        }
+        evidence = self.recall_contexts(owner_id=owner_id, locators=[locator], context_turns=context_turns)["evidence"][0]
+        assert evidence is not None
+        return evidence
+
+    def recall_contexts(
+        self,
+        *,
+        owner_id: str,
+        locators: list[dict[str, object] | None],
+        context_turns: int,
+    ) -> dict[str, object]:
+        """Read evidence for many recall hits with one statement.
+
+        ``evidence`` lines up with ``locators``; a missing locator yields None
+        so the caller reports it as it would for a single-hit read. Each entry
+        otherwise carries the same ``evidence_status`` as ``recall_context``.
+        """
+
+        evidence: list[dict[str, object] | None] = [None] * len(locators)
+        params: dict[str, object] = {"owner_id": owner_id, "before": context_turns + 1 if context_turns else 0, "after": context_turns}
+        values: list[str] = []
+        for index, locator in enumerate(locators):
+            if locator is None:
+                continue
+            search_event_id = locator.get("search_event_id")
+            start_order_time_us = locator.get("start_order_time_us")
+            if search_event_id is None and start_order_time_us is None:
+                evidence[index] = {
+                    "evidence_status": "unavailable",
+                    "evidence_reason": "hit_missing_locator",
+                    "context": [],
+                    "total_events": 0,
+                }
+                continue
+            values.append(f"(:i{index}, :s{index}, :g{index}, :e{index}, :p{index})")
+            params.update(
+                {
+                    f"i{index}": index,
+                    f"s{index}": str(locator["session_id"]),
+                    f"g{index}": str(locator["generation_id"]),
+                    f"e{index}": None if search_event_id is None else int(search_event_id),
+                    f"p{index}": None if search_event_id is not None else int(start_order_time_us),
+                }
+            )
+            evidence[index] = {
                 "evidence_status": "unavailable",
                 "evidence_reason": "hit_not_published",
                 "context": [],
                 "total_events": 0,
             }
-        total_events = int(target["event_count"])
-        if context_turns == 0:
-            return {"evidence_status": "complete", "evidence_reason": None, "context": [], "total_events": total_events}
-        before_sql = _CONTEXT_ROWS_SQL.format(
-            position_predicate="(e.order_time_us < ? OR (e.order_time_us = ? AND e.event_key <= ?))",
-            direction="DESC",
-        )
-        after_sql = _CONTEXT_ROWS_SQL.format(
-            position_predicate="(e.order_time_us > ? OR (e.order_time_us = ? AND e.event_key > ?))",
-            direction="ASC",
-        )
-        position = (int(target["order_time_us"]), int(target["order_time_us"]), str(target["event_key"]))
-        before = self.connection.execute(before_sql, (session_id, generation_id, owner_id, *position, context_turns + 1)).fetchall()
-        after = self.connection.execute(after_sql, (session_id, generation_id, owner_id, *position, context_turns)).fetchall()
-        context = [dict(row) for row in reversed(before)] + [dict(row) for row in after]
-        return {
-            "evidence_status": "complete",
-            "evidence_reason": None,
-            "context": context,
-            "total_events": total_events,
-        }
+        if not values:
+            return {"evidence": evidence}
+
+        rows = self.connection.execute(_CONTEXT_BATCH_SQL.format(hits=", ".join(values)), params).fetchall()
+        for row in rows:
+            entry = evidence[int(row["hit_index"])]
+            assert entry is not None
+            if not row["is_context"]:
+                entry.update({"evidence_status": "complete", "evidence_reason": None, "total_events": int(row["event_count"])})
+                continue
+            context = entry["context"]
+            assert isinstance(context, list)
+            context.append({field: row[field] for field in _CONTEXT_ROW_FIELDS})
+        return {"evidence": evidence}
 
     def _compile_fts_query(self, raw: str) -> tuple[str, int, int]:
         """Normalize only syntax; every user-supplied search term remains required."""
@@ -2249,6 +2438,12 @@ def _searchable_cutoff_us() -> int:
     return int((datetime.now(UTC) - timedelta(days=SEARCHABLE_RETENTION_DAYS)).timestamp() * 1_000_000)
 
 
+def uses_searchable_corpus(window_start_us: int | None) -> bool:
+    """Whether a search window is served by the published recent corpus."""
+
+    return window_start_us is not None and window_start_us >= _fast_scope_cutoff_us()
+
+
 def _fast_scope_cutoff_us() -> int:
     return int(
         (datetime.now(UTC) - timedelta(days=SEARCHABLE_FAST_WINDOW_DAYS, seconds=SEARCHABLE_FAST_WINDOW_MARGIN_SECONDS)).timestamp()
@@ -0,0 +1,222 @@
+"""Journaled FTS maintenance for bulk archive ingest (SQLite only).
+
+Large transcript ingests used to drop the ``events`` FTS triggers, insert, then
+re-create the triggers and backfill the index. The triggers are schema, so
+every other writer lost indexing while they were gone, and an ingest that
+failed after a chunk commit had to repair triggers and backfill from a second
+session.
+
+Instead a bulk ingest registers its session in ``events_fts_deferred_sessions``
+inside its own transaction. While that row exists, the insert trigger appends
+the new event id to ``events_fts_pending`` rather than indexing inline, and
+``drain_fts_journal`` later indexes the journal in bounded batches. Journal rows
+commit and roll back with the events they describe, so a failed ingest leaves
+the index consistent with whatever did commit. The trigger definitions live
+with the rest of the FTS schema in ``zerg.database``.
+
+Search reads the index as it stands; ``fts_journal_status`` reports how far it
+trails the archive.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import bindparam
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+FTS_INDEX_BATCH_SIZE = max(1, int(os.getenv("LONGHOUSE_FTS_INDEX_BATCH_SIZE", "500")))
+FTS_INDEX_INTERVAL_SECONDS = float(os.getenv("LONGHOUSE_FTS_INDEX_INTERVAL_SECONDS", "2"))
+# A deferral older than this belongs to an ingest that died without clearing
+# it. Leaving it only keeps journaling that session, which is still correct.
+FTS_DEFERRAL_LEASE_SECONDS = int(os.getenv("LONGHOUSE_FTS_DEFERRAL_LEASE_SECONDS", "900"))
+
+_JOURNAL_TABLES = ("events_fts_pending", "events_fts_deferred_sessions")
+
+_INDEX_PENDING_SQL = text("""
+    INSERT INTO events_fts(rowid, content_text, tool_output_text, tool_name, role, session_id)
+    SELECT e.id, e.content_text, e.tool_output_text, e.tool_name, e.role, e.session_id
+    FROM events e
+    WHERE e.id IN :event_ids
+""").bindparams(bindparam("event_ids", expanding=True))
+_CLEAR_PENDING_SQL = text("DELETE FROM events_fts_pending WHERE event_id IN :event_ids").bindparams(bindparam("event_ids", expanding=True))
+
+
+@dataclass(frozen=True)
+class FtsJournalStatus:
+    pending_events: int
+    oldest_pending_age_seconds: float | None
+    deferred_sessions: int
+
+
+def fts_journal_available(db: Session) -> bool:
+    bind = db.get_bind()
+    if bind is None or bind.dialect.name != "sqlite":
+        return False
+    try:
+        rows = db.execute(
+            text("SELECT name FROM sqlite_master WHERE type = 'table' AND name IN ('events_fts_pending', 'events_fts_deferred_sessions')")
+        ).fetchall()
+    except Exception:
+        return False
+    return {str(row[0]) for row in rows} == set(_JOURNAL_TABLES)
+
+
+def defer_fts_for_session(db: Session, session_id: UUID) -> bool:
+    """Journal this session's event inserts instead of indexing them inline.
+
+    Returns False when the journal is unavailable; the caller then keeps the
+    inline triggers, which are always correct, only slower.
+    """
+
+    if not fts_journal_available(db):
+        return False
+    db.execute(
+        text("INSERT OR REPLACE INTO events_fts_deferred_sessions(session_id, deferred_at) VALUES (:sid, :now)"),
+        {"sid": str(session_id), "now": int(time.time())},
+    )
+    return True
+
+
+def end_fts_deferral(db: Session, session_id: UUID) -> None:
+    db.execute(text("DELETE FROM events_fts_deferred_sessions WHERE session_id = :sid"), {"sid": str(session_id)})
+
+
+def drain_fts_journal(db: Session, *, limit: int = FTS_INDEX_BATCH_SIZE) -> int:
+    """Index up to ``limit`` journaled events; returns how many were indexed.
+
+    The caller owns the transaction. Rows are indexed and removed from the
+    journal in the same transaction, so a batch is never indexed twice.
+    """
+
+    event_ids = [
+        int(row[0])
+        for row in db.execute(
+            text("SELECT event_id FROM events_fts_pending ORDER BY event_id LIMIT :limit"),
+            {"limit": max(1, int(limit))},
+        ).fetchall()
+    ]
+    if not event_ids:
+        return 0
+    db.execute(_INDEX_PENDING_SQL, {"event_ids": event_ids})
+    db.execute(_CLEAR_PENDING_SQL, {"event_ids": event_ids})
+    return len(event_ids)
+
+
+def expire_stale_fts_deferrals(db: Session, *, lease_seconds: int = FTS_DEFERRAL_LEASE_SECONDS) -> int:
+    result = db.execute(
+        text("DELETE FROM events_fts_deferred_sessions WHERE deferred_at < :cutoff"),
+        {"cutoff": int(time.time()) - max(0, int(lease_seconds))},
+    )
+    return int(result.rowcount or 0)
+
+
+def fts_journal_status(db: Session) -> FtsJournalStatus:
+    row = db.execute(text("SELECT count(*), min(enqueued_at) FROM events_fts_pending")).fetchone()
+    deferred = db.execute(text("SELECT count(*) FROM events_fts_deferred_sessions")).scalar()
+    pending = int(row[0] or 0) if row is not None else 0
+    oldest = row[1] if row is not None else None
+    return FtsJournalStatus(
+        pending_events=pending,
+        oldest_pending_age_seconds=max(0.0, time.time() - float(oldest)) if oldest is not None else None,
+        deferred_sessions=int(deferred or 0),
+    )
+
+
+# -----------------------------------------------------------------------------
+# Background indexer
+# -----------------------------------------------------------------------------
+
+_indexer_task: asyncio.Task | None = None
+_indexer_loop: asyncio.AbstractEventLoop | None = None
+_indexer_wake: asyncio.Event | None = None
+
+
+def fts_indexer_running() -> bool:
+    return _indexer_task is not None and not _indexer_task.done()
+
+
+def wake_fts_indexer() -> bool:
+    """Ask the background indexer to drain now. Safe from any thread.
+
+    Returns False when no indexer is running, in which case the caller must
+    drain the journal itself.
+    """
+
+    loop, wake = _indexer_loop, _indexer_wake
+    if not fts_indexer_running() or loop is None or wake is None:
+        return False
+    try:
+        loop.call_soon_threadsafe(wake.set)
+    except RuntimeError:
+        return False
+    return True
+
+
+def _drain_batch(db: Session) -> int:
+    expire_stale_fts_deferrals(db)
+    indexed = drain_fts_journal(db, limit=FTS_INDEX_BATCH_SIZE)
+    _record_status(fts_journal_status(db))
+    return indexed
+
+
+def _record_status(status: FtsJournalStatus) -> None:
+    from zerg.metrics import events_fts_oldest_pending_age_seconds
+    from zerg.metrics import events_fts_pending
+
+    events_fts_pending.set(status.pending_events)
+    events_fts_oldest_pending_age_seconds.set(status.oldest_pending_age_seconds or 0)
+
+
+async def start_fts_indexer_loop() -> None:
+    """Drain the FTS journal in bounded batches through the archive writer."""
+
+    global _indexer_task, _indexer_loop, _indexer_wake
+    from zerg.services.write_serializer import get_write_serializer
+
+    if fts_indexer_running():
+        return
+    _indexer_loop = asyncio.get_running_loop()
+    _indexer_wake = asyncio.Event()
+    wake = _indexer_wake
+
+    async def _loop() -> None:
+        writer = get_write_serializer()
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=FTS_INDEX_INTERVAL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+                wake.clear()
+                # One bounded batch per writer slot so interactive writes can
+                # cut in between batches of a large backlog.
+                while await writer.execute(_drain_batch, label="fts-index") >= FTS_INDEX_BATCH_SIZE:
+                    pass
+            except asyncio.CancelledError:
+                return
+            except Exception:
+                logger.warning("FTS journal drain failed (non-fatal)", exc_info=True)
+
+    _indexer_task = asyncio.create_task(_loop())
+
+
+async def stop_fts_indexer_loop() -> None:
+    global _indexer_task, _indexer_loop, _indexer_wake
+    if _indexer_task and not _indexer_task.done():
+        _indexer_task.cancel()
+        try:
+            await _indexer_task
+        except Exception:
+            pass
+    _indexer_task = None
+    _indexer_loop = None
+    _indexer_wake = None
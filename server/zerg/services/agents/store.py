@@ -42,6 +42,12 @@ from zerg.models.agents import SessionRuntimeState
 from zerg.models.agents import SessionThread
 from zerg.models.agents import TimelineCard
 from zerg.services.agents.compaction import classify_compaction_kind
+from zerg.services.agents.fts_journal import FTS_INDEX_BATCH_SIZE
+from zerg.services.agents.fts_journal import defer_fts_for_session
+from zerg.services.agents.fts_journal import drain_fts_journal
+from zerg.services.agents.fts_journal import end_fts_deferral
+from zerg.services.agents.fts_journal import fts_journal_available
+from zerg.services.agents.fts_journal import wake_fts_indexer
 from zerg.services.agents.identity_resolver import ObservedSession
 from zerg.services.agents.identity_resolver import observed_lineage_from_evidence
 from zerg.services.agents.identity_resolver import resolve_session_projection
@@ -991,123 +997,33 @@ class AgentsStore:
             return
         try:
             self.db.execute(text("INSERT INTO events_fts(events_fts) VALUES('rebuild')"))
+            # The rebuild indexed every row, including journaled ones.
+            if fts_journal_available(self.db):
+                self.db.execute(text("DELETE FROM events_fts_pending"))
         except Exception as exc:
             logger.warning("FTS5 rebuild failed: %s", exc)
 
-    def _disable_fts_triggers(self) -> bool:
-        """Drop FTS triggers to avoid per-row overhead during bulk ingest.
+    def _defer_fts_for_session(self, session_id: UUID) -> bool:
+        """Journal a bulk ingest's event inserts for the FTS indexer.
 
-        Returns True if triggers were dropped (and must be re-created).
+        Returns True if the session is deferred and must be released with
+        ``_end_fts_deferral`` once its inserts are done.
         """
         if not self._fts_available():
             return False
         try:
-            self.db.execute(text("DROP TRIGGER IF EXISTS events_ai"))
-            self.db.execute(text("DROP TRIGGER IF EXISTS events_ad"))
-            self.db.execute(text("DROP TRIGGER IF EXISTS events_au"))
-            return True
+            return defer_fts_for_session(self.db, session_id)
         except Exception:
-            logger.warning("Failed to drop FTS triggers (non-fatal)", exc_info=True)
+            logger.warning("Failed to defer FTS indexing (non-fatal)", exc_info=True)
             return False
 
-    def _reenable_fts_triggers(self) -> None:
-        """Re-create FTS triggers after bulk ingest."""
-        try:
-            self.db.execute(
-                text("""
-                CREATE TRIGGER IF NOT EXISTS events_ai AFTER INSERT ON events BEGIN
-                  INSERT INTO events_fts(rowid, content_text, tool_output_text, tool_name, role, session_id)
-                  VALUES (new.id, new.content_text, new.tool_output_text, new.tool_name, new.role, new.session_id);
-                END
-            """)
-            )
-            self.db.execute(
-                text("""
-                CREATE TRIGGER IF NOT EXISTS events_ad AFTER DELETE ON events BEGIN
-                  INSERT INTO events_fts(events_fts, rowid, content_text, tool_output_text, tool_name, role, session_id)
-                  VALUES(
-                    'delete',
-                    old.id,
-                    old.content_text,
-                    old.tool_output_text,
-                    old.tool_name,
-                    old.role,
-                    old.session_id
-                  );
-                END
-            """)
-            )
-            self.db.execute(
-                text("""
-                CREATE TRIGGER IF NOT EXISTS events_au AFTER UPDATE ON events BEGIN
-                  INSERT INTO events_fts(events_fts, rowid, content_text, tool_output_text, tool_name, role, session_id)
-                  VALUES(
-                    'delete',
-                    old.id,
-                    old.content_text,
-                    old.tool_output_text,
-                    old.tool_name,
-                    old.role,
-                    old.session_id
-                  );
-                  INSERT INTO events_fts(rowid, content_text, tool_output_text, tool_name, role, session_id)
-                  VALUES (new.id, new.content_text, new.tool_output_text, new.tool_name, new.role, new.session_id);
-                END
-            """)
-            )
-        except Exception:
-            logger.exception("Failed to re-create FTS triggers")
-
-    def _restore_fts_after_failed_bulk_ingest(self, session_id: UUID) -> None:
-        bind = self.db.get_bind()
-        engine = getattr(bind, "engine", bind)
-        repair_db = Session(bind=engine)
-        try:
-            repair_store = AgentsStore(repair_db)
-            repair_store._reenable_fts_triggers()
-            repair_store._backfill_fts_for_session(session_id)
-            repair_db.commit()
-        finally:
-            repair_db.close()
-
-    def _backfill_fts_for_session(self, session_id) -> None:
-        """Batch-insert FTS entries for all events in a session that are missing from FTS."""
-        if not self._fts_available():
-            return
-        try:
-            self.db.execute(
-                text("""
-                    INSERT INTO events_fts(rowid, content_text, tool_output_text, tool_name, role, session_id)
-                    SELECT e.id, e.content_text, e.tool_output_text, e.tool_name, e.role, e.session_id
-                    FROM events e
-                WHERE e.session_id = :sid
-                  AND COALESCE(e.event_origin, 'durable') = 'durable'
-                  AND e.id NOT IN (SELECT rowid FROM events_fts)
-                """),
-                {"sid": str(session_id)},
-            )
-        except Exception:
-            logger.warning("FTS backfill for session %s failed (non-fatal)", session_id, exc_info=True)
-
-    def _backfill_fts_for_event_ids(self, event_ids: list[int]) -> None:
-        """Batch-insert FTS entries for newly inserted rows only."""
-        if not self._fts_available() or not event_ids:
-            return
-        try:
-            stmt = text("""
-                INSERT INTO events_fts(rowid, content_text, tool_output_text, tool_name, role, session_id)
-                SELECT e.id, e.content_text, e.tool_output_text, e.tool_name, e.role, e.session_id
-                FROM events e
-                LEFT JOIN events_fts f ON f.rowid = e.id
-                WHERE e.id IN :event_ids
-                  AND COALESCE(e.event_origin, 'durable') = 'durable'
-                  AND f.rowid IS NULL
-            """).bindparams(bindparam("event_ids", expanding=True))
-            for index in range(0, len(event_ids), 200):
-                batch = event_ids[index : index + 200]
-                self.db.execute(stmt, {"event_ids": batch})
-        except Exception:
-            logger.warning("FTS backfill for %s event ids failed (non-fatal)", len(event_ids), exc_info=True)
+    def _end_fts_deferral(self, session_id: UUID) -> None:
+        end_fts_deferral(self.db, session_id)
+        # Without a background indexer (tests, CLI, demo seeding) the caller
+        # is the only drainer, so index the journal before returning.
+        if not wake_fts_indexer():
+            while drain_fts_journal(self.db) >= FTS_INDEX_BATCH_SIZE:
+                pass
 
     def _fts_query(self, raw: str) -> str:
         """Normalize raw text into a safe FTS query."""
@@ -2684,7 +2600,7 @@ class AgentsStore:
         # periodically. A single 1000+ event transaction can hold the lock for
         # seconds, causing health-check timeouts and cascading failures.
         _INGEST_CHUNK = max(1, chunk_size) if chunk_size is not None else 200
-        _FTS_TRIGGER_DISABLE_THRESHOLD = 100
+        _FTS_JOURNAL_THRESHOLD = 100
         commit_count = 0
         commit_ms_total = 0.0
 
@@ -2695,14 +2611,12 @@ class AgentsStore:
             commit_ms_total += (time.monotonic() - t0) * 1000
             commit_count += 1
 
-        # Disabling triggers only pays off for genuinely large batches.
-        # Small transcript appends should keep trigger maintenance inline.
-        fts_triggers_dropped = len(data.events) >= _FTS_TRIGGER_DISABLE_THRESHOLD and self._disable_fts_triggers()
+        # Journaling only pays off for genuinely large batches. Small
+        # transcript appends keep trigger maintenance inline.
+        fts_deferred = len(data.events) >= _FTS_JOURNAL_THRESHOLD and self._defer_fts_for_session(session_id)
         _since_commit = 0
-        inserted_event_ids: list[int] = []
-        needs_session_wide_fts_backfill = False
         provider_events_received_at = datetime.now(timezone.utc)
-        direct_event_projection = not fts_triggers_dropped
+        direct_event_projection = not fts_deferred
 
         stage_started = time.monotonic()
         try:
@@ -2821,13 +2735,6 @@ class AgentsStore:
                             last_visible_preview_delta = candidate
                     if reduction.event is not None and isinstance(reduction.event.id, int):
                         latest_inserted_event_id = reduction.event.id
-                    if fts_triggers_dropped:
-                        inserted_event_id = reduction.event.id if reduction.event is not None else None
-                        has_inserted_event_id = isinstance(inserted_event_id, int) and inserted_event_id > 0
-                        if has_inserted_event_id:
-                            inserted_event_ids.append(inserted_event_id)
-                        else:
-                            needs_session_wide_fts_backfill = True
                     normalized_timestamp = _normalize_utc_naive(event_data.timestamp)
                     if normalized_timestamp is not None and (
                         latest_inserted_timestamp is None or normalized_timestamp > latest_inserted_timestamp
@@ -2843,25 +2750,23 @@ class AgentsStore:
                     _commit_with_telemetry()
                     _since_commit = 0
         except Exception:
-            if fts_triggers_dropped:
+            if fts_deferred:
+                # Committed chunks keep their journal rows; only the deferral
+                # itself needs releasing so later inserts index inline again.
                 self.db.rollback()
                 try:
-                    self._restore_fts_after_failed_bulk_ingest(session_id)
+                    self._end_fts_deferral(session_id)
+                    self.db.commit()
                 except Exception:
-                    logger.exception("Failed to restore FTS triggers after ingest error for session %s", session_id)
+                    logger.exception("Failed to release FTS deferral after ingest error for session %s", session_id)
             raise
         if events_inserted > 0 and latest_inserted_event_id is None:
             latest_inserted_event_id = self.get_latest_event_id(session_id)
         _record_stage("provider_event_observations", stage_started)
 
-        if fts_triggers_dropped:
+        if fts_deferred:
             stage_started = time.monotonic()
-            self._reenable_fts_triggers()
-            if events_inserted > 0:
-                if not needs_session_wide_fts_backfill and inserted_event_ids:
-                    self._backfill_fts_for_event_ids(inserted_event_ids)
-                else:
-                    self._backfill_fts_for_session(session_id)
+            self._end_fts_deferral(session_id)
             _record_stage("fts_maintenance", stage_started)
 
         stage_started = time.monotonic()
@@ -0,0 +1,121 @@
+"""Byte-budgeted LRU shared by the API process's read caches.
+
+Decoded render objects, pre-serialized event fragments and memoized tool
+presentations all cache immutable values keyed by content, so they share one
+storage policy:
+
+- the budget counts caller-supplied bytes, not entries;
+- entries never go stale, so LRU eviction is the only removal;
+- a value larger than the whole budget is not stored;
+- a concurrent duplicate ``put`` keeps the resident value.
+
+Callers pass ``on_lookup``/``on_resize`` hooks to publish their own metrics.
+Hooks run outside the lock.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from collections.abc import Hashable
+from dataclasses import dataclass
+from typing import Generic
+from typing import TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class ByteBudgetCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    resident_bytes: int
+    max_bytes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ByteBudgetLRU(Generic[K, V]):
+    def __init__(
+        self,
+        *,
+        max_bytes: int,
+        on_lookup: Callable[[str], None] | None = None,
+        on_resize: Callable[[int, int], None] | None = None,
+    ) -> None:
+        self._max_bytes = max(0, int(max_bytes))
+        self._on_lookup = on_lookup
+        self._on_resize = on_resize
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._resident_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    def get(self, key: K) -> V | None:
+        """Return the resident value for ``key`` and mark it most recently used."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+            else:
+                self._misses += 1
+        if self._on_lookup is not None:
+            self._on_lookup("hit" if entry is not None else "miss")
+        return entry[0] if entry is not None else None
+
+    def put(self, key: K, value: V, *, size_bytes: int) -> bool:
+        """Store ``value`` unless it exceeds the budget or ``key`` is already resident."""
+
+        with self._lock:
+            if size_bytes > self._max_bytes or key in self._entries:
+                return False
+            self._entries[key] = (value, size_bytes)
+            self._resident_bytes += size_bytes
+            while self._resident_bytes > self._max_bytes:
+                _evicted_key, (_evicted, evicted_size) = self._entries.popitem(last=False)
+                self._resident_bytes -= evicted_size
+                self._evictions += 1
+            resident_bytes, entries = self._resident_bytes, len(self._entries)
+        if self._on_resize is not None:
+            self._on_resize(resident_bytes, entries)
+        return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._resident_bytes = 0
+        if self._on_resize is not None:
+            self._on_resize(0, 0)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> ByteBudgetCacheStats:
+        with self._lock:
+            return ByteBudgetCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                resident_bytes=self._resident_bytes,
+                max_bytes=self._max_bytes,
+            )
+
+
+__all__ = ["ByteBudgetCacheStats", "ByteBudgetLRU"]
@@ -56,9 +56,12 @@ def catalogd_paths() -> tuple[Path, Path]:
 
 
 class CatalogdSupervisor:
-    def __init__(self, *, database_path: Path, socket_path: Path) -> None:
+    def __init__(self, *, database_path: Path, socket_path: Path, spawn: bool = True) -> None:
         self.database_path = database_path
         self.socket_path = socket_path
+        # HTTP workers of a multi-worker host attach to the control process's
+        # catalogd; only the control process spawns, restarts and reports it.
+        self.spawn = spawn
         self.status_path = socket_path.with_name("catalogd-status.json")
         self.client = CatalogClient(socket_path)
         self.projector_client = CatalogClient(
@@ -72,7 +75,7 @@ class CatalogdSupervisor:
         self._last_logged_status: tuple[object, ...] | None = None
 
     async def start(self, *, readiness_timeout_seconds: float = 15.0) -> dict[str, Any]:
-        if self._task is None or self._task.done():
+        if self.spawn and (self._task is None or self._task.done()):
             self._stopping = False
             self._task = asyncio.create_task(self._run(), name="catalogd-supervisor")
         deadline = asyncio.get_running_loop().time() + readiness_timeout_seconds
@@ -217,6 +220,8 @@ class CatalogdSupervisor:
         return catalogd_ping_is_compatible(ping)
 
     def _write_status(self, status: str, *, log_transition: bool = True, **details: Any) -> None:
+        if not self.spawn:
+            return
         if log_transition:
             self._log_status_transition(status, details)
         self.status_path.parent.mkdir(parents=True, exist_ok=True)
@@ -270,11 +275,11 @@ class CatalogdSupervisor:
 _supervisor: CatalogdSupervisor | None = None
 
 
-async def start_catalogd_supervisor() -> dict[str, Any]:
+async def start_catalogd_supervisor(*, spawn: bool = True) -> dict[str, Any]:
     global _supervisor
     if _supervisor is None:
         database_path, socket_path = catalogd_paths()
-        _supervisor = CatalogdSupervisor(database_path=database_path, socket_path=socket_path)
+        _supervisor = CatalogdSupervisor(database_path=database_path, socket_path=socket_path, spawn=spawn)
     return await _supervisor.start(
         readiness_timeout_seconds=CATALOGD_COLD_START_READINESS_TIMEOUT_SECONDS,
     )
@@ -0,0 +1,64 @@
+"""Connection snapshots the control process publishes for HTTP workers.
+
+Registries whose sockets live in the control process (Machine Agent control,
+runners) publish their whole connection set on a pubsub topic after every
+change, and HTTP workers answer presence reads from the newest snapshot.
+
+Snapshots are whole state, so a follower only needs the latest one. Control
+also republishes every ``SNAPSHOT_REFRESH_SECONDS``: the pubsub broker evicts
+idle topic rings and restarts with empty ones, and a worker that connects
+after either still converges without waiting for the next connect or
+disconnect.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from collections.abc import Mapping
+from collections.abc import Sequence
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_REFRESH_SECONDS = 30.0
+
+
+async def follow_snapshots(topic: str, apply_snapshot: Callable[[Mapping[str, Any]], None]) -> None:
+    """Apply every snapshot published on ``topic`` until cancelled.
+
+    Subscribes before its first await, so a task started ahead of the broker
+    link counts as a subscriber when the link asks the broker for replay.
+    """
+
+    from zerg.services.session_pubsub import get_pubsub
+
+    bus = get_pubsub()
+    apply_snapshot({"connections": []})
+    latest_seq = bus.peek_latest_seq(topic)
+    # Replay only the newest retained snapshot; a dropped intermediate one loses nothing.
+    with bus.subscribe(topic, since_seq=latest_seq - 1 if latest_seq else None) as subscription:
+        while True:
+            message = await subscription.next_message()
+            if message is None:
+                continue
+            try:
+                apply_snapshot(message.payload)
+            except (KeyError, TypeError, ValueError):
+                logger.warning("Ignoring malformed %s snapshot seq=%s", topic, message.seq)
+
+
+async def republish_snapshots(publishers: Sequence[Callable[[], None]], *, interval_seconds: float = SNAPSHOT_REFRESH_SECONDS) -> None:
+    """Republish each registry's current snapshot every ``interval_seconds``."""
+
+    while True:
+        await asyncio.sleep(interval_seconds)
+        for publish in publishers:
+            try:
+                publish()
+            except Exception:
+                logger.exception("Connection snapshot republish failed")
+
+
+__all__ = ["SNAPSHOT_REFRESH_SECONDS", "follow_snapshots", "republish_snapshots"]
@@ -0,0 +1,180 @@
+"""Pre-serialized event JSON for the storage-v2 session-detail surfaces.
+
+Session detail, the events page, the projection and the mobile tail each turn
+every render record on the page into the same nested event object -- tool
+presentation, shell summary and all -- and then FastAPI walks the whole
+response through ``jsonable_encoder`` before ``json.dumps`` serializes it
+again. For a 1,000-event page that is most of the request's CPU, and it is
+repeated for every tab, poll and reconnect.
+
+An event's JSON depends only on immutable inputs: the render object it came
+from (``object_hash``), its ordinal there, the session provider (tool
+presentation rules vary by provider) and its derived tool-call state. This
+module caches the serialized bytes under exactly that key:
+
+- fragments are encoded with the standard library exactly as
+  ``JSONResponse`` would encode them, so cached bytes are byte-identical to the
+  model path by construction;
+- ``render_json`` splices fragments into the response envelope with orjson and
+  falls back to the standard library only for the rare envelope value whose
+  orjson spelling may differ (a float outside ``[1e-4, 1e16)``, an integer
+  beyond 64 bits);
+- the budget counts serialized bytes, and eviction is the only removal.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import os
+from collections.abc import Callable
+from collections.abc import Iterable
+
+import orjson
+from fastapi import Response
+
+from zerg.services.byte_budget_lru import ByteBudgetLRU
+
+EVENT_FRAGMENT_CACHE_MAX_BYTES = int(os.getenv("LONGHOUSE_EVENT_FRAGMENT_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+EventFragmentKey = tuple[str, int, str | None, str | None]
+
+
+class SerializedJSON:
+    """A JSON value that is already encoded; ``render_json`` emits it verbatim."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"SerializedJSON({len(self.data)} bytes)"
+
+
+class EventFragmentCache(ByteBudgetLRU[EventFragmentKey, SerializedJSON]):
+    def __init__(self, *, max_bytes: int = EVENT_FRAGMENT_CACHE_MAX_BYTES) -> None:
+        super().__init__(max_bytes=max_bytes, on_lookup=_record_cache_lookup, on_resize=_record_cache_size)
+
+    def fragment(self, key: EventFragmentKey, build: Callable[[], object]) -> SerializedJSON:
+        """Return the serialized event for ``key``, building it at most once while resident.
+
+        Two requests missing the same key at once both build it; the value is
+        identical, so the second insert is simply dropped.
+        """
+
+        if not self.enabled:
+            return SerializedJSON(encode_json(build()))
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        fragment = SerializedJSON(encode_json(build()))
+        self.put(key, fragment, size_bytes=len(fragment.data))
+        return fragment
+
+
+def encode_json(value: object) -> bytes:
+    """Encode ``value`` exactly as FastAPI's ``JSONResponse`` renders it."""
+
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def _orjson_default(value: object) -> object:
+    if isinstance(value, SerializedJSON):
+        return orjson.Fragment(value.data)
+    raise TypeError
+
+
+def _stdlib_default(value: object) -> object:
+    if isinstance(value, SerializedJSON):
+        return json.loads(value.data)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _orjson_spells_differently(value: object) -> bool:
+    # json.dumps spells floats as repr() does: positional in [1e-4, 1e16),
+    # exponent notation (1e-05, 1e+16) outside it. orjson's exponent spelling
+    # varies by release (0.00001, 1e16) and it writes null where json.dumps
+    # refuses NaN, so only positional floats go through orjson. Strings, bools
+    # and null it emits byte-for-byte as json.dumps does; wide integers make
+    # orjson raise, which render_json also handles.
+    if isinstance(value, float):
+        return not math.isfinite(value) or (value != 0 and not 1e-4 <= abs(value) < 1e16)
+    if isinstance(value, dict):
+        return any(_orjson_spells_differently(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_orjson_spells_differently(item) for item in value)
+    return False
+
+
+def render_json(content: object) -> bytes:
+    """Serialize a body holding ``SerializedJSON`` fragments, byte-identical to ``JSONResponse``."""
+
+    if not _orjson_spells_differently(content):
+        try:
+            return orjson.dumps(content, default=_orjson_default)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+        default=_stdlib_default,
+    ).encode("utf-8")
+
+
+class FragmentJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: object) -> bytes:
+        return render_json(content)
+
+
+def fragment_json_response(content: object, *, response: Response) -> FragmentJSONResponse:
+    """Return ``content`` directly, keeping headers a route already set on ``response``.
+
+    FastAPI drops the injected ``response`` once a route returns its own
+    ``Response``, so Server-Timing and Cache-Control are carried across here.
+    """
+
+    rendered = FragmentJSONResponse(content)
+    rendered.raw_headers.extend(_carried_headers(response.raw_headers))
+    return rendered
+
+
+def _carried_headers(raw_headers: Iterable[tuple[bytes, bytes]]) -> list[tuple[bytes, bytes]]:
+    return [(name, value) for name, value in raw_headers if name.lower() not in {b"content-length", b"content-type"}]
+
+
+def _record_cache_lookup(outcome: str) -> None:
+    from zerg.metrics import event_fragment_cache_lookups_total
+
+    event_fragment_cache_lookups_total.labels(outcome=outcome).inc()
+
+
+def _record_cache_size(resident_bytes: int, entries: int) -> None:
+    from zerg.metrics import event_fragment_cache_entries
+    from zerg.metrics import event_fragment_cache_resident_bytes
+
+    event_fragment_cache_resident_bytes.set(resident_bytes)
+    event_fragment_cache_entries.set(entries)
+
+
+_cache = EventFragmentCache()
+
+
+def get_event_fragment_cache() -> EventFragmentCache:
+    return _cache
+
+
+__all__ = [
+    "EventFragmentCache",
+    "FragmentJSONResponse",
+    "SerializedJSON",
+    "encode_json",
+    "fragment_json_response",
+    "get_event_fragment_cache",
+    "render_json",
+]
@@ -342,6 +342,36 @@ def refresh_godview_gauges() -> None:
     refresh_device_gauges()
     refresh_host_disk_gauges()
     refresh_storage_telemetry_gauges()
+    refresh_render_object_cache_gauges()
+    refresh_event_fragment_cache_gauges()
+    refresh_tool_presentation_memo_gauges()
+
+
+def refresh_render_object_cache_gauges() -> None:
+    from zerg.services.render_object_cache import get_decoded_render_object_cache
+
+    stats = get_decoded_render_object_cache().stats()
+    metrics.render_object_cache_hit_ratio.set(stats.hit_ratio)
+    metrics.render_object_cache_resident_bytes.set(float(stats.resident_bytes))
+    metrics.render_object_cache_entries.set(float(stats.entries))
+
+
+def refresh_event_fragment_cache_gauges() -> None:
+    from zerg.services.event_fragments import get_event_fragment_cache
+
+    stats = get_event_fragment_cache().stats()
+    metrics.event_fragment_cache_hit_ratio.set(stats.hit_ratio)
+    metrics.event_fragment_cache_resident_bytes.set(float(stats.resident_bytes))
+    metrics.event_fragment_cache_entries.set(float(stats.entries))
+
+
+def refresh_tool_presentation_memo_gauges() -> None:
+    from zerg.services.tool_presentation import get_tool_presentation_memo
+
+    stats = get_tool_presentation_memo().stats()
+    metrics.tool_presentation_memo_hit_ratio.set(stats.hit_ratio)
+    metrics.tool_presentation_memo_resident_bytes.set(float(stats.resident_bytes))
+    metrics.tool_presentation_memo_entries.set(float(stats.entries))
 
 
 def refresh_host_disk_gauges() -> None:
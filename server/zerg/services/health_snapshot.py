@@ -0,0 +1,195 @@
+"""Background-refreshed health probes served from an immutable snapshot.
+
+Load balancers, uptime monitors and the desktop app all poll ``/health`` and
+``/readyz``. Recomputing serializer stalls, WAL pressure, projection lag and
+catalog pings per probe made health traffic a measurable share of reads, so
+each expensive check is a named probe with its own refresh cadence.
+
+Probes register on first use: the first request computes inline, after which
+the refresh loop keeps the result warm and requests read the current
+snapshot. A snapshot is replaced, never mutated, so a request sees one
+consistent set of results. Without a running loop (tests, one-shot tools) and
+for operator ``?fresh=1`` requests every read computes inline, exactly as
+before the snapshot existed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+from types import MappingProxyType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# A result older than this many refresh intervals means the loop is wedged;
+# requests then compute inline rather than serve a stale verdict.
+STALE_INTERVALS = 3.0
+_MAX_IDLE_SECONDS = 5.0
+
+
+@dataclass(frozen=True, slots=True)
+class HealthProbeResult:
+    value: Any
+    error: BaseException | None
+    refreshed_at: float
+    refreshed_at_monotonic: float
+    duration_ms: float
+
+    def age_seconds(self) -> float:
+        return max(0.0, time.monotonic() - self.refreshed_at_monotonic)
+
+    def unwrap(self) -> Any:
+        """Return the probe value, re-raising the probe's failure."""
+
+        if self.error is not None:
+            # The same exception object is shared by every reader of the
+            # snapshot; drop the old traceback so re-raising cannot grow it.
+            raise self.error.with_traceback(None)
+        return self.value
+
+    def freshness(self) -> dict[str, Any]:
+        return {
+            "refreshed_at": datetime.fromtimestamp(self.refreshed_at, timezone.utc).isoformat(),
+            "age_seconds": round(self.age_seconds(), 3),
+            "duration_ms": round(self.duration_ms, 3),
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class HealthSnapshot:
+    results: Mapping[str, HealthProbeResult]
+
+
+@dataclass(frozen=True, slots=True)
+class _Probe:
+    compute: Callable[[], Any]
+    interval_seconds: float
+
+
+def _run_probe(compute: Callable[[], Any]) -> HealthProbeResult:
+    started = time.monotonic()
+    try:
+        value, error = compute(), None
+    except Exception as exc:  # graded by the route, like an inline failure
+        value, error = None, exc
+    finished = time.monotonic()
+    return HealthProbeResult(value, error, time.time(), finished, (finished - started) * 1000.0)
+
+
+class HealthAggregator:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._probes: dict[str, _Probe] = {}
+        self._snapshot = HealthSnapshot(MappingProxyType({}))
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def snapshot(self) -> HealthSnapshot:
+        return self._snapshot
+
+    def read(
+        self,
+        name: str,
+        compute: Callable[[], Any],
+        *,
+        interval_seconds: float,
+        fresh: bool = False,
+    ) -> HealthProbeResult:
+        """Return the probe's snapshot result, computing inline when needed."""
+
+        if not self._running:
+            return _run_probe(compute)
+        if not fresh:
+            current = self._snapshot.results.get(name)
+            if current is not None and current.age_seconds() <= interval_seconds * STALE_INTERVALS:
+                return current
+        with self._lock:
+            self._probes.setdefault(name, _Probe(compute, interval_seconds))
+        result = _run_probe(compute)
+        self._publish(name, result)
+        return result
+
+    def _publish(self, name: str, result: HealthProbeResult) -> None:
+        with self._lock:
+            current = self._snapshot.results.get(name)
+            if current is not None and current.refreshed_at_monotonic >= result.refreshed_at_monotonic:
+                return
+            self._snapshot = HealthSnapshot(MappingProxyType({**self._snapshot.results, name: result}))
+
+    def _due(self) -> tuple[list[tuple[str, _Probe]], float]:
+        now = time.monotonic()
+        due: list[tuple[str, _Probe]] = []
+        wait = _MAX_IDLE_SECONDS
+        with self._lock:
+            probes = list(self._probes.items())
+        results = self._snapshot.results
+        for name, probe in probes:
+            current = results.get(name)
+            next_at = current.refreshed_at_monotonic + probe.interval_seconds if current is not None else now
+            if next_at <= now:
+                due.append((name, probe))
+            else:
+                wait = min(wait, next_at - now)
+        return due, wait
+
+    async def run(self) -> None:
+        """Refresh registered probes on their cadences until cancelled."""
+
+        self._running = True
+        try:
+            while True:
+                due, wait = self._due()
+                # Probes run one at a time off the event loop: they block on
+                # SQLite and sockets, and health must not compete with requests
+                # for more than one worker thread.
+                for name, probe in due:
+                    self._publish(name, await asyncio.to_thread(_run_probe, probe.compute))
+                if due:
+                    continue
+                await asyncio.sleep(wait)
+        finally:
+            self._running = False
+
+
+_aggregator = HealthAggregator()
+
+
+def get_health_aggregator() -> HealthAggregator:
+    return _aggregator
+
+
+async def run_health_refresh_loop() -> None:
+    while True:
+        try:
+            await _aggregator.run()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Health refresh loop failed")
+            await asyncio.sleep(_MAX_IDLE_SECONDS)
+
+
+def reset_health_aggregator_for_tests() -> None:
+    global _aggregator
+    _aggregator = HealthAggregator()
+
+
+__all__ = [
+    "HealthAggregator",
+    "HealthProbeResult",
+    "HealthSnapshot",
+    "get_health_aggregator",
+    "reset_health_aggregator_for_tests",
+    "run_health_refresh_loop",
+]
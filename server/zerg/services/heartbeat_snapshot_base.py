@@ -0,0 +1,188 @@
+"""Per-machine heartbeat snapshot bases for delta-encoded heartbeats.
+
+A machine heartbeat used to carry the full session snapshot every interval,
+so the Runtime Host parsed and validated every resolved session from every
+machine on every tick even when nothing had changed. A delta heartbeat instead
+names the ``sessions_digest`` it was computed against and carries only the
+sessions that changed since then; the server rebuilds the full snapshot from
+the base it acknowledged last.
+
+The base is a cache, never authority. It is process-local and bounded, so a
+restart, a second worker, or an eviction simply loses it; the machine then
+receives ``heartbeat_resync_required`` and sends one full snapshot, which
+re-establishes the base. Nothing here can make a heartbeat wrong, only
+unnecessary to repeat.
+
+Wire shape (``snapshot_delta`` on ``POST /agents/heartbeat``)::
+
+    {
+      "base_digest": "<sessions_digest the server acknowledged>",
+      "upserted_sessions": [<resolved session>, ...],
+      "removed_session_keys": ["<provider>|<session_id>|<provider_session_id>", ...],
+      "session_count": <len(full snapshot after applying the delta)>,
+      "machine_evidence_unchanged": true
+    }
+
+``sessions_digest`` on the envelope stays the digest of the *resulting* full
+snapshot, and the server recomputes it over the reconstruction before it
+applies or acknowledges anything: a base the two sides disagree about is a
+resync, never a silently wrong snapshot. Evidence is delta-encoded at envelope
+granularity: reducer identities address facts by their index within a family,
+so a partial family would change every identity after it.
+
+The machine half lives in engine/src/heartbeat.rs (``HeartbeatDeltaState``).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from typing import Mapping
+from typing import Sequence
+
+# One entry per machine. A base is a few hundred resolved sessions at most, so
+# the bound is about pathological device churn, not steady-state size.
+HEARTBEAT_SNAPSHOT_BASE_MAX_DEVICES = int(os.getenv("LONGHOUSE_HEARTBEAT_SNAPSHOT_BASE_MAX_DEVICES", "4096"))
+HEARTBEAT_BASE_ACK_HEADER = "X-Longhouse-Heartbeat-Base"
+
+
+def wire_session_key(session: Mapping[str, Any]) -> str:
+    """Identity of one resolved session within a machine snapshot.
+
+    Computed over the wire strings exactly as the engine sent them, with no
+    normalization, so both sides of the protocol derive the same key.
+    Unmanaged sessions may not have a Longhouse session id yet, so the provider
+    session id is part of the key rather than a fallback for it.
+    """
+
+    return "|".join(_wire_text(session.get(field)) for field in ("provider", "session_id", "provider_session_id"))
+
+
+def _wire_text(value: object) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _wire_section(session: Mapping[str, Any], name: str) -> Mapping[str, Any]:
+    section = session.get(name)
+    return section if isinstance(section, Mapping) else {}
+
+
+def session_snapshot_digest(sessions: Sequence[Mapping[str, Any]], activity: Sequence[Mapping[str, Any]]) -> str:
+    """Port of the engine's ``session_snapshot_digest`` over wire JSON.
+
+    Must stay byte-for-byte with engine/src/heartbeat.rs; both sides pin the
+    same test vector. Only identity/control fields participate, which is why
+    the engine can send a timestamp-only change without changing the digest.
+    """
+
+    rows: list[str] = []
+    for session in sessions:
+        workspace = _wire_section(session, "workspace")
+        process = _wire_section(session, "process")
+        bridge = _wire_section(session, "bridge")
+        evidence = _wire_section(session, "evidence")
+        fields = (
+            session.get("provider"),
+            session.get("session_id"),
+            session.get("provider_session_id"),
+            session.get("control_path"),
+            session.get("state"),
+            session.get("phase"),
+            session.get("tool_name"),
+            workspace.get("cwd"),
+            workspace.get("label"),
+            workspace.get("branch"),
+            process.get("pid"),
+            process.get("process_start_time"),
+            process.get("boot_id"),
+            process.get("started_at"),
+            bridge.get("bridge_pid"),
+            bridge.get("app_server_pid"),
+            bridge.get("status"),
+            bridge.get("thread_subscription_status"),
+            bridge.get("launch_mode"),
+            bridge.get("ui_attached"),
+            bridge.get("ui_presence"),
+            bool(evidence.get("process_observed")),
+            bool(evidence.get("transcript_observed")),
+            evidence.get("bridge_state"),
+            ",".join(sorted(str(key) for key in evidence.get("join_keys") or ())),
+            ",".join(sorted(str(code) for code in session.get("reason_codes") or ())),
+        )
+        rows.append("|".join(_wire_text(value) for value in fields))
+    facts = [
+        "|".join(_wire_text(fact.get(field)) for field in ("provider", "session_id", "run_id", "kind", "tool_name", "observed_at"))
+        for fact in activity
+    ]
+    signature = f"sessions=[{';'.join(sorted(rows))}]|activity=[{';'.join(sorted(facts))}]"
+    return hashlib.sha256(signature.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class HeartbeatSnapshotBase:
+    """The last full snapshot a machine's heartbeat was verified against.
+
+    All three session maps share ``wire_session_key`` keys and snapshot order:
+    ``sessions`` holds the validated request models, ``sessions_json`` their
+    retention form and ``sessions_wire`` the JSON the engine sent, which is
+    what the digest is recomputed over. An unchanged session is therefore
+    neither re-validated nor re-serialized.
+    """
+
+    digest: str
+    sessions: Mapping[str, Any]
+    sessions_json: Mapping[str, dict[str, Any]]
+    sessions_wire: Mapping[str, Mapping[str, Any]]
+    activity_wire: Sequence[Mapping[str, Any]]
+    machine_evidence: Any
+    machine_evidence_json: dict[str, Any] | None
+
+
+class HeartbeatSnapshotBaseCache:
+    def __init__(self, *, max_devices: int = HEARTBEAT_SNAPSHOT_BASE_MAX_DEVICES) -> None:
+        self._max_devices = max(0, int(max_devices))
+        self._lock = threading.Lock()
+        self._bases: OrderedDict[str, HeartbeatSnapshotBase] = OrderedDict()
+
+    def get(self, device_id: str) -> HeartbeatSnapshotBase | None:
+        with self._lock:
+            base = self._bases.get(device_id)
+            if base is not None:
+                self._bases.move_to_end(device_id)
+            return base
+
+    def put(self, device_id: str, base: HeartbeatSnapshotBase) -> None:
+        if self._max_devices <= 0:
+            return
+        with self._lock:
+            self._bases[device_id] = base
+            self._bases.move_to_end(device_id)
+            while len(self._bases) > self._max_devices:
+                self._bases.popitem(last=False)
+
+    def discard(self, device_id: str) -> None:
+        with self._lock:
+            self._bases.pop(device_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bases.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._bases)
+
+
+_cache = HeartbeatSnapshotBaseCache()
+
+
+def get_heartbeat_snapshot_base_cache() -> HeartbeatSnapshotBaseCache:
+    return _cache
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import hashlib
 import json
 from datetime import datetime
 from datetime import timezone
@@ -30,6 +32,11 @@ from zerg.services.live_launch_readiness import LiveLaunchReadinessView
 from zerg.services.live_launch_readiness import project_live_launch_readiness
 from zerg.services.machine_control_channel import get_machine_control_channel_registry
 from zerg.services.managed_provider_contracts import contract_for_provider
+from zerg.services.projection_digest import Exclusions
+from zerg.services.projection_digest import changed_fields
+from zerg.services.projection_digest import field_digests
+from zerg.services.projection_digest import structural_digest
+from zerg.services.session_listing_types import SessionListingError
 from zerg.services.session_pubsub import TOPIC_TIMELINE
 from zerg.services.session_pubsub import get_pubsub
 from zerg.services.session_runtime_display import TRANSCRIPT_SYNC_DISPLAY_WINDOW
@@ -600,11 +607,56 @@ def list_live_catalog_timeline(
             "canonical_owner_required",
             "Canonical timeline projection requires an owner-scoped request.",
         )
+    filters = _timeline_cursor_filters(snapshot_params, owner_id=owner_id)
+    cursor = _decode_timeline_cursor(params.cursor, filters=filters) if params.cursor is not None else None
+    if cursor is not None:
+        if params.offset:
+            raise SessionListingError(400, "cursor and offset cannot be combined")
+        snapshot_params["cursor"] = cursor["keyset"]
     snapshot = canonical_timeline_snapshot(snapshot_params, owner_id=owner_id)
-    return project_catalog_timeline_snapshot(snapshot)
+    # Only the first page counts candidates; deeper pages report the total
+    # the walk started with instead of re-ranking the whole owner.
+    total = int(snapshot.get("total") or 0) if cursor is None else cursor["total"]
+    next_keyset = snapshot.get("next_cursor")
+    next_cursor = _encode_timeline_cursor(next_keyset, total=total, filters=filters) if isinstance(next_keyset, dict) else None
+    return project_catalog_timeline_snapshot(snapshot, total=total, next_cursor=next_cursor)
 
 
-def project_catalog_timeline_snapshot(snapshot: dict[str, Any]) -> TimelineSessionsListResponse:
+def _timeline_cursor_filters(snapshot_params: dict[str, Any], *, owner_id: int) -> str:
+    """Fingerprint the filters a cursor was issued for."""
+
+    filters = {key: value for key, value in snapshot_params.items() if key not in {"limit", "offset"}}
+    encoded = json.dumps({**filters, "owner_id": owner_id}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def _encode_timeline_cursor(keyset: dict[str, Any], *, total: int, filters: str) -> str:
+    payload = json.dumps({"v": 1, "k": keyset, "t": total, "f": filters}, sort_keys=True, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_timeline_cursor(token: str, *, filters: str) -> dict[str, Any]:
+    """Decode an opaque timeline cursor, rejecting one issued for other filters."""
+
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except (ValueError, UnicodeDecodeError) as exc:
+        raise SessionListingError(400, "Invalid timeline cursor") from exc
+    if not isinstance(payload, dict) or payload.get("v") != 1 or not isinstance(payload.get("k"), dict):
+        raise SessionListingError(400, "Invalid timeline cursor")
+    if type(payload.get("t")) is not int or payload["t"] < 0:
+        raise SessionListingError(400, "Invalid timeline cursor")
+    if payload.get("f") != filters:
+        raise SessionListingError(400, "Timeline cursor does not match the requested filters")
+    return {"keyset": payload["k"], "total": payload["t"]}
+
+
+def project_catalog_timeline_snapshot(
+    snapshot: dict[str, Any],
+    *,
+    total: int | None = None,
+    next_cursor: str | None = None,
+) -> TimelineSessionsListResponse:
     """Project a raw catalogd timeline snapshot without any storage access."""
 
     observed_at = decode_catalog_datetime(snapshot.get("observed_at"))
@@ -640,31 +692,30 @@ def project_catalog_timeline_snapshot(snapshot: dict[str, Any]) -> TimelineSessi
         )
     return TimelineSessionsListResponse(
         sessions=cards,
-        total=int(snapshot.get("total") or 0),
+        total=int(snapshot.get("total") or 0) if total is None else total,
         has_real_sessions=bool(snapshot.get("has_real_sessions")),
+        next_cursor=next_cursor,
     )
 
 
-def _timeline_card_signature(card: TimelineSessionCardResponse) -> str:
-    """Return a change signature that excludes the global catalog watermark.
+# ``session_state.commit_seq`` and the compatibility ``runtime_version`` are
+# catalog-wide coordinates. They advance when any session changes, so using
+# them as card identity makes every visible card look changed on every wake.
+# The payload still carries those coordinates when the session itself emits;
+# they simply do not force unrelated cards onto the browser stream.
+_PROJECTION_VOLATILE: Exclusions = {"runtime_version": None, "session_state": {"commit_seq": None}}
+_TIMELINE_CARD_VOLATILE: Exclusions = {"head": _PROJECTION_VOLATILE, "detail": _PROJECTION_VOLATILE, "root": _PROJECTION_VOLATILE}
+_MACHINE_DELTA_VOLATILE = frozenset({"commit_seq", "fanout_kind", "server_fanout_at_ms"})
+
+
+def _timeline_card_signature(card: TimelineSessionCardResponse) -> int:
+    """Return a change digest that excludes the global catalog watermark.
 
-    ``session_state.commit_seq`` and the compatibility ``runtime_version`` are
-    catalog-wide coordinates. They advance when any session changes, so using
-    them as card identity makes every visible card look changed on every wake.
-    The payload still carries those coordinates when the session itself emits;
-    they simply do not force unrelated cards onto the browser stream.
+    The card is digested in place rather than dumped to Python JSON; its
+    head, detail and root usually share one projection, serialized once.
     """
 
-    payload = card.model_dump(mode="json")
-    for projection_key in ("head", "detail", "root"):
-        projection = payload.get(projection_key)
-        if not isinstance(projection, dict):
-            continue
-        projection.pop("runtime_version", None)
-        state = projection.get("session_state")
-        if isinstance(state, dict):
-            state.pop("commit_seq", None)
-    return json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return structural_digest(card, exclude=_TIMELINE_CARD_VOLATILE, memo={})
 
 
 def list_live_catalog_sessions(
@@ -814,23 +865,26 @@ def project_machine_session_delta(
     return {key: value for key, value in payload.items() if value is not None}
 
 
-def _machine_session_delta_signature(payload: dict[str, Any]) -> str:
-    rendered = {key: value for key, value in payload.items() if key not in {"commit_seq", "fanout_kind", "server_fanout_at_ms"}}
-    return json.dumps(rendered, sort_keys=True, separators=(",", ":"))
-
-
 async def stream_live_catalog_machine_sessions(
     request,
     *,
     params: TimelineSessionListParams,
     skip_initial_replay: bool,
     owner_id: int | None = None,
+    emit_patches: bool = False,
 ):
-    """Slim, targeted machine session stream; never serializes browser cards."""
+    """Slim, targeted machine session stream; never serializes browser cards.
+
+    Each delta's top-level fields are digested as they are projected, so an
+    unchanged session is skipped without encoding it. With ``emit_patches``
+    a session already sent on this stream is updated by a ``session_patch``
+    carrying only the fields that changed (``null`` for a dropped field)
+    instead of a full ``session_delta``.
+    """
 
     bus = get_pubsub()
     sequence = bus.peek_latest_seq(TOPIC_TIMELINE)
-    previous: dict[str, str] = {}
+    previous: dict[str, dict[str, int]] = {}
     yield {"event": "connected", "data": json.dumps({"source": "runtime_host"})}
 
     if not skip_initial_replay:
@@ -842,8 +896,7 @@ async def stream_live_catalog_machine_sessions(
         for card in response.sessions:
             initial_commit_seq = card.head.session_state.commit_seq
             delta = project_machine_session_delta(card.head, commit_seq=initial_commit_seq, canonical=True)
-            signature = _machine_session_delta_signature(delta)
-            previous[card.head.id] = signature
+            previous[card.head.id] = field_digests(delta, exclude=_MACHINE_DELTA_VOLATILE)
             yield {
                 "event": "session_delta",
                 "data": json.dumps(delta, sort_keys=True, separators=(",", ":")),
@@ -878,20 +931,29 @@ async def stream_live_catalog_machine_sessions(
                         "data": json.dumps({"session_id": session_id, "source": "runtime_host"}),
                     }
                 continue
-            delta = project_machine_session_delta(session, commit_seq=commit_seq, canonical=True)
-            signature = _machine_session_delta_signature(delta)
-            if previous.get(session_id) == signature:
-                continue
-            previous[session_id] = signature
-            event_delta = project_machine_session_delta(
+            delta = project_machine_session_delta(
                 session,
                 commit_seq=commit_seq,
                 fanout=message.payload,
                 canonical=True,
             )
+            digests = field_digests(delta, exclude=_MACHINE_DELTA_VOLATILE)
+            prior = previous.get(session_id)
+            changed = changed_fields(prior, digests)
+            if not changed:
+                continue
+            previous[session_id] = digests
+            if emit_patches and prior is not None:
+                patch = {key: delta[key] for key in ("session_id", "source", *_MACHINE_DELTA_VOLATILE) if key in delta}
+                patch.update({key: delta.get(key) for key in changed})
+                yield {
+                    "event": "session_patch",
+                    "data": json.dumps(patch, sort_keys=True, separators=(",", ":")),
+                }
+                continue
             yield {
                 "event": "session_delta",
-                "data": json.dumps(event_delta, sort_keys=True, separators=(",", ":")),
+                "data": json.dumps(delta, sort_keys=True, separators=(",", ":")),
             }
 
 
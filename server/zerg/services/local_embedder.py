@@ -27,13 +27,19 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import re
 import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import numpy as np
 
 from zerg.embedding_space import DOCUMENT_PREFIX
+from zerg.embedding_space import EMBEDDING_ARTIFACT_REVISION
 from zerg.embedding_space import EMBEDDING_OUTPUT_NAME
 from zerg.embedding_space import QUERY_PREFIX
 
@@ -56,6 +62,15 @@ EMBED_MAX_TOKENS = int(os.getenv("LONGHOUSE_EMBED_MAX_TOKENS", "2048"))
 # document per quantum bounds interactive waiting at one document forward pass;
 # operators can raise it only when throughput matters more than recall latency.
 EMBED_DOCUMENT_MICROBATCH = int(os.getenv("LONGHOUSE_EMBED_DOCUMENT_MICROBATCH", "1"))
+# Auto-recall on session start, pagination and client retries re-send the same
+# query, and each repeat paid a full ~20ms forward pass. A query vector is a
+# pure function of (embedding space, query text), so a bounded memo is exact.
+# The TTL only bounds how long a rarely-repeated query holds memory; it is not
+# a freshness rule. Size 0 disables the cache.
+EMBED_QUERY_CACHE_SIZE = int(os.getenv("LONGHOUSE_EMBED_QUERY_CACHE_SIZE", "1024"))
+EMBED_QUERY_CACHE_TTL_SECONDS = float(os.getenv("LONGHOUSE_EMBED_QUERY_CACHE_TTL_SECONDS", "900"))
+
+_WHITESPACE = re.compile(r"\s+")
 
 
 class LocalEmbedderUnavailable(RuntimeError):
@@ -67,6 +82,170 @@ class LocalEmbedderUnavailable(RuntimeError):
     """
 
 
+def embedding_space_id(config: "EmbeddingSpaceConfig") -> str:
+    """Identity of the vector space a query embedding belongs to.
+
+    The artifact revision is part of it: a re-pinned model with the same name
+    and dimensions produces vectors that do not compare with the old ones.
+    """
+
+    return f"{config.provider}:{config.model}@{EMBEDDING_ARTIFACT_REVISION}/{config.dims}d"
+
+
+def normalize_query_text(text: str) -> str:
+    """Collapse the differences that cannot matter to the model's tokenizer.
+
+    Only Unicode composition and whitespace runs are folded. Case is kept: the
+    tokenizer is case-sensitive, so folding it would serve a vector for text the
+    caller never sent.
+    """
+
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+@dataclass(frozen=True, slots=True)
+class QueryEmbeddingCacheStats:
+    hits: int
+    misses: int
+    expired: int
+    evictions: int
+    invalidations: int
+    entries: int
+    max_entries: int
+    ttl_seconds: float
+    space_id: str | None
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class QueryEmbeddingCache:
+    """Size- and TTL-bounded LRU of normalized query text to query vector.
+
+    Entries are scoped to one embedding space. Binding a different space drops
+    everything, so a vector from the previous model can never be served against
+    the new corpus. Cached arrays are read-only because every caller shares them.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = EMBED_QUERY_CACHE_SIZE,
+        ttl_seconds: float = EMBED_QUERY_CACHE_TTL_SECONDS,
+        clock=time.monotonic,
+    ) -> None:
+        self._max_entries = max(0, int(max_entries))
+        self._ttl_seconds = float(ttl_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], tuple[float, np.ndarray]] = OrderedDict()
+        self._space_id: str | None = None
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_entries > 0
+
+    def bind_space(self, space_id: str) -> None:
+        with self._lock:
+            if self._space_id == space_id:
+                return
+            if self._entries:
+                self._invalidations += 1
+            self._entries.clear()
+            self._space_id = space_id
+        _record_cache_size(0)
+
+    def get(self, space_id: str, text: str) -> np.ndarray | None:
+        if not self.enabled:
+            return None
+        key = (space_id, normalize_query_text(text))
+        outcome = "miss"
+        vector = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, cached = entry
+                if self._ttl_seconds > 0 and self._clock() - stored_at > self._ttl_seconds:
+                    del self._entries[key]
+                    self._expired += 1
+                    self._misses += 1
+                    outcome = "expired"
+                else:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    outcome = "hit"
+                    vector = cached
+            else:
+                self._misses += 1
+            size = len(self._entries)
+        _record_cache_lookup(outcome, size)
+        return vector
+
+    def put(self, space_id: str, text: str, vector: np.ndarray) -> np.ndarray:
+        if not self.enabled:
+            return vector
+        stored = np.array(vector, dtype="float32", copy=True)
+        stored.setflags(write=False)
+        key = (space_id, normalize_query_text(text))
+        with self._lock:
+            # A late writer from before a space change must not repopulate the
+            # cache with a vector from the space that was just retired.
+            if self._space_id is not None and space_id != self._space_id:
+                return stored
+            self._entries[key] = (self._clock(), stored)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            self._evictions += evicted
+            size = len(self._entries)
+        _record_cache_size(size)
+        return stored
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._entries:
+                self._invalidations += 1
+            self._entries.clear()
+        _record_cache_size(0)
+
+    def stats(self) -> QueryEmbeddingCacheStats:
+        with self._lock:
+            return QueryEmbeddingCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                expired=self._expired,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                max_entries=self._max_entries,
+                ttl_seconds=self._ttl_seconds,
+                space_id=self._space_id,
+            )
+
+
+def _record_cache_lookup(outcome: str, size: int) -> None:
+    from zerg.metrics import query_embedding_cache_entries
+    from zerg.metrics import query_embedding_cache_lookups_total
+
+    query_embedding_cache_lookups_total.labels(outcome=outcome).inc()
+    query_embedding_cache_entries.set(size)
+
+
+def _record_cache_size(size: int) -> None:
+    from zerg.metrics import query_embedding_cache_entries
+
+    query_embedding_cache_entries.set(size)
+
+
 class LocalEmbedder:
     """One process-wide ONNX session shared by the query path and the projector.
 
@@ -238,6 +417,8 @@ class LocalEmbedder:
 
 
 _embedder: LocalEmbedder | None = None
+_embedder_space_id: str | None = None
+_query_cache = QueryEmbeddingCache()
 
 
 def get_local_embedder() -> LocalEmbedder:
@@ -246,20 +427,39 @@ def get_local_embedder() -> LocalEmbedder:
     return _embedder
 
 
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    return _query_cache
+
+
 def initialize_local_embedder(config: "EmbeddingSpaceConfig", model_dir: str | Path) -> LocalEmbedder:
-    global _embedder
+    global _embedder, _embedder_space_id
     embedder = LocalEmbedder(model_dir, dims=config.dims)
     embedder.load()
+    space_id = embedding_space_id(config)
+    # Rebinding is what invalidates: a new space drops every cached vector,
+    # while reloading the same space keeps vectors that are still exact.
+    _query_cache.bind_space(space_id)
     _embedder = embedder
+    _embedder_space_id = space_id
     return embedder
 
 
 async def embed_query(text: str) -> np.ndarray:
-    """Embed one query off the event loop.
+    """Embed one query off the event loop, serving repeats from the query cache.
 
     The forward pass is CPU-bound; running it inline would block every other
-    request on this worker for the duration.
+    request on this worker for the duration. The returned array is read-only
+    when it came from (or went into) the cache.
     """
 
     embedder = get_local_embedder()
-    return (await asyncio.to_thread(embedder.embed_queries, [text]))[0]
+    space_id = _embedder_space_id
+    if space_id is None or not _query_cache.enabled:
+        return (await asyncio.to_thread(embedder.embed_queries, [text]))[0]
+    cached = _query_cache.get(space_id, text)
+    if cached is not None:
+        return cached
+    # With the cache in play the model sees the normalized form, so the cached
+    # vector is exactly what every query sharing its key would have produced.
+    vector = (await asyncio.to_thread(embedder.embed_queries, [normalize_query_text(text)]))[0]
+    return _query_cache.put(space_id, text, vector)
@@ -1,4 +1,10 @@
-"""Machine Agent managed-control WebSocket registry."""
+"""Machine Agent managed-control WebSocket registry.
+
+The sockets live in one process. In a multi-worker Runtime Host that is the
+control process, which publishes a full connection snapshot on the
+``machine_control`` pubsub topic after every change; HTTP workers follow the
+topic so their read-only presence answers (``info``/``is_online``/...) match.
+"""
 
 from __future__ import annotations
 
@@ -54,10 +60,37 @@ class _PendingCommand:
     future: asyncio.Future[Mapping[str, Any]]
 
 
+MACHINE_CONTROL_TOPIC = "machine_control"
+
+
 def _utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _info_to_wire(info: MachineControlConnectionInfo) -> dict[str, Any]:
+    return {
+        "owner_id": info.owner_id,
+        "device_id": info.device_id,
+        "machine_name": info.machine_name,
+        "engine_build": info.engine_build,
+        "supports": sorted(info.supports),
+        "connected_at": info.connected_at.isoformat(),
+        "last_seen_at": info.last_seen_at.isoformat(),
+    }
+
+
+def _info_from_wire(raw: Mapping[str, Any]) -> MachineControlConnectionInfo:
+    return MachineControlConnectionInfo(
+        owner_id=int(raw["owner_id"]),
+        device_id=str(raw["device_id"]),
+        machine_name=raw.get("machine_name"),
+        engine_build=raw.get("engine_build"),
+        supports=frozenset(str(item) for item in raw.get("supports") or ()),
+        connected_at=datetime.fromisoformat(raw["connected_at"]),
+        last_seen_at=datetime.fromisoformat(raw["last_seen_at"]),
+    )
+
+
 class MachineControlChannelRegistry:
     """In-memory registry for typed Machine Agent control channels."""
 
@@ -65,6 +98,34 @@ class MachineControlChannelRegistry:
         self._connections: dict[tuple[int, str], _MachineControlConnection] = {}
         self._pending: dict[str, _PendingCommand] = {}
         self._lock = asyncio.Lock()
+        self._publish_snapshots = False
+        # Set in HTTP workers: the control process's connections, read-only.
+        self._mirror: dict[tuple[int, str], MachineControlConnectionInfo] | None = None
+
+    def enable_snapshot_publishing(self) -> None:
+        """Publish connection snapshots for HTTP workers, starting with the current one."""
+
+        self._publish_snapshots = True
+        self.publish_snapshot()
+
+    def apply_snapshot(self, payload: Mapping[str, Any]) -> None:
+        """Replace the mirrored connections with a snapshot from the control process."""
+
+        infos = [_info_from_wire(raw) for raw in payload.get("connections") or ()]
+        self._mirror = {(info.owner_id, info.device_id): info for info in infos}
+
+    def publish_snapshot(self) -> None:
+        if not self._publish_snapshots:
+            return
+        from zerg.services.session_pubsub import get_pubsub
+
+        connections = [_info_to_wire(connection.info) for connection in self._connections.values()]
+        get_pubsub().publish(MACHINE_CONTROL_TOPIC, {"kind": "machine_control_snapshot", "connections": connections})
+
+    def _infos(self) -> Mapping[tuple[int, str], MachineControlConnectionInfo]:
+        if self._mirror is not None:
+            return self._mirror
+        return {key: connection.info for key, connection in self._connections.items()}
 
     async def register(
         self,
@@ -96,6 +157,7 @@ class MachineControlChannelRegistry:
                 websocket=websocket,
                 send_lock=asyncio.Lock(),
             )
+            self.publish_snapshot()
         logger.info("Registered machine control channel for owner=%s device=%s", owner_id, device_id)
 
     async def unregister(self, *, owner_id: int, device_id: str, websocket: WebSocket) -> bool:
@@ -106,6 +168,7 @@ class MachineControlChannelRegistry:
                 return False
             del self._connections[key]
             self._fail_pending_for_key(key, "Machine control channel disconnected")
+            self.publish_snapshot()
         logger.info("Unregistered machine control channel for owner=%s device=%s", owner_id, device_id)
         return True
 
@@ -125,17 +188,17 @@ class MachineControlChannelRegistry:
                 connected_at=info.connected_at,
                 last_seen_at=_utc_now(),
             )
+            self.publish_snapshot()
 
     def info(self, *, owner_id: int, device_id: str) -> MachineControlConnectionInfo | None:
-        connection = self._connections.get((owner_id, device_id))
-        return connection.info if connection is not None else None
+        return self._infos().get((owner_id, device_id))
 
     def list_for_owner(self, *, owner_id: int) -> list[MachineControlConnectionInfo]:
         """Return infos for every currently-connected machine belonging to owner."""
-        return [connection.info for (conn_owner, _device), connection in self._connections.items() if conn_owner == owner_id]
+        return [info for (conn_owner, _device), info in self._infos().items() if conn_owner == owner_id]
 
     def is_online(self, *, owner_id: int, device_id: str) -> bool:
-        return (owner_id, device_id) in self._connections
+        return (owner_id, device_id) in self._infos()
 
     def supports(self, *, owner_id: int, device_id: str, capability: str) -> bool:
         info = self.info(owner_id=owner_id, device_id=device_id)
@@ -321,6 +384,7 @@ class MachineControlChannelRegistry:
                     pending.future.set_exception(RuntimeError("Machine control registry reset"))
             self._pending.clear()
             self._connections.clear()
+            self._mirror = None
 
     def _fail_pending_for_key(self, key: tuple[int, str], message: str) -> None:
         for command_id, pending in list(self._pending.items()):
@@ -339,3 +403,11 @@ def get_machine_control_channel_registry() -> MachineControlChannelRegistry:
     if _registry is None:
         _registry = MachineControlChannelRegistry()
     return _registry
+
+
+async def follow_machine_control_snapshots() -> None:
+    """Keep this HTTP worker's registry mirror in step with the control process."""
+
+    from zerg.services.control_snapshots import follow_snapshots
+
+    await follow_snapshots(MACHINE_CONTROL_TOPIC, get_machine_control_channel_registry().apply_snapshot)
@@ -1,7 +1,7 @@
 """Managed local session event polling and hydration.
 
 Extracted from routers/session_chat.py -- event fetching, snapshot hydration,
-and async polling for managed local turn events.
+and the pubsub-driven wait for managed local turn events.
 """
 
 from __future__ import annotations
@@ -18,13 +18,17 @@ from zerg.models.agents import AgentEvent
 from zerg.services.agents import AgentsStore
 from zerg.services.claude_channel_text import strip_claude_channel_wrapper
 from zerg.services.provisional_events import durable_transcript_event_predicate
+from zerg.services.session_pubsub import get_pubsub
+from zerg.services.session_pubsub import topic_session
 from zerg.services.session_turns import get_session_turn_snapshot
 
 logger = logging.getLogger(__name__)
 
 MANAGED_LOCAL_EVENT_TIMEOUT_SECS = 150.0
 MANAGED_LOCAL_POLL_INTERVAL_SECS = 0.1
-MANAGED_LOCAL_STABLE_POLLS = 1
+# Backstop read while no publication arrives, e.g. an ingest handled by
+# another process whose pubsub this one never sees.
+MANAGED_LOCAL_RECHECK_INTERVAL_SECS = 5.0
 
 
 def fetch_managed_local_events_since(*, db_bind, session_id: UUID, after_event_id: int) -> list[AgentEvent]:
@@ -162,45 +166,83 @@ async def await_managed_local_turn_events(
     timeout_secs: float = MANAGED_LOCAL_EVENT_TIMEOUT_SECS,
     poll_interval_secs: float = MANAGED_LOCAL_POLL_INTERVAL_SECS,
 ) -> list[AgentEvent]:
+    """Wait for a managed-local turn's events to land and settle, then fetch them.
+
+    Wakes on ``ingest`` publications to the session's pubsub topic instead of
+    polling the DB. A burst of publications is debounced in memory: the read
+    happens once nothing new has been published for ``poll_interval_secs``.
+    The DB is also read once on entry (events may have landed between the
+    caller's baseline and the subscription) and every
+    ``MANAGED_LOCAL_RECHECK_INTERVAL_SECS`` as a backstop for writes whose
+    publication this process never sees. Those reads did not follow a settled
+    burst, so a turn they find is only returned once a re-read after a quiet
+    period shows the same tail.
+    """
     deadline = time.monotonic() + timeout_secs
-    latest_seen = after_event_id
-    stable_polls = 0
     saw_pool_timeout = False
-
-    while time.monotonic() < deadline:
-        try:
-            latest_event_id = get_managed_local_latest_event_id(db_bind=db_bind, session_id=session_id)
-            if latest_event_id > after_event_id:
-                if latest_event_id == latest_seen:
-                    stable_polls += 1
-                else:
-                    latest_seen = latest_event_id
-                    stable_polls = 0
-
-                if stable_polls >= MANAGED_LOCAL_STABLE_POLLS:
-                    events = fetch_managed_local_events_since(
-                        db_bind=db_bind,
-                        session_id=session_id,
-                        after_event_id=after_event_id,
-                    )
-                    if expected_user_message and not managed_local_events_include_expected_turn(
-                        events=events,
-                        expected_user_message=expected_user_message,
-                    ):
-                        await asyncio.sleep(poll_interval_secs)
-                        continue
-                    return events
-        except SQLAlchemyTimeoutError:
-            if not saw_pool_timeout:
-                logger.warning(
-                    "Managed-local event poll for %s timed out waiting for a DB connection; retrying",
-                    session_id,
+    settled = False
+    unsettled_tail: tuple[int, object] | None = None
+
+    # Subscribe before the first read so an ingest landing in between still wakes us.
+    with get_pubsub().subscribe(topic_session(str(session_id))) as subscription:
+        while True:
+            try:
+                events = fetch_managed_local_events_since(
+                    db_bind=db_bind,
+                    session_id=session_id,
+                    after_event_id=after_event_id,
                 )
-                saw_pool_timeout = True
+                if events and (
+                    not expected_user_message
+                    or managed_local_events_include_expected_turn(events=events, expected_user_message=expected_user_message)
+                ):
+                    tail = (len(events), getattr(events[-1], "id", None))
+                    if settled or tail == unsettled_tail or time.monotonic() >= deadline:
+                        return events
+                    # The turn may still be landing; let it go quiet first.
+                    unsettled_tail = tail
+                    settled = False
+                    await _await_quiet(subscription, deadline=deadline, quiet_secs=poll_interval_secs)
+                    continue
+            except SQLAlchemyTimeoutError:
+                if not saw_pool_timeout:
+                    logger.warning(
+                        "Managed-local event read for %s timed out waiting for a DB connection; retrying",
+                        session_id,
+                    )
+                    saw_pool_timeout = True
+
+            unsettled_tail = None
+            settled = await _await_settled_ingest(
+                subscription,
+                deadline=deadline,
+                quiet_secs=poll_interval_secs,
+            )
+            if not settled and time.monotonic() >= deadline:
+                return []
+
+
+async def _await_settled_ingest(subscription, *, deadline: float, quiet_secs: float) -> bool:
+    """Return True once an ingest burst has gone quiet, False on a recheck or the deadline."""
+    message = await subscription.next_message(timeout=_remaining(deadline, MANAGED_LOCAL_RECHECK_INTERVAL_SECS))
+    while message is not None and message.payload.get("kind") != "ingest":
+        message = await subscription.next_message(timeout=_remaining(deadline, MANAGED_LOCAL_RECHECK_INTERVAL_SECS))
+    if message is None:
+        return False
+    await _await_quiet(subscription, deadline=deadline, quiet_secs=quiet_secs)
+    return True
+
+
+async def _await_quiet(subscription, *, deadline: float, quiet_secs: float) -> None:
+    """Return once nothing has been published for ``quiet_secs``, or at the deadline."""
+    while time.monotonic() < deadline:
+        subscription.drain_nowait()
+        if await subscription.next_message(timeout=_remaining(deadline, quiet_secs)) is None:
+            return
 
-        await asyncio.sleep(poll_interval_secs)
 
-    return []
+def _remaining(deadline: float, cap: float) -> float:
+    return max(0.0, min(cap, deadline - time.monotonic()))
 
 
 async def await_managed_local_events_task(
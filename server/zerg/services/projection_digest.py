@@ -0,0 +1,108 @@
+"""Structural digests for change detection on projected stream payloads.
+
+Session streams used to dump every projected card or delta to Python
+dictionaries and JSON-encode it on every wake just to learn whether it
+changed. A digest hashes the projection as a tree instead: mappings,
+sequences and namespaces hash their children's digests, and a pydantic model
+is serialized once by pydantic's Rust core with its exclusions applied. A
+model whose exclusions only descend into child fields is walked one level
+first, so children shared between fields (a timeline card's head, detail and
+root are the same ``SessionResponse``) are serialized once per walk.
+
+Digests use Python's per-process ``hash`` and are only ever compared with
+digests from the same stream. Two payloads with the same digest are treated
+as unchanged; with 64-bit hashes the chance of a collision masking a change is
+negligible, and the next real change re-emits the value anyway.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from collections.abc import Set
+from types import SimpleNamespace
+from typing import Any
+
+from pydantic import BaseModel
+
+# Exclusion trees name keys to skip at each level: ``{"commit_seq": None}``
+# drops a key outright, ``{"session_state": {"commit_seq": None}}`` descends.
+Exclusions = Mapping[str, "Exclusions | None"]
+
+_MISSING = object()
+
+
+def _pydantic_exclude(exclude: Exclusions | None) -> dict[str, Any] | None:
+    if exclude is None:
+        return None
+    return {name: True if nested is None else _pydantic_exclude(nested) for name, nested in exclude.items()}
+
+
+def _fields(value: Any, exclude: Exclusions | None) -> list[tuple[str, Any]] | None:
+    if isinstance(value, BaseModel):
+        # A model whose exclusions all reach past it only carries projections;
+        # anything else is serialized whole with the exclusions applied.
+        if not exclude or any(nested is None for nested in exclude.values()):
+            return None
+        items = [(name, getattr(value, name, None)) for name in type(value).model_fields]
+        extra = value.__pydantic_extra__
+        if extra:
+            items.extend(extra.items())
+        return items
+    if isinstance(value, Mapping):
+        return list(value.items())
+    if isinstance(value, SimpleNamespace):
+        return list(vars(value).items())
+    return None
+
+
+def structural_digest(value: Any, *, exclude: Exclusions | None = None, memo: dict[tuple[int, int], int] | None = None) -> int:
+    """Return a digest of ``value`` that changes whenever its JSON form would."""
+
+    fields = _fields(value, exclude)
+    if fields is None and not isinstance(value, BaseModel):
+        if isinstance(value, (list, tuple)):
+            return hash(("seq", *(structural_digest(item, memo=memo) for item in value)))
+        if isinstance(value, Set):
+            return hash(("set", frozenset(structural_digest(item, memo=memo) for item in value)))
+        # The type tag keeps True, 1 and 1.0 distinct, as they are in JSON.
+        try:
+            return hash((value.__class__, value))
+        except TypeError:
+            return hash((value.__class__, repr(value)))
+    key = (id(value), id(exclude))
+    if memo is not None:
+        cached = memo.get(key)
+        if cached is not None:
+            return cached
+    if fields is None:
+        digest = hash(value.model_dump_json(exclude=_pydantic_exclude(exclude)))
+    else:
+        children = []
+        for name, child in fields:
+            nested = exclude.get(name, _MISSING) if exclude is not None else _MISSING
+            if nested is None:
+                continue
+            children.append((name, structural_digest(child, exclude=None if nested is _MISSING else nested, memo=memo)))
+        digest = hash(frozenset(children))
+    if memo is not None:
+        memo[key] = digest
+    return digest
+
+
+def field_digests(payload: Mapping[str, Any], *, exclude: Set[str] = frozenset()) -> dict[str, int]:
+    """Digest each top-level field of a projected payload."""
+
+    return {name: structural_digest(value) for name, value in payload.items() if name not in exclude}
+
+
+def changed_fields(previous: Mapping[str, int] | None, current: Mapping[str, int]) -> set[str]:
+    """Return top-level fields that were added, changed or dropped."""
+
+    if previous is None:
+        return set(current)
+    changed = {name for name, digest in current.items() if previous.get(name) != digest}
+    changed.update(name for name in previous if name not in current)
+    return changed
+
+
+__all__ = ["Exclusions", "changed_fields", "field_digests", "structural_digest"]
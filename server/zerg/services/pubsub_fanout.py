@@ -0,0 +1,216 @@
+"""Attach this worker's session pubsub to the cross-process pubsub broker.
+
+When ``LONGHOUSE_PUBSUB_SOCKET`` names a ``zerg.pubsubd`` socket, every
+``SessionPubsub.publish`` in this process is sent to the broker, and every
+broker-numbered message, including this worker's own, comes back through
+``SessionPubsub.deliver``. Without the variable nothing changes: publish
+delivers locally exactly as a single-process runtime always has.
+
+- Publishes made while the broker is unreachable wait in a bounded outbox and
+  are sent on reconnect; the durable rows they announce are already written,
+  and SSE loops reconcile on their periodic rescans.
+- On connect the worker names the topics it has subscribers on and the broker
+  replays only those retained rings; ``deliver`` skips seqs this worker already
+  holds and wakes subscribers for the ones it missed. Other topics pick up
+  from the next live message, and older cursors on them get ``replay_gap``.
+- A new broker epoch resets local seqs so stale cursors surface as
+  ``replay_gap`` instead of silently matching a different message.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections import deque
+from contextlib import suppress
+from pathlib import Path
+from typing import Any
+
+from zerg.catalogd.protocol import ProtocolError
+from zerg.pubsubd.protocol import encode_message
+from zerg.pubsubd.protocol import read_message
+from zerg.services.session_pubsub import SessionPubsub
+from zerg.services.session_pubsub import get_pubsub
+
+logger = logging.getLogger(__name__)
+
+PUBSUB_SOCKET_ENV = "LONGHOUSE_PUBSUB_SOCKET"
+_OUTBOX_LIMIT = 4096
+# Keeps the subscribe frame well under the protocol's frame limit.
+_REPLAY_TOPICS_LIMIT = 4096
+_RECONNECT_MAX_SECONDS = 2.0
+
+
+def _record_frame(outcome: str) -> None:
+    try:
+        from zerg.metrics import pubsub_fanout_frames_total
+
+        pubsub_fanout_frames_total.labels(outcome=outcome).inc()
+    except Exception:  # noqa: BLE001 - metrics are best-effort
+        pass
+
+
+def _record_connected(connected: bool) -> None:
+    try:
+        from zerg.metrics import pubsub_fanout_connected
+
+        pubsub_fanout_connected.set(1 if connected else 0)
+    except Exception:  # noqa: BLE001 - metrics are best-effort
+        pass
+
+
+class PubsubBrokerLink:
+    """One worker's persistent connection to the broker; the bus's transport."""
+
+    def __init__(self, *, socket_path: Path, bus: SessionPubsub) -> None:
+        self.socket_path = socket_path
+        self.bus = bus
+        self.epoch: str | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._outbox: deque[bytes] = deque()
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._stopping = False
+
+    @property
+    def connected(self) -> bool:
+        return self._writer is not None
+
+    async def start(self, *, ready_timeout_seconds: float = 2.0) -> bool:
+        """Attach to the bus and connect; return whether the replay finished in time.
+
+        A slow broker is not fatal: publishes queue in the outbox and the link
+        keeps reconnecting in the background.
+        """
+
+        self._loop = asyncio.get_running_loop()
+        self._stopping = False
+        self.bus.attach_transport(self)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="pubsub-fanout")
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=ready_timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.warning("pubsub broker at %s is not ready; publishes will queue until it is", self.socket_path)
+            return False
+        return True
+
+    async def stop(self) -> None:
+        self._stopping = True
+        self.bus.attach_transport(None)
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._disconnect()
+
+    def send(self, topic: str, payload: dict[str, Any]) -> None:
+        frame = encode_message({"type": "publish", "topic": topic, "payload": payload})
+        loop = self._loop
+        try:
+            on_loop = loop is not None and asyncio.get_running_loop() is loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop or loop is None:
+            self._write(frame)
+        else:
+            loop.call_soon_threadsafe(self._write, frame)
+
+    def _write(self, frame: bytes) -> None:
+        writer = self._writer
+        if writer is not None and not writer.transport.is_closing():
+            writer.write(frame)
+            _record_frame("sent")
+            return
+        if len(self._outbox) >= _OUTBOX_LIMIT:
+            self._outbox.popleft()
+            _record_frame("dropped_offline")
+        self._outbox.append(frame)
+        _record_frame("queued_offline")
+
+    def _disconnect(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self._ready.clear()
+        _record_connected(False)
+
+    async def _run(self) -> None:
+        backoff = 0.05
+        while not self._stopping:
+            try:
+                reader, writer = await asyncio.open_unix_connection(str(self.socket_path))
+            except OSError:
+                await asyncio.sleep(backoff)
+                backoff = min(_RECONNECT_MAX_SECONDS, backoff * 2)
+                continue
+            try:
+                await self._consume(reader, writer)
+            except (EOFError, asyncio.IncompleteReadError, ConnectionError, ProtocolError) as exc:
+                if not self._stopping:
+                    logger.warning("pubsub broker connection lost (%s); reconnecting", type(exc).__name__)
+            finally:
+                self._disconnect()
+            backoff = 0.05
+            if not self._stopping:
+                await asyncio.sleep(backoff)
+
+    async def _consume(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        hello = await read_message(reader)
+        if hello["type"] != "hello":
+            raise ProtocolError("invalid_request", "pubsub broker must open with hello")
+        if hello["epoch"] != self.epoch or hello["buffer_size"] != self.bus.buffer_size:
+            if self.epoch is not None:
+                logger.info("pubsub broker epoch changed; resetting local topic sequences")
+            self.bus.reset_sequences(buffer_size=hello["buffer_size"])
+            self.epoch = hello["epoch"]
+        topics = self.bus.subscribed_topics()[:_REPLAY_TOPICS_LIMIT]
+        writer.write(encode_message({"type": "subscribe", "topics": topics}))
+        self._writer = writer
+        _record_connected(True)
+        while self._outbox:
+            writer.write(self._outbox.popleft())
+            _record_frame("sent")
+        while True:
+            wire = await read_message(reader)
+            if wire["type"] == "message":
+                delivered = self.bus.deliver(wire["topic"], wire["seq"], wire["payload"])
+                _record_frame("delivered" if delivered else "duplicate")
+            elif wire["type"] == "ready":
+                self._ready.set()
+            else:
+                raise ProtocolError("invalid_request", f"unexpected pubsub frame: {wire['type']}")
+
+
+_link: PubsubBrokerLink | None = None
+
+
+def pubsub_socket_path() -> Path | None:
+    raw = os.getenv(PUBSUB_SOCKET_ENV, "").strip()
+    return Path(raw).expanduser() if raw else None
+
+
+async def start_pubsub_fanout() -> bool | None:
+    """Attach the process pubsub to the broker if one is configured; None when not."""
+
+    global _link
+    socket_path = pubsub_socket_path()
+    if socket_path is None:
+        return None
+    if _link is None:
+        _link = PubsubBrokerLink(socket_path=socket_path, bus=get_pubsub())
+    return await _link.start()
+
+
+async def stop_pubsub_fanout() -> None:
+    global _link
+    if _link is not None:
+        await _link.stop()
+    _link = None
+
+
+def get_pubsub_fanout() -> PubsubBrokerLink | None:
+    return _link
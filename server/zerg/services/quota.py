@@ -1,13 +1,15 @@
 """Quota helpers for launch-era session actions.
 
-The retired automation-run ledger no longer backs quota accounting. Keep this
-module as a policy hook, but do not query dropped run tables.
+The retired automation-run ledger no longer backs quota accounting. Spend is
+read from catalogd's usage ledger, which storage-v2 folds at commit time.
 """
 
 from __future__ import annotations
 
-from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from fastapi import status
 
+from zerg.config import get_settings
 from zerg.models.models import User as UserModel
 
 
@@ -15,7 +17,18 @@ def _is_admin(user: UserModel | None) -> bool:
     return getattr(user, "role", "USER") == "ADMIN"
 
 
-def assert_can_start_run(db: Session, *, user: UserModel) -> None:
-    """Compatibility hook for callers that still ask before starting work."""
-    _ = (db, user)
-    return
+async def assert_can_start_run(*, user: UserModel) -> None:
+    """Reject non-admin work once today's ledger cost reaches the daily limit."""
+    if _is_admin(user):
+        return
+    daily_limit_cents = int(getattr(get_settings(), "daily_cost_per_user_cents", 0) or 0)
+    if daily_limit_cents <= 0:
+        return
+
+    from zerg.services.usage_service import get_user_today_cost_usd
+
+    if await get_user_today_cost_usd(user.id) * 100 >= daily_limit_cents:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Daily LLM cost limit reached",
+        )
@@ -1,4 +1,12 @@
-"""Persistent, lane-isolated process pools for immutable raw-object I/O."""
+"""Persistent, lane-isolated process pools for immutable raw-object I/O.
+
+Decoded objects normally come back from a worker by pickling. Streaming readers
+can instead use ``open_records``: with the ``shared_memory`` transfer the worker
+lays the verified record bytes out in a ``multiprocessing.shared_memory``
+segment and returns only the spec header and each record's offset, so a
+multi-megabyte object is not pickled, piped and unpickled on its way to the
+response. The reader owns the segment and unlinks it when the context exits.
+"""
 
 from __future__ import annotations
 
@@ -6,9 +14,14 @@ import asyncio
 import multiprocessing
 import os
 from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Iterator
 from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures.process import BrokenProcessPool
 from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from dataclasses import replace
+from multiprocessing import shared_memory
 from pathlib import Path
 from typing import Any
 
@@ -41,6 +54,9 @@ def storage_v2_root() -> Path:
     return get_settings().data_dir / "objects-v2"
 
 
+RAW_READ_TRANSFERS = frozenset({"pickle", "shared_memory"})
+
+
 def _env_positive_int(name: str, default: int) -> int:
     raw = os.getenv(name, "").strip()
     try:
@@ -63,6 +79,119 @@ def _read_in_worker(root: str, object_path: str, expected_object_hash: str, tena
     )
 
 
+@dataclass(frozen=True, slots=True)
+class SharedRawRecords:
+    """Worker reply whose record bytes live in a shared-memory segment.
+
+    ``spec.records`` is empty; ``record_spans`` holds ``(source_position,
+    offset, length)`` for each record in source order.
+    """
+
+    segment_name: str
+    spec: RawObjectSpec
+    record_spans: tuple[tuple[int, int, int], ...]
+    envelope_id: str
+    payload_hash: str
+    object_hash: str
+
+
+def _read_shared_in_worker(
+    root: str,
+    object_path: str,
+    expected_object_hash: str,
+    tenant_id: str,
+    min_bytes: int,
+) -> DecodedRawObject | SharedRawRecords:
+    decoded = _read_in_worker(root, object_path, expected_object_hash, tenant_id)
+    total = sum(len(record.data) for record in decoded.spec.records)
+    if total < max(1, min_bytes):
+        return decoded
+    try:
+        segment = shared_memory.SharedMemory(create=True, size=total)
+    except OSError:
+        # /dev/shm is small in some containers; pickling is slower, not wrong.
+        return decoded
+    try:
+        spans: list[tuple[int, int, int]] = []
+        offset = 0
+        for record in decoded.spec.records:
+            end = offset + len(record.data)
+            segment.buf[offset:end] = record.data
+            spans.append((record.source_position, offset, len(record.data)))
+            offset = end
+    except BaseException:
+        segment.close()
+        segment.unlink()
+        raise
+    segment.close()
+    return SharedRawRecords(
+        segment_name=segment.name,
+        spec=replace(decoded.spec, records=()),
+        record_spans=tuple(spans),
+        envelope_id=decoded.envelope_id,
+        payload_hash=decoded.payload_hash,
+        object_hash=decoded.object_hash,
+    )
+
+
+def _release_shared_reply(reply: object) -> None:
+    if not isinstance(reply, SharedRawRecords):
+        return
+    try:
+        segment = shared_memory.SharedMemory(name=reply.segment_name)
+    except FileNotFoundError:
+        return
+    segment.close()
+    segment.unlink()
+
+
+def _release_abandoned_reply(future: asyncio.Future[Any]) -> None:
+    if future.cancelled() or future.exception() is not None:
+        return
+    _release_shared_reply(future.result())
+
+
+class RawObjectRecords:
+    """Verified raw-object records for one streaming read.
+
+    ``record_data`` yields each record's bytes in source order. Shared-memory
+    replies are copied out one record at a time, so callers never hold a view
+    into the segment after ``close``.
+    """
+
+    def __init__(self, reply: DecodedRawObject | SharedRawRecords) -> None:
+        self.spec = reply.spec
+        self.envelope_id = reply.envelope_id
+        self.payload_hash = reply.payload_hash
+        self.object_hash = reply.object_hash
+        self._records = reply.spec.records
+        self._spans: tuple[tuple[int, int, int], ...] = ()
+        self._segment: shared_memory.SharedMemory | None = None
+        if isinstance(reply, SharedRawRecords):
+            self._spans = reply.record_spans
+            self._segment = shared_memory.SharedMemory(name=reply.segment_name)
+
+    @property
+    def shared(self) -> bool:
+        return self._segment is not None
+
+    def record_data(self) -> Iterator[bytes]:
+        if self._segment is None:
+            for record in self._records:
+                yield record.data
+            return
+        buffer = self._segment.buf
+        for _source_position, offset, length in self._spans:
+            yield bytes(buffer[offset : offset + length])
+
+    def close(self) -> None:
+        segment, self._segment = self._segment, None
+        if segment is None:
+            return
+        segment.close()
+        segment.unlink()
+
+
 def _seal_media_in_worker(root: str, spec: MediaObjectSpec) -> SealedMediaObject:
     return seal_media_object(Path(root), spec)
 
@@ -86,13 +215,19 @@ class RawObjectWorkerPool:
         repair_workers: int = 1,
         user_read_workers: int = 1,
         queue_multiplier: int = 2,
+        read_transfer: str = "pickle",
+        shared_memory_min_bytes: int = 2 * 1024 * 1024,
     ) -> None:
         if live_workers < 1 or repair_workers < 1 or user_read_workers < 1 or queue_multiplier < 1:
             raise ValueError("raw worker counts and queue multiplier must be positive")
+        if read_transfer not in RAW_READ_TRANSFERS:
+            raise ValueError("raw read transfer must be pickle or shared_memory")
         self.root = root.expanduser().resolve()
         self.live_workers = live_workers
         self.repair_workers = repair_workers
         self.user_read_workers = user_read_workers
+        self.read_transfer = read_transfer
+        self.shared_memory_min_bytes = max(1, shared_memory_min_bytes)
         self._live_slots = asyncio.Semaphore(live_workers * queue_multiplier)
         self._repair_slots = asyncio.Semaphore(repair_workers * queue_multiplier)
         self._user_read_slots = asyncio.Semaphore(user_read_workers * queue_multiplier)
@@ -276,39 +411,99 @@ class RawObjectWorkerPool:
         queue_timeout_seconds: float = 0.25,
         operation_timeout_seconds: float = 3.0,
     ) -> DecodedRawObject:
+        return await self._user_read(
+            "raw",
+            _read_in_worker,
+            str(self.root),
+            object_path,
+            expected_object_hash,
+            tenant_id,
+            queue_timeout_seconds=queue_timeout_seconds,
+            operation_timeout_seconds=operation_timeout_seconds,
+        )
+
+    @asynccontextmanager
+    async def open_records(
+        self,
+        object_path: str,
+        expected_object_hash: str,
+        tenant_id: str,
+        *,
+        queue_timeout_seconds: float = 0.25,
+        operation_timeout_seconds: float = 3.0,
+    ) -> AsyncIterator[RawObjectRecords]:
+        """Read one raw object on the user lane for streaming its record bytes."""
+
+        if self.read_transfer == "shared_memory":
+            reply = await self._user_read(
+                "raw",
+                _read_shared_in_worker,
+                str(self.root),
+                object_path,
+                expected_object_hash,
+                tenant_id,
+                self.shared_memory_min_bytes,
+                queue_timeout_seconds=queue_timeout_seconds,
+                operation_timeout_seconds=operation_timeout_seconds,
+                on_abandoned=_release_abandoned_reply,
+            )
+        else:
+            reply = await self.read(
+                object_path,
+                expected_object_hash,
+                tenant_id,
+                queue_timeout_seconds=queue_timeout_seconds,
+                operation_timeout_seconds=operation_timeout_seconds,
+            )
+        try:
+            records = RawObjectRecords(reply)
+        except BaseException:
+            _release_shared_reply(reply)
+            raise
+        try:
+            yield records
+        finally:
+            records.close()
+
+    async def _user_read(
+        self,
+        label: str,
+        fn: Callable[..., Any],
+        *args: Any,
+        queue_timeout_seconds: float,
+        operation_timeout_seconds: float,
+        on_abandoned: Callable[[asyncio.Future[Any]], None] | None = None,
+    ) -> Any:
         if self._closed:
             raise RawObjectWorkerError("raw worker pool is closed")
         try:
             async with asyncio.timeout(queue_timeout_seconds):
                 await self._user_read_slots.acquire()
         except TimeoutError as exc:
-            raise RawObjectWorkerBusy("raw user read queue is full") from exc
+            raise RawObjectWorkerBusy(f"{label} user read queue is full") from exc
         release_slot = True
         try:
             for attempt in range(2):
                 executor = self._user_read_executor
                 try:
-                    future = asyncio.get_running_loop().run_in_executor(
-                        executor,
-                        _read_in_worker,
-                        str(self.root),
-                        object_path,
-                        expected_object_hash,
-                        tenant_id,
-                    )
+                    future = asyncio.get_running_loop().run_in_executor(executor, fn, *args)
                     async with asyncio.timeout(operation_timeout_seconds):
                         return await asyncio.shield(future)
                 except BrokenProcessPool:
                     if attempt:
-                        raise RawObjectWorkerError("raw user reader pool crashed twice")
+                        raise RawObjectWorkerError(f"{label} user reader pool crashed twice")
                     await self._replace_executor("user", executor)
                 except TimeoutError as exc:
                     release_slot = False
                     self._drain_slot_when_done(future, self._user_read_slots)
-                    raise RawObjectWorkerError("raw user read exceeded its deadline") from exc
+                    if on_abandoned is not None:
+                        future.add_done_callback(on_abandoned)
+                    raise RawObjectWorkerError(f"{label} user read exceeded its deadline") from exc
                 except asyncio.CancelledError:
                     release_slot = False
                     self._drain_slot_when_done(future, self._user_read_slots)
+                    if on_abandoned is not None:
+                        future.add_done_callback(on_abandoned)
                     raise
             raise AssertionError("unreachable")
         finally:
@@ -411,6 +606,11 @@ class RawObjectWorkerPool:
 _pool: RawObjectWorkerPool | None = None
 
 
+def _env_read_transfer() -> str:
+    raw = os.getenv("LONGHOUSE_STORAGE_RAW_READ_TRANSFER", "").strip().lower()
+    return raw if raw in RAW_READ_TRANSFERS else "shared_memory"
+
+
 def get_raw_object_worker_pool() -> RawObjectWorkerPool:
     global _pool
     if _pool is None or _pool._closed:
@@ -420,6 +620,8 @@ def get_raw_object_worker_pool() -> RawObjectWorkerPool:
             repair_workers=_env_positive_int("LONGHOUSE_STORAGE_RAW_REPAIR_WORKERS", 1),
             user_read_workers=_env_positive_int("LONGHOUSE_STORAGE_RAW_READ_WORKERS", 1),
             queue_multiplier=_env_positive_int("LONGHOUSE_STORAGE_RAW_QUEUE_MULTIPLIER", 2),
+            read_transfer=_env_read_transfer(),
+            shared_memory_min_bytes=_env_positive_int("LONGHOUSE_STORAGE_RAW_SHARED_MEMORY_MIN_BYTES", 2 * 1024 * 1024),
         )
     return _pool
 
@@ -432,6 +634,7 @@ async def close_raw_object_worker_pool() -> None:
 
 
 __all__ = [
+    "RawObjectRecords",
     "RawObjectWorkerBusy",
     "RawObjectWorkerError",
     "RawObjectWorkerPool",
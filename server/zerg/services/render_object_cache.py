@@ -0,0 +1,150 @@
+"""Byte-bounded cache of decoded render objects in the API process.
+
+Every session-detail page read sends its render objects to a worker process
+that reads, verifies, zstd-decodes and JSON-parses them, then pickles the
+decoded object back. Render objects are immutable and content-addressed, so the
+tail page of an active session is the same object for every tab, SSE tick and
+mobile-tail poll. This cache keeps decoded objects by ``object_hash``:
+
+- entries never go stale, so eviction is the only removal;
+- the budget counts decoded JSON payload bytes, which tracks the resident size
+  of the decoded records closely enough to bound memory;
+- concurrent misses for one hash share a single worker read.
+
+Only user-lane reads fill the cache. Background repair and projector scans walk
+whole sessions once and would otherwise evict the pages people are looking at;
+they still reuse entries the user lane already decoded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from collections.abc import Awaitable
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from zerg.services.byte_budget_lru import ByteBudgetCacheStats
+from zerg.services.byte_budget_lru import ByteBudgetLRU
+from zerg.storage_v2.render_objects import DecodedRenderObject
+
+RENDER_OBJECT_CACHE_MAX_BYTES = int(os.getenv("LONGHOUSE_RENDER_OBJECT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
+
+@dataclass(frozen=True)
+class _RenderObjectCacheEntry:
+    decoded: DecodedRenderObject
+    decode_seconds: float
+
+
+@dataclass(frozen=True)
+class RenderObjectCacheStats(ByteBudgetCacheStats):
+    joined: int
+    decode_seconds_saved: float
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.joined + self.misses
+        return (self.hits + self.joined) / lookups if lookups else 0.0
+
+
+class DecodedRenderObjectCache(ByteBudgetLRU[str, _RenderObjectCacheEntry]):
+    def __init__(self, *, max_bytes: int = RENDER_OBJECT_CACHE_MAX_BYTES) -> None:
+        super().__init__(max_bytes=max_bytes, on_resize=_record_cache_size)
+        # Guards the in-flight reads and the counters below; taken before the
+        # LRU's own lock, never after it.
+        self._inflight_lock = threading.Lock()
+        # object hash -> the worker read every concurrent miss awaits.
+        self._inflight: dict[str, asyncio.Task[tuple[DecodedRenderObject, float]]] = {}
+        self._joined = 0
+        self._decode_seconds_saved = 0.0
+
+    async def load(
+        self,
+        object_hash: str,
+        loader: Callable[[], Awaitable[tuple[DecodedRenderObject, float]]],
+        *,
+        fill: bool = True,
+    ) -> DecodedRenderObject:
+        """Return the decoded object for ``object_hash``, reading it at most once.
+
+        ``loader`` performs the worker read and returns the decoded object with
+        the seconds the read took. It runs in its own task, so a cancelled
+        caller does not fail the other callers waiting on the same hash.
+        """
+
+        if not self.enabled:
+            decoded, _seconds = await loader()
+            return decoded
+        entry = None
+        with self._inflight_lock:
+            task = self._inflight.get(object_hash)
+            if task is not None:
+                outcome = "joined"
+                self._joined += 1
+            else:
+                entry = self.get(object_hash)
+                if entry is not None:
+                    self._decode_seconds_saved += entry.decode_seconds
+                else:
+                    outcome = "miss"
+                    task = asyncio.ensure_future(loader())
+                    self._inflight[object_hash] = task
+                    task.add_done_callback(lambda done, key=object_hash: self._finish(key, done, fill=fill))
+        if entry is not None:
+            _record_cache_lookup("hit", saved_seconds=entry.decode_seconds)
+            return entry.decoded
+        _record_cache_lookup(outcome)
+        decoded, _seconds = await asyncio.shield(task)
+        return decoded
+
+    def _finish(self, object_hash: str, task: asyncio.Task[tuple[DecodedRenderObject, float]], *, fill: bool) -> None:
+        with self._inflight_lock:
+            if self._inflight.get(object_hash) is task:
+                del self._inflight[object_hash]
+            if not fill or task.cancelled() or task.exception() is not None:
+                return
+            decoded, seconds = task.result()
+            entry = _RenderObjectCacheEntry(decoded=decoded, decode_seconds=seconds)
+            self.put(object_hash, entry, size_bytes=max(1, int(decoded.payload_size)))
+
+    def stats(self) -> RenderObjectCacheStats:
+        with self._inflight_lock:
+            base = super().stats()
+            return RenderObjectCacheStats(
+                **vars(base),
+                joined=self._joined,
+                decode_seconds_saved=self._decode_seconds_saved,
+            )
+
+
+def _record_cache_lookup(outcome: str, *, saved_seconds: float = 0.0) -> None:
+    from zerg.metrics import render_object_cache_decode_seconds_saved_total
+    from zerg.metrics import render_object_cache_lookups_total
+
+    render_object_cache_lookups_total.labels(outcome=outcome).inc()
+    if saved_seconds:
+        render_object_cache_decode_seconds_saved_total.inc(saved_seconds)
+
+
+def _record_cache_size(resident_bytes: int, entries: int) -> None:
+    from zerg.metrics import render_object_cache_entries
+    from zerg.metrics import render_object_cache_resident_bytes
+
+    render_object_cache_resident_bytes.set(resident_bytes)
+    render_object_cache_entries.set(entries)
+
+
+_cache = DecodedRenderObjectCache()
+
+
+def get_decoded_render_object_cache() -> DecodedRenderObjectCache:
+    return _cache
+
+
+__all__ = [
+    "DecodedRenderObjectCache",
+    "RenderObjectCacheStats",
+    "get_decoded_render_object_cache",
+]
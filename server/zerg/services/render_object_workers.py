@@ -5,17 +5,24 @@ from __future__ import annotations
 import asyncio
 import multiprocessing
 import os
+import threading
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures.process import BrokenProcessPool
 from contextlib import asynccontextmanager
 from pathlib import Path
+from time import monotonic
 from typing import Any
 
 from zerg.services.raw_object_workers import storage_v2_root
+from zerg.services.render_object_cache import DecodedRenderObjectCache
+from zerg.services.render_object_cache import get_decoded_render_object_cache
 from zerg.storage_v2.render_objects import DecodedRenderObject
+from zerg.storage_v2.render_objects import RenderObjectFilterIndex
 from zerg.storage_v2.render_objects import RenderObjectSpec
 from zerg.storage_v2.render_objects import SealedRenderObject
+from zerg.storage_v2.render_objects import read_render_filter_index
 from zerg.storage_v2.render_objects import read_render_object
 from zerg.storage_v2.render_objects import seal_render_object
 
@@ -49,6 +56,11 @@ def _env_positive_int(name: str, default: int) -> int:
     return max(1, value)
 
 
+# Filter indexes are small and immutable, so the pool keeps recently read ones
+# by object hash; filtered pages consult one per manifest object.
+_FILTER_INDEX_CACHE_ENTRIES = 4096
+
+
 class RenderObjectWorkerPool:
     def __init__(
         self,
@@ -58,6 +70,7 @@ class RenderObjectWorkerPool:
         repair_workers: int = 1,
         user_read_workers: int = 2,
         queue_multiplier: int = 2,
+        decoded_cache: DecodedRenderObjectCache | None = None,
     ) -> None:
         if live_workers < 1 or repair_workers < 1 or user_read_workers < 1 or queue_multiplier < 1:
             raise ValueError("render worker counts and queue multiplier must be positive")
@@ -75,6 +88,9 @@ class RenderObjectWorkerPool:
         self._user_read_executor = self._new_executor(user_read_workers)
         self._replace_lock = asyncio.Lock()
         self._slot_drainers: set[asyncio.Task[None]] = set()
+        self._decoded_cache = decoded_cache
+        self._filter_indexes: OrderedDict[str, RenderObjectFilterIndex] = OrderedDict()
+        self._filter_index_lock = threading.Lock()
         self._closed = False
 
     @staticmethod
@@ -174,6 +190,32 @@ class RenderObjectWorkerPool:
             raise RenderObjectWorkerError("render worker pool is closed")
         if lane not in {"user", "background"}:
             raise ValueError("render read lane must be user or background")
+
+        async def read_from_worker() -> tuple[DecodedRenderObject, float]:
+            started = monotonic()
+            decoded = await self._read_in_lane(
+                object_path,
+                expected_object_hash,
+                lane=lane,
+                queue_timeout_seconds=queue_timeout_seconds,
+                operation_timeout_seconds=operation_timeout_seconds,
+            )
+            return decoded, monotonic() - started
+
+        if self._decoded_cache is None:
+            decoded, _seconds = await read_from_worker()
+            return decoded
+        return await self._decoded_cache.load(expected_object_hash, read_from_worker, fill=lane == "user")
+
+    async def _read_in_lane(
+        self,
+        object_path: str,
+        expected_object_hash: str,
+        *,
+        lane: str,
+        queue_timeout_seconds: float,
+        operation_timeout_seconds: float,
+    ) -> DecodedRenderObject:
         slots = self._user_read_slots if lane == "user" else self._repair_slots
         try:
             async with asyncio.timeout(queue_timeout_seconds):
@@ -211,6 +253,44 @@ class RenderObjectWorkerPool:
             if release_slot:
                 slots.release()
 
+    async def read_filter_indexes(self, items: list[tuple[str, str]]) -> list[RenderObjectFilterIndex | None]:
+        """Return the sidecar filter index for each ``(object_path, object_hash)``.
+
+        None marks an object without a usable index; callers decode it instead.
+        """
+
+        if self._closed:
+            raise RenderObjectWorkerError("render worker pool is closed")
+        results: list[RenderObjectFilterIndex | None] = [None] * len(items)
+        missing: list[int] = []
+        with self._filter_index_lock:
+            for position, (_object_path, object_hash) in enumerate(items):
+                index = self._filter_indexes.get(object_hash)
+                if index is None:
+                    missing.append(position)
+                    continue
+                self._filter_indexes.move_to_end(object_hash)
+                results[position] = index
+        if not missing:
+            return results
+
+        def read_missing() -> list[RenderObjectFilterIndex | None]:
+            return [
+                read_render_filter_index(self.root, items[position][0], expected_object_hash=items[position][1]) for position in missing
+            ]
+
+        loaded = await asyncio.to_thread(read_missing)
+        with self._filter_index_lock:
+            for position, index in zip(missing, loaded, strict=True):
+                results[position] = index
+                if index is None:
+                    continue
+                self._filter_indexes[index.object_hash] = index
+                self._filter_indexes.move_to_end(index.object_hash)
+            while len(self._filter_indexes) > _FILTER_INDEX_CACHE_ENTRIES:
+                self._filter_indexes.popitem(last=False)
+        return results
+
     def _drain_slot_when_done(self, future: asyncio.Future[Any], slots: asyncio.Semaphore) -> None:
         async def drain() -> None:
             try:
@@ -268,6 +348,7 @@ def get_render_object_worker_pool() -> RenderObjectWorkerPool:
             repair_workers=_env_positive_int("LONGHOUSE_STORAGE_RENDER_REPAIR_WORKERS", 1),
             user_read_workers=_env_positive_int("LONGHOUSE_STORAGE_RENDER_READ_WORKERS", 2),
             queue_multiplier=_env_positive_int("LONGHOUSE_STORAGE_RENDER_QUEUE_MULTIPLIER", 2),
+            decoded_cache=get_decoded_render_object_cache(),
         )
     return _pool
 
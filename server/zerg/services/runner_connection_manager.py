@@ -2,13 +2,20 @@
 
 Maintains a registry of active runner connections and provides methods
 for routing messages to runners.
+
+The sockets live in one process. In a multi-worker Runtime Host that is the
+control process, which publishes the connected runner keys on the
+``runner_connections`` pubsub topic after every change; HTTP workers follow
+the topic so ``is_online``/``get_online_count`` answer the same there.
 """
 
 from __future__ import annotations
 
 import logging
+from typing import AbstractSet
 from typing import Any
 from typing import Dict
+from typing import Mapping
 from typing import Optional
 from typing import Tuple
 
@@ -16,6 +23,8 @@ from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+RUNNER_CONNECTIONS_TOPIC = "runner_connections"
+
 
 class RunnerConnectionManager:
     """Singleton manager for runner WebSocket connections.
@@ -28,6 +37,29 @@ class RunnerConnectionManager:
         """Initialize the connection manager."""
         # Key: (owner_id, runner_id), Value: WebSocket connection
         self._connections: Dict[Tuple[int, int], WebSocket] = {}
+        self._publish_snapshots = False
+        # Set in HTTP workers: the control process's connected runner keys.
+        self._mirror: Optional[frozenset[Tuple[int, int]]] = None
+
+    def enable_snapshot_publishing(self) -> None:
+        """Publish connection snapshots for HTTP workers, starting with the current one."""
+        self._publish_snapshots = True
+        self.publish_snapshot()
+
+    def apply_snapshot(self, payload: Mapping[str, Any]) -> None:
+        """Replace the mirrored connections with a snapshot from the control process."""
+        self._mirror = frozenset((int(owner_id), int(runner_id)) for owner_id, runner_id in payload.get("connections") or ())
+
+    def publish_snapshot(self) -> None:
+        if not self._publish_snapshots:
+            return
+        from zerg.services.session_pubsub import get_pubsub
+
+        connections = [[owner_id, runner_id] for owner_id, runner_id in self._connections]
+        get_pubsub().publish(RUNNER_CONNECTIONS_TOPIC, {"kind": "runner_connections_snapshot", "connections": connections})
+
+    def _online_keys(self) -> AbstractSet[Tuple[int, int]]:
+        return self._mirror if self._mirror is not None else self._connections.keys()
 
     def register(self, owner_id: int, runner_id: int, ws: WebSocket) -> None:
         """Register a new runner connection.
@@ -44,6 +76,7 @@ class RunnerConnectionManager:
             logger.warning(f"Replacing existing connection for runner {runner_id} (owner {owner_id})")
 
         self._connections[key] = ws
+        self.publish_snapshot()
         logger.info(f"Registered runner {runner_id} (owner {owner_id})")
 
     def unregister(self, owner_id: int, runner_id: int, ws: WebSocket) -> bool:
@@ -61,6 +94,7 @@ class RunnerConnectionManager:
         key = (owner_id, runner_id)
         if key in self._connections and self._connections[key] is ws:
             del self._connections[key]
+            self.publish_snapshot()
             logger.info(f"Unregistered runner {runner_id} (owner {owner_id})")
             return True
         return False
@@ -89,7 +123,7 @@ class RunnerConnectionManager:
             True if the runner is connected, False otherwise
         """
         key = (owner_id, runner_id)
-        return key in self._connections
+        return key in self._online_keys()
 
     async def send_to_runner(self, owner_id: int, runner_id: int, message: Dict[str, Any]) -> bool:
         """Send a JSON message to a runner.
@@ -126,10 +160,11 @@ class RunnerConnectionManager:
         Returns:
             Number of online runners
         """
+        keys = self._online_keys()
         if owner_id is None:
-            return len(self._connections)
+            return len(keys)
 
-        return sum(1 for (oid, _) in self._connections.keys() if oid == owner_id)
+        return sum(1 for (oid, _) in keys if oid == owner_id)
 
 
 # Global singleton instance
@@ -146,3 +181,10 @@ def get_runner_connection_manager() -> RunnerConnectionManager:
     if _manager_instance is None:
         _manager_instance = RunnerConnectionManager()
     return _manager_instance
+
+
+async def follow_runner_connection_snapshots() -> None:
+    """Keep this HTTP worker's runner presence mirror in step with the control process."""
+    from zerg.services.control_snapshots import follow_snapshots
+
+    await follow_snapshots(RUNNER_CONNECTIONS_TOPIC, get_runner_connection_manager().apply_snapshot)
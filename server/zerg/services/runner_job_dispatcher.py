@@ -3,11 +3,20 @@
 Handles dispatching jobs to runners and tracking pending completions.
 Manages concurrency control to ensure runners don't get overloaded.
 
-IMPORTANT: The dispatcher uses thread-safe primitives (threading.Event)
-instead of asyncio.Future because dispatch_job may be called from a
-tool thread (via _run_coro_sync) while complete_job is called from
-the main event loop's WebSocket handler. Using asyncio.Future would
-cause the completion signal to be lost across event loop boundaries.
+Runners advertise how many jobs they execute at once (``max_concurrent_jobs``
+in their hello metadata); runners that predate the field get one slot. A
+dispatch that finds every slot busy waits in the runner's queue, FIFO per
+dispatching run and round-robin across runs, so one agent run fanning out
+commands cannot starve the others. Runners belong to a single owner, so the
+run is the finest fairness unit the dispatcher sees; dispatches without a run
+fall back to their owner.
+
+IMPORTANT: dispatch_job may be called from a tool thread's event loop (via
+_run_coro_sync) while complete_job is called from the main event loop's
+WebSocket handler. Dispatcher state sits behind threading locks, and every
+wake-up is delivered to the waiting future's own loop with
+``call_soon_threadsafe``, so completion and slot-grant signals cannot be lost
+across event loop boundaries. Waiters no longer park an executor thread each.
 """
 
 from __future__ import annotations
@@ -15,7 +24,11 @@ from __future__ import annotations
 import asyncio
 import logging
 import threading
+import time
+from collections import OrderedDict
+from collections import deque
 from dataclasses import dataclass
+from dataclasses import field
 from datetime import timedelta
 from typing import Any
 from typing import Dict
@@ -24,6 +37,10 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from zerg.crud import runner_crud
+from zerg.metrics import runner_job_dispatch_total
+from zerg.metrics import runner_job_dispatch_wait_seconds
+from zerg.metrics import runner_job_queue_depth
+from zerg.metrics import runner_job_slots
 from zerg.services.runner_connection_manager import get_runner_connection_manager
 from zerg.utils.time import utc_now_naive
 
@@ -31,6 +48,32 @@ logger = logging.getLogger(__name__)
 
 _STALE_ACTIVE_JOB_GRACE_SECS = 10
 
+DEFAULT_RUNNER_SLOTS = 1
+MAX_RUNNER_SLOTS = 64
+MAX_QUEUED_JOBS_PER_RUNNER = 256
+
+
+def runner_slots_from_metadata(metadata: object) -> int:
+    """Return the job slots a runner advertised in its hello metadata."""
+    value = metadata.get("max_concurrent_jobs") if isinstance(metadata, dict) else None
+    if type(value) is not int or value < 1:
+        return DEFAULT_RUNNER_SLOTS
+    return min(value, MAX_RUNNER_SLOTS)
+
+
+def _set_if_pending(future: asyncio.Future, value: Any) -> None:
+    if not future.done():
+        future.set_result(value)
+
+
+def _resolve_future(future: asyncio.Future, value: Any) -> None:
+    """Resolve ``future`` on its own loop; safe from any thread or loop."""
+    try:
+        future.get_loop().call_soon_threadsafe(_set_if_pending, future, value)
+    except RuntimeError:
+        # The waiter's loop already closed; nobody is left to wake.
+        pass
+
 
 @dataclass
 class PendingJob:
@@ -38,13 +81,62 @@ class PendingJob:
 
     event: threading.Event
     result: Optional[Dict[str, Any]] = None
+    future: Optional[asyncio.Future] = None
+
+    def resolve(self, result: Dict[str, Any]) -> None:
+        self.result = result
+        self.event.set()
+        if self.future is not None:
+            _resolve_future(self.future, result)
+
+
+@dataclass(eq=False)
+class _SlotWaiter:
+    fairness_key: str
+    future: asyncio.Future
+    granted: bool = False
+
+
+@dataclass
+class _RunnerSlots:
+    capacity: int = DEFAULT_RUNNER_SLOTS
+    connected: bool = False
+    # Slots in use: active jobs plus slots granted to dispatches that have not
+    # created their job record yet.
+    held: int = 0
+    active: Dict[str, None] = field(default_factory=dict)
+    queues: "OrderedDict[str, deque[_SlotWaiter]]" = field(default_factory=OrderedDict)
+    queued: int = 0
+
+    def pop_next_waiter(self) -> _SlotWaiter | None:
+        # Round-robin across fairness keys, FIFO within a key.
+        while self.queues:
+            key, waiters = next(iter(self.queues.items()))
+            waiter = waiters.popleft()
+            self.queued -= 1
+            if waiters:
+                self.queues.move_to_end(key)
+            else:
+                del self.queues[key]
+            if not waiter.future.done():
+                return waiter
+        return None
+
+    def remove_waiter(self, waiter: _SlotWaiter) -> None:
+        waiters = self.queues.get(waiter.fairness_key)
+        if waiters is None or waiter not in waiters:
+            return
+        waiters.remove(waiter)
+        self.queued -= 1
+        if not waiters:
+            del self.queues[waiter.fairness_key]
 
 
 class RunnerJobDispatcher:
     """Dispatches jobs to runners and tracks pending completions.
 
-    Implements concurrency control to ensure each runner only processes
-    one job at a time (v1 limitation).
+    Each runner runs up to its advertised number of jobs at once; further
+    dispatches queue fairly for the next free slot.
 
     Uses thread-safe primitives for cross-event-loop signaling.
     """
@@ -56,10 +148,65 @@ class RunnerJobDispatcher:
         self._pending_jobs: Dict[str, PendingJob] = {}
         self._pending_lock = threading.Lock()
 
-        # Track active job per runner for concurrency control
-        # Key: runner_id (int), Value: job_id (UUID string)
-        self._runner_active_jobs: Dict[int, str] = {}
-        self._runner_active_jobs_lock = threading.Lock()
+        # Slot accounting and queued dispatches per runner
+        # Key: runner_id (int), Value: _RunnerSlots
+        self._runner_slots: Dict[int, _RunnerSlots] = {}
+        self._runner_slots_lock = threading.Lock()
+
+    def _slots(self, runner_id: int) -> _RunnerSlots:
+        state = self._runner_slots.get(runner_id)
+        if state is None:
+            state = self._runner_slots[runner_id] = _RunnerSlots()
+        return state
+
+    def _grant_free_slots(self, state: _RunnerSlots) -> list[_SlotWaiter]:
+        """Hand free slots to queued dispatches. Caller holds the slots lock."""
+        granted: list[_SlotWaiter] = []
+        while state.held < state.capacity and state.queued:
+            waiter = state.pop_next_waiter()
+            if waiter is None:
+                break
+            waiter.granted = True
+            state.held += 1
+            granted.append(waiter)
+        return granted
+
+    def _wake(self, waiters: list[_SlotWaiter], value: bool) -> None:
+        for waiter in waiters:
+            _resolve_future(waiter.future, value)
+        self._publish_metrics()
+
+    def _publish_metrics(self) -> None:
+        with self._runner_slots_lock:
+            states = [state for state in self._runner_slots.values() if state.connected]
+            queued = sum(state.queued for state in self._runner_slots.values())
+        runner_job_queue_depth.set(queued)
+        runner_job_slots.labels(state="total").set(sum(state.capacity for state in states))
+        runner_job_slots.labels(state="in_use").set(sum(state.held for state in states))
+
+    def set_runner_slots(self, runner_id: int, slots: int) -> None:
+        """Record a connected runner's advertised job slots."""
+        with self._runner_slots_lock:
+            state = self._slots(runner_id)
+            state.capacity = max(1, min(int(slots), MAX_RUNNER_SLOTS))
+            state.connected = True
+            granted = self._grant_free_slots(state)
+        self._wake(granted, True)
+
+    def runner_disconnected(self, runner_id: int) -> None:
+        """Fail dispatches queued on a runner whose connection went away.
+
+        Active jobs keep their slots until they complete or are reclaimed.
+        """
+        abandoned: list[_SlotWaiter] = []
+        with self._runner_slots_lock:
+            state = self._runner_slots.get(runner_id)
+            if state is None:
+                return
+            state.connected = False
+            while (waiter := state.pop_next_waiter()) is not None:
+                abandoned.append(waiter)
+        self._wake(abandoned, False)
 
     def can_accept_job(self, runner_id: int) -> bool:
         """Check if a runner can accept a new job.
@@ -68,57 +215,91 @@ class RunnerJobDispatcher:
             runner_id: ID of the runner
 
         Returns:
-            True if runner has no active jobs, False if busy
+            True if runner has a free slot and nothing queued, False if busy
         """
-        with self._runner_active_jobs_lock:
-            return runner_id not in self._runner_active_jobs
+        with self._runner_slots_lock:
+            state = self._runner_slots.get(runner_id)
+            return state is None or (state.held < state.capacity and not state.queued)
 
     def get_active_job_id(self, runner_id: int) -> str | None:
-        """Return the active job ID for a runner, if any."""
-        with self._runner_active_jobs_lock:
-            return self._runner_active_jobs.get(runner_id)
+        """Return the oldest active job ID for a runner, if any."""
+        with self._runner_slots_lock:
+            state = self._runner_slots.get(runner_id)
+            return next(iter(state.active), None) if state is not None else None
+
+    def get_active_job_ids(self, runner_id: int) -> list[str]:
+        """Return the runner's active job IDs, oldest first."""
+        with self._runner_slots_lock:
+            state = self._runner_slots.get(runner_id)
+            return list(state.active) if state is not None else []
 
     def mark_job_active(self, runner_id: int, job_id: str) -> None:
-        """Mark a job as active on a runner.
+        """Mark a job as active on a runner, taking one of its slots.
 
         Args:
             runner_id: ID of the runner
             job_id: UUID of the job
         """
-        with self._runner_active_jobs_lock:
-            self._runner_active_jobs[runner_id] = job_id
+        with self._runner_slots_lock:
+            state = self._slots(runner_id)
+            if job_id not in state.active:
+                state.active[job_id] = None
+                state.held += 1
+        self._publish_metrics()
         logger.debug(f"Marked job {job_id} as active on runner {runner_id}")
 
     def clear_active_job(self, runner_id: int, *, expected_job_id: str | None = None) -> str | None:
-        """Clear the active job for a runner.
+        """Clear an active job for a runner and hand its slot to the queue.
 
         Args:
             runner_id: ID of the runner
             expected_job_id: Optional job ID guard. When provided, only clear
-                the slot if the runner is still active on that specific job.
+                the slot if the runner is still active on that specific job;
+                otherwise the oldest active job is cleared.
         """
-        with self._runner_active_jobs_lock:
-            current_job_id = self._runner_active_jobs.get(runner_id)
-            if current_job_id is None:
+        with self._runner_slots_lock:
+            state = self._runner_slots.get(runner_id)
+            if state is None or not state.active:
                 return None
-            if expected_job_id is not None and current_job_id != expected_job_id:
+            if expected_job_id is not None and expected_job_id not in state.active:
                 return None
-            job_id = self._runner_active_jobs.pop(runner_id, None)
-        if job_id:
-            logger.debug(f"Cleared active job {job_id} from runner {runner_id}")
+            job_id = expected_job_id if expected_job_id is not None else next(iter(state.active))
+            del state.active[job_id]
+            state.held = max(0, state.held - 1)
+            granted = self._grant_free_slots(state)
+        self._wake(granted, True)
+        logger.debug(f"Cleared active job {job_id} from runner {runner_id}")
         return job_id
 
+    def _try_reserve_slot(self, runner_id: int) -> bool:
+        with self._runner_slots_lock:
+            state = self._slots(runner_id)
+            if state.held >= state.capacity or state.queued:
+                return False
+            state.held += 1
+        self._publish_metrics()
+        return True
+
+    def _release_slot(self, runner_id: int) -> None:
+        """Return a reserved slot that never got a job bound to it."""
+        with self._runner_slots_lock:
+            state = self._slots(runner_id)
+            state.held = max(0, state.held - 1)
+            granted = self._grant_free_slots(state)
+        self._wake(granted, True)
+
+    def _bind_reserved_slot(self, runner_id: int, job_id: str) -> None:
+        with self._runner_slots_lock:
+            self._slots(runner_id).active[job_id] = None
+        logger.debug(f"Marked job {job_id} as active on runner {runner_id}")
+
     def _drop_pending_job(self, job_id: str) -> PendingJob | None:
         """Remove and return a pending job entry, if present."""
         with self._pending_lock:
             return self._pending_jobs.pop(job_id, None)
 
-    def _reclaim_stale_active_job(self, db: Session | None, runner_id: int) -> bool:
+    def _reclaim_stale_active_job(self, db: Session | None, runner_id: int, job_id: str) -> bool:
         """Reclaim an active runner slot if its tracked job is terminal or stale."""
-        job_id = self.get_active_job_id(runner_id)
-        if not job_id:
-            return False
-
         job = runner_crud.get_job(db, job_id)
         if job is None:
             self._drop_pending_job(job_id)
@@ -155,6 +336,60 @@ class RunnerJobDispatcher:
         )
         return True
 
+    async def _acquire_slot(self, db: Session | None, runner_id: int, *, fairness_key: str, timeout_secs: int) -> str | None:
+        """Hold one of the runner's slots, queueing if all are busy.
+
+        Returns None once a slot is held, or the error message for the caller.
+        """
+        if self._try_reserve_slot(runner_id):
+            runner_job_dispatch_total.labels(outcome="immediate").inc()
+            return None
+
+        # Every slot is busy: first reclaim slots whose jobs ended or timed out
+        # without the runner telling us.
+        reclaimed = False
+        for job_id in self.get_active_job_ids(runner_id):
+            reclaimed = self._reclaim_stale_active_job(db, runner_id, job_id) or reclaimed
+        if reclaimed and self._try_reserve_slot(runner_id):
+            logger.info("Recovered runner %s from stale active-job state before dispatch", runner_id)
+            runner_job_dispatch_total.labels(outcome="immediate").inc()
+            return None
+
+        waiter = _SlotWaiter(fairness_key, asyncio.get_running_loop().create_future())
+        with self._runner_slots_lock:
+            state = self._slots(runner_id)
+            if state.queued >= MAX_QUEUED_JOBS_PER_RUNNER:
+                runner_job_dispatch_total.labels(outcome="queue_full").inc()
+                return "Runner is busy and its job queue is full"
+            state.queues.setdefault(fairness_key, deque()).append(waiter)
+            state.queued += 1
+            # A slot may have freed between the reserve attempt and enqueueing.
+            granted = self._grant_free_slots(state)
+        self._wake(granted, True)
+        runner_job_dispatch_total.labels(outcome="queued").inc()
+
+        try:
+            connected = await asyncio.wait_for(waiter.future, timeout=timeout_secs)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            with self._runner_slots_lock:
+                state = self._slots(runner_id)
+                if waiter.granted:
+                    # Granted as we gave up: pass the slot on.
+                    state.held = max(0, state.held - 1)
+                    granted = self._grant_free_slots(state)
+                else:
+                    state.remove_waiter(waiter)
+                    granted = []
+            self._wake(granted, True)
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            runner_job_dispatch_total.labels(outcome="queue_timeout").inc()
+            return f"Runner is busy; no job slot freed within {timeout_secs} seconds"
+        if not connected:
+            runner_job_dispatch_total.labels(outcome="offline").inc()
+            return "Runner is offline"
+        return None
+
     async def dispatch_job(
         self,
         db: Session | None,
@@ -172,29 +407,20 @@ class RunnerJobDispatcher:
             owner_id: ID of the user owning the job
             runner_id: ID of the runner to execute on
             command: Shell command to execute
-            timeout_secs: Maximum execution time in seconds
+            timeout_secs: Maximum execution time in seconds; also bounds the
+                wait for a free runner slot
             correlation_id: Optional request correlation ID
-            run_id: Optional run ID for correlation
+            run_id: Optional run ID for correlation and queue fairness
 
         Returns:
             Result dictionary with success/error envelope
         """
-        # Check if runner can accept a job
-        if not self.can_accept_job(runner_id):
-            if self._reclaim_stale_active_job(db, runner_id):
-                logger.info("Recovered runner %s from stale active-job state before dispatch", runner_id)
-            else:
-                return {
-                    "ok": False,
-                    "error": {
-                        "type": "execution_error",
-                        "message": "Runner is busy with another job",
-                    },
-                }
+        requested_at = time.monotonic()
 
         # Get runner connection
         connection_manager = get_runner_connection_manager()
         if not connection_manager.is_online(owner_id, runner_id):
+            runner_job_dispatch_total.labels(outcome="offline").inc()
             return {
                 "ok": False,
                 "error": {
@@ -203,26 +429,45 @@ class RunnerJobDispatcher:
                 },
             }
 
-        # Create job record
-        job = runner_crud.create_runner_job(
-            db=db,
-            owner_id=owner_id,
-            runner_id=runner_id,
-            command=command,
+        # Wait for one of the runner's slots
+        slot_error = await self._acquire_slot(
+            db,
+            runner_id,
+            fairness_key=f"run:{run_id}" if run_id else f"owner:{owner_id}",
             timeout_secs=timeout_secs,
-            correlation_id=correlation_id,
-            run_id=run_id,
         )
+        if slot_error is not None:
+            return {
+                "ok": False,
+                "error": {
+                    "type": "execution_error",
+                    "message": slot_error,
+                },
+            }
+
+        try:
+            # Create job record
+            job = runner_crud.create_runner_job(
+                db=db,
+                owner_id=owner_id,
+                runner_id=runner_id,
+                command=command,
+                timeout_secs=timeout_secs,
+                correlation_id=correlation_id,
+                run_id=run_id,
+            )
 
-        # Mark job as running
-        runner_crud.update_job_started(db, job.id)
+            # Mark job as running
+            runner_crud.update_job_started(db, job.id)
+        except BaseException:
+            self._release_slot(runner_id)
+            raise
 
-        # Mark runner as busy
-        self.mark_job_active(runner_id, job.id)
+        # Bind the held slot to the job
+        self._bind_reserved_slot(runner_id, job.id)
 
-        # Create thread-safe pending job for tracking completion
-        # This allows cross-event-loop signaling between tool threads and the main loop
-        pending = PendingJob(event=threading.Event())
+        # Completion may arrive on another loop; the future is resolved on ours.
+        pending = PendingJob(event=threading.Event(), future=asyncio.get_running_loop().create_future())
         with self._pending_lock:
             self._pending_jobs[job.id] = pending
 
@@ -253,16 +498,15 @@ class RunnerJobDispatcher:
                         "message": "Failed to send command to runner",
                     },
                 }
+            runner_job_dispatch_wait_seconds.observe(time.monotonic() - requested_at)
 
-            # Wait for completion with timeout (thread-safe)
+            # Wait for completion with timeout
             # Add extra buffer to timeout to account for network latency
             wait_timeout = timeout_secs + 5
 
-            # Use run_in_executor to wait on threading.Event without blocking event loop
-            loop = asyncio.get_running_loop()
-            completed = await loop.run_in_executor(None, lambda: pending.event.wait(timeout=wait_timeout))
-
-            if not completed:
+            try:
+                result = await asyncio.wait_for(pending.future, timeout=wait_timeout)
+            except asyncio.TimeoutError:
                 # Job timed out waiting for response
                 self._drop_pending_job(job.id)
                 self.clear_active_job(runner_id, expected_job_id=job.id)
@@ -275,9 +519,9 @@ class RunnerJobDispatcher:
                     },
                 }
 
-            # Event was set - return the result
+            # Completion arrived - return the result
             self._drop_pending_job(job.id)
-            return pending.result or {
+            return result or {
                 "ok": False,
                 "error": {"type": "execution_error", "message": "No result received"},
             }
@@ -332,18 +576,17 @@ class RunnerJobDispatcher:
         if runner_id is not None:
             cleared_job_id = self.clear_active_job(runner_id, expected_job_id=job_id)
             if cleared_job_id is None:
-                active_job_id = self.get_active_job_id(runner_id)
-                if active_job_id is not None:
+                active_job_ids = self.get_active_job_ids(runner_id)
+                if active_job_ids:
                     logger.warning(
                         "Received completion for job %s on runner %s, but runner is active on %s",
                         job_id,
                         runner_id,
-                        active_job_id,
+                        ", ".join(active_job_ids),
                     )
 
         if pending:
-            pending.result = result
-            pending.event.set()  # Signal completion after freeing the runner
+            pending.resolve(result)  # Signal completion after freeing the runner slot
             logger.debug(f"Completed job {job_id}")
         else:
             logger.warning(f"complete_job called for unknown job {job_id}")
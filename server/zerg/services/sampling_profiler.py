@@ -0,0 +1,416 @@
+"""Always-on sampling profiler for the API process.
+
+A daemon thread snapshots every other thread's Python stack with
+``sys._current_frames()`` at a fixed rate and folds the stacks into rolling
+time buckets, so "where is this host's CPU going" is answered from the last
+few minutes of samples instead of attaching py-spy by hand. Stacks are kept
+in folded form (``frame;frame;frame count``), the input flamegraph tools and
+speedscope read directly.
+
+Samples carry tags so one route or writer can be isolated:
+
+- ``thread:<name>`` for every sample (trailing pool indexes dropped);
+- ``route:<METHOD path>`` when the stack passes through a registered route
+  endpoint, which covers async handlers on the loop thread and sync handlers
+  on threadpool workers alike without per-request bookkeeping;
+- ``writer:<serializer>/<label>`` when the thread is a write serializer's
+  active worker.
+
+Overhead is bounded three ways: threads parked in a known wait are counted
+as idle without walking their stacks, each bucket keeps a fixed number of
+distinct stacks (the rest fold into ``[other]``), and the sampling interval
+stretches whenever the sampler's own CPU time exceeds its budget. Under
+``serve --workers N`` only the control process profiles itself: it runs the
+write serializers the ``writer:`` tags name, and the HTTP workers forward
+every ``/admin/profiler`` request to it.
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+from types import CodeType
+from types import FrameType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_INTERVAL_MS = 20.0
+_DEFAULT_WINDOW_SECONDS = 300.0
+_DEFAULT_MAX_OVERHEAD = 0.01
+_BUCKET_SECONDS = 10.0
+_MAX_STACK_DEPTH = 64
+_MAX_WALK_DEPTH = 256
+_MAX_STACKS_PER_BUCKET = 4096
+_OTHER_STACK = ("[other]",)
+
+# Leaf frames of threads blocked waiting for work rather than running code.
+_IDLE_LEAVES = frozenset(
+    {
+        ("threading.py", "wait"),
+        ("threading.py", "_wait_for_tstate_lock"),
+        ("selectors.py", "select"),
+        ("queue.py", "get"),
+        ("thread.py", "_worker"),
+        ("socket.py", "accept"),
+        ("runners.py", "run"),
+    }
+)
+_THREAD_INDEX_SUFFIX = re.compile(r"[-_ ]?\d+(?:_\d+)*$")
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "on"}
+
+
+def _frame_label(code: CodeType) -> str:
+    filename = code.co_filename
+    marker = filename.rfind("/zerg/")
+    if marker >= 0:
+        filename = filename[marker + 1 :]
+    else:
+        filename = os.path.basename(filename)
+    return f"{code.co_qualname} ({filename}:{code.co_firstlineno})"
+
+
+def _iter_endpoints(routes: Iterable[Any], prefix: str) -> Iterable[tuple[str, str, Any]]:
+    for route in routes:
+        effective = getattr(route, "effective_route_contexts", None)
+        if effective is not None:
+            # Lazily included FastAPI routers resolve their routes' full paths.
+            for context in effective():
+                if context.endpoint is not None:
+                    methods = getattr(context.original_route, "methods", None)
+                    yield ",".join(sorted(methods or ())) or "WS", prefix + context.path, context.endpoint
+            continue
+        path = prefix + (getattr(route, "path", None) or "")
+        endpoint = getattr(route, "endpoint", None)
+        if endpoint is not None:
+            yield ",".join(sorted(getattr(route, "methods", None) or ())) or "WS", path, endpoint
+            continue
+        # Mounted sub-applications (the /api app) expose their own routes.
+        yield from _iter_endpoints(getattr(route, "routes", None) or (), path)
+
+
+def _thread_group(name: str) -> str:
+    return _THREAD_INDEX_SUFFIX.sub("", name) or name
+
+
+@dataclass(frozen=True, slots=True)
+class _StackKey:
+    thread: str
+    route: str | None
+    writer: str | None
+    frames: tuple[str, ...]
+
+    def tags(self) -> tuple[str, ...]:
+        tags = [f"thread:{self.thread}"]
+        if self.route is not None:
+            tags.append(f"route:{self.route}")
+        if self.writer is not None:
+            tags.append(f"writer:{self.writer}")
+        return tuple(tags)
+
+    def folded(self) -> str:
+        return ";".join((*self.tags(), *self.frames))
+
+
+@dataclass(slots=True)
+class _Bucket:
+    started_at: float
+    stacks: Counter
+    samples: int = 0
+    idle_samples: int = 0
+    dropped_samples: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class ProfileWindow:
+    """Stacks merged over a slice of the rolling window."""
+
+    stacks: Counter
+    samples: int
+    idle_samples: int
+    dropped_samples: int
+    started_at: float | None
+    ended_at: float | None
+
+    def folded(self) -> str:
+        return "".join(f"{key.folded()} {count}\n" for key, count in self.stacks.most_common())
+
+    def summary(self, *, limit: int = 25) -> dict[str, Any]:
+        self_counts: Counter = Counter()
+        total_counts: Counter = Counter()
+        tag_counts: Counter = Counter()
+        for key, count in self.stacks.items():
+            if key.frames:
+                self_counts[key.frames[-1]] += count
+            for frame in set(key.frames):
+                total_counts[frame] += count
+            for tag in key.tags():
+                tag_counts[tag] += count
+        busy = sum(self.stacks.values()) or 1
+        return {
+            "samples": self.samples,
+            "busy_samples": sum(self.stacks.values()),
+            "idle_samples": self.idle_samples,
+            "dropped_samples": self.dropped_samples,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
+            "top_self": [
+                {"frame": frame, "samples": count, "percent": round(100.0 * count / busy, 2)}
+                for frame, count in self_counts.most_common(limit)
+            ],
+            "top_total": [
+                {"frame": frame, "samples": count, "percent": round(100.0 * count / busy, 2)}
+                for frame, count in total_counts.most_common(limit)
+            ],
+            "tags": [{"tag": tag, "samples": count} for tag, count in tag_counts.most_common(limit)],
+        }
+
+
+class SamplingProfiler:
+    def __init__(
+        self,
+        *,
+        interval_ms: float = _DEFAULT_INTERVAL_MS,
+        window_seconds: float = _DEFAULT_WINDOW_SECONDS,
+        max_overhead: float = _DEFAULT_MAX_OVERHEAD,
+        clock=time.time,
+    ) -> None:
+        self._base_interval = max(interval_ms, 1.0) / 1000.0
+        self._interval = self._base_interval
+        self._max_overhead = max(max_overhead, 0.0001)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets: deque[_Bucket] = deque(maxlen=max(1, int(window_seconds // _BUCKET_SECONDS)))
+        self._labels: dict[CodeType, str] = {}
+        self._routes: dict[CodeType, str] = {}
+        self._thread_names: dict[int, str] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._sampler_cpu_seconds = 0.0
+        self._sampler_started_at: float | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def register_routes(self, routes: Iterable[Any]) -> None:
+        """Tag samples passing through these routes' endpoint functions."""
+
+        mapping: dict[CodeType, str] = {}
+        for methods, path, endpoint in _iter_endpoints(routes, ""):
+            code = getattr(inspect.unwrap(endpoint), "__code__", None)
+            if code is not None:
+                mapping.setdefault(code, f"{methods} {path}")
+        with self._lock:
+            self._routes = mapping
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._sampler_cpu_seconds = 0.0
+        self._sampler_started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self) -> None:
+        cost_ewma = 0.0
+        while not self._stop.wait(self._interval):
+            started = time.thread_time()
+            try:
+                self.sample_once()
+            except Exception:  # pragma: no cover - the sampler must never take the process down
+                logger.exception("Sampling profiler sample failed")
+            cost = time.thread_time() - started
+            self._sampler_cpu_seconds += cost
+            cost_ewma = cost if cost_ewma == 0.0 else cost_ewma * 0.9 + cost * 0.1
+            # Stretch the interval until sampling costs at most the budget.
+            self._interval = max(self._base_interval, cost_ewma / self._max_overhead)
+
+    def _writer_tags(self) -> dict[int, str]:
+        from zerg.services.write_serializer import get_live_write_serializer
+        from zerg.services.write_serializer import get_write_serializer
+
+        tags: dict[int, str] = {}
+        for serializer in (get_write_serializer(), get_live_write_serializer()):
+            thread_id = serializer.active_worker_thread_id
+            if thread_id is not None and serializer.writer_active:
+                tags[thread_id] = f"{serializer.name}/{serializer.active_label or 'unlabeled'}"
+        return tags
+
+    def _thread_name(self, thread_id: int) -> str:
+        name = self._thread_names.get(thread_id)
+        if name is None:
+            self._thread_names = {thread.ident: _thread_group(thread.name) for thread in threading.enumerate() if thread.ident is not None}
+            name = self._thread_names.get(thread_id, "unknown")
+        return name
+
+    def _label(self, code: CodeType) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = _frame_label(code)
+        return label
+
+    def _stack_key(self, thread_id: int, frame: FrameType, writer: str | None) -> _StackKey:
+        frames: list[str] = []
+        route: str | None = None
+        routes = self._routes
+        depth = 0
+        current: FrameType | None = frame
+        while current is not None and depth < _MAX_WALK_DEPTH:
+            code = current.f_code
+            if depth < _MAX_STACK_DEPTH:
+                frames.append(self._label(code))
+            if route is None:
+                route = routes.get(code)
+            current = current.f_back
+            depth += 1
+        frames.reverse()
+        return _StackKey(self._thread_name(thread_id), route, writer, tuple(frames))
+
+    def sample_once(self) -> None:
+        """Record one sample of every thread except the sampler itself."""
+
+        own_id = threading.get_ident()
+        writers = self._writer_tags()
+        keys: list[_StackKey] = []
+        idle = 0
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+            code = frame.f_code
+            if (os.path.basename(code.co_filename), code.co_name) in _IDLE_LEAVES:
+                idle += 1
+                continue
+            keys.append(self._stack_key(thread_id, frame, writers.get(thread_id)))
+        self._record(keys, idle)
+
+    def _record(self, keys: list[_StackKey], idle: int) -> None:
+        now = self._clock()
+        with self._lock:
+            bucket = self._buckets[-1] if self._buckets else None
+            if bucket is None or now - bucket.started_at >= _BUCKET_SECONDS:
+                bucket = _Bucket(started_at=now - (now % _BUCKET_SECONDS), stacks=Counter())
+                self._buckets.append(bucket)
+            bucket.samples += len(keys) + idle
+            bucket.idle_samples += idle
+            for key in keys:
+                if key not in bucket.stacks and len(bucket.stacks) >= _MAX_STACKS_PER_BUCKET:
+                    bucket.dropped_samples += 1
+                    key = _StackKey(key.thread, key.route, key.writer, _OTHER_STACK)
+                bucket.stacks[key] += 1
+
+    def window(self, *, seconds: float | None = None, tag: str | None = None) -> ProfileWindow:
+        """Merge buckets from the last ``seconds`` keeping stacks carrying ``tag``."""
+
+        window_seconds = self._buckets.maxlen * _BUCKET_SECONDS
+        cutoff = self._clock() - (window_seconds if seconds is None else min(seconds, window_seconds))
+        stacks: Counter = Counter()
+        samples = idle = dropped = 0
+        started_at = ended_at = None
+        with self._lock:
+            buckets = [bucket for bucket in self._buckets if bucket.started_at + _BUCKET_SECONDS > cutoff]
+            for bucket in buckets:
+                for key, count in bucket.stacks.items():
+                    if tag is None or tag in key.tags():
+                        stacks[key] += count
+                samples += bucket.samples
+                idle += bucket.idle_samples
+                dropped += bucket.dropped_samples
+        if buckets:
+            started_at = buckets[0].started_at
+            ended_at = buckets[-1].started_at + _BUCKET_SECONDS
+        return ProfileWindow(stacks, samples, idle, dropped, started_at, ended_at)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def status(self) -> dict[str, Any]:
+        elapsed = time.monotonic() - self._sampler_started_at if self._sampler_started_at is not None and self.running else 0.0
+        return {
+            "running": self.running,
+            "pid": os.getpid(),
+            "interval_ms": round(self._interval * 1000.0, 3),
+            "base_interval_ms": round(self._base_interval * 1000.0, 3),
+            "window_seconds": self._buckets.maxlen * _BUCKET_SECONDS,
+            "bucket_seconds": _BUCKET_SECONDS,
+            "max_overhead": self._max_overhead,
+            "overhead": round(self._sampler_cpu_seconds / elapsed, 5) if elapsed > 0 else 0.0,
+            "routes_tagged": len(self._routes),
+        }
+
+
+_profiler: SamplingProfiler | None = None
+
+
+def get_sampling_profiler() -> SamplingProfiler:
+    global _profiler
+    if _profiler is None:
+        _profiler = SamplingProfiler(
+            interval_ms=_env_float("LONGHOUSE_PROFILER_INTERVAL_MS", _DEFAULT_INTERVAL_MS),
+            window_seconds=_env_float("LONGHOUSE_PROFILER_WINDOW_SECONDS", _DEFAULT_WINDOW_SECONDS),
+            max_overhead=_env_float("LONGHOUSE_PROFILER_MAX_OVERHEAD", _DEFAULT_MAX_OVERHEAD),
+        )
+    return _profiler
+
+
+def start_sampling_profiler(routes: Iterable[Any] = ()) -> SamplingProfiler | None:
+    """Start the process profiler unless ``LONGHOUSE_PROFILER`` disables it.
+
+    Routes are registered either way so an admin can start it later.
+    """
+
+    profiler = get_sampling_profiler()
+    profiler.register_routes(routes)
+    if not _env_bool("LONGHOUSE_PROFILER", True):
+        return None
+    profiler.start()
+    return profiler
+
+
+def stop_sampling_profiler() -> None:
+    if _profiler is not None:
+        _profiler.stop()
+
+
+__all__ = [
+    "ProfileWindow",
+    "SamplingProfiler",
+    "get_sampling_profiler",
+    "start_sampling_profiler",
+    "stop_sampling_profiler",
+]
@@ -43,9 +43,12 @@ def searchd_paths() -> tuple[Path, Path]:
 class SearchdSupervisor:
     """Keep searchd available without making it part of hot readiness."""
 
-    def __init__(self, *, database_path: Path, socket_path: Path) -> None:
+    def __init__(self, *, database_path: Path, socket_path: Path, spawn: bool = True) -> None:
         self.database_path = database_path
         self.socket_path = socket_path
+        # Attach-only in the HTTP workers of a multi-worker host; the control
+        # process owns the searchd lifecycle and its status file.
+        self.spawn = spawn
         self.status_path = socket_path.with_name("searchd-status.json")
         # Search and worklog are user-facing all-history reads with a five-second
         # hard budget. Keep supervisor health probes on the generic one-second
@@ -74,7 +77,7 @@ class SearchdSupervisor:
         keeps restarting searchd while the Runtime Host serves hot paths.
         """
 
-        if self._task is None or self._task.done():
+        if self.spawn and (self._task is None or self._task.done()):
             self._stopping = False
             self._task = asyncio.create_task(self._run(), name="searchd-supervisor")
         deadline = asyncio.get_running_loop().time() + readiness_timeout_seconds
@@ -229,6 +232,8 @@ class SearchdSupervisor:
         )
 
     def _write_status(self, status: str, *, log_transition: bool = True, **details: Any) -> None:
+        if not self.spawn:
+            return
         if log_transition:
             self._log_status_transition(status, details)
         self.status_path.parent.mkdir(parents=True, exist_ok=True)
@@ -282,11 +287,11 @@ class SearchdSupervisor:
 _supervisor: SearchdSupervisor | None = None
 
 
-async def start_searchd_supervisor() -> dict[str, Any] | None:
+async def start_searchd_supervisor(*, spawn: bool = True) -> dict[str, Any] | None:
     global _supervisor
     if _supervisor is None:
         database_path, socket_path = searchd_paths()
-        _supervisor = SearchdSupervisor(database_path=database_path, socket_path=socket_path)
+        _supervisor = SearchdSupervisor(database_path=database_path, socket_path=socket_path, spawn=spawn)
     return await _supervisor.start()
 
 
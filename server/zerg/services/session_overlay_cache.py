@@ -0,0 +1,220 @@
+"""Process-local overlay cache for session workspace reads.
+
+Every workspace fetch and SSE-driven refetch used to reload six per-session
+overlays (runtime state, pause request, hot catalog projection, managed
+control, provisional preview, pending response turn) even when nothing about
+the session had changed since the previous tick. This cache keeps the loaded
+overlay bundle per session id so refreshes of an active, unchanged session are
+dictionary lookups.
+
+The cache is never authority. An entry is reused only while all of these hold:
+
+- no ``session:{id}`` publication has happened since it was loaded. Every
+  writer that changes overlay state already publishes to that topic so SSE
+  subscribers refetch; ``SessionPubsub.publish`` drops the entry first, so the
+  refetch that publication triggers reads fresh state;
+- the session's durable workspace revision fingerprint is unchanged, which
+  covers archive writes that land without a publication;
+- its TTL has not elapsed, which bounds staleness for any remaining write
+  path and for pause requests that expire with no write at all.
+
+A load that races an invalidation is returned to its caller but not stored.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from time import monotonic
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+from zerg.utils.time import normalize_utc
+
+SESSION_OVERLAY_CACHE_TTL_SECONDS = float(os.getenv("LONGHOUSE_SESSION_OVERLAY_CACHE_TTL_SECONDS", "2"))
+SESSION_OVERLAY_CACHE_MAX_SESSIONS = int(os.getenv("LONGHOUSE_SESSION_OVERLAY_CACHE_MAX_SESSIONS", "1024"))
+
+
+@dataclass(frozen=True)
+class SessionOverlay:
+    """Workspace-visible overlay state for one session."""
+
+    runtime_state: Any | None
+    pause_request: dict[str, Any] | None
+    archive_state: str
+    control_state: Any | None
+    transcript_preview: Any | None
+    has_pending_response_turn: bool
+    # Wall-clock instant after which the overlay is wrong without any write,
+    # e.g. an active pause request reaching its expiry.
+    valid_until: datetime | None = None
+
+
+@dataclass(frozen=True)
+class _SessionOverlayCacheEntry:
+    scope: str
+    revision: str
+    expires_at: float
+    overlay: SessionOverlay
+
+
+def detach_orm_row(row: Any | None) -> Any | None:
+    """Copy a mapped row's column values into a new transient instance.
+
+    Cached rows outlive the request session that loaded them, and that
+    session may expire them on commit. A transient copy keeps the same class
+    (callers dispatch on it) without holding any session state.
+    """
+
+    if row is None or sa_inspect(row).transient:
+        return row
+    mapper = sa_inspect(type(row))
+    return type(row)(**{attr.key: getattr(row, attr.key) for attr in mapper.column_attrs})
+
+
+def session_overlay_scope(db: Session) -> str:
+    bind = db.get_bind()
+    bind_url = getattr(bind, "url", None)
+    return str(bind_url) if bind_url is not None else f"bind:{id(bind)}"
+
+
+class SessionOverlayCache:
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = SESSION_OVERLAY_CACHE_TTL_SECONDS,
+        max_sessions: int = SESSION_OVERLAY_CACHE_MAX_SESSIONS,
+    ) -> None:
+        self._ttl_seconds = max(0.0, float(ttl_seconds))
+        self._max_sessions = max(0, int(max_sessions))
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[UUID, _SessionOverlayCacheEntry] = OrderedDict()
+        # session id -> token of the load currently allowed to store it.
+        self._loading: dict[UUID, object] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds > 0 and self._max_sessions > 0
+
+    def load(
+        self,
+        *,
+        scope: str,
+        revision: str,
+        session_ids: Iterable[UUID],
+        loader: Callable[[list[UUID]], dict[UUID, SessionOverlay]],
+        now: datetime,
+    ) -> dict[UUID, SessionOverlay]:
+        """Return overlays for ``session_ids``, loading only the misses.
+
+        ``loader`` receives the missing ids and must return an overlay for
+        every one of them.
+        """
+
+        requested = list(dict.fromkeys(session_ids))
+        if not self.enabled:
+            return loader(requested) if requested else {}
+
+        result: dict[UUID, SessionOverlay] = {}
+        missing: list[UUID] = []
+        tokens: dict[UUID, object] = {}
+        now_utc = normalize_utc(now)
+        clock = monotonic()
+        with self._lock:
+            for session_id in requested:
+                entry = self._entries.get(session_id)
+                if entry is not None and self._entry_current(entry, scope=scope, revision=revision, clock=clock, now=now_utc):
+                    self._entries.move_to_end(session_id)
+                    result[session_id] = entry.overlay
+                    continue
+                if entry is not None:
+                    del self._entries[session_id]
+                token = object()
+                self._loading[session_id] = token
+                tokens[session_id] = token
+                missing.append(session_id)
+        if not missing:
+            return result
+
+        try:
+            loaded = loader(missing)
+        except BaseException:
+            self._release(tokens)
+            raise
+        expires_at = monotonic() + self._ttl_seconds
+        with self._lock:
+            for session_id, token in tokens.items():
+                overlay = loaded.get(session_id)
+                if self._loading.get(session_id) is not token:
+                    continue
+                del self._loading[session_id]
+                if overlay is None:
+                    continue
+                self._entries[session_id] = _SessionOverlayCacheEntry(
+                    scope=scope,
+                    revision=revision,
+                    expires_at=expires_at,
+                    overlay=overlay,
+                )
+                self._entries.move_to_end(session_id)
+            while len(self._entries) > self._max_sessions:
+                self._entries.popitem(last=False)
+        result.update(loaded)
+        return result
+
+    def invalidate(self, session_id: UUID | str) -> None:
+        try:
+            key = session_id if isinstance(session_id, UUID) else UUID(str(session_id))
+        except ValueError:
+            return
+        with self._lock:
+            self._entries.pop(key, None)
+            self._loading.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._loading.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _release(self, tokens: dict[UUID, object]) -> None:
+        with self._lock:
+            for session_id, token in tokens.items():
+                if self._loading.get(session_id) is token:
+                    del self._loading[session_id]
+
+    @staticmethod
+    def _entry_current(
+        entry: _SessionOverlayCacheEntry,
+        *,
+        scope: str,
+        revision: str,
+        clock: float,
+        now: datetime | None,
+    ) -> bool:
+        if entry.scope != scope or entry.revision != revision or entry.expires_at <= clock:
+            return False
+        valid_until = normalize_utc(entry.overlay.valid_until)
+        return valid_until is None or now is None or now < valid_until
+
+
+_cache = SessionOverlayCache()
+
+
+def get_session_overlay_cache() -> SessionOverlayCache:
+    return _cache
+
+
+def invalidate_session_overlay(session_id: UUID | str) -> None:
+    _cache.invalidate(session_id)
@@ -13,9 +13,12 @@ Payloads are small JSON-serializable dicts. SSE loops translate them to
 frame-specific shapes. Bounded queues drop-oldest to keep a slow subscriber
 from blocking publishers; the drop count surfaces via Prometheus.
 
-This is a process-local pubsub. Multi-worker deployments need a cross-worker
-fan-out path (Redis, Postgres LISTEN, etc.) before this helps at scale;
-today's Longhouse runtime is single-worker so that's fine.
+By default this is a process-local pubsub. A multi-worker deployment
+attaches a transport (``zerg.services.pubsub_fanout``) that sends every
+publish to the ``zerg.pubsubd`` broker; the broker assigns the per-topic
+``seq`` and hands the numbered message back to every worker through
+``deliver``, so buffers, replay and ``replay_gap`` agree across workers for
+every topic they hold subscribers on.
 """
 
 from __future__ import annotations
@@ -29,6 +32,9 @@ from dataclasses import field
 from datetime import datetime
 from datetime import timezone
 from typing import Any
+from typing import Protocol
+
+from zerg.services.session_overlay_cache import invalidate_session_overlay
 
 logger = logging.getLogger(__name__)
 
@@ -67,8 +73,14 @@ class _TopicState:
     next_seq: int = 1
 
 
+class PubsubTransport(Protocol):
+    """Cross-process publish path; numbered messages come back via ``deliver``."""
+
+    def send(self, topic: str, payload: dict[str, Any]) -> None: ...
+
+
 class SessionPubsub:
-    """Process-local topic pubsub with per-topic replay buffer.
+    """Topic pubsub with per-topic replay buffer.
 
     Thread-unsafe; intended for use from the asyncio event loop. All
     subscribe/publish/unsubscribe calls must be made from the same loop.
@@ -78,16 +90,74 @@ class SessionPubsub:
         self._topics: dict[str, _TopicState] = defaultdict(_TopicState)
         self._subscriber_queue_size = subscriber_queue_size
         self._buffer_size = buffer_size
+        self._transport: PubsubTransport | None = None
+
+    # ---------------------------------------------------------------- transport
+    def attach_transport(self, transport: PubsubTransport | None) -> None:
+        """Route publishes through ``transport`` (or back to local delivery for None)."""
+        self._transport = transport
+
+    @property
+    def buffer_size(self) -> int:
+        return self._buffer_size
+
+    def reset_sequences(self, *, buffer_size: int | None = None) -> None:
+        """Forget every topic's buffer and seq; subscribers stay attached.
+
+        Called when the broker's seq space restarts, so later cursors are judged
+        against the new space instead of this process's stale one. The broker
+        also dictates the ring size so every worker retains the same window.
+        """
+        if buffer_size is not None:
+            self._buffer_size = buffer_size
+        for state in self._topics.values():
+            state.buffer = deque(maxlen=self._buffer_size)
+            state.next_seq = 1
+
+    def subscribed_topics(self) -> list[str]:
+        """Topics with at least one live subscriber in this process."""
+        return [topic for topic, state in self._topics.items() if state.subscribers]
 
     # ------------------------------------------------------------------ publish
-    def publish(self, topic: str, payload: dict[str, Any]) -> int:
-        """Publish a message to a topic. Returns the assigned seq."""
+    def publish(self, topic: str, payload: dict[str, Any]) -> int | None:
+        """Publish a message to a topic. Returns the assigned seq.
+
+        With a transport attached the broker assigns the seq and the message
+        reaches local subscribers through ``deliver``; this returns None.
+        """
+        transport = self._transport
+        if transport is not None:
+            transport.send(topic, payload)
+            return None
+        state = self._state(topic)
+        return self._append(state, PubsubMessage(seq=state.next_seq, topic=topic, payload=payload))
+
+    def deliver(self, topic: str, seq: int, payload: dict[str, Any]) -> bool:
+        """Apply a broker-numbered message. Returns False for a seq already held."""
+        state = self._state(topic)
+        if seq < state.next_seq:
+            return False
+        if seq > state.next_seq and state.buffer:
+            # The seqs in between never reached this process (the broker only
+            # replays subscribed topics), so the ring restarts here and older
+            # cursors get ``replay_gap`` instead of a silently partial replay.
+            state.buffer.clear()
+        self._append(state, PubsubMessage(seq=seq, topic=topic, payload=payload))
+        return True
+
+    def _state(self, topic: str) -> _TopicState:
         state = self._topics[topic]
         if state.buffer.maxlen != self._buffer_size:
             # First-touch sizing for defaultdict-created states.
             state.buffer = deque(state.buffer, maxlen=self._buffer_size)
-        msg = PubsubMessage(seq=state.next_seq, topic=topic, payload=payload)
-        state.next_seq += 1
+        return state
+
+    def _append(self, state: _TopicState, msg: PubsubMessage) -> int:
+        if msg.topic.startswith(_SESSION_TOPIC_PREFIX):
+            # Subscribers refetch the workspace on this wake; drop the cached
+            # overlays first so that refetch reads the write being announced.
+            invalidate_session_overlay(msg.topic[len(_SESSION_TOPIC_PREFIX) :])
+        state.next_seq = msg.seq + 1
         state.buffer.append(msg)
 
         for sub in list(state.subscribers):
@@ -250,8 +320,11 @@ def reset_pubsub_for_test() -> None:
     _bus = None
 
 
+_SESSION_TOPIC_PREFIX = "session:"
+
+
 def topic_session(session_id: str) -> str:
-    return f"session:{session_id}"
+    return f"{_SESSION_TOPIC_PREFIX}{session_id}"
 
 
 TOPIC_TIMELINE = "timeline"
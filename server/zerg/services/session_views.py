@@ -1838,6 +1838,18 @@ class CursorRoleBackfillResponse(BaseModel):
     message: str = ""
 
 
+class UsageLedgerBackfillResponse(BaseModel):
+    """Response for one batch of the usage-ledger backfill."""
+
+    dry_run: bool
+    scanned: int = 0
+    folded: int = 0
+    skipped: int = 0
+    unreadable: int = 0
+    next_after_envelope_id: Optional[str] = None
+    message: str = ""
+
+
 class IngestHealthResponse(UTCBaseModel):
     status: str  # "ok" | "stale" | "unknown"
     last_session_at: Optional[datetime] = None
@@ -18,6 +18,10 @@ from zerg.services.agents.kernel_capabilities import project_capabilities_bulk
 from zerg.services.managed_control_state import load_managed_control_state_map
 from zerg.services.provisional_events import load_active_provisional_preview_map
 from zerg.services.session_kernel_projection import project_session_lineage_fields
+from zerg.services.session_overlay_cache import SessionOverlay
+from zerg.services.session_overlay_cache import detach_orm_row
+from zerg.services.session_overlay_cache import get_session_overlay_cache
+from zerg.services.session_overlay_cache import session_overlay_scope
 from zerg.services.session_pause_requests import load_active_pause_request_map
 from zerg.services.session_pause_requests import load_hot_session_projection_map
 from zerg.services.session_pause_requests import serialize_pause_request_projection
@@ -210,22 +214,14 @@ def build_session_workspace(
     thread_cache = store.batch_thread_meta(thread_sessions)
     now = datetime.now(timezone.utc)
     with timing.span("load_runtime"):
-        with timing.span("runtime_state"):
-            runtime_state_map = load_runtime_state_map(db, thread_session_ids)
-        with timing.span("pause_requests"):
-            pause_request_map = load_active_pause_request_map(db, thread_session_ids)
-            hot_projection_map = load_hot_session_projection_map(thread_session_ids)
-        with timing.span("control_state"):
-            control_state_map = load_managed_control_state_map(db, thread_session_ids)
-        with timing.span("provisional_preview"):
-            transcript_preview_map = _load_provisional_preview_map(
-                db,
-                thread_sessions=thread_sessions,
-                runtime_state_map=runtime_state_map,
-                now=now,
-            )
-        with timing.span("pending_turns"):
-            pending_response_turn_map = load_pending_response_turn_map(db, thread_session_ids)
+        overlays = _load_session_overlays(
+            db,
+            sessions=_overlay_sessions(thread_sessions, session),
+            workspace_revision=workspace_revision,
+            now=now,
+            timing=timing,
+        )
+        runtime_state_map = _runtime_state_map(overlays)
         with timing.span("kernel_capabilities"):
             kernel_capabilities_map = project_capabilities_bulk(db, session_ids=thread_session_ids)
     with timing.span("build_thread_responses"):
@@ -242,17 +238,13 @@ def build_session_workspace(
                     now=now,
                 ),
                 first_user_message=first_user_map.get(item.id),
-                control_overlay=control_state_map.get(item.id),
-                transcript_preview=transcript_preview_map.get(str(item.id)),
+                control_overlay=overlays[item.id].control_state,
+                transcript_preview=overlays[item.id].transcript_preview,
                 owner_id=owner_id,
                 kernel_capabilities=kernel_capabilities_map.get(item.id),
-                has_pending_response_turn=bool(pending_response_turn_map.get(item.id)),
-                pause_request=(
-                    hot_projection_map[item.id][0]
-                    if item.id in hot_projection_map
-                    else serialize_pause_request_projection(pause_request_map.get(item.id))
-                ),
-                archive_state=(hot_projection_map[item.id][1] if item.id in hot_projection_map else "current"),
+                has_pending_response_turn=overlays[item.id].has_pending_response_turn,
+                pause_request=overlays[item.id].pause_request,
+                archive_state=overlays[item.id].archive_state,
                 launch_readiness=(live_readiness if item.id == session.id else None),
                 sharer=sharer,
             )
@@ -273,17 +265,13 @@ def build_session_workspace(
                 now=now,
             ),
             first_user_message=first_user_map.get(session.id),
-            control_overlay=control_state_map.get(session.id),
-            transcript_preview=transcript_preview_map.get(str(session.id)),
+            control_overlay=overlays[session.id].control_state,
+            transcript_preview=overlays[session.id].transcript_preview,
             owner_id=owner_id,
             kernel_capabilities=kernel_capabilities_map.get(session.id),
-            has_pending_response_turn=bool(pending_response_turn_map.get(session.id)),
-            pause_request=(
-                hot_projection_map[session.id][0]
-                if session.id in hot_projection_map
-                else serialize_pause_request_projection(pause_request_map.get(session.id))
-            ),
-            archive_state=(hot_projection_map[session.id][1] if session.id in hot_projection_map else "current"),
+            has_pending_response_turn=overlays[session.id].has_pending_response_turn,
+            pause_request=overlays[session.id].pause_request,
+            archive_state=overlays[session.id].archive_state,
             launch_readiness=live_readiness,
             sharer=sharer,
         )
@@ -456,22 +444,14 @@ def build_session_mobile_tail(
     thread_cache = store.batch_thread_meta(thread_sessions)
     now = datetime.now(timezone.utc)
     with timing.span("load_runtime"):
-        with timing.span("runtime_state"):
-            runtime_state_map = load_runtime_state_map(db, thread_session_ids)
-        with timing.span("pause_requests"):
-            pause_request_map = load_active_pause_request_map(db, thread_session_ids)
-            hot_projection_map = load_hot_session_projection_map(thread_session_ids)
-        with timing.span("control_state"):
-            control_state_map = load_managed_control_state_map(db, thread_session_ids)
-        with timing.span("provisional_preview"):
-            transcript_preview_map = _load_provisional_preview_map(
-                db,
-                thread_sessions=thread_sessions,
-                runtime_state_map=runtime_state_map,
-                now=now,
-            )
-        with timing.span("pending_turns"):
-            pending_response_turn_map = load_pending_response_turn_map(db, thread_session_ids)
+        overlays = _load_session_overlays(
+            db,
+            sessions=_overlay_sessions(thread_sessions, session),
+            workspace_revision=workspace_revision,
+            now=now,
+            timing=timing,
+        )
+        runtime_state_map = _runtime_state_map(overlays)
 
     with timing.span("build_session"):
         session_response = build_session_response(
@@ -486,16 +466,12 @@ def build_session_mobile_tail(
                 now=now,
             ),
             first_user_message=first_user_map.get(session.id),
-            control_overlay=control_state_map.get(session.id),
-            transcript_preview=transcript_preview_map.get(str(session.id)),
+            control_overlay=overlays[session.id].control_state,
+            transcript_preview=overlays[session.id].transcript_preview,
             owner_id=owner_id,
-            pause_request=(
-                hot_projection_map[session.id][0]
-                if session.id in hot_projection_map
-                else serialize_pause_request_projection(pause_request_map.get(session.id))
-            ),
-            archive_state=(hot_projection_map[session.id][1] if session.id in hot_projection_map else "current"),
-            has_pending_response_turn=bool(pending_response_turn_map.get(session.id)),
+            pause_request=overlays[session.id].pause_request,
+            archive_state=overlays[session.id].archive_state,
+            has_pending_response_turn=overlays[session.id].has_pending_response_turn,
             launch_readiness=live_readiness,
         )
 
@@ -538,6 +514,76 @@ def _build_workspace_revision_response(revision: SessionWorkspaceRevision) -> Se
     )
 
 
+def _overlay_sessions(thread_sessions, session) -> list:
+    if any(item.id == session.id for item in thread_sessions):
+        return list(thread_sessions)
+    return [*thread_sessions, session]
+
+
+def _runtime_state_map(overlays: dict[UUID, SessionOverlay]) -> dict[str, object]:
+    return {str(session_id): overlay.runtime_state for session_id, overlay in overlays.items() if overlay.runtime_state is not None}
+
+
+def _load_session_overlays(
+    db: Session,
+    *,
+    sessions,
+    workspace_revision: SessionWorkspaceRevision,
+    now: datetime,
+    timing: ServerTimingRecorder,
+) -> dict[UUID, SessionOverlay]:
+    """Load runtime/pause/control/preview/turn overlays through the overlay cache."""
+
+    sessions_by_id = {item.id: item for item in sessions}
+
+    def load(session_ids: list[UUID]) -> dict[UUID, SessionOverlay]:
+        with timing.span("runtime_state"):
+            runtime_state_map = load_runtime_state_map(db, session_ids)
+        with timing.span("pause_requests"):
+            pause_request_map = load_active_pause_request_map(db, session_ids)
+            hot_projection_map = load_hot_session_projection_map(session_ids)
+        with timing.span("control_state"):
+            control_state_map = load_managed_control_state_map(db, session_ids)
+        with timing.span("provisional_preview"):
+            transcript_preview_map = _load_provisional_preview_map(
+                db,
+                thread_sessions=[sessions_by_id[session_id] for session_id in session_ids],
+                runtime_state_map=runtime_state_map,
+                now=now,
+            )
+        with timing.span("pending_turns"):
+            pending_response_turn_map = load_pending_response_turn_map(db, session_ids)
+
+        overlays: dict[UUID, SessionOverlay] = {}
+        for session_id in session_ids:
+            if session_id in hot_projection_map:
+                pause_request, archive_state = hot_projection_map[session_id]
+            else:
+                pause_request = serialize_pause_request_projection(pause_request_map.get(session_id))
+                archive_state = "current"
+            pause_expires_at = pause_request.get("expires_at") if isinstance(pause_request, dict) else None
+            overlays[session_id] = SessionOverlay(
+                runtime_state=detach_orm_row(runtime_state_map.get(str(session_id))),
+                pause_request=pause_request,
+                archive_state=archive_state,
+                control_state=control_state_map.get(session_id),
+                transcript_preview=transcript_preview_map.get(str(session_id)),
+                has_pending_response_turn=bool(pending_response_turn_map.get(session_id)),
+                valid_until=pause_expires_at if isinstance(pause_expires_at, datetime) else None,
+            )
+        return overlays
+
+    cache = get_session_overlay_cache()
+    with timing.span("overlay_cache"):
+        return cache.load(
+            scope=session_overlay_scope(db),
+            revision=workspace_revision.fingerprint,
+            session_ids=list(sessions_by_id),
+            loader=load,
+            now=now,
+        )
+
+
 def _load_provisional_preview_map(
     db: Session,
     *,
@@ -87,15 +87,15 @@ async def build_storage_v2_raw_export(
                 if not isinstance(item, dict):
                     raise RuntimeError("catalog returned an invalid raw-object row")
                 try:
-                    decoded = await workers.read(str(item["object_path"]), str(item["object_hash"]), str(item["tenant_id"]))
+                    async with workers.open_records(str(item["object_path"]), str(item["object_hash"]), str(item["tenant_id"])) as decoded:
+                        if decoded.envelope_id != item.get("envelope_id") or decoded.spec.session_id != session_id:
+                            raise RuntimeError("raw object does not match its catalog manifest")
+                        for data in decoded.record_data():
+                            yield data
+                            if not data.endswith(b"\n"):
+                                yield b"\n"
                 except (KeyError, RawObjectCorruptError, RawObjectWorkerError) as exc:
                     raise RuntimeError("immutable raw object could not be verified") from exc
-                if decoded.envelope_id != item.get("envelope_id") or decoded.spec.session_id != session_id:
-                    raise RuntimeError("raw object does not match its catalog manifest")
-                for record in decoded.spec.records:
-                    yield record.data
-                    if not record.data.endswith(b"\n"):
-                        yield b"\n"
             after_source_key = _source_key(objects[-1])
             if manifest.get("objects_truncated") is not True:
                 return
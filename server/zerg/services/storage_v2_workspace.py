@@ -16,11 +16,54 @@ from zerg.config import get_settings
 from zerg.routers.agents_storage_v2 import read_storage_v2_session_events_page
 from zerg.services.catalog_read_gateway import CatalogReadError
 from zerg.services.catalogd_supervisor import get_catalogd_client
+from zerg.services.event_fragments import SerializedJSON
+from zerg.services.event_fragments import get_event_fragment_cache
 from zerg.services.live_catalog_timeline import read_live_catalog_session
 from zerg.services.tool_presentation import project_tool_presentation
+from zerg.storage_v2.render_objects import RenderRecordFilter
 from zerg.utils.server_timing import ServerTimingRecorder
 
 
+def _tool_call_state(event: dict[str, object], *, closed: bool, completed_tool_call_ids: set[str]) -> str | None:
+    if not event.get("tool_name"):
+        return None
+    tool_call_id = str(event["tool_call_id"]) if event.get("tool_call_id") else None
+    return "completed" if tool_call_id in completed_tool_call_ids else ("dropped" if closed else "running")
+
+
+def _event_payload(event: dict[str, object], *, provider: str | None, tool_call_state: str | None) -> dict[str, object]:
+    return {
+        "id": str(event["event_id"]),
+        "cursor": event["cursor"],
+        "role": event["role"],
+        "content_text": event.get("content_text"),
+        "raw_content_text": None,
+        "input_origin": None,
+        "tool_name": event.get("tool_name"),
+        "tool_input_json": event.get("tool_input_json"),
+        "tool_output_text": event.get("tool_output_text"),
+        "tool_output_truncated": False,
+        "tool_output_original_chars": None,
+        "tool_call_id": str(event["tool_call_id"]) if event.get("tool_call_id") else None,
+        "tool_presentation": project_tool_presentation(
+            event.get("tool_name"),
+            event.get("tool_input_json"),
+            provider=provider,
+        ),
+        "timestamp": event["timestamp"],
+        "in_active_context": True,
+        "branch_id": None,
+        "is_head_branch": event.get("branch_kind") != "abandoned",
+        "event_origin": "durable",
+        "provisional_state": None,
+        "provisional_cursor": None,
+        "provisional_complete": False,
+        "reconciled_event_id": None,
+        "tool_call_state": tool_call_state,
+        "media_refs": [],
+    }
+
+
 def _event_projection(
     event: dict[str, object],
     *,
@@ -28,46 +71,24 @@ def _event_projection(
     closed: bool,
     provider: str | None,
     completed_tool_call_ids: set[str],
+    source: tuple[str, int] | None = None,
 ) -> dict[str, object]:
-    event_id = str(event["event_id"])
-    tool_call_id = str(event["tool_call_id"]) if event.get("tool_call_id") else None
-    tool_call_state = None
-    if event.get("tool_name"):
-        tool_call_state = "completed" if tool_call_id in completed_tool_call_ids else ("dropped" if closed else "running")
+    """Project one render event; with its ``source`` the event body comes pre-serialized."""
+
+    tool_call_state = _tool_call_state(event, closed=closed, completed_tool_call_ids=completed_tool_call_ids)
+    if source is None:
+        payload: dict[str, object] | SerializedJSON = _event_payload(event, provider=provider, tool_call_state=tool_call_state)
+    else:
+        object_hash, ordinal = source
+        payload = get_event_fragment_cache().fragment(
+            (object_hash, ordinal, provider, tool_call_state),
+            lambda: _event_payload(event, provider=provider, tool_call_state=tool_call_state),
+        )
     return {
         "kind": "event",
         "session_id": str(session_id),
         "timestamp": event["timestamp"],
-        "event": {
-            "id": event_id,
-            "cursor": event["cursor"],
-            "role": event["role"],
-            "content_text": event.get("content_text"),
-            "raw_content_text": None,
-            "input_origin": None,
-            "tool_name": event.get("tool_name"),
-            "tool_input_json": event.get("tool_input_json"),
-            "tool_output_text": event.get("tool_output_text"),
-            "tool_output_truncated": False,
-            "tool_output_original_chars": None,
-            "tool_call_id": tool_call_id,
-            "tool_presentation": project_tool_presentation(
-                event.get("tool_name"),
-                event.get("tool_input_json"),
-                provider=provider,
-            ),
-            "timestamp": event["timestamp"],
-            "in_active_context": True,
-            "branch_id": None,
-            "is_head_branch": event.get("branch_kind") != "abandoned",
-            "event_origin": "durable",
-            "provisional_state": None,
-            "provisional_cursor": None,
-            "provisional_complete": False,
-            "reconciled_event_id": None,
-            "tool_call_state": tool_call_state,
-            "media_refs": [],
-        },
+        "event": payload,
         "action": None,
         "continued_from_session_id": None,
         "continuation_kind": None,
@@ -95,6 +116,9 @@ def _workspace_envelope(
     events = page.get("events") if page is not None else []
     if not isinstance(events, list) or any(not isinstance(event, dict) for event in events):
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="The render projection is invalid.")
+    sources = page.get("event_sources") if page is not None else None
+    if sources is not None and (not isinstance(sources, list) or len(sources) != len(events)):
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="The render projection is invalid.")
     completed_tool_call_ids = {str(event["tool_call_id"]) for event in events if event.get("role") == "tool" and event.get("tool_call_id")}
     items = [
         _event_projection(
@@ -103,8 +127,9 @@ def _workspace_envelope(
             closed=session.runtime_display.lifecycle == "closed",
             provider=getattr(session, "provider", None),
             completed_tool_call_ids=completed_tool_call_ids,
+            source=sources[index] if sources is not None else None,
         )
-        for event in events
+        for index, event in enumerate(events)
     ]
     total = int(page.get("total") or 0) if page is not None else 0
     latest_event_id = str(events[-1]["event_id"]) if events else None
@@ -166,12 +191,18 @@ async def build_storage_v2_workspace(
     cursor: str | None = None,
     anchor: str = "tail",
     timing: ServerTimingRecorder | None = None,
+    record_filter: RenderRecordFilter | None = None,
+    serialized_events: bool = False,
 ) -> dict[str, object] | None:
     """Return a storage-v2 workspace, including live control-only sessions.
 
     A managed control lease is useful only if the session remains openable.  A
     provider may not yet have a transcript source, however, so its first
     workspace is allowed to be an empty, explicitly control-only projection.
+
+    With ``serialized_events`` each projection item's ``event`` is a cached
+    ``SerializedJSON`` fragment rather than a dict; the caller must render the
+    workspace with ``render_json``.
     """
 
     if branch_mode not in {"head", "all"}:
@@ -216,6 +247,8 @@ async def build_storage_v2_workspace(
             anchor=anchor,
             limit=limit,
             timing=timing,
+            record_filter=record_filter,
+            include_sources=serialized_events,
         )
     return _workspace_envelope(
         session_id=session_id,
@@ -45,6 +45,7 @@ class TimelineSessionsListResponse(UTCBaseModel):
     sessions: list[TimelineSessionCardResponse]
     total: int
     has_real_sessions: bool = True
+    next_cursor: str | None = Field(None, description="Opaque cursor for the next page; null on the last page")
 
 
 @dataclass(frozen=True)
@@ -63,6 +64,7 @@ class TimelineSessionListParams:
     mode: str | None
     context_mode: str
     include_automation: bool = False
+    cursor: str | None = None
 
     def to_agent_params(self) -> SessionListParams:
         return SessionListParams(
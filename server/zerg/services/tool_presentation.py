@@ -3,6 +3,12 @@
 Raw provider evidence stays authoritative.  This module projects a disposable,
 versioned reading lens and never mutates stored events.  Codex custom ``exec``
 wrappers are parsed with a bounded scanner; transcript text is never executed.
+
+Tool events are immutable once sealed, and a transcript page re-renders the
+same ``Bash``/``Edit``/``exec`` payloads on every view.  Projections are
+therefore memoized by a digest of the tool input, bounded by an approximate
+byte budget.  A memoized projection is shared between callers and must be
+treated as read-only.
 """
 
 from __future__ import annotations
@@ -10,17 +16,22 @@ from __future__ import annotations
 import ast
 import hashlib
 import json
+import os
 import re
 from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from zerg.services.byte_budget_lru import ByteBudgetLRU
 from zerg.services.shell_command_summary import summarize_shell_source
 
 PRESENTATION_VERSION = 2
 MAX_WRAPPER_CHARS = 200_000
 MAX_WRAPPER_CALLS = 32
 MAX_LITERAL_DEPTH = 8
+TOOL_PRESENTATION_MEMO_MAX_BYTES = int(os.getenv("LONGHOUSE_TOOL_PRESENTATION_MEMO_MAX_BYTES", str(16 * 1024 * 1024)))
+# Rough per-entry overhead of the projection dict, its children and the key.
+_MEMO_ENTRY_OVERHEAD_BYTES = 1024
 
 _IDENTIFIER = re.compile(r"[A-Za-z_$][A-Za-z0-9_$]*")
 _NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?$")
@@ -46,6 +57,7 @@ def _load_rules(path: str = str(DEFAULT_RULES_PATH)) -> dict[str, Any]:
 
 def clear_tool_presentation_cache() -> None:
     _load_rules.cache_clear()
+    _memo.clear()
 
 
 def _skip_space(text: str, index: int) -> int:
@@ -462,15 +474,7 @@ def _attach_shell_summary(projection: dict[str, Any], *, rules_path: Path) -> di
     return projection
 
 
-def project_tool_presentation(
-    tool_name: str | None,
-    tool_input_json: Any,
-    *,
-    provider: str | None = None,
-    rules_path: Path = DEFAULT_RULES_PATH,
-) -> dict[str, Any] | None:
-    if not tool_name:
-        return None
+def _project_tool_presentation(tool_name: str, tool_input_json: Any, *, is_codex: bool, rules_path: Path) -> dict[str, Any]:
     base = _base_projection(tool_name, tool_input_json, rules_path=rules_path)
     base.update(
         {
@@ -480,7 +484,6 @@ def project_tool_presentation(
             "children": [],
         }
     )
-    is_codex = str(provider or "").lower() == "codex"
     if is_codex and tool_name.lower() == "write_stdin" and isinstance(tool_input_json, dict):
         if tool_input_json.get("chars") in {None, ""}:
             base.update({"label": "Wait", "icon": "…", "color": "tertiary", "tier": "noise", "aggregate": "wait"})
@@ -538,3 +541,77 @@ def project_tool_presentation(
         "children": children,
         "rule_id": "codex:exec:multi-child:v1",
     }
+
+
+MemoKey = tuple[str, bool, str, bytes]
+
+
+class ToolPresentationMemo(ByteBudgetLRU[MemoKey, dict[str, Any]]):
+    """Approximately byte-bounded LRU of projections keyed by tool input digest."""
+
+    def __init__(self, *, max_bytes: int = TOOL_PRESENTATION_MEMO_MAX_BYTES) -> None:
+        super().__init__(max_bytes=max_bytes, on_lookup=_record_memo_lookup, on_resize=_record_memo_size)
+
+
+def _memo_key(tool_name: str, tool_input_json: Any, *, is_codex: bool, rules_path: Path) -> tuple[MemoKey, int] | None:
+    # Strings and JSON values get distinct prefixes, so the input "1" never
+    # shares an entry with the integer 1.  Inputs JSON cannot spell are not
+    # memoized rather than keyed loosely.
+    if isinstance(tool_input_json, str):
+        text = "s" + tool_input_json
+    else:
+        try:
+            text = "j" + json.dumps(tool_input_json, ensure_ascii=False, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return None
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+    return (tool_name, is_codex, str(rules_path), digest), 2 * len(text) + _MEMO_ENTRY_OVERHEAD_BYTES
+
+
+def project_tool_presentation(
+    tool_name: str | None,
+    tool_input_json: Any,
+    *,
+    provider: str | None = None,
+    rules_path: Path = DEFAULT_RULES_PATH,
+) -> dict[str, Any] | None:
+    """Project one tool call, reusing the memoized projection for identical input.
+
+    Only whether the provider is Codex affects the projection, so that flag,
+    not the provider name, is part of the key.
+    """
+
+    if not tool_name:
+        return None
+    is_codex = str(provider or "").lower() == "codex"
+    memo_key = _memo_key(tool_name, tool_input_json, is_codex=is_codex, rules_path=rules_path) if _memo.enabled else None
+    if memo_key is None:
+        return _project_tool_presentation(tool_name, tool_input_json, is_codex=is_codex, rules_path=rules_path)
+    key, size_bytes = memo_key
+    cached = _memo.get(key)
+    if cached is not None:
+        return cached
+    projection = _project_tool_presentation(tool_name, tool_input_json, is_codex=is_codex, rules_path=rules_path)
+    _memo.put(key, projection, size_bytes=size_bytes)
+    return projection
+
+
+def _record_memo_lookup(outcome: str) -> None:
+    from zerg.metrics import tool_presentation_memo_lookups_total
+
+    tool_presentation_memo_lookups_total.labels(outcome=outcome).inc()
+
+
+def _record_memo_size(resident_bytes: int, entries: int) -> None:
+    from zerg.metrics import tool_presentation_memo_entries
+    from zerg.metrics import tool_presentation_memo_resident_bytes
+
+    tool_presentation_memo_resident_bytes.set(resident_bytes)
+    tool_presentation_memo_entries.set(entries)
+
+
+_memo = ToolPresentationMemo()
+
+
+def get_tool_presentation_memo() -> ToolPresentationMemo:
+    return _memo
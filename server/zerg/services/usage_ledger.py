@@ -0,0 +1,286 @@
+"""Ingest-time token and cost extraction for the usage ledger.
+
+Provider transcripts already carry per-response token usage. Storage-v2
+extracts it once while parsing an envelope and hands the deltas to catalogd,
+which folds them into ``usage_daily_rollups`` inside the same commit
+transaction. Usage reads then touch O(days) rollup rows instead of scanning
+every assistant event.
+
+Every delta carries a ``source_key`` that names the provider response it
+meters. catalogd keeps one ledger entry per (session, source_key), so a
+response repeated across envelopes, or re-read by the backfill, is counted
+once. Pricing happens at fold time, where a Codex response whose
+``turn_context`` sat in an earlier envelope can inherit the session's model.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import unicodedata
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import UTC
+from datetime import datetime
+
+from zerg.pricing import get_usd_prices_per_1k
+from zerg.storage_v2.raw_objects import MAX_RECORDS
+
+UNKNOWN_MODEL = "unknown"
+# At most one response per raw record.
+MAX_USAGE_DELTAS = MAX_RECORDS
+USAGE_PROVIDERS = frozenset({"claude", "codex"})
+
+# Cached input is billed against the input price. Reads are 0.1x on both
+# Anthropic and OpenAI; writes are Anthropic's 5-minute cache premium.
+CACHE_READ_PRICE_FACTOR = 0.1
+CACHE_WRITE_PRICE_FACTOR = 1.25
+
+_DATED_MODEL_SUFFIX = re.compile(r"-\d{8}$")
+
+
+@dataclass(frozen=True, slots=True)
+class UsageDelta:
+    """Token usage of one provider response."""
+
+    source_key: str
+    occurred_at: datetime
+    model: str
+    input_tokens: int
+    output_tokens: int
+    cache_read_tokens: int
+    cache_write_tokens: int
+
+    @property
+    def day(self) -> str:
+        return self.occurred_at.astimezone(UTC).date().isoformat()
+
+    def to_wire(self) -> dict[str, object]:
+        return {
+            "source_key": self.source_key,
+            "day": self.day,
+            "model": self.model,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "cache_read_tokens": self.cache_read_tokens,
+            "cache_write_tokens": self.cache_write_tokens,
+        }
+
+
+def usage_cost_microusd(
+    model: str,
+    *,
+    input_tokens: int,
+    output_tokens: int,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
+) -> int:
+    """Price one response in micro-USD; unpriced models cost 0, as in ``zerg.pricing``."""
+
+    prices = get_usd_prices_per_1k(model) or get_usd_prices_per_1k(_DATED_MODEL_SUFFIX.sub("", model))
+    if prices is None:
+        return 0
+    input_per_1k, output_per_1k = prices
+    billed_input = input_tokens + cache_read_tokens * CACHE_READ_PRICE_FACTOR + cache_write_tokens * CACHE_WRITE_PRICE_FACTOR
+    return round((billed_input * input_per_1k + output_tokens * output_per_1k) * 1_000)
+
+
+def _count(value: object) -> int:
+    return value if type(value) is int and value > 0 else 0
+
+
+def _timestamp(value: object, fallback: datetime) -> datetime:
+    if isinstance(value, str) and value:
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return fallback
+        return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+    return fallback
+
+
+def _bounded_text(value: str) -> str:
+    # catalogd accepts NFC text of at most 255 UTF-8 bytes for keys and models.
+    encoded = unicodedata.normalize("NFC", value.strip()).encode("utf-8")[:255]
+    return encoded.decode("utf-8", errors="ignore")
+
+
+def _delta(
+    *,
+    source_key: str,
+    occurred_at: datetime,
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    cache_read_tokens: int,
+    cache_write_tokens: int,
+) -> UsageDelta:
+    return UsageDelta(
+        source_key=_bounded_text(source_key),
+        occurred_at=occurred_at,
+        model=_bounded_text(model) or UNKNOWN_MODEL,
+        input_tokens=input_tokens,
+        output_tokens=output_tokens,
+        cache_read_tokens=cache_read_tokens,
+        cache_write_tokens=cache_write_tokens,
+    )
+
+
+def _claude_deltas(values: Iterable[tuple[bytes, dict]], fallback: datetime) -> list[UsageDelta]:
+    # Claude writes one line per content block and repeats the message usage
+    # on each; streaming lines can carry a partial output count. Keep the
+    # largest report per message id.
+    by_message: dict[str, UsageDelta] = {}
+    for data, value in values:
+        message = value.get("message")
+        if value.get("type") != "assistant" or not isinstance(message, dict):
+            continue
+        usage = message.get("usage")
+        if not isinstance(usage, dict):
+            continue
+        model = str(message.get("model") or "")
+        if model == "<synthetic>":
+            continue
+        message_id = message.get("id")
+        source_key = f"claude:{message_id}" if isinstance(message_id, str) and message_id else f"record:{hashlib.sha256(data).hexdigest()}"
+        delta = _delta(
+            source_key=source_key,
+            occurred_at=_timestamp(value.get("timestamp"), fallback),
+            model=model,
+            input_tokens=_count(usage.get("input_tokens")),
+            output_tokens=_count(usage.get("output_tokens")),
+            cache_read_tokens=_count(usage.get("cache_read_input_tokens")),
+            cache_write_tokens=_count(usage.get("cache_creation_input_tokens")),
+        )
+        current = by_message.get(source_key)
+        if current is None or delta.output_tokens > current.output_tokens:
+            by_message[source_key] = delta
+    return list(by_message.values())
+
+
+def _codex_deltas(values: Iterable[tuple[bytes, dict]], fallback: datetime) -> list[UsageDelta]:
+    deltas: dict[str, UsageDelta] = {}
+    model = UNKNOWN_MODEL
+    for _data, value in values:
+        payload = value.get("payload")
+        if not isinstance(payload, dict):
+            continue
+        if value.get("type") == "turn_context" and isinstance(payload.get("model"), str):
+            model = payload["model"]
+            continue
+        if value.get("type") != "event_msg" or payload.get("type") != "token_count":
+            continue
+        info = payload.get("info")
+        if not isinstance(info, dict):
+            continue
+        last = info.get("last_token_usage")
+        total = info.get("total_token_usage")
+        if not isinstance(last, dict) or not isinstance(total, dict):
+            continue
+        # Codex re-emits the same token_count after some turns. The running
+        # session total only grows, so it identifies the response it closes.
+        source_key = f"codex:{_count(total.get('total_tokens'))}"
+        cached = _count(last.get("cached_input_tokens"))
+        deltas[source_key] = _delta(
+            source_key=source_key,
+            occurred_at=_timestamp(value.get("timestamp"), fallback),
+            model=model,
+            # OpenAI counts cached input inside input_tokens.
+            input_tokens=max(0, _count(last.get("input_tokens")) - cached),
+            output_tokens=_count(last.get("output_tokens")),
+            cache_read_tokens=cached,
+            cache_write_tokens=0,
+        )
+    return list(deltas.values())
+
+
+def extract_usage_deltas(
+    provider: str,
+    records: Iterable[bytes],
+    *,
+    fallback_time: datetime,
+) -> list[UsageDelta]:
+    """Return the metered provider responses in one envelope's raw records.
+
+    ``fallback_time`` dates records without a usable timestamp.
+    """
+
+    provider = provider.strip().lower()
+    if provider not in USAGE_PROVIDERS:
+        return []
+    values: list[tuple[bytes, dict]] = []
+    for data in records:
+        # Most records carry no usage; a substring test is far cheaper than
+        # decoding every tool result and transcript line.
+        if b'"usage"' not in data and b'"token_count"' not in data and b'"turn_context"' not in data:
+            continue
+        try:
+            value = json.loads(data)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            continue
+        if isinstance(value, dict):
+            values.append((data, value))
+    deltas = _claude_deltas(values, fallback_time) if provider == "claude" else _codex_deltas(values, fallback_time)
+    return [delta for delta in deltas if delta.input_tokens or delta.output_tokens or delta.cache_read_tokens or delta.cache_write_tokens]
+
+
+@dataclass(slots=True)
+class UsageBackfillResult:
+    scanned: int = 0
+    folded: int = 0
+    skipped: int = 0
+    unreadable: int = 0
+    next_after_envelope_id: str | None = None
+
+
+async def backfill_usage_ledger_batch(
+    catalog,
+    *,
+    after_envelope_id: str | None,
+    limit: int,
+    dry_run: bool,
+) -> UsageBackfillResult:
+    """Fold one page of already-committed raw objects into the usage ledger.
+
+    Ledger entries are keyed by response, so objects committed after the
+    ledger existed, and pages repeated after a crash, fold as no-ops. Loop
+    with ``next_after_envelope_id`` until it is ``None``.
+    """
+
+    from zerg.services.raw_object_workers import RawObjectWorkerError
+    from zerg.services.raw_object_workers import get_raw_object_worker_pool
+    from zerg.storage_v2.raw_objects import RawObjectCorruptError
+
+    page = await catalog.call("usage.ledger.backfill.objects.v2", {"after_envelope_id": after_envelope_id, "limit": limit})
+    objects = page.get("objects")
+    if not isinstance(objects, list):
+        raise RuntimeError("catalog returned an invalid usage backfill page")
+    result = UsageBackfillResult(scanned=len(objects), next_after_envelope_id=page.get("next_after_envelope_id"))
+    workers = get_raw_object_worker_pool()
+    for item in objects:
+        if item["provider"] not in USAGE_PROVIDERS:
+            result.skipped += 1
+            continue
+        try:
+            decoded = await workers.read(item["object_path"], item["object_hash"], item["tenant_id"])
+        except (RawObjectCorruptError, RawObjectWorkerError):
+            result.unreadable += 1
+            continue
+        deltas = extract_usage_deltas(
+            item["provider"],
+            (record.data for record in decoded.spec.records),
+            fallback_time=datetime.fromisoformat(item["sealed_at"]),
+        )
+        if not deltas:
+            result.skipped += 1
+            continue
+        if dry_run:
+            result.folded += len(deltas)
+            continue
+        folded = await catalog.call(
+            "usage.ledger.fold.v2",
+            {"session_id": item["session_id"], "usage_deltas": [delta.to_wire() for delta in deltas]},
+        )
+        result.folded += int(folded.get("folded") or 0)
+    return result
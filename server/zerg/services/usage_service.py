@@ -1,14 +1,15 @@
 """LLM usage aggregation service.
 
-The retired automation-run data plane no longer backs usage accounting.
-Launch usage endpoints intentionally return empty counters until the session
-runtime has a first-class usage ledger.
+Usage is read from catalogd's ingest-time usage ledger: storage-v2 folds the
+token usage of every provider response into per-(owner, day, provider, model,
+project) rollup rows as envelopes commit, so each read here touches O(days)
+rows. Hosts without a catalog have no ledger and report empty counters.
 """
 
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import date
-from datetime import datetime
 from datetime import timedelta
 from typing import Literal
 from typing import Optional
@@ -22,70 +23,95 @@ from zerg.schemas.usage import UsageLimit
 from zerg.schemas.usage import UserUsageResponse
 from zerg.utils.time import utc_now_naive
 
+_PERIOD_DAYS = {"today": 1, "7d": 7, "30d": 30}
+_COST_SORTS = {"cost_today": "today", "cost_7d": "seven_days", "cost_30d": "thirty_days"}
+
 
 def _today_utc_date() -> date:
     """Return today's date in UTC (as a date)."""
     return utc_now_naive().date()
 
 
-def _utc_day_start(day: date) -> datetime:
-    """Return naive UTC datetime at start of a given day."""
-    return datetime(day.year, day.month, day.day)
+def _period_start_date(period: Literal["today", "7d", "30d"]) -> date:
+    """Return the first UTC day included in the given period."""
+    if period not in _PERIOD_DAYS:
+        raise ValueError(f"Invalid period: {period}")
+    return _today_utc_date() - timedelta(days=_PERIOD_DAYS[period] - 1)
 
 
-def _period_start_date(period: Literal["today", "7d", "30d"]) -> datetime.date:
-    """Return the start date for the given period."""
-    today = _today_utc_date()
-    if period == "today":
-        return today
-    elif period == "7d":
-        return today - timedelta(days=6)  # Include today
-    elif period == "30d":
-        return today - timedelta(days=29)  # Include today
-    else:
-        raise ValueError(f"Invalid period: {period}")
+async def _read_usage_rows(owner_ids: list[int] | None, start_day: date, end_day: date) -> list[dict]:
+    """Read per-(owner, day) ledger totals over an inclusive UTC day range."""
+
+    from zerg.services.catalogd_supervisor import get_catalogd_client
 
+    catalog = get_catalogd_client()
+    if catalog is None:
+        return []
+    if owner_ids is not None and not owner_ids:
+        return []
+    result = await catalog.call(
+        "usage.rollups.read.v2",
+        {
+            "owner_ids": [str(owner_id) for owner_id in owner_ids] if owner_ids is not None else None,
+            "start_day": start_day.isoformat(),
+            "end_day": end_day.isoformat(),
+        },
+    )
+    return list(result.get("rows") or [])
 
-def _usage_range_for_period(period: Literal["today", "7d", "30d"]) -> tuple[datetime, datetime]:
-    """Return (start_dt, end_dt) for a period in naive UTC.
 
-    We use an exclusive end bound at *tomorrow 00:00 UTC* so "today/7d/30d"
-    are inclusive of the current day.
+def _summarize(rows: list[dict], start_day: date) -> dict:
+    """Total token/cost/response stats for rows on or after ``start_day``.
+
+    ``runs`` counts metered provider responses; automation runs are retired.
     """
-    today = _today_utc_date()
-    start_date = _period_start_date(period)
-    start_dt = _utc_day_start(start_date)
-    end_dt = _utc_day_start(today + timedelta(days=1))
-    return start_dt, end_dt
+    first = start_day.isoformat()
+    selected = [row for row in rows if row["day"] >= first]
+    prompt = sum(row["input_tokens"] + row["cache_read_tokens"] + row["cache_write_tokens"] for row in selected)
+    completion = sum(row["output_tokens"] for row in selected)
+    return {
+        "tokens": prompt + completion,
+        "prompt_tokens": prompt,
+        "completion_tokens": completion,
+        "cost_usd": round(sum(row["cost_microusd"] for row in selected) / 1_000_000, 6),
+        "runs": sum(row["responses"] for row in selected),
+    }
 
 
-def _get_user_usage_range(db: Session, user_id: int, start_dt: datetime, end_dt: datetime) -> dict:
-    """Aggregate token/cost/run stats for a user within [start_dt, end_dt)."""
-    _ = (db, user_id, start_dt, end_dt)
-    return {"tokens": 0, "cost_usd": 0.0, "runs": 0}
+def _multi_period_usage(rows: list[dict]) -> dict:
+    summaries = {
+        "today": _summarize(rows, _period_start_date("today")),
+        "seven_days": _summarize(rows, _period_start_date("7d")),
+        "thirty_days": _summarize(rows, _period_start_date("30d")),
+    }
+    return {name: {key: summary[key] for key in ("tokens", "cost_usd", "runs")} for name, summary in summaries.items()}
 
 
-def get_user_usage(
-    db: Session,
+async def get_user_today_cost_usd(user_id: int) -> float:
+    """Return the user's ledger cost for the current UTC day."""
+    today = _today_utc_date()
+    return _summarize(await _read_usage_rows([user_id], today, today), today)["cost_usd"]
+
+
+async def get_user_usage(
     user_id: int,
     period: Literal["today", "7d", "30d"] = "today",
 ) -> UserUsageResponse:
     """Get LLM usage stats for a user.
 
     Args:
-        db: Database session
         user_id: ID of the user
         period: Time period - "today", "7d", or "30d"
 
     Returns:
         UserUsageResponse with token/cost stats and limit info
     """
-    start_dt, end_dt = _usage_range_for_period(period)
-    period_usage = _get_user_usage_range(db, user_id, start_dt, end_dt)
-
-    # Get today's cost for limit calculation (limits are always daily)
-    today_start, tomorrow_start = _usage_range_for_period("today")
-    today_cost_usd = _get_user_usage_range(db, user_id, today_start, tomorrow_start)["cost_usd"]
+    today = _today_utc_date()
+    start_day = _period_start_date(period)
+    # One range read covers both the period and today's limit usage.
+    rows = await _read_usage_rows([user_id], start_day, today)
+    period_usage = _summarize(rows, start_day)
+    today_cost_usd = _summarize(rows, today)["cost_usd"]
 
     # Calculate limit status
     settings = get_settings()
@@ -118,11 +144,9 @@ def get_user_usage(
             status=status,
         )
 
-    # Token breakdown (prompt/completion) - we don't currently track these
-    # separately on Run, so they'll be None
     tokens = TokenBreakdown(
-        prompt=None,  # Not tracked separately yet
-        completion=None,  # Not tracked separately yet
+        prompt=period_usage["prompt_tokens"],
+        completion=period_usage["completion_tokens"],
         total=period_usage["tokens"],
     )
 
@@ -140,7 +164,7 @@ def get_user_usage(
 # ---------------------------------------------------------------------------
 
 
-def get_all_users_usage(
+async def get_all_users_usage(
     db: Session,
     *,
     sort: Literal["cost_today", "cost_7d", "cost_30d", "email", "created_at"] = "cost_today",
@@ -172,18 +196,27 @@ def get_all_users_usage(
     total = int(db.query(func.count(UserModel.id)).filter(*user_filters).scalar() or 0)
 
     query = db.query(UserModel).filter(*user_filters)
-
-    sort_expr_map = {
-        "cost_today": UserModel.id,
-        "cost_7d": UserModel.id,
-        "cost_30d": UserModel.id,
-        "email": func.lower(UserModel.email),
-        "created_at": UserModel.created_at,
-    }
-    sort_expr = sort_expr_map[sort]
-    query = query.order_by(sort_expr.desc() if order == "desc" else sort_expr.asc())
-
-    rows = query.limit(limit).offset(offset).all()
+    today = _today_utc_date()
+    thirty_days_start = _period_start_date("30d")
+
+    if sort in _COST_SORTS:
+        # Cost ordering needs every owner's totals, which is still one
+        # O(owners x days) rollup read rather than an event scan.
+        candidates = query.order_by(UserModel.id.asc()).all()
+        rows_by_owner: dict[str, list[dict]] = defaultdict(list)
+        for row in await _read_usage_rows(None, thirty_days_start, today):
+            rows_by_owner[row["owner_id"]].append(row)
+        usage_by_user = {user.id: _multi_period_usage(rows_by_owner.get(str(user.id), [])) for user in candidates}
+        period_key = _COST_SORTS[sort]
+        candidates.sort(key=lambda user: usage_by_user[user.id][period_key]["cost_usd"], reverse=order == "desc")
+        rows = candidates[offset : offset + limit]
+    else:
+        sort_expr = func.lower(UserModel.email) if sort == "email" else UserModel.created_at
+        rows = query.order_by(sort_expr.desc() if order == "desc" else sort_expr.asc()).limit(limit).offset(offset).all()
+        rows_by_owner = defaultdict(list)
+        for row in await _read_usage_rows([user.id for user in rows], thirty_days_start, today):
+            rows_by_owner[row["owner_id"]].append(row)
+        usage_by_user = {user.id: _multi_period_usage(rows_by_owner.get(str(user.id), [])) for user in rows}
 
     users = []
     for row in rows:
@@ -195,22 +228,18 @@ def get_all_users_usage(
                 "role": row.role,
                 "is_active": row.is_active,
                 "created_at": row.created_at,
-                "usage": {
-                    "today": {"tokens": 0, "cost_usd": 0.0, "runs": 0},
-                    "seven_days": {"tokens": 0, "cost_usd": 0.0, "runs": 0},
-                    "thirty_days": {"tokens": 0, "cost_usd": 0.0, "runs": 0},
-                },
+                "usage": usage_by_user[row.id],
             }
         )
 
     return {"users": users, "total": total, "limit": limit, "offset": offset}
 
 
-def get_user_usage_detail(
+async def get_user_usage_detail(
     db: Session,
     user_id: int,
     period: Literal["today", "7d", "30d"] = "7d",
-) -> dict:
+) -> dict | None:
     """Get detailed usage for a specific user (admin-only).
 
     Args:
@@ -228,18 +257,18 @@ def get_user_usage_detail(
     if not user:
         return None
 
-    start_dt, end_dt = _usage_range_for_period(period)
-
-    # Get period summary
-    summary = _get_user_usage_range(db, user_id, start_dt, end_dt)
+    today = _today_utc_date()
+    start_day = _period_start_date(period)
+    rows = await _read_usage_rows([user_id], _period_start_date("30d"), today)
 
+    summary = _summarize(rows, start_day)
+    rows_by_day = {row["day"]: row for row in rows}
     daily_breakdown = []
-    top_automations = []
-
-    # Get usage for all periods for the user row
-    usage_today = {"tokens": 0, "cost_usd": 0.0, "runs": 0}
-    usage_7d = {"tokens": 0, "cost_usd": 0.0, "runs": 0}
-    usage_30d = {"tokens": 0, "cost_usd": 0.0, "runs": 0}
+    for offset in range(_PERIOD_DAYS[period]):
+        day = start_day + timedelta(days=offset)
+        row = rows_by_day.get(day.isoformat())
+        day_usage = _summarize([row] if row is not None else [], day)
+        daily_breakdown.append({"date": day, "tokens": day_usage["tokens"], "cost_usd": day_usage["cost_usd"], "runs": day_usage["runs"]})
 
     return {
         "user": {
@@ -249,14 +278,11 @@ def get_user_usage_detail(
             "role": user.role,
             "is_active": user.is_active,
             "created_at": user.created_at,
-            "usage": {
-                "today": usage_today,
-                "seven_days": usage_7d,
-                "thirty_days": usage_30d,
-            },
+            "usage": _multi_period_usage(rows),
         },
         "period": period,
         "summary": {"tokens": summary["tokens"], "cost_usd": summary["cost_usd"], "runs": summary["runs"]},
         "daily_breakdown": daily_breakdown,
-        "top_automations": top_automations,
+        # Automations are retired; the ledger attributes usage to sessions.
+        "top_automations": [],
     }
@@ -138,6 +138,8 @@ _LABEL_PRIORITIES: dict[str, int] = {
     "task-fail": 7,
     "summary-backfill": 60,
     "embeddings": 60,
+    # Journaled FTS indexing trails bulk ingest by design; search reports the lag.
+    "fts-index": 60,
     "projection-reconcile": 70,
     # Background queue maintenance is lowest priority.
     "task-resurrect": 85,
@@ -465,6 +467,10 @@ class WriteSerializer:
     def stats(self) -> WriteStats:
         return self._stats
 
+    @property
+    def name(self) -> str:
+        return self._name
+
     @property
     def queue_depth(self) -> int:
         return len(self._queue)
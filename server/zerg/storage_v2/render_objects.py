@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import base64
 import hashlib
 import json
 import os
@@ -26,6 +27,17 @@ MAX_RENDER_BYTES = 4 * 1024 * 1024
 MAX_RENDER_EVENTS = 10_000
 MAX_RENDER_COMPRESSED_BYTES = 8 * 1024 * 1024
 _ROLES = {"user", "assistant", "tool", "system"}
+# Filter indexes are sidecars written next to each sealed object. They only
+# narrow which objects and ordinals a filtered page decodes; every candidate is
+# still checked against the decoded record, so a missing or stale sidecar costs
+# speed, never correctness.
+FILTER_INDEX_FORMAT_VERSION = 1
+MAX_FILTER_INDEX_BYTES = 1024 * 1024
+# Objects with more casefolded content than this get no text filter; building
+# trigrams for the largest objects would cost more on the seal path than it
+# saves on reads.
+MAX_TEXT_FILTER_CHARS = 256 * 1024
+_TEXT_FILTER_HASHES = 4
 
 
 class RenderObjectError(RuntimeError):
@@ -94,11 +106,79 @@ class SealedRenderObject:
     reused: bool
 
 
+@dataclass(frozen=True, slots=True)
+class RenderObjectFilterIndex:
+    """Secondary indexes for one render object, keyed by record ordinal."""
+
+    object_hash: str
+    record_count: int
+    roles: dict[str, tuple[int, ...]]
+    tool_names: dict[str, tuple[int, ...]]
+    # Bloom filter over the casefolded content_text trigrams of every record,
+    # or None when the object was too large to index.
+    text_filter: bytes | None
+
+    def candidate_ordinals(self, *, roles: frozenset[str] | None, tool_name: str | None) -> frozenset[int] | None:
+        """Ordinals that can match the structured filters; None means every ordinal."""
+
+        candidates: frozenset[int] | None = None
+        if roles is not None:
+            candidates = frozenset(ordinal for role in roles for ordinal in self.roles.get(role, ()))
+        if tool_name is not None:
+            by_tool = frozenset(self.tool_names.get(tool_name, ()))
+            candidates = by_tool if candidates is None else candidates & by_tool
+        return candidates
+
+    def may_contain_text(self, needle: str) -> bool:
+        """False only when no record's content_text can contain ``needle`` (casefolded)."""
+
+        if self.text_filter is None:
+            return True
+        trigrams = _trigrams(needle)
+        if not trigrams:
+            return True
+        bits = len(self.text_filter) * 8
+        return all(_bloom_contains(self.text_filter, bits, trigram) for trigram in trigrams)
+
+
+@dataclass(frozen=True, slots=True)
+class RenderRecordFilter:
+    """Event-page filters evaluated against render records.
+
+    ``query`` is a case-insensitive substring of ``content_text``.
+    """
+
+    roles: frozenset[str] | None = None
+    tool_name: str | None = None
+    query: str | None = None
+
+    @property
+    def active(self) -> bool:
+        return self.roles is not None or self.tool_name is not None or self.query is not None
+
+    def matches(self, record: RenderRecord) -> bool:
+        if self.roles is not None and record.role not in self.roles:
+            return False
+        if self.tool_name is not None and record.tool_name != self.tool_name:
+            return False
+        return self.query is None or self.query.casefold() in (record.content_text or "").casefold()
+
+    def candidate_ordinals(self, index: RenderObjectFilterIndex | None) -> frozenset[int] | None:
+        """Ordinals worth decoding; None means all, an empty set means skip the object."""
+
+        if index is None:
+            return None
+        if self.query is not None and not index.may_contain_text(self.query.casefold()):
+            return frozenset()
+        return index.candidate_ordinals(roles=self.roles, tool_name=self.tool_name)
+
+
 @dataclass(frozen=True, slots=True)
 class DecodedRenderObject:
     spec: RenderObjectSpec
     object_hash: str
     payload_hash: str
+    payload_size: int = 0
 
 
 def seal_render_object(root: Path, spec: RenderObjectSpec) -> SealedRenderObject:
@@ -118,27 +198,13 @@ def seal_render_object(root: Path, spec: RenderObjectSpec) -> SealedRenderObject
             raise RenderObjectCorruptError(f"existing content-addressed render object is corrupt: {relative_path}")
         reused = True
     else:
-        temporary_name: str | None = None
-        try:
-            with tempfile.NamedTemporaryFile(
-                mode="wb",
-                prefix=f".{object_hash}.tmp-",
-                dir=final_path.parent,
-                delete=False,
-            ) as handle:
-                temporary_name = handle.name
-                os.chmod(temporary_name, 0o600)
-                handle.write(compressed)
-                handle.flush()
-                os.fsync(handle.fileno())
-            os.replace(temporary_name, final_path)
-            temporary_name = None
-            _fsync_directory(final_path.parent)
-        finally:
-            if temporary_name is not None:
-                Path(temporary_name).unlink(missing_ok=True)
+        _write_file_atomically(final_path, compressed, object_hash)
         reused = False
 
+    index_path = _safe_path(root, filter_index_path(relative_path.as_posix()))
+    if not index_path.exists():
+        _write_file_atomically(index_path, encode_render_filter_index(build_render_filter_index(spec, object_hash)), object_hash)
+
     aggregate = _aggregate(spec)
     return SealedRenderObject(
         object_id=object_hash,
@@ -200,9 +266,85 @@ def read_render_object(root: Path, object_path: str, *, expected_object_hash: st
         spec=spec,
         object_hash=expected_object_hash,
         payload_hash=hashlib.sha256(payload).hexdigest(),
+        payload_size=len(payload),
     )
 
 
+def filter_index_path(object_path: str) -> Path:
+    relative_path = Path(object_path)
+    return relative_path.with_name(relative_path.name.removesuffix(".zst") + ".filters.json")
+
+
+def build_render_filter_index(spec: RenderObjectSpec, object_hash: str) -> RenderObjectFilterIndex:
+    roles: dict[str, list[int]] = {}
+    tool_names: dict[str, list[int]] = {}
+    trigrams: set[str] = set()
+    text_chars = 0
+    for ordinal, record in enumerate(spec.records):
+        roles.setdefault(record.role, []).append(ordinal)
+        if record.tool_name is not None:
+            tool_names.setdefault(record.tool_name, []).append(ordinal)
+        if record.content_text and text_chars <= MAX_TEXT_FILTER_CHARS:
+            folded = record.content_text.casefold()
+            text_chars += len(folded)
+            if text_chars <= MAX_TEXT_FILTER_CHARS:
+                trigrams.update(_trigrams(folded))
+    return RenderObjectFilterIndex(
+        object_hash=object_hash,
+        record_count=len(spec.records),
+        roles={role: tuple(ordinals) for role, ordinals in roles.items()},
+        tool_names={name: tuple(ordinals) for name, ordinals in tool_names.items()},
+        text_filter=_bloom_filter(trigrams) if text_chars <= MAX_TEXT_FILTER_CHARS else None,
+    )
+
+
+def encode_render_filter_index(index: RenderObjectFilterIndex) -> bytes:
+    body = {
+        "format_version": FILTER_INDEX_FORMAT_VERSION,
+        "object_hash": index.object_hash,
+        "record_count": index.record_count,
+        "roles": {role: list(ordinals) for role, ordinals in index.roles.items()},
+        "tool_names": {name: list(ordinals) for name, ordinals in index.tool_names.items()},
+        "text_filter": base64.b64encode(index.text_filter).decode("ascii") if index.text_filter is not None else None,
+    }
+    encoded = json.dumps(body, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+    checksum = hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+    return json.dumps({"body": body, "sha256": checksum}, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def read_render_filter_index(root: Path, object_path: str, *, expected_object_hash: str) -> RenderObjectFilterIndex | None:
+    """Return the object's filter index, or None when it is absent or unusable."""
+
+    if not _is_hash(expected_object_hash) or expected_object_hash not in Path(object_path).name:
+        return None
+    try:
+        path = _safe_path(root, filter_index_path(object_path))
+        with path.open("rb") as handle:
+            raw = handle.read(MAX_FILTER_INDEX_BYTES + 1)
+    except (OSError, RenderObjectValidationError):
+        return None
+    if len(raw) > MAX_FILTER_INDEX_BYTES:
+        return None
+    try:
+        envelope = json.loads(raw)
+        body = envelope["body"]
+        encoded = json.dumps(body, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+        if hashlib.sha256(encoded.encode("utf-8")).hexdigest() != envelope["sha256"]:
+            return None
+        if body["format_version"] != FILTER_INDEX_FORMAT_VERSION or body["object_hash"] != expected_object_hash:
+            return None
+        text_filter = body["text_filter"]
+        return RenderObjectFilterIndex(
+            object_hash=expected_object_hash,
+            record_count=int(body["record_count"]),
+            roles={str(role): tuple(int(ordinal) for ordinal in ordinals) for role, ordinals in body["roles"].items()},
+            tool_names={str(name): tuple(int(ordinal) for ordinal in ordinals) for name, ordinals in body["tool_names"].items()},
+            text_filter=base64.b64decode(text_filter, validate=True) if text_filter is not None else None,
+        )
+    except (KeyError, TypeError, ValueError, AttributeError):
+        return None
+
+
 def decode_render_object(payload: bytes) -> RenderObjectSpec:
     if len(payload) > MAX_RENDER_BYTES:
         raise RenderObjectCorruptError("render object exceeds 4 MiB")
@@ -363,6 +505,55 @@ def _safe_path(root: Path, relative: Path) -> Path:
     return resolved
 
 
+def _write_file_atomically(final_path: Path, data: bytes, object_hash: str) -> None:
+    temporary_name: str | None = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            mode="wb",
+            prefix=f".{object_hash}.tmp-",
+            dir=final_path.parent,
+            delete=False,
+        ) as handle:
+            temporary_name = handle.name
+            os.chmod(temporary_name, 0o600)
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary_name, final_path)
+        temporary_name = None
+        _fsync_directory(final_path.parent)
+    finally:
+        if temporary_name is not None:
+            Path(temporary_name).unlink(missing_ok=True)
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[index : index + 3] for index in range(len(text) - 2)}
+
+
+def _bloom_positions(bits: int, trigram: str) -> list[int]:
+    digest = hashlib.blake2b(trigram.encode("utf-8"), digest_size=16).digest()
+    first = int.from_bytes(digest[:8], "little")
+    second = int.from_bytes(digest[8:], "little") | 1
+    return [(first + step * second) % bits for step in range(_TEXT_FILTER_HASHES)]
+
+
+def _bloom_filter(trigrams: set[str]) -> bytes:
+    # About ten bits per trigram keeps false positives near 1% with four hashes.
+    size = 64
+    while size * 8 < len(trigrams) * 10:
+        size *= 2
+    bits = bytearray(size)
+    for trigram in trigrams:
+        for position in _bloom_positions(size * 8, trigram):
+            bits[position >> 3] |= 1 << (position & 7)
+    return bytes(bits)
+
+
+def _bloom_contains(data: bytes, bits: int, trigram: str) -> bool:
+    return all(data[position >> 3] & (1 << (position & 7)) for position in _bloom_positions(bits, trigram))
+
+
 def _fsync_directory(path: Path) -> None:
     descriptor = os.open(path, os.O_RDONLY)
     try:
@@ -379,14 +570,20 @@ __all__ = [
     "DecodedRenderObject",
     "RenderObjectCorruptError",
     "RenderObjectError",
+    "RenderObjectFilterIndex",
     "RenderObjectSpec",
     "RenderObjectValidationError",
     "RenderRecord",
+    "RenderRecordFilter",
     "SEMANTIC_PROJECTION_VERSION",
     "SealedRenderObject",
     "aggregate_render_object",
+    "build_render_filter_index",
     "decode_render_object",
+    "encode_render_filter_index",
     "encode_render_object",
+    "filter_index_path",
+    "read_render_filter_index",
     "read_render_object",
     "seal_render_object",
     "validate_render_object_spec",
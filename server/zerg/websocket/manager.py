@@ -2,17 +2,27 @@
 
 Manages WebSocket connections with topic-based subscriptions and relays
 EventBus events to connected clients.
+
+A broadcast is encoded to JSON text once and the same frame is queued for
+every subscriber, so encode cost no longer scales with subscriber count.
+Messages that only carry the latest state (user updates, pings) may be
+marked coalescable: when a slow client's queue is full, the new frame
+replaces the queued frame it supersedes instead of disconnecting the client.
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import time
+from dataclasses import dataclass
+from dataclasses import field
 from typing import Any
 from typing import Dict
 from typing import Set
 
+import orjson
 from fastapi import WebSocket
 from fastapi.encoders import jsonable_encoder
 
@@ -24,6 +34,56 @@ from zerg.generated.ws_messages import Envelope
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class _Frame:
+    """One encoded message, shared by every subscriber queue it is put on."""
+
+    text: str
+    topic_family: str
+    coalesce_key: tuple[str, str] | None = None
+    created_at: float = field(default_factory=time.monotonic)
+
+
+def encode_frame(message: Dict[str, Any]) -> str:
+    """Encode ``message`` once for every recipient.
+
+    orjson is used when it can encode the message; anything it rejects (such
+    as non-string keys) falls back to the same encoding ``send_json`` used.
+    """
+
+    try:
+        return orjson.dumps(message).decode("utf-8")
+    except TypeError:
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+
+def _build_frame(topic: str, message: Dict[str, Any], *, coalesce: bool = False) -> _Frame:
+    return _Frame(
+        text=encode_frame(message),
+        topic_family=topic.split(":", 1)[0],
+        coalesce_key=(topic, str(message.get("type"))) if coalesce else None,
+    )
+
+
+class _ClientQueue(asyncio.Queue):
+    """Per-client frame queue that can replace a superseded frame in place of growing."""
+
+    def supersede(self, frame: _Frame) -> bool:
+        """Drop the queued frame ``frame`` supersedes and append ``frame``; False if none."""
+
+        if frame.coalesce_key is None:
+            return False
+        for index, queued in enumerate(self._queue):
+            if queued.coalesce_key == frame.coalesce_key:
+                # Remove then append, so the newer state is not delivered ahead
+                # of frames that were queued after the one it replaces. The
+                # unfinished-task count is unchanged: one frame out, one in.
+                del self._queue[index]
+                self._queue.append(frame)
+                return True
+        return False
+
+
 class TopicConnectionManager:
     """Manages WebSocket connections with topic-based subscriptions."""
 
@@ -151,7 +211,7 @@ class TopicConnectionManager:
             from zerg.config import get_settings  # local import to avoid cycles
 
             queue_size = 0 if get_settings().testing else self.QUEUE_SIZE
-            self.client_queues[client_id] = asyncio.Queue(maxsize=queue_size)
+            self.client_queues[client_id] = _ClientQueue(maxsize=queue_size)
 
             # Start writer task for this client
             self.writer_tasks[client_id] = asyncio.create_task(self._writer(client_id, websocket, self.client_queues[client_id]))
@@ -281,14 +341,17 @@ class TopicConnectionManager:
 
     async def _writer(self, client_id: str, websocket: WebSocket, queue: asyncio.Queue) -> None:
         """Writer task that processes messages from the queue with timeout and back-pressure handling."""
+        from zerg.metrics import ws_broadcast_fanout_seconds
+
         try:
             while True:
-                # Wait for a message to send
-                payload = await queue.get()
+                # Wait for a pre-encoded frame to send
+                frame = await queue.get()
 
                 try:
                     # Send with timeout to prevent hanging on slow clients
-                    await asyncio.wait_for(websocket.send_json(payload), timeout=self.SEND_TIMEOUT)
+                    await asyncio.wait_for(websocket.send_text(frame.text), timeout=self.SEND_TIMEOUT)
+                    ws_broadcast_fanout_seconds.labels(topic=frame.topic_family).observe(time.monotonic() - frame.created_at)
                 except asyncio.TimeoutError:
                     logger.warning("Send timeout for client %s, disconnecting", client_id)
                     await self.disconnect(client_id)
@@ -324,7 +387,9 @@ class TopicConnectionManager:
                     topic="system",
                     data={},
                 )
-                ping_message = ping_envelope.model_dump()
+                # Encoded once for every client; a ping still queued behind a
+                # slow client is superseded by this one rather than stacking.
+                ping_frame = _build_frame("system", ping_envelope.model_dump(), coalesce=True)
 
                 # Get client queues snapshot
                 async with self._get_lock():
@@ -338,8 +403,10 @@ class TopicConnectionManager:
                         continue
 
                     try:
-                        queue.put_nowait(ping_message)
+                        queue.put_nowait(ping_frame)
                     except asyncio.QueueFull:
+                        if isinstance(queue, _ClientQueue) and queue.supersede(ping_frame):
+                            continue
                         # Client queue is full - disconnect due to back-pressure
                         logger.warning("Ping queue full for client %s, disconnecting", client_id)
                         asyncio.create_task(self.disconnect(client_id))
@@ -395,12 +462,15 @@ class TopicConnectionManager:
                 except Exception:
                     pass
 
-    async def broadcast_to_topic(self, topic: str, message: Dict[str, Any]) -> None:
+    async def broadcast_to_topic(self, topic: str, message: Dict[str, Any], *, coalesce: bool = False) -> None:
         """Broadcast a message to all clients subscribed to a topic.
 
         Args:
             topic: The topic to broadcast to
             message: The message to broadcast (must be in envelope format)
+            coalesce: The message carries only the latest state for its
+                topic and type, so for a client whose queue is full it may
+                replace the queued message of the same topic and type.
         """
         logger.debug(f"broadcast_to_topic called for topic: {topic}")
         # If there are no active subscribers we silently skip to avoid log
@@ -416,7 +486,7 @@ class TopicConnectionManager:
                 client_id: self.client_queues.get(client_id)  # *None* when no dedicated queue
                 for client_id in self.topic_subscriptions[topic]
             }
-            logger.info(f"Broadcasting to {len(client_queues)} subscribers on topic {topic}")
+            logger.debug(f"Broadcasting to {len(client_queues)} subscribers on topic {topic}")
 
         # Envelope format is mandatory - no legacy format support
         # All callers must provide properly formatted envelope messages
@@ -424,9 +494,11 @@ class TopicConnectionManager:
             logger.error("broadcast_to_topic: Invalid message format - envelope required")
             raise ValueError("Message must be in envelope format")
 
-        final_message = message
+        from zerg.metrics import ws_broadcast_frames_total
 
-        # Queue / immediately send the message for each client
+        frame = _build_frame(topic, message, coalesce=coalesce)
+
+        # Queue / immediately send the frame for each client
         for client_id, queue in client_queues.items():
             # ----------------------------------------------------------
             # 1. Fallback – no dedicated queue (legacy/dummy tests)
@@ -437,7 +509,7 @@ class TopicConnectionManager:
                     continue
 
                 try:
-                    await ws.send_json(final_message)
+                    await ws.send_text(frame.text)
                 except Exception as exc:  # pragma: no cover – defensive
                     logger.warning("Send error (direct) for client %s: %s", client_id, exc)
                     asyncio.create_task(self.disconnect(client_id))
@@ -447,7 +519,8 @@ class TopicConnectionManager:
             # 2. Normal path – hand off to per-connection queue
             # ----------------------------------------------------------
             try:
-                queue.put_nowait(final_message)
+                queue.put_nowait(frame)
+                ws_broadcast_frames_total.labels(outcome="queued").inc()
             except RuntimeError as exc:
                 # Stale queue from a closed event loop (common in tests); drop it.
                 if "Event loop is closed" in str(exc):
@@ -456,7 +529,12 @@ class TopicConnectionManager:
                     continue
                 raise
             except asyncio.QueueFull:
-                # Back-pressure: drop client to protect server memory
+                if isinstance(queue, _ClientQueue) and queue.supersede(frame):
+                    ws_broadcast_frames_total.labels(outcome="coalesced").inc()
+                    continue
+                # Back-pressure with nothing to supersede: drop client to
+                # protect server memory
+                ws_broadcast_frames_total.labels(outcome="disconnected").inc()
                 logger.warning("Queue full for client %s, disconnecting due to back-pressure", client_id)
                 asyncio.create_task(self.disconnect(client_id))
 
@@ -485,7 +563,7 @@ class TopicConnectionManager:
 
         # Use envelope format
         envelope = Envelope.create(message_type="user_update", topic=topic, data=serialized_data)
-        await self.broadcast_to_topic(topic, envelope.model_dump())
+        await self.broadcast_to_topic(topic, envelope.model_dump(), coalesce=True)
 
 
 # Create a global instance of the new connection manager